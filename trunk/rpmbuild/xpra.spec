@@ -30,7 +30,6 @@
 #some of these dependencies may get turned off (empty) on some platforms:
 %define build_args --with-Xdummy --without-csc_opencl --without-enc_x265 --without-webp --without-csc_opencv --without-enc_xvid
 %define requires_xorg xorg-x11-server-utils, xorg-x11-drv-dummy, xorg-x11-xauth
-%define requires_websockify , python-websockify
 %define requires_lzo , %{py2prefix}-lzo
 %define numpy numpy
 %define requires_webcam , python-inotify
@@ -64,7 +63,6 @@
 # any centos / rhel supported:
 %if 0%{?el6}%{?el7}
 #not available:
-%define requires_websockify %{nil}
 %define requires_lzo %{nil}
 #cups-pdf is not in the regular repos, so remove it from dependencies:
 %define requires_printing , python-cups
@@ -165,7 +163,7 @@ Patch3: broken-xdgruntime.patch
 Patch4: selinux-homesocket.patch
 BuildRoot: %{_tmppath}/%{name}-%{version}-root
 
-Requires: python %{requires_opengl} %{requires_sound} %{requires_lzo} %{requires_websockify} %{requires_printing} %{requires_webcam}
+Requires: python %{requires_opengl} %{requires_sound} %{requires_lzo} %{requires_printing} %{requires_webcam}
 Requires: %{py2prefix}-lz4
 Requires: %{requires_pygtk2}
 Requires: %{requires_dbus}
@@ -40,11 +40,12 @@ function bencode(obj) {
 function uintToString(uintArray) {
     // apply in chunks of 10400 to avoid call stack overflow
     // https://developer.mozilla.org/en-US/docs/Web/JavaScript/Reference/Global_Objects/Function/apply
+    // typed arrays give us views of the data, plain arrays have to be copied
     var s = ""
     var skip = 10400;
-    var slice = uintArray.slice;
+    var subarray = uintArray.subarray;
     for (var i=0, len=uintArray.length; i<len; i+=skip) {
-        if(!slice) {
+        if(subarray) {
             s += String.fromCharCode.apply(null, uintArray.subarray(i, Math.min(i + skip, len)));
         } else {
             s += String.fromCharCode.apply(null, uintArray.slice(i, Math.min(i + skip, len)));
@@ -71,6 +71,9 @@ function XpraClient(container) {
 	}
 	// a list of our windows
 	this.id_to_window = {};
+	// the windows we have painted since the last animation frame
+	this.redraw_windows = {};
+	this.redraw_pending = false;
 	// basic window management
 	this.topwindow = null;
 	this.topindex = 0;
@@ -1155,17 +1158,37 @@ XpraClient.prototype._process_draw = function(packet, ctx) {
 			function (ctx) {
 				decode_time = new Date().getTime() - start;
 				ctx._window_send_damage_sequence(wid, packet_sequence, width, height, decode_time);
+				ctx._request_redraw(win);
 			}
 		);
-		// request that drawing to screen takes place at next available opportunity if possible
-		if(requestAnimationFrame) {
-			requestAnimationFrame(function() {
-				win.draw();
-			});
-		} else {
-			// requestAnimationFrame is not available, draw immediately
-			win.draw();
-		}
+	}
+}
+
+XpraClient.prototype._request_redraw = function(win) {
+	// the windows are drawn to the screen at most once per animation frame,
+	// no matter how many draw packets we have painted for them
+	this.redraw_windows[win.wid] = win;
+	if(this.redraw_pending) {
+		return;
+	}
+	if(window.requestAnimationFrame) {
+		var me = this;
+		this.redraw_pending = true;
+		window.requestAnimationFrame(function() {
+			me._redraw_windows();
+		});
+	} else {
+		// requestAnimationFrame is not available, draw immediately
+		this._redraw_windows();
+	}
+}
+
+XpraClient.prototype._redraw_windows = function() {
+	var windows = this.redraw_windows;
+	this.redraw_windows = {};
+	this.redraw_pending = false;
+	for (var wid in windows) {
+		windows[wid].draw();
 	}
 }
 
@@ -76,6 +76,34 @@ XpraProtocolWorkerHost.prototype.set_cipher_out = function(caps, key) {
 
 
 
+/*
+Decompresses the rgb pixel data of a draw packet,
+this is used by the window when painting and by the worker
+*/
+function inflate_rgb(img_data, options) {
+	//if the pixel data is not in an array buffer already, convert it:
+	//(this happens with inlined pixel data)
+	if (typeof img_data==='string') {
+		var uint = new Uint8Array(img_data.length);
+		for(var i=0,j=img_data.length;i<j;++i) {
+			uint[i] = img_data.charCodeAt(i);
+		}
+		img_data = uint;
+	}
+	if (options!=null && options["zlib"]>0) {
+		img_data = new Zlib.Inflate(img_data).decompress();
+	} else if (options!=null && options["lz4"]>0) {
+		// will always be little endian
+		var length = img_data[0] | (img_data[1] << 8) | (img_data[2] << 16) | (img_data[3] << 24);
+		// decode the LZ4 block
+		var inflated = new Buffer(length);
+		var uncompressedSize = LZ4.decodeBlock(img_data.subarray(4), inflated);
+		img_data = inflated.slice(0, uncompressedSize);
+	}
+	return img_data;
+}
+
+
 /*
 The main Xpra wire protocol
 */
@@ -88,9 +116,8 @@ function XpraProtocol() {
 	this.cipher_in_block_size = null;
 	this.cipher_out = null;
 	this.mode = 'binary';  // Current WebSocket mode: 'binary', 'base64'
-    this.rQ = [];          // Receive queue
-    this.rQi = 0;          // Receive queue index
-    this.rQmax = 10000;    // Max receive queue size before compacting
+    this.rQ = [];          // Receive queue: the Uint8Array chunks received
+    this.rQlen = 0;        // Receive queue length in bytes
     this.sQ = [];          // Send queue
 }
 
@@ -98,7 +125,7 @@ XpraProtocol.prototype.open = function(uri) {
 	var me = this;
 	// init
 	this.rQ         = [];
-    this.rQi        = 0;
+    this.rQlen      = 0;
     this.sQ         = [];
     this.websocket  = null;
     // connect the socket
@@ -114,15 +141,12 @@ XpraProtocol.prototype.open = function(uri) {
 		me.packet_handler(['error'], me.packet_ctx);
 	};
 	this.websocket.onmessage = function (e) {
-		// push arraybuffer values onto the end
-        var u8 = new Uint8Array(e.data);
-        for (var i = 0; i < u8.length; i++) {
-            me.rQ.push(u8[i]);
-        }
-        // wait for 8 bytes
-        if (me.rQ.length >= 8) {
-	        me._process();
-	    }
+		// queue the arraybuffer as it is, without copying it
+		me._buffer_push(new Uint8Array(e.data));
+		// wait for 8 bytes
+		if (me.rQlen >= 8) {
+			me._process();
+		}
 	};
 }
 
@@ -199,15 +223,77 @@ XpraProtocol.prototype.set_cipher_out = function(caps, key) {
 	this.cipher_out.start({iv: caps['cipher.iv']});
 }
 
+/*
+The receive queue is a list of Uint8Array chunks, as received from the websocket.
+Packets can span multiple chunks, and chunks can contain multiple packets:
+we only copy the data when a packet spans more than one chunk,
+otherwise we return a view of the chunk.
+*/
+XpraProtocol.prototype._buffer_push = function(u8) {
+	if (u8.length>0) {
+		this.rQ.push(u8);
+		this.rQlen += u8.length;
+	}
+}
+
 XpraProtocol.prototype._buffer_peek = function(bytes) {
-	return this.rQ.slice(0, 0+bytes);
+	var first = this.rQ[0];
+	if (first.length>=bytes) {
+		return first.subarray(0, bytes);
+	}
+	// spans multiple chunks, copy it:
+	var buf = new Uint8Array(Math.min(bytes, this.rQlen));
+	var pos = 0;
+	for (var i=0; pos<buf.length; i++) {
+		var chunk = this.rQ[i];
+		var n = Math.min(chunk.length, buf.length-pos);
+		buf.set(n<chunk.length ? chunk.subarray(0, n) : chunk, pos);
+		pos += n;
+	}
+	return buf;
 }
 
 XpraProtocol.prototype._buffer_shift = function(bytes) {
-	return this.rQ.splice(0, 0+bytes);;
+	this.rQlen -= bytes;
+	var first = this.rQ[0];
+	if (first.length>bytes) {
+		// the chunk has more data after this
+		this.rQ[0] = first.subarray(bytes);
+		return first.subarray(0, bytes);
+	}
+	if (first.length==bytes) {
+		return this.rQ.shift();
+	}
+	// spans multiple chunks, copy it:
+	var buf = new Uint8Array(bytes);
+	var pos = 0;
+	while (pos<bytes) {
+		var chunk = this.rQ[0];
+		var n = bytes-pos;
+		if (chunk.length>n) {
+			buf.set(chunk.subarray(0, n), pos);
+			this.rQ[0] = chunk.subarray(n);
+		}
+		else {
+			buf.set(chunk, pos);
+			this.rQ.shift();
+			n = chunk.length;
+		}
+		pos += n;
+	}
+	return buf;
 }
 
 XpraProtocol.prototype._process = function() {
+	// process all the complete packets we have
+	while (this.rQlen >= 8) {
+		if (!this._process_packet()) {
+			break;
+		}
+	}
+}
+
+XpraProtocol.prototype._process_packet = function() {
 	// peek at first 8 bytes of buffer
 	var buf = this._buffer_peek(8);
 
@@ -215,8 +301,8 @@ XpraProtocol.prototype._process = function() {
 		msg = "invalid packet header format: " + buf[0];
 		if (buf.length>1) {
 			msg += ": ";
-			for (c in buf) {
-				msg += String.fromCharCode(c);
+			for (var c=0; c<buf.length; c++) {
+				msg += String.fromCharCode(buf[c]);
 			}
 		}
 		throw msg;
@@ -250,10 +336,10 @@ XpraProtocol.prototype._process = function() {
 
 	// wait for packet to be complete
 	// the header is still on the buffer so wait for packetsize+headersize bytes!
-	if (this.rQ.length < packet_size+8) {
+	if (this.rQlen < packet_size+8) {
 		// we already shifted the header off the buffer?
-		debug("packet is not complete yet");
-		return;
+		//debug("packet is not complete yet");
+		return false;
 	}
 
 	// packet is complete but header is still on buffer
@@ -265,10 +351,9 @@ XpraProtocol.prototype._process = function() {
 	if (proto_crypto) {
 		this.cipher_in.update(forge.util.createBuffer(uintToString(packet_data)));
 		var decrypted = this.cipher_in.output.getBytes();
-		packet_data = [];
-		for (var i=0; i<decrypted.length; i++)
-			packet_data.push(decrypted[i].charCodeAt(0));
-		packet_data = packet_data.slice(0, -1 * padding);
+		packet_data = new Uint8Array(decrypted.length - padding);
+		for (var i=0; i<packet_data.length; i++)
+			packet_data[i] = decrypted.charCodeAt(i);
 	}
 
 	//decompress it if needed:
@@ -277,12 +362,12 @@ XpraProtocol.prototype._process = function() {
 			// lz4
 			// python-lz4 inserts the length of the uncompressed data as an int
 			// at the start of the stream
-			var d = packet_data.splice(0, 4);
+			var d = packet_data;
 			// will always be little endian
 			var length = d[0] | (d[1] << 8) | (d[2] << 16) | (d[3] << 24);
 			// decode the LZ4 block
 			var inflated = new Buffer(length);
-			var uncompressedSize = LZ4.decodeBlock(packet_data, inflated);
+			var uncompressedSize = LZ4.decodeBlock(packet_data.subarray(4), inflated);
 			if(!proto_crypto)
 				inflated = inflated.slice(0, uncompressedSize);
 		} else if (level & 0x20) {
@@ -316,12 +401,88 @@ XpraProtocol.prototype._process = function() {
 			//console.error("packet_data="+packet_data);
 		}
 	}
+	return true;
+}
+
+
+/*
+Posts the packets from the worker to the main thread,
+so that the main thread only has to blit the pixels of the draw packets:
+the rgb pixel data is decompressed here, and the png, jpeg and webp images
+are decoded into ImageBitmaps (when createImageBitmap is available).
+The packets are still posted in the order they were received,
+and their buffers are transferred to the main thread instead of being copied.
+*/
+var XPRA_BITMAP_CODINGS = ["png", "jpeg", "webp"];
+
+function XpraPacketPoster() {
+	this.queue = [];	// packets waiting to be posted, in order
+}
 
-	// see if buffer still has unread packets
-	if (this.rQ.length >= 8) {
-		this._process();
+XpraPacketPoster.prototype.post = function(packet) {
+	var entry = {'packet': packet, 'ready': true};
+	if (packet[0]=='draw') {
+		this._decode_draw(entry);
 	}
+	this.queue.push(entry);
+	this._flush();
+}
 
+XpraPacketPoster.prototype._decode_draw = function(entry) {
+	var packet = entry.packet;
+	var coding = packet[6];
+	var img_data = packet[7];
+	if (coding=="rgb32") {
+		var options = packet.length>10 ? packet[10] : null;
+		packet[7] = inflate_rgb(img_data, options);
+		if (options!=null) {
+			// so the window does not try to decompress it again:
+			delete options["zlib"];
+			delete options["lz4"];
+		}
+	}
+	else if (XPRA_BITMAP_CODINGS.indexOf(coding)>=0 && img_data.subarray && typeof createImageBitmap==='function') {
+		var me = this;
+		entry.ready = false;
+		createImageBitmap(new Blob([img_data], {'type': 'image/'+coding})).then(function(bitmap) {
+			packet[7] = bitmap;
+		}, function(e) {
+			// the window will decode it instead
+			postMessage({'c': 'l', 't': "failed to decode "+coding+" image in worker: "+e});
+		}).then(function() {
+			entry.ready = true;
+			me._flush();
+		});
+	}
+}
+
+XpraPacketPoster.prototype._flush = function() {
+	while (this.queue.length>0 && this.queue[0].ready) {
+		var packet = this.queue.shift().packet;
+		postMessage({'c': 'p', 'p': packet}, this._get_transferables(packet));
+	}
+}
+
+XpraPacketPoster.prototype._get_transferables = function(packet) {
+	var transfer = [];
+	for (var i=0; i<packet.length; i++) {
+		var v = packet[i];
+		if (typeof ImageBitmap!=='undefined' && v instanceof ImageBitmap) {
+			transfer.push(v);
+		}
+		else if (v!=null && typeof v==='object' && ArrayBuffer.isView(v)) {
+			if (v.byteOffset!=0 || v.byteLength!=v.buffer.byteLength) {
+				// this is a view of a larger buffer (ie: the websocket message it came from),
+				// which we cannot transfer, so copy just the bytes we need
+				v = new Uint8Array(v);
+				packet[i] = v;
+			}
+			if (transfer.indexOf(v.buffer)<0) {
+				transfer.push(v.buffer);
+			}
+		}
+	}
+	return transfer;
 }
 
 
@@ -338,9 +499,10 @@ if (!(typeof window == "object" && typeof document == "object" && window.documen
 		'forge.min.js');
 	// make protocol instance
 	var protocol = new XpraProtocol();
+	var poster = new XpraPacketPoster();
 	// we create a custom packet handler which posts packet as a message
 	protocol.set_packet_handler(function (packet, ctx) {
-		postMessage({'c': 'p', 'p': packet});
+		poster.post(packet);
 	}, null);
 	// attach listeners from main thread
 	self.addEventListener('message', function(e) {
@@ -752,6 +752,17 @@ XpraWindow.prototype._init_avc = function() {
  */
 XpraWindow.prototype.paint = function paint(x, y, width, height, coding, img_data, packet_sequence, rowstride, options, decode_callback) {
 	"use strict";
+	if (typeof ImageBitmap!=='undefined' && img_data instanceof ImageBitmap) {
+		// the image has already been decoded by the protocol worker,
+		// we just have to blit it:
+		if(this.offscreen_canvas_mode!='2d') {
+			this._init_2d_canvas();
+		}
+		this.offscreen_canvas_ctx.drawImage(img_data, x, y);
+		img_data.close();
+		decode_callback(this.client);
+		return;
+	}
  	if (this.debug)
  		console.log("paint("+img_data.length+" bytes of "+("zlib" in options?"zlib ":"")+coding+" data "+width+"x"+height+" at "+x+","+y+") focused="+this.focused);
 
@@ -761,39 +772,7 @@ XpraWindow.prototype.paint = function paint(x, y, width, height, coding, img_dat
 	    	this._init_2d_canvas();
 	    }
 		var img = this.offscreen_canvas_ctx.createImageData(width, height);
-		//if the pixel data is not in an array buffer already, convert it:
-		//(this happens with inlined pixel data)
-		if (typeof img_data==='string') {
-			var uint = new Uint8Array(img_data.length);
-			for(var i=0,j=img_data.length;i<j;++i) {
-				uint[i] = img_data.charCodeAt(i);
-			}
-			img_data = uint;
-		}
-		//show("options="+(options).toSource());
-		if (options!=null && options["zlib"]>0) {
-			//show("decompressing "+img_data.length+" bytes of "+coding+"/zlib");
-			var inflated = new Zlib.Inflate(img_data).decompress();
-			//show("rgb32 data inflated from "+img_data.length+" to "+inflated.length+" bytes");
-			img_data = inflated;
-		} else if (options!=null && options["lz4"]>0) {
-			// in future we need to make sure that we use typed arrays everywhere...
-			if(img_data.subarray) {
-				var d = img_data.subarray(0, 4);
-			} else {
-				var d = img_data.slice(0, 4);
-			}
-			// will always be little endian
-			var length = d[0] | (d[1] << 8) | (d[2] << 16) | (d[3] << 24);
-			// decode the LZ4 block
-			var inflated = new Buffer(length);
-			if(img_data.subarray) {
-				var uncompressedSize = LZ4.decodeBlock(img_data.subarray(4), inflated);
-			} else {
-				var uncompressedSize = LZ4.decodeBlock(img_data.slice(4), inflated);
-			}
-			img_data = inflated.slice(0, uncompressedSize);
-		}
+		img_data = inflate_rgb(img_data, options);
 		// set the imagedata rgb32 method
 		if(img_data.length > img.data.length) {
 			console.error("data size mismatch: wanted",img.data.length,", got",img_data.length, ", stride",rowstride);
@@ -884,6 +884,7 @@ if 'clean' in sys.argv or 'sdist' in sys.argv:
                    "xpra/x11/bindings/ximage.c",
                    "xpra/net/bencode/cython_bencode.c",
                    "xpra/net/vsock.c",
+                   "xpra/net/websocket_mask.c",
                    "xpra/codecs/vpx/encoder.c",
                    "xpra/codecs/vpx/decoder.c",
                    "xpra/codecs/vpx/constants.pxi",
@@ -1866,7 +1867,6 @@ if html5_ENABLED:
             k = os.sep+k
         add_data_files(html5_dir+k, v)
     if WIN32 or OSX:
-        external_includes.append("websockify")
         external_includes.append("numpy")
         external_includes.append("ssl")
         external_includes.append("_ssl")
@@ -2052,6 +2052,9 @@ if server_ENABLED:
     cython_add(Extension("xpra.server.cystats",
                 ["xpra/server/cystats.pyx"],
                 **O3_pkgconfig))
+    cython_add(Extension("xpra.net.websocket_mask",
+                ["xpra/net/websocket_mask.pyx"]+membuffers_c,
+                **O3_pkgconfig))
     cython_add(Extension("xpra.server.window.region",
                 ["xpra/server/window/region.pyx"],
                 **O3_pkgconfig))
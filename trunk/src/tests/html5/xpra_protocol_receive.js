@@ -0,0 +1,253 @@
+#!/usr/bin/env node
+/*
+ * This file is part of Xpra.
+ * Copyright (C) 2016 Antoine Martin <antoine@devloop.org.uk>
+ * Xpra is released under the terms of the GNU GPL v2, or, at your option, any
+ * later version. See the file COPYING for details.
+ *
+ * Measures the receive path of the html5 client's XpraProtocol
+ * (header parsing, packet extraction, decompression and bdecode)
+ * by replaying a packet capture, and compares the cost of extracting the packets
+ * using the old byte array receive queue against the Uint8Array chunk queue.
+ *
+ * A capture is the sequence of websocket messages received by the client,
+ * each one stored as a 4 byte big endian length followed by the message data.
+ *
+ * usage:
+ *  node xpra_protocol_receive.js --generate capture.bin
+ *      writes a synthetic capture: control packets, lz4 and zlib compressed packets
+ *      and draw packets with large raw chunks, split into websocket messages of random sizes
+ *  node xpra_protocol_receive.js [capture.bin] [iterations]
+ *      replays the capture (or a synthetic one)
+ */
+
+var fs = require('fs');
+var vm = require('vm');
+var path = require('path');
+var zlib = require('zlib');
+
+var INCLUDE = path.join(__dirname, '..', '..', 'html5', 'include');
+
+
+function load_protocol() {
+	// the protocol only starts a worker when it is not loaded in a document,
+	// and we feed it the websocket messages ourselves:
+	var ctx = {
+		console		: console,
+		window		: {},
+		document	: {},
+		WebSocket	: function(uri, protocol) {},
+	};
+	ctx.window.document = ctx.document;
+	vm.createContext(ctx);
+	var scripts = ['bencode.js', 'inflate.min.js', 'lz4.min.js', 'xpra_protocol.js'];
+	for (var i=0; i<scripts.length; i++) {
+		var filename = path.join(INCLUDE, scripts[i]);
+		vm.runInContext(fs.readFileSync(filename, 'utf8'), ctx, {filename: filename});
+	}
+	return ctx;
+}
+
+
+// a deterministic random number generator, so the synthetic captures are reproducible
+var seed = 1;
+function random() {
+	seed = (seed * 16807) % 2147483647;
+	return (seed - 1) / 2147483646;
+}
+
+function make_pixels(size) {
+	// compressible, but not trivially so:
+	var data = Buffer.alloc(size);
+	for (var i=0; i<size; i++) {
+		data[i] = (i % 251) ^ (random()<0.2 ? Math.floor(random()*256) : 0);
+	}
+	return data;
+}
+
+function make_frame(payload, level, index) {
+	var header = Buffer.from([0x50, 0, level, index, 0, 0, 0, 0]);
+	header.writeUInt32BE(payload.length, 4);
+	return Buffer.concat([header, payload]);
+}
+
+function make_capture(ctx) {
+	var LZ4 = vm.runInContext("require('lz4')", ctx);
+	function bencoded(packet) {
+		return Buffer.from(ctx.bencode(packet), 'binary');
+	}
+	function lz4(data) {
+		var output = Buffer.alloc(LZ4.encodeBound(data.length));
+		var size = LZ4.encodeBlock(data, output);
+		var prefix = Buffer.alloc(4);
+		prefix.writeUInt32LE(data.length, 0);
+		return Buffer.concat([prefix, output.slice(0, size)]);
+	}
+	var frames = [];
+	for (var i=0; i<2000; i++) {
+		var r = random();
+		if (r<0.5) {
+			// small control packets, mostly uncompressed
+			frames.push(make_frame(bencoded(["ping", i*10, "", ""]), 0, 0));
+		}
+		else if (r<0.7) {
+			var packet = ["window-metadata", 1, {"title" : "window "+i, "size-constraints" : {"minimum-size" : [100, 100]}}];
+			if (r<0.6) {
+				frames.push(make_frame(lz4(bencoded(packet)), 0x10, 0));
+			} else {
+				frames.push(make_frame(zlib.deflateSync(bencoded(packet)), 1, 0));
+			}
+		}
+		else {
+			// draw packet with the pixel data in a raw chunk:
+			var w = 64 + Math.floor(random()*512);
+			var h = 64 + Math.floor(random()*256);
+			var pixels = make_pixels(w*h*4);
+			frames.push(make_frame(lz4(pixels), 0x10, 7));
+			frames.push(make_frame(bencoded(["draw", 1, 0, 0, w, h, "rgb32", "", i, w*4, {}]), 0, 0));
+		}
+	}
+	// the websocket messages don't match the packet boundaries:
+	var stream = Buffer.concat(frames);
+	var messages = [];
+	var pos = 0;
+	while (pos<stream.length) {
+		var size = Math.min(stream.length-pos, 1 + Math.floor(random()*128*1024));
+		messages.push(stream.slice(pos, pos+size));
+		pos += size;
+	}
+	return messages;
+}
+
+function save_capture(filename, messages) {
+	var parts = [];
+	for (var i=0; i<messages.length; i++) {
+		var len = Buffer.alloc(4);
+		len.writeUInt32BE(messages[i].length, 0);
+		parts.push(len, messages[i]);
+	}
+	fs.writeFileSync(filename, Buffer.concat(parts));
+}
+
+function load_capture(filename) {
+	var data = fs.readFileSync(filename);
+	var messages = [];
+	var pos = 0;
+	while (pos+4<=data.length) {
+		var size = data.readUInt32BE(pos);
+		messages.push(data.slice(pos+4, pos+4+size));
+		pos += 4+size;
+	}
+	return messages;
+}
+
+function to_arraybuffers(messages) {
+	// each message gets its own ArrayBuffer, like the websocket gives us:
+	return messages.map(function(m) {
+		return new Uint8Array(m).buffer;
+	});
+}
+
+
+function parse_sizes(buf) {
+	var size = 0;
+	for (var i=0; i<4; i++) {
+		size = size*0x100 + buf[4+i];
+	}
+	return size;
+}
+
+// the old receive queue: one array element per byte
+function extract_byte_array(buffers) {
+	var rQ = [];
+	var count = 0;
+	for (var m=0; m<buffers.length; m++) {
+		var u8 = new Uint8Array(buffers[m]);
+		for (var i = 0; i < u8.length; i++) {
+			rQ.push(u8[i]);
+		}
+		while (rQ.length>=8) {
+			var size = parse_sizes(rQ.slice(0, 8));
+			if (rQ.length<size+8) {
+				break;
+			}
+			rQ.splice(0, 8);
+			rQ.splice(0, size);
+			count += 1;
+		}
+	}
+	return count;
+}
+
+// the chunk queue, without decoding the packets
+function extract_chunks(ctx, buffers) {
+	var protocol = new ctx.XpraProtocol();
+	var count = 0;
+	for (var m=0; m<buffers.length; m++) {
+		protocol._buffer_push(new Uint8Array(buffers[m]));
+		while (protocol.rQlen>=8) {
+			var size = parse_sizes(protocol._buffer_peek(8));
+			if (protocol.rQlen<size+8) {
+				break;
+			}
+			protocol._buffer_shift(8);
+			protocol._buffer_shift(size);
+			count += 1;
+		}
+	}
+	return count;
+}
+
+// the complete receive path, as used by the client
+function receive(ctx, buffers) {
+	var protocol = new ctx.XpraProtocol();
+	var count = 0;
+	protocol.set_packet_handler(function(packet, ctx) {
+		if (packet[0]=="draw" && packet[7].length!=packet[4]*packet[5]*4) {
+			throw "invalid pixel data for draw packet "+packet[8]+": "+packet[7].length+" bytes";
+		}
+		count += 1;
+	}, null);
+	protocol.open("ws://localhost/");
+	var ws = protocol.websocket;
+	for (var m=0; m<buffers.length; m++) {
+		ws.onmessage({data : buffers[m]});
+	}
+	return count;
+}
+
+
+function time_it(name, bytes, iterations, fn) {
+	var count = 0;
+	var start = process.hrtime();
+	for (var i=0; i<iterations; i++) {
+		count = fn();
+	}
+	var elapsed = process.hrtime(start);
+	var ms = (elapsed[0]*1000 + elapsed[1]/1000000) / iterations;
+	var mbps = bytes/1024/1024/(ms/1000);
+	console.log("  "+name+": "+count+" packets in "+ms.toFixed(1)+"ms, "+mbps.toFixed(1)+"MB/s");
+}
+
+function main(argv) {
+	var ctx = load_protocol();
+	if (argv[0]=="--generate") {
+		var messages = make_capture(ctx);
+		save_capture(argv[1], messages);
+		console.log("saved "+messages.length+" websocket messages to "+argv[1]);
+		return;
+	}
+	var messages = argv.length>0 ? load_capture(argv[0]) : make_capture(ctx);
+	var iterations = argv.length>1 ? parseInt(argv[1]) : 5;
+	var bytes = 0;
+	for (var i=0; i<messages.length; i++) {
+		bytes += messages[i].length;
+	}
+	var buffers = to_arraybuffers(messages);
+	console.log(messages.length+" websocket messages, "+Math.round(bytes/1024)+"KB:");
+	time_it("byte array extraction", bytes, iterations, function() { return extract_byte_array(buffers); });
+	time_it("chunk queue extraction", bytes, iterations, function() { return extract_chunks(ctx, buffers); });
+	time_it("XpraProtocol receive", bytes, iterations, function() { return receive(ctx, buffers); });
+}
+
+main(process.argv.slice(2));
@@ -0,0 +1,138 @@
+#!/usr/bin/env python
+# This file is part of Xpra.
+# Copyright (C) 2016 Antoine Martin <antoine@devloop.org.uk>
+# Xpra is released under the terms of the GNU GPL v2, or, at your option, any
+# later version. See the file COPYING for details.
+
+import time
+import unittest
+from threading import Lock, Event
+
+from xpra.client.draw_pool import DrawPool
+
+
+class TestDrawPool(unittest.TestCase):
+
+    def test_order_per_window(self):
+        lock = Lock()
+        drawn = {}
+        done = Event()
+        N = 50
+        def process(packet):
+            wid, seq = packet[1], packet[8]
+            with lock:
+                drawn.setdefault(wid, []).append(seq)
+                if sum(len(x) for x in drawn.values())==3*N:
+                    done.set()
+        pool = DrawPool(process, threads=3)
+        pool.start()
+        try:
+            for seq in range(N):
+                for wid in (1, 2, 3):
+                    #video packets are never skipped:
+                    pool.put(["draw", wid, 0, 0, 10, 10, "h264", b"", seq, 0, {}])
+            assert done.wait(5), "only processed %s" % drawn
+        finally:
+            pool.stop()
+            for t in pool.threads:
+                t.join(5)
+        for wid in (1, 2, 3):
+            assert drawn[wid]==list(range(N)), "window %i packets processed out of order: %s" % (wid, drawn[wid])
+        info = pool.get_info()
+        assert info["processed"]==3*N
+
+    def test_shared_stream(self):
+        #the packets of all the windows in the same stream are processed in the order received,
+        #even with multiple threads: (ie: legacy mmap draws)
+        lock = Lock()
+        drawn = []
+        done = Event()
+        N = 50
+        def process(packet):
+            with lock:
+                drawn.append(packet[8])
+                if len(drawn)==3*N:
+                    done.set()
+            time.sleep(0)
+        pool = DrawPool(process, threads=3)
+        pool.start()
+        try:
+            for seq in range(3*N):
+                pool.put(["draw", 1+seq%3, 0, 0, 10, 10, "mmap", [], seq, 0, {}], "mmap")
+            assert done.wait(5), "only processed %s" % drawn
+        finally:
+            pool.stop()
+            for t in pool.threads:
+                t.join(5)
+        assert drawn==list(range(3*N)), "packets processed out of order: %s" % drawn
+
+    def test_slow_window(self):
+        #a slow window must not prevent the other window from being painted:
+        slow_started = Event()
+        release = Event()
+        fast_done = Event()
+        def process(packet):
+            wid = packet[1]
+            if wid==1:
+                slow_started.set()
+                release.wait(5)
+            else:
+                fast_done.set()
+        pool = DrawPool(process, threads=2)
+        pool.start()
+        try:
+            pool.put(["draw", 1, 0, 0, 10, 10, "png", b"", 1, 0, {}])
+            assert slow_started.wait(5)
+            start = time.time()
+            pool.put(["draw", 2, 0, 0, 10, 10, "png", b"", 2, 0, {}])
+            assert fast_done.wait(5)
+            assert time.time()-start<1
+            #the slow window is still being processed:
+            assert pool.get_info()["queued"].get(1)==0
+        finally:
+            release.set()
+            pool.stop()
+
+    def test_coalesce(self):
+        skipped = []
+        pool = DrawPool(None, skipped.append, threads=1)
+        #not started, so the packets just accumulate:
+        def draw(seq, x, y, w, h, coding="png", options={}):
+            pool.put(["draw", 1, x, y, w, h, coding, b"", seq, 0, options])
+        def queued():
+            return [p[8] for p in pool.pending.get(1, [])]
+        draw(1, 0, 0, 10, 10)
+        draw(2, 0, 0, 100, 100)
+        #the first packet was already waiting for a thread, it is replaced:
+        assert queued()==[2] and [p[8] for p in skipped]==[1]
+        #video and delta packets are kept:
+        draw(3, 10, 10, 10, 10, "h264")
+        draw(4, 20, 20, 10, 10, "png", {"delta" : 1})
+        draw(5, 30, 30, 10, 10, "png", {"store" : 2})
+        #not covered:
+        draw(6, 90, 90, 20, 20)
+        draw(7, 0, 0, 100, 100)
+        assert queued()==[3, 4, 5, 6, 7], "got %s" % queued()
+        assert [p[8] for p in skipped]==[1, 2]
+        #packets before a scroll packet cannot be skipped:
+        draw(8, 0, 0, 50, 50, "scroll")
+        draw(9, 0, 0, 100, 100)
+        assert queued()==[3, 4, 5, 6, 7, 8, 9], "got %s" % queued()
+        info = pool.get_info()
+        assert info["skipped"]==2 and info["queued"]=={1 : 7}
+
+    def test_coalesce_shared_stream(self):
+        #a packet only supersedes the packets of its own window:
+        skipped = []
+        pool = DrawPool(None, skipped.append, threads=1)
+        for seq, wid in ((1, 1), (2, 2), (3, 1)):
+            pool.put(["draw", wid, 0, 0, 100, 100, "png", b"", seq, 0, {}], "mmap")
+        assert [p[8] for p in pool.pending["mmap"]]==[2, 3]
+        assert [p[8] for p in skipped]==[1]
+
+
+def main():
+    unittest.main()
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,69 @@
+#!/usr/bin/env python
+# This file is part of Xpra.
+# Copyright (C) 2016 Antoine Martin <antoine@devloop.org.uk>
+# Xpra is released under the terms of the GNU GPL v2, or, at your option, any
+# later version. See the file COPYING for details.
+
+import unittest
+
+from xpra.codecs.argb.argb import pack_rgb32     #@UnresolvedImport
+
+
+class TestPackRGB32(unittest.TestCase):
+
+    def test_clear_padding(self):
+        #2x2 pixels with 4 bytes of rowstride padding:
+        pixels = b"\1\2\3\4"*2+b"\0"*4 + b"\5\6\7\x08"*2+b"\0"*4
+        rgb_format, data, rowstride = pack_rgb32(pixels, 2, 2, 12, "BGRX")
+        assert rgb_format=="BGRX"
+        assert rowstride==8
+        assert data==b"\1\2\3\xff"*2+b"\5\6\7\xff"*2, "unexpected output: %r" % data
+        rgb_format, data, rowstride = pack_rgb32(pixels, 2, 2, 12, "XRGB")
+        assert data==b"\xff\2\3\4"*2+b"\xff\6\7\x08"*2, "unexpected output: %r" % data
+
+    def test_alpha_preserved(self):
+        pixels = b"\1\2\3\4"*4
+        rgb_format, data, rowstride = pack_rgb32(pixels, 2, 2, 8, "RGBA")
+        assert rgb_format=="RGBA" and rowstride==8
+        assert data==pixels
+
+    def test_rgb24(self):
+        pixels = b"\1\2\3\4"*2+b"\0"*4 + b"\5\6\7\x08"*2+b"\0"*4
+        for src_format, dst_format, expected in (
+            ("BGRX", "BGR", b"\1\2\3"*2+b"\5\6\7"*2),
+            ("XRGB", "RGB", b"\2\3\4"*2+b"\6\7\x08"*2),
+            ("RGBA", "RGB", b"\1\2\3"*2+b"\5\6\7"*2),
+            ("BGXR", "BGR", b"\1\2\4"*2+b"\5\6\x08"*2),
+            ):
+            rgb_format, data, rowstride = pack_rgb32(pixels, 2, 2, 12, src_format, True)
+            assert rgb_format==dst_format, "expected %s but got %s" % (dst_format, rgb_format)
+            assert rowstride==6
+            assert data==expected, "unexpected output for %s: %r" % (src_format, data)
+
+    def test_invalid(self):
+        for args in (
+            (b"\0"*16, 2, 2, 8, "RGB"),         #not a 32-bit format
+            (b"\0"*15, 2, 2, 8, "BGRX"),        #buffer too small
+            (b"\0"*16, 2, 2, 4, "BGRX"),        #invalid rowstride
+            (b"", 2, 0, 8, "BGRX"),             #zero height
+            (b"", 0, 2, 8, "BGRX"),             #zero width
+            ):
+            try:
+                pack_rgb32(*args)
+            except Exception:
+                pass
+            else:
+                raise Exception("pack_rgb32%s should have failed" % (args, ))
+        try:
+            pack_rgb32(b"\0"*16, 2, 2, 8, "RGBP", True)
+        except Exception:
+            pass
+        else:
+            raise Exception("pack_rgb32 should fail to drop a channel that does not exist")
+
+
+def main():
+    unittest.main()
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,107 @@
+#!/usr/bin/env python
+# This file is part of Xpra.
+# Copyright (C) 2016 Antoine Martin <antoine@devloop.org.uk>
+# Xpra is released under the terms of the GNU GPL v2, or, at your option, any
+# later version. See the file COPYING for details.
+
+import os
+import unittest
+
+from xpra.os_util import memoryview_to_bytes
+from xpra.codecs.image_wrapper import ImageWrapper
+try:
+    from xpra.codecs.csc_cython import colorspace_converter     #@UnresolvedImport
+except ImportError:
+    colorspace_converter = None
+
+#small bands, so that we can test the band edges with small images:
+MIN_BAND_ROWS = 4
+THREADS = 3
+
+
+def get_rows(image):
+    """ returns the rows of pixels of each plane, without the rowstride padding """
+    w = image.get_width()
+    h = image.get_height()
+    pixels = image.get_pixels()
+    if image.get_planes()==ImageWrapper.PACKED:
+        rowstride = image.get_rowstride()
+        bpp = len(image.get_pixel_format())
+        data = memoryview_to_bytes(pixels)
+        return [data[y*rowstride:y*rowstride+w*bpp] for y in range(h)]
+    planes = []
+    for i, plane in enumerate(pixels):
+        rowstride = image.get_rowstride()[i]
+        data = memoryview_to_bytes(plane)
+        pw, ph = w, h
+        if i>0 and image.get_pixel_format()=="YUV420P":
+            pw, ph = (w+1)//2, (h+1)//2
+        planes.append([data[y*rowstride:y*rowstride+pw] for y in range(ph)])
+    return planes
+
+
+@unittest.skipUnless(colorspace_converter, "csc_cython is not available")
+class TestThreadedConverter(unittest.TestCase):
+
+    def setUp(self):
+        self.saved = colorspace_converter.THREADS, colorspace_converter.MIN_BAND_ROWS
+        colorspace_converter.THREADS = THREADS
+        colorspace_converter.MIN_BAND_ROWS = MIN_BAND_ROWS
+
+    def tearDown(self):
+        colorspace_converter.THREADS, colorspace_converter.MIN_BAND_ROWS = self.saved
+
+    def convert(self, converter_class, image, dst_width, dst_height, dst_format):
+        converter = converter_class()
+        converter.init_context(image.get_width(), image.get_height(), image.get_pixel_format(),
+                               dst_width, dst_height, dst_format)
+        try:
+            return converter.convert_image(image)
+        finally:
+            converter.clean()
+
+    def compare(self, image, dst_width, dst_height, dst_format):
+        single = self.convert(colorspace_converter.ColorspaceConverter, image, dst_width, dst_height, dst_format)
+        threaded = self.convert(colorspace_converter.ThreadedColorspaceConverter, image, dst_width, dst_height, dst_format)
+        assert get_rows(single)==get_rows(threaded), "threaded output differs for %s %ix%i to %s %ix%i" % (
+            image.get_pixel_format(), image.get_width(), image.get_height(), dst_format, dst_width, dst_height)
+        return single
+
+    def test_rgb_yuv(self):
+        #odd heights, and heights on either side of the band edges:
+        for w, h in ((32, 15), (34, 33), (18, 47), (64, 64), (20, 65), (30, 96), (26, 97), (40, 250)):
+            for src_format in ("BGRX", "RGBX", "RGB", "BGR", "r210"):
+                bpp = 4 if src_format=="r210" else len(src_format)
+                rowstride = w*bpp+8
+                image = ImageWrapper(0, 0, w, h, os.urandom(rowstride*h), src_format, 24, rowstride, planes=ImageWrapper.PACKED)
+                for dw, dh in ((w, h), (w//2*2, h*3//4//2*2), (w//2, h//2)):
+                    yuv = self.compare(image, dw, dh, "YUV420P")
+                    if src_format!="BGRX":
+                        continue
+                    #and back to rgb:
+                    for dst_format in ("RGB", "BGR", "RGBX", "BGRX"):
+                        self.compare(yuv, w, h, dst_format)
+
+    def test_gbrp(self):
+        for w, h in ((16, 7), (24, 33), (10, 64), (36, 101)):
+            planes = [os.urandom(w*h) for _ in range(3)]
+            image = ImageWrapper(0, 0, w, h, planes, "GBRP", 24, [w, w, w], planes=ImageWrapper._3_PLANES)
+            for dst_format in ("RGBX", "BGRX"):
+                self.compare(image, w, h, dst_format)
+
+    def test_specs(self):
+        specs = colorspace_converter.get_specs("BGRX", "YUV420P")
+        self.assertEqual(len(specs), 2)
+        threaded = specs[1]
+        self.assertTrue(threaded.speed>specs[0].speed)
+        #the speed is only advertised for frames which are split into at least two bands:
+        self.assertEqual(threaded.threaded_min_h, 4*MIN_BAND_ROWS)
+        colorspace_converter.THREADS = 1
+        self.assertEqual(len(colorspace_converter.get_specs("BGRX", "YUV420P")), 1)
+
+
+def main():
+    unittest.main()
+
+if __name__ == '__main__':
+    main()
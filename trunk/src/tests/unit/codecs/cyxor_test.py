@@ -4,14 +4,15 @@
 # Xpra is released under the terms of the GNU GPL v2, or, at your option, any
 # later version. See the file COPYING for details.
 
+import os
 import time
 import unittest
 
 from xpra.os_util import strtobytes
 try:
-    from xpra.codecs.xor.cyxor import xor_str       #@UnresolvedImport
+    from xpra.codecs.xor.cyxor import xor_str, xor_rows     #@UnresolvedImport
 except:
-    xor_str = None
+    xor_str, xor_rows = None, None
 import binascii
 def h(v):
     return binascii.hexlify(v)
@@ -62,6 +63,57 @@ class TestHMAC(unittest.TestCase):
         #print("%iMB/s: took %ims on average (%s iterations)" % (speed, 1000*(end-start)/count, count))
         assert speed>0, "running the xor speed test took too long"
 
+    def make_rows(self, rowstride, height, changed, size=None):
+        old = os.urandom(size or rowstride*height)
+        new = bytearray(old)
+        for y in changed:
+            new[y*rowstride:(y+1)*rowstride] = os.urandom(len(new[y*rowstride:(y+1)*rowstride]))
+        return old, bytes(new)
+
+    def test_xor_rows(self):
+        for rowstride, height, changed in (
+                                           (64, 10, []),
+                                           (64, 10, [0]),
+                                           (64, 10, [9]),
+                                           (64, 10, [2, 3, 7]),
+                                           (64, 10, list(range(10))),
+                                           #rowstride not a multiple of 8:
+                                           (3*17, 5, [1, 4]),
+                                           ):
+            old, new = self.make_rows(rowstride, height, changed)
+            xored = xor_rows(new, old, rowstride, changed)
+            #same as xoring the whole buffer, since the other rows are identical:
+            assert xored==xor_str(new, old), "xor_rows differs from xor_str for rowstride=%i, changed=%s" % (rowstride, changed)
+            #the client can reconstruct the new pixels from the delta:
+            assert bytes(xor_str(xored, old))==new
+            for y in range(height):
+                if y not in changed:
+                    assert xored[y*rowstride:(y+1)*rowstride]==bytearray(rowstride)
+
+    def test_xor_rows_partial_last_row(self):
+        #the buffer does not end on a row boundary:
+        rowstride, height = 40, 6
+        size = rowstride*(height-1)+12
+        old, new = self.make_rows(rowstride, height, [1, height-1], size)
+        assert len(new)==size
+        xored = xor_rows(new, old, rowstride, [1, height-1])
+        assert len(xored)==size
+        assert bytes(xor_str(xored, old))==new
+
+    def test_xor_rows_invalid(self):
+        old, new = self.make_rows(32, 4, [1])
+        def f(*args):
+            try:
+                xor_rows(*args)
+            except Exception:
+                return
+            raise Exception("xor_rows should have failed for %s" % (args[2:], ))
+        #invalid rows:
+        f(new, old, 32, [4])
+        f(new, old, 32, [-1])
+        #buffers of different sizes:
+        f(new, old[:-1], 32, [1])
+        f(new+b"\0"*32, old, 32, [1])
 
 
 def main():
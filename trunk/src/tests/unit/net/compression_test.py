@@ -0,0 +1,84 @@
+#!/usr/bin/env python
+# This file is part of Xpra.
+# Copyright (C) 2016 Antoine Martin <antoine@devloop.org.uk>
+# Xpra is released under the terms of the GNU GPL v2, or, at your option, any
+# later version. See the file COPYING for details.
+
+import os
+import unittest
+
+from xpra.net import compression
+from xpra.net.compression import CompressionPolicy, decompress, COMPRESSION_SAMPLES
+
+
+class TestCompressionPolicy(unittest.TestCase):
+
+	def test_default_only(self):
+		p = CompressionPolicy()
+		#no compressors negotiated yet: use the default one
+		p.set_compressors("zlib")
+		data = b"0123456789"*100
+		cl, cdata = p.compress("hello", data, 1)
+		assert cl>0 and decompress(cdata, cl)==data
+
+	def test_skip_random(self):
+		p = CompressionPolicy()
+		p.set_compressors("zlib", ["zlib"])
+		data = os.urandom(4096)
+		for _ in range(COMPRESSION_SAMPLES):
+			cl, cdata = p.compress("sound-data", data, 1)
+			assert cl>0
+		#random data does not compress, so we should stop trying:
+		cl, cdata = p.compress("sound-data", data, 1)
+		assert cl==0 and cdata==data
+		info = p.get_info()["packet"]["sound-data"]
+		assert info["choice"]=="none"
+		assert info["zlib"]["ratio"]>90
+
+	def test_compressible(self):
+		p = CompressionPolicy()
+		p.set_compressors("zlib", ["zlib"])
+		data = b"window-metadata"*100
+		for _ in range(COMPRESSION_SAMPLES+10):
+			cl, cdata = p.compress("window-metadata", data, 1)
+			assert cl>0 and decompress(cdata, cl)==data
+		info = p.get_info()["packet"]["window-metadata"]
+		assert info["choice"]=="zlib"
+		assert info["saved"]>0
+
+	def test_disabled(self):
+		saved = compression.ADAPTIVE_COMPRESSION
+		try:
+			compression.ADAPTIVE_COMPRESSION = False
+			p = CompressionPolicy()
+			p.set_compressors("zlib", ["zlib"])
+			data = os.urandom(4096)
+			for _ in range(COMPRESSION_SAMPLES+1):
+				cl, _ = p.compress("sound-data", data, 1)
+				assert cl>0
+		finally:
+			compression.ADAPTIVE_COMPRESSION = saved
+
+	def test_zstd_dictionary(self):
+		if not compression.has_zstd:
+			print("zstd is not available, skipped")
+			return
+		assert compression.ZSTD_DICTIONARY_ID>0
+		p = CompressionPolicy()
+		p.set_compressors("zstd", ["zstd"])
+		p.set_zstd_dictionary(compression.ZSTD_DICTIONARY_ID)
+		assert p.get_min_compress_size(378)<378
+		data = b"l15:configure-windowi1ei10ei20ei640ei480ed5:framel...e"
+		cl, cdata = p.compress("configure-window", data, 3)
+		assert cl & compression.ZSTD_FLAG
+		assert decompress(cdata, cl)==data
+		#a different dictionary id means the peer does not have the same dictionary:
+		p.set_zstd_dictionary(1)
+		assert not p.zstd_dictionary
+
+
+def main():
+	unittest.main()
+
+if __name__ == '__main__':
+	main()
@@ -5,9 +5,14 @@
 # Xpra is released under the terms of the GNU GPL v2, or, at your option, any
 # later version. See the file COPYING for details.
 
+import os
+import hmac
 import time
+import socket
+import hashlib
 import unittest
 import binascii
+import threading
 from xpra.os_util import strtobytes
 
 from xpra.net.crypto import DEFAULT_SALT, DEFAULT_ITERATIONS, DEFAULT_BLOCKSIZE, DEFAULT_IV
@@ -136,6 +141,240 @@ class TestCrypto(unittest.TestCase):
             self.do_test_perf(i, 10, 10)
 
 
+class Scheduler(object):
+    def idle_add(self, fn, *args):
+        fn(*args)
+    def timeout_add(self, delay, fn, *args):
+        pass
+    def source_remove(self, *args):
+        pass
+
+
+class TestAEAD(unittest.TestCase):
+
+    def setUp(self):
+        from xpra.net import crypto
+        crypto.crypto_backend_init()
+        if crypto.MODE_GCM not in crypto.MODES:
+            self.skipTest("no %s support" % crypto.MODE_GCM)
+
+    def test_cipher_mode(self):
+        from xpra.net.crypto import get_cipher_mode, choose_mode, MODES, MODE_CBC, MODE_GCM
+        self.assertEqual(get_cipher_mode("AES"), ("AES", None))
+        self.assertEqual(get_cipher_mode("AES-GCM"), ("AES", MODE_GCM))
+        self.assertEqual(choose_mode([MODE_CBC]), MODE_CBC)
+        self.assertEqual(choose_mode(MODES), MODES[0])
+        self.assertRaises(Exception, choose_mode, ["foo"])
+
+    def test_gcm(self):
+        from xpra.net.crypto import get_encryptor, get_decryptor, MODE_GCM, AEAD_TAG_SIZE
+        args = ("AES", DEFAULT_IV, "this is our secret", DEFAULT_SALT, DEFAULT_ITERATIONS, MODE_GCM)
+        enc = get_encryptor(*args)[0]
+        def dec():
+            return get_decryptor(*args)[0]
+        message = b"some message"*1000
+        nonces = [enc.next_nonce() for _ in range(10)]
+        self.assertEqual(len(set(nonces)), 10)
+        nonce = nonces[0]
+        v = enc.encrypt(nonce, message, b"header")
+        self.assertEqual(len(v), len(message)+AEAD_TAG_SIZE)
+        self.assertEqual(dec().decrypt(nonce, v, b"header"), message)
+        #tampering with the data, the header or the nonce is detected:
+        tampered = bytearray(v)
+        tampered[10] ^= 1
+        self.assertRaises(Exception, dec().decrypt, nonce, bytes(tampered), b"header")
+        self.assertRaises(Exception, dec().decrypt, nonce, v, b"headex")
+        tampered = bytearray(nonce)
+        tampered[0] ^= 1
+        self.assertRaises(Exception, dec().decrypt, bytes(tampered), v, b"header")
+
+    def test_protocol(self):
+        import os
+        import socket
+        import threading
+        from xpra.net.crypto import MODE_CBC, MODE_GCM, PARALLEL_ENCRYPT_SIZE
+        from xpra.net.protocol import Protocol
+        from xpra.net.bytestreams import SocketConnection
+        from xpra.net.compression import Compressed
+        for mode in (MODE_CBC, MODE_GCM):
+            a, b = socket.socketpair()
+            received = []
+            done = threading.Event()
+            payload = os.urandom(PARALLEL_ENCRYPT_SIZE*3)
+            packets = []
+            for i in range(5):
+                packets.append(["draw", i, 0, 0, 10, 10, "rgb32", Compressed("raw", payload[i:])])
+                packets.append(["ping", i])
+            def process(proto, packet):
+                received.append(packet)
+                if len(received)==len(packets):
+                    done.set()
+            sender = Protocol(Scheduler(), SocketConnection(a, "a", "b", "a", "unix-domain"), process)
+            receiver = Protocol(Scheduler(), SocketConnection(b, "b", "a", "b", "unix-domain"), process)
+            self.addCleanup(sender.close)
+            self.addCleanup(receiver.close)
+            for p in (sender, receiver):
+                p.enable_default_encoder()
+            sender.set_split_packets(True)
+            args = ("AES", DEFAULT_IV, "this is our secret", DEFAULT_SALT, DEFAULT_ITERATIONS, "PKCS#7", mode)
+            sender.set_cipher_out(*args)
+            receiver.set_cipher_in(*args)
+            queue = list(packets)
+            def next_packet():
+                return queue.pop(0), None, None, bool(queue)
+            sender.set_packet_source(next_packet)
+            sender.start()
+            receiver.start()
+            sender.source_has_more()
+            self.assertTrue(done.wait(20), "only received %i packets using %s" % (len(received), mode))
+            draws = sorted((x for x in received if x[0] in ("draw", b"draw")), key=lambda x : x[1])
+            self.assertEqual([bytes(x[7]) for x in draws], [payload[i:] for i in range(5)])
+            if mode==MODE_GCM:
+                self.assertTrue(sender.parallel_encrypted>0)
+            else:
+                #chained cipher: the packets are written in the order they were encrypted
+                self.assertEqual([(strtobytes(x[0]), x[1]) for x in received], [(strtobytes(x[0]), x[1]) for x in packets])
+
+
+class FakeAEAD(object):
+    """ authenticates the data with an HMAC (without encrypting it), so we can test without a crypto backend """
+    def __init__(self, key):
+        self.key = key
+
+    def tag(self, nonce, data, aad):
+        from xpra.net.crypto import AEAD_TAG_SIZE
+        return hmac.new(self.key, nonce+aad+data, hashlib.sha256).digest()[:AEAD_TAG_SIZE]
+
+    def encrypt(self, nonce, data, aad):
+        return data+self.tag(nonce, data, aad)
+
+    def decrypt(self, nonce, data, aad):
+        from xpra.net.crypto import AEAD_TAG_SIZE
+        data, tag = data[:-AEAD_TAG_SIZE], data[-AEAD_TAG_SIZE:]
+        if tag!=self.tag(nonce, data, aad):
+            raise Exception("authentication failed")
+        return data
+
+
+class FakeBackend(object):
+    __name__ = "fake"
+    def get_key(self, password, key_salt, block_size, iterations):
+        return strtobytes(password)
+    def get_aead(self, key):
+        return FakeAEAD(key)
+
+
+class TestAEADNonces(unittest.TestCase):
+
+    def setUp(self):
+        from xpra.net import crypto
+        self.saved_backend = crypto.backend
+        crypto.backend = FakeBackend()
+
+    def tearDown(self):
+        from xpra.net import crypto
+        crypto.backend = self.saved_backend
+
+    def get_ciphers(self):
+        from xpra.net.crypto import get_encryptor, get_decryptor, MODE_GCM
+        args = ("AES", DEFAULT_IV, "this is our secret", DEFAULT_SALT, DEFAULT_ITERATIONS, MODE_GCM)
+        return get_encryptor(*args)[0], get_decryptor(*args)[0]
+
+    def encrypt(self, enc, message):
+        nonce = enc.next_nonce()
+        return nonce, enc.encrypt(nonce, message, b"header")
+
+    def test_replay(self):
+        enc, dec = self.get_ciphers()
+        chunks = [self.encrypt(enc, b"message %i" % i) for i in range(5)]
+        nonce, v = chunks[0]
+        self.assertEqual(dec.decrypt(nonce, v, b"header"), b"message 0")
+        #replayed:
+        self.assertRaises(Exception, dec.decrypt, nonce, v, b"header")
+        #dropped:
+        self.assertRaises(Exception, dec.decrypt, chunks[2][0], chunks[2][1], b"header")
+        #a chunk which fails authentication does not move the counter:
+        self.assertRaises(Exception, dec.decrypt, chunks[1][0], chunks[1][1], b"headex")
+        self.assertEqual(dec.decrypt(chunks[1][0], chunks[1][1], b"header"), b"message 1")
+        #a chunk from another connection:
+        other = self.get_ciphers()[0]
+        other.counter = 2
+        nonce, v = self.encrypt(other, b"message 2")
+        self.assertRaises(Exception, dec.decrypt, nonce, v, b"header")
+        for i in (2, 3, 4):
+            self.assertEqual(dec.decrypt(chunks[i][0], chunks[i][1], b"header"), b"message %i" % i)
+
+    def make_protocols(self, process, sender_sock, receiver_sock):
+        from xpra.net.crypto import MODE_GCM
+        from xpra.net.protocol import Protocol
+        from xpra.net.bytestreams import SocketConnection
+        args = ("AES", DEFAULT_IV, "this is our secret", DEFAULT_SALT, DEFAULT_ITERATIONS, "PKCS#7", MODE_GCM)
+        sender = Protocol(Scheduler(), SocketConnection(sender_sock, "a", "b", "a", "unix-domain"), process)
+        receiver = Protocol(Scheduler(), SocketConnection(receiver_sock, "b", "a", "b", "unix-domain"), process)
+        for p in (sender, receiver):
+            p.enable_default_encoder()
+            self.addCleanup(p.close)
+        sender.set_cipher_out(*args)
+        receiver.set_cipher_in(*args)
+        return sender, receiver
+
+    def test_protocol_order(self):
+        #the write queue sends the ping packets before the split draw packets,
+        #the nonces must still be used in the order the chunks are written:
+        from xpra.net.crypto import PARALLEL_ENCRYPT_SIZE
+        from xpra.net.compression import Compressed
+        a, b = socket.socketpair()
+        received = []
+        done = threading.Event()
+        payload = os.urandom(PARALLEL_ENCRYPT_SIZE*3)
+        packets = []
+        for i in range(5):
+            packets.append(["draw", i, 0, 0, 10, 10, "rgb32", Compressed("raw", payload[i:])])
+            packets.append(["ping", i])
+        def process(proto, packet):
+            received.append(packet)
+            if len(received)==len(packets):
+                done.set()
+        sender, receiver = self.make_protocols(process, a, b)
+        sender.set_split_packets(True)
+        queue = list(packets)
+        def next_packet():
+            return queue.pop(0), None, None, bool(queue)
+        sender.set_packet_source(next_packet)
+        sender.start()
+        receiver.start()
+        sender.source_has_more()
+        self.assertTrue(done.wait(20), "only received %i packets: %s" % (len(received), [x[0] for x in received]))
+        draws = sorted((x for x in received if x[0] in ("draw", b"draw")), key=lambda x : x[1])
+        self.assertEqual([bytes(x[7]) for x in draws], [payload[i:] for i in range(5)])
+        self.assertTrue(sender.parallel_encrypted>0)
+        self.assertTrue(sender.get_info().get("output").get("priority").get("interleaved")>0)
+
+    def test_protocol_replay(self):
+        from xpra.net.protocol import Protocol
+        #capture what the sender writes:
+        a, b = socket.socketpair()
+        sender = self.make_protocols(lambda *args : None, a, socket.socketpair()[0])[0]
+        sender.start()
+        sender.send_now(["ping", 1])
+        b.settimeout(5)
+        data = b.recv(65536)
+        self.assertTrue(data)
+        #and send it twice to the receiver:
+        c, d = socket.socketpair()
+        received = []
+        lost = threading.Event()
+        def process(proto, packet):
+            received.append(packet)
+            if packet[0]==Protocol.CONNECTION_LOST:
+                lost.set()
+        receiver = self.make_protocols(process, socket.socketpair()[0], d)[1]
+        receiver.start()
+        c.sendall(data+data)
+        self.assertTrue(lost.wait(5), "the replayed packet was accepted: %s" % (received, ))
+        self.assertEqual([x[0] for x in received], [b"ping" if isinstance(received[0][0], bytes) else "ping", Protocol.CONNECTION_LOST])
+
+
 def main():
     unittest.main()
 
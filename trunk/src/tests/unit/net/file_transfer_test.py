@@ -0,0 +1,272 @@
+#!/usr/bin/env python
+# This file is part of Xpra.
+# Copyright (C) 2016 Antoine Martin <antoine@devloop.org.uk>
+# Xpra is released under the terms of the GNU GPL v2, or, at your option, any
+# later version. See the file COPYING for details.
+
+import os
+import shutil
+import hashlib
+import tempfile
+import unittest
+
+from xpra.util import typedict
+from xpra.platform import paths
+from xpra.net import file_transfer
+from xpra.net.file_transfer import FileTransferHandler, FILE_CHUNKS_WINDOW
+
+CHUNK_SIZE = 1024
+
+
+class LoopbackHandler(FileTransferHandler):
+	""" keeps the packets we send so the test can deliver them to the peer """
+
+	def __init__(self, scope=""):
+		self.scope = scope
+		self.timers = {}
+		self.timeout_add = self._timeout_add
+		self.idle_add = lambda fn, *args : fn(*args)
+		self.source_remove = self.timers.pop
+		FileTransferHandler.__init__(self)
+		self.init_attributes(True, 1, False, False, None)
+		self.file_chunks = CHUNK_SIZE
+		self.packets = []
+		self.downloaded = []
+		self.downloaded_options = []
+
+	def _timeout_add(self, delay, fn, *args):
+		timer = len(self.timers)+1
+		self.timers[timer] = (fn, args)
+		return timer
+
+	def send(self, *packet):
+		self.packets.append(packet)
+
+	def compressed_wrapper(self, datatype, data):
+		return data
+
+	def get_file_transfer_scope(self):
+		return self.scope
+
+	def do_process_downloaded_file(self, filename, mimetype, printit, openit, filesize, options):
+		self.downloaded.append(filename)
+		self.downloaded_options.append((mimetype, printit, openit))
+
+	def process(self, packet):
+		handler = {
+				"send-file"			: self._process_send_file,
+				"send-file-chunk"	: self._process_send_file_chunk,
+				"ack-file-chunk"	: self._process_ack_file_chunk,
+				}[packet[0]]
+		handler(packet)
+
+	def connect(self, uuid, stream=True):
+		caps = self.get_file_transfer_features()
+		caps["file-stream"] = stream
+		caps["uuid"] = uuid
+		return typedict(caps)
+
+
+class TestFileTransfer(unittest.TestCase):
+
+	def setUp(self):
+		self.tmpdir = tempfile.mkdtemp()
+		self.download_dir = os.path.join(self.tmpdir, "downloads")
+		os.mkdir(self.download_dir)
+		self.saved_get_download_dir = paths.get_download_dir
+		paths.get_download_dir = lambda : self.download_dir
+		file_transfer.suspended_downloads.clear()
+		file_transfer.suspended_uploads.clear()
+
+	def tearDown(self):
+		paths.get_download_dir = self.saved_get_download_dir
+		shutil.rmtree(self.tmpdir)
+
+	def make_file(self, size):
+		filename = os.path.join(self.tmpdir, "upload.bin")
+		data = os.urandom(size)
+		with open(filename, "wb") as f:
+			f.write(data)
+		return filename, data
+
+	def make_pair(self, stream=True, scope=""):
+		sender = LoopbackHandler(scope)
+		receiver = LoopbackHandler(scope)
+		sender.parse_file_transfer_caps(receiver.connect("receiver", stream))
+		receiver.parse_file_transfer_caps(sender.connect("sender", stream))
+		return sender, receiver
+
+	def exchange(self, sender, receiver, max_packets=-1):
+		""" delivers the packets in both directions, returns the chunks sent in each round """
+		rounds = []
+		while (sender.packets or receiver.packets) and max_packets!=0:
+			packets, sender.packets = sender.packets, []
+			rounds.append(len([x for x in packets if x[0]=="send-file-chunk"]))
+			for packet in packets:
+				receiver.process(packet)
+			packets, receiver.packets = receiver.packets, []
+			for packet in packets:
+				sender.process(packet)
+			max_packets -= 1
+		return rounds
+
+	def check_downloaded(self, receiver, data):
+		self.assertEqual(len(receiver.downloaded), 1)
+		with open(receiver.downloaded[0], "rb") as f:
+			self.assertEqual(f.read(), data)
+		self.assertEqual(os.listdir(self.download_dir), [os.path.basename(receiver.downloaded[0])])
+
+	def test_stream(self):
+		sender, receiver = self.make_pair()
+		filename, data = self.make_file(CHUNK_SIZE*20+17)
+		self.assertTrue(sender.send_file_from_path(filename))
+		options = sender.packets[0][7]
+		self.assertTrue(options.get("file-stream"))
+		self.assertTrue(options.get("file-id"))
+		self.assertNotIn("sha1", options)
+		rounds = self.exchange(sender, receiver)
+		#the chunks are sent without waiting for each ack:
+		self.assertEqual(rounds[1], FILE_CHUNKS_WINDOW)
+		self.assertEqual(sum(rounds), 21)
+		self.check_downloaded(receiver, data)
+		self.assertFalse(sender.send_chunks_in_progress)
+		self.assertFalse(receiver.receive_chunks_in_progress)
+
+	def test_digest_mismatch(self):
+		sender, receiver = self.make_pair()
+		filename, _ = self.make_file(CHUNK_SIZE*(FILE_CHUNKS_WINDOW+4))
+		self.assertTrue(sender.send_file_from_path(filename))
+		#corrupt the digest before the last chunk is sent:
+		self.exchange(sender, receiver, 1)
+		state = list(sender.send_chunks_in_progress.values())[0]
+		state.digest = hashlib.sha1(b"corrupt")
+		self.assertRaises(Exception, self.exchange, sender, receiver)
+		self.assertEqual(receiver.downloaded, [])
+
+	def test_legacy(self):
+		sender, receiver = self.make_pair(False)
+		filename, data = self.make_file(CHUNK_SIZE*5+1)
+		self.assertTrue(sender.send_file_from_path(filename))
+		options = sender.packets[0][7]
+		self.assertEqual(options.get("sha1"), hashlib.sha1(data).hexdigest())
+		self.assertNotIn("file-stream", options)
+		rounds = self.exchange(sender, receiver)
+		#one chunk at a time:
+		self.assertEqual(max(rounds), 1)
+		self.check_downloaded(receiver, data)
+
+	def test_memory(self):
+		sender, receiver = self.make_pair()
+		data = os.urandom(CHUNK_SIZE*3+5)
+		self.assertTrue(sender.send_file("memory.bin", "", data, len(data)))
+		self.exchange(sender, receiver)
+		self.check_downloaded(receiver, data)
+		#small files are sent in one packet:
+		sender.send_file("small.bin", "", data[:10], 10)
+		self.exchange(sender, receiver)
+		self.assertEqual(len(receiver.downloaded), 2)
+
+	def test_resume(self):
+		sender, receiver = self.make_pair()
+		filename, data = self.make_file(CHUNK_SIZE*30)
+		self.assertTrue(sender.send_file_from_path(filename))
+		self.exchange(sender, receiver, 2)
+		#the connection is lost:
+		received = list(receiver.receive_chunks_in_progress.values())[0].written
+		self.assertTrue(received>0)
+		receiver.cleanup()
+		sender.cleanup()
+		self.assertEqual(len(file_transfer.suspended_downloads), 1)
+		self.assertEqual(len(file_transfer.suspended_uploads), 1)
+		#and re-established, the sender resumes the upload:
+		sender, receiver = self.make_pair()
+		self.assertEqual(file_transfer.suspended_uploads, {})
+		rounds = self.exchange(sender, receiver)
+		self.assertEqual(file_transfer.suspended_downloads, {})
+		self.assertEqual(sum(rounds), 30-received//CHUNK_SIZE)
+		self.check_downloaded(receiver, data)
+
+	def test_resume_new_sender(self):
+		#the sender process was restarted, the user sends the same file again:
+		sender, receiver = self.make_pair()
+		filename, data = self.make_file(CHUNK_SIZE*10)
+		self.assertTrue(sender.send_file_from_path(filename))
+		self.exchange(sender, receiver, 2)
+		receiver.cleanup()
+		file_transfer.suspended_uploads.clear()
+		sender, receiver = self.make_pair()
+		self.assertTrue(sender.send_file_from_path(filename))
+		rounds = self.exchange(sender, receiver)
+		self.assertTrue(sum(rounds)<10)
+		self.check_downloaded(receiver, data)
+
+	def test_resume_options(self):
+		#what to do with the file comes from the new request, not the suspended one:
+		sender, receiver = self.make_pair()
+		filename, data = self.make_file(CHUNK_SIZE*10)
+		self.assertTrue(sender.send_file_from_path(filename, "application/octet-stream", False, True))
+		self.exchange(sender, receiver, 2)
+		receiver.cleanup()
+		file_transfer.suspended_uploads.clear()
+		sender, receiver = self.make_pair()
+		self.assertTrue(sender.send_file_from_path(filename))
+		rounds = self.exchange(sender, receiver)
+		self.assertTrue(sum(rounds)<10)
+		self.check_downloaded(receiver, data)
+		self.assertEqual(receiver.downloaded_options, [("", False, False)])
+
+	def test_resume_other_scope(self):
+		#a peer claiming the same uuid from another session cannot use our partial download:
+		sender, receiver = self.make_pair(scope="user1")
+		filename, data = self.make_file(CHUNK_SIZE*10)
+		self.assertTrue(sender.send_file_from_path(filename))
+		self.exchange(sender, receiver, 2)
+		receiver.cleanup()
+		sender.cleanup()
+		sender, receiver = self.make_pair(scope="user2")
+		#the upload is not resumed either:
+		self.assertEqual(sender.packets, [])
+		self.assertEqual(len(file_transfer.suspended_uploads), 1)
+		self.assertTrue(sender.send_file_from_path(filename))
+		rounds = self.exchange(sender, receiver)
+		self.assertEqual(sum(rounds), 10)
+		self.assertEqual(len(file_transfer.suspended_downloads), 1)
+		with open(receiver.downloaded[0], "rb") as f:
+			self.assertEqual(f.read(), data)
+
+	def test_resume_truncated(self):
+		sender, receiver = self.make_pair()
+		filename, data = self.make_file(CHUNK_SIZE*10)
+		self.assertTrue(sender.send_file_from_path(filename))
+		self.exchange(sender, receiver, 2)
+		receiver.cleanup()
+		file_transfer.suspended_uploads.clear()
+		#the partial file has been modified:
+		partial = list(file_transfer.suspended_downloads.values())[0].filename
+		with open(partial, "r+b") as f:
+			f.truncate(1)
+		sender, receiver = self.make_pair()
+		self.assertTrue(sender.send_file_from_path(filename))
+		rounds = self.exchange(sender, receiver)
+		self.assertEqual(sum(rounds), 10)
+		with open(receiver.downloaded[0], "rb") as f:
+			self.assertEqual(f.read(), data)
+
+	def test_resume_expired(self):
+		sender, receiver = self.make_pair()
+		filename, _ = self.make_file(CHUNK_SIZE*10)
+		sender.send_file_from_path(filename)
+		self.exchange(sender, receiver, 2)
+		receiver.cleanup()
+		self.assertEqual(len(os.listdir(self.download_dir)), 1)
+		file_transfer.expire_suspended_transfers(file_transfer.time.time()+file_transfer.RESUME_TIMEOUT+1)
+		self.assertEqual(file_transfer.suspended_downloads, {})
+		#the partial file is removed:
+		self.assertEqual(os.listdir(self.download_dir), [])
+
+
+def main():
+	unittest.main()
+
+if __name__ == '__main__':
+	main()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+# This file is part of Xpra.
+# Copyright (C) 2016 Antoine Martin <antoine@devloop.org.uk>
+# Xpra is released under the terms of the GNU GPL v2, or, at your option, any
+# later version. See the file COPYING for details.
+
+import mmap
+import unittest
+
+from xpra.net.mmap_pipe import MmapAllocator, mmap_read, mmap_free, mmap_write, is_slot_mode, int_from_buffer, DATA_OFFSET, RING_SIZE
+
+
+SIZE = 1024*1024
+
+def read(area, chunks):
+	v = mmap_read(area, chunks)
+	#ctypes array:
+	return getattr(v, "raw", v)
+
+class TestMmapPipe(unittest.TestCase):
+
+	def test_legacy(self):
+		area = mmap.mmap(-1, SIZE)
+		assert not is_slot_mode(area)
+		data = b"0123456789"*100
+		chunks, free = mmap_write(area, SIZE, data)
+		assert chunks and free>0
+		assert read(area, chunks)==data
+		#reading moves the data_start index past the data:
+		data_start = int_from_buffer(area, 0).value
+		assert data_start==chunks[-1][0]+chunks[-1][1]
+		mmap_free(area, chunks)
+		assert int_from_buffer(area, 0).value==data_start
+
+	def test_slots(self):
+		area = mmap.mmap(-1, SIZE)
+		allocator = MmapAllocator(area, SIZE)
+		assert is_slot_mode(area)
+		frames = []
+		for i in range(4):
+			data = bytes(bytearray([i])*100000)
+			chunks, free = allocator.write(data, i)
+			assert chunks and free>0
+			frames.append((chunks, data))
+		for chunks, data in frames:
+			assert read(area, chunks)==data
+		assert allocator.get_info()["slots"][""]==4
+		#free them out of order:
+		mmap_free(area, frames[2][0])
+		mmap_free(area, frames[0][0])
+		allocator.reclaim()
+		info = allocator.get_info()
+		assert info["slots"][""]==2
+		assert info["free"]["blocks"]==3
+		assert info["fragmentation"]>0
+		mmap_free(area, frames[1][0])
+		mmap_free(area, frames[3][0])
+		allocator.reclaim()
+		info = allocator.get_info()
+		assert info["slots"][""]==0
+		#all the blocks have been merged back:
+		assert info["free"]["blocks"]==1 and info["free"][""]==SIZE-DATA_OFFSET
+		assert info["fragmentation"]==0
+
+	def test_full(self):
+		area = mmap.mmap(-1, SIZE)
+		allocator = MmapAllocator(area, SIZE)
+		chunks, _ = allocator.write(b"0"*(SIZE//2))
+		assert chunks
+		#not enough space left:
+		assert allocator.write(b"1"*(SIZE//2))[0] is None
+		mmap_free(area, chunks)
+		#once the client has freed the slot, we can re-use it:
+		assert allocator.write(b"1"*(SIZE//2))[0]==chunks
+
+	def test_slot_limit(self):
+		area = mmap.mmap(-1, SIZE)
+		allocator = MmapAllocator(area, SIZE)
+		for _ in range(RING_SIZE-1):
+			assert allocator.write(b"x")[0]
+		#the ring must always have room for all the slots:
+		assert allocator.write(b"x")[0] is None
+		assert allocator.get_info()["failures"]==1
+
+
+def main():
+	unittest.main()
+
+if __name__ == '__main__':
+	main()
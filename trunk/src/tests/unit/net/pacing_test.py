@@ -0,0 +1,56 @@
+#!/usr/bin/env python
+# This file is part of Xpra.
+# Copyright (C) 2016 Antoine Martin <antoine@devloop.org.uk>
+# Xpra is released under the terms of the GNU GPL v2, or, at your option, any
+# later version. See the file COPYING for details.
+
+import time
+import unittest
+
+from xpra.net.compression import Compressed
+from xpra.net.pacing import Pacer, get_packet_size, MIN_BURST
+
+
+class TestPacing(unittest.TestCase):
+
+	def test_packet_size(self):
+		assert get_packet_size(["ping", 100])==0
+		packet = ["draw", 1, 0, 0, 100, 100, "png", Compressed("png", b"0"*1000), 1, 400, {}]
+		assert get_packet_size(packet)==1000
+
+	def test_disabled(self):
+		p = Pacer()
+		p.consume(100*1024*1024)
+		assert p.get_delay()==0
+
+	def test_rate(self):
+		rate = 1024*1024
+		p = Pacer(rate)
+		#we can always send the first burst:
+		assert p.get_delay()==0
+		p.consume(MIN_BURST)
+		assert p.get_delay()==0
+		#now in debt by 512KB, which takes about half a second to repay:
+		p.consume(512*1024)
+		delay = p.get_delay()
+		assert 0.4<delay<=0.5, "unexpected delay: %s" % delay
+		#the tokens are replenished over time:
+		p.tokens = -rate//100
+		time.sleep(0.02)
+		assert p.get_delay()==0
+		info = p.get_info()
+		assert info.get("rate")==rate and info.get("delayed")==1
+
+	def test_rate_change(self):
+		p = Pacer(100*1024*1024)
+		assert p.burst>MIN_BURST
+		p.set_rate(1024)
+		#the tokens are capped to the new burst size:
+		assert p.tokens<=p.burst==MIN_BURST
+
+
+def main():
+	unittest.main()
+
+if __name__ == '__main__':
+	main()
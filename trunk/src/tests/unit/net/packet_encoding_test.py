@@ -0,0 +1,65 @@
+#!/usr/bin/env python
+# This file is part of Xpra.
+# Copyright (C) 2016 Antoine Martin <antoine@devloop.org.uk>
+# Xpra is released under the terms of the GNU GPL v2, or, at your option, any
+# later version. See the file COPYING for details.
+
+import unittest
+
+from xpra.net import packet_encoding
+from xpra.net.header import FLAGS_RENCODE, FLAGS_BENCODE, FLAGS_YAML
+
+
+class TestPacketEncoding(unittest.TestCase):
+
+	def _test_peek(self, encoder, flags):
+		peek = packet_encoding.peek_packet_type
+		for packet in (["draw", 1, 2, 3, b"x"*1000, {"a" : 1}], ["hello", {}], ["ping"]):
+			data = encoder(packet)
+			assert peek(data, flags)==packet[0], "expected %s but got %s" % (packet[0], peek(data, flags))
+			assert peek(memoryview(data), flags)==packet[0]
+		#aliases can't be resolved:
+		assert peek(encoder([5, "foo"]), flags) is None
+		#garbage:
+		assert peek(b"", flags) is None
+		assert peek(b"\0\0\0", flags) is None
+
+	def test_peek_bencode(self):
+		packet_encoding.init_bencode()
+		if packet_encoding.has_bencode:
+			self._test_peek(packet_encoding.bencode, FLAGS_BENCODE)
+
+	def test_peek_rencode(self):
+		packet_encoding.init_rencode()
+		if packet_encoding.has_rencode:
+			self._test_peek(packet_encoding.rencode_dumps, FLAGS_RENCODE)
+
+	def _test_decode_buffer(self, encoder, flags):
+		packet = ["draw", 1, 2, 3, b"x"*1000, {b"a" : 1}]
+		data = encoder(packet)
+		for buf in (data, memoryview(data), memoryview(bytearray(data))):
+			decoded = packet_encoding.decode(buf, flags)
+			assert decoded[0] in ("draw", b"draw"), "expected 'draw' but got %r" % (decoded[0], )
+			#the decoders never hand out views of the read buffer:
+			assert type(decoded[4])==bytes, "expected bytes but got %s" % type(decoded[4])
+			assert decoded[4]==b"x"*1000
+
+	def test_decode_buffer_bencode(self):
+		packet_encoding.init_bencode()
+		if packet_encoding.has_bencode:
+			self._test_decode_buffer(packet_encoding.bencode, FLAGS_BENCODE)
+
+	def test_decode_buffer_rencode(self):
+		packet_encoding.init_rencode()
+		if packet_encoding.has_rencode:
+			self._test_decode_buffer(packet_encoding.rencode_dumps, FLAGS_RENCODE)
+
+	def test_peek_yaml(self):
+		assert packet_encoding.peek_packet_type(b"- hello\n", FLAGS_YAML) is None
+
+
+def main():
+	unittest.main()
+
+if __name__ == '__main__':
+	main()
@@ -0,0 +1,55 @@
+#!/usr/bin/env python
+# This file is part of Xpra.
+# Copyright (C) 2016 Antoine Martin <antoine@devloop.org.uk>
+# Xpra is released under the terms of the GNU GPL v2, or, at your option, any
+# later version. See the file COPYING for details.
+
+import unittest
+
+from xpra.os_util import memoryview_to_bytes
+from xpra.net.read_buffer import ReadBuffer
+
+
+class TestReadBuffer(unittest.TestCase):
+
+	def test_read(self):
+		rb = ReadBuffer()
+		assert len(rb)==0 and rb.peek(8)==b""
+		rb.append(b"0123")
+		rb.append(b"")
+		rb.append(b"456789")
+		assert len(rb)==10
+		assert rb.peek(2)==b"01"
+		assert rb.peek(6)==b"012345"
+		assert rb.peek(100)==b"0123456789"
+		rb.skip(1)
+		assert memoryview_to_bytes(rb.read(2))==b"12"
+		#spans both chunks:
+		assert memoryview_to_bytes(rb.read(3))==b"345"
+		assert len(rb)==4
+		#exactly what is left:
+		assert memoryview_to_bytes(rb.read(4))==b"6789"
+		assert len(rb)==0
+
+	def test_whole_chunk(self):
+		rb = ReadBuffer()
+		chunk = b"x"*1000
+		rb.append(chunk)
+		assert rb.read(1000) is chunk, "whole chunks should not be copied"
+
+	def test_invalid(self):
+		rb = ReadBuffer()
+		rb.append(b"abc")
+		try:
+			rb.read(4)
+		except AssertionError:
+			pass
+		else:
+			raise Exception("reading more than available should fail")
+
+
+def main():
+	unittest.main()
+
+if __name__ == '__main__':
+	main()
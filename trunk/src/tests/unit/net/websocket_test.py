@@ -0,0 +1,171 @@
+#!/usr/bin/env python
+# This file is part of Xpra.
+# Copyright (C) 2016 Antoine Martin <antoine@devloop.org.uk>
+# Xpra is released under the terms of the GNU GPL v2, or, at your option, any
+# later version. See the file COPYING for details.
+
+import os
+import socket
+import struct
+import unittest
+import threading
+
+from xpra.net import websocket
+from xpra.net.websocket import (WebSocketConnection, WSRequestHandler, encode_header, parse_header, python_mask_into,
+							OPCODE_BINARY, OPCODE_CONTINUATION, OPCODE_PING, OPCODE_PONG, OPCODE_CLOSE)
+
+
+def mask_frame(opcode, payload, fin=True, key=b"\x12\x34\x56\x78"):
+	data = bytearray(payload)
+	for i in range(len(data)):
+		data[i] ^= bytearray(key)[i % 4]
+	return encode_header(opcode, len(payload), fin, key)+bytes(data)
+
+def tcp_socketpair():
+	listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+	listener.bind(("127.0.0.1", 0))
+	listener.listen(1)
+	client = socket.create_connection(listener.getsockname())
+	server = listener.accept()[0]
+	listener.close()
+	return server, client
+
+
+class FrameReader(object):
+	def __init__(self, sock):
+		self.sock = sock
+		self.data = b""
+
+	def recv_frame(self):
+		while True:
+			header = parse_header(bytearray(self.data))
+			if header:
+				_, opcode, size, _, hlen = header
+				if len(self.data)>=hlen+size:
+					payload = self.data[hlen:hlen+size]
+					self.data = self.data[hlen+size:]
+					return opcode, payload
+			self.data += self.sock.recv(65536)
+
+
+class TestWebSocket(unittest.TestCase):
+
+	def test_mask(self):
+		key = b"\x01\x80\xff\x7f"
+		for size in (0, 1, 3, 4, 7, 8, 15, 64, 1001):
+			data = os.urandom(size)
+			for offset in (0, 1, 2, 3, 5):
+				expected = bytearray(data)
+				for i in range(size):
+					expected[i] ^= bytearray(key)[(offset+i) % 4]
+				for mask_into in (websocket.mask_into, python_mask_into):
+					#use an unaligned view:
+					buf = bytearray(b"x"+data)
+					mask_into(memoryview(buf)[1:], key, offset)
+					self.assertEqual(buf[1:], expected, "%s failed for size %i and offset %i" % (mask_into, size, offset))
+
+	def test_header(self):
+		for size in (0, 125, 126, 65535, 65536, 2**32+1):
+			for mask in (None, b"abcd"):
+				header = encode_header(OPCODE_BINARY, size, True, mask)
+				parsed = parse_header(bytearray(header))
+				self.assertEqual(parsed, (True, OPCODE_BINARY, size, mask, len(header)))
+				#incomplete headers:
+				for i in range(len(header)):
+					self.assertIsNone(parse_header(bytearray(header[:i])))
+
+	def make_connection(self):
+		server, client = tcp_socketpair()
+		conn = WebSocketConnection(server, "local", "remote", "target", "tcp")
+		self.addCleanup(client.close)
+		self.addCleanup(server.close)
+		return conn, client, FrameReader(client)
+
+	def read_all(self, conn, size, read_into=False):
+		data = b""
+		while len(data)<size:
+			if read_into:
+				buf = bytearray(1000)
+				n = conn.read_into(buf)
+				self.assertTrue(n>0)
+				data += bytes(buf[:n])
+			else:
+				buf = conn.read(1000)
+				self.assertTrue(len(buf)>0)
+				data += bytes(buf)
+		return data
+
+	def test_read(self):
+		for read_into in (False, True):
+			conn, client, reader = self.make_connection()
+			payload = os.urandom(5000)
+			#a fragmented message with a ping in the middle:
+			client.sendall(mask_frame(OPCODE_BINARY, payload[:3000], False))
+			client.sendall(mask_frame(OPCODE_PING, b"hello"))
+			client.sendall(mask_frame(OPCODE_CONTINUATION, payload[3000:]))
+			self.assertEqual(self.read_all(conn, len(payload), read_into), payload)
+			self.assertEqual(reader.recv_frame(), (OPCODE_PONG, b"hello"))
+			#the close frame ends the stream:
+			client.sendall(mask_frame(OPCODE_CLOSE, struct.pack("!H", 1000)))
+			self.assertFalse(conn.read(1000))
+			opcode, _ = reader.recv_frame()
+			self.assertEqual(opcode, OPCODE_CLOSE)
+			conn.close()
+
+	def test_write(self):
+		conn, client, reader = self.make_connection()
+		self.assertEqual(conn.write(b"hello"), 5)
+		self.assertEqual(reader.recv_frame(), (OPCODE_BINARY, b"hello"))
+		#the buffers are sent as a single message:
+		self.assertEqual(conn.writev([b"P", b"abc", memoryview(b"0123456789")[2:6]]), 8)
+		self.assertEqual(reader.recv_frame(), (OPCODE_BINARY, b"Pabc2345"))
+		#large writes are split into multiple messages:
+		payload = os.urandom(websocket.FRAME_SIZE*2+10)
+		def write():
+			conn.writev([payload[:10], payload[10:]])
+		t = threading.Thread(target=write)
+		t.start()
+		messages = [reader.recv_frame() for _ in range(3)]
+		t.join()
+		self.assertEqual([len(x[1]) for x in messages], [websocket.FRAME_SIZE, websocket.FRAME_SIZE, 10])
+		self.assertEqual(b"".join(x[1] for x in messages), payload)
+		conn.close()
+
+	def test_handshake(self):
+		server, client = tcp_socketpair()
+		self.addCleanup(client.close)
+		self.addCleanup(server.close)
+		connections = []
+		def new_websocket_client(wsh):
+			connections.append(WebSocketConnection(server, "local", "remote", "target", "tcp", wsh))
+		t = threading.Thread(target=WSRequestHandler, args=(server, ("127.0.0.1", 0), new_websocket_client, "/nonexistent"))
+		t.start()
+		client.sendall(b"\r\n".join([
+			b"GET / HTTP/1.1",
+			b"Host: localhost",
+			b"Upgrade: websocket",
+			b"Connection: Upgrade",
+			b"Sec-WebSocket-Key: dGhlIHNhbXBsZSBub25jZQ==",
+			b"Sec-WebSocket-Protocol: binary",
+			b"Sec-WebSocket-Version: 13",
+			b"", b""]))
+		response = b""
+		while not response.endswith(b"\r\n\r\n"):
+			response += client.recv(1)
+		t.join()
+		lines = response.split(b"\r\n")
+		self.assertTrue(lines[0].startswith(b"HTTP/1.1 101"))
+		self.assertIn(b"Sec-WebSocket-Accept: s3pPLMBiTxaQ9kYGzzhZRbK+xOo=", lines)
+		self.assertIn(b"Sec-WebSocket-Protocol: binary", lines)
+		self.assertEqual(len(connections), 1)
+		conn = connections[0]
+		client.sendall(mask_frame(OPCODE_BINARY, b"PING"))
+		self.assertEqual(bytes(conn.read(100)), b"PING")
+		conn.close()
+
+
+def main():
+	unittest.main()
+
+if __name__ == '__main__':
+	main()
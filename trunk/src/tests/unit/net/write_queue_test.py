@@ -0,0 +1,207 @@
+#!/usr/bin/env python
+# This file is part of Xpra.
+# Copyright (C) 2016 Antoine Martin <antoine@devloop.org.uk>
+# Xpra is released under the terms of the GNU GPL v2, or, at your option, any
+# later version. See the file COPYING for details.
+
+import time
+import socket
+import unittest
+import threading
+
+from xpra.net.write_queue import PriorityWriteQueue, PRIORITY_CONTROL, PRIORITY_FOCUSED, PRIORITY_BACKGROUND, PRIORITY_BULK
+from xpra.net.protocol import Protocol
+from xpra.net.bytestreams import SocketConnection
+from xpra.net.compression import Compressed
+
+
+def unit(name):
+	return [(name, None, None)]
+
+
+class Scheduler(object):
+	def idle_add(self, fn, *args):
+		fn(*args)
+	def timeout_add(self, delay, fn, *args):
+		pass
+
+
+class TestWriteQueue(unittest.TestCase):
+
+	def test_priority(self):
+		q = PriorityWriteQueue()
+		q.put([unit("bulk")], PRIORITY_BULK)
+		q.put([unit("background")], PRIORITY_BACKGROUND)
+		q.put([unit("control1")], PRIORITY_CONTROL)
+		q.put([unit("control2")], PRIORITY_CONTROL)
+		q.put([unit("focused")], PRIORITY_FOCUSED)
+		order = [q.get()[0][0] for _ in range(5)]
+		assert order==["control1", "control2", "focused", "background", "bulk"], "invalid order: %s" % order
+		assert q.empty()
+		info = q.get_info()
+		assert info.get("control").get("packets")==2
+
+	def test_split(self):
+		q = PriorityWriteQueue()
+		q.put([unit("bg1-%i" % i) for i in range(3)], PRIORITY_BACKGROUND)
+		assert q.get()[0][0]=="bg1-0"
+		#another split packet must wait for the first one to complete,
+		#even if it is more urgent:
+		q.put([unit("bulk-%i" % i) for i in range(2)], PRIORITY_BULK)
+		q.put([unit("focused-%i" % i) for i in range(2)], PRIORITY_FOCUSED)
+		#but a single unit packet can be sent in between:
+		q.put([unit("control")], PRIORITY_CONTROL)
+		order = [q.get()[0][0] for _ in range(7)]
+		assert order==["control", "bg1-1", "bg1-2", "focused-0", "focused-1", "bulk-0", "bulk-1"], "invalid order: %s" % order
+		assert q.get_info().get("interleaved")==1
+
+	def test_stream_order(self):
+		q = PriorityWriteQueue()
+		q.put([unit("draw1-a")], PRIORITY_BACKGROUND, 1)
+		q.put([unit("draw2-a")], PRIORITY_BACKGROUND, 2)
+		#window 1 gains focus, but its new draw packet must not overtake the one already queued:
+		q.put([unit("draw1-b")], PRIORITY_FOCUSED, 1)
+		#and neither can a control packet for the same window:
+		q.put([unit("lost-window1")], PRIORITY_CONTROL, 1)
+		q.put([unit("ping")], PRIORITY_CONTROL)
+		order = [q.get()[0][0] for _ in range(5)]
+		assert order==["ping", "draw1-a", "draw2-a", "draw1-b", "lost-window1"], "invalid order: %s" % order
+		#once all the packets have been written, the stream can use another class:
+		q.put([unit("draw2-b")], PRIORITY_BACKGROUND, 2)
+		q.put([unit("draw1-c")], PRIORITY_FOCUSED, 1)
+		order = [q.get()[0][0] for _ in range(2)]
+		assert order==["draw1-c", "draw2-b"], "invalid order: %s" % order
+		assert q.get_info().get("streams")==0
+
+	def test_focus_change(self):
+		s1, s2 = socket.socketpair()
+		proto = Protocol(Scheduler(), SocketConnection(s1, "local", "remote", "test", "socket"), lambda *args : None)
+		self.addCleanup(s2.close)
+		self.addCleanup(proto.close)
+		proto.enable_default_encoder()
+		proto.enable_compressor("none")
+		focused = [2]
+		proto.set_focused_window_cb(lambda : focused[0])
+		def draw(wid):
+			proto._add_packet_to_queue(["draw", wid, 0, 0, 10, 10, "rgb24", b"0"*300, 1, 30, {}])
+		q = proto._write_queue
+		draw(1)
+		focused[0] = 1
+		draw(1)
+		draw(2)
+		proto._add_packet_to_queue(["raise-window", 1])
+		def streams(priority):
+			return [e.stream for e in q.queues[priority]]
+		assert streams(PRIORITY_FOCUSED)==[], "focused draws should wait for the other packets of this window: %s" % streams(PRIORITY_FOCUSED)
+		assert streams(PRIORITY_BACKGROUND)==[1, 1, 2, 1], "invalid queue: %s" % streams(PRIORITY_BACKGROUND)
+		while not q.empty():
+			q.get()
+		draw(1)
+		assert streams(PRIORITY_FOCUSED)==[1]
+
+	def make_protocol(self):
+		s1, s2 = socket.socketpair()
+		proto = Protocol(Scheduler(), SocketConnection(s1, "local", "remote", "test", "socket"), lambda *args : None)
+		self.addCleanup(s2.close)
+		self.addCleanup(proto.close)
+		proto.enable_default_encoder()
+		proto.enable_compressor("none")
+		return proto
+
+	def test_ordered_window_packets(self):
+		#legacy mmap: the draw packets of all the windows are written in order, even with focus:
+		proto = self.make_protocol()
+		proto.set_focused_window_cb(lambda : 2)
+		proto.set_ordered_window_packets(True)
+		for wid in (1, 2, 3):
+			proto._add_packet_to_queue(["draw", wid, 0, 0, 10, 10, "mmap", [(8, 400)], 1, 40, {}])
+		proto._add_packet_to_queue(["raise-window", 2])
+		q = proto._write_queue
+		assert len(q.queues[PRIORITY_FOCUSED])==0
+		assert len(q.queues[PRIORITY_BACKGROUND])==4
+		assert set(e.stream for e in q.queues[PRIORITY_BACKGROUND])==set(["mmap"])
+
+	def test_chained_cipher(self):
+		#with CBC, the packets are encrypted when they are formatted, they cannot be re-ordered:
+		from xpra.net.crypto import MODE_CBC, MODE_GCM
+		proto = self.make_protocol()
+		proto.set_focused_window_cb(lambda : 1)
+		draw = ["draw", 1, 0, 0, 10, 10, "rgb24", b"0"*300, 1, 30, {}]
+		assert proto.get_packet_priority(draw)==PRIORITY_FOCUSED
+		proto.cipher_out = object()
+		proto.cipher_out_mode = MODE_CBC
+		assert not proto.can_reorder_writes()
+		for packet in (draw, ["sound-data", "opus", b""], ["ping", 0]):
+			assert proto.get_packet_priority(packet)==PRIORITY_CONTROL
+		#AEAD chunks are encrypted when they are written:
+		proto.cipher_out_mode = MODE_GCM
+		assert proto.can_reorder_writes()
+		assert proto.get_packet_priority(draw)==PRIORITY_FOCUSED
+
+	def test_backpressure(self):
+		q = PriorityWriteQueue(max_queued=1)
+		q.put([unit("background")], PRIORITY_BACKGROUND)
+		q.announce(PRIORITY_BACKGROUND)
+		waited = []
+		def wait():
+			waited.append(q.wait_for_room())
+		t = threading.Thread(target=wait)
+		t.start()
+		time.sleep(0.05)
+		assert not waited, "we should be waiting for the background packet to be written"
+		#an urgent packet is coming, so we must stop waiting:
+		q.announce(PRIORITY_CONTROL)
+		t.join(1)
+		assert waited==[True]
+		q.close()
+		assert q.get() is None
+
+
+class TestSplitPackets(unittest.TestCase):
+
+	def test_roundtrip(self):
+		s1, s2 = socket.socketpair()
+		received = []
+		done = threading.Event()
+		def process_packet(proto, packet):
+			received.append(packet)
+			if len(received)==2:
+				done.set()
+		scheduler = Scheduler()
+		sender = Protocol(scheduler, SocketConnection(s1, "local", "remote", "test", "socket"), lambda *args : None)
+		receiver = Protocol(scheduler, SocketConnection(s2, "remote", "local", "test", "socket"), process_packet)
+		for p in (sender, receiver):
+			p.enable_default_encoder()
+			p.enable_compressor("none")
+		sender.set_split_packets(True)
+		data = bytes(bytearray(i%256 for i in range(300*1000)))
+		packets = [
+			["draw", 1, 0, 0, 100, 100, "rgb24", Compressed("rgb24", data), 1, 300, {}],
+			["ping", 1],
+			]
+		def get_packet():
+			packet = packets.pop(0)
+			return packet, None, None, len(packets)>0
+		sender.set_packet_source(get_packet)
+		try:
+			receiver.start()
+			sender.start()
+			sender.source_has_more()
+			assert done.wait(5), "packets not received: %s" % received
+			#the ping is more urgent, so it may be sent first:
+			packet_types = sorted(str(x[0]) for x in received)
+			assert packet_types in (["draw", "ping"], ["b'draw'", "b'ping'"]), "unexpected packets: %s" % packet_types
+			draw = [x for x in received if len(x)>2][0]
+			assert draw[7]==data
+			info = sender.get_info()
+			assert info.get("output").get("priority").get("background").get("units")>1
+		finally:
+			sender.close()
+			receiver.close()
+
+
+def main():
+	unittest.main()
+
+if __name__ == '__main__':
+	main()
@@ -0,0 +1,114 @@
+#!/usr/bin/env python
+# This file is part of Xpra.
+# Copyright (C) 2016 Antoine Martin <antoine@devloop.org.uk>
+# Xpra is released under the terms of the GNU GPL v2, or, at your option, any
+# later version. See the file COPYING for details.
+
+import os
+import time
+import unittest
+
+try:
+	from xpra.server.window import window_source
+	from xpra.server.window.window_source import WindowSource, get_row_hashes, MAX_DELTA_CHANGED
+except ImportError:
+	window_source = None
+
+W, H = 16, 32
+ROWSTRIDE = W*4
+
+
+def make_pixels(changed=(), pixels=None):
+	pixels = bytearray(pixels or os.urandom(ROWSTRIDE*H))
+	for y in changed:
+		pixels[y*ROWSTRIDE:(y+1)*ROWSTRIDE] = os.urandom(ROWSTRIDE)
+	return bytes(pixels)
+
+
+@unittest.skipUnless(window_source, "no window source support")
+class TestDeltaBuckets(unittest.TestCase):
+
+	def make_source(self, buckets=4):
+		#we only need the delta bucket state:
+		ws = WindowSource.__new__(WindowSource)
+		ws.delta_pixel_data = [None]*buckets
+		ws.delta_evict = []
+		return ws
+
+	def store(self, ws, bucket, pixels, last_used=None):
+		row_hashes = get_row_hashes(pixels, ROWSTRIDE, H)
+		ws.delta_pixel_data[bucket] = [W, H, "BGRX", "rgb32", bucket+1, len(pixels), pixels, row_hashes, 0, last_used or time.time()]
+
+	def check_row_hashes(self):
+		pixels = make_pixels()
+		hashes = get_row_hashes(pixels, ROWSTRIDE, H)
+		self.assertEqual(len(hashes), H)
+		#identical rows have the same hash:
+		self.assertEqual(get_row_hashes(bytes(bytearray(pixels)), ROWSTRIDE, H), hashes)
+		changed = make_pixels((3, 17), pixels)
+		chashes = get_row_hashes(changed, ROWSTRIDE, H)
+		self.assertEqual([y for y in range(H) if hashes[y]!=chashes[y]], [3, 17])
+
+	def test_row_hashes(self):
+		self.check_row_hashes()
+
+	def test_row_hashes_crc32(self):
+		#without xxhash, CRC_Image returns None and we use crc32:
+		saved = window_source.CRC_Image
+		window_source.CRC_Image = lambda *args : None
+		try:
+			self.check_row_hashes()
+		finally:
+			window_source.CRC_Image = saved
+
+	def test_find_bucket(self):
+		ws = self.make_source()
+		pixels = make_pixels()
+		hashes = get_row_hashes(pixels, ROWSTRIDE, H)
+		self.assertEqual(ws.find_delta_bucket(W, H, "BGRX", "rgb32", len(pixels), hashes), (-1, None))
+		self.store(ws, 0, make_pixels(range(10), pixels))
+		self.store(ws, 2, make_pixels((5, ), pixels))
+		#pick the bucket with the fewest changed rows:
+		self.assertEqual(ws.find_delta_bucket(W, H, "BGRX", "rgb32", len(pixels), hashes), (2, [5]))
+		self.store(ws, 1, pixels)
+		self.assertEqual(ws.find_delta_bucket(W, H, "BGRX", "rgb32", len(pixels), hashes), (1, []))
+		#buckets with different attributes are ignored:
+		self.assertEqual(ws.find_delta_bucket(W, H, "RGBX", "rgb32", len(pixels), hashes), (-1, None))
+		self.assertEqual(ws.find_delta_bucket(W, H, "BGRX", "png", len(pixels), hashes), (-1, None))
+
+	def test_find_bucket_too_different(self):
+		ws = self.make_source()
+		pixels = make_pixels()
+		hashes = get_row_hashes(pixels, ROWSTRIDE, H)
+		n = H*MAX_DELTA_CHANGED//100+1
+		self.store(ws, 3, make_pixels(range(n), pixels))
+		self.assertEqual(ws.find_delta_bucket(W, H, "BGRX", "rgb32", len(pixels), hashes), (3, None))
+
+	def test_store_bucket(self):
+		ws = self.make_source(3)
+		now = time.time()
+		self.assertEqual(ws.get_store_bucket(), 0)
+		self.store(ws, 0, make_pixels(), now-10)
+		self.store(ws, 2, make_pixels(), now-20)
+		self.assertEqual(ws.get_store_bucket(), 1)
+		self.store(ws, 1, make_pixels(), now-5)
+		#all in use, evict the least recently used one:
+		self.assertEqual(ws.get_store_bucket(), 2)
+
+	def test_expire(self):
+		ws = self.make_source(3)
+		now = time.time()
+		self.store(ws, 0, make_pixels(), now)
+		self.store(ws, 1, make_pixels(), now-window_source.DELTA_BUCKET_EXPIRY-1)
+		ws.expire_delta_buckets()
+		self.assertIsNotNone(ws.delta_pixel_data[0])
+		self.assertIsNone(ws.delta_pixel_data[1])
+		#the client is told it can free the expired bucket:
+		self.assertEqual(ws.delta_evict, [1])
+
+
+def main():
+	unittest.main()
+
+if __name__ == '__main__':
+	main()
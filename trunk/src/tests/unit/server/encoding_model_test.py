@@ -0,0 +1,138 @@
+#!/usr/bin/env python
+# This file is part of Xpra.
+# Copyright (C) 2016 Antoine Martin <antoine@devloop.org.uk>
+# Xpra is released under the terms of the GNU GPL v2, or, at your option, any
+# later version. See the file COPYING for details.
+
+import unittest
+
+from xpra.server.window import encoding_model
+from xpra.server.window.encoding_model import EncodingCostModel, get_size_bucket, get_quality_band, MIN_SAMPLES
+
+MB = 1024*1024
+
+
+class TestEncodingModel(unittest.TestCase):
+
+	def setUp(self):
+		self.saved_explore = encoding_model.EXPLORE
+		encoding_model.EXPLORE = 0
+
+	def tearDown(self):
+		encoding_model.EXPLORE = self.saved_explore
+
+	def test_buckets(self):
+		assert get_size_bucket(0)==0
+		assert get_size_bucket(1000)==0
+		assert get_size_bucket(4096)==1
+		assert get_size_bucket(8191)==1
+		assert get_size_bucket(8192)==2
+		assert get_size_bucket(100*1000*1000)==encoding_model.MAX_BUCKET
+
+	def test_predict(self):
+		m = EncodingCostModel()
+		pixels = 256*256
+		assert m.predict("png", pixels, MB) is None
+		for _ in range(MIN_SAMPLES):
+			#png: 10ms and 64KB
+			m.record("png", pixels, 64*1024, 0.010)
+		p = m.predict("png", pixels, MB)
+		assert abs(p-(0.010+1.0/16))<0.001, "unexpected prediction: %s" % p
+		#other region sizes use their own bucket:
+		assert m.predict("png", 16, MB) is None
+		info = m.get_info()
+		assert info.get("png")
+
+	def test_choose(self):
+		m = EncodingCostModel()
+		pixels = 512*512
+		candidates = ["rgb24", "png", "jpeg"]
+		#no data, use the default:
+		assert m.choose(candidates, pixels, MB, "jpeg")=="jpeg"
+		for _ in range(MIN_SAMPLES):
+			m.record("rgb24", pixels, pixels*3//10, 0.001)   #fast, 10:1 lz4 compression
+			m.record("jpeg", pixels, pixels//10, 0.020)
+		#slow network: jpeg is smaller
+		assert m.choose(candidates, pixels, MB, "jpeg")=="jpeg"
+		#fast network: rgb is quicker
+		assert m.choose(candidates, pixels, 1000*MB, "jpeg")=="rgb24"
+		#we don't have any data for png, so we don't override it:
+		assert m.choose(candidates, pixels, 1000*MB, "png")=="png"
+		#the choice must be one of the candidates:
+		assert m.choose(["png", "jpeg"], pixels, 1000*MB, "jpeg")=="jpeg"
+		info = m.get_info()
+		assert info.get("overrides")==1
+		assert info.get("last")
+
+	def test_explore(self):
+		encoding_model.EXPLORE = 2
+		m = EncodingCostModel()
+		choices = [m.choose(["png", "webp"], 100*100, MB, "png") for _ in range(4)]
+		assert choices==["png", "webp", "png", "webp"], "unexpected choices: %s" % choices
+
+	def test_explore_cost(self):
+		encoding_model.EXPLORE = 1
+		m = EncodingCostModel()
+		pixels = 1024*1024
+		#we know nothing about webp, don't try it on a large region:
+		assert m.choose(["png", "webp"], pixels, MB, "png")=="png"
+		#png is much slower than rgb24 (measured on smaller regions):
+		for _ in range(MIN_SAMPLES):
+			m.record("rgb24", 256*256, 256*256*3//10, 0.001)
+			m.record("png", 256*256, 256*256//10, 0.100)
+		assert m.choose(["rgb24", "png"], pixels, 1000*MB, "rgb24")=="rgb24"
+		#but rgb24 is cheap enough to try instead of png:
+		assert m.choose(["rgb24", "png"], pixels, 1000*MB, "png")=="rgb24"
+		assert m.get_info().get("explored")==1
+
+	def test_seed(self):
+		pixels = 256*256
+		other = EncodingCostModel()
+		for _ in range(MIN_SAMPLES):
+			other.record("png", pixels, 64*1024, 0.010)
+		m = EncodingCostModel()
+		m.seed(other)
+		p = m.predict("png", pixels, MB)
+		assert p is not None and abs(p-(0.010+1.0/16))<0.001, "unexpected prediction: %s" % p
+		#our own samples are not modified by the other window's:
+		m.record("png", pixels, 64*1024, 0.010)
+		assert m.get_samples("png", get_size_bucket(pixels))==MIN_SAMPLES+1
+		assert other.get_samples("png", get_size_bucket(pixels))==MIN_SAMPLES
+
+	def test_quality_bands(self):
+		m = EncodingCostModel()
+		pixels = 256*256
+		for _ in range(MIN_SAMPLES):
+			m.record("jpeg", pixels, pixels//20, 0.005, 30)
+			m.record("png", pixels, pixels//10, 0.010, 30)
+		#the jpeg samples do not tell us anything about another quality band:
+		assert m.predict("jpeg", pixels, MB, 30) is not None
+		assert m.predict("jpeg", pixels, MB, 90) is None
+		#but the lossless encodings don't care about the quality:
+		assert m.predict("png", pixels, MB, 90) is not None
+		assert get_quality_band("jpeg", 30)!=get_quality_band("jpeg", 90)
+		assert get_quality_band("webp", 99)!=get_quality_band("webp", 100)
+		assert get_quality_band("png", 30)==get_quality_band("png", 90)
+		info = m.get_info()
+		assert info.get("jpeg", {}).get("quality>=25"), "missing jpeg quality band in %s" % info
+
+	def test_explore_stale(self):
+		encoding_model.EXPLORE = 1
+		m = EncodingCostModel()
+		pixels = 100*100
+		bucket = get_size_bucket(pixels)
+		for _ in range(MIN_SAMPLES):
+			m.record("rgb24", pixels, pixels*3//10, 0.001)
+			m.record("png", pixels, pixels//10, 0.005)
+		#rgb24 is better, and we have recent samples for both:
+		assert m.choose(["rgb24", "png"], pixels, 1000*MB, "png")=="rgb24"
+		#once the png samples are old, we try it again:
+		m.stats[("png", bucket, 0)][3] -= encoding_model.STALE+1
+		assert m.choose(["rgb24", "png"], pixels, 1000*MB, "png")=="png"
+		assert m.get_info().get("explored")==1
+
+def main():
+	unittest.main()
+
+if __name__ == '__main__':
+	main()
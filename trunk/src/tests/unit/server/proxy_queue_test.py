@@ -0,0 +1,121 @@
+#!/usr/bin/env python
+# This file is part of Xpra.
+# Copyright (C) 2016 Antoine Martin <antoine@devloop.org.uk>
+# Xpra is released under the terms of the GNU GPL v2, or, at your option, any
+# later version. See the file COPYING for details.
+
+import os
+import time
+import socket
+import unittest
+import threading
+
+from xpra.os_util import Queue
+from xpra.util import typedict
+from xpra.net.protocol import Protocol
+from xpra.net.bytestreams import SocketConnection
+from xpra.net.selector_protocol import SelectorProtocol, selectors
+try:
+	from xpra.server.proxy import proxy_instance_process
+	from xpra.server.proxy.proxy_instance_process import ProxyInstanceProcess, PROXY_QUEUE_SIZE
+except ImportError:
+	proxy_instance_process = None
+
+COUNT = 100
+PAYLOAD_SIZE = 64*1024
+
+
+class Scheduler(object):
+	def idle_add(self, fn, *args):
+		fn(*args)
+	def timeout_add(self, delay, fn, *args):
+		pass
+	def source_remove(self, *args):
+		pass
+
+
+def make_conn(sock, name):
+	return SocketConnection(sock, name, "peer", name, "unix-domain")
+
+def packet_type(packet):
+	v = packet[0]
+	if not isinstance(v, str):
+		v = v.decode()
+	return v
+
+
+@unittest.skipUnless(proxy_instance_process and selectors, "no selectors or proxy support")
+class TestProxyQueue(unittest.TestCase):
+
+	def make_protocol(self, protocol_class, sock, name, process, scheduler=None, get_packet=None):
+		p = protocol_class(scheduler or Scheduler(), make_conn(sock, name), process, get_packet)
+		p.enable_default_encoder()
+		p.max_packet_size = PAYLOAD_SIZE*2
+		p.large_packets += ["test", b"test"]
+		self.addCleanup(p.close)
+		return p
+
+	def test_backpressure(self):
+		client_sock, client_peer = socket.socketpair()
+		server_sock, server_peer = socket.socketpair()
+		proxy = ProxyInstanceProcess(0, 0, {}, {}, None, [], [],
+									make_conn(client_sock, "client"), {}, None, None,
+									make_conn(server_sock, "server"), typedict(), None)
+		proxy.main_queue = Queue()
+		proxy.client_protocol = self.make_protocol(SelectorProtocol, client_sock, "client",
+												proxy.process_client_packet, proxy, proxy.get_client_packet)
+		proxy.server_protocol = self.make_protocol(SelectorProtocol, server_sock, "server",
+												proxy.process_server_packet, proxy, proxy.get_server_packet)
+		proxy.init_packet_queues()
+		#the client does not read anything yet,
+		#so the client connection's socket buffer and write queue are going to fill up:
+		received = []
+		all_received = threading.Event()
+		def client_process(proto, packet):
+			if packet_type(packet)=="test":
+				received.append(packet[1])
+				if len(received)==COUNT:
+					all_received.set()
+		client = self.make_protocol(Protocol, client_peer, "client-peer", client_process)
+		payload = os.urandom(PAYLOAD_SIZE)
+		packets = [["test", i, payload] for i in range(COUNT)]
+		def next_packet():
+			return packets.pop(0), None, None, bool(packets)
+		server = self.make_protocol(Protocol, server_peer, "server-peer", lambda *args : None, get_packet=next_packet)
+		for p in (proxy.client_protocol, proxy.server_protocol, server):
+			p.start()
+		server.source_has_more()
+		#wait for the packets to back up in the proxy:
+		for _ in range(100):
+			if proxy.client_packets.qsize()>=PROXY_QUEUE_SIZE:
+				break
+			time.sleep(0.05)
+		self.assertTrue(proxy.client_packets.qsize()>=PROXY_QUEUE_SIZE)
+		self.assertEqual(len(received), 0)
+		#the selector thread must still be servicing other connections:
+		a, b = socket.socketpair()
+		def echo(proto, packet):
+			if packet_type(packet)=="ping":
+				proto.send_now(["pong", packet[1]])
+		self.make_protocol(SelectorProtocol, a, "echo", echo).start()
+		pong = threading.Event()
+		def pinger_process(proto, packet):
+			if packet_type(packet)=="pong":
+				pong.set()
+		pinger = self.make_protocol(Protocol, b, "pinger", pinger_process)
+		pinger.start()
+		pinger.send_now(["ping", 1])
+		self.assertTrue(pong.wait(5), "the selector loop is not making progress")
+		self.assertTrue(proxy.server_protocol._read_paused, "the server connection should have been paused")
+		#once the client reads again, all the packets are forwarded in order:
+		client.start()
+		self.assertTrue(all_received.wait(20), "only received %i packets" % len(received))
+		self.assertEqual(received, list(range(COUNT)))
+		self.assertFalse(proxy.server_protocol._read_paused)
+
+
+def main():
+	unittest.main()
+
+if __name__ == '__main__':
+	main()
@@ -8,7 +8,7 @@
 import unittest
 
 try:
-    from xpra.server.region import rectangle        #@UnresolvedImport
+    from xpra.server.window.region import rectangle, Region      #@UnresolvedImport
 
     R1 = rectangle(0, 0, 20, 20)
     R2 = rectangle(0, 0, 20, 20)
@@ -16,7 +16,7 @@ try:
     R4 = rectangle(10, 10, 50, 50)
     R5 = rectangle(100, 100, 100, 100)
 except:
-    rectangle, R1, R2, R3, R4, R5 = None, None, None, None, None, None
+    rectangle, Region, R1, R2, R3, R4, R5 = None, None, None, None, None, None, None
 
 
 class TestRegion(unittest.TestCase):
@@ -92,6 +92,80 @@ class TestRegion(unittest.TestCase):
         assert rectangle(0, 50, 50, 50) in l
         assert rectangle(200, 200, 0, 0) not in l
 
+    def test_region_union(self):
+        r = Region()
+        assert not r and len(r)==0 and r.get_extents() is None
+        r.add(0, 0, 10, 10)
+        r.add(10, 0, 10, 10)
+        #touching boxes are merged:
+        assert r.get_rectangles()==[rectangle(0, 0, 20, 10)]
+        r.add(0, 10, 20, 10)
+        #and so are bands with identical columns:
+        assert r.get_rectangles()==[rectangle(0, 0, 20, 20)]
+        #overlapping rectangles are split into bands:
+        r.add(10, 10, 20, 20)
+        assert r.get_rectangles()==[rectangle(0, 0, 20, 10), rectangle(0, 10, 30, 10), rectangle(10, 20, 20, 10)]
+        assert r.get_area()==20*10+30*10+20*10
+        assert r.get_extents()==rectangle(0, 0, 30, 30)
+        other = Region([rectangle(100, 100, 10, 10)])
+        r.union(other)
+        assert len(r)==4 and r.get_extents()==rectangle(0, 0, 110, 110)
+
+    def test_region_substract_intersect(self):
+        r = Region([R3])
+        r.substract(10, 10, 20, 20)
+        assert len(r)==4 and r.get_area()==40*40-20*20
+        assert not r.contains(15, 15, 5, 5)
+        assert not r.intersects(15, 15, 5, 5)
+        assert r.contains(0, 0, 40, 10)
+        assert r.intersects(5, 5, 10, 10)
+        c = r.copy()
+        c.intersect_rect(R1)
+        assert c.get_area()==20*20-10*10
+        #the original is unchanged:
+        assert r.get_area()==40*40-20*20
+        c.intersect_region(Region([R5]))
+        assert not c
+        r.substract_region(Region([R3]))
+        assert not r
+
+    def test_region_merge(self):
+        r = Region()
+        r.add(0, 0, 10, 10)
+        r.add(20, 0, 10, 10)
+        r.add(500, 500, 10, 10)
+        #packets are free, don't merge anything:
+        assert len(r.merge(0))==3
+        #merging the first two costs 100 pixels, less than a packet:
+        merged = r.merge(200)
+        assert sorted(v.get_geometry() for v in merged)==[(0, 0, 30, 10), (500, 500, 10, 10)], "got %s" % (merged, )
+        #force it into a single rectangle:
+        assert r.merge(0, 1)==[rectangle(0, 0, 510, 510)]
+        assert r.merge(0, 2)==merged
+
+    def test_region_random(self):
+        import random
+        random.seed(0)
+        def pixels(rects):
+            return set((x, y) for r in rects for x in range(r.x, r.x+r.width) for y in range(r.y, r.y+r.height))
+        def rr():
+            return rectangle(random.randint(0, 30), random.randint(0, 30), random.randint(0, 12), random.randint(0, 12))
+        for _ in range(200):
+            a = [rr() for _ in range(random.randint(0, 6))]
+            b = [rr() for _ in range(random.randint(0, 6))]
+            A = pixels(a)
+            B = pixels(b)
+            ra = Region(a)
+            rb = Region(b)
+            assert pixels(ra)==A and ra.get_area()==len(A)
+            for op, expected in (("union", A|B), ("substract_region", A-B), ("intersect_region", A&B)):
+                r = ra.copy()
+                getattr(r, op)(rb)
+                rects = r.get_rectangles()
+                assert pixels(rects)==expected, "%s failed for %s and %s" % (op, a, b)
+                #no overlap:
+                assert sum(v.width*v.height for v in rects)==len(expected)
+
 
 def main():
     #skip test if import failed (ie: not a server build)
@@ -0,0 +1,41 @@
+#!/usr/bin/env python
+# This file is part of Xpra.
+# Copyright (C) 2016 Antoine Martin <antoine@devloop.org.uk>
+# Xpra is released under the terms of the GNU GPL v2, or, at your option, any
+# later version. See the file COPYING for details.
+
+import unittest
+
+from xpra.server.window.shared_encode import SharedEncodeCache
+
+
+class TestSharedEncode(unittest.TestCase):
+
+	def test_cache(self):
+		c = SharedEncodeCache()
+		assert not c.is_active()
+		c.add_source("client1")
+		assert not c.is_active(), "one client should not use the shared cache"
+		c.add_source("client2")
+		assert c.is_active()
+		key = ("png", 0, 0, 10, 10, "BGRX", 40, 100, 50)
+		result = ("png", "data", {}, 10, 10, 40, 24)
+		assert c.get(1, key, "digest") is None
+		c.add(1, key, "digest", result)
+		assert c.get(1, key, "digest")==result
+		#different window, settings or pixels must not match:
+		assert c.get(2, key, "digest") is None
+		assert c.get(1, key, "other-digest") is None
+		assert c.get(1, ("jpeg", )+key[1:], "digest") is None
+		info = c.get_info()
+		assert info.get("hits")==1 and info.get("misses")==4
+		c.remove_source("client2")
+		assert not c.is_active()
+		assert c.get(1, key, "digest") is None
+
+
+def main():
+	unittest.main()
+
+if __name__ == '__main__':
+	main()
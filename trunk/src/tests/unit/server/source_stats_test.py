@@ -0,0 +1,63 @@
+#!/usr/bin/env python
+# This file is part of Xpra.
+# Copyright (C) 2016 Antoine Martin <antoine@devloop.org.uk>
+# Xpra is released under the terms of the GNU GPL v2, or, at your option, any
+# later version. See the file COPYING for details.
+
+import time
+import unittest
+
+from xpra.server.source_stats import GlobalPerformanceStatistics, BANDWIDTH_PERIOD
+
+MB = 1024*1024
+
+
+class TestSourceStats(unittest.TestCase):
+
+	def test_no_data(self):
+		s = GlobalPerformanceStatistics()
+		s.update_averages()
+		assert s.bandwidth_estimate==0
+		assert s.get_bandwidth_usage()==0
+		assert s.get_info().get("bandwidth").get("")==0
+
+	def test_write_speed(self):
+		s = GlobalPerformanceStatistics()
+		#10 packets of 1MB, each one taking 100ms to write:
+		for _ in range(10):
+			s.record_write(MB, 0.1)
+		#(the records all have about the same timestamp, so they overlap: 10MB in 100ms)
+		s.update_averages()
+		assert abs(s.write_speed-100*MB)<MB, "unexpected write speed: %s" % s.write_speed
+		now = time.time()
+		s.socket_writes.clear()
+		for i in range(10):
+			s.socket_writes.append((now-1+i*0.1, MB, 0.1))
+		s.update_averages()
+		assert abs(s.write_speed-10*MB)<MB//100, "unexpected write speed: %s" % s.write_speed
+		assert s.bandwidth_estimate==s.write_speed
+		assert s.send_rate==10*MB//BANDWIDTH_PERIOD
+		assert 0<s.get_bandwidth_usage()<1
+
+	def test_ack_speed(self):
+		s = GlobalPerformanceStatistics()
+		now = time.time()
+		#a small packet gives us the network latency: 20ms
+		s.record_latency(1, 0, now-0.020, now-0.019, 100, 100)
+		#1MB packets take 520ms to get through: 2MB/s
+		for _ in range(5):
+			s.record_latency(1, 1000, now-0.521, now-0.1, 1000*1000, MB)
+		assert len(s.client_throughput)==5
+		s.record_write(5*MB, 0.1)
+		s.update_averages()
+		assert abs(s.ack_speed-2*MB)<MB//10, "unexpected ack speed: %s" % s.ack_speed
+		#the write speed is higher, so we use the ack speed:
+		assert s.bandwidth_estimate==s.ack_speed
+		assert s.get_bandwidth_usage()>0
+
+
+def main():
+	unittest.main()
+
+if __name__ == '__main__':
+	main()
@@ -0,0 +1,76 @@
+#!/usr/bin/env python
+# This file is part of Xpra.
+# Copyright (C) 2016 Antoine Martin <antoine@devloop.org.uk>
+# Xpra is released under the terms of the GNU GPL v2, or, at your option, any
+# later version. See the file COPYING for details.
+
+import unittest
+
+try:
+	from xpra.server.window.tiles import TileHashMap, tiles_to_rectangles
+except ImportError:
+	TileHashMap = None
+
+
+W = 256
+H = 192
+STRIDE = W*4
+
+def set_pixel(pixels, x, y, value=0xff):
+	pixels[y*STRIDE+x*4] = value
+
+
+class TestTiles(unittest.TestCase):
+
+	def test_tiles_to_rectangles(self):
+		assert tiles_to_rectangles([])==[]
+		#one row of consecutive tiles:
+		assert tiles_to_rectangles([(64, 0, 64, 64), (0, 0, 64, 64)])==[(0, 0, 128, 64)]
+		#identical columns on consecutive rows are merged:
+		assert tiles_to_rectangles([(0, 0, 64, 64), (0, 64, 64, 64), (0, 128, 64, 10)])==[(0, 0, 64, 138)]
+		#gaps are preserved:
+		r = tiles_to_rectangles([(0, 0, 64, 64), (128, 0, 64, 64), (0, 128, 64, 64)])
+		assert r==[(0, 0, 64, 64), (128, 0, 64, 64), (0, 128, 64, 64)], "got %s" % (r,)
+
+	def test_update(self):
+		pixels = bytearray(STRIDE*H)
+		th = TileHashMap(64)
+		#first time around, everything has changed:
+		assert th.update(pixels, 0, 0, W, H, STRIDE)==[(0, 0, W, H)]
+		assert th.get_info().get("tiles")==4*3
+		#nothing has changed:
+		assert th.update(pixels, 0, 0, W, H, STRIDE)==[]
+		#a single pixel:
+		set_pixel(pixels, 70, 10)
+		assert th.update(pixels, 0, 0, W, H, STRIDE)==[(64, 0, 64, 64)]
+		#two tiles in the same column:
+		set_pixel(pixels, 100, 70)
+		set_pixel(pixels, 100, 130)
+		assert th.update(pixels, 0, 0, W, H, STRIDE)==[(64, 64, 64, 128)]
+		#invalidated tiles are sent again:
+		th.invalidate(130, 10, 1, 1)
+		assert th.update(pixels, 0, 0, W, H, STRIDE)==[(128, 0, 64, 64)]
+		th.clear()
+		assert th.update(pixels, 0, 0, W, H, STRIDE)==[(0, 0, W, H)]
+
+	def test_sub_region(self):
+		pixels = bytearray(STRIDE*H)
+		th = TileHashMap(64)
+		#a small region which straddles two tiles, like a blinking cursor:
+		x, y, w, h = 60, 20, 8, 16
+		sub = bytearray(w*4*h)
+		assert th.update(sub, x, y, w, h, w*4)==[(x, y, w, h)]
+		assert th.update(sub, x, y, w, h, w*4)==[]
+		sub[0] = 1
+		#only the part of the first tile is sent:
+		assert th.update(sub, x, y, w, h, w*4)==[(x, y, 4, h)]
+		#a different area of the same tiles does not match:
+		assert th.update(sub, x, y+1, w, h, w*4)==[(x, y+1, w, h)]
+
+
+def main():
+	if TileHashMap:
+		unittest.main()
+
+if __name__ == '__main__':
+	main()
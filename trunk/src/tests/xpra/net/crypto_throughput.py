@@ -0,0 +1,119 @@
+#!/usr/bin/env python
+# This file is part of Xpra.
+# Copyright (C) 2016 Antoine Martin <antoine@devloop.org.uk>
+# Xpra is released under the terms of the GNU GPL v2, or, at your option, any
+# later version. See the file COPYING for details.
+
+"""
+Compares the encryption throughput of the AES-CBC and AES-GCM cipher modes:
+first the raw cipher cost for each chunk size (including the padding copy for CBC,
+and using the worker pool for GCM), then the throughput of a Protocol pair
+sending large draw packets over a socketpair.
+"""
+
+import os
+import sys
+import time
+import socket
+import threading
+
+from xpra.net import crypto
+from xpra.net.crypto import (get_encryptor, get_encrypt_pool, pad, choose_padding,
+                             MODE_CBC, MODE_GCM, DEFAULT_SALT, DEFAULT_ITERATIONS, DEFAULT_IV)
+from xpra.net.protocol import Protocol
+from xpra.net.bytestreams import SocketConnection
+from xpra.net.compression import Compressed
+
+SIZES = (1024, 16*1024, 256*1024, 1024*1024)
+TOTAL = 64*1024*1024
+PASSWORD = "this is our secret"
+
+
+class Scheduler(object):
+    def idle_add(self, fn, *args):
+        fn(*args)
+    def timeout_add(self, delay, fn, *args):
+        pass
+    def source_remove(self, *args):
+        pass
+
+
+def get_cipher(mode):
+    return get_encryptor("AES", DEFAULT_IV, PASSWORD, DEFAULT_SALT, DEFAULT_ITERATIONS, mode)
+
+def show(name, size, count, elapsed):
+    print("%-28s: %8i bytes chunks: %7.1fMB/s" % (name, size, size*count/elapsed/1024/1024))
+
+def test_ciphers():
+    padding = choose_padding(crypto.PADDING_OPTIONS)
+    for size in SIZES:
+        data = os.urandom(size)
+        count = max(1, TOTAL//size)
+        cbc, block_size = get_cipher(MODE_CBC)
+        start = time.time()
+        for _ in range(count):
+            padded = data+pad(padding, block_size-len(data)%block_size)
+            cbc.encrypt(padded)
+        show("CBC", size, count, time.time()-start)
+        gcm = get_cipher(MODE_GCM)[0]
+        start = time.time()
+        for _ in range(count):
+            gcm.encrypt(gcm.next_nonce(), data, b"header")
+        show("GCM", size, count, time.time()-start)
+        pool = get_encrypt_pool()
+        start = time.time()
+        results = [pool.apply_async(gcm.encrypt, (gcm.next_nonce(), data, b"header")) for _ in range(count)]
+        for r in results:
+            r.get()
+        show("GCM (%i threads)" % crypto.CRYPTO_THREADS, size, count, time.time()-start)
+
+
+def test_protocol(mode, count=64, size=1024*1024):
+    a, b = socket.socketpair()
+    received = []
+    done = threading.Event()
+    def process(proto, packet):
+        received.append(packet)
+        if len(received)==count:
+            done.set()
+    sender = Protocol(Scheduler(), SocketConnection(a, "a", "b", "a", "unix-domain"), process)
+    receiver = Protocol(Scheduler(), SocketConnection(b, "b", "a", "b", "unix-domain"), process)
+    for p in (sender, receiver):
+        p.enable_default_encoder()
+    args = ("AES", DEFAULT_IV, PASSWORD, DEFAULT_SALT, DEFAULT_ITERATIONS, "PKCS#7", mode)
+    sender.set_cipher_out(*args)
+    receiver.set_cipher_in(*args)
+    payload = os.urandom(size)
+    packets = [["draw", i, 0, 0, 10, 10, "rgb32", Compressed("raw", payload)] for i in range(count)]
+    def next_packet():
+        return packets.pop(0), None, None, bool(packets)
+    sender.set_packet_source(next_packet)
+    sender.start()
+    receiver.start()
+    start = time.time()
+    sender.source_has_more()
+    assert done.wait(120), "only received %i packets" % len(received)
+    elapsed = time.time()-start
+    print("Protocol %-19s: %8i bytes packets: %7.1fMB/s, %i chunks encrypted in parallel" % (
+            mode, size, size*count/elapsed/1024/1024, sender.parallel_encrypted))
+    sender.close()
+    receiver.close()
+
+
+def main():
+    crypto.crypto_backend_init()
+    if not crypto.backend:
+        print("no crypto backend available")
+        return 1
+    print("using %s, modes available: %s" % (crypto.backend.__name__, crypto.MODES))
+    if MODE_GCM not in crypto.MODES:
+        print("%s is not supported by this backend" % MODE_GCM)
+        return 1
+    test_ciphers()
+    for mode in (MODE_CBC, MODE_GCM):
+        test_protocol(mode)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
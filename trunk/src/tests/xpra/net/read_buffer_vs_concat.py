@@ -0,0 +1,75 @@
+#!/usr/bin/env python
+# This file is part of Xpra.
+# Copyright (C) 2016 Antoine Martin <antoine@devloop.org.uk>
+# Xpra is released under the terms of the GNU GPL v2, or, at your option, any
+# later version. See the file COPYING for details.
+
+"""
+Compares the cost of extracting packets from the network reads
+using string concatenation and slicing (the old parser)
+against the chunked ReadBuffer.
+"""
+
+import os
+import time
+
+from xpra.net.read_buffer import ReadBuffer, ZERO_COPY
+
+
+READ_SIZE = 65536
+
+def make_reads(packet_sizes):
+    data = b"".join(os.urandom(x) for x in packet_sizes)
+    return [data[i:i+READ_SIZE] for i in range(0, len(data), READ_SIZE)]
+
+def parse_concat(reads, packet_sizes):
+    read_buffer = None
+    sizes = list(packet_sizes)
+    packets = []
+    for buf in reads:
+        if read_buffer:
+            read_buffer = read_buffer + buf
+        else:
+            read_buffer = buf
+        while sizes and len(read_buffer)>=sizes[0]:
+            size = sizes.pop(0)
+            packets.append(read_buffer[:size])
+            read_buffer = read_buffer[size:]
+    return packets
+
+def parse_read_buffer(reads, packet_sizes):
+    read_buffer = ReadBuffer()
+    sizes = list(packet_sizes)
+    packets = []
+    for buf in reads:
+        read_buffer.append(buf)
+        while sizes and len(read_buffer)>=sizes[0]:
+            packets.append(read_buffer.read(sizes.pop(0)))
+    return packets
+
+def test_parser(name, packet_sizes, N=5):
+    reads = make_reads(packet_sizes)
+    total = sum(packet_sizes)
+    times = {}
+    for parser in (parse_concat, parse_read_buffer):
+        start = time.time()
+        for _ in range(N):
+            packets = parser(reads, packet_sizes)
+        times[parser] = (time.time()-start)/N
+        assert [len(x) for x in packets]==packet_sizes
+    ctime = times[parse_concat]
+    rtime = times[parse_read_buffer]
+    print("%-32s %8iKB in %4i reads: concat=%7.1fms, read buffer=%7.1fms (%.1f times faster)" % (
+            name, total//1024, len(reads), ctime*1000, rtime*1000, ctime/max(rtime, 0.000001)))
+
+def main():
+    print("zero copy mode: %s" % ZERO_COPY)
+    test_parser("small packets", [100+i%400 for i in range(10000)])
+    test_parser("one 1MB packet", [1024*1024])
+    test_parser("one 8MB packet", [8*1024*1024])
+    test_parser("4K frames", [3840*2160*4]*2)
+    test_parser("mixed", [200, 8*1024*1024, 50, 60, 100*1024, 70]*4)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+#!/usr/bin/env python
+# This file is part of Xpra.
+# Copyright (C) 2016 Antoine Martin <antoine@devloop.org.uk>
+# Xpra is released under the terms of the GNU GPL v2, or, at your option, any
+# later version. See the file COPYING for details.
+
+"""
+Compares the number of threads and the ping latency of the threaded Protocol
+and the SelectorProtocol, with many idle connections and a few active ones.
+"""
+
+import sys
+import time
+import socket
+import threading
+
+from xpra.net.protocol import Protocol
+from xpra.net.selector_protocol import SelectorProtocol, selectors
+from xpra.net.bytestreams import SocketConnection
+from xpra.net.header import pack_header, unpack_header
+from xpra.net.bencode import bencode, bdecode
+from xpra.simple_stats import get_list_stats
+
+IDLE = 200
+ACTIVE = 20
+PINGS = 50
+
+
+class Scheduler(object):
+    def idle_add(self, fn, *args):
+        fn(*args)
+    def timeout_add(self, delay, fn, *args):
+        pass
+
+
+def process_packet(proto, packet):
+    if packet[0]==b"ping" or packet[0]=="ping":
+        proto.send_now(["ping_echo", packet[1]])
+
+def make_ping(i):
+    data = bencode(["ping", i])
+    return pack_header(0, 0, 0, len(data)) + data
+
+def recv_all(sock, n):
+    data = b""
+    while len(data)<n:
+        v = sock.recv(n-len(data))
+        assert v, "connection closed"
+        data += v
+    return data
+
+def read_echo(sock):
+    header = recv_all(sock, 8)
+    size = unpack_header(header)[4]
+    return bdecode(recv_all(sock, size))[0]
+
+def test_protocol(protocol_class):
+    base_threads = threading.active_count()
+    scheduler = Scheduler()
+    protocols = []
+    clients = []
+    start = time.time()
+    for i in range(IDLE+ACTIVE):
+        server_sock, client_sock = socket.socketpair()
+        conn = SocketConnection(server_sock, "server", "client", "test-%i" % i, "unix-domain")
+        p = protocol_class(scheduler, conn, process_packet)
+        p.enable_default_encoder()
+        p.start()
+        protocols.append(p)
+        clients.append(client_sock)
+    #ping each idle connection once, so the parse threads are started too:
+    for i, sock in enumerate(clients):
+        sock.sendall(make_ping(i))
+        read_echo(sock)
+    setup = time.time()-start
+    threads = threading.active_count()-base_threads
+    #now measure the latency on the active connections, all at the same time:
+    latencies = []
+    def ping_loop(sock):
+        for i in range(PINGS):
+            t = time.time()
+            sock.sendall(make_ping(i))
+            read_echo(sock)
+            latencies.append((time.time()-t)*1000)
+    ping_threads = [threading.Thread(target=ping_loop, args=(sock,)) for sock in clients[IDLE:]]
+    for t in ping_threads:
+        t.start()
+    for t in ping_threads:
+        t.join()
+    stats = get_list_stats(latencies, show_percentile=[9])
+    print("%-20s: %4i threads for %i connections, setup time %5ims, ping latency: avg=%s, 90%%=%s, max=%s (ms)" % (
+            protocol_class.__name__, threads, len(protocols), setup*1000,
+            stats.get("avg"), stats.get("90p"), stats.get("max")))
+    for p in protocols:
+        p.close()
+    for sock in clients:
+        sock.close()
+
+
+def main():
+    if len(sys.argv)>1:
+        global IDLE, ACTIVE
+        IDLE = int(sys.argv[1])
+        if len(sys.argv)>2:
+            ACTIVE = int(sys.argv[2])
+    test_protocol(Protocol)
+    if not selectors:
+        print("no selectors module, cannot test the SelectorProtocol")
+        return
+    test_protocol(SelectorProtocol)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,250 @@
+#!/usr/bin/env python
+# This file is part of Xpra.
+# Copyright (C) 2016 Antoine Martin <antoine@devloop.org.uk>
+# Xpra is released under the terms of the GNU GPL v2, or, at your option, any
+# later version. See the file COPYING for details.
+
+"""
+Trains the zstd dictionary shipped in xpra/net/zstd_dictionary.py
+using synthetic but representative control packets:
+hello, new-window, configure-window, cursor and damage-sequence.
+The packets are encoded with bencode and rencode (if available),
+with and without packet aliases, just like the Protocol class would.
+
+Usage:
+  zstd_dictionary_train.py [OUTPUT_FILE]
+Without an output file, this only shows the compression ratios obtained.
+"""
+
+import sys
+import os.path
+import random
+import base64
+import zlib
+
+import zstandard
+
+from xpra.net.bencode import bencode
+from xpra.net.protocol import get_network_caps
+from xpra.util import flatten_dict
+
+try:
+    import rencode
+    rencode_dumps = rencode.dumps
+except ImportError:
+    rencode_dumps = None
+
+#the dictionary id is carried in the zstd frames,
+#we use our own value so we can identify incompatible dictionaries: "XPR\1"
+DICT_ID = 0x58505201
+DICT_SIZE = 16*1024
+SAMPLES = 2000
+
+PACKET_TYPES = ("hello", "new-window", "new-override-redirect", "configure-window", "cursor", "damage-sequence", "window-metadata", "ping", "ping_echo")
+ENCODINGS = ["h264", "vp8", "vp9", "webp", "png", "png/P", "png/L", "rgb24", "rgb32", "jpeg", "h265", "mpeg4"]
+WINDOW_TYPES = ["NORMAL", "DIALOG", "UTILITY", "MENU", "DROPDOWN_MENU", "POPUP_MENU", "TOOLTIP", "NOTIFICATION"]
+TITLES = ["xterm", "Terminal", "Mozilla Firefox", "gedit", "LibreOffice Writer", "Untitled Document 1", "Save As", "Open File", "Preferences"]
+CLASSES = [("xterm", "XTerm"), ("gnome-terminal", "Gnome-terminal"), ("Navigator", "Firefox"), ("gedit", "Gedit"), ("libreoffice", "libreoffice-writer")]
+CURSORS = ["left_ptr", "xterm", "hand2", "watch", "sb_h_double_arrow", "sb_v_double_arrow", "fleur", "top_left_corner"]
+
+
+def r(n):
+    return random.randint(0, n)
+
+def make_hello():
+    caps = flatten_dict(get_network_caps())
+    caps.update({
+        "version"                   : "0.18.0",
+        "platform"                  : random.choice(["linux2", "win32", "darwin"]),
+        "platform.name"             : random.choice(["Linux", "Microsoft Windows", "Mac OSX"]),
+        "platform.release"          : "4.%i.%i" % (r(9), r(20)),
+        "build.revision"            : r(20000),
+        "build.bit"                 : "64bit",
+        "uuid"                      : "%032x" % random.getrandbits(128),
+        "hostname"                  : random.choice(["desktop", "laptop", "localhost.localdomain"]),
+        "username"                  : random.choice(["user", "root", "antoine"]),
+        "name"                      : "",
+        "session-type"              : random.choice(["", "desktop", "shadow"]),
+        "compression_level"         : r(9),
+        "dpi"                       : random.choice([96, 120, 144]),
+        "desktop_size"              : (random.choice([1920, 2560, 3840]), random.choice([1080, 1440, 2160])),
+        "screen_sizes"              : [(":0.0", 1920, 1080, 508, 286, [("DVI-I-1", 0, 0, 1920, 1080, 531, 299)], 0, 0, 1920, 1055)],
+        "encodings"                 : random.sample(ENCODINGS, 8),
+        "encodings.core"            : ENCODINGS,
+        "encodings.rgb_formats"     : ["RGB", "RGBA", "RGBX", "BGRX", "BGRA"],
+        "encodings.window-icon"     : ["premult_argb32", "png"],
+        "encodings.cursor"          : ["raw", "png"],
+        "encoding.min-quality"      : r(50),
+        "encoding.min-speed"        : r(50),
+        "encoding.video_scaling"    : True,
+        "encoding.video_reinit"     : True,
+        "encoding.transparency"     : True,
+        "encoding.rgb_lz4"          : True,
+        "encoding.supports_delta"   : ["png", "rgb24", "rgb32"],
+        "encoding.flush"            : True,
+        "encoding.generic"          : True,
+        "keyboard"                  : True,
+        "keyboard_sync"             : random.choice([True, False]),
+        "xkbmap_layout"             : random.choice(["us", "gb", "fr", "de"]),
+        "xkbmap_variant"            : "",
+        "modifiers"                 : ["mod2"],
+        "clipboard"                 : True,
+        "clipboard.want_targets"    : False,
+        "clipboard.greedy"          : False,
+        "clipboard.selections"      : ["CLIPBOARD", "PRIMARY", "SECONDARY"],
+        "notifications"             : True,
+        "cursors"                   : True,
+        "bell"                      : True,
+        "system_tray"               : True,
+        "sharing"                   : random.choice([True, False]),
+        "windows"                   : True,
+        "randr_notify"              : True,
+        "raw_window_icons"          : True,
+        "chunked_compression"       : True,
+        "file-transfer"             : True,
+        "file-size-limit"           : 10,
+        "printing"                  : True,
+        "sound.send"                : True,
+        "sound.receive"             : True,
+        "sound.decoders"            : ["opus+mka", "vorbis+ogg", "flac", "wav", "mp3"],
+        "sound.encoders"            : ["opus+mka", "vorbis+ogg", "flac", "wav", "mp3"],
+        "sound.server_driven"       : True,
+        "window.raise"              : True,
+        "window.initiate-moveresize": True,
+        "window.states"             : ["fullscreen", "maximized", "sticky", "above", "below", "shaded", "iconified", "skip-taskbar", "skip-pager"],
+        "metadata.supported"        : ["title", "icon-title", "pid", "iconic", "size-hints", "class-instance", "client-machine", "transient-for", "window-type",
+                                       "fullscreen", "maximized", "decorations", "skip-taskbar", "skip-pager", "has-alpha", "override-redirect", "tray", "modal",
+                                       "role", "opacity", "xid", "group-leader", "shaded", "bypass-compositor", "strut", "fullscreen-monitors", "shape"],
+        })
+    return ["hello", caps]
+
+def make_metadata():
+    title = random.choice(TITLES)
+    return {
+        "title"             : title,
+        "icon-title"        : title,
+        "class-instance"    : random.choice(CLASSES),
+        "client-machine"    : "desktop",
+        "pid"               : r(32768),
+        "xid"               : "%#x" % (0x400000+r(0xfffff)),
+        "window-type"       : [random.choice(WINDOW_TYPES)],
+        "has-alpha"         : random.choice([True, False]),
+        "opacity"           : -1,
+        "iconic"            : False,
+        "decorations"       : True,
+        "size-constraints"  : {"minimum-size" : (r(200), r(200)), "base-size" : (r(20), r(20)), "increment" : (r(10), r(20))},
+        "fullscreen"        : False,
+        "maximized"         : random.choice([True, False]),
+        "skip-taskbar"      : False,
+        "skip-pager"        : False,
+        "above"             : False,
+        "below"             : False,
+        "shaded"            : False,
+        "sticky"            : False,
+        "modal"             : False,
+        "role"              : random.choice(["", "browser", "GtkFileChooserDialog"]),
+        "group-leader-xid"  : "%#x" % (0x400000+r(0xfffff)),
+        "transient-for"     : random.choice([0, r(100)]),
+        }
+
+def make_packet(packet_type):
+    wid = r(200)
+    x, y, w, h = r(1920), r(1080), r(1920), r(1080)
+    if packet_type=="hello":
+        return make_hello()
+    if packet_type in ("new-window", "new-override-redirect"):
+        return [packet_type, wid, x, y, w, h, make_metadata(), {}]
+    if packet_type=="window-metadata":
+        return [packet_type, wid, dict(random.sample(list(make_metadata().items()), 1+r(4)))]
+    if packet_type=="configure-window":
+        props = {}
+        if random.random()>0.5:
+            props = {"frame" : (r(5), r(5), r(30), r(5))}
+        return [packet_type, wid, x, y, w, h, props, r(100), {}, False]
+    if packet_type=="cursor":
+        return [packet_type, "png", x, y, r(32), r(32), r(16), r(16), r(10000), b"", random.choice(CURSORS)]
+    if packet_type=="damage-sequence":
+        return [packet_type, r(100000), wid, w, h, r(50000), ""]
+    if packet_type=="ping":
+        return [packet_type, random.getrandbits(40)]
+    return [packet_type, random.getrandbits(40), r(10000), r(10000), r(10000), r(100), ""]
+
+def get_encoders():
+    encoders = [bencode]
+    if rencode_dumps:
+        encoders.append(rencode_dumps)
+    return encoders
+
+def encode_samples(packet_type, count):
+    samples = []
+    encoders = get_encoders()
+    alias = PACKET_TYPES.index(packet_type)+1
+    for i in range(count):
+        packet = make_packet(packet_type)
+        if packet_type!="hello" and i%2==0:
+            #the packet type is usually replaced with an alias:
+            packet[0] = alias
+        samples.append(encoders[i%len(encoders)](packet))
+    return samples
+
+def make_samples():
+    samples = []
+    for packet_type in PACKET_TYPES:
+        count = SAMPLES//len(PACKET_TYPES)
+        if packet_type=="hello":
+            count //= 10
+        samples += encode_samples(packet_type, count)
+    random.shuffle(samples)
+    return samples
+
+def show_ratios(dict_data):
+    zc = zstandard.ZstdCompressor(level=3)
+    zdc = zstandard.ZstdCompressor(level=3, dict_data=dict_data)
+    print("%-24s %8s %8s %8s %8s" % ("packet type", "size", "zlib", "zstd", "zstd+dict"))
+    #use a different random seed from the one used for training:
+    random.seed(1)
+    for packet_type in PACKET_TYPES:
+        samples = encode_samples(packet_type, 50)
+        def avg(fn):
+            return sum(len(fn(x)) for x in samples)//len(samples)
+        print("%-24s %8i %8i %8i %8i" % (packet_type, avg(lambda x : x), avg(lambda x : zlib.compress(x, 1)), avg(zc.compress), avg(zdc.compress)))
+
+def write_module(filename, dict_data):
+    data = base64.b64encode(dict_data.as_bytes()).decode("latin1")
+    lines = [data[i:i+76] for i in range(0, len(data), 76)]
+    with open(filename, "w") as f:
+        f.write("""# This file is part of Xpra.
+# Copyright (C) 2016 Antoine Martin <antoine@devloop.org.uk>
+# Xpra is released under the terms of the GNU GPL v2, or, at your option, any
+# later version. See the file COPYING for details.
+
+# zstd dictionary trained from typical control packets,
+# generated using tests/xpra/net/zstd_dictionary_train.py - do not edit
+
+DICTIONARY_ID = %#x
+DICTIONARY_SIZE = %i
+
+DICTIONARY = (
+%s
+)
+
+def get_dictionary_data():
+    import base64
+    return base64.b64decode(DICTIONARY)
+""" % (DICT_ID, len(dict_data), "\n".join('    "%s"' % l for l in lines)))
+
+
+def main():
+    random.seed(0)
+    samples = make_samples()
+    dict_data = zstandard.train_dictionary(DICT_SIZE, samples, dict_id=DICT_ID)
+    print("trained a %i bytes dictionary from %i samples" % (len(dict_data), len(samples)))
+    show_ratios(dict_data)
+    if len(sys.argv)>1:
+        filename = sys.argv[1]
+        write_module(filename, dict_data)
+        print("saved to %s" % os.path.abspath(filename))
+
+
+if __name__ == "__main__":
+    main()
@@ -24,8 +24,9 @@ from xpra.scripts.config import InitExit
 from xpra.child_reaper import getChildReaper, reaper_cleanup
 from xpra.net import compression
 from xpra.net.protocol import Protocol, get_network_caps, sanity_checks
-from xpra.net.crypto import crypto_backend_init, get_iterations, get_iv, get_salt, choose_padding, \
-    ENCRYPTION_CIPHERS, ENCRYPT_FIRST_PACKET, DEFAULT_IV, DEFAULT_SALT, DEFAULT_ITERATIONS, INITIAL_PADDING, DEFAULT_PADDING, ALL_PADDING_OPTIONS, PADDING_OPTIONS
+from xpra.net.crypto import crypto_backend_init, get_iterations, get_iv, get_salt, choose_padding, choose_mode, get_cipher_mode, \
+    ENCRYPTION_CIPHERS, ENCRYPT_FIRST_PACKET, DEFAULT_IV, DEFAULT_SALT, DEFAULT_ITERATIONS, INITIAL_PADDING, DEFAULT_PADDING, ALL_PADDING_OPTIONS, PADDING_OPTIONS, \
+    DEFAULT_MODE, MODES
 from xpra.version_util import version_compat_check, get_version_info, local_version
 from xpra.platform.info import get_name
 from xpra.os_util import get_machine_id, get_user_uuid, load_binary_file, SIGNAMES, strtobytes, bytestostr
@@ -89,6 +90,7 @@ class XpraClientBase(FileTransferHandler):
         self.encryption = None
         self.encryption_keyfile = None
         self.server_padding_options = [DEFAULT_PADDING]
+        self.server_mode_options = [DEFAULT_MODE]
         self.quality = -1
         self.min_quality = 0
         self.speed = 0
@@ -236,7 +238,8 @@ class XpraClientBase(FileTransferHandler):
         self._protocol.enable_default_compressor()
         if self.encryption and ENCRYPT_FIRST_PACKET:
             key = self.get_encryption_key()
-            self._protocol.set_cipher_out(self.encryption, DEFAULT_IV, key, DEFAULT_SALT, DEFAULT_ITERATIONS, INITIAL_PADDING)
+            cipher = get_cipher_mode(self.encryption)[0]
+            self._protocol.set_cipher_out(cipher, DEFAULT_IV, key, DEFAULT_SALT, DEFAULT_ITERATIONS, INITIAL_PADDING)
         self.have_more = self._protocol.source_has_more
         if conn.timeout>0:
             self.timeout_add((conn.timeout + EXTRA_TIMEOUT) * 1000, self.verify_connected)
@@ -361,23 +364,30 @@ class XpraClientBase(FileTransferHandler):
 
         if self.encryption:
             assert self.encryption in ENCRYPTION_CIPHERS
+            cipher, mode = get_cipher_mode(self.encryption)
             iv = get_iv()
             key_salt = get_salt()
             iterations = get_iterations()
             padding = choose_padding(self.server_padding_options)
+            #unless the mode is specified, use the best one the server supports,
+            #older servers do not tell us and only support the default one:
+            mode_options = [mode] if mode else MODES
+            mode = mode or choose_mode(self.server_mode_options)
             up("cipher", {
-                    ""                      : self.encryption,
+                    ""                      : cipher,
                     "iv"                    : iv,
                     "key_salt"              : key_salt,
                     "key_stretch_iterations": iterations,
                     "padding"               : padding,
                     "padding.options"       : PADDING_OPTIONS,
+                    "mode"                  : mode,
+                    "mode.options"          : mode_options,
                     })
             key = self.get_encryption_key()
             if key is None:
                 self.warn_and_quit(EXIT_ENCRYPTION, "encryption key is missing")
                 return
-            self._protocol.set_cipher_in(self.encryption, iv, key, key_salt, iterations, padding)
+            self._protocol.set_cipher_in(cipher, iv, key, key_salt, iterations, padding, mode)
             netlog("encryption capabilities: %s", dict((k,v) for k,v in capabilities.items() if k.startswith("cipher")))
         return capabilities
 
@@ -576,9 +586,11 @@ class XpraClientBase(FileTransferHandler):
         key_salt = caps.strget("cipher.key_salt")
         iterations = caps.intget("cipher.key_stretch_iterations")
         padding = caps.strget("cipher.padding", DEFAULT_PADDING)
+        mode = caps.strget("cipher.mode", DEFAULT_MODE)
         #server may tell us what it supports,
         #either from hello response or from challenge packet:
         self.server_padding_options = caps.strlistget("cipher.padding.options", [DEFAULT_PADDING])
+        self.server_mode_options = caps.strlistget("cipher.mode.options", [DEFAULT_MODE])
         if not cipher or not cipher_iv:
             self.warn_and_quit(EXIT_ENCRYPTION, "the server does not use or support encryption/password, cannot continue with %s cipher" % self.encryption)
             return False
@@ -588,10 +600,14 @@ class XpraClientBase(FileTransferHandler):
         if padding not in ALL_PADDING_OPTIONS:
             self.warn_and_quit(EXIT_ENCRYPTION, "unsupported server cipher padding: %s, allowed ciphers: %s" % (padding, ", ".join(ALL_PADDING_OPTIONS)))
             return False
+        wanted_mode = get_cipher_mode(self.encryption)[1]
+        if mode not in MODES or (wanted_mode and mode!=wanted_mode):
+            self.warn_and_quit(EXIT_ENCRYPTION, "unsupported server cipher mode: %s, allowed modes: %s" % (mode, ", ".join([wanted_mode] if wanted_mode else MODES)))
+            return False
         p = self._protocol
         if not p:
             return False
-        p.set_cipher_out(cipher, cipher_iv, key, key_salt, iterations, padding)
+        p.set_cipher_out(cipher, cipher_iv, key, key_salt, iterations, padding, mode)
         return True
 
 
@@ -659,6 +675,12 @@ class XpraClientBase(FileTransferHandler):
     def parse_logging_capabilities(self):
         pass
 
+    def get_file_transfer_scope(self):
+        #the server we are connected to:
+        p = self._protocol
+        conn = p and p._conn
+        return str((conn and conn.target) or "")
+
     def parse_printing_capabilities(self):
         if self.printing:
             if self.server_capabilities.boolget("printing"):
@@ -788,6 +810,7 @@ class XpraClientBase(FileTransferHandler):
         if not p or not p.enable_encoder_from_caps(c):
             return False
         p.enable_compressor_from_caps(c)
+        p.set_split_packets(c.boolget("split-packets"))
         return True
 
     def parse_encryption_capabilities(self):
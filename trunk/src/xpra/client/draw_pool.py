@@ -0,0 +1,159 @@
+# This file is part of Xpra.
+# Copyright (C) 2016 Antoine Martin <antoine@devloop.org.uk>
+# Xpra is released under the terms of the GNU GPL v2, or, at your option, any
+# later version. See the file COPYING for details.
+
+import time
+from collections import deque
+from threading import Lock
+
+from xpra.log import Logger
+log = Logger("paint")
+
+from xpra.os_util import Queue, bytestostr
+from xpra.util import envint, envbool, typedict
+from xpra.make_thread import make_thread
+
+try:
+    from multiprocessing import cpu_count
+    CPU_COUNT = cpu_count()
+except:
+    CPU_COUNT = 1
+DRAW_THREADS = max(1, envint("XPRA_DRAW_THREADS", min(4, CPU_COUNT)))
+#drop the draw packets which are superseded by a later update of the same area:
+DRAW_COALESCE = envbool("XPRA_DRAW_COALESCE", True)
+#these encodings do not keep any state in the decoder, so they can be skipped:
+#(not video encodings, and not mmap which must be freed)
+COALESCE_ENCODINGS = ("png", "png/P", "png/L", "jpeg", "webp", "rgb24", "rgb32")
+
+
+def get_draw_info(packet):
+    """
+        Returns the geometry of a draw packet and whether it can be dropped or replace other packets,
+        which is only the case for stateless encodings that do not use (or store) a delta bucket.
+    """
+    x, y, w, h, coding = packet[2:7]
+    stateless = False
+    if bytestostr(coding) in COALESCE_ENCODINGS:
+        options = typedict(packet[10] if len(packet)>10 else {})
+        stateless = options.intget("delta", -1)<0 and options.intget("store", -1)<0
+    return (x, y, x+w, y+h), stateless
+
+
+class DrawPool(object):
+    """
+        Processes the draw packets using a small pool of threads.
+        The packets of a stream are always processed in order and by one thread at a time,
+        each window is a stream by default (the decoders and the delta buckets are per window)
+        so the windows are processed in parallel,
+        and a slow decoder in one window does not delay the paints of all the other windows.
+        The caller can also put the packets of several windows in the same stream
+        when they must be processed in the order they were received.
+        After each packet, the stream goes back to the end of the queue
+        to give the other streams a fair share of the threads.
+    """
+
+    def __init__(self, process_packet, skip_packet=None, threads=DRAW_THREADS):
+        self.process_packet = process_packet
+        self.skip_packet = skip_packet
+        self.lock = Lock()
+        self.pending = {}           #stream -> deque of packets
+        self.ready = Queue()        #the streams which are waiting for a thread (each one only once)
+        self.processed = 0
+        self.skipped = 0
+        self.max_queued = 0
+        self.threads = [make_thread(self.run, "draw-%i" % i) for i in range(threads)]
+
+    def __repr__(self):
+        return "DrawPool(%i threads)" % len(self.threads)
+
+    def start(self):
+        for t in self.threads:
+            t.start()
+
+    def stop(self):
+        #tell the draw threads to exit:
+        for _ in self.threads:
+            self.ready.put(None)
+
+    def get_info(self):
+        with self.lock:
+            queued = dict((stream, len(packets)) for stream, packets in self.pending.items())
+        return {
+                "threads"   : len(self.threads),
+                "processed" : self.processed,
+                "skipped"   : self.skipped,
+                "queued"    : queued,
+                "max-queued": self.max_queued,
+                }
+
+    def put(self, packet, stream=None):
+        wid = packet[1]
+        if stream is None:
+            stream = wid
+        skipped = []
+        with self.lock:
+            packets = self.pending.get(stream)
+            if packets is None:
+                #this stream is not scheduled yet:
+                self.pending[stream] = deque([packet])
+                self.ready.put(stream)
+                return
+            if DRAW_COALESCE and packets:
+                skipped = self.remove_superseded(packets, packet)
+                self.skipped += len(skipped)
+            packets.append(packet)
+            self.max_queued = max(self.max_queued, len(packets))
+        if skipped:
+            log("skipped %i draw packets for window %i superseded by sequence %i", len(skipped), wid, packet[8])
+            if self.skip_packet:
+                for p in skipped:
+                    self.skip_packet(p)
+
+    def remove_superseded(self, packets, packet):
+        """
+            Removes the packets of the same window which are fully covered by this new packet.
+            We must stop at the first scroll packet since it copies pixels
+            from areas which may be painted by the packets before it.
+            The lock must be held.
+        """
+        (x1, y1, x2, y2), stateless = get_draw_info(packet)
+        if not stateless:
+            return []
+        keep = []
+        skipped = []
+        while packets:
+            p = packets.pop()
+            if bytestostr(p[6])=="scroll":
+                packets.append(p)
+                break
+            (px1, py1, px2, py2), p_stateless = get_draw_info(p)
+            if p[1]==packet[1] and p_stateless and px1>=x1 and py1>=y1 and px2<=x2 and py2<=y2:
+                skipped.insert(0, p)
+            else:
+                keep.insert(0, p)
+        packets.extend(keep)
+        return skipped
+
+    def run(self):
+        while True:
+            stream = self.ready.get()
+            if stream is None:
+                break
+            with self.lock:
+                packet = self.pending[stream].popleft()
+            try:
+                self.process_packet(packet)
+                time.sleep(0)
+            except KeyboardInterrupt:
+                raise
+            except:
+                log.error("error processing draw packet", exc_info=True)
+            with self.lock:
+                self.processed += 1
+                if self.pending[stream]:
+                    #more packets for this stream, back in the queue:
+                    self.ready.put(stream)
+                else:
+                    del self.pending[stream]
+        log("draw thread ended")
@@ -167,8 +167,13 @@ class GTKXpraClient(UIXpraClient, GObjectXpraClient):
         filename = dialog.get_filename()
         gfile = dialog.get_file()
         dialog.destroy()
+        openit = v==gtk.RESPONSE_ACCEPT
+        if filename:
+            #local file, stream it from disk:
+            self.send_file_from_path(filename, "", openit=openit)
+            return
         filelog("load_contents: filename=%s, response=%s", filename, v)
-        gfile.load_contents_async(self.file_upload_ready, user_data=(filename, v==gtk.RESPONSE_ACCEPT))
+        gfile.load_contents_async(self.file_upload_ready, user_data=(filename, openit))
 
     def file_upload_ready(self, gfile, result, user_data):
         filelog("file_upload_ready%s", (gfile, result, user_data))
@@ -417,6 +422,7 @@ class GTKXpraClient(UIXpraClient, GObjectXpraClient):
                     "icons.size"        : (64, 64),     #size we want
                     "icons.max_size"    : (128, 128),   #limit
                     "delta_buckets"     : DELTA_BUCKETS,
+                    "delta_evict"       : True,
                     })
         return capabilities
 
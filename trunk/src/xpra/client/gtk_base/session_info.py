@@ -382,6 +382,12 @@ class SessionInfo(gtk.Window):
             if self.client.client_supports_opengl:
                 self.opengl_label = label()
                 wtb.attach(self.opengl_label, 4)
+            wtb.inc()
+            wtb.attach(label("Draw Queue:", "Screen updates waiting to be painted, and updates skipped because newer ones replaced them"), 0, xoptions=EXPAND|FILL, xpadding=0)
+            self.draw_queue_label = label()
+            wtb.attach(self.draw_queue_label, 1)
+            self.draw_skipped_label = label()
+            wtb.attach(self.draw_skipped_label, 2)
 
             #add encoder info:
             etb = TableBuilder()
@@ -935,6 +941,9 @@ class SessionInfo(gtk.Window):
             self.trays_managed_label.set_text(str(trays))
             if self.client.client_supports_opengl:
                 self.opengl_label.set_text(str(gl))
+            dinfo = self.client.get_info().get("draw", {})
+            self.draw_queue_label.set_text("%i queued" % sum(dinfo.get("queued", {}).values()))
+            self.draw_skipped_label.set_text("%i skipped" % dinfo.get("skipped", 0))
 
             #remove all the current labels:
             for x in self.encoder_info_box.get_children():
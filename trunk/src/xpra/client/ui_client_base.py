@@ -44,6 +44,7 @@ from xpra.client.client_base import XpraClientBase
 from xpra.exit_codes import (EXIT_TIMEOUT, EXIT_MMAP_TOKEN_FAILURE)
 from xpra.client.client_tray import ClientTray
 from xpra.client.keyboard_helper import KeyboardHelper
+from xpra.client.draw_pool import DrawPool
 from xpra.platform.features import MMAP_SUPPORTED, SYSTEM_TRAY_SUPPORTED, CLIPBOARD_WANT_TARGETS, CLIPBOARD_GREEDY, CLIPBOARDS, REINIT_WINDOWS
 from xpra.platform.gui import (ready as gui_ready, get_vrefresh, get_antialias_info, get_icc_info, get_double_click_time, show_desktop, get_cursor_size,
                                get_double_click_distance, get_native_notifier_classes, get_native_tray_classes, get_native_system_tray_classes,
@@ -57,8 +58,7 @@ from xpra.simple_stats import std_unit
 from xpra.net import compression, packet_encoding
 from xpra.net.compression import Compressed
 from xpra.child_reaper import reaper_cleanup
-from xpra.make_thread import make_thread
-from xpra.os_util import BytesIOClass, Queue, platform_name, get_machine_id, get_user_uuid, bytestostr
+from xpra.os_util import BytesIOClass, platform_name, get_machine_id, get_user_uuid, bytestostr
 from xpra.util import nonl, std, iround, envint, envbool, AtomicInteger, log_screen_sizes, typedict, updict, csv, engs, CLIENT_EXIT
 from xpra.version_util import get_version_info_full, get_platform_info
 try:
@@ -164,9 +164,9 @@ class UIXpraClient(XpraClientBase):
         self.desktop_fullscreen = False
 
         #draw thread:
-        self._draw_queue = None
-        self._draw_thread = None
-        self._draw_counter = 0
+        self._draw_pool = None
+        #draw packets are processed by multiple draw pool threads:
+        self._draw_counter = AtomicInteger()
 
         #statistics and server info:
         self.server_start_time = -1
@@ -486,9 +486,8 @@ class UIXpraClient(XpraClientBase):
         else:
             self.window_close_action = opts.window_close
 
-        #draw thread:
-        self._draw_queue = Queue()
-        self._draw_thread = make_thread(self._draw_thread_loop, "draw")
+        #draw threads:
+        self._draw_pool = DrawPool(self._do_draw, self._skip_draw)
 
     def setup_connection(self, conn):
         XpraClientBase.setup_connection(self, conn)
@@ -608,7 +607,7 @@ class UIXpraClient(XpraClientBase):
         if self.client_extras:
             self.idle_add(self.client_extras.ready)
         XpraClientBase.run(self)    #start network threads
-        self._draw_thread.start()
+        self._draw_pool.start()
         self.send_hello()
 
 
@@ -619,10 +618,10 @@ class UIXpraClient(XpraClientBase):
         log("UIXpraClient.cleanup()")
         self.stop_sending_webcam()
         XpraClientBase.cleanup(self)
-        #tell the draw thread to exit:
-        dq = self._draw_queue
-        if dq:
-            dq.put(None)
+        #tell the draw threads to exit:
+        dp = self._draw_pool
+        if dp:
+            dp.stop()
         self.stop_all_sound()
         for x in (self.keyboard_helper, self.clipboard_helper, self.tray, self.notifier, self.menu_helper, self.client_extras, getVideoHelper()):
             if x is None:
@@ -1382,6 +1381,8 @@ class UIXpraClient(XpraClientBase):
         if self.mmap_enabled:
             capabilities["mmap_file"] = self.mmap_filename
             capabilities["mmap_token"] = self.mmap_token
+            #we free the mmap slots as soon as we have painted them:
+            capabilities["mmap_slots"] = True
         #don't try to find the server uuid if this platform cannot run servers..
         #(doing so causes lockups on win32 and startup errors on osx)
         if MMAP_SUPPORTED:
@@ -2895,27 +2896,37 @@ class UIXpraClient(XpraClientBase):
             window.resize(aw, ah, resize_counter)
 
     def _process_draw(self, packet):
-        self._draw_queue.put(packet)
+        stream = None
+        if self.mmap_enabled:
+            from xpra.net.mmap_pipe import is_slot_mode
+            if not is_slot_mode(self.mmap):
+                #without the slot allocator, the mmap area is a ring which must be read
+                #in the order the server wrote it, and the other packets of each window
+                #must stay in order with the mmap ones: use a single ordered stream
+                stream = "mmap"
+        self._draw_pool.put(packet, stream)
 
     def send_damage_sequence(self, wid, packet_sequence, width, height, decode_time, message=""):
         self.send_now("damage-sequence", packet_sequence, wid, width, height, decode_time, message)
 
-    def _draw_thread_loop(self):
-        while self.exit_code is None:
-            packet = self._draw_queue.get()
-            if packet is None:
-                break
-            try:
-                self._do_draw(packet)
-                time.sleep(0)
-            except KeyboardInterrupt:
-                raise
-            except:
-                log.error("error processing draw packet", exc_info=True)
-        log("draw thread ended")
+    def get_info(self):
+        info = {}
+        dp = self._draw_pool
+        if dp:
+            info["draw"] = dp.get_info()
+        return info
+
+    def _skip_draw(self, packet):
+        """
+            The draw pool is dropping this packet because a newer one covers the same area,
+            let the server know so it can adjust its batch delay.
+        """
+        wid, _, _, width, height, coding, _, packet_sequence = packet[1:9]
+        paintlog("skipping %s draw packet %i for window %i", coding, packet_sequence, wid)
+        self.send_damage_sequence(wid, packet_sequence, width, height, 0, "superseded")
 
     def _do_draw(self, packet):
-        """ this runs from the draw thread above """
+        """ this runs from one of the draw pool threads """
         wid, x, y, width, height, coding, data, packet_sequence, rowstride = packet[1:10]
         #rename old encoding aliases early:
         window = self._id_to_window.get(wid)
@@ -2924,14 +2935,11 @@ class UIXpraClient(XpraClientBase):
             def draw_cleanup():
                 if coding=="mmap":
                     assert self.mmap_enabled
-                    from xpra.net.mmap_pipe import int_from_buffer
-                    def free_mmap_area():
-                        #we need to ack the data to free the space!
-                        data_start = int_from_buffer(self.mmap, 0)
-                        offset, length = data[-1]
-                        data_start.value = offset+length
-                    #clear the mmap area via idle_add so any pending draw requests
-                    #will get a chance to run first (preserving the order)
+                    #we need to ack the data to free the space!
+                    #(in legacy mode, the draw packets are all processed in order
+                    # and this runs via idle_add after the paints they have scheduled)
+                    from xpra.net.mmap_pipe import mmap_free
+                    mmap_free(self.mmap, data)
                 self.send_damage_sequence(wid, packet_sequence, width, height, -1)
             self.idle_add(draw_cleanup)
             return
@@ -2956,11 +2964,11 @@ class UIXpraClient(XpraClientBase):
                 decode_time = 0
                 paintlog("record_decode_time(%s, %s) decoding or painting skipped on wid=%s, %s: %sx%s", success, message, wid, coding, width, height)
             self.send_damage_sequence(wid, packet_sequence, width, height, decode_time, message)
-        self._draw_counter += 1
-        if PAINT_FAULT_RATE>0 and (self._draw_counter % PAINT_FAULT_RATE)==0:
-            log.warn("injecting paint fault for %s draw packet %i, sequence number=%i", coding, self._draw_counter, packet_sequence)
+        draw_count = self._draw_counter.increase()
+        if PAINT_FAULT_RATE>0 and (draw_count % PAINT_FAULT_RATE)==0:
+            log.warn("injecting paint fault for %s draw packet %i, sequence number=%i", coding, draw_count, packet_sequence)
             if PAINT_FAULT_TELL:
-                self.idle_add(record_decode_time, False, "fault injection for %s draw packet %i, sequence number=%i" % (coding, self._draw_counter, packet_sequence))
+                self.idle_add(record_decode_time, False, "fault injection for %s draw packet %i, sequence number=%i" % (coding, draw_count, packet_sequence))
             return
         #we could expose this to the csc step? (not sure how this could be used)
         #if self.xscale!=1 or self.yscale!=1:
@@ -10,7 +10,7 @@ log = Logger("paint")
 deltalog = Logger("delta")
 
 from threading import Lock
-from xpra.net.mmap_pipe import mmap_read
+from xpra.net.mmap_pipe import mmap_read, mmap_free, is_slot_mode
 from xpra.net import compression
 from xpra.util import typedict, csv, envint, envbool
 from xpra.codecs.loader import get_codec
@@ -448,7 +448,14 @@ class WindowBackingBase(object):
         data = mmap_read(self.mmap, img_data)
         rgb_format = options.strget("rgb_format", "RGB")
         #Note: BGR(A) is only handled by gl_window_backing
-        self.do_paint_rgb(rgb_format, data, x, y, width, height, rowstride, options, callbacks)
+        #(in legacy mode, mmap_read has already moved data_start past this data)
+        slot_mode = is_slot_mode(self.mmap)
+        try:
+            self.do_paint_rgb(rgb_format, data, x, y, width, height, rowstride, options, callbacks)
+        finally:
+            if slot_mode:
+                #the pixels have been copied, the server can re-use this slot:
+                mmap_free(self.mmap, img_data)
 
     def paint_scroll(self, *args):
         raise NotImplementedError("no paint scroll on %s" % type(self))
@@ -461,6 +468,13 @@ class WindowBackingBase(object):
             log("draw_region(%s, %s, %s, %s, %s, %s bytes, %s, %s, %s)", x, y, width, height, coding, len(img_data), rowstride, options, callbacks)
             coding = bytestostr(coding)
             options["encoding"] = coding            #used for choosing the color of the paint box
+            evict = options.intlistget("evict", [])
+            if evict:
+                #the server is no longer using those delta buckets:
+                deltalog("delta: evicting buckets %s", evict)
+                for bucket in evict:
+                    if 0<=bucket<DELTA_BUCKETS:
+                        self._delta_pixel_data[bucket] = None
             if INTEGRITY_HASH:
                 l = options.get("z.len")
                 if l:
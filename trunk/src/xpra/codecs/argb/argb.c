@@ -0,0 +1,9271 @@
+/* Generated by Cython 0.29.37 */
+
+/* BEGIN: Cython Metadata
+{
+    "distutils": {
+        "depends": [
+            "xpra/buffers/buffers.h"
+        ],
+        "include_dirs": [
+            "xpra/codecs/argb"
+        ],
+        "name": "xpra.codecs.argb.argb",
+        "sources": [
+            "xpra/codecs/argb/argb.pyx",
+            "xpra/buffers/memalign.c",
+            "xpra/buffers/new_buffers.c"
+        ]
+    },
+    "module_name": "xpra.codecs.argb.argb"
+}
+END: Cython Metadata */
+
+#ifndef PY_SSIZE_T_CLEAN
+#define PY_SSIZE_T_CLEAN
+#endif /* PY_SSIZE_T_CLEAN */
+#include "Python.h"
+#ifndef Py_PYTHON_H
+    #error Python headers needed to compile C extensions, please install development version of Python.
+#elif PY_VERSION_HEX < 0x02060000 || (0x03000000 <= PY_VERSION_HEX && PY_VERSION_HEX < 0x03030000)
+    #error Cython requires Python 2.6+ or Python 3.3+.
+#else
+#define CYTHON_ABI "0_29_37"
+#define CYTHON_HEX_VERSION 0x001D25F0
+#define CYTHON_FUTURE_DIVISION 0
+#include <stddef.h>
+#ifndef offsetof
+  #define offsetof(type, member) ( (size_t) & ((type*)0) -> member )
+#endif
+#if !defined(WIN32) && !defined(MS_WINDOWS)
+  #ifndef __stdcall
+    #define __stdcall
+  #endif
+  #ifndef __cdecl
+    #define __cdecl
+  #endif
+  #ifndef __fastcall
+    #define __fastcall
+  #endif
+#endif
+#ifndef DL_IMPORT
+  #define DL_IMPORT(t) t
+#endif
+#ifndef DL_EXPORT
+  #define DL_EXPORT(t) t
+#endif
+#define __PYX_COMMA ,
+#ifndef HAVE_LONG_LONG
+  #if PY_VERSION_HEX >= 0x02070000
+    #define HAVE_LONG_LONG
+  #endif
+#endif
+#ifndef PY_LONG_LONG
+  #define PY_LONG_LONG LONG_LONG
+#endif
+#ifndef Py_HUGE_VAL
+  #define Py_HUGE_VAL HUGE_VAL
+#endif
+#ifdef PYPY_VERSION
+  #define CYTHON_COMPILING_IN_PYPY 1
+  #define CYTHON_COMPILING_IN_PYSTON 0
+  #define CYTHON_COMPILING_IN_CPYTHON 0
+  #define CYTHON_COMPILING_IN_NOGIL 0
+  #undef CYTHON_USE_TYPE_SLOTS
+  #define CYTHON_USE_TYPE_SLOTS 0
+  #undef CYTHON_USE_PYTYPE_LOOKUP
+  #define CYTHON_USE_PYTYPE_LOOKUP 0
+  #if PY_VERSION_HEX < 0x03050000
+    #undef CYTHON_USE_ASYNC_SLOTS
+    #define CYTHON_USE_ASYNC_SLOTS 0
+  #elif !defined(CYTHON_USE_ASYNC_SLOTS)
+    #define CYTHON_USE_ASYNC_SLOTS 1
+  #endif
+  #undef CYTHON_USE_PYLIST_INTERNALS
+  #define CYTHON_USE_PYLIST_INTERNALS 0
+  #undef CYTHON_USE_UNICODE_INTERNALS
+  #define CYTHON_USE_UNICODE_INTERNALS 0
+  #undef CYTHON_USE_UNICODE_WRITER
+  #define CYTHON_USE_UNICODE_WRITER 0
+  #undef CYTHON_USE_PYLONG_INTERNALS
+  #define CYTHON_USE_PYLONG_INTERNALS 0
+  #undef CYTHON_AVOID_BORROWED_REFS
+  #define CYTHON_AVOID_BORROWED_REFS 1
+  #undef CYTHON_ASSUME_SAFE_MACROS
+  #define CYTHON_ASSUME_SAFE_MACROS 0
+  #undef CYTHON_UNPACK_METHODS
+  #define CYTHON_UNPACK_METHODS 0
+  #undef CYTHON_FAST_THREAD_STATE
+  #define CYTHON_FAST_THREAD_STATE 0
+  #undef CYTHON_FAST_PYCALL
+  #define CYTHON_FAST_PYCALL 0
+  #if PY_VERSION_HEX < 0x03090000
+    #undef CYTHON_PEP489_MULTI_PHASE_INIT
+    #define CYTHON_PEP489_MULTI_PHASE_INIT 0
+  #elif !defined(CYTHON_PEP489_MULTI_PHASE_INIT)
+    #define CYTHON_PEP489_MULTI_PHASE_INIT 1
+  #endif
+  #undef CYTHON_USE_TP_FINALIZE
+  #define CYTHON_USE_TP_FINALIZE (PY_VERSION_HEX >= 0x030400a1 && PYPY_VERSION_NUM >= 0x07030C00)
+  #undef CYTHON_USE_DICT_VERSIONS
+  #define CYTHON_USE_DICT_VERSIONS 0
+  #undef CYTHON_USE_EXC_INFO_STACK
+  #define CYTHON_USE_EXC_INFO_STACK 0
+  #ifndef CYTHON_UPDATE_DESCRIPTOR_DOC
+    #define CYTHON_UPDATE_DESCRIPTOR_DOC 0
+  #endif
+#elif defined(PYSTON_VERSION)
+  #define CYTHON_COMPILING_IN_PYPY 0
+  #define CYTHON_COMPILING_IN_PYSTON 1
+  #define CYTHON_COMPILING_IN_CPYTHON 0
+  #define CYTHON_COMPILING_IN_NOGIL 0
+  #ifndef CYTHON_USE_TYPE_SLOTS
+    #define CYTHON_USE_TYPE_SLOTS 1
+  #endif
+  #undef CYTHON_USE_PYTYPE_LOOKUP
+  #define CYTHON_USE_PYTYPE_LOOKUP 0
+  #undef CYTHON_USE_ASYNC_SLOTS
+  #define CYTHON_USE_ASYNC_SLOTS 0
+  #undef CYTHON_USE_PYLIST_INTERNALS
+  #define CYTHON_USE_PYLIST_INTERNALS 0
+  #ifndef CYTHON_USE_UNICODE_INTERNALS
+    #define CYTHON_USE_UNICODE_INTERNALS 1
+  #endif
+  #undef CYTHON_USE_UNICODE_WRITER
+  #define CYTHON_USE_UNICODE_WRITER 0
+  #undef CYTHON_USE_PYLONG_INTERNALS
+  #define CYTHON_USE_PYLONG_INTERNALS 0
+  #ifndef CYTHON_AVOID_BORROWED_REFS
+    #define CYTHON_AVOID_BORROWED_REFS 0
+  #endif
+  #ifndef CYTHON_ASSUME_SAFE_MACROS
+    #define CYTHON_ASSUME_SAFE_MACROS 1
+  #endif
+  #ifndef CYTHON_UNPACK_METHODS
+    #define CYTHON_UNPACK_METHODS 1
+  #endif
+  #undef CYTHON_FAST_THREAD_STATE
+  #define CYTHON_FAST_THREAD_STATE 0
+  #undef CYTHON_FAST_PYCALL
+  #define CYTHON_FAST_PYCALL 0
+  #undef CYTHON_PEP489_MULTI_PHASE_INIT
+  #define CYTHON_PEP489_MULTI_PHASE_INIT 0
+  #undef CYTHON_USE_TP_FINALIZE
+  #define CYTHON_USE_TP_FINALIZE 0
+  #undef CYTHON_USE_DICT_VERSIONS
+  #define CYTHON_USE_DICT_VERSIONS 0
+  #undef CYTHON_USE_EXC_INFO_STACK
+  #define CYTHON_USE_EXC_INFO_STACK 0
+  #ifndef CYTHON_UPDATE_DESCRIPTOR_DOC
+    #define CYTHON_UPDATE_DESCRIPTOR_DOC 0
+  #endif
+#elif defined(PY_NOGIL)
+  #define CYTHON_COMPILING_IN_PYPY 0
+  #define CYTHON_COMPILING_IN_PYSTON 0
+  #define CYTHON_COMPILING_IN_CPYTHON 0
+  #define CYTHON_COMPILING_IN_NOGIL 1
+  #ifndef CYTHON_USE_TYPE_SLOTS
+    #define CYTHON_USE_TYPE_SLOTS 1
+  #endif
+  #undef CYTHON_USE_PYTYPE_LOOKUP
+  #define CYTHON_USE_PYTYPE_LOOKUP 0
+  #ifndef CYTHON_USE_ASYNC_SLOTS
+    #define CYTHON_USE_ASYNC_SLOTS 1
+  #endif
+  #undef CYTHON_USE_PYLIST_INTERNALS
+  #define CYTHON_USE_PYLIST_INTERNALS 0
+  #ifndef CYTHON_USE_UNICODE_INTERNALS
+    #define CYTHON_USE_UNICODE_INTERNALS 1
+  #endif
+  #undef CYTHON_USE_UNICODE_WRITER
+  #define CYTHON_USE_UNICODE_WRITER 0
+  #undef CYTHON_USE_PYLONG_INTERNALS
+  #define CYTHON_USE_PYLONG_INTERNALS 0
+  #ifndef CYTHON_AVOID_BORROWED_REFS
+    #define CYTHON_AVOID_BORROWED_REFS 0
+  #endif
+  #ifndef CYTHON_ASSUME_SAFE_MACROS
+    #define CYTHON_ASSUME_SAFE_MACROS 1
+  #endif
+  #ifndef CYTHON_UNPACK_METHODS
+    #define CYTHON_UNPACK_METHODS 1
+  #endif
+  #undef CYTHON_FAST_THREAD_STATE
+  #define CYTHON_FAST_THREAD_STATE 0
+  #undef CYTHON_FAST_PYCALL
+  #define CYTHON_FAST_PYCALL 0
+  #ifndef CYTHON_PEP489_MULTI_PHASE_INIT
+    #define CYTHON_PEP489_MULTI_PHASE_INIT 1
+  #endif
+  #ifndef CYTHON_USE_TP_FINALIZE
+    #define CYTHON_USE_TP_FINALIZE 1
+  #endif
+  #undef CYTHON_USE_DICT_VERSIONS
+  #define CYTHON_USE_DICT_VERSIONS 0
+  #undef CYTHON_USE_EXC_INFO_STACK
+  #define CYTHON_USE_EXC_INFO_STACK 0
+#else
+  #define CYTHON_COMPILING_IN_PYPY 0
+  #define CYTHON_COMPILING_IN_PYSTON 0
+  #define CYTHON_COMPILING_IN_CPYTHON 1
+  #define CYTHON_COMPILING_IN_NOGIL 0
+  #ifndef CYTHON_USE_TYPE_SLOTS
+    #define CYTHON_USE_TYPE_SLOTS 1
+  #endif
+  #if PY_VERSION_HEX < 0x02070000
+    #undef CYTHON_USE_PYTYPE_LOOKUP
+    #define CYTHON_USE_PYTYPE_LOOKUP 0
+  #elif !defined(CYTHON_USE_PYTYPE_LOOKUP)
+    #define CYTHON_USE_PYTYPE_LOOKUP 1
+  #endif
+  #if PY_MAJOR_VERSION < 3
+    #undef CYTHON_USE_ASYNC_SLOTS
+    #define CYTHON_USE_ASYNC_SLOTS 0
+  #elif !defined(CYTHON_USE_ASYNC_SLOTS)
+    #define CYTHON_USE_ASYNC_SLOTS 1
+  #endif
+  #if PY_VERSION_HEX < 0x02070000
+    #undef CYTHON_USE_PYLONG_INTERNALS
+    #define CYTHON_USE_PYLONG_INTERNALS 0
+  #elif !defined(CYTHON_USE_PYLONG_INTERNALS)
+    #define CYTHON_USE_PYLONG_INTERNALS (PY_VERSION_HEX < 0x030C00A5)
+  #endif
+  #ifndef CYTHON_USE_PYLIST_INTERNALS
+    #define CYTHON_USE_PYLIST_INTERNALS 1
+  #endif
+  #ifndef CYTHON_USE_UNICODE_INTERNALS
+    #define CYTHON_USE_UNICODE_INTERNALS 1
+  #endif
+  #if PY_VERSION_HEX < 0x030300F0 || PY_VERSION_HEX >= 0x030B00A2
+    #undef CYTHON_USE_UNICODE_WRITER
+    #define CYTHON_USE_UNICODE_WRITER 0
+  #elif !defined(CYTHON_USE_UNICODE_WRITER)
+    #define CYTHON_USE_UNICODE_WRITER 1
+  #endif
+  #ifndef CYTHON_AVOID_BORROWED_REFS
+    #define CYTHON_AVOID_BORROWED_REFS 0
+  #endif
+  #ifndef CYTHON_ASSUME_SAFE_MACROS
+    #define CYTHON_ASSUME_SAFE_MACROS 1
+  #endif
+  #ifndef CYTHON_UNPACK_METHODS
+    #define CYTHON_UNPACK_METHODS 1
+  #endif
+  #if PY_VERSION_HEX >= 0x030B00A4
+    #undef CYTHON_FAST_THREAD_STATE
+    #define CYTHON_FAST_THREAD_STATE 0
+  #elif !defined(CYTHON_FAST_THREAD_STATE)
+    #define CYTHON_FAST_THREAD_STATE 1
+  #endif
+  #ifndef CYTHON_FAST_PYCALL
+    #define CYTHON_FAST_PYCALL (PY_VERSION_HEX < 0x030A0000)
+  #endif
+  #ifndef CYTHON_PEP489_MULTI_PHASE_INIT
+    #define CYTHON_PEP489_MULTI_PHASE_INIT (PY_VERSION_HEX >= 0x03050000)
+  #endif
+  #ifndef CYTHON_USE_TP_FINALIZE
+    #define CYTHON_USE_TP_FINALIZE (PY_VERSION_HEX >= 0x030400a1)
+  #endif
+  #ifndef CYTHON_USE_DICT_VERSIONS
+    #define CYTHON_USE_DICT_VERSIONS ((PY_VERSION_HEX >= 0x030600B1) && (PY_VERSION_HEX < 0x030C00A5))
+  #endif
+  #if PY_VERSION_HEX >= 0x030B00A4
+    #undef CYTHON_USE_EXC_INFO_STACK
+    #define CYTHON_USE_EXC_INFO_STACK 0
+  #elif !defined(CYTHON_USE_EXC_INFO_STACK)
+    #define CYTHON_USE_EXC_INFO_STACK (PY_VERSION_HEX >= 0x030700A3)
+  #endif
+  #ifndef CYTHON_UPDATE_DESCRIPTOR_DOC
+    #define CYTHON_UPDATE_DESCRIPTOR_DOC 1
+  #endif
+#endif
+#if !defined(CYTHON_FAST_PYCCALL)
+#define CYTHON_FAST_PYCCALL  (CYTHON_FAST_PYCALL && PY_VERSION_HEX >= 0x030600B1)
+#endif
+#if CYTHON_USE_PYLONG_INTERNALS
+  #if PY_MAJOR_VERSION < 3
+    #include "longintrepr.h"
+  #endif
+  #undef SHIFT
+  #undef BASE
+  #undef MASK
+  #ifdef SIZEOF_VOID_P
+    enum { __pyx_check_sizeof_voidp = 1 / (int)(SIZEOF_VOID_P == sizeof(void*)) };
+  #endif
+#endif
+#ifndef __has_attribute
+  #define __has_attribute(x) 0
+#endif
+#ifndef __has_cpp_attribute
+  #define __has_cpp_attribute(x) 0
+#endif
+#ifndef CYTHON_RESTRICT
+  #if defined(__GNUC__)
+    #define CYTHON_RESTRICT __restrict__
+  #elif defined(_MSC_VER) && _MSC_VER >= 1400
+    #define CYTHON_RESTRICT __restrict
+  #elif defined (__STDC_VERSION__) && __STDC_VERSION__ >= 199901L
+    #define CYTHON_RESTRICT restrict
+  #else
+    #define CYTHON_RESTRICT
+  #endif
+#endif
+#ifndef CYTHON_UNUSED
+# if defined(__GNUC__)
+#   if !(defined(__cplusplus)) || (__GNUC__ > 3 || (__GNUC__ == 3 && __GNUC_MINOR__ >= 4))
+#     define CYTHON_UNUSED __attribute__ ((__unused__))
+#   else
+#     define CYTHON_UNUSED
+#   endif
+# elif defined(__ICC) || (defined(__INTEL_COMPILER) && !defined(_MSC_VER))
+#   define CYTHON_UNUSED __attribute__ ((__unused__))
+# else
+#   define CYTHON_UNUSED
+# endif
+#endif
+#ifndef CYTHON_MAYBE_UNUSED_VAR
+#  if defined(__cplusplus)
+     template<class T> void CYTHON_MAYBE_UNUSED_VAR( const T& ) { }
+#  else
+#    define CYTHON_MAYBE_UNUSED_VAR(x) (void)(x)
+#  endif
+#endif
+#ifndef CYTHON_NCP_UNUSED
+# if CYTHON_COMPILING_IN_CPYTHON
+#  define CYTHON_NCP_UNUSED
+# else
+#  define CYTHON_NCP_UNUSED CYTHON_UNUSED
+# endif
+#endif
+#define __Pyx_void_to_None(void_result) ((void)(void_result), Py_INCREF(Py_None), Py_None)
+#ifdef _MSC_VER
+    #ifndef _MSC_STDINT_H_
+        #if _MSC_VER < 1300
+           typedef unsigned char     uint8_t;
+           typedef unsigned int      uint32_t;
+        #else
+           typedef unsigned __int8   uint8_t;
+           typedef unsigned __int32  uint32_t;
+        #endif
+    #endif
+#else
+   #include <stdint.h>
+#endif
+#ifndef CYTHON_FALLTHROUGH
+  #if defined(__cplusplus) && __cplusplus >= 201103L
+    #if __has_cpp_attribute(fallthrough)
+      #define CYTHON_FALLTHROUGH [[fallthrough]]
+    #elif __has_cpp_attribute(clang::fallthrough)
+      #define CYTHON_FALLTHROUGH [[clang::fallthrough]]
+    #elif __has_cpp_attribute(gnu::fallthrough)
+      #define CYTHON_FALLTHROUGH [[gnu::fallthrough]]
+    #endif
+  #endif
+  #ifndef CYTHON_FALLTHROUGH
+    #if __has_attribute(fallthrough)
+      #define CYTHON_FALLTHROUGH __attribute__((fallthrough))
+    #else
+      #define CYTHON_FALLTHROUGH
+    #endif
+  #endif
+  #if defined(__clang__ ) && defined(__apple_build_version__)
+    #if __apple_build_version__ < 7000000
+      #undef  CYTHON_FALLTHROUGH
+      #define CYTHON_FALLTHROUGH
+    #endif
+  #endif
+#endif
+
+#ifndef CYTHON_INLINE
+  #if defined(__clang__)
+    #define CYTHON_INLINE __inline__ __attribute__ ((__unused__))
+  #elif defined(__GNUC__)
+    #define CYTHON_INLINE __inline__
+  #elif defined(_MSC_VER)
+    #define CYTHON_INLINE __inline
+  #elif defined (__STDC_VERSION__) && __STDC_VERSION__ >= 199901L
+    #define CYTHON_INLINE inline
+  #else
+    #define CYTHON_INLINE
+  #endif
+#endif
+
+#define __PYX_BUILD_PY_SSIZE_T "n"
+#define CYTHON_FORMAT_SSIZE_T "z"
+#if PY_MAJOR_VERSION < 3
+  #define __Pyx_BUILTIN_MODULE_NAME "__builtin__"
+  #define __Pyx_PyCode_New(a, k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)\
+          PyCode_New(a+k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)
+  #define __Pyx_DefaultClassType PyClass_Type
+#else
+  #define __Pyx_BUILTIN_MODULE_NAME "builtins"
+  #define __Pyx_DefaultClassType PyType_Type
+#if PY_VERSION_HEX >= 0x030B00A1
+    static CYTHON_INLINE PyCodeObject* __Pyx_PyCode_New(int a, int k, int l, int s, int f,
+                                                    PyObject *code, PyObject *c, PyObject* n, PyObject *v,
+                                                    PyObject *fv, PyObject *cell, PyObject* fn,
+                                                    PyObject *name, int fline, PyObject *lnos) {
+        PyObject *kwds=NULL, *argcount=NULL, *posonlyargcount=NULL, *kwonlyargcount=NULL;
+        PyObject *nlocals=NULL, *stacksize=NULL, *flags=NULL, *replace=NULL, *call_result=NULL, *empty=NULL;
+        const char *fn_cstr=NULL;
+        const char *name_cstr=NULL;
+        PyCodeObject* co=NULL;
+        PyObject *type, *value, *traceback;
+        PyErr_Fetch(&type, &value, &traceback);
+        if (!(kwds=PyDict_New())) goto end;
+        if (!(argcount=PyLong_FromLong(a))) goto end;
+        if (PyDict_SetItemString(kwds, "co_argcount", argcount) != 0) goto end;
+        if (!(posonlyargcount=PyLong_FromLong(0))) goto end;
+        if (PyDict_SetItemString(kwds, "co_posonlyargcount", posonlyargcount) != 0) goto end;
+        if (!(kwonlyargcount=PyLong_FromLong(k))) goto end;
+        if (PyDict_SetItemString(kwds, "co_kwonlyargcount", kwonlyargcount) != 0) goto end;
+        if (!(nlocals=PyLong_FromLong(l))) goto end;
+        if (PyDict_SetItemString(kwds, "co_nlocals", nlocals) != 0) goto end;
+        if (!(stacksize=PyLong_FromLong(s))) goto end;
+        if (PyDict_SetItemString(kwds, "co_stacksize", stacksize) != 0) goto end;
+        if (!(flags=PyLong_FromLong(f))) goto end;
+        if (PyDict_SetItemString(kwds, "co_flags", flags) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_code", code) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_consts", c) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_names", n) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_varnames", v) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_freevars", fv) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_cellvars", cell) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_linetable", lnos) != 0) goto end;
+        if (!(fn_cstr=PyUnicode_AsUTF8AndSize(fn, NULL))) goto end;
+        if (!(name_cstr=PyUnicode_AsUTF8AndSize(name, NULL))) goto end;
+        if (!(co = PyCode_NewEmpty(fn_cstr, name_cstr, fline))) goto end;
+        if (!(replace = PyObject_GetAttrString((PyObject*)co, "replace"))) goto cleanup_code_too;
+        if (!(empty = PyTuple_New(0))) goto cleanup_code_too; // unfortunately __pyx_empty_tuple isn't available here
+        if (!(call_result = PyObject_Call(replace, empty, kwds))) goto cleanup_code_too;
+        Py_XDECREF((PyObject*)co);
+        co = (PyCodeObject*)call_result;
+        call_result = NULL;
+        if (0) {
+            cleanup_code_too:
+            Py_XDECREF((PyObject*)co);
+            co = NULL;
+        }
+        end:
+        Py_XDECREF(kwds);
+        Py_XDECREF(argcount);
+        Py_XDECREF(posonlyargcount);
+        Py_XDECREF(kwonlyargcount);
+        Py_XDECREF(nlocals);
+        Py_XDECREF(stacksize);
+        Py_XDECREF(replace);
+        Py_XDECREF(call_result);
+        Py_XDECREF(empty);
+        if (type) {
+            PyErr_Restore(type, value, traceback);
+        }
+        return co;
+    }
+#else
+  #define __Pyx_PyCode_New(a, k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)\
+          PyCode_New(a, k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)
+#endif
+  #define __Pyx_DefaultClassType PyType_Type
+#endif
+#if PY_VERSION_HEX >= 0x030900F0 && !CYTHON_COMPILING_IN_PYPY
+  #define __Pyx_PyObject_GC_IsFinalized(o) PyObject_GC_IsFinalized(o)
+#else
+  #define __Pyx_PyObject_GC_IsFinalized(o) _PyGC_FINALIZED(o)
+#endif
+#ifndef Py_TPFLAGS_CHECKTYPES
+  #define Py_TPFLAGS_CHECKTYPES 0
+#endif
+#ifndef Py_TPFLAGS_HAVE_INDEX
+  #define Py_TPFLAGS_HAVE_INDEX 0
+#endif
+#ifndef Py_TPFLAGS_HAVE_NEWBUFFER
+  #define Py_TPFLAGS_HAVE_NEWBUFFER 0
+#endif
+#ifndef Py_TPFLAGS_HAVE_FINALIZE
+  #define Py_TPFLAGS_HAVE_FINALIZE 0
+#endif
+#ifndef METH_STACKLESS
+  #define METH_STACKLESS 0
+#endif
+#if PY_VERSION_HEX <= 0x030700A3 || !defined(METH_FASTCALL)
+  #ifndef METH_FASTCALL
+     #define METH_FASTCALL 0x80
+  #endif
+  typedef PyObject *(*__Pyx_PyCFunctionFast) (PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+  typedef PyObject *(*__Pyx_PyCFunctionFastWithKeywords) (PyObject *self, PyObject *const *args,
+                                                          Py_ssize_t nargs, PyObject *kwnames);
+#else
+  #define __Pyx_PyCFunctionFast _PyCFunctionFast
+  #define __Pyx_PyCFunctionFastWithKeywords _PyCFunctionFastWithKeywords
+#endif
+#if CYTHON_FAST_PYCCALL
+#define __Pyx_PyFastCFunction_Check(func)\
+    ((PyCFunction_Check(func) && (METH_FASTCALL == (PyCFunction_GET_FLAGS(func) & ~(METH_CLASS | METH_STATIC | METH_COEXIST | METH_KEYWORDS | METH_STACKLESS)))))
+#else
+#define __Pyx_PyFastCFunction_Check(func) 0
+#endif
+#if CYTHON_COMPILING_IN_PYPY && !defined(PyObject_Malloc)
+  #define PyObject_Malloc(s)   PyMem_Malloc(s)
+  #define PyObject_Free(p)     PyMem_Free(p)
+  #define PyObject_Realloc(p)  PyMem_Realloc(p)
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030400A1
+  #define PyMem_RawMalloc(n)           PyMem_Malloc(n)
+  #define PyMem_RawRealloc(p, n)       PyMem_Realloc(p, n)
+  #define PyMem_RawFree(p)             PyMem_Free(p)
+#endif
+#if CYTHON_COMPILING_IN_PYSTON
+  #define __Pyx_PyCode_HasFreeVars(co)  PyCode_HasFreeVars(co)
+  #define __Pyx_PyFrame_SetLineNumber(frame, lineno) PyFrame_SetLineNumber(frame, lineno)
+#else
+  #define __Pyx_PyCode_HasFreeVars(co)  (PyCode_GetNumFree(co) > 0)
+  #define __Pyx_PyFrame_SetLineNumber(frame, lineno)  (frame)->f_lineno = (lineno)
+#endif
+#if !CYTHON_FAST_THREAD_STATE || PY_VERSION_HEX < 0x02070000
+  #define __Pyx_PyThreadState_Current PyThreadState_GET()
+#elif PY_VERSION_HEX >= 0x03060000
+  #define __Pyx_PyThreadState_Current _PyThreadState_UncheckedGet()
+#elif PY_VERSION_HEX >= 0x03000000
+  #define __Pyx_PyThreadState_Current PyThreadState_GET()
+#else
+  #define __Pyx_PyThreadState_Current _PyThreadState_Current
+#endif
+#if PY_VERSION_HEX < 0x030700A2 && !defined(PyThread_tss_create) && !defined(Py_tss_NEEDS_INIT)
+#include "pythread.h"
+#define Py_tss_NEEDS_INIT 0
+typedef int Py_tss_t;
+static CYTHON_INLINE int PyThread_tss_create(Py_tss_t *key) {
+  *key = PyThread_create_key();
+  return 0;
+}
+static CYTHON_INLINE Py_tss_t * PyThread_tss_alloc(void) {
+  Py_tss_t *key = (Py_tss_t *)PyObject_Malloc(sizeof(Py_tss_t));
+  *key = Py_tss_NEEDS_INIT;
+  return key;
+}
+static CYTHON_INLINE void PyThread_tss_free(Py_tss_t *key) {
+  PyObject_Free(key);
+}
+static CYTHON_INLINE int PyThread_tss_is_created(Py_tss_t *key) {
+  return *key != Py_tss_NEEDS_INIT;
+}
+static CYTHON_INLINE void PyThread_tss_delete(Py_tss_t *key) {
+  PyThread_delete_key(*key);
+  *key = Py_tss_NEEDS_INIT;
+}
+static CYTHON_INLINE int PyThread_tss_set(Py_tss_t *key, void *value) {
+  return PyThread_set_key_value(*key, value);
+}
+static CYTHON_INLINE void * PyThread_tss_get(Py_tss_t *key) {
+  return PyThread_get_key_value(*key);
+}
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON || defined(_PyDict_NewPresized)
+#define __Pyx_PyDict_NewPresized(n)  ((n <= 8) ? PyDict_New() : _PyDict_NewPresized(n))
+#else
+#define __Pyx_PyDict_NewPresized(n)  PyDict_New()
+#endif
+#if PY_MAJOR_VERSION >= 3 || CYTHON_FUTURE_DIVISION
+  #define __Pyx_PyNumber_Divide(x,y)         PyNumber_TrueDivide(x,y)
+  #define __Pyx_PyNumber_InPlaceDivide(x,y)  PyNumber_InPlaceTrueDivide(x,y)
+#else
+  #define __Pyx_PyNumber_Divide(x,y)         PyNumber_Divide(x,y)
+  #define __Pyx_PyNumber_InPlaceDivide(x,y)  PyNumber_InPlaceDivide(x,y)
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030500A1 && CYTHON_USE_UNICODE_INTERNALS
+#define __Pyx_PyDict_GetItemStr(dict, name)  _PyDict_GetItem_KnownHash(dict, name, ((PyASCIIObject *) name)->hash)
+#else
+#define __Pyx_PyDict_GetItemStr(dict, name)  PyDict_GetItem(dict, name)
+#endif
+#if PY_VERSION_HEX > 0x03030000 && defined(PyUnicode_KIND)
+  #define CYTHON_PEP393_ENABLED 1
+  #if PY_VERSION_HEX >= 0x030C0000
+    #define __Pyx_PyUnicode_READY(op)       (0)
+  #else
+    #define __Pyx_PyUnicode_READY(op)       (likely(PyUnicode_IS_READY(op)) ?\
+                                                0 : _PyUnicode_Ready((PyObject *)(op)))
+  #endif
+  #define __Pyx_PyUnicode_GET_LENGTH(u)   PyUnicode_GET_LENGTH(u)
+  #define __Pyx_PyUnicode_READ_CHAR(u, i) PyUnicode_READ_CHAR(u, i)
+  #define __Pyx_PyUnicode_MAX_CHAR_VALUE(u)   PyUnicode_MAX_CHAR_VALUE(u)
+  #define __Pyx_PyUnicode_KIND(u)         PyUnicode_KIND(u)
+  #define __Pyx_PyUnicode_DATA(u)         PyUnicode_DATA(u)
+  #define __Pyx_PyUnicode_READ(k, d, i)   PyUnicode_READ(k, d, i)
+  #define __Pyx_PyUnicode_WRITE(k, d, i, ch)  PyUnicode_WRITE(k, d, i, ch)
+  #if PY_VERSION_HEX >= 0x030C0000
+    #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != PyUnicode_GET_LENGTH(u))
+  #else
+    #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x03090000
+    #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != (likely(PyUnicode_IS_READY(u)) ? PyUnicode_GET_LENGTH(u) : ((PyCompactUnicodeObject *)(u))->wstr_length))
+    #else
+    #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != (likely(PyUnicode_IS_READY(u)) ? PyUnicode_GET_LENGTH(u) : PyUnicode_GET_SIZE(u)))
+    #endif
+  #endif
+#else
+  #define CYTHON_PEP393_ENABLED 0
+  #define PyUnicode_1BYTE_KIND  1
+  #define PyUnicode_2BYTE_KIND  2
+  #define PyUnicode_4BYTE_KIND  4
+  #define __Pyx_PyUnicode_READY(op)       (0)
+  #define __Pyx_PyUnicode_GET_LENGTH(u)   PyUnicode_GET_SIZE(u)
+  #define __Pyx_PyUnicode_READ_CHAR(u, i) ((Py_UCS4)(PyUnicode_AS_UNICODE(u)[i]))
+  #define __Pyx_PyUnicode_MAX_CHAR_VALUE(u)   ((sizeof(Py_UNICODE) == 2) ? 65535 : 1114111)
+  #define __Pyx_PyUnicode_KIND(u)         (sizeof(Py_UNICODE))
+  #define __Pyx_PyUnicode_DATA(u)         ((void*)PyUnicode_AS_UNICODE(u))
+  #define __Pyx_PyUnicode_READ(k, d, i)   ((void)(k), (Py_UCS4)(((Py_UNICODE*)d)[i]))
+  #define __Pyx_PyUnicode_WRITE(k, d, i, ch)  (((void)(k)), ((Py_UNICODE*)d)[i] = ch)
+  #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != PyUnicode_GET_SIZE(u))
+#endif
+#if CYTHON_COMPILING_IN_PYPY
+  #define __Pyx_PyUnicode_Concat(a, b)      PyNumber_Add(a, b)
+  #define __Pyx_PyUnicode_ConcatSafe(a, b)  PyNumber_Add(a, b)
+#else
+  #define __Pyx_PyUnicode_Concat(a, b)      PyUnicode_Concat(a, b)
+  #define __Pyx_PyUnicode_ConcatSafe(a, b)  ((unlikely((a) == Py_None) || unlikely((b) == Py_None)) ?\
+      PyNumber_Add(a, b) : __Pyx_PyUnicode_Concat(a, b))
+#endif
+#if CYTHON_COMPILING_IN_PYPY && !defined(PyUnicode_Contains)
+  #define PyUnicode_Contains(u, s)  PySequence_Contains(u, s)
+#endif
+#if CYTHON_COMPILING_IN_PYPY && !defined(PyByteArray_Check)
+  #define PyByteArray_Check(obj)  PyObject_TypeCheck(obj, &PyByteArray_Type)
+#endif
+#if CYTHON_COMPILING_IN_PYPY && !defined(PyObject_Format)
+  #define PyObject_Format(obj, fmt)  PyObject_CallMethod(obj, "__format__", "O", fmt)
+#endif
+#define __Pyx_PyString_FormatSafe(a, b)   ((unlikely((a) == Py_None || (PyString_Check(b) && !PyString_CheckExact(b)))) ? PyNumber_Remainder(a, b) : __Pyx_PyString_Format(a, b))
+#define __Pyx_PyUnicode_FormatSafe(a, b)  ((unlikely((a) == Py_None || (PyUnicode_Check(b) && !PyUnicode_CheckExact(b)))) ? PyNumber_Remainder(a, b) : PyUnicode_Format(a, b))
+#if PY_MAJOR_VERSION >= 3
+  #define __Pyx_PyString_Format(a, b)  PyUnicode_Format(a, b)
+#else
+  #define __Pyx_PyString_Format(a, b)  PyString_Format(a, b)
+#endif
+#if PY_MAJOR_VERSION < 3 && !defined(PyObject_ASCII)
+  #define PyObject_ASCII(o)            PyObject_Repr(o)
+#endif
+#if PY_MAJOR_VERSION >= 3
+  #define PyBaseString_Type            PyUnicode_Type
+  #define PyStringObject               PyUnicodeObject
+  #define PyString_Type                PyUnicode_Type
+  #define PyString_Check               PyUnicode_Check
+  #define PyString_CheckExact          PyUnicode_CheckExact
+#ifndef PyObject_Unicode
+  #define PyObject_Unicode             PyObject_Str
+#endif
+#endif
+#if PY_MAJOR_VERSION >= 3
+  #define __Pyx_PyBaseString_Check(obj) PyUnicode_Check(obj)
+  #define __Pyx_PyBaseString_CheckExact(obj) PyUnicode_CheckExact(obj)
+#else
+  #define __Pyx_PyBaseString_Check(obj) (PyString_Check(obj) || PyUnicode_Check(obj))
+  #define __Pyx_PyBaseString_CheckExact(obj) (PyString_CheckExact(obj) || PyUnicode_CheckExact(obj))
+#endif
+#ifndef PySet_CheckExact
+  #define PySet_CheckExact(obj)        (Py_TYPE(obj) == &PySet_Type)
+#endif
+#if PY_VERSION_HEX >= 0x030900A4
+  #define __Pyx_SET_REFCNT(obj, refcnt) Py_SET_REFCNT(obj, refcnt)
+  #define __Pyx_SET_SIZE(obj, size) Py_SET_SIZE(obj, size)
+#else
+  #define __Pyx_SET_REFCNT(obj, refcnt) Py_REFCNT(obj) = (refcnt)
+  #define __Pyx_SET_SIZE(obj, size) Py_SIZE(obj) = (size)
+#endif
+#if CYTHON_ASSUME_SAFE_MACROS
+  #define __Pyx_PySequence_SIZE(seq)  Py_SIZE(seq)
+#else
+  #define __Pyx_PySequence_SIZE(seq)  PySequence_Size(seq)
+#endif
+#if PY_MAJOR_VERSION >= 3
+  #define PyIntObject                  PyLongObject
+  #define PyInt_Type                   PyLong_Type
+  #define PyInt_Check(op)              PyLong_Check(op)
+  #define PyInt_CheckExact(op)         PyLong_CheckExact(op)
+  #define PyInt_FromString             PyLong_FromString
+  #define PyInt_FromUnicode            PyLong_FromUnicode
+  #define PyInt_FromLong               PyLong_FromLong
+  #define PyInt_FromSize_t             PyLong_FromSize_t
+  #define PyInt_FromSsize_t            PyLong_FromSsize_t
+  #define PyInt_AsLong                 PyLong_AsLong
+  #define PyInt_AS_LONG                PyLong_AS_LONG
+  #define PyInt_AsSsize_t              PyLong_AsSsize_t
+  #define PyInt_AsUnsignedLongMask     PyLong_AsUnsignedLongMask
+  #define PyInt_AsUnsignedLongLongMask PyLong_AsUnsignedLongLongMask
+  #define PyNumber_Int                 PyNumber_Long
+#endif
+#if PY_MAJOR_VERSION >= 3
+  #define PyBoolObject                 PyLongObject
+#endif
+#if PY_MAJOR_VERSION >= 3 && CYTHON_COMPILING_IN_PYPY
+  #ifndef PyUnicode_InternFromString
+    #define PyUnicode_InternFromString(s) PyUnicode_FromString(s)
+  #endif
+#endif
+#if PY_VERSION_HEX < 0x030200A4
+  typedef long Py_hash_t;
+  #define __Pyx_PyInt_FromHash_t PyInt_FromLong
+  #define __Pyx_PyInt_AsHash_t   __Pyx_PyIndex_AsHash_t
+#else
+  #define __Pyx_PyInt_FromHash_t PyInt_FromSsize_t
+  #define __Pyx_PyInt_AsHash_t   __Pyx_PyIndex_AsSsize_t
+#endif
+#if PY_MAJOR_VERSION >= 3
+  #define __Pyx_PyMethod_New(func, self, klass) ((self) ? ((void)(klass), PyMethod_New(func, self)) : __Pyx_NewRef(func))
+#else
+  #define __Pyx_PyMethod_New(func, self, klass) PyMethod_New(func, self, klass)
+#endif
+#if CYTHON_USE_ASYNC_SLOTS
+  #if PY_VERSION_HEX >= 0x030500B1
+    #define __Pyx_PyAsyncMethodsStruct PyAsyncMethods
+    #define __Pyx_PyType_AsAsync(obj) (Py_TYPE(obj)->tp_as_async)
+  #else
+    #define __Pyx_PyType_AsAsync(obj) ((__Pyx_PyAsyncMethodsStruct*) (Py_TYPE(obj)->tp_reserved))
+  #endif
+#else
+  #define __Pyx_PyType_AsAsync(obj) NULL
+#endif
+#ifndef __Pyx_PyAsyncMethodsStruct
+    typedef struct {
+        unaryfunc am_await;
+        unaryfunc am_aiter;
+        unaryfunc am_anext;
+    } __Pyx_PyAsyncMethodsStruct;
+#endif
+
+#if defined(_WIN32) || defined(WIN32) || defined(MS_WINDOWS)
+  #if !defined(_USE_MATH_DEFINES)
+    #define _USE_MATH_DEFINES
+  #endif
+#endif
+#include <math.h>
+#ifdef NAN
+#define __PYX_NAN() ((float) NAN)
+#else
+static CYTHON_INLINE float __PYX_NAN() {
+  float value;
+  memset(&value, 0xFF, sizeof(value));
+  return value;
+}
+#endif
+#if defined(__CYGWIN__) && defined(_LDBL_EQ_DBL)
+#define __Pyx_truncl trunc
+#else
+#define __Pyx_truncl truncl
+#endif
+
+#define __PYX_MARK_ERR_POS(f_index, lineno) \
+    { __pyx_filename = __pyx_f[f_index]; (void)__pyx_filename; __pyx_lineno = lineno; (void)__pyx_lineno; __pyx_clineno = __LINE__; (void)__pyx_clineno; }
+#define __PYX_ERR(f_index, lineno, Ln_error) \
+    { __PYX_MARK_ERR_POS(f_index, lineno) goto Ln_error; }
+
+#ifndef __PYX_EXTERN_C
+  #ifdef __cplusplus
+    #define __PYX_EXTERN_C extern "C"
+  #else
+    #define __PYX_EXTERN_C extern
+  #endif
+#endif
+
+#define __PYX_HAVE__xpra__codecs__argb__argb
+#define __PYX_HAVE_API__xpra__codecs__argb__argb
+/* Early includes */
+#include "../../buffers/buffers.h"
+#include "string.h"
+#include "stdlib.h"
+#include <string.h>
+#include <stdio.h>
+#ifdef _OPENMP
+#include <omp.h>
+#endif /* _OPENMP */
+
+#if defined(PYREX_WITHOUT_ASSERTIONS) && !defined(CYTHON_WITHOUT_ASSERTIONS)
+#define CYTHON_WITHOUT_ASSERTIONS
+#endif
+
+typedef struct {PyObject **p; const char *s; const Py_ssize_t n; const char* encoding;
+                const char is_unicode; const char is_str; const char intern; } __Pyx_StringTabEntry;
+
+#define __PYX_DEFAULT_STRING_ENCODING_IS_ASCII 0
+#define __PYX_DEFAULT_STRING_ENCODING_IS_UTF8 0
+#define __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT (PY_MAJOR_VERSION >= 3 && __PYX_DEFAULT_STRING_ENCODING_IS_UTF8)
+#define __PYX_DEFAULT_STRING_ENCODING ""
+#define __Pyx_PyObject_FromString __Pyx_PyBytes_FromString
+#define __Pyx_PyObject_FromStringAndSize __Pyx_PyBytes_FromStringAndSize
+#define __Pyx_uchar_cast(c) ((unsigned char)c)
+#define __Pyx_long_cast(x) ((long)x)
+#define __Pyx_fits_Py_ssize_t(v, type, is_signed)  (\
+    (sizeof(type) < sizeof(Py_ssize_t))  ||\
+    (sizeof(type) > sizeof(Py_ssize_t) &&\
+          likely(v < (type)PY_SSIZE_T_MAX ||\
+                 v == (type)PY_SSIZE_T_MAX)  &&\
+          (!is_signed || likely(v > (type)PY_SSIZE_T_MIN ||\
+                                v == (type)PY_SSIZE_T_MIN)))  ||\
+    (sizeof(type) == sizeof(Py_ssize_t) &&\
+          (is_signed || likely(v < (type)PY_SSIZE_T_MAX ||\
+                               v == (type)PY_SSIZE_T_MAX)))  )
+static CYTHON_INLINE int __Pyx_is_valid_index(Py_ssize_t i, Py_ssize_t limit) {
+    return (size_t) i < (size_t) limit;
+}
+#if defined (__cplusplus) && __cplusplus >= 201103L
+    #include <cstdlib>
+    #define __Pyx_sst_abs(value) std::abs(value)
+#elif SIZEOF_INT >= SIZEOF_SIZE_T
+    #define __Pyx_sst_abs(value) abs(value)
+#elif SIZEOF_LONG >= SIZEOF_SIZE_T
+    #define __Pyx_sst_abs(value) labs(value)
+#elif defined (_MSC_VER)
+    #define __Pyx_sst_abs(value) ((Py_ssize_t)_abs64(value))
+#elif defined (__STDC_VERSION__) && __STDC_VERSION__ >= 199901L
+    #define __Pyx_sst_abs(value) llabs(value)
+#elif defined (__GNUC__)
+    #define __Pyx_sst_abs(value) __builtin_llabs(value)
+#else
+    #define __Pyx_sst_abs(value) ((value<0) ? -value : value)
+#endif
+static CYTHON_INLINE const char* __Pyx_PyObject_AsString(PyObject*);
+static CYTHON_INLINE const char* __Pyx_PyObject_AsStringAndSize(PyObject*, Py_ssize_t* length);
+#define __Pyx_PyByteArray_FromString(s) PyByteArray_FromStringAndSize((const char*)s, strlen((const char*)s))
+#define __Pyx_PyByteArray_FromStringAndSize(s, l) PyByteArray_FromStringAndSize((const char*)s, l)
+#define __Pyx_PyBytes_FromString        PyBytes_FromString
+#define __Pyx_PyBytes_FromStringAndSize PyBytes_FromStringAndSize
+static CYTHON_INLINE PyObject* __Pyx_PyUnicode_FromString(const char*);
+#if PY_MAJOR_VERSION < 3
+    #define __Pyx_PyStr_FromString        __Pyx_PyBytes_FromString
+    #define __Pyx_PyStr_FromStringAndSize __Pyx_PyBytes_FromStringAndSize
+#else
+    #define __Pyx_PyStr_FromString        __Pyx_PyUnicode_FromString
+    #define __Pyx_PyStr_FromStringAndSize __Pyx_PyUnicode_FromStringAndSize
+#endif
+#define __Pyx_PyBytes_AsWritableString(s)     ((char*) PyBytes_AS_STRING(s))
+#define __Pyx_PyBytes_AsWritableSString(s)    ((signed char*) PyBytes_AS_STRING(s))
+#define __Pyx_PyBytes_AsWritableUString(s)    ((unsigned char*) PyBytes_AS_STRING(s))
+#define __Pyx_PyBytes_AsString(s)     ((const char*) PyBytes_AS_STRING(s))
+#define __Pyx_PyBytes_AsSString(s)    ((const signed char*) PyBytes_AS_STRING(s))
+#define __Pyx_PyBytes_AsUString(s)    ((const unsigned char*) PyBytes_AS_STRING(s))
+#define __Pyx_PyObject_AsWritableString(s)    ((char*) __Pyx_PyObject_AsString(s))
+#define __Pyx_PyObject_AsWritableSString(s)    ((signed char*) __Pyx_PyObject_AsString(s))
+#define __Pyx_PyObject_AsWritableUString(s)    ((unsigned char*) __Pyx_PyObject_AsString(s))
+#define __Pyx_PyObject_AsSString(s)    ((const signed char*) __Pyx_PyObject_AsString(s))
+#define __Pyx_PyObject_AsUString(s)    ((const unsigned char*) __Pyx_PyObject_AsString(s))
+#define __Pyx_PyObject_FromCString(s)  __Pyx_PyObject_FromString((const char*)s)
+#define __Pyx_PyBytes_FromCString(s)   __Pyx_PyBytes_FromString((const char*)s)
+#define __Pyx_PyByteArray_FromCString(s)   __Pyx_PyByteArray_FromString((const char*)s)
+#define __Pyx_PyStr_FromCString(s)     __Pyx_PyStr_FromString((const char*)s)
+#define __Pyx_PyUnicode_FromCString(s) __Pyx_PyUnicode_FromString((const char*)s)
+static CYTHON_INLINE size_t __Pyx_Py_UNICODE_strlen(const Py_UNICODE *u) {
+    const Py_UNICODE *u_end = u;
+    while (*u_end++) ;
+    return (size_t)(u_end - u - 1);
+}
+#define __Pyx_PyUnicode_FromUnicode(u)       PyUnicode_FromUnicode(u, __Pyx_Py_UNICODE_strlen(u))
+#define __Pyx_PyUnicode_FromUnicodeAndLength PyUnicode_FromUnicode
+#define __Pyx_PyUnicode_AsUnicode            PyUnicode_AsUnicode
+#define __Pyx_NewRef(obj) (Py_INCREF(obj), obj)
+#define __Pyx_Owned_Py_None(b) __Pyx_NewRef(Py_None)
+static CYTHON_INLINE PyObject * __Pyx_PyBool_FromLong(long b);
+static CYTHON_INLINE int __Pyx_PyObject_IsTrue(PyObject*);
+static CYTHON_INLINE int __Pyx_PyObject_IsTrueAndDecref(PyObject*);
+static CYTHON_INLINE PyObject* __Pyx_PyNumber_IntOrLong(PyObject* x);
+#define __Pyx_PySequence_Tuple(obj)\
+    (likely(PyTuple_CheckExact(obj)) ? __Pyx_NewRef(obj) : PySequence_Tuple(obj))
+static CYTHON_INLINE Py_ssize_t __Pyx_PyIndex_AsSsize_t(PyObject*);
+static CYTHON_INLINE PyObject * __Pyx_PyInt_FromSize_t(size_t);
+static CYTHON_INLINE Py_hash_t __Pyx_PyIndex_AsHash_t(PyObject*);
+#if CYTHON_ASSUME_SAFE_MACROS
+#define __pyx_PyFloat_AsDouble(x) (PyFloat_CheckExact(x) ? PyFloat_AS_DOUBLE(x) : PyFloat_AsDouble(x))
+#else
+#define __pyx_PyFloat_AsDouble(x) PyFloat_AsDouble(x)
+#endif
+#define __pyx_PyFloat_AsFloat(x) ((float) __pyx_PyFloat_AsDouble(x))
+#if PY_MAJOR_VERSION >= 3
+#define __Pyx_PyNumber_Int(x) (PyLong_CheckExact(x) ? __Pyx_NewRef(x) : PyNumber_Long(x))
+#else
+#define __Pyx_PyNumber_Int(x) (PyInt_CheckExact(x) ? __Pyx_NewRef(x) : PyNumber_Int(x))
+#endif
+#define __Pyx_PyNumber_Float(x) (PyFloat_CheckExact(x) ? __Pyx_NewRef(x) : PyNumber_Float(x))
+#if PY_MAJOR_VERSION < 3 && __PYX_DEFAULT_STRING_ENCODING_IS_ASCII
+static int __Pyx_sys_getdefaultencoding_not_ascii;
+static int __Pyx_init_sys_getdefaultencoding_params(void) {
+    PyObject* sys;
+    PyObject* default_encoding = NULL;
+    PyObject* ascii_chars_u = NULL;
+    PyObject* ascii_chars_b = NULL;
+    const char* default_encoding_c;
+    sys = PyImport_ImportModule("sys");
+    if (!sys) goto bad;
+    default_encoding = PyObject_CallMethod(sys, (char*) "getdefaultencoding", NULL);
+    Py_DECREF(sys);
+    if (!default_encoding) goto bad;
+    default_encoding_c = PyBytes_AsString(default_encoding);
+    if (!default_encoding_c) goto bad;
+    if (strcmp(default_encoding_c, "ascii") == 0) {
+        __Pyx_sys_getdefaultencoding_not_ascii = 0;
+    } else {
+        char ascii_chars[128];
+        int c;
+        for (c = 0; c < 128; c++) {
+            ascii_chars[c] = c;
+        }
+        __Pyx_sys_getdefaultencoding_not_ascii = 1;
+        ascii_chars_u = PyUnicode_DecodeASCII(ascii_chars, 128, NULL);
+        if (!ascii_chars_u) goto bad;
+        ascii_chars_b = PyUnicode_AsEncodedString(ascii_chars_u, default_encoding_c, NULL);
+        if (!ascii_chars_b || !PyBytes_Check(ascii_chars_b) || memcmp(ascii_chars, PyBytes_AS_STRING(ascii_chars_b), 128) != 0) {
+            PyErr_Format(
+                PyExc_ValueError,
+                "This module compiled with c_string_encoding=ascii, but default encoding '%.200s' is not a superset of ascii.",
+                default_encoding_c);
+            goto bad;
+        }
+        Py_DECREF(ascii_chars_u);
+        Py_DECREF(ascii_chars_b);
+    }
+    Py_DECREF(default_encoding);
+    return 0;
+bad:
+    Py_XDECREF(default_encoding);
+    Py_XDECREF(ascii_chars_u);
+    Py_XDECREF(ascii_chars_b);
+    return -1;
+}
+#endif
+#if __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT && PY_MAJOR_VERSION >= 3
+#define __Pyx_PyUnicode_FromStringAndSize(c_str, size) PyUnicode_DecodeUTF8(c_str, size, NULL)
+#else
+#define __Pyx_PyUnicode_FromStringAndSize(c_str, size) PyUnicode_Decode(c_str, size, __PYX_DEFAULT_STRING_ENCODING, NULL)
+#if __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT
+static char* __PYX_DEFAULT_STRING_ENCODING;
+static int __Pyx_init_sys_getdefaultencoding_params(void) {
+    PyObject* sys;
+    PyObject* default_encoding = NULL;
+    char* default_encoding_c;
+    sys = PyImport_ImportModule("sys");
+    if (!sys) goto bad;
+    default_encoding = PyObject_CallMethod(sys, (char*) (const char*) "getdefaultencoding", NULL);
+    Py_DECREF(sys);
+    if (!default_encoding) goto bad;
+    default_encoding_c = PyBytes_AsString(default_encoding);
+    if (!default_encoding_c) goto bad;
+    __PYX_DEFAULT_STRING_ENCODING = (char*) malloc(strlen(default_encoding_c) + 1);
+    if (!__PYX_DEFAULT_STRING_ENCODING) goto bad;
+    strcpy(__PYX_DEFAULT_STRING_ENCODING, default_encoding_c);
+    Py_DECREF(default_encoding);
+    return 0;
+bad:
+    Py_XDECREF(default_encoding);
+    return -1;
+}
+#endif
+#endif
+
+
+/* Test for GCC > 2.95 */
+#if defined(__GNUC__)     && (__GNUC__ > 2 || (__GNUC__ == 2 && (__GNUC_MINOR__ > 95)))
+  #define likely(x)   __builtin_expect(!!(x), 1)
+  #define unlikely(x) __builtin_expect(!!(x), 0)
+#else /* !__GNUC__ or GCC < 2.95 */
+  #define likely(x)   (x)
+  #define unlikely(x) (x)
+#endif /* __GNUC__ */
+static CYTHON_INLINE void __Pyx_pretend_to_initialize(void* ptr) { (void)ptr; }
+
+static PyObject *__pyx_m = NULL;
+static PyObject *__pyx_d;
+static PyObject *__pyx_b;
+static PyObject *__pyx_cython_runtime = NULL;
+static PyObject *__pyx_empty_tuple;
+static PyObject *__pyx_empty_bytes;
+static PyObject *__pyx_empty_unicode;
+static int __pyx_lineno;
+static int __pyx_clineno = 0;
+static const char * __pyx_cfilenm= __FILE__;
+static const char *__pyx_filename;
+
+
+static const char *__pyx_f[] = {
+  "xpra/codecs/argb/argb.pyx",
+  "type.pxd",
+};
+/* NoFastGil.proto */
+#define __Pyx_PyGILState_Ensure PyGILState_Ensure
+#define __Pyx_PyGILState_Release PyGILState_Release
+#define __Pyx_FastGIL_Remember()
+#define __Pyx_FastGIL_Forget()
+#define __Pyx_FastGilFuncInit()
+
+/* ForceInitThreads.proto */
+#ifndef __PYX_FORCE_INIT_THREADS
+  #define __PYX_FORCE_INIT_THREADS 0
+#endif
+
+
+/*--- Type declarations ---*/
+
+/* --- Runtime support code (head) --- */
+/* Refnanny.proto */
+#ifndef CYTHON_REFNANNY
+  #define CYTHON_REFNANNY 0
+#endif
+#if CYTHON_REFNANNY
+  typedef struct {
+    void (*INCREF)(void*, PyObject*, int);
+    void (*DECREF)(void*, PyObject*, int);
+    void (*GOTREF)(void*, PyObject*, int);
+    void (*GIVEREF)(void*, PyObject*, int);
+    void* (*SetupContext)(const char*, int, const char*);
+    void (*FinishContext)(void**);
+  } __Pyx_RefNannyAPIStruct;
+  static __Pyx_RefNannyAPIStruct *__Pyx_RefNanny = NULL;
+  static __Pyx_RefNannyAPIStruct *__Pyx_RefNannyImportAPI(const char *modname);
+  #define __Pyx_RefNannyDeclarations void *__pyx_refnanny = NULL;
+#ifdef WITH_THREAD
+  #define __Pyx_RefNannySetupContext(name, acquire_gil)\
+          if (acquire_gil) {\
+              PyGILState_STATE __pyx_gilstate_save = PyGILState_Ensure();\
+              __pyx_refnanny = __Pyx_RefNanny->SetupContext((name), __LINE__, __FILE__);\
+              PyGILState_Release(__pyx_gilstate_save);\
+          } else {\
+              __pyx_refnanny = __Pyx_RefNanny->SetupContext((name), __LINE__, __FILE__);\
+          }
+#else
+  #define __Pyx_RefNannySetupContext(name, acquire_gil)\
+          __pyx_refnanny = __Pyx_RefNanny->SetupContext((name), __LINE__, __FILE__)
+#endif
+  #define __Pyx_RefNannyFinishContext()\
+          __Pyx_RefNanny->FinishContext(&__pyx_refnanny)
+  #define __Pyx_INCREF(r)  __Pyx_RefNanny->INCREF(__pyx_refnanny, (PyObject *)(r), __LINE__)
+  #define __Pyx_DECREF(r)  __Pyx_RefNanny->DECREF(__pyx_refnanny, (PyObject *)(r), __LINE__)
+  #define __Pyx_GOTREF(r)  __Pyx_RefNanny->GOTREF(__pyx_refnanny, (PyObject *)(r), __LINE__)
+  #define __Pyx_GIVEREF(r) __Pyx_RefNanny->GIVEREF(__pyx_refnanny, (PyObject *)(r), __LINE__)
+  #define __Pyx_XINCREF(r)  do { if((r) != NULL) {__Pyx_INCREF(r); }} while(0)
+  #define __Pyx_XDECREF(r)  do { if((r) != NULL) {__Pyx_DECREF(r); }} while(0)
+  #define __Pyx_XGOTREF(r)  do { if((r) != NULL) {__Pyx_GOTREF(r); }} while(0)
+  #define __Pyx_XGIVEREF(r) do { if((r) != NULL) {__Pyx_GIVEREF(r);}} while(0)
+#else
+  #define __Pyx_RefNannyDeclarations
+  #define __Pyx_RefNannySetupContext(name, acquire_gil)
+  #define __Pyx_RefNannyFinishContext()
+  #define __Pyx_INCREF(r) Py_INCREF(r)
+  #define __Pyx_DECREF(r) Py_DECREF(r)
+  #define __Pyx_GOTREF(r)
+  #define __Pyx_GIVEREF(r)
+  #define __Pyx_XINCREF(r) Py_XINCREF(r)
+  #define __Pyx_XDECREF(r) Py_XDECREF(r)
+  #define __Pyx_XGOTREF(r)
+  #define __Pyx_XGIVEREF(r)
+#endif
+#define __Pyx_XDECREF_SET(r, v) do {\
+        PyObject *tmp = (PyObject *) r;\
+        r = v; __Pyx_XDECREF(tmp);\
+    } while (0)
+#define __Pyx_DECREF_SET(r, v) do {\
+        PyObject *tmp = (PyObject *) r;\
+        r = v; __Pyx_DECREF(tmp);\
+    } while (0)
+#define __Pyx_CLEAR(r)    do { PyObject* tmp = ((PyObject*)(r)); r = NULL; __Pyx_DECREF(tmp);} while(0)
+#define __Pyx_XCLEAR(r)   do { if((r) != NULL) {PyObject* tmp = ((PyObject*)(r)); r = NULL; __Pyx_DECREF(tmp);}} while(0)
+
+/* PyObjectGetAttrStr.proto */
+#if CYTHON_USE_TYPE_SLOTS
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStr(PyObject* obj, PyObject* attr_name);
+#else
+#define __Pyx_PyObject_GetAttrStr(o,n) PyObject_GetAttr(o,n)
+#endif
+
+/* GetBuiltinName.proto */
+static PyObject *__Pyx_GetBuiltinName(PyObject *name);
+
+/* AssertionsEnabled.proto */
+#define __Pyx_init_assertions_enabled()
+#if CYTHON_COMPILING_IN_PYPY && PY_VERSION_HEX < 0x02070600 && !defined(Py_OptimizeFlag)
+  #define __pyx_assertions_enabled() (1)
+#elif PY_VERSION_HEX < 0x03080000  ||  CYTHON_COMPILING_IN_PYPY  ||  defined(Py_LIMITED_API)
+  #define __pyx_assertions_enabled() (!Py_OptimizeFlag)
+#elif CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030900A6
+  static int __pyx_assertions_enabled_flag;
+  #define __pyx_assertions_enabled() (__pyx_assertions_enabled_flag)
+  #undef __Pyx_init_assertions_enabled
+  static void __Pyx_init_assertions_enabled(void) {
+    __pyx_assertions_enabled_flag = ! _PyInterpreterState_GetConfig(__Pyx_PyThreadState_Current->interp)->optimization_level;
+  }
+#else
+  #define __pyx_assertions_enabled() (!Py_OptimizeFlag)
+#endif
+
+/* PyCFunctionFastCall.proto */
+#if CYTHON_FAST_PYCCALL
+static CYTHON_INLINE PyObject *__Pyx_PyCFunction_FastCall(PyObject *func, PyObject **args, Py_ssize_t nargs);
+#else
+#define __Pyx_PyCFunction_FastCall(func, args, nargs)  (assert(0), NULL)
+#endif
+
+/* PyFunctionFastCall.proto */
+#if CYTHON_FAST_PYCALL
+#define __Pyx_PyFunction_FastCall(func, args, nargs)\
+    __Pyx_PyFunction_FastCallDict((func), (args), (nargs), NULL)
+#if 1 || PY_VERSION_HEX < 0x030600B1
+static PyObject *__Pyx_PyFunction_FastCallDict(PyObject *func, PyObject **args, Py_ssize_t nargs, PyObject *kwargs);
+#else
+#define __Pyx_PyFunction_FastCallDict(func, args, nargs, kwargs) _PyFunction_FastCallDict(func, args, nargs, kwargs)
+#endif
+#define __Pyx_BUILD_ASSERT_EXPR(cond)\
+    (sizeof(char [1 - 2*!(cond)]) - 1)
+#ifndef Py_MEMBER_SIZE
+#define Py_MEMBER_SIZE(type, member) sizeof(((type *)0)->member)
+#endif
+#if CYTHON_FAST_PYCALL
+  static size_t __pyx_pyframe_localsplus_offset = 0;
+  #include "frameobject.h"
+#if PY_VERSION_HEX >= 0x030b00a6
+  #ifndef Py_BUILD_CORE
+    #define Py_BUILD_CORE 1
+  #endif
+  #include "internal/pycore_frame.h"
+#endif
+  #define __Pxy_PyFrame_Initialize_Offsets()\
+    ((void)__Pyx_BUILD_ASSERT_EXPR(sizeof(PyFrameObject) == offsetof(PyFrameObject, f_localsplus) + Py_MEMBER_SIZE(PyFrameObject, f_localsplus)),\
+     (void)(__pyx_pyframe_localsplus_offset = ((size_t)PyFrame_Type.tp_basicsize) - Py_MEMBER_SIZE(PyFrameObject, f_localsplus)))
+  #define __Pyx_PyFrame_GetLocalsplus(frame)\
+    (assert(__pyx_pyframe_localsplus_offset), (PyObject **)(((char *)(frame)) + __pyx_pyframe_localsplus_offset))
+#endif // CYTHON_FAST_PYCALL
+#endif
+
+/* PyObjectCall.proto */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_Call(PyObject *func, PyObject *arg, PyObject *kw);
+#else
+#define __Pyx_PyObject_Call(func, arg, kw) PyObject_Call(func, arg, kw)
+#endif
+
+/* PyObjectCallMethO.proto */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallMethO(PyObject *func, PyObject *arg);
+#endif
+
+/* PyObjectCallOneArg.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallOneArg(PyObject *func, PyObject *arg);
+
+/* SetItemIntByteArray.proto */
+#define __Pyx_SetItemInt_ByteArray(o, i, v, type, is_signed, to_py_func, is_list, wraparound, boundscheck)\
+    (__Pyx_fits_Py_ssize_t(i, type, is_signed) ?\
+    __Pyx_SetItemInt_ByteArray_Fast(o, (Py_ssize_t)i, v, wraparound, boundscheck) :\
+    (PyErr_SetString(PyExc_IndexError, "bytearray index out of range"), -1))
+static CYTHON_INLINE int __Pyx_SetItemInt_ByteArray_Fast(PyObject* string, Py_ssize_t i, unsigned char v,
+                                                         int wraparound, int boundscheck);
+
+/* RaiseArgTupleInvalid.proto */
+static void __Pyx_RaiseArgtupleInvalid(const char* func_name, int exact,
+    Py_ssize_t num_min, Py_ssize_t num_max, Py_ssize_t num_found);
+
+/* RaiseDoubleKeywords.proto */
+static void __Pyx_RaiseDoubleKeywordsError(const char* func_name, PyObject* kw_name);
+
+/* ParseKeywords.proto */
+static int __Pyx_ParseOptionalKeywords(PyObject *kwds, PyObject **argnames[],\
+    PyObject *kwds2, PyObject *values[], Py_ssize_t num_pos_args,\
+    const char* function_name);
+
+/* PyObjectCallNoArg.proto */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallNoArg(PyObject *func);
+#else
+#define __Pyx_PyObject_CallNoArg(func) __Pyx_PyObject_Call(func, __pyx_empty_tuple, NULL)
+#endif
+
+/* PyObjectCall2Args.proto */
+static CYTHON_UNUSED PyObject* __Pyx_PyObject_Call2Args(PyObject* function, PyObject* arg1, PyObject* arg2);
+
+/* SliceObject.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GetSlice(
+        PyObject* obj, Py_ssize_t cstart, Py_ssize_t cstop,
+        PyObject** py_start, PyObject** py_stop, PyObject** py_slice,
+        int has_cstart, int has_cstop, int wraparound);
+
+/* TypeImport.proto */
+#ifndef __PYX_HAVE_RT_ImportType_proto_0_29_37
+#define __PYX_HAVE_RT_ImportType_proto_0_29_37
+#if __STDC_VERSION__ >= 201112L
+#include <stdalign.h>
+#endif
+#if __STDC_VERSION__ >= 201112L || __cplusplus >= 201103L
+#define __PYX_GET_STRUCT_ALIGNMENT_0_29_37(s) alignof(s)
+#else
+#define __PYX_GET_STRUCT_ALIGNMENT_0_29_37(s) sizeof(void*)
+#endif
+enum __Pyx_ImportType_CheckSize_0_29_37 {
+   __Pyx_ImportType_CheckSize_Error_0_29_37 = 0,
+   __Pyx_ImportType_CheckSize_Warn_0_29_37 = 1,
+   __Pyx_ImportType_CheckSize_Ignore_0_29_37 = 2
+};
+static PyTypeObject *__Pyx_ImportType_0_29_37(PyObject* module, const char *module_name, const char *class_name, size_t size, size_t alignment, enum __Pyx_ImportType_CheckSize_0_29_37 check_size);
+#endif
+
+/* Import.proto */
+static PyObject *__Pyx_Import(PyObject *name, PyObject *from_list, int level);
+
+/* ImportFrom.proto */
+static PyObject* __Pyx_ImportFrom(PyObject* module, PyObject* name);
+
+/* PyDictVersioning.proto */
+#if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_TYPE_SLOTS
+#define __PYX_DICT_VERSION_INIT  ((PY_UINT64_T) -1)
+#define __PYX_GET_DICT_VERSION(dict)  (((PyDictObject*)(dict))->ma_version_tag)
+#define __PYX_UPDATE_DICT_CACHE(dict, value, cache_var, version_var)\
+    (version_var) = __PYX_GET_DICT_VERSION(dict);\
+    (cache_var) = (value);
+#define __PYX_PY_DICT_LOOKUP_IF_MODIFIED(VAR, DICT, LOOKUP) {\
+    static PY_UINT64_T __pyx_dict_version = 0;\
+    static PyObject *__pyx_dict_cached_value = NULL;\
+    if (likely(__PYX_GET_DICT_VERSION(DICT) == __pyx_dict_version)) {\
+        (VAR) = __pyx_dict_cached_value;\
+    } else {\
+        (VAR) = __pyx_dict_cached_value = (LOOKUP);\
+        __pyx_dict_version = __PYX_GET_DICT_VERSION(DICT);\
+    }\
+}
+static CYTHON_INLINE PY_UINT64_T __Pyx_get_tp_dict_version(PyObject *obj);
+static CYTHON_INLINE PY_UINT64_T __Pyx_get_object_dict_version(PyObject *obj);
+static CYTHON_INLINE int __Pyx_object_dict_version_matches(PyObject* obj, PY_UINT64_T tp_dict_version, PY_UINT64_T obj_dict_version);
+#else
+#define __PYX_GET_DICT_VERSION(dict)  (0)
+#define __PYX_UPDATE_DICT_CACHE(dict, value, cache_var, version_var)
+#define __PYX_PY_DICT_LOOKUP_IF_MODIFIED(VAR, DICT, LOOKUP)  (VAR) = (LOOKUP);
+#endif
+
+/* GetModuleGlobalName.proto */
+#if CYTHON_USE_DICT_VERSIONS
+#define __Pyx_GetModuleGlobalName(var, name)  do {\
+    static PY_UINT64_T __pyx_dict_version = 0;\
+    static PyObject *__pyx_dict_cached_value = NULL;\
+    (var) = (likely(__pyx_dict_version == __PYX_GET_DICT_VERSION(__pyx_d))) ?\
+        (likely(__pyx_dict_cached_value) ? __Pyx_NewRef(__pyx_dict_cached_value) : __Pyx_GetBuiltinName(name)) :\
+        __Pyx__GetModuleGlobalName(name, &__pyx_dict_version, &__pyx_dict_cached_value);\
+} while(0)
+#define __Pyx_GetModuleGlobalNameUncached(var, name)  do {\
+    PY_UINT64_T __pyx_dict_version;\
+    PyObject *__pyx_dict_cached_value;\
+    (var) = __Pyx__GetModuleGlobalName(name, &__pyx_dict_version, &__pyx_dict_cached_value);\
+} while(0)
+static PyObject *__Pyx__GetModuleGlobalName(PyObject *name, PY_UINT64_T *dict_version, PyObject **dict_cached_value);
+#else
+#define __Pyx_GetModuleGlobalName(var, name)  (var) = __Pyx__GetModuleGlobalName(name)
+#define __Pyx_GetModuleGlobalNameUncached(var, name)  (var) = __Pyx__GetModuleGlobalName(name)
+static CYTHON_INLINE PyObject *__Pyx__GetModuleGlobalName(PyObject *name);
+#endif
+
+/* PyThreadStateGet.proto */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_PyThreadState_declare  PyThreadState *__pyx_tstate;
+#define __Pyx_PyThreadState_assign  __pyx_tstate = __Pyx_PyThreadState_Current;
+#define __Pyx_PyErr_Occurred()  __pyx_tstate->curexc_type
+#else
+#define __Pyx_PyThreadState_declare
+#define __Pyx_PyThreadState_assign
+#define __Pyx_PyErr_Occurred()  PyErr_Occurred()
+#endif
+
+/* PyErrFetchRestore.proto */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_PyErr_Clear() __Pyx_ErrRestore(NULL, NULL, NULL)
+#define __Pyx_ErrRestoreWithState(type, value, tb)  __Pyx_ErrRestoreInState(PyThreadState_GET(), type, value, tb)
+#define __Pyx_ErrFetchWithState(type, value, tb)    __Pyx_ErrFetchInState(PyThreadState_GET(), type, value, tb)
+#define __Pyx_ErrRestore(type, value, tb)  __Pyx_ErrRestoreInState(__pyx_tstate, type, value, tb)
+#define __Pyx_ErrFetch(type, value, tb)    __Pyx_ErrFetchInState(__pyx_tstate, type, value, tb)
+static CYTHON_INLINE void __Pyx_ErrRestoreInState(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb);
+static CYTHON_INLINE void __Pyx_ErrFetchInState(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb);
+#if CYTHON_COMPILING_IN_CPYTHON
+#define __Pyx_PyErr_SetNone(exc) (Py_INCREF(exc), __Pyx_ErrRestore((exc), NULL, NULL))
+#else
+#define __Pyx_PyErr_SetNone(exc) PyErr_SetNone(exc)
+#endif
+#else
+#define __Pyx_PyErr_Clear() PyErr_Clear()
+#define __Pyx_PyErr_SetNone(exc) PyErr_SetNone(exc)
+#define __Pyx_ErrRestoreWithState(type, value, tb)  PyErr_Restore(type, value, tb)
+#define __Pyx_ErrFetchWithState(type, value, tb)  PyErr_Fetch(type, value, tb)
+#define __Pyx_ErrRestoreInState(tstate, type, value, tb)  PyErr_Restore(type, value, tb)
+#define __Pyx_ErrFetchInState(tstate, type, value, tb)  PyErr_Fetch(type, value, tb)
+#define __Pyx_ErrRestore(type, value, tb)  PyErr_Restore(type, value, tb)
+#define __Pyx_ErrFetch(type, value, tb)  PyErr_Fetch(type, value, tb)
+#endif
+
+/* CLineInTraceback.proto */
+#ifdef CYTHON_CLINE_IN_TRACEBACK
+#define __Pyx_CLineForTraceback(tstate, c_line)  (((CYTHON_CLINE_IN_TRACEBACK)) ? c_line : 0)
+#else
+static int __Pyx_CLineForTraceback(PyThreadState *tstate, int c_line);
+#endif
+
+/* CodeObjectCache.proto */
+typedef struct {
+    PyCodeObject* code_object;
+    int code_line;
+} __Pyx_CodeObjectCacheEntry;
+struct __Pyx_CodeObjectCache {
+    int count;
+    int max_count;
+    __Pyx_CodeObjectCacheEntry* entries;
+};
+static struct __Pyx_CodeObjectCache __pyx_code_cache = {0,0,NULL};
+static int __pyx_bisect_code_objects(__Pyx_CodeObjectCacheEntry* entries, int count, int code_line);
+static PyCodeObject *__pyx_find_code_object(int code_line);
+static void __pyx_insert_code_object(int code_line, PyCodeObject* code_object);
+
+/* AddTraceback.proto */
+static void __Pyx_AddTraceback(const char *funcname, int c_line,
+                               int py_line, const char *filename);
+
+/* GCCDiagnostics.proto */
+#if defined(__GNUC__) && (__GNUC__ > 4 || (__GNUC__ == 4 && __GNUC_MINOR__ >= 6))
+#define __Pyx_HAS_GCC_DIAGNOSTIC
+#endif
+
+/* CIntFromPy.proto */
+static CYTHON_INLINE unsigned char __Pyx_PyInt_As_unsigned_char(PyObject *);
+
+/* CIntFromPy.proto */
+static CYTHON_INLINE unsigned int __Pyx_PyInt_As_unsigned_int(PyObject *);
+
+/* CIntToPy.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_int(int value);
+
+/* CIntToPy.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_long(long value);
+
+/* CIntToPy.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_unsigned_int(unsigned int value);
+
+/* CIntFromPy.proto */
+static CYTHON_INLINE int __Pyx_PyInt_As_int(PyObject *);
+
+/* CIntFromPy.proto */
+static CYTHON_INLINE long __Pyx_PyInt_As_long(PyObject *);
+
+/* FastTypeChecks.proto */
+#if CYTHON_COMPILING_IN_CPYTHON
+#define __Pyx_TypeCheck(obj, type) __Pyx_IsSubtype(Py_TYPE(obj), (PyTypeObject *)type)
+static CYTHON_INLINE int __Pyx_IsSubtype(PyTypeObject *a, PyTypeObject *b);
+static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches(PyObject *err, PyObject *type);
+static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches2(PyObject *err, PyObject *type1, PyObject *type2);
+#else
+#define __Pyx_TypeCheck(obj, type) PyObject_TypeCheck(obj, (PyTypeObject *)type)
+#define __Pyx_PyErr_GivenExceptionMatches(err, type) PyErr_GivenExceptionMatches(err, type)
+#define __Pyx_PyErr_GivenExceptionMatches2(err, type1, type2) (PyErr_GivenExceptionMatches(err, type1) || PyErr_GivenExceptionMatches(err, type2))
+#endif
+#define __Pyx_PyException_Check(obj) __Pyx_TypeCheck(obj, PyExc_Exception)
+
+/* CheckBinaryVersion.proto */
+static int __Pyx_check_binary_version(void);
+
+/* FunctionExport.proto */
+static int __Pyx_ExportFunction(const char *name, void (*f)(void), const char *sig);
+
+/* InitStrings.proto */
+static int __Pyx_InitStrings(__Pyx_StringTabEntry *t);
+
+
+/* Module declarations from 'libc.string' */
+
+/* Module declarations from 'libc.stdio' */
+
+/* Module declarations from '__builtin__' */
+
+/* Module declarations from 'cpython.type' */
+static PyTypeObject *__pyx_ptype_7cpython_4type_type = 0;
+
+/* Module declarations from 'cpython' */
+
+/* Module declarations from 'cpython.object' */
+
+/* Module declarations from 'cpython.bytes' */
+
+/* Module declarations from 'xpra.codecs.argb.argb' */
+static unsigned char __pyx_v_4xpra_6codecs_4argb_4argb_B;
+static unsigned char __pyx_v_4xpra_6codecs_4argb_4argb_G;
+static unsigned char __pyx_v_4xpra_6codecs_4argb_4argb_R;
+static unsigned char __pyx_v_4xpra_6codecs_4argb_4argb_A;
+static PyObject *__pyx_f_4xpra_6codecs_4argb_4argb_argbdata_to_rgba(unsigned char const *, int const ); /*proto*/
+static PyObject *__pyx_f_4xpra_6codecs_4argb_4argb_argbdata_to_rgb(unsigned char const *, int const ); /*proto*/
+static PyObject *__pyx_f_4xpra_6codecs_4argb_4argb_bgradata_to_rgb(unsigned char const *, int const ); /*proto*/
+static PyObject *__pyx_f_4xpra_6codecs_4argb_4argb_bgradata_to_rgba(unsigned char const *, int const ); /*proto*/
+static CYTHON_INLINE unsigned char __pyx_f_4xpra_6codecs_4argb_4argb_clamp(int); /*proto*/
+static PyObject *__pyx_f_4xpra_6codecs_4argb_4argb_r210data_to_rgba(unsigned int const *, int const ); /*proto*/
+static PyObject *__pyx_f_4xpra_6codecs_4argb_4argb_r210data_to_rgb(unsigned int const *, int const ); /*proto*/
+static PyObject *__pyx_f_4xpra_6codecs_4argb_4argb_do_premultiply_argb_in_place(unsigned int *, Py_ssize_t); /*proto*/
+static PyObject *__pyx_f_4xpra_6codecs_4argb_4argb_do_unpremultiply_argb_in_place(unsigned int *, Py_ssize_t); /*proto*/
+static PyObject *__pyx_f_4xpra_6codecs_4argb_4argb_do_unpremultiply_argb(unsigned int *, Py_ssize_t); /*proto*/
+#define __Pyx_MODULE_NAME "xpra.codecs.argb.argb"
+extern int __pyx_module_is_main_xpra__codecs__argb__argb;
+int __pyx_module_is_main_xpra__codecs__argb__argb = 0;
+
+/* Implementation of 'xpra.codecs.argb.argb' */
+static PyObject *__pyx_builtin_range;
+static const char __pyx_k_A[] = "A";
+static const char __pyx_k_L[] = "=L";
+static const char __pyx_k_X[] = "X";
+static const char __pyx_k_d[] = "d";
+static const char __pyx_k_s[] = "s";
+static const char __pyx_k_v[] = "v";
+static const char __pyx_k_x[] = "x";
+static const char __pyx_k_y[] = "y";
+static const char __pyx_k_i0[] = "i0";
+static const char __pyx_k_i1[] = "i1";
+static const char __pyx_k_i2[] = "i2";
+static const char __pyx_k__22[] = "\000";
+static const char __pyx_k__24[] = "\001";
+static const char __pyx_k__26[] = "\002";
+static const char __pyx_k__28[] = "\003";
+static const char __pyx_k_bpp[] = "bpp";
+static const char __pyx_k_buf[] = "buf";
+static const char __pyx_k_dst[] = "dst";
+static const char __pyx_k_log[] = "log";
+static const char __pyx_k_out[] = "out";
+static const char __pyx_k_src[] = "src";
+static const char __pyx_k_tmp[] = "tmp";
+static const char __pyx_k_argb[] = "argb";
+static const char __pyx_k_cbuf[] = "cbuf";
+static const char __pyx_k_find[] = "find";
+static const char __pyx_k_main[] = "__main__";
+static const char __pyx_k_mask[] = "mask";
+static const char __pyx_k_name[] = "__name__";
+static const char __pyx_k_pack[] = "pack";
+static const char __pyx_k_test[] = "__test__";
+static const char __pyx_k_index[] = "index";
+static const char __pyx_k_range[] = "range";
+static const char __pyx_k_rgb24[] = "rgb24";
+static const char __pyx_k_upper[] = "upper";
+static const char __pyx_k_width[] = "width";
+static const char __pyx_k_Logger[] = "Logger";
+static const char __pyx_k_height[] = "height";
+static const char __pyx_k_import[] = "__import__";
+static const char __pyx_k_struct[] = "struct";
+static const char __pyx_k_src_len[] = "src_len";
+static const char __pyx_k_argb_len[] = "argb_len";
+static const char __pyx_k_bgra_buf[] = "bgra_buf";
+static const char __pyx_k_cbuf_len[] = "cbuf_len";
+static const char __pyx_k_encoding[] = "encoding";
+static const char __pyx_k_xpra_log[] = "xpra.log";
+static const char __pyx_k_bgra_buf2[] = "bgra_buf2";
+static const char __pyx_k_rowstride[] = "rowstride";
+static const char __pyx_k_mask_bytes[] = "mask_bytes";
+static const char __pyx_k_out_stride[] = "out_stride";
+static const char __pyx_k_pack_rgb32[] = "pack_rgb32";
+static const char __pyx_k_rgb_format[] = "rgb_format";
+static const char __pyx_k_alpha_index[] = "alpha_index";
+static const char __pyx_k_argb_to_rgb[] = "argb_to_rgb";
+static const char __pyx_k_bgra_to_rgb[] = "bgra_to_rgb";
+static const char __pyx_k_r210_to_rgb[] = "r210_to_rgb";
+static const char __pyx_k_argb_to_rgba[] = "argb_to_rgba";
+static const char __pyx_k_bgra_buf_len[] = "bgra_buf_len";
+static const char __pyx_k_bgra_to_rgba[] = "bgra_to_rgba";
+static const char __pyx_k_r210_to_rgba[] = "r210_to_rgba";
+static const char __pyx_k_bgra_buf_len2[] = "bgra_buf_len2";
+static const char __pyx_k_buffer_api_version[] = "buffer_api_version";
+static const char __pyx_k_cline_in_traceback[] = "cline_in_traceback";
+static const char __pyx_k_unpremultiply_argb[] = "unpremultiply_argb";
+static const char __pyx_k_xpra_codecs_argb_argb[] = "xpra.codecs.argb.argb";
+static const char __pyx_k_invalid_dimensions_ix_i[] = "invalid dimensions: %ix%i";
+static const char __pyx_k_premultiply_argb_in_place[] = "premultiply_argb_in_place";
+static const char __pyx_k_xpra_codecs_argb_argb_pyx[] = "xpra/codecs/argb/argb.pyx";
+static const char __pyx_k_unpremultiply_argb_in_place[] = "unpremultiply_argb_in_place";
+static const char __pyx_k_invalid_rgb32_pixel_format_s[] = "invalid rgb32 pixel format: %s";
+static const char __pyx_k_buffer_is_too_small_i_bytes_for[] = "buffer is too small: %i bytes for %ix%i with rowstride=%i";
+static const char __pyx_k_invalid_rowstride_i_for_width_i[] = "invalid rowstride %i for width %i";
+static const char __pyx_k_cannot_convert_s_to_a_readable_b[] = "cannot convert %s to a readable buffer";
+static const char __pyx_k_cannot_convert_s_to_a_writable_b[] = "cannot convert %s to a writable buffer";
+static const char __pyx_k_invalid_buffer_size_s_is_not_a_m[] = "invalid buffer size: %s is not a multiple of 4";
+static const char __pyx_k_no_alpha_or_padding_channel_to_d[] = "no alpha or padding channel to drop from %s";
+static PyObject *__pyx_n_s_A;
+static PyObject *__pyx_kp_s_L;
+static PyObject *__pyx_n_s_Logger;
+static PyObject *__pyx_n_s_X;
+static PyObject *__pyx_kp_b__22;
+static PyObject *__pyx_kp_b__24;
+static PyObject *__pyx_kp_b__26;
+static PyObject *__pyx_kp_b__28;
+static PyObject *__pyx_n_s_alpha_index;
+static PyObject *__pyx_n_s_argb;
+static PyObject *__pyx_n_s_argb_len;
+static PyObject *__pyx_n_s_argb_to_rgb;
+static PyObject *__pyx_n_s_argb_to_rgba;
+static PyObject *__pyx_n_s_bgra_buf;
+static PyObject *__pyx_n_s_bgra_buf2;
+static PyObject *__pyx_n_s_bgra_buf_len;
+static PyObject *__pyx_n_s_bgra_buf_len2;
+static PyObject *__pyx_n_s_bgra_to_rgb;
+static PyObject *__pyx_n_s_bgra_to_rgba;
+static PyObject *__pyx_n_s_bpp;
+static PyObject *__pyx_n_s_buf;
+static PyObject *__pyx_n_s_buffer_api_version;
+static PyObject *__pyx_kp_s_buffer_is_too_small_i_bytes_for;
+static PyObject *__pyx_kp_s_cannot_convert_s_to_a_readable_b;
+static PyObject *__pyx_kp_s_cannot_convert_s_to_a_writable_b;
+static PyObject *__pyx_n_s_cbuf;
+static PyObject *__pyx_n_s_cbuf_len;
+static PyObject *__pyx_n_s_cline_in_traceback;
+static PyObject *__pyx_n_s_d;
+static PyObject *__pyx_n_s_dst;
+static PyObject *__pyx_n_s_encoding;
+static PyObject *__pyx_n_s_find;
+static PyObject *__pyx_n_s_height;
+static PyObject *__pyx_n_s_i0;
+static PyObject *__pyx_n_s_i1;
+static PyObject *__pyx_n_s_i2;
+static PyObject *__pyx_n_s_import;
+static PyObject *__pyx_n_s_index;
+static PyObject *__pyx_kp_s_invalid_buffer_size_s_is_not_a_m;
+static PyObject *__pyx_kp_s_invalid_dimensions_ix_i;
+static PyObject *__pyx_kp_s_invalid_rgb32_pixel_format_s;
+static PyObject *__pyx_kp_s_invalid_rowstride_i_for_width_i;
+static PyObject *__pyx_n_s_log;
+static PyObject *__pyx_n_s_main;
+static PyObject *__pyx_n_s_mask;
+static PyObject *__pyx_n_s_mask_bytes;
+static PyObject *__pyx_n_s_name;
+static PyObject *__pyx_kp_s_no_alpha_or_padding_channel_to_d;
+static PyObject *__pyx_n_s_out;
+static PyObject *__pyx_n_s_out_stride;
+static PyObject *__pyx_n_s_pack;
+static PyObject *__pyx_n_s_pack_rgb32;
+static PyObject *__pyx_n_s_premultiply_argb_in_place;
+static PyObject *__pyx_n_s_r210_to_rgb;
+static PyObject *__pyx_n_s_r210_to_rgba;
+static PyObject *__pyx_n_s_range;
+static PyObject *__pyx_n_s_rgb24;
+static PyObject *__pyx_n_s_rgb_format;
+static PyObject *__pyx_n_s_rowstride;
+static PyObject *__pyx_n_s_s;
+static PyObject *__pyx_n_s_src;
+static PyObject *__pyx_n_s_src_len;
+static PyObject *__pyx_n_s_struct;
+static PyObject *__pyx_n_s_test;
+static PyObject *__pyx_n_s_tmp;
+static PyObject *__pyx_n_s_unpremultiply_argb;
+static PyObject *__pyx_n_s_unpremultiply_argb_in_place;
+static PyObject *__pyx_n_s_upper;
+static PyObject *__pyx_n_s_v;
+static PyObject *__pyx_n_s_width;
+static PyObject *__pyx_n_s_x;
+static PyObject *__pyx_n_s_xpra_codecs_argb_argb;
+static PyObject *__pyx_kp_s_xpra_codecs_argb_argb_pyx;
+static PyObject *__pyx_n_s_xpra_log;
+static PyObject *__pyx_n_s_y;
+static PyObject *__pyx_pf_4xpra_6codecs_4argb_4argb_buffer_api_version(CYTHON_UNUSED PyObject *__pyx_self); /* proto */
+static PyObject *__pyx_pf_4xpra_6codecs_4argb_4argb_2r210_to_rgba(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_buf); /* proto */
+static PyObject *__pyx_pf_4xpra_6codecs_4argb_4argb_4r210_to_rgb(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_buf); /* proto */
+static PyObject *__pyx_pf_4xpra_6codecs_4argb_4argb_6argb_to_rgba(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_buf); /* proto */
+static PyObject *__pyx_pf_4xpra_6codecs_4argb_4argb_8argb_to_rgb(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_buf); /* proto */
+static PyObject *__pyx_pf_4xpra_6codecs_4argb_4argb_10bgra_to_rgb(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_buf); /* proto */
+static PyObject *__pyx_pf_4xpra_6codecs_4argb_4argb_12bgra_to_rgba(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_buf); /* proto */
+static PyObject *__pyx_pf_4xpra_6codecs_4argb_4argb_14premultiply_argb_in_place(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_buf); /* proto */
+static PyObject *__pyx_pf_4xpra_6codecs_4argb_4argb_16unpremultiply_argb_in_place(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_buf); /* proto */
+static PyObject *__pyx_pf_4xpra_6codecs_4argb_4argb_18unpremultiply_argb(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_buf); /* proto */
+static PyObject *__pyx_pf_4xpra_6codecs_4argb_4argb_20pack_rgb32(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_buf, unsigned int __pyx_v_width, unsigned int __pyx_v_height, unsigned int __pyx_v_rowstride, PyObject *__pyx_v_rgb_format, PyObject *__pyx_v_rgb24); /* proto */
+static PyObject *__pyx_int_50462976;
+static PyObject *__pyx_tuple_;
+static PyObject *__pyx_tuple__3;
+static PyObject *__pyx_tuple__5;
+static PyObject *__pyx_tuple__7;
+static PyObject *__pyx_tuple__9;
+static PyObject *__pyx_tuple__11;
+static PyObject *__pyx_tuple__13;
+static PyObject *__pyx_tuple__15;
+static PyObject *__pyx_tuple__17;
+static PyObject *__pyx_tuple__19;
+static PyObject *__pyx_tuple__21;
+static PyObject *__pyx_tuple__23;
+static PyObject *__pyx_tuple__25;
+static PyObject *__pyx_tuple__27;
+static PyObject *__pyx_tuple__29;
+static PyObject *__pyx_tuple__30;
+static PyObject *__pyx_codeobj__2;
+static PyObject *__pyx_codeobj__4;
+static PyObject *__pyx_codeobj__6;
+static PyObject *__pyx_codeobj__8;
+static PyObject *__pyx_codeobj__10;
+static PyObject *__pyx_codeobj__12;
+static PyObject *__pyx_codeobj__14;
+static PyObject *__pyx_codeobj__16;
+static PyObject *__pyx_codeobj__18;
+static PyObject *__pyx_codeobj__20;
+static PyObject *__pyx_codeobj__31;
+/* Late includes */
+
+/* "xpra/codecs/argb/argb.pyx":29
+ * 
+ * 
+ * def buffer_api_version():             # <<<<<<<<<<<<<<
+ *     return get_buffer_api_version()
+ * 
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_4xpra_6codecs_4argb_4argb_1buffer_api_version(PyObject *__pyx_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static PyMethodDef __pyx_mdef_4xpra_6codecs_4argb_4argb_1buffer_api_version = {"buffer_api_version", (PyCFunction)__pyx_pw_4xpra_6codecs_4argb_4argb_1buffer_api_version, METH_NOARGS, 0};
+static PyObject *__pyx_pw_4xpra_6codecs_4argb_4argb_1buffer_api_version(PyObject *__pyx_self, CYTHON_UNUSED PyObject *unused) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("buffer_api_version (wrapper)", 0);
+  __pyx_r = __pyx_pf_4xpra_6codecs_4argb_4argb_buffer_api_version(__pyx_self);
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_4xpra_6codecs_4argb_4argb_buffer_api_version(CYTHON_UNUSED PyObject *__pyx_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("buffer_api_version", 0);
+
+  /* "xpra/codecs/argb/argb.pyx":30
+ * 
+ * def buffer_api_version():
+ *     return get_buffer_api_version()             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline unsigned char clamp(int v):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __Pyx_PyInt_From_int(get_buffer_api_version()); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 30, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* "xpra/codecs/argb/argb.pyx":29
+ * 
+ * 
+ * def buffer_api_version():             # <<<<<<<<<<<<<<
+ *     return get_buffer_api_version()
+ * 
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("xpra.codecs.argb.argb.buffer_api_version", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "xpra/codecs/argb/argb.pyx":32
+ *     return get_buffer_api_version()
+ * 
+ * cdef inline unsigned char clamp(int v):             # <<<<<<<<<<<<<<
+ *     if v>255:
+ *         return 255
+ */
+
+static CYTHON_INLINE unsigned char __pyx_f_4xpra_6codecs_4argb_4argb_clamp(int __pyx_v_v) {
+  unsigned char __pyx_r;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  __Pyx_RefNannySetupContext("clamp", 0);
+
+  /* "xpra/codecs/argb/argb.pyx":33
+ * 
+ * cdef inline unsigned char clamp(int v):
+ *     if v>255:             # <<<<<<<<<<<<<<
+ *         return 255
+ *     return <unsigned char> v
+ */
+  __pyx_t_1 = ((__pyx_v_v > 0xFF) != 0);
+  if (__pyx_t_1) {
+
+    /* "xpra/codecs/argb/argb.pyx":34
+ * cdef inline unsigned char clamp(int v):
+ *     if v>255:
+ *         return 255             # <<<<<<<<<<<<<<
+ *     return <unsigned char> v
+ * 
+ */
+    __pyx_r = 0xFF;
+    goto __pyx_L0;
+
+    /* "xpra/codecs/argb/argb.pyx":33
+ * 
+ * cdef inline unsigned char clamp(int v):
+ *     if v>255:             # <<<<<<<<<<<<<<
+ *         return 255
+ *     return <unsigned char> v
+ */
+  }
+
+  /* "xpra/codecs/argb/argb.pyx":35
+ *     if v>255:
+ *         return 255
+ *     return <unsigned char> v             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_r = ((unsigned char)__pyx_v_v);
+  goto __pyx_L0;
+
+  /* "xpra/codecs/argb/argb.pyx":32
+ *     return get_buffer_api_version()
+ * 
+ * cdef inline unsigned char clamp(int v):             # <<<<<<<<<<<<<<
+ *     if v>255:
+ *         return 255
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "xpra/codecs/argb/argb.pyx":38
+ * 
+ * 
+ * def r210_to_rgba(buf):             # <<<<<<<<<<<<<<
+ *     assert len(buf) % 4 == 0, "invalid buffer size: %s is not a multiple of 4" % len(buf)
+ *     # buf is a Python buffer object
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_4xpra_6codecs_4argb_4argb_3r210_to_rgba(PyObject *__pyx_self, PyObject *__pyx_v_buf); /*proto*/
+static PyMethodDef __pyx_mdef_4xpra_6codecs_4argb_4argb_3r210_to_rgba = {"r210_to_rgba", (PyCFunction)__pyx_pw_4xpra_6codecs_4argb_4argb_3r210_to_rgba, METH_O, 0};
+static PyObject *__pyx_pw_4xpra_6codecs_4argb_4argb_3r210_to_rgba(PyObject *__pyx_self, PyObject *__pyx_v_buf) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("r210_to_rgba (wrapper)", 0);
+  __pyx_r = __pyx_pf_4xpra_6codecs_4argb_4argb_2r210_to_rgba(__pyx_self, ((PyObject *)__pyx_v_buf));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_4xpra_6codecs_4argb_4argb_2r210_to_rgba(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_buf) {
+  unsigned int const *__pyx_v_cbuf;
+  Py_ssize_t __pyx_v_cbuf_len;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  Py_ssize_t __pyx_t_1;
+  Py_ssize_t __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("r210_to_rgba", 0);
+
+  /* "xpra/codecs/argb/argb.pyx":39
+ * 
+ * def r210_to_rgba(buf):
+ *     assert len(buf) % 4 == 0, "invalid buffer size: %s is not a multiple of 4" % len(buf)             # <<<<<<<<<<<<<<
+ *     # buf is a Python buffer object
+ *     cdef const unsigned int* cbuf = <const unsigned int *> 0
+ */
+  #ifndef CYTHON_WITHOUT_ASSERTIONS
+  if (unlikely(__pyx_assertions_enabled())) {
+    __pyx_t_1 = PyObject_Length(__pyx_v_buf); if (unlikely(__pyx_t_1 == ((Py_ssize_t)-1))) __PYX_ERR(0, 39, __pyx_L1_error)
+    if (unlikely(!(((__pyx_t_1 % 4) == 0) != 0))) {
+      __pyx_t_2 = PyObject_Length(__pyx_v_buf); if (unlikely(__pyx_t_2 == ((Py_ssize_t)-1))) __PYX_ERR(0, 39, __pyx_L1_error)
+      __pyx_t_3 = PyInt_FromSsize_t(__pyx_t_2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 39, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_3);
+      __pyx_t_4 = __Pyx_PyString_Format(__pyx_kp_s_invalid_buffer_size_s_is_not_a_m, __pyx_t_3); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 39, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_4);
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      PyErr_SetObject(PyExc_AssertionError, __pyx_t_4);
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+      __PYX_ERR(0, 39, __pyx_L1_error)
+    }
+  }
+  #endif
+
+  /* "xpra/codecs/argb/argb.pyx":41
+ *     assert len(buf) % 4 == 0, "invalid buffer size: %s is not a multiple of 4" % len(buf)
+ *     # buf is a Python buffer object
+ *     cdef const unsigned int* cbuf = <const unsigned int *> 0             # <<<<<<<<<<<<<<
+ *     cdef Py_ssize_t cbuf_len = 0
+ *     assert object_as_buffer(buf, <const void**> &cbuf, &cbuf_len)==0, "cannot convert %s to a readable buffer" % type(buf)
+ */
+  __pyx_v_cbuf = ((unsigned int const *)0);
+
+  /* "xpra/codecs/argb/argb.pyx":42
+ *     # buf is a Python buffer object
+ *     cdef const unsigned int* cbuf = <const unsigned int *> 0
+ *     cdef Py_ssize_t cbuf_len = 0             # <<<<<<<<<<<<<<
+ *     assert object_as_buffer(buf, <const void**> &cbuf, &cbuf_len)==0, "cannot convert %s to a readable buffer" % type(buf)
+ *     return r210data_to_rgba(cbuf, cbuf_len)
+ */
+  __pyx_v_cbuf_len = 0;
+
+  /* "xpra/codecs/argb/argb.pyx":43
+ *     cdef const unsigned int* cbuf = <const unsigned int *> 0
+ *     cdef Py_ssize_t cbuf_len = 0
+ *     assert object_as_buffer(buf, <const void**> &cbuf, &cbuf_len)==0, "cannot convert %s to a readable buffer" % type(buf)             # <<<<<<<<<<<<<<
+ *     return r210data_to_rgba(cbuf, cbuf_len)
+ * 
+ */
+  #ifndef CYTHON_WITHOUT_ASSERTIONS
+  if (unlikely(__pyx_assertions_enabled())) {
+    if (unlikely(!((object_as_buffer(__pyx_v_buf, ((void const **)(&__pyx_v_cbuf)), (&__pyx_v_cbuf_len)) == 0) != 0))) {
+      __pyx_t_4 = __Pyx_PyString_FormatSafe(__pyx_kp_s_cannot_convert_s_to_a_readable_b, ((PyObject *)Py_TYPE(__pyx_v_buf))); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 43, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_4);
+      PyErr_SetObject(PyExc_AssertionError, __pyx_t_4);
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+      __PYX_ERR(0, 43, __pyx_L1_error)
+    }
+  }
+  #endif
+
+  /* "xpra/codecs/argb/argb.pyx":44
+ *     cdef Py_ssize_t cbuf_len = 0
+ *     assert object_as_buffer(buf, <const void**> &cbuf, &cbuf_len)==0, "cannot convert %s to a readable buffer" % type(buf)
+ *     return r210data_to_rgba(cbuf, cbuf_len)             # <<<<<<<<<<<<<<
+ * 
+ * cdef r210data_to_rgba(const unsigned int* r210, const int r210_len):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_4 = __pyx_f_4xpra_6codecs_4argb_4argb_r210data_to_rgba(__pyx_v_cbuf, __pyx_v_cbuf_len); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 44, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_r = __pyx_t_4;
+  __pyx_t_4 = 0;
+  goto __pyx_L0;
+
+  /* "xpra/codecs/argb/argb.pyx":38
+ * 
+ * 
+ * def r210_to_rgba(buf):             # <<<<<<<<<<<<<<
+ *     assert len(buf) % 4 == 0, "invalid buffer size: %s is not a multiple of 4" % len(buf)
+ *     # buf is a Python buffer object
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_AddTraceback("xpra.codecs.argb.argb.r210_to_rgba", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "xpra/codecs/argb/argb.pyx":46
+ *     return r210data_to_rgba(cbuf, cbuf_len)
+ * 
+ * cdef r210data_to_rgba(const unsigned int* r210, const int r210_len):             # <<<<<<<<<<<<<<
+ *     if r210_len <= 0:
+ *         return None
+ */
+
+static PyObject *__pyx_f_4xpra_6codecs_4argb_4argb_r210data_to_rgba(unsigned int const *__pyx_v_r210, int const __pyx_v_r210_len) {
+  PyObject *__pyx_v_rgba = NULL;
+  int __pyx_v_i;
+  unsigned int __pyx_v_v;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  long __pyx_t_5;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("r210data_to_rgba", 0);
+
+  /* "xpra/codecs/argb/argb.pyx":47
+ * 
+ * cdef r210data_to_rgba(const unsigned int* r210, const int r210_len):
+ *     if r210_len <= 0:             # <<<<<<<<<<<<<<
+ *         return None
+ *     assert r210_len>0 and r210_len % 4 == 0, "invalid buffer size: %s is not a multiple of 4" % r210_len
+ */
+  __pyx_t_1 = ((__pyx_v_r210_len <= 0) != 0);
+  if (__pyx_t_1) {
+
+    /* "xpra/codecs/argb/argb.pyx":48
+ * cdef r210data_to_rgba(const unsigned int* r210, const int r210_len):
+ *     if r210_len <= 0:
+ *         return None             # <<<<<<<<<<<<<<
+ *     assert r210_len>0 and r210_len % 4 == 0, "invalid buffer size: %s is not a multiple of 4" % r210_len
+ *     rgba = bytearray(r210_len)
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+    goto __pyx_L0;
+
+    /* "xpra/codecs/argb/argb.pyx":47
+ * 
+ * cdef r210data_to_rgba(const unsigned int* r210, const int r210_len):
+ *     if r210_len <= 0:             # <<<<<<<<<<<<<<
+ *         return None
+ *     assert r210_len>0 and r210_len % 4 == 0, "invalid buffer size: %s is not a multiple of 4" % r210_len
+ */
+  }
+
+  /* "xpra/codecs/argb/argb.pyx":49
+ *     if r210_len <= 0:
+ *         return None
+ *     assert r210_len>0 and r210_len % 4 == 0, "invalid buffer size: %s is not a multiple of 4" % r210_len             # <<<<<<<<<<<<<<
+ *     rgba = bytearray(r210_len)
+ *     #number of pixels:
+ */
+  #ifndef CYTHON_WITHOUT_ASSERTIONS
+  if (unlikely(__pyx_assertions_enabled())) {
+    __pyx_t_2 = ((__pyx_v_r210_len > 0) != 0);
+    if (__pyx_t_2) {
+    } else {
+      __pyx_t_1 = __pyx_t_2;
+      goto __pyx_L4_bool_binop_done;
+    }
+    __pyx_t_2 = (((__pyx_v_r210_len % 4) == 0) != 0);
+    __pyx_t_1 = __pyx_t_2;
+    __pyx_L4_bool_binop_done:;
+    if (unlikely(!__pyx_t_1)) {
+      __pyx_t_3 = __Pyx_PyInt_From_int(__pyx_v_r210_len); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 49, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_3);
+      __pyx_t_4 = __Pyx_PyString_Format(__pyx_kp_s_invalid_buffer_size_s_is_not_a_m, __pyx_t_3); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 49, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_4);
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      PyErr_SetObject(PyExc_AssertionError, __pyx_t_4);
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+      __PYX_ERR(0, 49, __pyx_L1_error)
+    }
+  }
+  #endif
+
+  /* "xpra/codecs/argb/argb.pyx":50
+ *         return None
+ *     assert r210_len>0 and r210_len % 4 == 0, "invalid buffer size: %s is not a multiple of 4" % r210_len
+ *     rgba = bytearray(r210_len)             # <<<<<<<<<<<<<<
+ *     #number of pixels:
+ *     cdef int i = 0
+ */
+  __pyx_t_4 = __Pyx_PyInt_From_int(__pyx_v_r210_len); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 50, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_3 = __Pyx_PyObject_CallOneArg(((PyObject *)(&PyByteArray_Type)), __pyx_t_4); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 50, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_v_rgba = ((PyObject*)__pyx_t_3);
+  __pyx_t_3 = 0;
+
+  /* "xpra/codecs/argb/argb.pyx":52
+ *     rgba = bytearray(r210_len)
+ *     #number of pixels:
+ *     cdef int i = 0             # <<<<<<<<<<<<<<
+ *     cdef unsigned int v
+ *     while i < r210_len:
+ */
+  __pyx_v_i = 0;
+
+  /* "xpra/codecs/argb/argb.pyx":54
+ *     cdef int i = 0
+ *     cdef unsigned int v
+ *     while i < r210_len:             # <<<<<<<<<<<<<<
+ *         v = r210[i//4]
+ *         rgba[i]   = (v&0x000003ff) >> 2
+ */
+  while (1) {
+    __pyx_t_1 = ((__pyx_v_i < __pyx_v_r210_len) != 0);
+    if (!__pyx_t_1) break;
+
+    /* "xpra/codecs/argb/argb.pyx":55
+ *     cdef unsigned int v
+ *     while i < r210_len:
+ *         v = r210[i//4]             # <<<<<<<<<<<<<<
+ *         rgba[i]   = (v&0x000003ff) >> 2
+ *         rgba[i+1] = (v&0x000ffc00) >> 12
+ */
+    __pyx_v_v = (__pyx_v_r210[(__pyx_v_i / 4)]);
+
+    /* "xpra/codecs/argb/argb.pyx":56
+ *     while i < r210_len:
+ *         v = r210[i//4]
+ *         rgba[i]   = (v&0x000003ff) >> 2             # <<<<<<<<<<<<<<
+ *         rgba[i+1] = (v&0x000ffc00) >> 12
+ *         rgba[i+2] = (v&0x3ff00000) >> 22
+ */
+    if (unlikely(((__pyx_v_v & 0x000003ff) >> 2) < 0 || ((__pyx_v_v & 0x000003ff) >> 2) > 255)) {
+      PyErr_SetString(PyExc_ValueError, "byte must be in range(0, 256)"); __PYX_ERR(0, 56, __pyx_L1_error)
+    }
+    if (unlikely(__Pyx_SetItemInt_ByteArray(__pyx_v_rgba, __pyx_v_i, ((unsigned char)((__pyx_v_v & 0x000003ff) >> 2)), int, 1, __Pyx_PyInt_From_int, 0, 0, 0) < 0)) __PYX_ERR(0, 56, __pyx_L1_error)
+
+    /* "xpra/codecs/argb/argb.pyx":57
+ *         v = r210[i//4]
+ *         rgba[i]   = (v&0x000003ff) >> 2
+ *         rgba[i+1] = (v&0x000ffc00) >> 12             # <<<<<<<<<<<<<<
+ *         rgba[i+2] = (v&0x3ff00000) >> 22
+ *         rgba[i+3] = ((v&(<unsigned int>0xc0000000)) >> 30)*85
+ */
+    __pyx_t_5 = (__pyx_v_i + 1);
+    if (unlikely(((__pyx_v_v & 0x000ffc00) >> 12) < 0 || ((__pyx_v_v & 0x000ffc00) >> 12) > 255)) {
+      PyErr_SetString(PyExc_ValueError, "byte must be in range(0, 256)"); __PYX_ERR(0, 57, __pyx_L1_error)
+    }
+    if (unlikely(__Pyx_SetItemInt_ByteArray(__pyx_v_rgba, __pyx_t_5, ((unsigned char)((__pyx_v_v & 0x000ffc00) >> 12)), long, 1, __Pyx_PyInt_From_long, 0, 0, 0) < 0)) __PYX_ERR(0, 57, __pyx_L1_error)
+
+    /* "xpra/codecs/argb/argb.pyx":58
+ *         rgba[i]   = (v&0x000003ff) >> 2
+ *         rgba[i+1] = (v&0x000ffc00) >> 12
+ *         rgba[i+2] = (v&0x3ff00000) >> 22             # <<<<<<<<<<<<<<
+ *         rgba[i+3] = ((v&(<unsigned int>0xc0000000)) >> 30)*85
+ *         i = i + 4
+ */
+    __pyx_t_5 = (__pyx_v_i + 2);
+    if (unlikely(((__pyx_v_v & 0x3ff00000) >> 22) < 0 || ((__pyx_v_v & 0x3ff00000) >> 22) > 255)) {
+      PyErr_SetString(PyExc_ValueError, "byte must be in range(0, 256)"); __PYX_ERR(0, 58, __pyx_L1_error)
+    }
+    if (unlikely(__Pyx_SetItemInt_ByteArray(__pyx_v_rgba, __pyx_t_5, ((unsigned char)((__pyx_v_v & 0x3ff00000) >> 22)), long, 1, __Pyx_PyInt_From_long, 0, 0, 0) < 0)) __PYX_ERR(0, 58, __pyx_L1_error)
+
+    /* "xpra/codecs/argb/argb.pyx":59
+ *         rgba[i+1] = (v&0x000ffc00) >> 12
+ *         rgba[i+2] = (v&0x3ff00000) >> 22
+ *         rgba[i+3] = ((v&(<unsigned int>0xc0000000)) >> 30)*85             # <<<<<<<<<<<<<<
+ *         i = i + 4
+ *     return rgba
+ */
+    __pyx_t_5 = (__pyx_v_i + 3);
+    if (unlikely((((__pyx_v_v & ((unsigned int)0xc0000000)) >> 30) * 85) < 0 || (((__pyx_v_v & ((unsigned int)0xc0000000)) >> 30) * 85) > 255)) {
+      PyErr_SetString(PyExc_ValueError, "byte must be in range(0, 256)"); __PYX_ERR(0, 59, __pyx_L1_error)
+    }
+    if (unlikely(__Pyx_SetItemInt_ByteArray(__pyx_v_rgba, __pyx_t_5, ((unsigned char)(((__pyx_v_v & ((unsigned int)0xc0000000)) >> 30) * 85)), long, 1, __Pyx_PyInt_From_long, 0, 0, 0) < 0)) __PYX_ERR(0, 59, __pyx_L1_error)
+
+    /* "xpra/codecs/argb/argb.pyx":60
+ *         rgba[i+2] = (v&0x3ff00000) >> 22
+ *         rgba[i+3] = ((v&(<unsigned int>0xc0000000)) >> 30)*85
+ *         i = i + 4             # <<<<<<<<<<<<<<
+ *     return rgba
+ * 
+ */
+    __pyx_v_i = (__pyx_v_i + 4);
+  }
+
+  /* "xpra/codecs/argb/argb.pyx":61
+ *         rgba[i+3] = ((v&(<unsigned int>0xc0000000)) >> 30)*85
+ *         i = i + 4
+ *     return rgba             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v_rgba);
+  __pyx_r = __pyx_v_rgba;
+  goto __pyx_L0;
+
+  /* "xpra/codecs/argb/argb.pyx":46
+ *     return r210data_to_rgba(cbuf, cbuf_len)
+ * 
+ * cdef r210data_to_rgba(const unsigned int* r210, const int r210_len):             # <<<<<<<<<<<<<<
+ *     if r210_len <= 0:
+ *         return None
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_AddTraceback("xpra.codecs.argb.argb.r210data_to_rgba", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_rgba);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "xpra/codecs/argb/argb.pyx":64
+ * 
+ * 
+ * def r210_to_rgb(buf):             # <<<<<<<<<<<<<<
+ *     assert len(buf) % 4 == 0, "invalid buffer size: %s is not a multiple of 4" % len(buf)
+ *     # buf is a Python buffer object
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_4xpra_6codecs_4argb_4argb_5r210_to_rgb(PyObject *__pyx_self, PyObject *__pyx_v_buf); /*proto*/
+static PyMethodDef __pyx_mdef_4xpra_6codecs_4argb_4argb_5r210_to_rgb = {"r210_to_rgb", (PyCFunction)__pyx_pw_4xpra_6codecs_4argb_4argb_5r210_to_rgb, METH_O, 0};
+static PyObject *__pyx_pw_4xpra_6codecs_4argb_4argb_5r210_to_rgb(PyObject *__pyx_self, PyObject *__pyx_v_buf) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("r210_to_rgb (wrapper)", 0);
+  __pyx_r = __pyx_pf_4xpra_6codecs_4argb_4argb_4r210_to_rgb(__pyx_self, ((PyObject *)__pyx_v_buf));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_4xpra_6codecs_4argb_4argb_4r210_to_rgb(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_buf) {
+  unsigned int const *__pyx_v_cbuf;
+  Py_ssize_t __pyx_v_cbuf_len;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  Py_ssize_t __pyx_t_1;
+  Py_ssize_t __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("r210_to_rgb", 0);
+
+  /* "xpra/codecs/argb/argb.pyx":65
+ * 
+ * def r210_to_rgb(buf):
+ *     assert len(buf) % 4 == 0, "invalid buffer size: %s is not a multiple of 4" % len(buf)             # <<<<<<<<<<<<<<
+ *     # buf is a Python buffer object
+ *     cdef const unsigned int* cbuf = <const unsigned int *> 0
+ */
+  #ifndef CYTHON_WITHOUT_ASSERTIONS
+  if (unlikely(__pyx_assertions_enabled())) {
+    __pyx_t_1 = PyObject_Length(__pyx_v_buf); if (unlikely(__pyx_t_1 == ((Py_ssize_t)-1))) __PYX_ERR(0, 65, __pyx_L1_error)
+    if (unlikely(!(((__pyx_t_1 % 4) == 0) != 0))) {
+      __pyx_t_2 = PyObject_Length(__pyx_v_buf); if (unlikely(__pyx_t_2 == ((Py_ssize_t)-1))) __PYX_ERR(0, 65, __pyx_L1_error)
+      __pyx_t_3 = PyInt_FromSsize_t(__pyx_t_2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 65, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_3);
+      __pyx_t_4 = __Pyx_PyString_Format(__pyx_kp_s_invalid_buffer_size_s_is_not_a_m, __pyx_t_3); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 65, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_4);
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      PyErr_SetObject(PyExc_AssertionError, __pyx_t_4);
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+      __PYX_ERR(0, 65, __pyx_L1_error)
+    }
+  }
+  #endif
+
+  /* "xpra/codecs/argb/argb.pyx":67
+ *     assert len(buf) % 4 == 0, "invalid buffer size: %s is not a multiple of 4" % len(buf)
+ *     # buf is a Python buffer object
+ *     cdef const unsigned int* cbuf = <const unsigned int *> 0             # <<<<<<<<<<<<<<
+ *     cdef Py_ssize_t cbuf_len = 0
+ *     assert object_as_buffer(buf, <const void**> &cbuf, &cbuf_len)==0, "cannot convert %s to a readable buffer" % type(buf)
+ */
+  __pyx_v_cbuf = ((unsigned int const *)0);
+
+  /* "xpra/codecs/argb/argb.pyx":68
+ *     # buf is a Python buffer object
+ *     cdef const unsigned int* cbuf = <const unsigned int *> 0
+ *     cdef Py_ssize_t cbuf_len = 0             # <<<<<<<<<<<<<<
+ *     assert object_as_buffer(buf, <const void**> &cbuf, &cbuf_len)==0, "cannot convert %s to a readable buffer" % type(buf)
+ *     return r210data_to_rgb(cbuf, cbuf_len)
+ */
+  __pyx_v_cbuf_len = 0;
+
+  /* "xpra/codecs/argb/argb.pyx":69
+ *     cdef const unsigned int* cbuf = <const unsigned int *> 0
+ *     cdef Py_ssize_t cbuf_len = 0
+ *     assert object_as_buffer(buf, <const void**> &cbuf, &cbuf_len)==0, "cannot convert %s to a readable buffer" % type(buf)             # <<<<<<<<<<<<<<
+ *     return r210data_to_rgb(cbuf, cbuf_len)
+ * 
+ */
+  #ifndef CYTHON_WITHOUT_ASSERTIONS
+  if (unlikely(__pyx_assertions_enabled())) {
+    if (unlikely(!((object_as_buffer(__pyx_v_buf, ((void const **)(&__pyx_v_cbuf)), (&__pyx_v_cbuf_len)) == 0) != 0))) {
+      __pyx_t_4 = __Pyx_PyString_FormatSafe(__pyx_kp_s_cannot_convert_s_to_a_readable_b, ((PyObject *)Py_TYPE(__pyx_v_buf))); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 69, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_4);
+      PyErr_SetObject(PyExc_AssertionError, __pyx_t_4);
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+      __PYX_ERR(0, 69, __pyx_L1_error)
+    }
+  }
+  #endif
+
+  /* "xpra/codecs/argb/argb.pyx":70
+ *     cdef Py_ssize_t cbuf_len = 0
+ *     assert object_as_buffer(buf, <const void**> &cbuf, &cbuf_len)==0, "cannot convert %s to a readable buffer" % type(buf)
+ *     return r210data_to_rgb(cbuf, cbuf_len)             # <<<<<<<<<<<<<<
+ * 
+ * cdef r210data_to_rgb(const unsigned int* r210, const int r210_len):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_4 = __pyx_f_4xpra_6codecs_4argb_4argb_r210data_to_rgb(__pyx_v_cbuf, __pyx_v_cbuf_len); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 70, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_r = __pyx_t_4;
+  __pyx_t_4 = 0;
+  goto __pyx_L0;
+
+  /* "xpra/codecs/argb/argb.pyx":64
+ * 
+ * 
+ * def r210_to_rgb(buf):             # <<<<<<<<<<<<<<
+ *     assert len(buf) % 4 == 0, "invalid buffer size: %s is not a multiple of 4" % len(buf)
+ *     # buf is a Python buffer object
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_AddTraceback("xpra.codecs.argb.argb.r210_to_rgb", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "xpra/codecs/argb/argb.pyx":72
+ *     return r210data_to_rgb(cbuf, cbuf_len)
+ * 
+ * cdef r210data_to_rgb(const unsigned int* r210, const int r210_len):             # <<<<<<<<<<<<<<
+ *     if r210_len <= 0:
+ *         return None
+ */
+
+static PyObject *__pyx_f_4xpra_6codecs_4argb_4argb_r210data_to_rgb(unsigned int const *__pyx_v_r210, int const __pyx_v_r210_len) {
+  PyObject *__pyx_v_rgb = NULL;
+  int __pyx_v_s;
+  int __pyx_v_d;
+  unsigned int __pyx_v_v;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  long __pyx_t_5;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("r210data_to_rgb", 0);
+
+  /* "xpra/codecs/argb/argb.pyx":73
+ * 
+ * cdef r210data_to_rgb(const unsigned int* r210, const int r210_len):
+ *     if r210_len <= 0:             # <<<<<<<<<<<<<<
+ *         return None
+ *     assert r210_len>0 and r210_len % 4 == 0, "invalid buffer size: %s is not a multiple of 4" % r210_len
+ */
+  __pyx_t_1 = ((__pyx_v_r210_len <= 0) != 0);
+  if (__pyx_t_1) {
+
+    /* "xpra/codecs/argb/argb.pyx":74
+ * cdef r210data_to_rgb(const unsigned int* r210, const int r210_len):
+ *     if r210_len <= 0:
+ *         return None             # <<<<<<<<<<<<<<
+ *     assert r210_len>0 and r210_len % 4 == 0, "invalid buffer size: %s is not a multiple of 4" % r210_len
+ *     rgb = bytearray(r210_len//4*3)
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+    goto __pyx_L0;
+
+    /* "xpra/codecs/argb/argb.pyx":73
+ * 
+ * cdef r210data_to_rgb(const unsigned int* r210, const int r210_len):
+ *     if r210_len <= 0:             # <<<<<<<<<<<<<<
+ *         return None
+ *     assert r210_len>0 and r210_len % 4 == 0, "invalid buffer size: %s is not a multiple of 4" % r210_len
+ */
+  }
+
+  /* "xpra/codecs/argb/argb.pyx":75
+ *     if r210_len <= 0:
+ *         return None
+ *     assert r210_len>0 and r210_len % 4 == 0, "invalid buffer size: %s is not a multiple of 4" % r210_len             # <<<<<<<<<<<<<<
+ *     rgb = bytearray(r210_len//4*3)
+ *     #number of pixels:
+ */
+  #ifndef CYTHON_WITHOUT_ASSERTIONS
+  if (unlikely(__pyx_assertions_enabled())) {
+    __pyx_t_2 = ((__pyx_v_r210_len > 0) != 0);
+    if (__pyx_t_2) {
+    } else {
+      __pyx_t_1 = __pyx_t_2;
+      goto __pyx_L4_bool_binop_done;
+    }
+    __pyx_t_2 = (((__pyx_v_r210_len % 4) == 0) != 0);
+    __pyx_t_1 = __pyx_t_2;
+    __pyx_L4_bool_binop_done:;
+    if (unlikely(!__pyx_t_1)) {
+      __pyx_t_3 = __Pyx_PyInt_From_int(__pyx_v_r210_len); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 75, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_3);
+      __pyx_t_4 = __Pyx_PyString_Format(__pyx_kp_s_invalid_buffer_size_s_is_not_a_m, __pyx_t_3); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 75, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_4);
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      PyErr_SetObject(PyExc_AssertionError, __pyx_t_4);
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+      __PYX_ERR(0, 75, __pyx_L1_error)
+    }
+  }
+  #endif
+
+  /* "xpra/codecs/argb/argb.pyx":76
+ *         return None
+ *     assert r210_len>0 and r210_len % 4 == 0, "invalid buffer size: %s is not a multiple of 4" % r210_len
+ *     rgb = bytearray(r210_len//4*3)             # <<<<<<<<<<<<<<
+ *     #number of pixels:
+ *     cdef int s = 0
+ */
+  __pyx_t_4 = __Pyx_PyInt_From_long(((__pyx_v_r210_len / 4) * 3)); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 76, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_3 = __Pyx_PyObject_CallOneArg(((PyObject *)(&PyByteArray_Type)), __pyx_t_4); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 76, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_v_rgb = ((PyObject*)__pyx_t_3);
+  __pyx_t_3 = 0;
+
+  /* "xpra/codecs/argb/argb.pyx":78
+ *     rgb = bytearray(r210_len//4*3)
+ *     #number of pixels:
+ *     cdef int s = 0             # <<<<<<<<<<<<<<
+ *     cdef int d = 0
+ *     cdef unsigned int v
+ */
+  __pyx_v_s = 0;
+
+  /* "xpra/codecs/argb/argb.pyx":79
+ *     #number of pixels:
+ *     cdef int s = 0
+ *     cdef int d = 0             # <<<<<<<<<<<<<<
+ *     cdef unsigned int v
+ *     while s < r210_len//4:
+ */
+  __pyx_v_d = 0;
+
+  /* "xpra/codecs/argb/argb.pyx":81
+ *     cdef int d = 0
+ *     cdef unsigned int v
+ *     while s < r210_len//4:             # <<<<<<<<<<<<<<
+ *         v = r210[s]
+ *         rgb[d]   = (v&0x000003ff) >> 2
+ */
+  while (1) {
+    __pyx_t_1 = ((__pyx_v_s < (__pyx_v_r210_len / 4)) != 0);
+    if (!__pyx_t_1) break;
+
+    /* "xpra/codecs/argb/argb.pyx":82
+ *     cdef unsigned int v
+ *     while s < r210_len//4:
+ *         v = r210[s]             # <<<<<<<<<<<<<<
+ *         rgb[d]   = (v&0x000003ff) >> 2
+ *         rgb[d+1] = (v&0x000ffc00) >> 12
+ */
+    __pyx_v_v = (__pyx_v_r210[__pyx_v_s]);
+
+    /* "xpra/codecs/argb/argb.pyx":83
+ *     while s < r210_len//4:
+ *         v = r210[s]
+ *         rgb[d]   = (v&0x000003ff) >> 2             # <<<<<<<<<<<<<<
+ *         rgb[d+1] = (v&0x000ffc00) >> 12
+ *         rgb[d+2] = (v&0x3ff00000) >> 22
+ */
+    if (unlikely(((__pyx_v_v & 0x000003ff) >> 2) < 0 || ((__pyx_v_v & 0x000003ff) >> 2) > 255)) {
+      PyErr_SetString(PyExc_ValueError, "byte must be in range(0, 256)"); __PYX_ERR(0, 83, __pyx_L1_error)
+    }
+    if (unlikely(__Pyx_SetItemInt_ByteArray(__pyx_v_rgb, __pyx_v_d, ((unsigned char)((__pyx_v_v & 0x000003ff) >> 2)), int, 1, __Pyx_PyInt_From_int, 0, 0, 0) < 0)) __PYX_ERR(0, 83, __pyx_L1_error)
+
+    /* "xpra/codecs/argb/argb.pyx":84
+ *         v = r210[s]
+ *         rgb[d]   = (v&0x000003ff) >> 2
+ *         rgb[d+1] = (v&0x000ffc00) >> 12             # <<<<<<<<<<<<<<
+ *         rgb[d+2] = (v&0x3ff00000) >> 22
+ *         s += 1
+ */
+    __pyx_t_5 = (__pyx_v_d + 1);
+    if (unlikely(((__pyx_v_v & 0x000ffc00) >> 12) < 0 || ((__pyx_v_v & 0x000ffc00) >> 12) > 255)) {
+      PyErr_SetString(PyExc_ValueError, "byte must be in range(0, 256)"); __PYX_ERR(0, 84, __pyx_L1_error)
+    }
+    if (unlikely(__Pyx_SetItemInt_ByteArray(__pyx_v_rgb, __pyx_t_5, ((unsigned char)((__pyx_v_v & 0x000ffc00) >> 12)), long, 1, __Pyx_PyInt_From_long, 0, 0, 0) < 0)) __PYX_ERR(0, 84, __pyx_L1_error)
+
+    /* "xpra/codecs/argb/argb.pyx":85
+ *         rgb[d]   = (v&0x000003ff) >> 2
+ *         rgb[d+1] = (v&0x000ffc00) >> 12
+ *         rgb[d+2] = (v&0x3ff00000) >> 22             # <<<<<<<<<<<<<<
+ *         s += 1
+ *         d += 3
+ */
+    __pyx_t_5 = (__pyx_v_d + 2);
+    if (unlikely(((__pyx_v_v & 0x3ff00000) >> 22) < 0 || ((__pyx_v_v & 0x3ff00000) >> 22) > 255)) {
+      PyErr_SetString(PyExc_ValueError, "byte must be in range(0, 256)"); __PYX_ERR(0, 85, __pyx_L1_error)
+    }
+    if (unlikely(__Pyx_SetItemInt_ByteArray(__pyx_v_rgb, __pyx_t_5, ((unsigned char)((__pyx_v_v & 0x3ff00000) >> 22)), long, 1, __Pyx_PyInt_From_long, 0, 0, 0) < 0)) __PYX_ERR(0, 85, __pyx_L1_error)
+
+    /* "xpra/codecs/argb/argb.pyx":86
+ *         rgb[d+1] = (v&0x000ffc00) >> 12
+ *         rgb[d+2] = (v&0x3ff00000) >> 22
+ *         s += 1             # <<<<<<<<<<<<<<
+ *         d += 3
+ *     return rgb
+ */
+    __pyx_v_s = (__pyx_v_s + 1);
+
+    /* "xpra/codecs/argb/argb.pyx":87
+ *         rgb[d+2] = (v&0x3ff00000) >> 22
+ *         s += 1
+ *         d += 3             # <<<<<<<<<<<<<<
+ *     return rgb
+ * 
+ */
+    __pyx_v_d = (__pyx_v_d + 3);
+  }
+
+  /* "xpra/codecs/argb/argb.pyx":88
+ *         s += 1
+ *         d += 3
+ *     return rgb             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v_rgb);
+  __pyx_r = __pyx_v_rgb;
+  goto __pyx_L0;
+
+  /* "xpra/codecs/argb/argb.pyx":72
+ *     return r210data_to_rgb(cbuf, cbuf_len)
+ * 
+ * cdef r210data_to_rgb(const unsigned int* r210, const int r210_len):             # <<<<<<<<<<<<<<
+ *     if r210_len <= 0:
+ *         return None
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_AddTraceback("xpra.codecs.argb.argb.r210data_to_rgb", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_rgb);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "xpra/codecs/argb/argb.pyx":91
+ * 
+ * 
+ * def argb_to_rgba(buf):             # <<<<<<<<<<<<<<
+ *     assert len(buf) % 4 == 0, "invalid buffer size: %s is not a multiple of 4" % len(buf)
+ *     # buf is a Python buffer object
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_4xpra_6codecs_4argb_4argb_7argb_to_rgba(PyObject *__pyx_self, PyObject *__pyx_v_buf); /*proto*/
+static PyMethodDef __pyx_mdef_4xpra_6codecs_4argb_4argb_7argb_to_rgba = {"argb_to_rgba", (PyCFunction)__pyx_pw_4xpra_6codecs_4argb_4argb_7argb_to_rgba, METH_O, 0};
+static PyObject *__pyx_pw_4xpra_6codecs_4argb_4argb_7argb_to_rgba(PyObject *__pyx_self, PyObject *__pyx_v_buf) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("argb_to_rgba (wrapper)", 0);
+  __pyx_r = __pyx_pf_4xpra_6codecs_4argb_4argb_6argb_to_rgba(__pyx_self, ((PyObject *)__pyx_v_buf));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_4xpra_6codecs_4argb_4argb_6argb_to_rgba(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_buf) {
+  unsigned char const *__pyx_v_cbuf;
+  Py_ssize_t __pyx_v_cbuf_len;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  Py_ssize_t __pyx_t_1;
+  Py_ssize_t __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("argb_to_rgba", 0);
+
+  /* "xpra/codecs/argb/argb.pyx":92
+ * 
+ * def argb_to_rgba(buf):
+ *     assert len(buf) % 4 == 0, "invalid buffer size: %s is not a multiple of 4" % len(buf)             # <<<<<<<<<<<<<<
+ *     # buf is a Python buffer object
+ *     cdef const unsigned char * cbuf = <unsigned char *> 0
+ */
+  #ifndef CYTHON_WITHOUT_ASSERTIONS
+  if (unlikely(__pyx_assertions_enabled())) {
+    __pyx_t_1 = PyObject_Length(__pyx_v_buf); if (unlikely(__pyx_t_1 == ((Py_ssize_t)-1))) __PYX_ERR(0, 92, __pyx_L1_error)
+    if (unlikely(!(((__pyx_t_1 % 4) == 0) != 0))) {
+      __pyx_t_2 = PyObject_Length(__pyx_v_buf); if (unlikely(__pyx_t_2 == ((Py_ssize_t)-1))) __PYX_ERR(0, 92, __pyx_L1_error)
+      __pyx_t_3 = PyInt_FromSsize_t(__pyx_t_2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 92, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_3);
+      __pyx_t_4 = __Pyx_PyString_Format(__pyx_kp_s_invalid_buffer_size_s_is_not_a_m, __pyx_t_3); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 92, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_4);
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      PyErr_SetObject(PyExc_AssertionError, __pyx_t_4);
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+      __PYX_ERR(0, 92, __pyx_L1_error)
+    }
+  }
+  #endif
+
+  /* "xpra/codecs/argb/argb.pyx":94
+ *     assert len(buf) % 4 == 0, "invalid buffer size: %s is not a multiple of 4" % len(buf)
+ *     # buf is a Python buffer object
+ *     cdef const unsigned char * cbuf = <unsigned char *> 0             # <<<<<<<<<<<<<<
+ *     cdef Py_ssize_t cbuf_len = 0
+ *     assert object_as_buffer(buf, <const void**> &cbuf, &cbuf_len)==0, "cannot convert %s to a readable buffer" % type(buf)
+ */
+  __pyx_v_cbuf = ((unsigned char *)0);
+
+  /* "xpra/codecs/argb/argb.pyx":95
+ *     # buf is a Python buffer object
+ *     cdef const unsigned char * cbuf = <unsigned char *> 0
+ *     cdef Py_ssize_t cbuf_len = 0             # <<<<<<<<<<<<<<
+ *     assert object_as_buffer(buf, <const void**> &cbuf, &cbuf_len)==0, "cannot convert %s to a readable buffer" % type(buf)
+ *     return argbdata_to_rgba(cbuf, cbuf_len)
+ */
+  __pyx_v_cbuf_len = 0;
+
+  /* "xpra/codecs/argb/argb.pyx":96
+ *     cdef const unsigned char * cbuf = <unsigned char *> 0
+ *     cdef Py_ssize_t cbuf_len = 0
+ *     assert object_as_buffer(buf, <const void**> &cbuf, &cbuf_len)==0, "cannot convert %s to a readable buffer" % type(buf)             # <<<<<<<<<<<<<<
+ *     return argbdata_to_rgba(cbuf, cbuf_len)
+ * 
+ */
+  #ifndef CYTHON_WITHOUT_ASSERTIONS
+  if (unlikely(__pyx_assertions_enabled())) {
+    if (unlikely(!((object_as_buffer(__pyx_v_buf, ((void const **)(&__pyx_v_cbuf)), (&__pyx_v_cbuf_len)) == 0) != 0))) {
+      __pyx_t_4 = __Pyx_PyString_FormatSafe(__pyx_kp_s_cannot_convert_s_to_a_readable_b, ((PyObject *)Py_TYPE(__pyx_v_buf))); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 96, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_4);
+      PyErr_SetObject(PyExc_AssertionError, __pyx_t_4);
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+      __PYX_ERR(0, 96, __pyx_L1_error)
+    }
+  }
+  #endif
+
+  /* "xpra/codecs/argb/argb.pyx":97
+ *     cdef Py_ssize_t cbuf_len = 0
+ *     assert object_as_buffer(buf, <const void**> &cbuf, &cbuf_len)==0, "cannot convert %s to a readable buffer" % type(buf)
+ *     return argbdata_to_rgba(cbuf, cbuf_len)             # <<<<<<<<<<<<<<
+ * 
+ * cdef argbdata_to_rgba(const unsigned char* argb, const int argb_len):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_4 = __pyx_f_4xpra_6codecs_4argb_4argb_argbdata_to_rgba(__pyx_v_cbuf, __pyx_v_cbuf_len); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 97, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_r = __pyx_t_4;
+  __pyx_t_4 = 0;
+  goto __pyx_L0;
+
+  /* "xpra/codecs/argb/argb.pyx":91
+ * 
+ * 
+ * def argb_to_rgba(buf):             # <<<<<<<<<<<<<<
+ *     assert len(buf) % 4 == 0, "invalid buffer size: %s is not a multiple of 4" % len(buf)
+ *     # buf is a Python buffer object
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_AddTraceback("xpra.codecs.argb.argb.argb_to_rgba", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "xpra/codecs/argb/argb.pyx":99
+ *     return argbdata_to_rgba(cbuf, cbuf_len)
+ * 
+ * cdef argbdata_to_rgba(const unsigned char* argb, const int argb_len):             # <<<<<<<<<<<<<<
+ *     if argb_len <= 0:
+ *         return None
+ */
+
+static PyObject *__pyx_f_4xpra_6codecs_4argb_4argb_argbdata_to_rgba(unsigned char const *__pyx_v_argb, int const __pyx_v_argb_len) {
+  PyObject *__pyx_v_rgba = NULL;
+  int __pyx_v_i;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  long __pyx_t_5;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("argbdata_to_rgba", 0);
+
+  /* "xpra/codecs/argb/argb.pyx":100
+ * 
+ * cdef argbdata_to_rgba(const unsigned char* argb, const int argb_len):
+ *     if argb_len <= 0:             # <<<<<<<<<<<<<<
+ *         return None
+ *     assert argb_len>0 and argb_len % 4 == 0, "invalid buffer size: %s is not a multiple of 4" % argb_len
+ */
+  __pyx_t_1 = ((__pyx_v_argb_len <= 0) != 0);
+  if (__pyx_t_1) {
+
+    /* "xpra/codecs/argb/argb.pyx":101
+ * cdef argbdata_to_rgba(const unsigned char* argb, const int argb_len):
+ *     if argb_len <= 0:
+ *         return None             # <<<<<<<<<<<<<<
+ *     assert argb_len>0 and argb_len % 4 == 0, "invalid buffer size: %s is not a multiple of 4" % argb_len
+ *     rgba = bytearray(argb_len)
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+    goto __pyx_L0;
+
+    /* "xpra/codecs/argb/argb.pyx":100
+ * 
+ * cdef argbdata_to_rgba(const unsigned char* argb, const int argb_len):
+ *     if argb_len <= 0:             # <<<<<<<<<<<<<<
+ *         return None
+ *     assert argb_len>0 and argb_len % 4 == 0, "invalid buffer size: %s is not a multiple of 4" % argb_len
+ */
+  }
+
+  /* "xpra/codecs/argb/argb.pyx":102
+ *     if argb_len <= 0:
+ *         return None
+ *     assert argb_len>0 and argb_len % 4 == 0, "invalid buffer size: %s is not a multiple of 4" % argb_len             # <<<<<<<<<<<<<<
+ *     rgba = bytearray(argb_len)
+ *     #number of pixels:
+ */
+  #ifndef CYTHON_WITHOUT_ASSERTIONS
+  if (unlikely(__pyx_assertions_enabled())) {
+    __pyx_t_2 = ((__pyx_v_argb_len > 0) != 0);
+    if (__pyx_t_2) {
+    } else {
+      __pyx_t_1 = __pyx_t_2;
+      goto __pyx_L4_bool_binop_done;
+    }
+    __pyx_t_2 = (((__pyx_v_argb_len % 4) == 0) != 0);
+    __pyx_t_1 = __pyx_t_2;
+    __pyx_L4_bool_binop_done:;
+    if (unlikely(!__pyx_t_1)) {
+      __pyx_t_3 = __Pyx_PyInt_From_int(__pyx_v_argb_len); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 102, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_3);
+      __pyx_t_4 = __Pyx_PyString_Format(__pyx_kp_s_invalid_buffer_size_s_is_not_a_m, __pyx_t_3); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 102, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_4);
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      PyErr_SetObject(PyExc_AssertionError, __pyx_t_4);
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+      __PYX_ERR(0, 102, __pyx_L1_error)
+    }
+  }
+  #endif
+
+  /* "xpra/codecs/argb/argb.pyx":103
+ *         return None
+ *     assert argb_len>0 and argb_len % 4 == 0, "invalid buffer size: %s is not a multiple of 4" % argb_len
+ *     rgba = bytearray(argb_len)             # <<<<<<<<<<<<<<
+ *     #number of pixels:
+ *     cdef int i = 0
+ */
+  __pyx_t_4 = __Pyx_PyInt_From_int(__pyx_v_argb_len); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 103, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_3 = __Pyx_PyObject_CallOneArg(((PyObject *)(&PyByteArray_Type)), __pyx_t_4); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 103, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_v_rgba = ((PyObject*)__pyx_t_3);
+  __pyx_t_3 = 0;
+
+  /* "xpra/codecs/argb/argb.pyx":105
+ *     rgba = bytearray(argb_len)
+ *     #number of pixels:
+ *     cdef int i = 0             # <<<<<<<<<<<<<<
+ *     while i < argb_len:
+ *         rgba[i]    = argb[i+1]              #R
+ */
+  __pyx_v_i = 0;
+
+  /* "xpra/codecs/argb/argb.pyx":106
+ *     #number of pixels:
+ *     cdef int i = 0
+ *     while i < argb_len:             # <<<<<<<<<<<<<<
+ *         rgba[i]    = argb[i+1]              #R
+ *         rgba[i+1]  = argb[i+2]              #G
+ */
+  while (1) {
+    __pyx_t_1 = ((__pyx_v_i < __pyx_v_argb_len) != 0);
+    if (!__pyx_t_1) break;
+
+    /* "xpra/codecs/argb/argb.pyx":107
+ *     cdef int i = 0
+ *     while i < argb_len:
+ *         rgba[i]    = argb[i+1]              #R             # <<<<<<<<<<<<<<
+ *         rgba[i+1]  = argb[i+2]              #G
+ *         rgba[i+2]  = argb[i+3]              #B
+ */
+    if (unlikely((__pyx_v_argb[(__pyx_v_i + 1)]) > 255)) {
+      PyErr_SetString(PyExc_ValueError, "byte must be in range(0, 256)"); __PYX_ERR(0, 107, __pyx_L1_error)
+    }
+    if (unlikely(__Pyx_SetItemInt_ByteArray(__pyx_v_rgba, __pyx_v_i, ((unsigned char)(__pyx_v_argb[(__pyx_v_i + 1)])), int, 1, __Pyx_PyInt_From_int, 0, 0, 0) < 0)) __PYX_ERR(0, 107, __pyx_L1_error)
+
+    /* "xpra/codecs/argb/argb.pyx":108
+ *     while i < argb_len:
+ *         rgba[i]    = argb[i+1]              #R
+ *         rgba[i+1]  = argb[i+2]              #G             # <<<<<<<<<<<<<<
+ *         rgba[i+2]  = argb[i+3]              #B
+ *         rgba[i+3]  = argb[i]                #A
+ */
+    __pyx_t_5 = (__pyx_v_i + 1);
+    if (unlikely((__pyx_v_argb[(__pyx_v_i + 2)]) > 255)) {
+      PyErr_SetString(PyExc_ValueError, "byte must be in range(0, 256)"); __PYX_ERR(0, 108, __pyx_L1_error)
+    }
+    if (unlikely(__Pyx_SetItemInt_ByteArray(__pyx_v_rgba, __pyx_t_5, ((unsigned char)(__pyx_v_argb[(__pyx_v_i + 2)])), long, 1, __Pyx_PyInt_From_long, 0, 0, 0) < 0)) __PYX_ERR(0, 108, __pyx_L1_error)
+
+    /* "xpra/codecs/argb/argb.pyx":109
+ *         rgba[i]    = argb[i+1]              #R
+ *         rgba[i+1]  = argb[i+2]              #G
+ *         rgba[i+2]  = argb[i+3]              #B             # <<<<<<<<<<<<<<
+ *         rgba[i+3]  = argb[i]                #A
+ *         i = i + 4
+ */
+    __pyx_t_5 = (__pyx_v_i + 2);
+    if (unlikely((__pyx_v_argb[(__pyx_v_i + 3)]) > 255)) {
+      PyErr_SetString(PyExc_ValueError, "byte must be in range(0, 256)"); __PYX_ERR(0, 109, __pyx_L1_error)
+    }
+    if (unlikely(__Pyx_SetItemInt_ByteArray(__pyx_v_rgba, __pyx_t_5, ((unsigned char)(__pyx_v_argb[(__pyx_v_i + 3)])), long, 1, __Pyx_PyInt_From_long, 0, 0, 0) < 0)) __PYX_ERR(0, 109, __pyx_L1_error)
+
+    /* "xpra/codecs/argb/argb.pyx":110
+ *         rgba[i+1]  = argb[i+2]              #G
+ *         rgba[i+2]  = argb[i+3]              #B
+ *         rgba[i+3]  = argb[i]                #A             # <<<<<<<<<<<<<<
+ *         i = i + 4
+ *     return rgba
+ */
+    __pyx_t_5 = (__pyx_v_i + 3);
+    if (unlikely((__pyx_v_argb[__pyx_v_i]) > 255)) {
+      PyErr_SetString(PyExc_ValueError, "byte must be in range(0, 256)"); __PYX_ERR(0, 110, __pyx_L1_error)
+    }
+    if (unlikely(__Pyx_SetItemInt_ByteArray(__pyx_v_rgba, __pyx_t_5, ((unsigned char)(__pyx_v_argb[__pyx_v_i])), long, 1, __Pyx_PyInt_From_long, 0, 0, 0) < 0)) __PYX_ERR(0, 110, __pyx_L1_error)
+
+    /* "xpra/codecs/argb/argb.pyx":111
+ *         rgba[i+2]  = argb[i+3]              #B
+ *         rgba[i+3]  = argb[i]                #A
+ *         i = i + 4             # <<<<<<<<<<<<<<
+ *     return rgba
+ * 
+ */
+    __pyx_v_i = (__pyx_v_i + 4);
+  }
+
+  /* "xpra/codecs/argb/argb.pyx":112
+ *         rgba[i+3]  = argb[i]                #A
+ *         i = i + 4
+ *     return rgba             # <<<<<<<<<<<<<<
+ * 
+ * def argb_to_rgb(buf):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v_rgba);
+  __pyx_r = __pyx_v_rgba;
+  goto __pyx_L0;
+
+  /* "xpra/codecs/argb/argb.pyx":99
+ *     return argbdata_to_rgba(cbuf, cbuf_len)
+ * 
+ * cdef argbdata_to_rgba(const unsigned char* argb, const int argb_len):             # <<<<<<<<<<<<<<
+ *     if argb_len <= 0:
+ *         return None
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_AddTraceback("xpra.codecs.argb.argb.argbdata_to_rgba", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_rgba);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "xpra/codecs/argb/argb.pyx":114
+ *     return rgba
+ * 
+ * def argb_to_rgb(buf):             # <<<<<<<<<<<<<<
+ *     assert len(buf) % 4 == 0, "invalid buffer size: %s is not a multiple of 4" % len(buf)
+ *     # buf is a Python buffer object
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_4xpra_6codecs_4argb_4argb_9argb_to_rgb(PyObject *__pyx_self, PyObject *__pyx_v_buf); /*proto*/
+static PyMethodDef __pyx_mdef_4xpra_6codecs_4argb_4argb_9argb_to_rgb = {"argb_to_rgb", (PyCFunction)__pyx_pw_4xpra_6codecs_4argb_4argb_9argb_to_rgb, METH_O, 0};
+static PyObject *__pyx_pw_4xpra_6codecs_4argb_4argb_9argb_to_rgb(PyObject *__pyx_self, PyObject *__pyx_v_buf) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("argb_to_rgb (wrapper)", 0);
+  __pyx_r = __pyx_pf_4xpra_6codecs_4argb_4argb_8argb_to_rgb(__pyx_self, ((PyObject *)__pyx_v_buf));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_4xpra_6codecs_4argb_4argb_8argb_to_rgb(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_buf) {
+  unsigned char *__pyx_v_cbuf;
+  Py_ssize_t __pyx_v_cbuf_len;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  Py_ssize_t __pyx_t_1;
+  Py_ssize_t __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("argb_to_rgb", 0);
+
+  /* "xpra/codecs/argb/argb.pyx":115
+ * 
+ * def argb_to_rgb(buf):
+ *     assert len(buf) % 4 == 0, "invalid buffer size: %s is not a multiple of 4" % len(buf)             # <<<<<<<<<<<<<<
+ *     # buf is a Python buffer object
+ *     cdef unsigned char * cbuf = <unsigned char *> 0     #@DuplicateSignature
+ */
+  #ifndef CYTHON_WITHOUT_ASSERTIONS
+  if (unlikely(__pyx_assertions_enabled())) {
+    __pyx_t_1 = PyObject_Length(__pyx_v_buf); if (unlikely(__pyx_t_1 == ((Py_ssize_t)-1))) __PYX_ERR(0, 115, __pyx_L1_error)
+    if (unlikely(!(((__pyx_t_1 % 4) == 0) != 0))) {
+      __pyx_t_2 = PyObject_Length(__pyx_v_buf); if (unlikely(__pyx_t_2 == ((Py_ssize_t)-1))) __PYX_ERR(0, 115, __pyx_L1_error)
+      __pyx_t_3 = PyInt_FromSsize_t(__pyx_t_2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 115, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_3);
+      __pyx_t_4 = __Pyx_PyString_Format(__pyx_kp_s_invalid_buffer_size_s_is_not_a_m, __pyx_t_3); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 115, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_4);
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      PyErr_SetObject(PyExc_AssertionError, __pyx_t_4);
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+      __PYX_ERR(0, 115, __pyx_L1_error)
+    }
+  }
+  #endif
+
+  /* "xpra/codecs/argb/argb.pyx":117
+ *     assert len(buf) % 4 == 0, "invalid buffer size: %s is not a multiple of 4" % len(buf)
+ *     # buf is a Python buffer object
+ *     cdef unsigned char * cbuf = <unsigned char *> 0     #@DuplicateSignature             # <<<<<<<<<<<<<<
+ *     cdef Py_ssize_t cbuf_len = 0                        #@DuplicateSignature
+ *     assert object_as_buffer(buf, <const void**> &cbuf, &cbuf_len)==0, "cannot convert %s to a readable buffer" % type(buf)
+ */
+  __pyx_v_cbuf = ((unsigned char *)0);
+
+  /* "xpra/codecs/argb/argb.pyx":118
+ *     # buf is a Python buffer object
+ *     cdef unsigned char * cbuf = <unsigned char *> 0     #@DuplicateSignature
+ *     cdef Py_ssize_t cbuf_len = 0                        #@DuplicateSignature             # <<<<<<<<<<<<<<
+ *     assert object_as_buffer(buf, <const void**> &cbuf, &cbuf_len)==0, "cannot convert %s to a readable buffer" % type(buf)
+ *     return argbdata_to_rgb(cbuf, cbuf_len)
+ */
+  __pyx_v_cbuf_len = 0;
+
+  /* "xpra/codecs/argb/argb.pyx":119
+ *     cdef unsigned char * cbuf = <unsigned char *> 0     #@DuplicateSignature
+ *     cdef Py_ssize_t cbuf_len = 0                        #@DuplicateSignature
+ *     assert object_as_buffer(buf, <const void**> &cbuf, &cbuf_len)==0, "cannot convert %s to a readable buffer" % type(buf)             # <<<<<<<<<<<<<<
+ *     return argbdata_to_rgb(cbuf, cbuf_len)
+ * 
+ */
+  #ifndef CYTHON_WITHOUT_ASSERTIONS
+  if (unlikely(__pyx_assertions_enabled())) {
+    if (unlikely(!((object_as_buffer(__pyx_v_buf, ((void const **)(&__pyx_v_cbuf)), (&__pyx_v_cbuf_len)) == 0) != 0))) {
+      __pyx_t_4 = __Pyx_PyString_FormatSafe(__pyx_kp_s_cannot_convert_s_to_a_readable_b, ((PyObject *)Py_TYPE(__pyx_v_buf))); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 119, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_4);
+      PyErr_SetObject(PyExc_AssertionError, __pyx_t_4);
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+      __PYX_ERR(0, 119, __pyx_L1_error)
+    }
+  }
+  #endif
+
+  /* "xpra/codecs/argb/argb.pyx":120
+ *     cdef Py_ssize_t cbuf_len = 0                        #@DuplicateSignature
+ *     assert object_as_buffer(buf, <const void**> &cbuf, &cbuf_len)==0, "cannot convert %s to a readable buffer" % type(buf)
+ *     return argbdata_to_rgb(cbuf, cbuf_len)             # <<<<<<<<<<<<<<
+ * 
+ * cdef argbdata_to_rgb(const unsigned char *argb, const int argb_len):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_4 = __pyx_f_4xpra_6codecs_4argb_4argb_argbdata_to_rgb(__pyx_v_cbuf, __pyx_v_cbuf_len); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 120, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_r = __pyx_t_4;
+  __pyx_t_4 = 0;
+  goto __pyx_L0;
+
+  /* "xpra/codecs/argb/argb.pyx":114
+ *     return rgba
+ * 
+ * def argb_to_rgb(buf):             # <<<<<<<<<<<<<<
+ *     assert len(buf) % 4 == 0, "invalid buffer size: %s is not a multiple of 4" % len(buf)
+ *     # buf is a Python buffer object
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_AddTraceback("xpra.codecs.argb.argb.argb_to_rgb", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "xpra/codecs/argb/argb.pyx":122
+ *     return argbdata_to_rgb(cbuf, cbuf_len)
+ * 
+ * cdef argbdata_to_rgb(const unsigned char *argb, const int argb_len):             # <<<<<<<<<<<<<<
+ *     if argb_len <= 0:
+ *         return None
+ */
+
+static PyObject *__pyx_f_4xpra_6codecs_4argb_4argb_argbdata_to_rgb(unsigned char const *__pyx_v_argb, int const __pyx_v_argb_len) {
+  unsigned int __pyx_v_mi;
+  PyObject *__pyx_v_rgb = NULL;
+  int __pyx_v_i;
+  int __pyx_v_di;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  long __pyx_t_5;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("argbdata_to_rgb", 0);
+
+  /* "xpra/codecs/argb/argb.pyx":123
+ * 
+ * cdef argbdata_to_rgb(const unsigned char *argb, const int argb_len):
+ *     if argb_len <= 0:             # <<<<<<<<<<<<<<
+ *         return None
+ *     assert argb_len>0 and argb_len % 4 == 0, "invalid buffer size: %s is not a multiple of 4" % argb_len
+ */
+  __pyx_t_1 = ((__pyx_v_argb_len <= 0) != 0);
+  if (__pyx_t_1) {
+
+    /* "xpra/codecs/argb/argb.pyx":124
+ * cdef argbdata_to_rgb(const unsigned char *argb, const int argb_len):
+ *     if argb_len <= 0:
+ *         return None             # <<<<<<<<<<<<<<
+ *     assert argb_len>0 and argb_len % 4 == 0, "invalid buffer size: %s is not a multiple of 4" % argb_len
+ *     #number of pixels:
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+    goto __pyx_L0;
+
+    /* "xpra/codecs/argb/argb.pyx":123
+ * 
+ * cdef argbdata_to_rgb(const unsigned char *argb, const int argb_len):
+ *     if argb_len <= 0:             # <<<<<<<<<<<<<<
+ *         return None
+ *     assert argb_len>0 and argb_len % 4 == 0, "invalid buffer size: %s is not a multiple of 4" % argb_len
+ */
+  }
+
+  /* "xpra/codecs/argb/argb.pyx":125
+ *     if argb_len <= 0:
+ *         return None
+ *     assert argb_len>0 and argb_len % 4 == 0, "invalid buffer size: %s is not a multiple of 4" % argb_len             # <<<<<<<<<<<<<<
+ *     #number of pixels:
+ *     cdef unsigned int mi = argb_len//4                #@DuplicateSignature
+ */
+  #ifndef CYTHON_WITHOUT_ASSERTIONS
+  if (unlikely(__pyx_assertions_enabled())) {
+    __pyx_t_2 = ((__pyx_v_argb_len > 0) != 0);
+    if (__pyx_t_2) {
+    } else {
+      __pyx_t_1 = __pyx_t_2;
+      goto __pyx_L4_bool_binop_done;
+    }
+    __pyx_t_2 = (((__pyx_v_argb_len % 4) == 0) != 0);
+    __pyx_t_1 = __pyx_t_2;
+    __pyx_L4_bool_binop_done:;
+    if (unlikely(!__pyx_t_1)) {
+      __pyx_t_3 = __Pyx_PyInt_From_int(__pyx_v_argb_len); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 125, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_3);
+      __pyx_t_4 = __Pyx_PyString_Format(__pyx_kp_s_invalid_buffer_size_s_is_not_a_m, __pyx_t_3); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 125, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_4);
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      PyErr_SetObject(PyExc_AssertionError, __pyx_t_4);
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+      __PYX_ERR(0, 125, __pyx_L1_error)
+    }
+  }
+  #endif
+
+  /* "xpra/codecs/argb/argb.pyx":127
+ *     assert argb_len>0 and argb_len % 4 == 0, "invalid buffer size: %s is not a multiple of 4" % argb_len
+ *     #number of pixels:
+ *     cdef unsigned int mi = argb_len//4                #@DuplicateSignature             # <<<<<<<<<<<<<<
+ *     #3 bytes per pixel:
+ *     rgb = bytearray(mi*3)
+ */
+  __pyx_v_mi = (__pyx_v_argb_len / 4);
+
+  /* "xpra/codecs/argb/argb.pyx":129
+ *     cdef unsigned int mi = argb_len//4                #@DuplicateSignature
+ *     #3 bytes per pixel:
+ *     rgb = bytearray(mi*3)             # <<<<<<<<<<<<<<
+ *     cdef int i = 0, di = 0                          #@DuplicateSignature
+ *     while i < argb_len:
+ */
+  __pyx_t_4 = __Pyx_PyInt_From_long((__pyx_v_mi * 3)); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 129, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_3 = __Pyx_PyObject_CallOneArg(((PyObject *)(&PyByteArray_Type)), __pyx_t_4); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 129, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_v_rgb = ((PyObject*)__pyx_t_3);
+  __pyx_t_3 = 0;
+
+  /* "xpra/codecs/argb/argb.pyx":130
+ *     #3 bytes per pixel:
+ *     rgb = bytearray(mi*3)
+ *     cdef int i = 0, di = 0                          #@DuplicateSignature             # <<<<<<<<<<<<<<
+ *     while i < argb_len:
+ *         rgb[di]   = argb[i+1]               #R
+ */
+  __pyx_v_i = 0;
+  __pyx_v_di = 0;
+
+  /* "xpra/codecs/argb/argb.pyx":131
+ *     rgb = bytearray(mi*3)
+ *     cdef int i = 0, di = 0                          #@DuplicateSignature
+ *     while i < argb_len:             # <<<<<<<<<<<<<<
+ *         rgb[di]   = argb[i+1]               #R
+ *         rgb[di+1] = argb[i+2]               #G
+ */
+  while (1) {
+    __pyx_t_1 = ((__pyx_v_i < __pyx_v_argb_len) != 0);
+    if (!__pyx_t_1) break;
+
+    /* "xpra/codecs/argb/argb.pyx":132
+ *     cdef int i = 0, di = 0                          #@DuplicateSignature
+ *     while i < argb_len:
+ *         rgb[di]   = argb[i+1]               #R             # <<<<<<<<<<<<<<
+ *         rgb[di+1] = argb[i+2]               #G
+ *         rgb[di+2] = argb[i+3]               #B
+ */
+    if (unlikely((__pyx_v_argb[(__pyx_v_i + 1)]) > 255)) {
+      PyErr_SetString(PyExc_ValueError, "byte must be in range(0, 256)"); __PYX_ERR(0, 132, __pyx_L1_error)
+    }
+    if (unlikely(__Pyx_SetItemInt_ByteArray(__pyx_v_rgb, __pyx_v_di, ((unsigned char)(__pyx_v_argb[(__pyx_v_i + 1)])), int, 1, __Pyx_PyInt_From_int, 0, 0, 0) < 0)) __PYX_ERR(0, 132, __pyx_L1_error)
+
+    /* "xpra/codecs/argb/argb.pyx":133
+ *     while i < argb_len:
+ *         rgb[di]   = argb[i+1]               #R
+ *         rgb[di+1] = argb[i+2]               #G             # <<<<<<<<<<<<<<
+ *         rgb[di+2] = argb[i+3]               #B
+ *         di += 3
+ */
+    __pyx_t_5 = (__pyx_v_di + 1);
+    if (unlikely((__pyx_v_argb[(__pyx_v_i + 2)]) > 255)) {
+      PyErr_SetString(PyExc_ValueError, "byte must be in range(0, 256)"); __PYX_ERR(0, 133, __pyx_L1_error)
+    }
+    if (unlikely(__Pyx_SetItemInt_ByteArray(__pyx_v_rgb, __pyx_t_5, ((unsigned char)(__pyx_v_argb[(__pyx_v_i + 2)])), long, 1, __Pyx_PyInt_From_long, 0, 0, 0) < 0)) __PYX_ERR(0, 133, __pyx_L1_error)
+
+    /* "xpra/codecs/argb/argb.pyx":134
+ *         rgb[di]   = argb[i+1]               #R
+ *         rgb[di+1] = argb[i+2]               #G
+ *         rgb[di+2] = argb[i+3]               #B             # <<<<<<<<<<<<<<
+ *         di += 3
+ *         i += 4
+ */
+    __pyx_t_5 = (__pyx_v_di + 2);
+    if (unlikely((__pyx_v_argb[(__pyx_v_i + 3)]) > 255)) {
+      PyErr_SetString(PyExc_ValueError, "byte must be in range(0, 256)"); __PYX_ERR(0, 134, __pyx_L1_error)
+    }
+    if (unlikely(__Pyx_SetItemInt_ByteArray(__pyx_v_rgb, __pyx_t_5, ((unsigned char)(__pyx_v_argb[(__pyx_v_i + 3)])), long, 1, __Pyx_PyInt_From_long, 0, 0, 0) < 0)) __PYX_ERR(0, 134, __pyx_L1_error)
+
+    /* "xpra/codecs/argb/argb.pyx":135
+ *         rgb[di+1] = argb[i+2]               #G
+ *         rgb[di+2] = argb[i+3]               #B
+ *         di += 3             # <<<<<<<<<<<<<<
+ *         i += 4
+ *     return rgb
+ */
+    __pyx_v_di = (__pyx_v_di + 3);
+
+    /* "xpra/codecs/argb/argb.pyx":136
+ *         rgb[di+2] = argb[i+3]               #B
+ *         di += 3
+ *         i += 4             # <<<<<<<<<<<<<<
+ *     return rgb
+ * 
+ */
+    __pyx_v_i = (__pyx_v_i + 4);
+  }
+
+  /* "xpra/codecs/argb/argb.pyx":137
+ *         di += 3
+ *         i += 4
+ *     return rgb             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v_rgb);
+  __pyx_r = __pyx_v_rgb;
+  goto __pyx_L0;
+
+  /* "xpra/codecs/argb/argb.pyx":122
+ *     return argbdata_to_rgb(cbuf, cbuf_len)
+ * 
+ * cdef argbdata_to_rgb(const unsigned char *argb, const int argb_len):             # <<<<<<<<<<<<<<
+ *     if argb_len <= 0:
+ *         return None
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_AddTraceback("xpra.codecs.argb.argb.argbdata_to_rgb", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_rgb);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "xpra/codecs/argb/argb.pyx":140
+ * 
+ * 
+ * def bgra_to_rgb(buf):             # <<<<<<<<<<<<<<
+ *     assert len(buf) % 4 == 0, "invalid buffer size: %s is not a multiple of 4" % len(buf)
+ *     # buf is a Python buffer object
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_4xpra_6codecs_4argb_4argb_11bgra_to_rgb(PyObject *__pyx_self, PyObject *__pyx_v_buf); /*proto*/
+static PyMethodDef __pyx_mdef_4xpra_6codecs_4argb_4argb_11bgra_to_rgb = {"bgra_to_rgb", (PyCFunction)__pyx_pw_4xpra_6codecs_4argb_4argb_11bgra_to_rgb, METH_O, 0};
+static PyObject *__pyx_pw_4xpra_6codecs_4argb_4argb_11bgra_to_rgb(PyObject *__pyx_self, PyObject *__pyx_v_buf) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("bgra_to_rgb (wrapper)", 0);
+  __pyx_r = __pyx_pf_4xpra_6codecs_4argb_4argb_10bgra_to_rgb(__pyx_self, ((PyObject *)__pyx_v_buf));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_4xpra_6codecs_4argb_4argb_10bgra_to_rgb(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_buf) {
+  unsigned char *__pyx_v_bgra_buf;
+  Py_ssize_t __pyx_v_bgra_buf_len;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  Py_ssize_t __pyx_t_1;
+  Py_ssize_t __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("bgra_to_rgb", 0);
+
+  /* "xpra/codecs/argb/argb.pyx":141
+ * 
+ * def bgra_to_rgb(buf):
+ *     assert len(buf) % 4 == 0, "invalid buffer size: %s is not a multiple of 4" % len(buf)             # <<<<<<<<<<<<<<
+ *     # buf is a Python buffer object
+ *     cdef unsigned char * bgra_buf = NULL    #@DuplicateSignature
+ */
+  #ifndef CYTHON_WITHOUT_ASSERTIONS
+  if (unlikely(__pyx_assertions_enabled())) {
+    __pyx_t_1 = PyObject_Length(__pyx_v_buf); if (unlikely(__pyx_t_1 == ((Py_ssize_t)-1))) __PYX_ERR(0, 141, __pyx_L1_error)
+    if (unlikely(!(((__pyx_t_1 % 4) == 0) != 0))) {
+      __pyx_t_2 = PyObject_Length(__pyx_v_buf); if (unlikely(__pyx_t_2 == ((Py_ssize_t)-1))) __PYX_ERR(0, 141, __pyx_L1_error)
+      __pyx_t_3 = PyInt_FromSsize_t(__pyx_t_2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 141, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_3);
+      __pyx_t_4 = __Pyx_PyString_Format(__pyx_kp_s_invalid_buffer_size_s_is_not_a_m, __pyx_t_3); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 141, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_4);
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      PyErr_SetObject(PyExc_AssertionError, __pyx_t_4);
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+      __PYX_ERR(0, 141, __pyx_L1_error)
+    }
+  }
+  #endif
+
+  /* "xpra/codecs/argb/argb.pyx":143
+ *     assert len(buf) % 4 == 0, "invalid buffer size: %s is not a multiple of 4" % len(buf)
+ *     # buf is a Python buffer object
+ *     cdef unsigned char * bgra_buf = NULL    #@DuplicateSignature             # <<<<<<<<<<<<<<
+ *     cdef Py_ssize_t bgra_buf_len = 0        #@DuplicateSignature
+ *     assert object_as_buffer(buf, <const void**> &bgra_buf, &bgra_buf_len)==0, "cannot convert %s to a readable buffer" % type(buf)
+ */
+  __pyx_v_bgra_buf = NULL;
+
+  /* "xpra/codecs/argb/argb.pyx":144
+ *     # buf is a Python buffer object
+ *     cdef unsigned char * bgra_buf = NULL    #@DuplicateSignature
+ *     cdef Py_ssize_t bgra_buf_len = 0        #@DuplicateSignature             # <<<<<<<<<<<<<<
+ *     assert object_as_buffer(buf, <const void**> &bgra_buf, &bgra_buf_len)==0, "cannot convert %s to a readable buffer" % type(buf)
+ *     return bgradata_to_rgb(bgra_buf, bgra_buf_len)
+ */
+  __pyx_v_bgra_buf_len = 0;
+
+  /* "xpra/codecs/argb/argb.pyx":145
+ *     cdef unsigned char * bgra_buf = NULL    #@DuplicateSignature
+ *     cdef Py_ssize_t bgra_buf_len = 0        #@DuplicateSignature
+ *     assert object_as_buffer(buf, <const void**> &bgra_buf, &bgra_buf_len)==0, "cannot convert %s to a readable buffer" % type(buf)             # <<<<<<<<<<<<<<
+ *     return bgradata_to_rgb(bgra_buf, bgra_buf_len)
+ * 
+ */
+  #ifndef CYTHON_WITHOUT_ASSERTIONS
+  if (unlikely(__pyx_assertions_enabled())) {
+    if (unlikely(!((object_as_buffer(__pyx_v_buf, ((void const **)(&__pyx_v_bgra_buf)), (&__pyx_v_bgra_buf_len)) == 0) != 0))) {
+      __pyx_t_4 = __Pyx_PyString_FormatSafe(__pyx_kp_s_cannot_convert_s_to_a_readable_b, ((PyObject *)Py_TYPE(__pyx_v_buf))); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 145, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_4);
+      PyErr_SetObject(PyExc_AssertionError, __pyx_t_4);
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+      __PYX_ERR(0, 145, __pyx_L1_error)
+    }
+  }
+  #endif
+
+  /* "xpra/codecs/argb/argb.pyx":146
+ *     cdef Py_ssize_t bgra_buf_len = 0        #@DuplicateSignature
+ *     assert object_as_buffer(buf, <const void**> &bgra_buf, &bgra_buf_len)==0, "cannot convert %s to a readable buffer" % type(buf)
+ *     return bgradata_to_rgb(bgra_buf, bgra_buf_len)             # <<<<<<<<<<<<<<
+ * 
+ * cdef bgradata_to_rgb(const unsigned char* bgra, const int bgra_len):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_4 = __pyx_f_4xpra_6codecs_4argb_4argb_bgradata_to_rgb(__pyx_v_bgra_buf, __pyx_v_bgra_buf_len); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 146, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_r = __pyx_t_4;
+  __pyx_t_4 = 0;
+  goto __pyx_L0;
+
+  /* "xpra/codecs/argb/argb.pyx":140
+ * 
+ * 
+ * def bgra_to_rgb(buf):             # <<<<<<<<<<<<<<
+ *     assert len(buf) % 4 == 0, "invalid buffer size: %s is not a multiple of 4" % len(buf)
+ *     # buf is a Python buffer object
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_AddTraceback("xpra.codecs.argb.argb.bgra_to_rgb", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "xpra/codecs/argb/argb.pyx":148
+ *     return bgradata_to_rgb(bgra_buf, bgra_buf_len)
+ * 
+ * cdef bgradata_to_rgb(const unsigned char* bgra, const int bgra_len):             # <<<<<<<<<<<<<<
+ *     if bgra_len <= 0:
+ *         return None
+ */
+
+static PyObject *__pyx_f_4xpra_6codecs_4argb_4argb_bgradata_to_rgb(unsigned char const *__pyx_v_bgra, int const __pyx_v_bgra_len) {
+  int __pyx_v_mi;
+  PyObject *__pyx_v_rgb = NULL;
+  int __pyx_v_di;
+  int __pyx_v_si;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  long __pyx_t_5;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("bgradata_to_rgb", 0);
+
+  /* "xpra/codecs/argb/argb.pyx":149
+ * 
+ * cdef bgradata_to_rgb(const unsigned char* bgra, const int bgra_len):
+ *     if bgra_len <= 0:             # <<<<<<<<<<<<<<
+ *         return None
+ *     assert bgra_len>0 and bgra_len % 4 == 0, "invalid buffer size: %s is not a multiple of 4" % bgra_len
+ */
+  __pyx_t_1 = ((__pyx_v_bgra_len <= 0) != 0);
+  if (__pyx_t_1) {
+
+    /* "xpra/codecs/argb/argb.pyx":150
+ * cdef bgradata_to_rgb(const unsigned char* bgra, const int bgra_len):
+ *     if bgra_len <= 0:
+ *         return None             # <<<<<<<<<<<<<<
+ *     assert bgra_len>0 and bgra_len % 4 == 0, "invalid buffer size: %s is not a multiple of 4" % bgra_len
+ *     #number of pixels:
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+    goto __pyx_L0;
+
+    /* "xpra/codecs/argb/argb.pyx":149
+ * 
+ * cdef bgradata_to_rgb(const unsigned char* bgra, const int bgra_len):
+ *     if bgra_len <= 0:             # <<<<<<<<<<<<<<
+ *         return None
+ *     assert bgra_len>0 and bgra_len % 4 == 0, "invalid buffer size: %s is not a multiple of 4" % bgra_len
+ */
+  }
+
+  /* "xpra/codecs/argb/argb.pyx":151
+ *     if bgra_len <= 0:
+ *         return None
+ *     assert bgra_len>0 and bgra_len % 4 == 0, "invalid buffer size: %s is not a multiple of 4" % bgra_len             # <<<<<<<<<<<<<<
+ *     #number of pixels:
+ *     cdef int mi = bgra_len//4                #@DuplicateSignature
+ */
+  #ifndef CYTHON_WITHOUT_ASSERTIONS
+  if (unlikely(__pyx_assertions_enabled())) {
+    __pyx_t_2 = ((__pyx_v_bgra_len > 0) != 0);
+    if (__pyx_t_2) {
+    } else {
+      __pyx_t_1 = __pyx_t_2;
+      goto __pyx_L4_bool_binop_done;
+    }
+    __pyx_t_2 = (((__pyx_v_bgra_len % 4) == 0) != 0);
+    __pyx_t_1 = __pyx_t_2;
+    __pyx_L4_bool_binop_done:;
+    if (unlikely(!__pyx_t_1)) {
+      __pyx_t_3 = __Pyx_PyInt_From_int(__pyx_v_bgra_len); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 151, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_3);
+      __pyx_t_4 = __Pyx_PyString_Format(__pyx_kp_s_invalid_buffer_size_s_is_not_a_m, __pyx_t_3); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 151, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_4);
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      PyErr_SetObject(PyExc_AssertionError, __pyx_t_4);
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+      __PYX_ERR(0, 151, __pyx_L1_error)
+    }
+  }
+  #endif
+
+  /* "xpra/codecs/argb/argb.pyx":153
+ *     assert bgra_len>0 and bgra_len % 4 == 0, "invalid buffer size: %s is not a multiple of 4" % bgra_len
+ *     #number of pixels:
+ *     cdef int mi = bgra_len//4                #@DuplicateSignature             # <<<<<<<<<<<<<<
+ *     #3 bytes per pixel:
+ *     rgb = bytearray(mi*3)
+ */
+  __pyx_v_mi = (__pyx_v_bgra_len / 4);
+
+  /* "xpra/codecs/argb/argb.pyx":155
+ *     cdef int mi = bgra_len//4                #@DuplicateSignature
+ *     #3 bytes per pixel:
+ *     rgb = bytearray(mi*3)             # <<<<<<<<<<<<<<
+ *     cdef int di = 0, si = 0                  #@DuplicateSignature
+ *     while si < bgra_len:
+ */
+  __pyx_t_4 = __Pyx_PyInt_From_long((__pyx_v_mi * 3)); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 155, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_3 = __Pyx_PyObject_CallOneArg(((PyObject *)(&PyByteArray_Type)), __pyx_t_4); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 155, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_v_rgb = ((PyObject*)__pyx_t_3);
+  __pyx_t_3 = 0;
+
+  /* "xpra/codecs/argb/argb.pyx":156
+ *     #3 bytes per pixel:
+ *     rgb = bytearray(mi*3)
+ *     cdef int di = 0, si = 0                  #@DuplicateSignature             # <<<<<<<<<<<<<<
+ *     while si < bgra_len:
+ *         rgb[di]   = bgra[si+2]              #R
+ */
+  __pyx_v_di = 0;
+  __pyx_v_si = 0;
+
+  /* "xpra/codecs/argb/argb.pyx":157
+ *     rgb = bytearray(mi*3)
+ *     cdef int di = 0, si = 0                  #@DuplicateSignature
+ *     while si < bgra_len:             # <<<<<<<<<<<<<<
+ *         rgb[di]   = bgra[si+2]              #R
+ *         rgb[di+1] = bgra[si+1]              #G
+ */
+  while (1) {
+    __pyx_t_1 = ((__pyx_v_si < __pyx_v_bgra_len) != 0);
+    if (!__pyx_t_1) break;
+
+    /* "xpra/codecs/argb/argb.pyx":158
+ *     cdef int di = 0, si = 0                  #@DuplicateSignature
+ *     while si < bgra_len:
+ *         rgb[di]   = bgra[si+2]              #R             # <<<<<<<<<<<<<<
+ *         rgb[di+1] = bgra[si+1]              #G
+ *         rgb[di+2] = bgra[si]                #B
+ */
+    if (unlikely((__pyx_v_bgra[(__pyx_v_si + 2)]) > 255)) {
+      PyErr_SetString(PyExc_ValueError, "byte must be in range(0, 256)"); __PYX_ERR(0, 158, __pyx_L1_error)
+    }
+    if (unlikely(__Pyx_SetItemInt_ByteArray(__pyx_v_rgb, __pyx_v_di, ((unsigned char)(__pyx_v_bgra[(__pyx_v_si + 2)])), int, 1, __Pyx_PyInt_From_int, 0, 0, 0) < 0)) __PYX_ERR(0, 158, __pyx_L1_error)
+
+    /* "xpra/codecs/argb/argb.pyx":159
+ *     while si < bgra_len:
+ *         rgb[di]   = bgra[si+2]              #R
+ *         rgb[di+1] = bgra[si+1]              #G             # <<<<<<<<<<<<<<
+ *         rgb[di+2] = bgra[si]                #B
+ *         di += 3
+ */
+    __pyx_t_5 = (__pyx_v_di + 1);
+    if (unlikely((__pyx_v_bgra[(__pyx_v_si + 1)]) > 255)) {
+      PyErr_SetString(PyExc_ValueError, "byte must be in range(0, 256)"); __PYX_ERR(0, 159, __pyx_L1_error)
+    }
+    if (unlikely(__Pyx_SetItemInt_ByteArray(__pyx_v_rgb, __pyx_t_5, ((unsigned char)(__pyx_v_bgra[(__pyx_v_si + 1)])), long, 1, __Pyx_PyInt_From_long, 0, 0, 0) < 0)) __PYX_ERR(0, 159, __pyx_L1_error)
+
+    /* "xpra/codecs/argb/argb.pyx":160
+ *         rgb[di]   = bgra[si+2]              #R
+ *         rgb[di+1] = bgra[si+1]              #G
+ *         rgb[di+2] = bgra[si]                #B             # <<<<<<<<<<<<<<
+ *         di += 3
+ *         si += 4
+ */
+    __pyx_t_5 = (__pyx_v_di + 2);
+    if (unlikely((__pyx_v_bgra[__pyx_v_si]) > 255)) {
+      PyErr_SetString(PyExc_ValueError, "byte must be in range(0, 256)"); __PYX_ERR(0, 160, __pyx_L1_error)
+    }
+    if (unlikely(__Pyx_SetItemInt_ByteArray(__pyx_v_rgb, __pyx_t_5, ((unsigned char)(__pyx_v_bgra[__pyx_v_si])), long, 1, __Pyx_PyInt_From_long, 0, 0, 0) < 0)) __PYX_ERR(0, 160, __pyx_L1_error)
+
+    /* "xpra/codecs/argb/argb.pyx":161
+ *         rgb[di+1] = bgra[si+1]              #G
+ *         rgb[di+2] = bgra[si]                #B
+ *         di += 3             # <<<<<<<<<<<<<<
+ *         si += 4
+ *     return rgb
+ */
+    __pyx_v_di = (__pyx_v_di + 3);
+
+    /* "xpra/codecs/argb/argb.pyx":162
+ *         rgb[di+2] = bgra[si]                #B
+ *         di += 3
+ *         si += 4             # <<<<<<<<<<<<<<
+ *     return rgb
+ * 
+ */
+    __pyx_v_si = (__pyx_v_si + 4);
+  }
+
+  /* "xpra/codecs/argb/argb.pyx":163
+ *         di += 3
+ *         si += 4
+ *     return rgb             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v_rgb);
+  __pyx_r = __pyx_v_rgb;
+  goto __pyx_L0;
+
+  /* "xpra/codecs/argb/argb.pyx":148
+ *     return bgradata_to_rgb(bgra_buf, bgra_buf_len)
+ * 
+ * cdef bgradata_to_rgb(const unsigned char* bgra, const int bgra_len):             # <<<<<<<<<<<<<<
+ *     if bgra_len <= 0:
+ *         return None
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_AddTraceback("xpra.codecs.argb.argb.bgradata_to_rgb", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_rgb);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "xpra/codecs/argb/argb.pyx":166
+ * 
+ * 
+ * def bgra_to_rgba(buf):             # <<<<<<<<<<<<<<
+ *     assert len(buf) % 4 == 0, "invalid buffer size: %s is not a multiple of 4" % len(buf)
+ *     # buf is a Python buffer object
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_4xpra_6codecs_4argb_4argb_13bgra_to_rgba(PyObject *__pyx_self, PyObject *__pyx_v_buf); /*proto*/
+static PyMethodDef __pyx_mdef_4xpra_6codecs_4argb_4argb_13bgra_to_rgba = {"bgra_to_rgba", (PyCFunction)__pyx_pw_4xpra_6codecs_4argb_4argb_13bgra_to_rgba, METH_O, 0};
+static PyObject *__pyx_pw_4xpra_6codecs_4argb_4argb_13bgra_to_rgba(PyObject *__pyx_self, PyObject *__pyx_v_buf) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("bgra_to_rgba (wrapper)", 0);
+  __pyx_r = __pyx_pf_4xpra_6codecs_4argb_4argb_12bgra_to_rgba(__pyx_self, ((PyObject *)__pyx_v_buf));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_4xpra_6codecs_4argb_4argb_12bgra_to_rgba(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_buf) {
+  unsigned char *__pyx_v_bgra_buf2;
+  Py_ssize_t __pyx_v_bgra_buf_len2;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  Py_ssize_t __pyx_t_1;
+  Py_ssize_t __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("bgra_to_rgba", 0);
+
+  /* "xpra/codecs/argb/argb.pyx":167
+ * 
+ * def bgra_to_rgba(buf):
+ *     assert len(buf) % 4 == 0, "invalid buffer size: %s is not a multiple of 4" % len(buf)             # <<<<<<<<<<<<<<
+ *     # buf is a Python buffer object
+ *     cdef unsigned char * bgra_buf2 = NULL
+ */
+  #ifndef CYTHON_WITHOUT_ASSERTIONS
+  if (unlikely(__pyx_assertions_enabled())) {
+    __pyx_t_1 = PyObject_Length(__pyx_v_buf); if (unlikely(__pyx_t_1 == ((Py_ssize_t)-1))) __PYX_ERR(0, 167, __pyx_L1_error)
+    if (unlikely(!(((__pyx_t_1 % 4) == 0) != 0))) {
+      __pyx_t_2 = PyObject_Length(__pyx_v_buf); if (unlikely(__pyx_t_2 == ((Py_ssize_t)-1))) __PYX_ERR(0, 167, __pyx_L1_error)
+      __pyx_t_3 = PyInt_FromSsize_t(__pyx_t_2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 167, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_3);
+      __pyx_t_4 = __Pyx_PyString_Format(__pyx_kp_s_invalid_buffer_size_s_is_not_a_m, __pyx_t_3); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 167, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_4);
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      PyErr_SetObject(PyExc_AssertionError, __pyx_t_4);
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+      __PYX_ERR(0, 167, __pyx_L1_error)
+    }
+  }
+  #endif
+
+  /* "xpra/codecs/argb/argb.pyx":169
+ *     assert len(buf) % 4 == 0, "invalid buffer size: %s is not a multiple of 4" % len(buf)
+ *     # buf is a Python buffer object
+ *     cdef unsigned char * bgra_buf2 = NULL             # <<<<<<<<<<<<<<
+ *     cdef Py_ssize_t bgra_buf_len2 = 0
+ *     assert object_as_buffer(buf, <const void**> &bgra_buf2, &bgra_buf_len2)==0, "cannot convert %s to a readable buffer" % type(buf)
+ */
+  __pyx_v_bgra_buf2 = NULL;
+
+  /* "xpra/codecs/argb/argb.pyx":170
+ *     # buf is a Python buffer object
+ *     cdef unsigned char * bgra_buf2 = NULL
+ *     cdef Py_ssize_t bgra_buf_len2 = 0             # <<<<<<<<<<<<<<
+ *     assert object_as_buffer(buf, <const void**> &bgra_buf2, &bgra_buf_len2)==0, "cannot convert %s to a readable buffer" % type(buf)
+ *     return bgradata_to_rgba(bgra_buf2, bgra_buf_len2)
+ */
+  __pyx_v_bgra_buf_len2 = 0;
+
+  /* "xpra/codecs/argb/argb.pyx":171
+ *     cdef unsigned char * bgra_buf2 = NULL
+ *     cdef Py_ssize_t bgra_buf_len2 = 0
+ *     assert object_as_buffer(buf, <const void**> &bgra_buf2, &bgra_buf_len2)==0, "cannot convert %s to a readable buffer" % type(buf)             # <<<<<<<<<<<<<<
+ *     return bgradata_to_rgba(bgra_buf2, bgra_buf_len2)
+ * 
+ */
+  #ifndef CYTHON_WITHOUT_ASSERTIONS
+  if (unlikely(__pyx_assertions_enabled())) {
+    if (unlikely(!((object_as_buffer(__pyx_v_buf, ((void const **)(&__pyx_v_bgra_buf2)), (&__pyx_v_bgra_buf_len2)) == 0) != 0))) {
+      __pyx_t_4 = __Pyx_PyString_FormatSafe(__pyx_kp_s_cannot_convert_s_to_a_readable_b, ((PyObject *)Py_TYPE(__pyx_v_buf))); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 171, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_4);
+      PyErr_SetObject(PyExc_AssertionError, __pyx_t_4);
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+      __PYX_ERR(0, 171, __pyx_L1_error)
+    }
+  }
+  #endif
+
+  /* "xpra/codecs/argb/argb.pyx":172
+ *     cdef Py_ssize_t bgra_buf_len2 = 0
+ *     assert object_as_buffer(buf, <const void**> &bgra_buf2, &bgra_buf_len2)==0, "cannot convert %s to a readable buffer" % type(buf)
+ *     return bgradata_to_rgba(bgra_buf2, bgra_buf_len2)             # <<<<<<<<<<<<<<
+ * 
+ * cdef bgradata_to_rgba(const unsigned char* bgra, const int bgra_len):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_4 = __pyx_f_4xpra_6codecs_4argb_4argb_bgradata_to_rgba(__pyx_v_bgra_buf2, __pyx_v_bgra_buf_len2); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 172, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_r = __pyx_t_4;
+  __pyx_t_4 = 0;
+  goto __pyx_L0;
+
+  /* "xpra/codecs/argb/argb.pyx":166
+ * 
+ * 
+ * def bgra_to_rgba(buf):             # <<<<<<<<<<<<<<
+ *     assert len(buf) % 4 == 0, "invalid buffer size: %s is not a multiple of 4" % len(buf)
+ *     # buf is a Python buffer object
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_AddTraceback("xpra.codecs.argb.argb.bgra_to_rgba", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "xpra/codecs/argb/argb.pyx":174
+ *     return bgradata_to_rgba(bgra_buf2, bgra_buf_len2)
+ * 
+ * cdef bgradata_to_rgba(const unsigned char* bgra, const int bgra_len):             # <<<<<<<<<<<<<<
+ *     if bgra_len <= 0:
+ *         return None
+ */
+
+static PyObject *__pyx_f_4xpra_6codecs_4argb_4argb_bgradata_to_rgba(unsigned char const *__pyx_v_bgra, int const __pyx_v_bgra_len) {
+  PyObject *__pyx_v_rgba = NULL;
+  int __pyx_v_i;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  long __pyx_t_5;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("bgradata_to_rgba", 0);
+
+  /* "xpra/codecs/argb/argb.pyx":175
+ * 
+ * cdef bgradata_to_rgba(const unsigned char* bgra, const int bgra_len):
+ *     if bgra_len <= 0:             # <<<<<<<<<<<<<<
+ *         return None
+ *     assert bgra_len>0 and bgra_len % 4 == 0, "invalid buffer size: %s is not a multiple of 4" % bgra_len
+ */
+  __pyx_t_1 = ((__pyx_v_bgra_len <= 0) != 0);
+  if (__pyx_t_1) {
+
+    /* "xpra/codecs/argb/argb.pyx":176
+ * cdef bgradata_to_rgba(const unsigned char* bgra, const int bgra_len):
+ *     if bgra_len <= 0:
+ *         return None             # <<<<<<<<<<<<<<
+ *     assert bgra_len>0 and bgra_len % 4 == 0, "invalid buffer size: %s is not a multiple of 4" % bgra_len
+ *     #same number of bytes:
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+    goto __pyx_L0;
+
+    /* "xpra/codecs/argb/argb.pyx":175
+ * 
+ * cdef bgradata_to_rgba(const unsigned char* bgra, const int bgra_len):
+ *     if bgra_len <= 0:             # <<<<<<<<<<<<<<
+ *         return None
+ *     assert bgra_len>0 and bgra_len % 4 == 0, "invalid buffer size: %s is not a multiple of 4" % bgra_len
+ */
+  }
+
+  /* "xpra/codecs/argb/argb.pyx":177
+ *     if bgra_len <= 0:
+ *         return None
+ *     assert bgra_len>0 and bgra_len % 4 == 0, "invalid buffer size: %s is not a multiple of 4" % bgra_len             # <<<<<<<<<<<<<<
+ *     #same number of bytes:
+ *     rgba = bytearray(bgra_len)
+ */
+  #ifndef CYTHON_WITHOUT_ASSERTIONS
+  if (unlikely(__pyx_assertions_enabled())) {
+    __pyx_t_2 = ((__pyx_v_bgra_len > 0) != 0);
+    if (__pyx_t_2) {
+    } else {
+      __pyx_t_1 = __pyx_t_2;
+      goto __pyx_L4_bool_binop_done;
+    }
+    __pyx_t_2 = (((__pyx_v_bgra_len % 4) == 0) != 0);
+    __pyx_t_1 = __pyx_t_2;
+    __pyx_L4_bool_binop_done:;
+    if (unlikely(!__pyx_t_1)) {
+      __pyx_t_3 = __Pyx_PyInt_From_int(__pyx_v_bgra_len); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 177, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_3);
+      __pyx_t_4 = __Pyx_PyString_Format(__pyx_kp_s_invalid_buffer_size_s_is_not_a_m, __pyx_t_3); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 177, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_4);
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      PyErr_SetObject(PyExc_AssertionError, __pyx_t_4);
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+      __PYX_ERR(0, 177, __pyx_L1_error)
+    }
+  }
+  #endif
+
+  /* "xpra/codecs/argb/argb.pyx":179
+ *     assert bgra_len>0 and bgra_len % 4 == 0, "invalid buffer size: %s is not a multiple of 4" % bgra_len
+ *     #same number of bytes:
+ *     rgba = bytearray(bgra_len)             # <<<<<<<<<<<<<<
+ *     cdef int i = 0                      #@DuplicateSignature
+ *     while i < bgra_len:
+ */
+  __pyx_t_4 = __Pyx_PyInt_From_int(__pyx_v_bgra_len); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 179, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_3 = __Pyx_PyObject_CallOneArg(((PyObject *)(&PyByteArray_Type)), __pyx_t_4); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 179, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_v_rgba = ((PyObject*)__pyx_t_3);
+  __pyx_t_3 = 0;
+
+  /* "xpra/codecs/argb/argb.pyx":180
+ *     #same number of bytes:
+ *     rgba = bytearray(bgra_len)
+ *     cdef int i = 0                      #@DuplicateSignature             # <<<<<<<<<<<<<<
+ *     while i < bgra_len:
+ *         rgba[i]   = bgra[i+2]           #R
+ */
+  __pyx_v_i = 0;
+
+  /* "xpra/codecs/argb/argb.pyx":181
+ *     rgba = bytearray(bgra_len)
+ *     cdef int i = 0                      #@DuplicateSignature
+ *     while i < bgra_len:             # <<<<<<<<<<<<<<
+ *         rgba[i]   = bgra[i+2]           #R
+ *         rgba[i+1] = bgra[i+1]           #G
+ */
+  while (1) {
+    __pyx_t_1 = ((__pyx_v_i < __pyx_v_bgra_len) != 0);
+    if (!__pyx_t_1) break;
+
+    /* "xpra/codecs/argb/argb.pyx":182
+ *     cdef int i = 0                      #@DuplicateSignature
+ *     while i < bgra_len:
+ *         rgba[i]   = bgra[i+2]           #R             # <<<<<<<<<<<<<<
+ *         rgba[i+1] = bgra[i+1]           #G
+ *         rgba[i+2] = bgra[i]             #B
+ */
+    if (unlikely((__pyx_v_bgra[(__pyx_v_i + 2)]) > 255)) {
+      PyErr_SetString(PyExc_ValueError, "byte must be in range(0, 256)"); __PYX_ERR(0, 182, __pyx_L1_error)
+    }
+    if (unlikely(__Pyx_SetItemInt_ByteArray(__pyx_v_rgba, __pyx_v_i, ((unsigned char)(__pyx_v_bgra[(__pyx_v_i + 2)])), int, 1, __Pyx_PyInt_From_int, 0, 0, 0) < 0)) __PYX_ERR(0, 182, __pyx_L1_error)
+
+    /* "xpra/codecs/argb/argb.pyx":183
+ *     while i < bgra_len:
+ *         rgba[i]   = bgra[i+2]           #R
+ *         rgba[i+1] = bgra[i+1]           #G             # <<<<<<<<<<<<<<
+ *         rgba[i+2] = bgra[i]             #B
+ *         rgba[i+3] = bgra[i+3]           #A
+ */
+    __pyx_t_5 = (__pyx_v_i + 1);
+    if (unlikely((__pyx_v_bgra[(__pyx_v_i + 1)]) > 255)) {
+      PyErr_SetString(PyExc_ValueError, "byte must be in range(0, 256)"); __PYX_ERR(0, 183, __pyx_L1_error)
+    }
+    if (unlikely(__Pyx_SetItemInt_ByteArray(__pyx_v_rgba, __pyx_t_5, ((unsigned char)(__pyx_v_bgra[(__pyx_v_i + 1)])), long, 1, __Pyx_PyInt_From_long, 0, 0, 0) < 0)) __PYX_ERR(0, 183, __pyx_L1_error)
+
+    /* "xpra/codecs/argb/argb.pyx":184
+ *         rgba[i]   = bgra[i+2]           #R
+ *         rgba[i+1] = bgra[i+1]           #G
+ *         rgba[i+2] = bgra[i]             #B             # <<<<<<<<<<<<<<
+ *         rgba[i+3] = bgra[i+3]           #A
+ *         i += 4
+ */
+    __pyx_t_5 = (__pyx_v_i + 2);
+    if (unlikely((__pyx_v_bgra[__pyx_v_i]) > 255)) {
+      PyErr_SetString(PyExc_ValueError, "byte must be in range(0, 256)"); __PYX_ERR(0, 184, __pyx_L1_error)
+    }
+    if (unlikely(__Pyx_SetItemInt_ByteArray(__pyx_v_rgba, __pyx_t_5, ((unsigned char)(__pyx_v_bgra[__pyx_v_i])), long, 1, __Pyx_PyInt_From_long, 0, 0, 0) < 0)) __PYX_ERR(0, 184, __pyx_L1_error)
+
+    /* "xpra/codecs/argb/argb.pyx":185
+ *         rgba[i+1] = bgra[i+1]           #G
+ *         rgba[i+2] = bgra[i]             #B
+ *         rgba[i+3] = bgra[i+3]           #A             # <<<<<<<<<<<<<<
+ *         i += 4
+ *     return rgba
+ */
+    __pyx_t_5 = (__pyx_v_i + 3);
+    if (unlikely((__pyx_v_bgra[(__pyx_v_i + 3)]) > 255)) {
+      PyErr_SetString(PyExc_ValueError, "byte must be in range(0, 256)"); __PYX_ERR(0, 185, __pyx_L1_error)
+    }
+    if (unlikely(__Pyx_SetItemInt_ByteArray(__pyx_v_rgba, __pyx_t_5, ((unsigned char)(__pyx_v_bgra[(__pyx_v_i + 3)])), long, 1, __Pyx_PyInt_From_long, 0, 0, 0) < 0)) __PYX_ERR(0, 185, __pyx_L1_error)
+
+    /* "xpra/codecs/argb/argb.pyx":186
+ *         rgba[i+2] = bgra[i]             #B
+ *         rgba[i+3] = bgra[i+3]           #A
+ *         i += 4             # <<<<<<<<<<<<<<
+ *     return rgba
+ * 
+ */
+    __pyx_v_i = (__pyx_v_i + 4);
+  }
+
+  /* "xpra/codecs/argb/argb.pyx":187
+ *         rgba[i+3] = bgra[i+3]           #A
+ *         i += 4
+ *     return rgba             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v_rgba);
+  __pyx_r = __pyx_v_rgba;
+  goto __pyx_L0;
+
+  /* "xpra/codecs/argb/argb.pyx":174
+ *     return bgradata_to_rgba(bgra_buf2, bgra_buf_len2)
+ * 
+ * cdef bgradata_to_rgba(const unsigned char* bgra, const int bgra_len):             # <<<<<<<<<<<<<<
+ *     if bgra_len <= 0:
+ *         return None
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_AddTraceback("xpra.codecs.argb.argb.bgradata_to_rgba", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_rgba);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "xpra/codecs/argb/argb.pyx":190
+ * 
+ * 
+ * def premultiply_argb_in_place(buf):             # <<<<<<<<<<<<<<
+ *     # b is a Python buffer object
+ *     cdef unsigned int * cbuf = <unsigned int *> 0
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_4xpra_6codecs_4argb_4argb_15premultiply_argb_in_place(PyObject *__pyx_self, PyObject *__pyx_v_buf); /*proto*/
+static PyMethodDef __pyx_mdef_4xpra_6codecs_4argb_4argb_15premultiply_argb_in_place = {"premultiply_argb_in_place", (PyCFunction)__pyx_pw_4xpra_6codecs_4argb_4argb_15premultiply_argb_in_place, METH_O, 0};
+static PyObject *__pyx_pw_4xpra_6codecs_4argb_4argb_15premultiply_argb_in_place(PyObject *__pyx_self, PyObject *__pyx_v_buf) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("premultiply_argb_in_place (wrapper)", 0);
+  __pyx_r = __pyx_pf_4xpra_6codecs_4argb_4argb_14premultiply_argb_in_place(__pyx_self, ((PyObject *)__pyx_v_buf));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_4xpra_6codecs_4argb_4argb_14premultiply_argb_in_place(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_buf) {
+  unsigned int *__pyx_v_cbuf;
+  Py_ssize_t __pyx_v_cbuf_len;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  Py_ssize_t __pyx_t_1;
+  Py_ssize_t __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("premultiply_argb_in_place", 0);
+
+  /* "xpra/codecs/argb/argb.pyx":192
+ * def premultiply_argb_in_place(buf):
+ *     # b is a Python buffer object
+ *     cdef unsigned int * cbuf = <unsigned int *> 0             # <<<<<<<<<<<<<<
+ *     cdef Py_ssize_t cbuf_len = 0                #@DuplicateSignature
+ *     assert sizeof(int) == 4
+ */
+  __pyx_v_cbuf = ((unsigned int *)0);
+
+  /* "xpra/codecs/argb/argb.pyx":193
+ *     # b is a Python buffer object
+ *     cdef unsigned int * cbuf = <unsigned int *> 0
+ *     cdef Py_ssize_t cbuf_len = 0                #@DuplicateSignature             # <<<<<<<<<<<<<<
+ *     assert sizeof(int) == 4
+ *     assert len(buf) % 4 == 0, "invalid buffer size: %s is not a multiple of 4" % len(buf)
+ */
+  __pyx_v_cbuf_len = 0;
+
+  /* "xpra/codecs/argb/argb.pyx":194
+ *     cdef unsigned int * cbuf = <unsigned int *> 0
+ *     cdef Py_ssize_t cbuf_len = 0                #@DuplicateSignature
+ *     assert sizeof(int) == 4             # <<<<<<<<<<<<<<
+ *     assert len(buf) % 4 == 0, "invalid buffer size: %s is not a multiple of 4" % len(buf)
+ *     assert object_as_write_buffer(buf, <void **>&cbuf, &cbuf_len)==0
+ */
+  #ifndef CYTHON_WITHOUT_ASSERTIONS
+  if (unlikely(__pyx_assertions_enabled())) {
+    if (unlikely(!(((sizeof(int)) == 4) != 0))) {
+      PyErr_SetNone(PyExc_AssertionError);
+      __PYX_ERR(0, 194, __pyx_L1_error)
+    }
+  }
+  #endif
+
+  /* "xpra/codecs/argb/argb.pyx":195
+ *     cdef Py_ssize_t cbuf_len = 0                #@DuplicateSignature
+ *     assert sizeof(int) == 4
+ *     assert len(buf) % 4 == 0, "invalid buffer size: %s is not a multiple of 4" % len(buf)             # <<<<<<<<<<<<<<
+ *     assert object_as_write_buffer(buf, <void **>&cbuf, &cbuf_len)==0
+ *     do_premultiply_argb_in_place(cbuf, cbuf_len)
+ */
+  #ifndef CYTHON_WITHOUT_ASSERTIONS
+  if (unlikely(__pyx_assertions_enabled())) {
+    __pyx_t_1 = PyObject_Length(__pyx_v_buf); if (unlikely(__pyx_t_1 == ((Py_ssize_t)-1))) __PYX_ERR(0, 195, __pyx_L1_error)
+    if (unlikely(!(((__pyx_t_1 % 4) == 0) != 0))) {
+      __pyx_t_2 = PyObject_Length(__pyx_v_buf); if (unlikely(__pyx_t_2 == ((Py_ssize_t)-1))) __PYX_ERR(0, 195, __pyx_L1_error)
+      __pyx_t_3 = PyInt_FromSsize_t(__pyx_t_2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 195, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_3);
+      __pyx_t_4 = __Pyx_PyString_Format(__pyx_kp_s_invalid_buffer_size_s_is_not_a_m, __pyx_t_3); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 195, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_4);
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      PyErr_SetObject(PyExc_AssertionError, __pyx_t_4);
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+      __PYX_ERR(0, 195, __pyx_L1_error)
+    }
+  }
+  #endif
+
+  /* "xpra/codecs/argb/argb.pyx":196
+ *     assert sizeof(int) == 4
+ *     assert len(buf) % 4 == 0, "invalid buffer size: %s is not a multiple of 4" % len(buf)
+ *     assert object_as_write_buffer(buf, <void **>&cbuf, &cbuf_len)==0             # <<<<<<<<<<<<<<
+ *     do_premultiply_argb_in_place(cbuf, cbuf_len)
+ * 
+ */
+  #ifndef CYTHON_WITHOUT_ASSERTIONS
+  if (unlikely(__pyx_assertions_enabled())) {
+    if (unlikely(!((object_as_write_buffer(__pyx_v_buf, ((void **)(&__pyx_v_cbuf)), (&__pyx_v_cbuf_len)) == 0) != 0))) {
+      PyErr_SetNone(PyExc_AssertionError);
+      __PYX_ERR(0, 196, __pyx_L1_error)
+    }
+  }
+  #endif
+
+  /* "xpra/codecs/argb/argb.pyx":197
+ *     assert len(buf) % 4 == 0, "invalid buffer size: %s is not a multiple of 4" % len(buf)
+ *     assert object_as_write_buffer(buf, <void **>&cbuf, &cbuf_len)==0
+ *     do_premultiply_argb_in_place(cbuf, cbuf_len)             # <<<<<<<<<<<<<<
+ * 
+ * cdef do_premultiply_argb_in_place(unsigned int *buf, Py_ssize_t argb_len):
+ */
+  __pyx_t_4 = __pyx_f_4xpra_6codecs_4argb_4argb_do_premultiply_argb_in_place(__pyx_v_cbuf, __pyx_v_cbuf_len); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 197, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+  /* "xpra/codecs/argb/argb.pyx":190
+ * 
+ * 
+ * def premultiply_argb_in_place(buf):             # <<<<<<<<<<<<<<
+ *     # b is a Python buffer object
+ *     cdef unsigned int * cbuf = <unsigned int *> 0
+ */
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_AddTraceback("xpra.codecs.argb.argb.premultiply_argb_in_place", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "xpra/codecs/argb/argb.pyx":199
+ *     do_premultiply_argb_in_place(cbuf, cbuf_len)
+ * 
+ * cdef do_premultiply_argb_in_place(unsigned int *buf, Py_ssize_t argb_len):             # <<<<<<<<<<<<<<
+ *     # cbuf contains non-premultiplied ARGB32 data in native-endian.
+ *     # We convert to premultiplied ARGB32 data, in-place.
+ */
+
+static PyObject *__pyx_f_4xpra_6codecs_4argb_4argb_do_premultiply_argb_in_place(unsigned int *__pyx_v_buf, Py_ssize_t __pyx_v_argb_len) {
+  unsigned char __pyx_v_a;
+  unsigned char __pyx_v_r;
+  unsigned char __pyx_v_g;
+  unsigned char __pyx_v_b;
+  unsigned int __pyx_v_argb;
+  int __pyx_v_i;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  Py_ssize_t __pyx_t_5;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("do_premultiply_argb_in_place", 0);
+
+  /* "xpra/codecs/argb/argb.pyx":204
+ *     cdef unsigned char a, r, g, b
+ *     cdef unsigned int argb
+ *     assert sizeof(int) == 4             # <<<<<<<<<<<<<<
+ *     assert argb_len>0 and argb_len % 4 == 0, "invalid buffer size: %s is not a multiple of 4" % argb_len
+ *     cdef int i
+ */
+  #ifndef CYTHON_WITHOUT_ASSERTIONS
+  if (unlikely(__pyx_assertions_enabled())) {
+    if (unlikely(!(((sizeof(int)) == 4) != 0))) {
+      PyErr_SetNone(PyExc_AssertionError);
+      __PYX_ERR(0, 204, __pyx_L1_error)
+    }
+  }
+  #endif
+
+  /* "xpra/codecs/argb/argb.pyx":205
+ *     cdef unsigned int argb
+ *     assert sizeof(int) == 4
+ *     assert argb_len>0 and argb_len % 4 == 0, "invalid buffer size: %s is not a multiple of 4" % argb_len             # <<<<<<<<<<<<<<
+ *     cdef int i
+ *     for 0 <= i < argb_len / 4:
+ */
+  #ifndef CYTHON_WITHOUT_ASSERTIONS
+  if (unlikely(__pyx_assertions_enabled())) {
+    __pyx_t_2 = ((__pyx_v_argb_len > 0) != 0);
+    if (__pyx_t_2) {
+    } else {
+      __pyx_t_1 = __pyx_t_2;
+      goto __pyx_L3_bool_binop_done;
+    }
+    __pyx_t_2 = (((__pyx_v_argb_len % 4) == 0) != 0);
+    __pyx_t_1 = __pyx_t_2;
+    __pyx_L3_bool_binop_done:;
+    if (unlikely(!__pyx_t_1)) {
+      __pyx_t_3 = PyInt_FromSsize_t(__pyx_v_argb_len); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 205, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_3);
+      __pyx_t_4 = __Pyx_PyString_Format(__pyx_kp_s_invalid_buffer_size_s_is_not_a_m, __pyx_t_3); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 205, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_4);
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      PyErr_SetObject(PyExc_AssertionError, __pyx_t_4);
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+      __PYX_ERR(0, 205, __pyx_L1_error)
+    }
+  }
+  #endif
+
+  /* "xpra/codecs/argb/argb.pyx":207
+ *     assert argb_len>0 and argb_len % 4 == 0, "invalid buffer size: %s is not a multiple of 4" % argb_len
+ *     cdef int i
+ *     for 0 <= i < argb_len / 4:             # <<<<<<<<<<<<<<
+ *         argb = buf[i]
+ *         a = (argb >> 24) & 0xff
+ */
+  __pyx_t_5 = (__pyx_v_argb_len / 4);
+  for (__pyx_v_i = 0; __pyx_v_i < __pyx_t_5; __pyx_v_i++) {
+
+    /* "xpra/codecs/argb/argb.pyx":208
+ *     cdef int i
+ *     for 0 <= i < argb_len / 4:
+ *         argb = buf[i]             # <<<<<<<<<<<<<<
+ *         a = (argb >> 24) & 0xff
+ *         r = (argb >> 16) & 0xff
+ */
+    __pyx_v_argb = (__pyx_v_buf[__pyx_v_i]);
+
+    /* "xpra/codecs/argb/argb.pyx":209
+ *     for 0 <= i < argb_len / 4:
+ *         argb = buf[i]
+ *         a = (argb >> 24) & 0xff             # <<<<<<<<<<<<<<
+ *         r = (argb >> 16) & 0xff
+ *         r = r * a // 255
+ */
+    __pyx_v_a = ((__pyx_v_argb >> 24) & 0xff);
+
+    /* "xpra/codecs/argb/argb.pyx":210
+ *         argb = buf[i]
+ *         a = (argb >> 24) & 0xff
+ *         r = (argb >> 16) & 0xff             # <<<<<<<<<<<<<<
+ *         r = r * a // 255
+ *         g = (argb >> 8) & 0xff
+ */
+    __pyx_v_r = ((__pyx_v_argb >> 16) & 0xff);
+
+    /* "xpra/codecs/argb/argb.pyx":211
+ *         a = (argb >> 24) & 0xff
+ *         r = (argb >> 16) & 0xff
+ *         r = r * a // 255             # <<<<<<<<<<<<<<
+ *         g = (argb >> 8) & 0xff
+ *         g = g * a // 255
+ */
+    __pyx_v_r = ((__pyx_v_r * __pyx_v_a) / 0xFF);
+
+    /* "xpra/codecs/argb/argb.pyx":212
+ *         r = (argb >> 16) & 0xff
+ *         r = r * a // 255
+ *         g = (argb >> 8) & 0xff             # <<<<<<<<<<<<<<
+ *         g = g * a // 255
+ *         b = (argb >> 0) & 0xff
+ */
+    __pyx_v_g = ((__pyx_v_argb >> 8) & 0xff);
+
+    /* "xpra/codecs/argb/argb.pyx":213
+ *         r = r * a // 255
+ *         g = (argb >> 8) & 0xff
+ *         g = g * a // 255             # <<<<<<<<<<<<<<
+ *         b = (argb >> 0) & 0xff
+ *         b = b * a // 255
+ */
+    __pyx_v_g = ((__pyx_v_g * __pyx_v_a) / 0xFF);
+
+    /* "xpra/codecs/argb/argb.pyx":214
+ *         g = (argb >> 8) & 0xff
+ *         g = g * a // 255
+ *         b = (argb >> 0) & 0xff             # <<<<<<<<<<<<<<
+ *         b = b * a // 255
+ *         buf[i] = (a << 24) | (r << 16) | (g << 8) | (b << 0)
+ */
+    __pyx_v_b = ((__pyx_v_argb >> 0) & 0xff);
+
+    /* "xpra/codecs/argb/argb.pyx":215
+ *         g = g * a // 255
+ *         b = (argb >> 0) & 0xff
+ *         b = b * a // 255             # <<<<<<<<<<<<<<
+ *         buf[i] = (a << 24) | (r << 16) | (g << 8) | (b << 0)
+ * 
+ */
+    __pyx_v_b = ((__pyx_v_b * __pyx_v_a) / 0xFF);
+
+    /* "xpra/codecs/argb/argb.pyx":216
+ *         b = (argb >> 0) & 0xff
+ *         b = b * a // 255
+ *         buf[i] = (a << 24) | (r << 16) | (g << 8) | (b << 0)             # <<<<<<<<<<<<<<
+ * 
+ * def unpremultiply_argb_in_place(buf):
+ */
+    (__pyx_v_buf[__pyx_v_i]) = ((((__pyx_v_a << 24) | (__pyx_v_r << 16)) | (__pyx_v_g << 8)) | (__pyx_v_b << 0));
+  }
+
+  /* "xpra/codecs/argb/argb.pyx":199
+ *     do_premultiply_argb_in_place(cbuf, cbuf_len)
+ * 
+ * cdef do_premultiply_argb_in_place(unsigned int *buf, Py_ssize_t argb_len):             # <<<<<<<<<<<<<<
+ *     # cbuf contains non-premultiplied ARGB32 data in native-endian.
+ *     # We convert to premultiplied ARGB32 data, in-place.
+ */
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_AddTraceback("xpra.codecs.argb.argb.do_premultiply_argb_in_place", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "xpra/codecs/argb/argb.pyx":218
+ *         buf[i] = (a << 24) | (r << 16) | (g << 8) | (b << 0)
+ * 
+ * def unpremultiply_argb_in_place(buf):             # <<<<<<<<<<<<<<
+ *     # b is a Python buffer object
+ *     cdef unsigned int * cbuf = <unsigned int *> 0   #@DuplicateSignature
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_4xpra_6codecs_4argb_4argb_17unpremultiply_argb_in_place(PyObject *__pyx_self, PyObject *__pyx_v_buf); /*proto*/
+static PyMethodDef __pyx_mdef_4xpra_6codecs_4argb_4argb_17unpremultiply_argb_in_place = {"unpremultiply_argb_in_place", (PyCFunction)__pyx_pw_4xpra_6codecs_4argb_4argb_17unpremultiply_argb_in_place, METH_O, 0};
+static PyObject *__pyx_pw_4xpra_6codecs_4argb_4argb_17unpremultiply_argb_in_place(PyObject *__pyx_self, PyObject *__pyx_v_buf) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("unpremultiply_argb_in_place (wrapper)", 0);
+  __pyx_r = __pyx_pf_4xpra_6codecs_4argb_4argb_16unpremultiply_argb_in_place(__pyx_self, ((PyObject *)__pyx_v_buf));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_4xpra_6codecs_4argb_4argb_16unpremultiply_argb_in_place(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_buf) {
+  unsigned int *__pyx_v_cbuf;
+  Py_ssize_t __pyx_v_cbuf_len;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  Py_ssize_t __pyx_t_1;
+  Py_ssize_t __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("unpremultiply_argb_in_place", 0);
+
+  /* "xpra/codecs/argb/argb.pyx":220
+ * def unpremultiply_argb_in_place(buf):
+ *     # b is a Python buffer object
+ *     cdef unsigned int * cbuf = <unsigned int *> 0   #@DuplicateSignature             # <<<<<<<<<<<<<<
+ *     cdef Py_ssize_t cbuf_len = 0                    #@DuplicateSignature
+ *     assert sizeof(int) == 4
+ */
+  __pyx_v_cbuf = ((unsigned int *)0);
+
+  /* "xpra/codecs/argb/argb.pyx":221
+ *     # b is a Python buffer object
+ *     cdef unsigned int * cbuf = <unsigned int *> 0   #@DuplicateSignature
+ *     cdef Py_ssize_t cbuf_len = 0                    #@DuplicateSignature             # <<<<<<<<<<<<<<
+ *     assert sizeof(int) == 4
+ *     assert len(buf) % 4 == 0, "invalid buffer size: %s is not a multiple of 4" % len(buf)
+ */
+  __pyx_v_cbuf_len = 0;
+
+  /* "xpra/codecs/argb/argb.pyx":222
+ *     cdef unsigned int * cbuf = <unsigned int *> 0   #@DuplicateSignature
+ *     cdef Py_ssize_t cbuf_len = 0                    #@DuplicateSignature
+ *     assert sizeof(int) == 4             # <<<<<<<<<<<<<<
+ *     assert len(buf) % 4 == 0, "invalid buffer size: %s is not a multiple of 4" % len(buf)
+ *     assert object_as_write_buffer(buf, <void **>&cbuf, &cbuf_len)==0, "cannot convert %s to a writable buffer" % type(buf)
+ */
+  #ifndef CYTHON_WITHOUT_ASSERTIONS
+  if (unlikely(__pyx_assertions_enabled())) {
+    if (unlikely(!(((sizeof(int)) == 4) != 0))) {
+      PyErr_SetNone(PyExc_AssertionError);
+      __PYX_ERR(0, 222, __pyx_L1_error)
+    }
+  }
+  #endif
+
+  /* "xpra/codecs/argb/argb.pyx":223
+ *     cdef Py_ssize_t cbuf_len = 0                    #@DuplicateSignature
+ *     assert sizeof(int) == 4
+ *     assert len(buf) % 4 == 0, "invalid buffer size: %s is not a multiple of 4" % len(buf)             # <<<<<<<<<<<<<<
+ *     assert object_as_write_buffer(buf, <void **>&cbuf, &cbuf_len)==0, "cannot convert %s to a writable buffer" % type(buf)
+ *     do_unpremultiply_argb_in_place(cbuf, cbuf_len)
+ */
+  #ifndef CYTHON_WITHOUT_ASSERTIONS
+  if (unlikely(__pyx_assertions_enabled())) {
+    __pyx_t_1 = PyObject_Length(__pyx_v_buf); if (unlikely(__pyx_t_1 == ((Py_ssize_t)-1))) __PYX_ERR(0, 223, __pyx_L1_error)
+    if (unlikely(!(((__pyx_t_1 % 4) == 0) != 0))) {
+      __pyx_t_2 = PyObject_Length(__pyx_v_buf); if (unlikely(__pyx_t_2 == ((Py_ssize_t)-1))) __PYX_ERR(0, 223, __pyx_L1_error)
+      __pyx_t_3 = PyInt_FromSsize_t(__pyx_t_2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 223, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_3);
+      __pyx_t_4 = __Pyx_PyString_Format(__pyx_kp_s_invalid_buffer_size_s_is_not_a_m, __pyx_t_3); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 223, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_4);
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      PyErr_SetObject(PyExc_AssertionError, __pyx_t_4);
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+      __PYX_ERR(0, 223, __pyx_L1_error)
+    }
+  }
+  #endif
+
+  /* "xpra/codecs/argb/argb.pyx":224
+ *     assert sizeof(int) == 4
+ *     assert len(buf) % 4 == 0, "invalid buffer size: %s is not a multiple of 4" % len(buf)
+ *     assert object_as_write_buffer(buf, <void **>&cbuf, &cbuf_len)==0, "cannot convert %s to a writable buffer" % type(buf)             # <<<<<<<<<<<<<<
+ *     do_unpremultiply_argb_in_place(cbuf, cbuf_len)
+ * 
+ */
+  #ifndef CYTHON_WITHOUT_ASSERTIONS
+  if (unlikely(__pyx_assertions_enabled())) {
+    if (unlikely(!((object_as_write_buffer(__pyx_v_buf, ((void **)(&__pyx_v_cbuf)), (&__pyx_v_cbuf_len)) == 0) != 0))) {
+      __pyx_t_4 = __Pyx_PyString_FormatSafe(__pyx_kp_s_cannot_convert_s_to_a_writable_b, ((PyObject *)Py_TYPE(__pyx_v_buf))); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 224, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_4);
+      PyErr_SetObject(PyExc_AssertionError, __pyx_t_4);
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+      __PYX_ERR(0, 224, __pyx_L1_error)
+    }
+  }
+  #endif
+
+  /* "xpra/codecs/argb/argb.pyx":225
+ *     assert len(buf) % 4 == 0, "invalid buffer size: %s is not a multiple of 4" % len(buf)
+ *     assert object_as_write_buffer(buf, <void **>&cbuf, &cbuf_len)==0, "cannot convert %s to a writable buffer" % type(buf)
+ *     do_unpremultiply_argb_in_place(cbuf, cbuf_len)             # <<<<<<<<<<<<<<
+ * 
+ * cdef do_unpremultiply_argb_in_place(unsigned int * buf, Py_ssize_t buf_len):
+ */
+  __pyx_t_4 = __pyx_f_4xpra_6codecs_4argb_4argb_do_unpremultiply_argb_in_place(__pyx_v_cbuf, __pyx_v_cbuf_len); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 225, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+  /* "xpra/codecs/argb/argb.pyx":218
+ *         buf[i] = (a << 24) | (r << 16) | (g << 8) | (b << 0)
+ * 
+ * def unpremultiply_argb_in_place(buf):             # <<<<<<<<<<<<<<
+ *     # b is a Python buffer object
+ *     cdef unsigned int * cbuf = <unsigned int *> 0   #@DuplicateSignature
+ */
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_AddTraceback("xpra.codecs.argb.argb.unpremultiply_argb_in_place", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "xpra/codecs/argb/argb.pyx":227
+ *     do_unpremultiply_argb_in_place(cbuf, cbuf_len)
+ * 
+ * cdef do_unpremultiply_argb_in_place(unsigned int * buf, Py_ssize_t buf_len):             # <<<<<<<<<<<<<<
+ *     # cbuf contains non-premultiplied ARGB32 data in native-endian.
+ *     # We convert to premultiplied ARGB32 data, in-place.
+ */
+
+static PyObject *__pyx_f_4xpra_6codecs_4argb_4argb_do_unpremultiply_argb_in_place(unsigned int *__pyx_v_buf, Py_ssize_t __pyx_v_buf_len) {
+  unsigned char __pyx_v_a;
+  unsigned char __pyx_v_r;
+  unsigned char __pyx_v_g;
+  unsigned char __pyx_v_b;
+  unsigned int __pyx_v_argb;
+  int __pyx_v_i;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  Py_ssize_t __pyx_t_5;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("do_unpremultiply_argb_in_place", 0);
+
+  /* "xpra/codecs/argb/argb.pyx":232
+ *     cdef unsigned char a, r, g, b                   #@DuplicateSignature
+ *     cdef unsigned int argb                          #@DuplicateSignature
+ *     assert sizeof(int) == 4             # <<<<<<<<<<<<<<
+ *     assert buf_len>0 and buf_len % 4 == 0, "invalid buffer size: %s is not a multiple of 4" % buf_len
+ *     cdef int i                                      #@DuplicateSignature
+ */
+  #ifndef CYTHON_WITHOUT_ASSERTIONS
+  if (unlikely(__pyx_assertions_enabled())) {
+    if (unlikely(!(((sizeof(int)) == 4) != 0))) {
+      PyErr_SetNone(PyExc_AssertionError);
+      __PYX_ERR(0, 232, __pyx_L1_error)
+    }
+  }
+  #endif
+
+  /* "xpra/codecs/argb/argb.pyx":233
+ *     cdef unsigned int argb                          #@DuplicateSignature
+ *     assert sizeof(int) == 4
+ *     assert buf_len>0 and buf_len % 4 == 0, "invalid buffer size: %s is not a multiple of 4" % buf_len             # <<<<<<<<<<<<<<
+ *     cdef int i                                      #@DuplicateSignature
+ *     for 0 <= i < buf_len // 4:
+ */
+  #ifndef CYTHON_WITHOUT_ASSERTIONS
+  if (unlikely(__pyx_assertions_enabled())) {
+    __pyx_t_2 = ((__pyx_v_buf_len > 0) != 0);
+    if (__pyx_t_2) {
+    } else {
+      __pyx_t_1 = __pyx_t_2;
+      goto __pyx_L3_bool_binop_done;
+    }
+    __pyx_t_2 = (((__pyx_v_buf_len % 4) == 0) != 0);
+    __pyx_t_1 = __pyx_t_2;
+    __pyx_L3_bool_binop_done:;
+    if (unlikely(!__pyx_t_1)) {
+      __pyx_t_3 = PyInt_FromSsize_t(__pyx_v_buf_len); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 233, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_3);
+      __pyx_t_4 = __Pyx_PyString_Format(__pyx_kp_s_invalid_buffer_size_s_is_not_a_m, __pyx_t_3); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 233, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_4);
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      PyErr_SetObject(PyExc_AssertionError, __pyx_t_4);
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+      __PYX_ERR(0, 233, __pyx_L1_error)
+    }
+  }
+  #endif
+
+  /* "xpra/codecs/argb/argb.pyx":235
+ *     assert buf_len>0 and buf_len % 4 == 0, "invalid buffer size: %s is not a multiple of 4" % buf_len
+ *     cdef int i                                      #@DuplicateSignature
+ *     for 0 <= i < buf_len // 4:             # <<<<<<<<<<<<<<
+ *         argb = buf[i]
+ *         a = (argb >> 24) & 0xff
+ */
+  __pyx_t_5 = (__pyx_v_buf_len / 4);
+  for (__pyx_v_i = 0; __pyx_v_i < __pyx_t_5; __pyx_v_i++) {
+
+    /* "xpra/codecs/argb/argb.pyx":236
+ *     cdef int i                                      #@DuplicateSignature
+ *     for 0 <= i < buf_len // 4:
+ *         argb = buf[i]             # <<<<<<<<<<<<<<
+ *         a = (argb >> 24) & 0xff
+ *         if a==0:
+ */
+    __pyx_v_argb = (__pyx_v_buf[__pyx_v_i]);
+
+    /* "xpra/codecs/argb/argb.pyx":237
+ *     for 0 <= i < buf_len // 4:
+ *         argb = buf[i]
+ *         a = (argb >> 24) & 0xff             # <<<<<<<<<<<<<<
+ *         if a==0:
+ *             buf[i] = 0
+ */
+    __pyx_v_a = ((__pyx_v_argb >> 24) & 0xff);
+
+    /* "xpra/codecs/argb/argb.pyx":238
+ *         argb = buf[i]
+ *         a = (argb >> 24) & 0xff
+ *         if a==0:             # <<<<<<<<<<<<<<
+ *             buf[i] = 0
+ *             continue
+ */
+    __pyx_t_1 = ((__pyx_v_a == 0) != 0);
+    if (__pyx_t_1) {
+
+      /* "xpra/codecs/argb/argb.pyx":239
+ *         a = (argb >> 24) & 0xff
+ *         if a==0:
+ *             buf[i] = 0             # <<<<<<<<<<<<<<
+ *             continue
+ *         r = clamp(((argb >> 16) & 0xff) * 255 // a)
+ */
+      (__pyx_v_buf[__pyx_v_i]) = 0;
+
+      /* "xpra/codecs/argb/argb.pyx":240
+ *         if a==0:
+ *             buf[i] = 0
+ *             continue             # <<<<<<<<<<<<<<
+ *         r = clamp(((argb >> 16) & 0xff) * 255 // a)
+ *         g = clamp(((argb >> 8) & 0xff) * 255 // a)
+ */
+      goto __pyx_L5_continue;
+
+      /* "xpra/codecs/argb/argb.pyx":238
+ *         argb = buf[i]
+ *         a = (argb >> 24) & 0xff
+ *         if a==0:             # <<<<<<<<<<<<<<
+ *             buf[i] = 0
+ *             continue
+ */
+    }
+
+    /* "xpra/codecs/argb/argb.pyx":241
+ *             buf[i] = 0
+ *             continue
+ *         r = clamp(((argb >> 16) & 0xff) * 255 // a)             # <<<<<<<<<<<<<<
+ *         g = clamp(((argb >> 8) & 0xff) * 255 // a)
+ *         b = clamp(((argb >> 0) & 0xff) * 255 // a)
+ */
+    __pyx_v_r = __pyx_f_4xpra_6codecs_4argb_4argb_clamp(((((__pyx_v_argb >> 16) & 0xff) * 0xFF) / __pyx_v_a));
+
+    /* "xpra/codecs/argb/argb.pyx":242
+ *             continue
+ *         r = clamp(((argb >> 16) & 0xff) * 255 // a)
+ *         g = clamp(((argb >> 8) & 0xff) * 255 // a)             # <<<<<<<<<<<<<<
+ *         b = clamp(((argb >> 0) & 0xff) * 255 // a)
+ *         buf[i] = (a << 24) | (r << 16) | (g << 8) | (b << 0)
+ */
+    __pyx_v_g = __pyx_f_4xpra_6codecs_4argb_4argb_clamp(((((__pyx_v_argb >> 8) & 0xff) * 0xFF) / __pyx_v_a));
+
+    /* "xpra/codecs/argb/argb.pyx":243
+ *         r = clamp(((argb >> 16) & 0xff) * 255 // a)
+ *         g = clamp(((argb >> 8) & 0xff) * 255 // a)
+ *         b = clamp(((argb >> 0) & 0xff) * 255 // a)             # <<<<<<<<<<<<<<
+ *         buf[i] = (a << 24) | (r << 16) | (g << 8) | (b << 0)
+ * 
+ */
+    __pyx_v_b = __pyx_f_4xpra_6codecs_4argb_4argb_clamp(((((__pyx_v_argb >> 0) & 0xff) * 0xFF) / __pyx_v_a));
+
+    /* "xpra/codecs/argb/argb.pyx":244
+ *         g = clamp(((argb >> 8) & 0xff) * 255 // a)
+ *         b = clamp(((argb >> 0) & 0xff) * 255 // a)
+ *         buf[i] = (a << 24) | (r << 16) | (g << 8) | (b << 0)             # <<<<<<<<<<<<<<
+ * 
+ * def unpremultiply_argb(buf):
+ */
+    (__pyx_v_buf[__pyx_v_i]) = ((((__pyx_v_a << 24) | (__pyx_v_r << 16)) | (__pyx_v_g << 8)) | (__pyx_v_b << 0));
+    __pyx_L5_continue:;
+  }
+
+  /* "xpra/codecs/argb/argb.pyx":227
+ *     do_unpremultiply_argb_in_place(cbuf, cbuf_len)
+ * 
+ * cdef do_unpremultiply_argb_in_place(unsigned int * buf, Py_ssize_t buf_len):             # <<<<<<<<<<<<<<
+ *     # cbuf contains non-premultiplied ARGB32 data in native-endian.
+ *     # We convert to premultiplied ARGB32 data, in-place.
+ */
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_AddTraceback("xpra.codecs.argb.argb.do_unpremultiply_argb_in_place", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "xpra/codecs/argb/argb.pyx":246
+ *         buf[i] = (a << 24) | (r << 16) | (g << 8) | (b << 0)
+ * 
+ * def unpremultiply_argb(buf):             # <<<<<<<<<<<<<<
+ *     # b is a Python buffer object
+ *     cdef unsigned int * argb = <unsigned int *> 0   #@DuplicateSignature
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_4xpra_6codecs_4argb_4argb_19unpremultiply_argb(PyObject *__pyx_self, PyObject *__pyx_v_buf); /*proto*/
+static PyMethodDef __pyx_mdef_4xpra_6codecs_4argb_4argb_19unpremultiply_argb = {"unpremultiply_argb", (PyCFunction)__pyx_pw_4xpra_6codecs_4argb_4argb_19unpremultiply_argb, METH_O, 0};
+static PyObject *__pyx_pw_4xpra_6codecs_4argb_4argb_19unpremultiply_argb(PyObject *__pyx_self, PyObject *__pyx_v_buf) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("unpremultiply_argb (wrapper)", 0);
+  __pyx_r = __pyx_pf_4xpra_6codecs_4argb_4argb_18unpremultiply_argb(__pyx_self, ((PyObject *)__pyx_v_buf));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_4xpra_6codecs_4argb_4argb_18unpremultiply_argb(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_buf) {
+  unsigned int *__pyx_v_argb;
+  Py_ssize_t __pyx_v_argb_len;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  Py_ssize_t __pyx_t_1;
+  Py_ssize_t __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("unpremultiply_argb", 0);
+
+  /* "xpra/codecs/argb/argb.pyx":248
+ * def unpremultiply_argb(buf):
+ *     # b is a Python buffer object
+ *     cdef unsigned int * argb = <unsigned int *> 0   #@DuplicateSignature             # <<<<<<<<<<<<<<
+ *     cdef Py_ssize_t argb_len = 0                    #@DuplicateSignature
+ *     assert sizeof(int) == 4
+ */
+  __pyx_v_argb = ((unsigned int *)0);
+
+  /* "xpra/codecs/argb/argb.pyx":249
+ *     # b is a Python buffer object
+ *     cdef unsigned int * argb = <unsigned int *> 0   #@DuplicateSignature
+ *     cdef Py_ssize_t argb_len = 0                    #@DuplicateSignature             # <<<<<<<<<<<<<<
+ *     assert sizeof(int) == 4
+ *     assert len(buf) % 4 == 0, "invalid buffer size: %s is not a multiple of 4" % len(buf)
+ */
+  __pyx_v_argb_len = 0;
+
+  /* "xpra/codecs/argb/argb.pyx":250
+ *     cdef unsigned int * argb = <unsigned int *> 0   #@DuplicateSignature
+ *     cdef Py_ssize_t argb_len = 0                    #@DuplicateSignature
+ *     assert sizeof(int) == 4             # <<<<<<<<<<<<<<
+ *     assert len(buf) % 4 == 0, "invalid buffer size: %s is not a multiple of 4" % len(buf)
+ *     assert object_as_buffer(buf, <const void **>&argb, &argb_len)==0
+ */
+  #ifndef CYTHON_WITHOUT_ASSERTIONS
+  if (unlikely(__pyx_assertions_enabled())) {
+    if (unlikely(!(((sizeof(int)) == 4) != 0))) {
+      PyErr_SetNone(PyExc_AssertionError);
+      __PYX_ERR(0, 250, __pyx_L1_error)
+    }
+  }
+  #endif
+
+  /* "xpra/codecs/argb/argb.pyx":251
+ *     cdef Py_ssize_t argb_len = 0                    #@DuplicateSignature
+ *     assert sizeof(int) == 4
+ *     assert len(buf) % 4 == 0, "invalid buffer size: %s is not a multiple of 4" % len(buf)             # <<<<<<<<<<<<<<
+ *     assert object_as_buffer(buf, <const void **>&argb, &argb_len)==0
+ *     return do_unpremultiply_argb(argb, argb_len)
+ */
+  #ifndef CYTHON_WITHOUT_ASSERTIONS
+  if (unlikely(__pyx_assertions_enabled())) {
+    __pyx_t_1 = PyObject_Length(__pyx_v_buf); if (unlikely(__pyx_t_1 == ((Py_ssize_t)-1))) __PYX_ERR(0, 251, __pyx_L1_error)
+    if (unlikely(!(((__pyx_t_1 % 4) == 0) != 0))) {
+      __pyx_t_2 = PyObject_Length(__pyx_v_buf); if (unlikely(__pyx_t_2 == ((Py_ssize_t)-1))) __PYX_ERR(0, 251, __pyx_L1_error)
+      __pyx_t_3 = PyInt_FromSsize_t(__pyx_t_2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 251, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_3);
+      __pyx_t_4 = __Pyx_PyString_Format(__pyx_kp_s_invalid_buffer_size_s_is_not_a_m, __pyx_t_3); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 251, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_4);
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      PyErr_SetObject(PyExc_AssertionError, __pyx_t_4);
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+      __PYX_ERR(0, 251, __pyx_L1_error)
+    }
+  }
+  #endif
+
+  /* "xpra/codecs/argb/argb.pyx":252
+ *     assert sizeof(int) == 4
+ *     assert len(buf) % 4 == 0, "invalid buffer size: %s is not a multiple of 4" % len(buf)
+ *     assert object_as_buffer(buf, <const void **>&argb, &argb_len)==0             # <<<<<<<<<<<<<<
+ *     return do_unpremultiply_argb(argb, argb_len)
+ * 
+ */
+  #ifndef CYTHON_WITHOUT_ASSERTIONS
+  if (unlikely(__pyx_assertions_enabled())) {
+    if (unlikely(!((object_as_buffer(__pyx_v_buf, ((void const **)(&__pyx_v_argb)), (&__pyx_v_argb_len)) == 0) != 0))) {
+      PyErr_SetNone(PyExc_AssertionError);
+      __PYX_ERR(0, 252, __pyx_L1_error)
+    }
+  }
+  #endif
+
+  /* "xpra/codecs/argb/argb.pyx":253
+ *     assert len(buf) % 4 == 0, "invalid buffer size: %s is not a multiple of 4" % len(buf)
+ *     assert object_as_buffer(buf, <const void **>&argb, &argb_len)==0
+ *     return do_unpremultiply_argb(argb, argb_len)             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_4 = __pyx_f_4xpra_6codecs_4argb_4argb_do_unpremultiply_argb(__pyx_v_argb, __pyx_v_argb_len); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 253, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_r = __pyx_t_4;
+  __pyx_t_4 = 0;
+  goto __pyx_L0;
+
+  /* "xpra/codecs/argb/argb.pyx":246
+ *         buf[i] = (a << 24) | (r << 16) | (g << 8) | (b << 0)
+ * 
+ * def unpremultiply_argb(buf):             # <<<<<<<<<<<<<<
+ *     # b is a Python buffer object
+ *     cdef unsigned int * argb = <unsigned int *> 0   #@DuplicateSignature
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_AddTraceback("xpra.codecs.argb.argb.unpremultiply_argb", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "xpra/codecs/argb/argb.pyx":265
+ * cdef unsigned char A = tmp.index(b'\3')
+ * 
+ * cdef do_unpremultiply_argb(unsigned int * argb_in, Py_ssize_t argb_len):             # <<<<<<<<<<<<<<
+ *     # cbuf contains non-premultiplied ARGB32 data in native-endian.
+ *     # We convert to premultiplied ARGB32 data
+ */
+
+static PyObject *__pyx_f_4xpra_6codecs_4argb_4argb_do_unpremultiply_argb(unsigned int *__pyx_v_argb_in, Py_ssize_t __pyx_v_argb_len) {
+  unsigned char __pyx_v_a;
+  unsigned char __pyx_v_r;
+  unsigned char __pyx_v_g;
+  unsigned char __pyx_v_b;
+  unsigned int __pyx_v_argb;
+  PyObject *__pyx_v_argb_out = NULL;
+  int __pyx_v_i;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  Py_ssize_t __pyx_t_5;
+  long __pyx_t_6;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("do_unpremultiply_argb", 0);
+
+  /* "xpra/codecs/argb/argb.pyx":270
+ *     cdef unsigned char a, r, g, b                #@DuplicateSignature
+ *     cdef unsigned int argb                      #@DuplicateSignature
+ *     assert sizeof(int) == 4             # <<<<<<<<<<<<<<
+ *     assert argb_len>0 and argb_len % 4 == 0, "invalid buffer size: %s is not a multiple of 4" % argb_len
+ *     argb_out = bytearray(argb_len)
+ */
+  #ifndef CYTHON_WITHOUT_ASSERTIONS
+  if (unlikely(__pyx_assertions_enabled())) {
+    if (unlikely(!(((sizeof(int)) == 4) != 0))) {
+      PyErr_SetNone(PyExc_AssertionError);
+      __PYX_ERR(0, 270, __pyx_L1_error)
+    }
+  }
+  #endif
+
+  /* "xpra/codecs/argb/argb.pyx":271
+ *     cdef unsigned int argb                      #@DuplicateSignature
+ *     assert sizeof(int) == 4
+ *     assert argb_len>0 and argb_len % 4 == 0, "invalid buffer size: %s is not a multiple of 4" % argb_len             # <<<<<<<<<<<<<<
+ *     argb_out = bytearray(argb_len)
+ *     cdef int i                                  #@DuplicateSignature
+ */
+  #ifndef CYTHON_WITHOUT_ASSERTIONS
+  if (unlikely(__pyx_assertions_enabled())) {
+    __pyx_t_2 = ((__pyx_v_argb_len > 0) != 0);
+    if (__pyx_t_2) {
+    } else {
+      __pyx_t_1 = __pyx_t_2;
+      goto __pyx_L3_bool_binop_done;
+    }
+    __pyx_t_2 = (((__pyx_v_argb_len % 4) == 0) != 0);
+    __pyx_t_1 = __pyx_t_2;
+    __pyx_L3_bool_binop_done:;
+    if (unlikely(!__pyx_t_1)) {
+      __pyx_t_3 = PyInt_FromSsize_t(__pyx_v_argb_len); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 271, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_3);
+      __pyx_t_4 = __Pyx_PyString_Format(__pyx_kp_s_invalid_buffer_size_s_is_not_a_m, __pyx_t_3); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 271, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_4);
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      PyErr_SetObject(PyExc_AssertionError, __pyx_t_4);
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+      __PYX_ERR(0, 271, __pyx_L1_error)
+    }
+  }
+  #endif
+
+  /* "xpra/codecs/argb/argb.pyx":272
+ *     assert sizeof(int) == 4
+ *     assert argb_len>0 and argb_len % 4 == 0, "invalid buffer size: %s is not a multiple of 4" % argb_len
+ *     argb_out = bytearray(argb_len)             # <<<<<<<<<<<<<<
+ *     cdef int i                                  #@DuplicateSignature
+ *     for 0 <= i < argb_len // 4:
+ */
+  __pyx_t_4 = PyInt_FromSsize_t(__pyx_v_argb_len); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 272, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_3 = __Pyx_PyObject_CallOneArg(((PyObject *)(&PyByteArray_Type)), __pyx_t_4); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 272, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_v_argb_out = ((PyObject*)__pyx_t_3);
+  __pyx_t_3 = 0;
+
+  /* "xpra/codecs/argb/argb.pyx":274
+ *     argb_out = bytearray(argb_len)
+ *     cdef int i                                  #@DuplicateSignature
+ *     for 0 <= i < argb_len // 4:             # <<<<<<<<<<<<<<
+ *         argb = argb_in[i]
+ *         a = (argb >> 24) & 0xff
+ */
+  __pyx_t_5 = (__pyx_v_argb_len / 4);
+  for (__pyx_v_i = 0; __pyx_v_i < __pyx_t_5; __pyx_v_i++) {
+
+    /* "xpra/codecs/argb/argb.pyx":275
+ *     cdef int i                                  #@DuplicateSignature
+ *     for 0 <= i < argb_len // 4:
+ *         argb = argb_in[i]             # <<<<<<<<<<<<<<
+ *         a = (argb >> 24) & 0xff
+ *         r = (argb >> 16) & 0xff
+ */
+    __pyx_v_argb = (__pyx_v_argb_in[__pyx_v_i]);
+
+    /* "xpra/codecs/argb/argb.pyx":276
+ *     for 0 <= i < argb_len // 4:
+ *         argb = argb_in[i]
+ *         a = (argb >> 24) & 0xff             # <<<<<<<<<<<<<<
+ *         r = (argb >> 16) & 0xff
+ *         g = (argb >> 8) & 0xff
+ */
+    __pyx_v_a = ((__pyx_v_argb >> 24) & 0xff);
+
+    /* "xpra/codecs/argb/argb.pyx":277
+ *         argb = argb_in[i]
+ *         a = (argb >> 24) & 0xff
+ *         r = (argb >> 16) & 0xff             # <<<<<<<<<<<<<<
+ *         g = (argb >> 8) & 0xff
+ *         b = (argb >> 0) & 0xff
+ */
+    __pyx_v_r = ((__pyx_v_argb >> 16) & 0xff);
+
+    /* "xpra/codecs/argb/argb.pyx":278
+ *         a = (argb >> 24) & 0xff
+ *         r = (argb >> 16) & 0xff
+ *         g = (argb >> 8) & 0xff             # <<<<<<<<<<<<<<
+ *         b = (argb >> 0) & 0xff
+ *         if a!=0:
+ */
+    __pyx_v_g = ((__pyx_v_argb >> 8) & 0xff);
+
+    /* "xpra/codecs/argb/argb.pyx":279
+ *         r = (argb >> 16) & 0xff
+ *         g = (argb >> 8) & 0xff
+ *         b = (argb >> 0) & 0xff             # <<<<<<<<<<<<<<
+ *         if a!=0:
+ *             r = clamp(r * 255 // a)
+ */
+    __pyx_v_b = ((__pyx_v_argb >> 0) & 0xff);
+
+    /* "xpra/codecs/argb/argb.pyx":280
+ *         g = (argb >> 8) & 0xff
+ *         b = (argb >> 0) & 0xff
+ *         if a!=0:             # <<<<<<<<<<<<<<
+ *             r = clamp(r * 255 // a)
+ *             g = clamp(g * 255 // a)
+ */
+    __pyx_t_1 = ((__pyx_v_a != 0) != 0);
+    if (__pyx_t_1) {
+
+      /* "xpra/codecs/argb/argb.pyx":281
+ *         b = (argb >> 0) & 0xff
+ *         if a!=0:
+ *             r = clamp(r * 255 // a)             # <<<<<<<<<<<<<<
+ *             g = clamp(g * 255 // a)
+ *             b = clamp(b * 255 // a)
+ */
+      __pyx_v_r = __pyx_f_4xpra_6codecs_4argb_4argb_clamp(((__pyx_v_r * 0xFF) / __pyx_v_a));
+
+      /* "xpra/codecs/argb/argb.pyx":282
+ *         if a!=0:
+ *             r = clamp(r * 255 // a)
+ *             g = clamp(g * 255 // a)             # <<<<<<<<<<<<<<
+ *             b = clamp(b * 255 // a)
+ *         else:
+ */
+      __pyx_v_g = __pyx_f_4xpra_6codecs_4argb_4argb_clamp(((__pyx_v_g * 0xFF) / __pyx_v_a));
+
+      /* "xpra/codecs/argb/argb.pyx":283
+ *             r = clamp(r * 255 // a)
+ *             g = clamp(g * 255 // a)
+ *             b = clamp(b * 255 // a)             # <<<<<<<<<<<<<<
+ *         else:
+ *             r = 0
+ */
+      __pyx_v_b = __pyx_f_4xpra_6codecs_4argb_4argb_clamp(((__pyx_v_b * 0xFF) / __pyx_v_a));
+
+      /* "xpra/codecs/argb/argb.pyx":280
+ *         g = (argb >> 8) & 0xff
+ *         b = (argb >> 0) & 0xff
+ *         if a!=0:             # <<<<<<<<<<<<<<
+ *             r = clamp(r * 255 // a)
+ *             g = clamp(g * 255 // a)
+ */
+      goto __pyx_L7;
+    }
+
+    /* "xpra/codecs/argb/argb.pyx":285
+ *             b = clamp(b * 255 // a)
+ *         else:
+ *             r = 0             # <<<<<<<<<<<<<<
+ *             g = 0
+ *             b = 0
+ */
+    /*else*/ {
+      __pyx_v_r = 0;
+
+      /* "xpra/codecs/argb/argb.pyx":286
+ *         else:
+ *             r = 0
+ *             g = 0             # <<<<<<<<<<<<<<
+ *             b = 0
+ *         #we could use struct pack to avoid endianness issues
+ */
+      __pyx_v_g = 0;
+
+      /* "xpra/codecs/argb/argb.pyx":287
+ *             r = 0
+ *             g = 0
+ *             b = 0             # <<<<<<<<<<<<<<
+ *         #we could use struct pack to avoid endianness issues
+ *         #but this is python 2.5 onwards only and is probably slower:
+ */
+      __pyx_v_b = 0;
+    }
+    __pyx_L7:;
+
+    /* "xpra/codecs/argb/argb.pyx":291
+ *         #but this is python 2.5 onwards only and is probably slower:
+ *         #struct.pack_into("=BBBB", argb_out, i*4, b, g, r, a)
+ *         argb_out[i*4+B] = b             # <<<<<<<<<<<<<<
+ *         argb_out[i*4+G] = g
+ *         argb_out[i*4+R] = r
+ */
+    __pyx_t_6 = ((__pyx_v_i * 4) + __pyx_v_4xpra_6codecs_4argb_4argb_B);
+    if (unlikely(__pyx_v_b > 255)) {
+      PyErr_SetString(PyExc_ValueError, "byte must be in range(0, 256)"); __PYX_ERR(0, 291, __pyx_L1_error)
+    }
+    if (unlikely(__Pyx_SetItemInt_ByteArray(__pyx_v_argb_out, __pyx_t_6, __pyx_v_b, long, 1, __Pyx_PyInt_From_long, 0, 0, 0) < 0)) __PYX_ERR(0, 291, __pyx_L1_error)
+
+    /* "xpra/codecs/argb/argb.pyx":292
+ *         #struct.pack_into("=BBBB", argb_out, i*4, b, g, r, a)
+ *         argb_out[i*4+B] = b
+ *         argb_out[i*4+G] = g             # <<<<<<<<<<<<<<
+ *         argb_out[i*4+R] = r
+ *         argb_out[i*4+A] = a
+ */
+    __pyx_t_6 = ((__pyx_v_i * 4) + __pyx_v_4xpra_6codecs_4argb_4argb_G);
+    if (unlikely(__pyx_v_g > 255)) {
+      PyErr_SetString(PyExc_ValueError, "byte must be in range(0, 256)"); __PYX_ERR(0, 292, __pyx_L1_error)
+    }
+    if (unlikely(__Pyx_SetItemInt_ByteArray(__pyx_v_argb_out, __pyx_t_6, __pyx_v_g, long, 1, __Pyx_PyInt_From_long, 0, 0, 0) < 0)) __PYX_ERR(0, 292, __pyx_L1_error)
+
+    /* "xpra/codecs/argb/argb.pyx":293
+ *         argb_out[i*4+B] = b
+ *         argb_out[i*4+G] = g
+ *         argb_out[i*4+R] = r             # <<<<<<<<<<<<<<
+ *         argb_out[i*4+A] = a
+ *     return argb_out
+ */
+    __pyx_t_6 = ((__pyx_v_i * 4) + __pyx_v_4xpra_6codecs_4argb_4argb_R);
+    if (unlikely(__pyx_v_r > 255)) {
+      PyErr_SetString(PyExc_ValueError, "byte must be in range(0, 256)"); __PYX_ERR(0, 293, __pyx_L1_error)
+    }
+    if (unlikely(__Pyx_SetItemInt_ByteArray(__pyx_v_argb_out, __pyx_t_6, __pyx_v_r, long, 1, __Pyx_PyInt_From_long, 0, 0, 0) < 0)) __PYX_ERR(0, 293, __pyx_L1_error)
+
+    /* "xpra/codecs/argb/argb.pyx":294
+ *         argb_out[i*4+G] = g
+ *         argb_out[i*4+R] = r
+ *         argb_out[i*4+A] = a             # <<<<<<<<<<<<<<
+ *     return argb_out
+ * 
+ */
+    __pyx_t_6 = ((__pyx_v_i * 4) + __pyx_v_4xpra_6codecs_4argb_4argb_A);
+    if (unlikely(__pyx_v_a > 255)) {
+      PyErr_SetString(PyExc_ValueError, "byte must be in range(0, 256)"); __PYX_ERR(0, 294, __pyx_L1_error)
+    }
+    if (unlikely(__Pyx_SetItemInt_ByteArray(__pyx_v_argb_out, __pyx_t_6, __pyx_v_a, long, 1, __Pyx_PyInt_From_long, 0, 0, 0) < 0)) __PYX_ERR(0, 294, __pyx_L1_error)
+  }
+
+  /* "xpra/codecs/argb/argb.pyx":295
+ *         argb_out[i*4+R] = r
+ *         argb_out[i*4+A] = a
+ *     return argb_out             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v_argb_out);
+  __pyx_r = __pyx_v_argb_out;
+  goto __pyx_L0;
+
+  /* "xpra/codecs/argb/argb.pyx":265
+ * cdef unsigned char A = tmp.index(b'\3')
+ * 
+ * cdef do_unpremultiply_argb(unsigned int * argb_in, Py_ssize_t argb_len):             # <<<<<<<<<<<<<<
+ *     # cbuf contains non-premultiplied ARGB32 data in native-endian.
+ *     # We convert to premultiplied ARGB32 data
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_AddTraceback("xpra.codecs.argb.argb.do_unpremultiply_argb", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_argb_out);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "xpra/codecs/argb/argb.pyx":298
+ * 
+ * 
+ * def pack_rgb32(buf, unsigned int width, unsigned int height, unsigned int rowstride, rgb_format, rgb24=False):             # <<<<<<<<<<<<<<
+ *     """
+ *         Prepares 32-bit pixels for sending as plain rgb, in a single pass:
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_4xpra_6codecs_4argb_4argb_21pack_rgb32(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_4xpra_6codecs_4argb_4argb_20pack_rgb32[] = "\n        Prepares 32-bit pixels for sending as plain rgb, in a single pass:\n        * the padding channel (\"X\") is set to 255 (its value may be garbage)\n        * or, when rgb24 is set, the padding or alpha channel is dropped\n        * the rows are packed together (no rowstride padding)\n        Returns the new pixel format, the new pixel data and its rowstride.\n    ";
+static PyMethodDef __pyx_mdef_4xpra_6codecs_4argb_4argb_21pack_rgb32 = {"pack_rgb32", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_4xpra_6codecs_4argb_4argb_21pack_rgb32, METH_VARARGS|METH_KEYWORDS, __pyx_doc_4xpra_6codecs_4argb_4argb_20pack_rgb32};
+static PyObject *__pyx_pw_4xpra_6codecs_4argb_4argb_21pack_rgb32(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_buf = 0;
+  unsigned int __pyx_v_width;
+  unsigned int __pyx_v_height;
+  unsigned int __pyx_v_rowstride;
+  PyObject *__pyx_v_rgb_format = 0;
+  PyObject *__pyx_v_rgb24 = 0;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("pack_rgb32 (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_buf,&__pyx_n_s_width,&__pyx_n_s_height,&__pyx_n_s_rowstride,&__pyx_n_s_rgb_format,&__pyx_n_s_rgb24,0};
+    PyObject* values[6] = {0,0,0,0,0,0};
+    values[5] = ((PyObject *)Py_False);
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  6: values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
+        CYTHON_FALLTHROUGH;
+        case  5: values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+        CYTHON_FALLTHROUGH;
+        case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+        CYTHON_FALLTHROUGH;
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_buf)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_width)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("pack_rgb32", 0, 5, 6, 1); __PYX_ERR(0, 298, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  2:
+        if (likely((values[2] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_height)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("pack_rgb32", 0, 5, 6, 2); __PYX_ERR(0, 298, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  3:
+        if (likely((values[3] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_rowstride)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("pack_rgb32", 0, 5, 6, 3); __PYX_ERR(0, 298, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  4:
+        if (likely((values[4] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_rgb_format)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("pack_rgb32", 0, 5, 6, 4); __PYX_ERR(0, 298, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  5:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_rgb24);
+          if (value) { values[5] = value; kw_args--; }
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "pack_rgb32") < 0)) __PYX_ERR(0, 298, __pyx_L3_error)
+      }
+    } else {
+      switch (PyTuple_GET_SIZE(__pyx_args)) {
+        case  6: values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
+        CYTHON_FALLTHROUGH;
+        case  5: values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+        values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+        values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+    }
+    __pyx_v_buf = values[0];
+    __pyx_v_width = __Pyx_PyInt_As_unsigned_int(values[1]); if (unlikely((__pyx_v_width == (unsigned int)-1) && PyErr_Occurred())) __PYX_ERR(0, 298, __pyx_L3_error)
+    __pyx_v_height = __Pyx_PyInt_As_unsigned_int(values[2]); if (unlikely((__pyx_v_height == (unsigned int)-1) && PyErr_Occurred())) __PYX_ERR(0, 298, __pyx_L3_error)
+    __pyx_v_rowstride = __Pyx_PyInt_As_unsigned_int(values[3]); if (unlikely((__pyx_v_rowstride == (unsigned int)-1) && PyErr_Occurred())) __PYX_ERR(0, 298, __pyx_L3_error)
+    __pyx_v_rgb_format = values[4];
+    __pyx_v_rgb24 = values[5];
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("pack_rgb32", 0, 5, 6, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 298, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("xpra.codecs.argb.argb.pack_rgb32", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_4xpra_6codecs_4argb_4argb_20pack_rgb32(__pyx_self, __pyx_v_buf, __pyx_v_width, __pyx_v_height, __pyx_v_rowstride, __pyx_v_rgb_format, __pyx_v_rgb24);
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_4xpra_6codecs_4argb_4argb_20pack_rgb32(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_buf, unsigned int __pyx_v_width, unsigned int __pyx_v_height, unsigned int __pyx_v_rowstride, PyObject *__pyx_v_rgb_format, PyObject *__pyx_v_rgb24) {
+  unsigned char const *__pyx_v_src;
+  Py_ssize_t __pyx_v_src_len;
+  int __pyx_v_alpha_index;
+  unsigned int __pyx_v_bpp;
+  unsigned int __pyx_v_out_stride;
+  PyObject *__pyx_v_out = NULL;
+  unsigned char *__pyx_v_dst;
+  unsigned char __pyx_v_i0;
+  unsigned char __pyx_v_i1;
+  unsigned char __pyx_v_i2;
+  unsigned int __pyx_v_mask;
+  unsigned char __pyx_v_mask_bytes[4];
+  unsigned int __pyx_v_x;
+  unsigned int __pyx_v_y;
+  unsigned int __pyx_v_v;
+  unsigned char const *__pyx_v_s;
+  unsigned char *__pyx_v_d;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  Py_ssize_t __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  int __pyx_t_3;
+  int __pyx_t_4;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  PyObject *__pyx_t_7 = NULL;
+  PyObject *__pyx_t_8 = NULL;
+  int __pyx_t_9;
+  unsigned char __pyx_t_10;
+  unsigned char __pyx_t_11;
+  unsigned char __pyx_t_12;
+  unsigned int __pyx_t_13;
+  unsigned int __pyx_t_14;
+  unsigned int __pyx_t_15;
+  unsigned int __pyx_t_16;
+  unsigned int __pyx_t_17;
+  unsigned int __pyx_t_18;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("pack_rgb32", 0);
+  __Pyx_INCREF(__pyx_v_rgb_format);
+
+  /* "xpra/codecs/argb/argb.pyx":306
+ *         Returns the new pixel format, the new pixel data and its rowstride.
+ *     """
+ *     assert len(rgb_format)==4, "invalid rgb32 pixel format: %s" % rgb_format             # <<<<<<<<<<<<<<
+ *     cdef const unsigned char *src = NULL
+ *     cdef Py_ssize_t src_len = 0
+ */
+  #ifndef CYTHON_WITHOUT_ASSERTIONS
+  if (unlikely(__pyx_assertions_enabled())) {
+    __pyx_t_1 = PyObject_Length(__pyx_v_rgb_format); if (unlikely(__pyx_t_1 == ((Py_ssize_t)-1))) __PYX_ERR(0, 306, __pyx_L1_error)
+    if (unlikely(!((__pyx_t_1 == 4) != 0))) {
+      __pyx_t_2 = __Pyx_PyString_FormatSafe(__pyx_kp_s_invalid_rgb32_pixel_format_s, __pyx_v_rgb_format); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 306, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_2);
+      PyErr_SetObject(PyExc_AssertionError, __pyx_t_2);
+      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+      __PYX_ERR(0, 306, __pyx_L1_error)
+    }
+  }
+  #endif
+
+  /* "xpra/codecs/argb/argb.pyx":307
+ *     """
+ *     assert len(rgb_format)==4, "invalid rgb32 pixel format: %s" % rgb_format
+ *     cdef const unsigned char *src = NULL             # <<<<<<<<<<<<<<
+ *     cdef Py_ssize_t src_len = 0
+ *     assert object_as_buffer(buf, <const void**> &src, &src_len)==0, "cannot convert %s to a readable buffer" % type(buf)
+ */
+  __pyx_v_src = NULL;
+
+  /* "xpra/codecs/argb/argb.pyx":308
+ *     assert len(rgb_format)==4, "invalid rgb32 pixel format: %s" % rgb_format
+ *     cdef const unsigned char *src = NULL
+ *     cdef Py_ssize_t src_len = 0             # <<<<<<<<<<<<<<
+ *     assert object_as_buffer(buf, <const void**> &src, &src_len)==0, "cannot convert %s to a readable buffer" % type(buf)
+ *     assert width>0 and height>0, "invalid dimensions: %ix%i" % (width, height)
+ */
+  __pyx_v_src_len = 0;
+
+  /* "xpra/codecs/argb/argb.pyx":309
+ *     cdef const unsigned char *src = NULL
+ *     cdef Py_ssize_t src_len = 0
+ *     assert object_as_buffer(buf, <const void**> &src, &src_len)==0, "cannot convert %s to a readable buffer" % type(buf)             # <<<<<<<<<<<<<<
+ *     assert width>0 and height>0, "invalid dimensions: %ix%i" % (width, height)
+ *     assert rowstride>=width*4, "invalid rowstride %i for width %i" % (rowstride, width)
+ */
+  #ifndef CYTHON_WITHOUT_ASSERTIONS
+  if (unlikely(__pyx_assertions_enabled())) {
+    if (unlikely(!((object_as_buffer(__pyx_v_buf, ((void const **)(&__pyx_v_src)), (&__pyx_v_src_len)) == 0) != 0))) {
+      __pyx_t_2 = __Pyx_PyString_FormatSafe(__pyx_kp_s_cannot_convert_s_to_a_readable_b, ((PyObject *)Py_TYPE(__pyx_v_buf))); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 309, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_2);
+      PyErr_SetObject(PyExc_AssertionError, __pyx_t_2);
+      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+      __PYX_ERR(0, 309, __pyx_L1_error)
+    }
+  }
+  #endif
+
+  /* "xpra/codecs/argb/argb.pyx":310
+ *     cdef Py_ssize_t src_len = 0
+ *     assert object_as_buffer(buf, <const void**> &src, &src_len)==0, "cannot convert %s to a readable buffer" % type(buf)
+ *     assert width>0 and height>0, "invalid dimensions: %ix%i" % (width, height)             # <<<<<<<<<<<<<<
+ *     assert rowstride>=width*4, "invalid rowstride %i for width %i" % (rowstride, width)
+ *     assert src_len>=(<Py_ssize_t> rowstride)*(height-1)+width*4, "buffer is too small: %i bytes for %ix%i with rowstride=%i" % (src_len, width, height, rowstride)
+ */
+  #ifndef CYTHON_WITHOUT_ASSERTIONS
+  if (unlikely(__pyx_assertions_enabled())) {
+    __pyx_t_4 = ((__pyx_v_width > 0) != 0);
+    if (__pyx_t_4) {
+    } else {
+      __pyx_t_3 = __pyx_t_4;
+      goto __pyx_L3_bool_binop_done;
+    }
+    __pyx_t_4 = ((__pyx_v_height > 0) != 0);
+    __pyx_t_3 = __pyx_t_4;
+    __pyx_L3_bool_binop_done:;
+    if (unlikely(!__pyx_t_3)) {
+      __pyx_t_2 = __Pyx_PyInt_From_unsigned_int(__pyx_v_width); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 310, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_2);
+      __pyx_t_5 = __Pyx_PyInt_From_unsigned_int(__pyx_v_height); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 310, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_5);
+      __pyx_t_6 = PyTuple_New(2); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 310, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_6);
+      __Pyx_GIVEREF(__pyx_t_2);
+      PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_t_2);
+      __Pyx_GIVEREF(__pyx_t_5);
+      PyTuple_SET_ITEM(__pyx_t_6, 1, __pyx_t_5);
+      __pyx_t_2 = 0;
+      __pyx_t_5 = 0;
+      __pyx_t_5 = __Pyx_PyString_Format(__pyx_kp_s_invalid_dimensions_ix_i, __pyx_t_6); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 310, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_5);
+      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+      PyErr_SetObject(PyExc_AssertionError, __pyx_t_5);
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      __PYX_ERR(0, 310, __pyx_L1_error)
+    }
+  }
+  #endif
+
+  /* "xpra/codecs/argb/argb.pyx":311
+ *     assert object_as_buffer(buf, <const void**> &src, &src_len)==0, "cannot convert %s to a readable buffer" % type(buf)
+ *     assert width>0 and height>0, "invalid dimensions: %ix%i" % (width, height)
+ *     assert rowstride>=width*4, "invalid rowstride %i for width %i" % (rowstride, width)             # <<<<<<<<<<<<<<
+ *     assert src_len>=(<Py_ssize_t> rowstride)*(height-1)+width*4, "buffer is too small: %i bytes for %ix%i with rowstride=%i" % (src_len, width, height, rowstride)
+ *     cdef int alpha_index = rgb_format.upper().find("X")
+ */
+  #ifndef CYTHON_WITHOUT_ASSERTIONS
+  if (unlikely(__pyx_assertions_enabled())) {
+    if (unlikely(!((__pyx_v_rowstride >= (__pyx_v_width * 4)) != 0))) {
+      __pyx_t_5 = __Pyx_PyInt_From_unsigned_int(__pyx_v_rowstride); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 311, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_5);
+      __pyx_t_6 = __Pyx_PyInt_From_unsigned_int(__pyx_v_width); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 311, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_6);
+      __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 311, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_2);
+      __Pyx_GIVEREF(__pyx_t_5);
+      PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_t_5);
+      __Pyx_GIVEREF(__pyx_t_6);
+      PyTuple_SET_ITEM(__pyx_t_2, 1, __pyx_t_6);
+      __pyx_t_5 = 0;
+      __pyx_t_6 = 0;
+      __pyx_t_6 = __Pyx_PyString_Format(__pyx_kp_s_invalid_rowstride_i_for_width_i, __pyx_t_2); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 311, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_6);
+      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+      PyErr_SetObject(PyExc_AssertionError, __pyx_t_6);
+      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+      __PYX_ERR(0, 311, __pyx_L1_error)
+    }
+  }
+  #endif
+
+  /* "xpra/codecs/argb/argb.pyx":312
+ *     assert width>0 and height>0, "invalid dimensions: %ix%i" % (width, height)
+ *     assert rowstride>=width*4, "invalid rowstride %i for width %i" % (rowstride, width)
+ *     assert src_len>=(<Py_ssize_t> rowstride)*(height-1)+width*4, "buffer is too small: %i bytes for %ix%i with rowstride=%i" % (src_len, width, height, rowstride)             # <<<<<<<<<<<<<<
+ *     cdef int alpha_index = rgb_format.upper().find("X")
+ *     if rgb24 and alpha_index<0:
+ */
+  #ifndef CYTHON_WITHOUT_ASSERTIONS
+  if (unlikely(__pyx_assertions_enabled())) {
+    if (unlikely(!((__pyx_v_src_len >= ((((Py_ssize_t)__pyx_v_rowstride) * (__pyx_v_height - 1)) + (__pyx_v_width * 4))) != 0))) {
+      __pyx_t_6 = PyInt_FromSsize_t(__pyx_v_src_len); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 312, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_6);
+      __pyx_t_2 = __Pyx_PyInt_From_unsigned_int(__pyx_v_width); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 312, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_2);
+      __pyx_t_5 = __Pyx_PyInt_From_unsigned_int(__pyx_v_height); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 312, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_5);
+      __pyx_t_7 = __Pyx_PyInt_From_unsigned_int(__pyx_v_rowstride); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 312, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_7);
+      __pyx_t_8 = PyTuple_New(4); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 312, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_8);
+      __Pyx_GIVEREF(__pyx_t_6);
+      PyTuple_SET_ITEM(__pyx_t_8, 0, __pyx_t_6);
+      __Pyx_GIVEREF(__pyx_t_2);
+      PyTuple_SET_ITEM(__pyx_t_8, 1, __pyx_t_2);
+      __Pyx_GIVEREF(__pyx_t_5);
+      PyTuple_SET_ITEM(__pyx_t_8, 2, __pyx_t_5);
+      __Pyx_GIVEREF(__pyx_t_7);
+      PyTuple_SET_ITEM(__pyx_t_8, 3, __pyx_t_7);
+      __pyx_t_6 = 0;
+      __pyx_t_2 = 0;
+      __pyx_t_5 = 0;
+      __pyx_t_7 = 0;
+      __pyx_t_7 = __Pyx_PyString_Format(__pyx_kp_s_buffer_is_too_small_i_bytes_for, __pyx_t_8); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 312, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_7);
+      __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+      PyErr_SetObject(PyExc_AssertionError, __pyx_t_7);
+      __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+      __PYX_ERR(0, 312, __pyx_L1_error)
+    }
+  }
+  #endif
+
+  /* "xpra/codecs/argb/argb.pyx":313
+ *     assert rowstride>=width*4, "invalid rowstride %i for width %i" % (rowstride, width)
+ *     assert src_len>=(<Py_ssize_t> rowstride)*(height-1)+width*4, "buffer is too small: %i bytes for %ix%i with rowstride=%i" % (src_len, width, height, rowstride)
+ *     cdef int alpha_index = rgb_format.upper().find("X")             # <<<<<<<<<<<<<<
+ *     if rgb24 and alpha_index<0:
+ *         alpha_index = rgb_format.upper().find("A")
+ */
+  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_v_rgb_format, __pyx_n_s_upper); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 313, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_2 = NULL;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_5))) {
+    __pyx_t_2 = PyMethod_GET_SELF(__pyx_t_5);
+    if (likely(__pyx_t_2)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_5);
+      __Pyx_INCREF(__pyx_t_2);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_5, function);
+    }
+  }
+  __pyx_t_8 = (__pyx_t_2) ? __Pyx_PyObject_CallOneArg(__pyx_t_5, __pyx_t_2) : __Pyx_PyObject_CallNoArg(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
+  if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 313, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_8);
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_8, __pyx_n_s_find); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 313, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+  __pyx_t_8 = NULL;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_5))) {
+    __pyx_t_8 = PyMethod_GET_SELF(__pyx_t_5);
+    if (likely(__pyx_t_8)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_5);
+      __Pyx_INCREF(__pyx_t_8);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_5, function);
+    }
+  }
+  __pyx_t_7 = (__pyx_t_8) ? __Pyx_PyObject_Call2Args(__pyx_t_5, __pyx_t_8, __pyx_n_s_X) : __Pyx_PyObject_CallOneArg(__pyx_t_5, __pyx_n_s_X);
+  __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
+  if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 313, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __pyx_t_9 = __Pyx_PyInt_As_int(__pyx_t_7); if (unlikely((__pyx_t_9 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 313, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_v_alpha_index = __pyx_t_9;
+
+  /* "xpra/codecs/argb/argb.pyx":314
+ *     assert src_len>=(<Py_ssize_t> rowstride)*(height-1)+width*4, "buffer is too small: %i bytes for %ix%i with rowstride=%i" % (src_len, width, height, rowstride)
+ *     cdef int alpha_index = rgb_format.upper().find("X")
+ *     if rgb24 and alpha_index<0:             # <<<<<<<<<<<<<<
+ *         alpha_index = rgb_format.upper().find("A")
+ *     cdef unsigned int bpp = 4
+ */
+  __pyx_t_4 = __Pyx_PyObject_IsTrue(__pyx_v_rgb24); if (unlikely(__pyx_t_4 < 0)) __PYX_ERR(0, 314, __pyx_L1_error)
+  if (__pyx_t_4) {
+  } else {
+    __pyx_t_3 = __pyx_t_4;
+    goto __pyx_L6_bool_binop_done;
+  }
+  __pyx_t_4 = ((__pyx_v_alpha_index < 0) != 0);
+  __pyx_t_3 = __pyx_t_4;
+  __pyx_L6_bool_binop_done:;
+  if (__pyx_t_3) {
+
+    /* "xpra/codecs/argb/argb.pyx":315
+ *     cdef int alpha_index = rgb_format.upper().find("X")
+ *     if rgb24 and alpha_index<0:
+ *         alpha_index = rgb_format.upper().find("A")             # <<<<<<<<<<<<<<
+ *     cdef unsigned int bpp = 4
+ *     if rgb24:
+ */
+    __pyx_t_8 = __Pyx_PyObject_GetAttrStr(__pyx_v_rgb_format, __pyx_n_s_upper); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 315, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_8);
+    __pyx_t_2 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_8))) {
+      __pyx_t_2 = PyMethod_GET_SELF(__pyx_t_8);
+      if (likely(__pyx_t_2)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_8);
+        __Pyx_INCREF(__pyx_t_2);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_8, function);
+      }
+    }
+    __pyx_t_5 = (__pyx_t_2) ? __Pyx_PyObject_CallOneArg(__pyx_t_8, __pyx_t_2) : __Pyx_PyObject_CallNoArg(__pyx_t_8);
+    __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
+    if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 315, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+    __pyx_t_8 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_n_s_find); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 315, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_8);
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __pyx_t_5 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_8))) {
+      __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_8);
+      if (likely(__pyx_t_5)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_8);
+        __Pyx_INCREF(__pyx_t_5);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_8, function);
+      }
+    }
+    __pyx_t_7 = (__pyx_t_5) ? __Pyx_PyObject_Call2Args(__pyx_t_8, __pyx_t_5, __pyx_n_s_A) : __Pyx_PyObject_CallOneArg(__pyx_t_8, __pyx_n_s_A);
+    __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+    if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 315, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_7);
+    __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+    __pyx_t_9 = __Pyx_PyInt_As_int(__pyx_t_7); if (unlikely((__pyx_t_9 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 315, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+    __pyx_v_alpha_index = __pyx_t_9;
+
+    /* "xpra/codecs/argb/argb.pyx":314
+ *     assert src_len>=(<Py_ssize_t> rowstride)*(height-1)+width*4, "buffer is too small: %i bytes for %ix%i with rowstride=%i" % (src_len, width, height, rowstride)
+ *     cdef int alpha_index = rgb_format.upper().find("X")
+ *     if rgb24 and alpha_index<0:             # <<<<<<<<<<<<<<
+ *         alpha_index = rgb_format.upper().find("A")
+ *     cdef unsigned int bpp = 4
+ */
+  }
+
+  /* "xpra/codecs/argb/argb.pyx":316
+ *     if rgb24 and alpha_index<0:
+ *         alpha_index = rgb_format.upper().find("A")
+ *     cdef unsigned int bpp = 4             # <<<<<<<<<<<<<<
+ *     if rgb24:
+ *         assert alpha_index>=0, "no alpha or padding channel to drop from %s" % rgb_format
+ */
+  __pyx_v_bpp = 4;
+
+  /* "xpra/codecs/argb/argb.pyx":317
+ *         alpha_index = rgb_format.upper().find("A")
+ *     cdef unsigned int bpp = 4
+ *     if rgb24:             # <<<<<<<<<<<<<<
+ *         assert alpha_index>=0, "no alpha or padding channel to drop from %s" % rgb_format
+ *         bpp = 3
+ */
+  __pyx_t_3 = __Pyx_PyObject_IsTrue(__pyx_v_rgb24); if (unlikely(__pyx_t_3 < 0)) __PYX_ERR(0, 317, __pyx_L1_error)
+  if (__pyx_t_3) {
+
+    /* "xpra/codecs/argb/argb.pyx":318
+ *     cdef unsigned int bpp = 4
+ *     if rgb24:
+ *         assert alpha_index>=0, "no alpha or padding channel to drop from %s" % rgb_format             # <<<<<<<<<<<<<<
+ *         bpp = 3
+ *         rgb_format = rgb_format[:alpha_index]+rgb_format[alpha_index+1:]
+ */
+    #ifndef CYTHON_WITHOUT_ASSERTIONS
+    if (unlikely(__pyx_assertions_enabled())) {
+      if (unlikely(!((__pyx_v_alpha_index >= 0) != 0))) {
+        __pyx_t_7 = __Pyx_PyString_FormatSafe(__pyx_kp_s_no_alpha_or_padding_channel_to_d, __pyx_v_rgb_format); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 318, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_7);
+        PyErr_SetObject(PyExc_AssertionError, __pyx_t_7);
+        __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+        __PYX_ERR(0, 318, __pyx_L1_error)
+      }
+    }
+    #endif
+
+    /* "xpra/codecs/argb/argb.pyx":319
+ *     if rgb24:
+ *         assert alpha_index>=0, "no alpha or padding channel to drop from %s" % rgb_format
+ *         bpp = 3             # <<<<<<<<<<<<<<
+ *         rgb_format = rgb_format[:alpha_index]+rgb_format[alpha_index+1:]
+ *     cdef unsigned int out_stride = width*bpp
+ */
+    __pyx_v_bpp = 3;
+
+    /* "xpra/codecs/argb/argb.pyx":320
+ *         assert alpha_index>=0, "no alpha or padding channel to drop from %s" % rgb_format
+ *         bpp = 3
+ *         rgb_format = rgb_format[:alpha_index]+rgb_format[alpha_index+1:]             # <<<<<<<<<<<<<<
+ *     cdef unsigned int out_stride = width*bpp
+ *     #we fill in the new bytes object before anything else can see it:
+ */
+    __pyx_t_7 = __Pyx_PyObject_GetSlice(__pyx_v_rgb_format, 0, __pyx_v_alpha_index, NULL, NULL, NULL, 0, 1, 0); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 320, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_7);
+    __pyx_t_8 = __Pyx_PyObject_GetSlice(__pyx_v_rgb_format, (__pyx_v_alpha_index + 1), 0, NULL, NULL, NULL, 1, 0, 0); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 320, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_8);
+    __pyx_t_5 = PyNumber_Add(__pyx_t_7, __pyx_t_8); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 320, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+    __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+    __Pyx_DECREF_SET(__pyx_v_rgb_format, __pyx_t_5);
+    __pyx_t_5 = 0;
+
+    /* "xpra/codecs/argb/argb.pyx":317
+ *         alpha_index = rgb_format.upper().find("A")
+ *     cdef unsigned int bpp = 4
+ *     if rgb24:             # <<<<<<<<<<<<<<
+ *         assert alpha_index>=0, "no alpha or padding channel to drop from %s" % rgb_format
+ *         bpp = 3
+ */
+  }
+
+  /* "xpra/codecs/argb/argb.pyx":321
+ *         bpp = 3
+ *         rgb_format = rgb_format[:alpha_index]+rgb_format[alpha_index+1:]
+ *     cdef unsigned int out_stride = width*bpp             # <<<<<<<<<<<<<<
+ *     #we fill in the new bytes object before anything else can see it:
+ *     out = PyBytes_FromStringAndSize(NULL, out_stride*height)
+ */
+  __pyx_v_out_stride = (__pyx_v_width * __pyx_v_bpp);
+
+  /* "xpra/codecs/argb/argb.pyx":323
+ *     cdef unsigned int out_stride = width*bpp
+ *     #we fill in the new bytes object before anything else can see it:
+ *     out = PyBytes_FromStringAndSize(NULL, out_stride*height)             # <<<<<<<<<<<<<<
+ *     cdef unsigned char *dst = <unsigned char *> PyBytes_AS_STRING(out)
+ *     #channel indexes for rgb24:
+ */
+  __pyx_t_5 = PyBytes_FromStringAndSize(NULL, (__pyx_v_out_stride * __pyx_v_height)); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 323, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_v_out = ((PyObject*)__pyx_t_5);
+  __pyx_t_5 = 0;
+
+  /* "xpra/codecs/argb/argb.pyx":324
+ *     #we fill in the new bytes object before anything else can see it:
+ *     out = PyBytes_FromStringAndSize(NULL, out_stride*height)
+ *     cdef unsigned char *dst = <unsigned char *> PyBytes_AS_STRING(out)             # <<<<<<<<<<<<<<
+ *     #channel indexes for rgb24:
+ *     cdef unsigned char i0 = 0, i1 = 1, i2 = 2
+ */
+  __pyx_v_dst = ((unsigned char *)PyBytes_AS_STRING(__pyx_v_out));
+
+  /* "xpra/codecs/argb/argb.pyx":326
+ *     cdef unsigned char *dst = <unsigned char *> PyBytes_AS_STRING(out)
+ *     #channel indexes for rgb24:
+ *     cdef unsigned char i0 = 0, i1 = 1, i2 = 2             # <<<<<<<<<<<<<<
+ *     if alpha_index==0:
+ *         i0, i1, i2 = 1, 2, 3
+ */
+  __pyx_v_i0 = 0;
+  __pyx_v_i1 = 1;
+  __pyx_v_i2 = 2;
+
+  /* "xpra/codecs/argb/argb.pyx":327
+ *     #channel indexes for rgb24:
+ *     cdef unsigned char i0 = 0, i1 = 1, i2 = 2
+ *     if alpha_index==0:             # <<<<<<<<<<<<<<
+ *         i0, i1, i2 = 1, 2, 3
+ *     elif alpha_index==1:
+ */
+  switch (__pyx_v_alpha_index) {
+    case 0:
+
+    /* "xpra/codecs/argb/argb.pyx":328
+ *     cdef unsigned char i0 = 0, i1 = 1, i2 = 2
+ *     if alpha_index==0:
+ *         i0, i1, i2 = 1, 2, 3             # <<<<<<<<<<<<<<
+ *     elif alpha_index==1:
+ *         i0, i1, i2 = 0, 2, 3
+ */
+    __pyx_t_10 = 1;
+    __pyx_t_11 = 2;
+    __pyx_t_12 = 3;
+    __pyx_v_i0 = __pyx_t_10;
+    __pyx_v_i1 = __pyx_t_11;
+    __pyx_v_i2 = __pyx_t_12;
+
+    /* "xpra/codecs/argb/argb.pyx":327
+ *     #channel indexes for rgb24:
+ *     cdef unsigned char i0 = 0, i1 = 1, i2 = 2
+ *     if alpha_index==0:             # <<<<<<<<<<<<<<
+ *         i0, i1, i2 = 1, 2, 3
+ *     elif alpha_index==1:
+ */
+    break;
+    case 1:
+
+    /* "xpra/codecs/argb/argb.pyx":330
+ *         i0, i1, i2 = 1, 2, 3
+ *     elif alpha_index==1:
+ *         i0, i1, i2 = 0, 2, 3             # <<<<<<<<<<<<<<
+ *     elif alpha_index==2:
+ *         i0, i1, i2 = 0, 1, 3
+ */
+    __pyx_t_12 = 0;
+    __pyx_t_11 = 2;
+    __pyx_t_10 = 3;
+    __pyx_v_i0 = __pyx_t_12;
+    __pyx_v_i1 = __pyx_t_11;
+    __pyx_v_i2 = __pyx_t_10;
+
+    /* "xpra/codecs/argb/argb.pyx":329
+ *     if alpha_index==0:
+ *         i0, i1, i2 = 1, 2, 3
+ *     elif alpha_index==1:             # <<<<<<<<<<<<<<
+ *         i0, i1, i2 = 0, 2, 3
+ *     elif alpha_index==2:
+ */
+    break;
+    case 2:
+
+    /* "xpra/codecs/argb/argb.pyx":332
+ *         i0, i1, i2 = 0, 2, 3
+ *     elif alpha_index==2:
+ *         i0, i1, i2 = 0, 1, 3             # <<<<<<<<<<<<<<
+ *     #mask for forcing the padding channel to 255,
+ *     #built from bytes so that it matches the native endianness of the 32-bit loads:
+ */
+    __pyx_t_10 = 0;
+    __pyx_t_11 = 1;
+    __pyx_t_12 = 3;
+    __pyx_v_i0 = __pyx_t_10;
+    __pyx_v_i1 = __pyx_t_11;
+    __pyx_v_i2 = __pyx_t_12;
+
+    /* "xpra/codecs/argb/argb.pyx":331
+ *     elif alpha_index==1:
+ *         i0, i1, i2 = 0, 2, 3
+ *     elif alpha_index==2:             # <<<<<<<<<<<<<<
+ *         i0, i1, i2 = 0, 1, 3
+ *     #mask for forcing the padding channel to 255,
+ */
+    break;
+    default: break;
+  }
+
+  /* "xpra/codecs/argb/argb.pyx":335
+ *     #mask for forcing the padding channel to 255,
+ *     #built from bytes so that it matches the native endianness of the 32-bit loads:
+ *     cdef unsigned int mask = 0             # <<<<<<<<<<<<<<
+ *     cdef unsigned char mask_bytes[4]
+ *     memset(mask_bytes, 0, 4)
+ */
+  __pyx_v_mask = 0;
+
+  /* "xpra/codecs/argb/argb.pyx":337
+ *     cdef unsigned int mask = 0
+ *     cdef unsigned char mask_bytes[4]
+ *     memset(mask_bytes, 0, 4)             # <<<<<<<<<<<<<<
+ *     if alpha_index>=0:
+ *         mask_bytes[alpha_index] = 255
+ */
+  (void)(memset(__pyx_v_mask_bytes, 0, 4));
+
+  /* "xpra/codecs/argb/argb.pyx":338
+ *     cdef unsigned char mask_bytes[4]
+ *     memset(mask_bytes, 0, 4)
+ *     if alpha_index>=0:             # <<<<<<<<<<<<<<
+ *         mask_bytes[alpha_index] = 255
+ *     memcpy(&mask, mask_bytes, 4)
+ */
+  __pyx_t_3 = ((__pyx_v_alpha_index >= 0) != 0);
+  if (__pyx_t_3) {
+
+    /* "xpra/codecs/argb/argb.pyx":339
+ *     memset(mask_bytes, 0, 4)
+ *     if alpha_index>=0:
+ *         mask_bytes[alpha_index] = 255             # <<<<<<<<<<<<<<
+ *     memcpy(&mask, mask_bytes, 4)
+ *     cdef unsigned int x, y
+ */
+    (__pyx_v_mask_bytes[__pyx_v_alpha_index]) = 0xFF;
+
+    /* "xpra/codecs/argb/argb.pyx":338
+ *     cdef unsigned char mask_bytes[4]
+ *     memset(mask_bytes, 0, 4)
+ *     if alpha_index>=0:             # <<<<<<<<<<<<<<
+ *         mask_bytes[alpha_index] = 255
+ *     memcpy(&mask, mask_bytes, 4)
+ */
+  }
+
+  /* "xpra/codecs/argb/argb.pyx":340
+ *     if alpha_index>=0:
+ *         mask_bytes[alpha_index] = 255
+ *     memcpy(&mask, mask_bytes, 4)             # <<<<<<<<<<<<<<
+ *     cdef unsigned int x, y
+ *     cdef unsigned int v
+ */
+  (void)(memcpy((&__pyx_v_mask), __pyx_v_mask_bytes, 4));
+
+  /* "xpra/codecs/argb/argb.pyx":345
+ *     cdef const unsigned char *s
+ *     cdef unsigned char *d
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         for y in range(height):
+ *             s = src + y*rowstride
+ */
+  {
+      #ifdef WITH_THREAD
+      PyThreadState *_save;
+      Py_UNBLOCK_THREADS
+      __Pyx_FastGIL_Remember();
+      #endif
+      /*try:*/ {
+
+        /* "xpra/codecs/argb/argb.pyx":346
+ *     cdef unsigned char *d
+ *     with nogil:
+ *         for y in range(height):             # <<<<<<<<<<<<<<
+ *             s = src + y*rowstride
+ *             d = dst + y*out_stride
+ */
+        __pyx_t_13 = __pyx_v_height;
+        __pyx_t_14 = __pyx_t_13;
+        for (__pyx_t_15 = 0; __pyx_t_15 < __pyx_t_14; __pyx_t_15+=1) {
+          __pyx_v_y = __pyx_t_15;
+
+          /* "xpra/codecs/argb/argb.pyx":347
+ *     with nogil:
+ *         for y in range(height):
+ *             s = src + y*rowstride             # <<<<<<<<<<<<<<
+ *             d = dst + y*out_stride
+ *             if bpp==4:
+ */
+          __pyx_v_s = (__pyx_v_src + (__pyx_v_y * __pyx_v_rowstride));
+
+          /* "xpra/codecs/argb/argb.pyx":348
+ *         for y in range(height):
+ *             s = src + y*rowstride
+ *             d = dst + y*out_stride             # <<<<<<<<<<<<<<
+ *             if bpp==4:
+ *                 for x in range(width):
+ */
+          __pyx_v_d = (__pyx_v_dst + (__pyx_v_y * __pyx_v_out_stride));
+
+          /* "xpra/codecs/argb/argb.pyx":349
+ *             s = src + y*rowstride
+ *             d = dst + y*out_stride
+ *             if bpp==4:             # <<<<<<<<<<<<<<
+ *                 for x in range(width):
+ *                     memcpy(&v, <void*> (s+x*4), 4)
+ */
+          __pyx_t_3 = ((__pyx_v_bpp == 4) != 0);
+          if (__pyx_t_3) {
+
+            /* "xpra/codecs/argb/argb.pyx":350
+ *             d = dst + y*out_stride
+ *             if bpp==4:
+ *                 for x in range(width):             # <<<<<<<<<<<<<<
+ *                     memcpy(&v, <void*> (s+x*4), 4)
+ *                     v = v | mask
+ */
+            __pyx_t_16 = __pyx_v_width;
+            __pyx_t_17 = __pyx_t_16;
+            for (__pyx_t_18 = 0; __pyx_t_18 < __pyx_t_17; __pyx_t_18+=1) {
+              __pyx_v_x = __pyx_t_18;
+
+              /* "xpra/codecs/argb/argb.pyx":351
+ *             if bpp==4:
+ *                 for x in range(width):
+ *                     memcpy(&v, <void*> (s+x*4), 4)             # <<<<<<<<<<<<<<
+ *                     v = v | mask
+ *                     memcpy(d+x*4, &v, 4)
+ */
+              (void)(memcpy((&__pyx_v_v), ((void *)(__pyx_v_s + (__pyx_v_x * 4))), 4));
+
+              /* "xpra/codecs/argb/argb.pyx":352
+ *                 for x in range(width):
+ *                     memcpy(&v, <void*> (s+x*4), 4)
+ *                     v = v | mask             # <<<<<<<<<<<<<<
+ *                     memcpy(d+x*4, &v, 4)
+ *             else:
+ */
+              __pyx_v_v = (__pyx_v_v | __pyx_v_mask);
+
+              /* "xpra/codecs/argb/argb.pyx":353
+ *                     memcpy(&v, <void*> (s+x*4), 4)
+ *                     v = v | mask
+ *                     memcpy(d+x*4, &v, 4)             # <<<<<<<<<<<<<<
+ *             else:
+ *                 for x in range(width):
+ */
+              (void)(memcpy((__pyx_v_d + (__pyx_v_x * 4)), (&__pyx_v_v), 4));
+            }
+
+            /* "xpra/codecs/argb/argb.pyx":349
+ *             s = src + y*rowstride
+ *             d = dst + y*out_stride
+ *             if bpp==4:             # <<<<<<<<<<<<<<
+ *                 for x in range(width):
+ *                     memcpy(&v, <void*> (s+x*4), 4)
+ */
+            goto __pyx_L15;
+          }
+
+          /* "xpra/codecs/argb/argb.pyx":355
+ *                     memcpy(d+x*4, &v, 4)
+ *             else:
+ *                 for x in range(width):             # <<<<<<<<<<<<<<
+ *                     d[0] = s[i0]
+ *                     d[1] = s[i1]
+ */
+          /*else*/ {
+            __pyx_t_16 = __pyx_v_width;
+            __pyx_t_17 = __pyx_t_16;
+            for (__pyx_t_18 = 0; __pyx_t_18 < __pyx_t_17; __pyx_t_18+=1) {
+              __pyx_v_x = __pyx_t_18;
+
+              /* "xpra/codecs/argb/argb.pyx":356
+ *             else:
+ *                 for x in range(width):
+ *                     d[0] = s[i0]             # <<<<<<<<<<<<<<
+ *                     d[1] = s[i1]
+ *                     d[2] = s[i2]
+ */
+              (__pyx_v_d[0]) = (__pyx_v_s[__pyx_v_i0]);
+
+              /* "xpra/codecs/argb/argb.pyx":357
+ *                 for x in range(width):
+ *                     d[0] = s[i0]
+ *                     d[1] = s[i1]             # <<<<<<<<<<<<<<
+ *                     d[2] = s[i2]
+ *                     s += 4
+ */
+              (__pyx_v_d[1]) = (__pyx_v_s[__pyx_v_i1]);
+
+              /* "xpra/codecs/argb/argb.pyx":358
+ *                     d[0] = s[i0]
+ *                     d[1] = s[i1]
+ *                     d[2] = s[i2]             # <<<<<<<<<<<<<<
+ *                     s += 4
+ *                     d += 3
+ */
+              (__pyx_v_d[2]) = (__pyx_v_s[__pyx_v_i2]);
+
+              /* "xpra/codecs/argb/argb.pyx":359
+ *                     d[1] = s[i1]
+ *                     d[2] = s[i2]
+ *                     s += 4             # <<<<<<<<<<<<<<
+ *                     d += 3
+ *     return rgb_format, out, out_stride
+ */
+              __pyx_v_s = (__pyx_v_s + 4);
+
+              /* "xpra/codecs/argb/argb.pyx":360
+ *                     d[2] = s[i2]
+ *                     s += 4
+ *                     d += 3             # <<<<<<<<<<<<<<
+ *     return rgb_format, out, out_stride
+ */
+              __pyx_v_d = (__pyx_v_d + 3);
+            }
+          }
+          __pyx_L15:;
+        }
+      }
+
+      /* "xpra/codecs/argb/argb.pyx":345
+ *     cdef const unsigned char *s
+ *     cdef unsigned char *d
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         for y in range(height):
+ *             s = src + y*rowstride
+ */
+      /*finally:*/ {
+        /*normal exit:*/{
+          #ifdef WITH_THREAD
+          __Pyx_FastGIL_Forget();
+          Py_BLOCK_THREADS
+          #endif
+          goto __pyx_L12;
+        }
+        __pyx_L12:;
+      }
+  }
+
+  /* "xpra/codecs/argb/argb.pyx":361
+ *                     s += 4
+ *                     d += 3
+ *     return rgb_format, out, out_stride             # <<<<<<<<<<<<<<
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_5 = __Pyx_PyInt_From_unsigned_int(__pyx_v_out_stride); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 361, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_8 = PyTuple_New(3); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 361, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_8);
+  __Pyx_INCREF(__pyx_v_rgb_format);
+  __Pyx_GIVEREF(__pyx_v_rgb_format);
+  PyTuple_SET_ITEM(__pyx_t_8, 0, __pyx_v_rgb_format);
+  __Pyx_INCREF(__pyx_v_out);
+  __Pyx_GIVEREF(__pyx_v_out);
+  PyTuple_SET_ITEM(__pyx_t_8, 1, __pyx_v_out);
+  __Pyx_GIVEREF(__pyx_t_5);
+  PyTuple_SET_ITEM(__pyx_t_8, 2, __pyx_t_5);
+  __pyx_t_5 = 0;
+  __pyx_r = __pyx_t_8;
+  __pyx_t_8 = 0;
+  goto __pyx_L0;
+
+  /* "xpra/codecs/argb/argb.pyx":298
+ * 
+ * 
+ * def pack_rgb32(buf, unsigned int width, unsigned int height, unsigned int rowstride, rgb_format, rgb24=False):             # <<<<<<<<<<<<<<
+ *     """
+ *         Prepares 32-bit pixels for sending as plain rgb, in a single pass:
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_XDECREF(__pyx_t_8);
+  __Pyx_AddTraceback("xpra.codecs.argb.argb.pack_rgb32", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_out);
+  __Pyx_XDECREF(__pyx_v_rgb_format);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyMethodDef __pyx_methods[] = {
+  {0, 0, 0, 0}
+};
+
+#if PY_MAJOR_VERSION >= 3
+#if CYTHON_PEP489_MULTI_PHASE_INIT
+static PyObject* __pyx_pymod_create(PyObject *spec, PyModuleDef *def); /*proto*/
+static int __pyx_pymod_exec_argb(PyObject* module); /*proto*/
+static PyModuleDef_Slot __pyx_moduledef_slots[] = {
+  {Py_mod_create, (void*)__pyx_pymod_create},
+  {Py_mod_exec, (void*)__pyx_pymod_exec_argb},
+  {0, NULL}
+};
+#endif
+
+static struct PyModuleDef __pyx_moduledef = {
+    PyModuleDef_HEAD_INIT,
+    "argb",
+    0, /* m_doc */
+  #if CYTHON_PEP489_MULTI_PHASE_INIT
+    0, /* m_size */
+  #else
+    -1, /* m_size */
+  #endif
+    __pyx_methods /* m_methods */,
+  #if CYTHON_PEP489_MULTI_PHASE_INIT
+    __pyx_moduledef_slots, /* m_slots */
+  #else
+    NULL, /* m_reload */
+  #endif
+    NULL, /* m_traverse */
+    NULL, /* m_clear */
+    NULL /* m_free */
+};
+#endif
+#ifndef CYTHON_SMALL_CODE
+#if defined(__clang__)
+    #define CYTHON_SMALL_CODE
+#elif defined(__GNUC__) && (__GNUC__ > 4 || (__GNUC__ == 4 && __GNUC_MINOR__ >= 3))
+    #define CYTHON_SMALL_CODE __attribute__((cold))
+#else
+    #define CYTHON_SMALL_CODE
+#endif
+#endif
+
+static __Pyx_StringTabEntry __pyx_string_tab[] = {
+  {&__pyx_n_s_A, __pyx_k_A, sizeof(__pyx_k_A), 0, 0, 1, 1},
+  {&__pyx_kp_s_L, __pyx_k_L, sizeof(__pyx_k_L), 0, 0, 1, 0},
+  {&__pyx_n_s_Logger, __pyx_k_Logger, sizeof(__pyx_k_Logger), 0, 0, 1, 1},
+  {&__pyx_n_s_X, __pyx_k_X, sizeof(__pyx_k_X), 0, 0, 1, 1},
+  {&__pyx_kp_b__22, __pyx_k__22, sizeof(__pyx_k__22), 0, 0, 0, 0},
+  {&__pyx_kp_b__24, __pyx_k__24, sizeof(__pyx_k__24), 0, 0, 0, 0},
+  {&__pyx_kp_b__26, __pyx_k__26, sizeof(__pyx_k__26), 0, 0, 0, 0},
+  {&__pyx_kp_b__28, __pyx_k__28, sizeof(__pyx_k__28), 0, 0, 0, 0},
+  {&__pyx_n_s_alpha_index, __pyx_k_alpha_index, sizeof(__pyx_k_alpha_index), 0, 0, 1, 1},
+  {&__pyx_n_s_argb, __pyx_k_argb, sizeof(__pyx_k_argb), 0, 0, 1, 1},
+  {&__pyx_n_s_argb_len, __pyx_k_argb_len, sizeof(__pyx_k_argb_len), 0, 0, 1, 1},
+  {&__pyx_n_s_argb_to_rgb, __pyx_k_argb_to_rgb, sizeof(__pyx_k_argb_to_rgb), 0, 0, 1, 1},
+  {&__pyx_n_s_argb_to_rgba, __pyx_k_argb_to_rgba, sizeof(__pyx_k_argb_to_rgba), 0, 0, 1, 1},
+  {&__pyx_n_s_bgra_buf, __pyx_k_bgra_buf, sizeof(__pyx_k_bgra_buf), 0, 0, 1, 1},
+  {&__pyx_n_s_bgra_buf2, __pyx_k_bgra_buf2, sizeof(__pyx_k_bgra_buf2), 0, 0, 1, 1},
+  {&__pyx_n_s_bgra_buf_len, __pyx_k_bgra_buf_len, sizeof(__pyx_k_bgra_buf_len), 0, 0, 1, 1},
+  {&__pyx_n_s_bgra_buf_len2, __pyx_k_bgra_buf_len2, sizeof(__pyx_k_bgra_buf_len2), 0, 0, 1, 1},
+  {&__pyx_n_s_bgra_to_rgb, __pyx_k_bgra_to_rgb, sizeof(__pyx_k_bgra_to_rgb), 0, 0, 1, 1},
+  {&__pyx_n_s_bgra_to_rgba, __pyx_k_bgra_to_rgba, sizeof(__pyx_k_bgra_to_rgba), 0, 0, 1, 1},
+  {&__pyx_n_s_bpp, __pyx_k_bpp, sizeof(__pyx_k_bpp), 0, 0, 1, 1},
+  {&__pyx_n_s_buf, __pyx_k_buf, sizeof(__pyx_k_buf), 0, 0, 1, 1},
+  {&__pyx_n_s_buffer_api_version, __pyx_k_buffer_api_version, sizeof(__pyx_k_buffer_api_version), 0, 0, 1, 1},
+  {&__pyx_kp_s_buffer_is_too_small_i_bytes_for, __pyx_k_buffer_is_too_small_i_bytes_for, sizeof(__pyx_k_buffer_is_too_small_i_bytes_for), 0, 0, 1, 0},
+  {&__pyx_kp_s_cannot_convert_s_to_a_readable_b, __pyx_k_cannot_convert_s_to_a_readable_b, sizeof(__pyx_k_cannot_convert_s_to_a_readable_b), 0, 0, 1, 0},
+  {&__pyx_kp_s_cannot_convert_s_to_a_writable_b, __pyx_k_cannot_convert_s_to_a_writable_b, sizeof(__pyx_k_cannot_convert_s_to_a_writable_b), 0, 0, 1, 0},
+  {&__pyx_n_s_cbuf, __pyx_k_cbuf, sizeof(__pyx_k_cbuf), 0, 0, 1, 1},
+  {&__pyx_n_s_cbuf_len, __pyx_k_cbuf_len, sizeof(__pyx_k_cbuf_len), 0, 0, 1, 1},
+  {&__pyx_n_s_cline_in_traceback, __pyx_k_cline_in_traceback, sizeof(__pyx_k_cline_in_traceback), 0, 0, 1, 1},
+  {&__pyx_n_s_d, __pyx_k_d, sizeof(__pyx_k_d), 0, 0, 1, 1},
+  {&__pyx_n_s_dst, __pyx_k_dst, sizeof(__pyx_k_dst), 0, 0, 1, 1},
+  {&__pyx_n_s_encoding, __pyx_k_encoding, sizeof(__pyx_k_encoding), 0, 0, 1, 1},
+  {&__pyx_n_s_find, __pyx_k_find, sizeof(__pyx_k_find), 0, 0, 1, 1},
+  {&__pyx_n_s_height, __pyx_k_height, sizeof(__pyx_k_height), 0, 0, 1, 1},
+  {&__pyx_n_s_i0, __pyx_k_i0, sizeof(__pyx_k_i0), 0, 0, 1, 1},
+  {&__pyx_n_s_i1, __pyx_k_i1, sizeof(__pyx_k_i1), 0, 0, 1, 1},
+  {&__pyx_n_s_i2, __pyx_k_i2, sizeof(__pyx_k_i2), 0, 0, 1, 1},
+  {&__pyx_n_s_import, __pyx_k_import, sizeof(__pyx_k_import), 0, 0, 1, 1},
+  {&__pyx_n_s_index, __pyx_k_index, sizeof(__pyx_k_index), 0, 0, 1, 1},
+  {&__pyx_kp_s_invalid_buffer_size_s_is_not_a_m, __pyx_k_invalid_buffer_size_s_is_not_a_m, sizeof(__pyx_k_invalid_buffer_size_s_is_not_a_m), 0, 0, 1, 0},
+  {&__pyx_kp_s_invalid_dimensions_ix_i, __pyx_k_invalid_dimensions_ix_i, sizeof(__pyx_k_invalid_dimensions_ix_i), 0, 0, 1, 0},
+  {&__pyx_kp_s_invalid_rgb32_pixel_format_s, __pyx_k_invalid_rgb32_pixel_format_s, sizeof(__pyx_k_invalid_rgb32_pixel_format_s), 0, 0, 1, 0},
+  {&__pyx_kp_s_invalid_rowstride_i_for_width_i, __pyx_k_invalid_rowstride_i_for_width_i, sizeof(__pyx_k_invalid_rowstride_i_for_width_i), 0, 0, 1, 0},
+  {&__pyx_n_s_log, __pyx_k_log, sizeof(__pyx_k_log), 0, 0, 1, 1},
+  {&__pyx_n_s_main, __pyx_k_main, sizeof(__pyx_k_main), 0, 0, 1, 1},
+  {&__pyx_n_s_mask, __pyx_k_mask, sizeof(__pyx_k_mask), 0, 0, 1, 1},
+  {&__pyx_n_s_mask_bytes, __pyx_k_mask_bytes, sizeof(__pyx_k_mask_bytes), 0, 0, 1, 1},
+  {&__pyx_n_s_name, __pyx_k_name, sizeof(__pyx_k_name), 0, 0, 1, 1},
+  {&__pyx_kp_s_no_alpha_or_padding_channel_to_d, __pyx_k_no_alpha_or_padding_channel_to_d, sizeof(__pyx_k_no_alpha_or_padding_channel_to_d), 0, 0, 1, 0},
+  {&__pyx_n_s_out, __pyx_k_out, sizeof(__pyx_k_out), 0, 0, 1, 1},
+  {&__pyx_n_s_out_stride, __pyx_k_out_stride, sizeof(__pyx_k_out_stride), 0, 0, 1, 1},
+  {&__pyx_n_s_pack, __pyx_k_pack, sizeof(__pyx_k_pack), 0, 0, 1, 1},
+  {&__pyx_n_s_pack_rgb32, __pyx_k_pack_rgb32, sizeof(__pyx_k_pack_rgb32), 0, 0, 1, 1},
+  {&__pyx_n_s_premultiply_argb_in_place, __pyx_k_premultiply_argb_in_place, sizeof(__pyx_k_premultiply_argb_in_place), 0, 0, 1, 1},
+  {&__pyx_n_s_r210_to_rgb, __pyx_k_r210_to_rgb, sizeof(__pyx_k_r210_to_rgb), 0, 0, 1, 1},
+  {&__pyx_n_s_r210_to_rgba, __pyx_k_r210_to_rgba, sizeof(__pyx_k_r210_to_rgba), 0, 0, 1, 1},
+  {&__pyx_n_s_range, __pyx_k_range, sizeof(__pyx_k_range), 0, 0, 1, 1},
+  {&__pyx_n_s_rgb24, __pyx_k_rgb24, sizeof(__pyx_k_rgb24), 0, 0, 1, 1},
+  {&__pyx_n_s_rgb_format, __pyx_k_rgb_format, sizeof(__pyx_k_rgb_format), 0, 0, 1, 1},
+  {&__pyx_n_s_rowstride, __pyx_k_rowstride, sizeof(__pyx_k_rowstride), 0, 0, 1, 1},
+  {&__pyx_n_s_s, __pyx_k_s, sizeof(__pyx_k_s), 0, 0, 1, 1},
+  {&__pyx_n_s_src, __pyx_k_src, sizeof(__pyx_k_src), 0, 0, 1, 1},
+  {&__pyx_n_s_src_len, __pyx_k_src_len, sizeof(__pyx_k_src_len), 0, 0, 1, 1},
+  {&__pyx_n_s_struct, __pyx_k_struct, sizeof(__pyx_k_struct), 0, 0, 1, 1},
+  {&__pyx_n_s_test, __pyx_k_test, sizeof(__pyx_k_test), 0, 0, 1, 1},
+  {&__pyx_n_s_tmp, __pyx_k_tmp, sizeof(__pyx_k_tmp), 0, 0, 1, 1},
+  {&__pyx_n_s_unpremultiply_argb, __pyx_k_unpremultiply_argb, sizeof(__pyx_k_unpremultiply_argb), 0, 0, 1, 1},
+  {&__pyx_n_s_unpremultiply_argb_in_place, __pyx_k_unpremultiply_argb_in_place, sizeof(__pyx_k_unpremultiply_argb_in_place), 0, 0, 1, 1},
+  {&__pyx_n_s_upper, __pyx_k_upper, sizeof(__pyx_k_upper), 0, 0, 1, 1},
+  {&__pyx_n_s_v, __pyx_k_v, sizeof(__pyx_k_v), 0, 0, 1, 1},
+  {&__pyx_n_s_width, __pyx_k_width, sizeof(__pyx_k_width), 0, 0, 1, 1},
+  {&__pyx_n_s_x, __pyx_k_x, sizeof(__pyx_k_x), 0, 0, 1, 1},
+  {&__pyx_n_s_xpra_codecs_argb_argb, __pyx_k_xpra_codecs_argb_argb, sizeof(__pyx_k_xpra_codecs_argb_argb), 0, 0, 1, 1},
+  {&__pyx_kp_s_xpra_codecs_argb_argb_pyx, __pyx_k_xpra_codecs_argb_argb_pyx, sizeof(__pyx_k_xpra_codecs_argb_argb_pyx), 0, 0, 1, 0},
+  {&__pyx_n_s_xpra_log, __pyx_k_xpra_log, sizeof(__pyx_k_xpra_log), 0, 0, 1, 1},
+  {&__pyx_n_s_y, __pyx_k_y, sizeof(__pyx_k_y), 0, 0, 1, 1},
+  {0, 0, 0, 0, 0, 0, 0}
+};
+static CYTHON_SMALL_CODE int __Pyx_InitCachedBuiltins(void) {
+  __pyx_builtin_range = __Pyx_GetBuiltinName(__pyx_n_s_range); if (!__pyx_builtin_range) __PYX_ERR(0, 346, __pyx_L1_error)
+  return 0;
+  __pyx_L1_error:;
+  return -1;
+}
+
+static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_InitCachedConstants", 0);
+
+  /* "xpra/codecs/argb/argb.pyx":26
+ * import struct
+ * from xpra.log import Logger
+ * log = Logger("encoding")             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_tuple_ = PyTuple_Pack(1, __pyx_n_s_encoding); if (unlikely(!__pyx_tuple_)) __PYX_ERR(0, 26, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple_);
+  __Pyx_GIVEREF(__pyx_tuple_);
+
+  /* "xpra/codecs/argb/argb.pyx":29
+ * 
+ * 
+ * def buffer_api_version():             # <<<<<<<<<<<<<<
+ *     return get_buffer_api_version()
+ * 
+ */
+  __pyx_codeobj__2 = (PyObject*)__Pyx_PyCode_New(0, 0, 0, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_xpra_codecs_argb_argb_pyx, __pyx_n_s_buffer_api_version, 29, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__2)) __PYX_ERR(0, 29, __pyx_L1_error)
+
+  /* "xpra/codecs/argb/argb.pyx":38
+ * 
+ * 
+ * def r210_to_rgba(buf):             # <<<<<<<<<<<<<<
+ *     assert len(buf) % 4 == 0, "invalid buffer size: %s is not a multiple of 4" % len(buf)
+ *     # buf is a Python buffer object
+ */
+  __pyx_tuple__3 = PyTuple_Pack(3, __pyx_n_s_buf, __pyx_n_s_cbuf, __pyx_n_s_cbuf_len); if (unlikely(!__pyx_tuple__3)) __PYX_ERR(0, 38, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__3);
+  __Pyx_GIVEREF(__pyx_tuple__3);
+  __pyx_codeobj__4 = (PyObject*)__Pyx_PyCode_New(1, 0, 3, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__3, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_xpra_codecs_argb_argb_pyx, __pyx_n_s_r210_to_rgba, 38, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__4)) __PYX_ERR(0, 38, __pyx_L1_error)
+
+  /* "xpra/codecs/argb/argb.pyx":64
+ * 
+ * 
+ * def r210_to_rgb(buf):             # <<<<<<<<<<<<<<
+ *     assert len(buf) % 4 == 0, "invalid buffer size: %s is not a multiple of 4" % len(buf)
+ *     # buf is a Python buffer object
+ */
+  __pyx_tuple__5 = PyTuple_Pack(3, __pyx_n_s_buf, __pyx_n_s_cbuf, __pyx_n_s_cbuf_len); if (unlikely(!__pyx_tuple__5)) __PYX_ERR(0, 64, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__5);
+  __Pyx_GIVEREF(__pyx_tuple__5);
+  __pyx_codeobj__6 = (PyObject*)__Pyx_PyCode_New(1, 0, 3, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__5, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_xpra_codecs_argb_argb_pyx, __pyx_n_s_r210_to_rgb, 64, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__6)) __PYX_ERR(0, 64, __pyx_L1_error)
+
+  /* "xpra/codecs/argb/argb.pyx":91
+ * 
+ * 
+ * def argb_to_rgba(buf):             # <<<<<<<<<<<<<<
+ *     assert len(buf) % 4 == 0, "invalid buffer size: %s is not a multiple of 4" % len(buf)
+ *     # buf is a Python buffer object
+ */
+  __pyx_tuple__7 = PyTuple_Pack(3, __pyx_n_s_buf, __pyx_n_s_cbuf, __pyx_n_s_cbuf_len); if (unlikely(!__pyx_tuple__7)) __PYX_ERR(0, 91, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__7);
+  __Pyx_GIVEREF(__pyx_tuple__7);
+  __pyx_codeobj__8 = (PyObject*)__Pyx_PyCode_New(1, 0, 3, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__7, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_xpra_codecs_argb_argb_pyx, __pyx_n_s_argb_to_rgba, 91, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__8)) __PYX_ERR(0, 91, __pyx_L1_error)
+
+  /* "xpra/codecs/argb/argb.pyx":114
+ *     return rgba
+ * 
+ * def argb_to_rgb(buf):             # <<<<<<<<<<<<<<
+ *     assert len(buf) % 4 == 0, "invalid buffer size: %s is not a multiple of 4" % len(buf)
+ *     # buf is a Python buffer object
+ */
+  __pyx_tuple__9 = PyTuple_Pack(3, __pyx_n_s_buf, __pyx_n_s_cbuf, __pyx_n_s_cbuf_len); if (unlikely(!__pyx_tuple__9)) __PYX_ERR(0, 114, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__9);
+  __Pyx_GIVEREF(__pyx_tuple__9);
+  __pyx_codeobj__10 = (PyObject*)__Pyx_PyCode_New(1, 0, 3, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__9, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_xpra_codecs_argb_argb_pyx, __pyx_n_s_argb_to_rgb, 114, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__10)) __PYX_ERR(0, 114, __pyx_L1_error)
+
+  /* "xpra/codecs/argb/argb.pyx":140
+ * 
+ * 
+ * def bgra_to_rgb(buf):             # <<<<<<<<<<<<<<
+ *     assert len(buf) % 4 == 0, "invalid buffer size: %s is not a multiple of 4" % len(buf)
+ *     # buf is a Python buffer object
+ */
+  __pyx_tuple__11 = PyTuple_Pack(3, __pyx_n_s_buf, __pyx_n_s_bgra_buf, __pyx_n_s_bgra_buf_len); if (unlikely(!__pyx_tuple__11)) __PYX_ERR(0, 140, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__11);
+  __Pyx_GIVEREF(__pyx_tuple__11);
+  __pyx_codeobj__12 = (PyObject*)__Pyx_PyCode_New(1, 0, 3, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__11, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_xpra_codecs_argb_argb_pyx, __pyx_n_s_bgra_to_rgb, 140, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__12)) __PYX_ERR(0, 140, __pyx_L1_error)
+
+  /* "xpra/codecs/argb/argb.pyx":166
+ * 
+ * 
+ * def bgra_to_rgba(buf):             # <<<<<<<<<<<<<<
+ *     assert len(buf) % 4 == 0, "invalid buffer size: %s is not a multiple of 4" % len(buf)
+ *     # buf is a Python buffer object
+ */
+  __pyx_tuple__13 = PyTuple_Pack(3, __pyx_n_s_buf, __pyx_n_s_bgra_buf2, __pyx_n_s_bgra_buf_len2); if (unlikely(!__pyx_tuple__13)) __PYX_ERR(0, 166, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__13);
+  __Pyx_GIVEREF(__pyx_tuple__13);
+  __pyx_codeobj__14 = (PyObject*)__Pyx_PyCode_New(1, 0, 3, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__13, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_xpra_codecs_argb_argb_pyx, __pyx_n_s_bgra_to_rgba, 166, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__14)) __PYX_ERR(0, 166, __pyx_L1_error)
+
+  /* "xpra/codecs/argb/argb.pyx":190
+ * 
+ * 
+ * def premultiply_argb_in_place(buf):             # <<<<<<<<<<<<<<
+ *     # b is a Python buffer object
+ *     cdef unsigned int * cbuf = <unsigned int *> 0
+ */
+  __pyx_tuple__15 = PyTuple_Pack(3, __pyx_n_s_buf, __pyx_n_s_cbuf, __pyx_n_s_cbuf_len); if (unlikely(!__pyx_tuple__15)) __PYX_ERR(0, 190, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__15);
+  __Pyx_GIVEREF(__pyx_tuple__15);
+  __pyx_codeobj__16 = (PyObject*)__Pyx_PyCode_New(1, 0, 3, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__15, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_xpra_codecs_argb_argb_pyx, __pyx_n_s_premultiply_argb_in_place, 190, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__16)) __PYX_ERR(0, 190, __pyx_L1_error)
+
+  /* "xpra/codecs/argb/argb.pyx":218
+ *         buf[i] = (a << 24) | (r << 16) | (g << 8) | (b << 0)
+ * 
+ * def unpremultiply_argb_in_place(buf):             # <<<<<<<<<<<<<<
+ *     # b is a Python buffer object
+ *     cdef unsigned int * cbuf = <unsigned int *> 0   #@DuplicateSignature
+ */
+  __pyx_tuple__17 = PyTuple_Pack(3, __pyx_n_s_buf, __pyx_n_s_cbuf, __pyx_n_s_cbuf_len); if (unlikely(!__pyx_tuple__17)) __PYX_ERR(0, 218, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__17);
+  __Pyx_GIVEREF(__pyx_tuple__17);
+  __pyx_codeobj__18 = (PyObject*)__Pyx_PyCode_New(1, 0, 3, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__17, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_xpra_codecs_argb_argb_pyx, __pyx_n_s_unpremultiply_argb_in_place, 218, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__18)) __PYX_ERR(0, 218, __pyx_L1_error)
+
+  /* "xpra/codecs/argb/argb.pyx":246
+ *         buf[i] = (a << 24) | (r << 16) | (g << 8) | (b << 0)
+ * 
+ * def unpremultiply_argb(buf):             # <<<<<<<<<<<<<<
+ *     # b is a Python buffer object
+ *     cdef unsigned int * argb = <unsigned int *> 0   #@DuplicateSignature
+ */
+  __pyx_tuple__19 = PyTuple_Pack(3, __pyx_n_s_buf, __pyx_n_s_argb, __pyx_n_s_argb_len); if (unlikely(!__pyx_tuple__19)) __PYX_ERR(0, 246, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__19);
+  __Pyx_GIVEREF(__pyx_tuple__19);
+  __pyx_codeobj__20 = (PyObject*)__Pyx_PyCode_New(1, 0, 3, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__19, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_xpra_codecs_argb_argb_pyx, __pyx_n_s_unpremultiply_argb, 246, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__20)) __PYX_ERR(0, 246, __pyx_L1_error)
+
+  /* "xpra/codecs/argb/argb.pyx":257
+ * 
+ * #precalculate indexes in native endianness:
+ * tmp = struct.pack("=L", 0 + 1*(2**8) + 2*(2**16) + 3*(2**24))             # <<<<<<<<<<<<<<
+ * #little endian will give 0, 1, 2, 3
+ * #big endian should give 3, 2, 1, 0 (untested)
+ */
+  __pyx_tuple__21 = PyTuple_Pack(2, __pyx_kp_s_L, __pyx_int_50462976); if (unlikely(!__pyx_tuple__21)) __PYX_ERR(0, 257, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__21);
+  __Pyx_GIVEREF(__pyx_tuple__21);
+
+  /* "xpra/codecs/argb/argb.pyx":260
+ * #little endian will give 0, 1, 2, 3
+ * #big endian should give 3, 2, 1, 0 (untested)
+ * cdef unsigned char B = tmp.index(b'\0')             # <<<<<<<<<<<<<<
+ * cdef unsigned char G = tmp.index(b'\1')
+ * cdef unsigned char R = tmp.index(b'\2')
+ */
+  __pyx_tuple__23 = PyTuple_Pack(1, __pyx_kp_b__22); if (unlikely(!__pyx_tuple__23)) __PYX_ERR(0, 260, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__23);
+  __Pyx_GIVEREF(__pyx_tuple__23);
+
+  /* "xpra/codecs/argb/argb.pyx":261
+ * #big endian should give 3, 2, 1, 0 (untested)
+ * cdef unsigned char B = tmp.index(b'\0')
+ * cdef unsigned char G = tmp.index(b'\1')             # <<<<<<<<<<<<<<
+ * cdef unsigned char R = tmp.index(b'\2')
+ * cdef unsigned char A = tmp.index(b'\3')
+ */
+  __pyx_tuple__25 = PyTuple_Pack(1, __pyx_kp_b__24); if (unlikely(!__pyx_tuple__25)) __PYX_ERR(0, 261, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__25);
+  __Pyx_GIVEREF(__pyx_tuple__25);
+
+  /* "xpra/codecs/argb/argb.pyx":262
+ * cdef unsigned char B = tmp.index(b'\0')
+ * cdef unsigned char G = tmp.index(b'\1')
+ * cdef unsigned char R = tmp.index(b'\2')             # <<<<<<<<<<<<<<
+ * cdef unsigned char A = tmp.index(b'\3')
+ * 
+ */
+  __pyx_tuple__27 = PyTuple_Pack(1, __pyx_kp_b__26); if (unlikely(!__pyx_tuple__27)) __PYX_ERR(0, 262, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__27);
+  __Pyx_GIVEREF(__pyx_tuple__27);
+
+  /* "xpra/codecs/argb/argb.pyx":263
+ * cdef unsigned char G = tmp.index(b'\1')
+ * cdef unsigned char R = tmp.index(b'\2')
+ * cdef unsigned char A = tmp.index(b'\3')             # <<<<<<<<<<<<<<
+ * 
+ * cdef do_unpremultiply_argb(unsigned int * argb_in, Py_ssize_t argb_len):
+ */
+  __pyx_tuple__29 = PyTuple_Pack(1, __pyx_kp_b__28); if (unlikely(!__pyx_tuple__29)) __PYX_ERR(0, 263, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__29);
+  __Pyx_GIVEREF(__pyx_tuple__29);
+
+  /* "xpra/codecs/argb/argb.pyx":298
+ * 
+ * 
+ * def pack_rgb32(buf, unsigned int width, unsigned int height, unsigned int rowstride, rgb_format, rgb24=False):             # <<<<<<<<<<<<<<
+ *     """
+ *         Prepares 32-bit pixels for sending as plain rgb, in a single pass:
+ */
+  __pyx_tuple__30 = PyTuple_Pack(23, __pyx_n_s_buf, __pyx_n_s_width, __pyx_n_s_height, __pyx_n_s_rowstride, __pyx_n_s_rgb_format, __pyx_n_s_rgb24, __pyx_n_s_src, __pyx_n_s_src_len, __pyx_n_s_alpha_index, __pyx_n_s_bpp, __pyx_n_s_out_stride, __pyx_n_s_out, __pyx_n_s_dst, __pyx_n_s_i0, __pyx_n_s_i1, __pyx_n_s_i2, __pyx_n_s_mask, __pyx_n_s_mask_bytes, __pyx_n_s_x, __pyx_n_s_y, __pyx_n_s_v, __pyx_n_s_s, __pyx_n_s_d); if (unlikely(!__pyx_tuple__30)) __PYX_ERR(0, 298, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__30);
+  __Pyx_GIVEREF(__pyx_tuple__30);
+  __pyx_codeobj__31 = (PyObject*)__Pyx_PyCode_New(6, 0, 23, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__30, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_xpra_codecs_argb_argb_pyx, __pyx_n_s_pack_rgb32, 298, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__31)) __PYX_ERR(0, 298, __pyx_L1_error)
+  __Pyx_RefNannyFinishContext();
+  return 0;
+  __pyx_L1_error:;
+  __Pyx_RefNannyFinishContext();
+  return -1;
+}
+
+static CYTHON_SMALL_CODE int __Pyx_InitGlobals(void) {
+  /* AssertionsEnabled.init */
+  __Pyx_init_assertions_enabled();
+
+if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 1, __pyx_L1_error)
+
+  if (__Pyx_InitStrings(__pyx_string_tab) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_50462976 = PyInt_FromLong(50462976L); if (unlikely(!__pyx_int_50462976)) __PYX_ERR(0, 1, __pyx_L1_error)
+  return 0;
+  __pyx_L1_error:;
+  return -1;
+}
+
+static CYTHON_SMALL_CODE int __Pyx_modinit_global_init_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_variable_export_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_function_export_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_type_init_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_type_import_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_variable_import_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_function_import_code(void); /*proto*/
+
+static int __Pyx_modinit_global_init_code(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_modinit_global_init_code", 0);
+  /*--- Global init code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+static int __Pyx_modinit_variable_export_code(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_modinit_variable_export_code", 0);
+  /*--- Variable export code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+static int __Pyx_modinit_function_export_code(void) {
+  __Pyx_RefNannyDeclarations
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__Pyx_modinit_function_export_code", 0);
+  /*--- Function export code ---*/
+  if (__Pyx_ExportFunction("argbdata_to_rgba", (void (*)(void))__pyx_f_4xpra_6codecs_4argb_4argb_argbdata_to_rgba, "PyObject *(unsigned char const *, int const )") < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (__Pyx_ExportFunction("argbdata_to_rgb", (void (*)(void))__pyx_f_4xpra_6codecs_4argb_4argb_argbdata_to_rgb, "PyObject *(unsigned char const *, int const )") < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (__Pyx_ExportFunction("bgradata_to_rgb", (void (*)(void))__pyx_f_4xpra_6codecs_4argb_4argb_bgradata_to_rgb, "PyObject *(unsigned char const *, int const )") < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (__Pyx_ExportFunction("bgradata_to_rgba", (void (*)(void))__pyx_f_4xpra_6codecs_4argb_4argb_bgradata_to_rgba, "PyObject *(unsigned char const *, int const )") < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  __Pyx_RefNannyFinishContext();
+  return 0;
+  __pyx_L1_error:;
+  __Pyx_RefNannyFinishContext();
+  return -1;
+}
+
+static int __Pyx_modinit_type_init_code(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_modinit_type_init_code", 0);
+  /*--- Type init code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+static int __Pyx_modinit_type_import_code(void) {
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__Pyx_modinit_type_import_code", 0);
+  /*--- Type import code ---*/
+  __pyx_t_1 = PyImport_ImportModule(__Pyx_BUILTIN_MODULE_NAME); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 9, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_ptype_7cpython_4type_type = __Pyx_ImportType_0_29_37(__pyx_t_1, __Pyx_BUILTIN_MODULE_NAME, "type", 
+  #if defined(PYPY_VERSION_NUM) && PYPY_VERSION_NUM < 0x050B0000
+  sizeof(PyTypeObject), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(PyTypeObject),
+  #else
+  sizeof(PyHeapTypeObject), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(PyHeapTypeObject),
+  #endif
+  __Pyx_ImportType_CheckSize_Warn_0_29_37); if (!__pyx_ptype_7cpython_4type_type) __PYX_ERR(1, 9, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_RefNannyFinishContext();
+  return 0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_RefNannyFinishContext();
+  return -1;
+}
+
+static int __Pyx_modinit_variable_import_code(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_modinit_variable_import_code", 0);
+  /*--- Variable import code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+static int __Pyx_modinit_function_import_code(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_modinit_function_import_code", 0);
+  /*--- Function import code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+
+#ifndef CYTHON_NO_PYINIT_EXPORT
+#define __Pyx_PyMODINIT_FUNC PyMODINIT_FUNC
+#elif PY_MAJOR_VERSION < 3
+#ifdef __cplusplus
+#define __Pyx_PyMODINIT_FUNC extern "C" void
+#else
+#define __Pyx_PyMODINIT_FUNC void
+#endif
+#else
+#ifdef __cplusplus
+#define __Pyx_PyMODINIT_FUNC extern "C" PyObject *
+#else
+#define __Pyx_PyMODINIT_FUNC PyObject *
+#endif
+#endif
+
+
+#if PY_MAJOR_VERSION < 3
+__Pyx_PyMODINIT_FUNC initargb(void) CYTHON_SMALL_CODE; /*proto*/
+__Pyx_PyMODINIT_FUNC initargb(void)
+#else
+__Pyx_PyMODINIT_FUNC PyInit_argb(void) CYTHON_SMALL_CODE; /*proto*/
+__Pyx_PyMODINIT_FUNC PyInit_argb(void)
+#if CYTHON_PEP489_MULTI_PHASE_INIT
+{
+  return PyModuleDef_Init(&__pyx_moduledef);
+}
+static CYTHON_SMALL_CODE int __Pyx_check_single_interpreter(void) {
+    #if PY_VERSION_HEX >= 0x030700A1
+    static PY_INT64_T main_interpreter_id = -1;
+    PY_INT64_T current_id = PyInterpreterState_GetID(PyThreadState_Get()->interp);
+    if (main_interpreter_id == -1) {
+        main_interpreter_id = current_id;
+        return (unlikely(current_id == -1)) ? -1 : 0;
+    } else if (unlikely(main_interpreter_id != current_id))
+    #else
+    static PyInterpreterState *main_interpreter = NULL;
+    PyInterpreterState *current_interpreter = PyThreadState_Get()->interp;
+    if (!main_interpreter) {
+        main_interpreter = current_interpreter;
+    } else if (unlikely(main_interpreter != current_interpreter))
+    #endif
+    {
+        PyErr_SetString(
+            PyExc_ImportError,
+            "Interpreter change detected - this module can only be loaded into one interpreter per process.");
+        return -1;
+    }
+    return 0;
+}
+static CYTHON_SMALL_CODE int __Pyx_copy_spec_to_module(PyObject *spec, PyObject *moddict, const char* from_name, const char* to_name, int allow_none) {
+    PyObject *value = PyObject_GetAttrString(spec, from_name);
+    int result = 0;
+    if (likely(value)) {
+        if (allow_none || value != Py_None) {
+            result = PyDict_SetItemString(moddict, to_name, value);
+        }
+        Py_DECREF(value);
+    } else if (PyErr_ExceptionMatches(PyExc_AttributeError)) {
+        PyErr_Clear();
+    } else {
+        result = -1;
+    }
+    return result;
+}
+static CYTHON_SMALL_CODE PyObject* __pyx_pymod_create(PyObject *spec, CYTHON_UNUSED PyModuleDef *def) {
+    PyObject *module = NULL, *moddict, *modname;
+    if (__Pyx_check_single_interpreter())
+        return NULL;
+    if (__pyx_m)
+        return __Pyx_NewRef(__pyx_m);
+    modname = PyObject_GetAttrString(spec, "name");
+    if (unlikely(!modname)) goto bad;
+    module = PyModule_NewObject(modname);
+    Py_DECREF(modname);
+    if (unlikely(!module)) goto bad;
+    moddict = PyModule_GetDict(module);
+    if (unlikely(!moddict)) goto bad;
+    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "loader", "__loader__", 1) < 0)) goto bad;
+    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "origin", "__file__", 1) < 0)) goto bad;
+    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "parent", "__package__", 1) < 0)) goto bad;
+    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "submodule_search_locations", "__path__", 0) < 0)) goto bad;
+    return module;
+bad:
+    Py_XDECREF(module);
+    return NULL;
+}
+
+
+static CYTHON_SMALL_CODE int __pyx_pymod_exec_argb(PyObject *__pyx_pyinit_module)
+#endif
+#endif
+{
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  unsigned char __pyx_t_3;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannyDeclarations
+  #if CYTHON_PEP489_MULTI_PHASE_INIT
+  if (__pyx_m) {
+    if (__pyx_m == __pyx_pyinit_module) return 0;
+    PyErr_SetString(PyExc_RuntimeError, "Module 'argb' has already been imported. Re-initialisation is not supported.");
+    return -1;
+  }
+  #elif PY_MAJOR_VERSION >= 3
+  if (__pyx_m) return __Pyx_NewRef(__pyx_m);
+  #endif
+  #if CYTHON_REFNANNY
+__Pyx_RefNanny = __Pyx_RefNannyImportAPI("refnanny");
+if (!__Pyx_RefNanny) {
+  PyErr_Clear();
+  __Pyx_RefNanny = __Pyx_RefNannyImportAPI("Cython.Runtime.refnanny");
+  if (!__Pyx_RefNanny)
+      Py_FatalError("failed to import 'refnanny' module");
+}
+#endif
+  __Pyx_RefNannySetupContext("__Pyx_PyMODINIT_FUNC PyInit_argb(void)", 0);
+  if (__Pyx_check_binary_version() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #ifdef __Pxy_PyFrame_Initialize_Offsets
+  __Pxy_PyFrame_Initialize_Offsets();
+  #endif
+  __pyx_empty_tuple = PyTuple_New(0); if (unlikely(!__pyx_empty_tuple)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_empty_bytes = PyBytes_FromStringAndSize("", 0); if (unlikely(!__pyx_empty_bytes)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_empty_unicode = PyUnicode_FromStringAndSize("", 0); if (unlikely(!__pyx_empty_unicode)) __PYX_ERR(0, 1, __pyx_L1_error)
+  #ifdef __Pyx_CyFunction_USED
+  if (__pyx_CyFunction_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  #ifdef __Pyx_FusedFunction_USED
+  if (__pyx_FusedFunction_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  #ifdef __Pyx_Coroutine_USED
+  if (__pyx_Coroutine_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  #ifdef __Pyx_Generator_USED
+  if (__pyx_Generator_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  #ifdef __Pyx_AsyncGen_USED
+  if (__pyx_AsyncGen_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  #ifdef __Pyx_StopAsyncIteration_USED
+  if (__pyx_StopAsyncIteration_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  /*--- Library function declarations ---*/
+  /*--- Threads initialization code ---*/
+  #if defined(WITH_THREAD) && PY_VERSION_HEX < 0x030700F0 && defined(__PYX_FORCE_INIT_THREADS) && __PYX_FORCE_INIT_THREADS
+  PyEval_InitThreads();
+  #endif
+  /*--- Module creation code ---*/
+  #if CYTHON_PEP489_MULTI_PHASE_INIT
+  __pyx_m = __pyx_pyinit_module;
+  Py_INCREF(__pyx_m);
+  #else
+  #if PY_MAJOR_VERSION < 3
+  __pyx_m = Py_InitModule4("argb", __pyx_methods, 0, 0, PYTHON_API_VERSION); Py_XINCREF(__pyx_m);
+  #else
+  __pyx_m = PyModule_Create(&__pyx_moduledef);
+  #endif
+  if (unlikely(!__pyx_m)) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  __pyx_d = PyModule_GetDict(__pyx_m); if (unlikely(!__pyx_d)) __PYX_ERR(0, 1, __pyx_L1_error)
+  Py_INCREF(__pyx_d);
+  __pyx_b = PyImport_AddModule(__Pyx_BUILTIN_MODULE_NAME); if (unlikely(!__pyx_b)) __PYX_ERR(0, 1, __pyx_L1_error)
+  Py_INCREF(__pyx_b);
+  __pyx_cython_runtime = PyImport_AddModule((char *) "cython_runtime"); if (unlikely(!__pyx_cython_runtime)) __PYX_ERR(0, 1, __pyx_L1_error)
+  Py_INCREF(__pyx_cython_runtime);
+  if (PyObject_SetAttrString(__pyx_m, "__builtins__", __pyx_b) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  /*--- Initialize various global constants etc. ---*/
+  if (__Pyx_InitGlobals() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #if PY_MAJOR_VERSION < 3 && (__PYX_DEFAULT_STRING_ENCODING_IS_ASCII || __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT)
+  if (__Pyx_init_sys_getdefaultencoding_params() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  if (__pyx_module_is_main_xpra__codecs__argb__argb) {
+    if (PyObject_SetAttr(__pyx_m, __pyx_n_s_name, __pyx_n_s_main) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  }
+  #if PY_MAJOR_VERSION >= 3
+  {
+    PyObject *modules = PyImport_GetModuleDict(); if (unlikely(!modules)) __PYX_ERR(0, 1, __pyx_L1_error)
+    if (!PyDict_GetItemString(modules, "xpra.codecs.argb.argb")) {
+      if (unlikely(PyDict_SetItemString(modules, "xpra.codecs.argb.argb", __pyx_m) < 0)) __PYX_ERR(0, 1, __pyx_L1_error)
+    }
+  }
+  #endif
+  /*--- Builtin init code ---*/
+  if (__Pyx_InitCachedBuiltins() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  /*--- Constants init code ---*/
+  if (__Pyx_InitCachedConstants() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  /*--- Global type/function init code ---*/
+  (void)__Pyx_modinit_global_init_code();
+  (void)__Pyx_modinit_variable_export_code();
+  if (unlikely(__Pyx_modinit_function_export_code() < 0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  (void)__Pyx_modinit_type_init_code();
+  if (unlikely(__Pyx_modinit_type_import_code() < 0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  (void)__Pyx_modinit_variable_import_code();
+  (void)__Pyx_modinit_function_import_code();
+  /*--- Execution code ---*/
+  #if defined(__Pyx_Generator_USED) || defined(__Pyx_Coroutine_USED)
+  if (__Pyx_patch_abc() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+
+  /* "xpra/codecs/argb/argb.pyx":24
+ * from cpython.bytes cimport PyBytes_FromStringAndSize, PyBytes_AS_STRING
+ * 
+ * import struct             # <<<<<<<<<<<<<<
+ * from xpra.log import Logger
+ * log = Logger("encoding")
+ */
+  __pyx_t_1 = __Pyx_Import(__pyx_n_s_struct, 0, -1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 24, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_struct, __pyx_t_1) < 0) __PYX_ERR(0, 24, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "xpra/codecs/argb/argb.pyx":25
+ * 
+ * import struct
+ * from xpra.log import Logger             # <<<<<<<<<<<<<<
+ * log = Logger("encoding")
+ * 
+ */
+  __pyx_t_1 = PyList_New(1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 25, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_INCREF(__pyx_n_s_Logger);
+  __Pyx_GIVEREF(__pyx_n_s_Logger);
+  PyList_SET_ITEM(__pyx_t_1, 0, __pyx_n_s_Logger);
+  __pyx_t_2 = __Pyx_Import(__pyx_n_s_xpra_log, __pyx_t_1, -1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 25, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = __Pyx_ImportFrom(__pyx_t_2, __pyx_n_s_Logger); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 25, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_Logger, __pyx_t_1) < 0) __PYX_ERR(0, 25, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "xpra/codecs/argb/argb.pyx":26
+ * import struct
+ * from xpra.log import Logger
+ * log = Logger("encoding")             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_Logger); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 26, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_tuple_, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 26, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_log, __pyx_t_1) < 0) __PYX_ERR(0, 26, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "xpra/codecs/argb/argb.pyx":29
+ * 
+ * 
+ * def buffer_api_version():             # <<<<<<<<<<<<<<
+ *     return get_buffer_api_version()
+ * 
+ */
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4xpra_6codecs_4argb_4argb_1buffer_api_version, NULL, __pyx_n_s_xpra_codecs_argb_argb); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 29, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_buffer_api_version, __pyx_t_1) < 0) __PYX_ERR(0, 29, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "xpra/codecs/argb/argb.pyx":38
+ * 
+ * 
+ * def r210_to_rgba(buf):             # <<<<<<<<<<<<<<
+ *     assert len(buf) % 4 == 0, "invalid buffer size: %s is not a multiple of 4" % len(buf)
+ *     # buf is a Python buffer object
+ */
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4xpra_6codecs_4argb_4argb_3r210_to_rgba, NULL, __pyx_n_s_xpra_codecs_argb_argb); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 38, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_r210_to_rgba, __pyx_t_1) < 0) __PYX_ERR(0, 38, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "xpra/codecs/argb/argb.pyx":64
+ * 
+ * 
+ * def r210_to_rgb(buf):             # <<<<<<<<<<<<<<
+ *     assert len(buf) % 4 == 0, "invalid buffer size: %s is not a multiple of 4" % len(buf)
+ *     # buf is a Python buffer object
+ */
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4xpra_6codecs_4argb_4argb_5r210_to_rgb, NULL, __pyx_n_s_xpra_codecs_argb_argb); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 64, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_r210_to_rgb, __pyx_t_1) < 0) __PYX_ERR(0, 64, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "xpra/codecs/argb/argb.pyx":91
+ * 
+ * 
+ * def argb_to_rgba(buf):             # <<<<<<<<<<<<<<
+ *     assert len(buf) % 4 == 0, "invalid buffer size: %s is not a multiple of 4" % len(buf)
+ *     # buf is a Python buffer object
+ */
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4xpra_6codecs_4argb_4argb_7argb_to_rgba, NULL, __pyx_n_s_xpra_codecs_argb_argb); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 91, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_argb_to_rgba, __pyx_t_1) < 0) __PYX_ERR(0, 91, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "xpra/codecs/argb/argb.pyx":114
+ *     return rgba
+ * 
+ * def argb_to_rgb(buf):             # <<<<<<<<<<<<<<
+ *     assert len(buf) % 4 == 0, "invalid buffer size: %s is not a multiple of 4" % len(buf)
+ *     # buf is a Python buffer object
+ */
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4xpra_6codecs_4argb_4argb_9argb_to_rgb, NULL, __pyx_n_s_xpra_codecs_argb_argb); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 114, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_argb_to_rgb, __pyx_t_1) < 0) __PYX_ERR(0, 114, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "xpra/codecs/argb/argb.pyx":140
+ * 
+ * 
+ * def bgra_to_rgb(buf):             # <<<<<<<<<<<<<<
+ *     assert len(buf) % 4 == 0, "invalid buffer size: %s is not a multiple of 4" % len(buf)
+ *     # buf is a Python buffer object
+ */
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4xpra_6codecs_4argb_4argb_11bgra_to_rgb, NULL, __pyx_n_s_xpra_codecs_argb_argb); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 140, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_bgra_to_rgb, __pyx_t_1) < 0) __PYX_ERR(0, 140, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "xpra/codecs/argb/argb.pyx":166
+ * 
+ * 
+ * def bgra_to_rgba(buf):             # <<<<<<<<<<<<<<
+ *     assert len(buf) % 4 == 0, "invalid buffer size: %s is not a multiple of 4" % len(buf)
+ *     # buf is a Python buffer object
+ */
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4xpra_6codecs_4argb_4argb_13bgra_to_rgba, NULL, __pyx_n_s_xpra_codecs_argb_argb); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 166, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_bgra_to_rgba, __pyx_t_1) < 0) __PYX_ERR(0, 166, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "xpra/codecs/argb/argb.pyx":190
+ * 
+ * 
+ * def premultiply_argb_in_place(buf):             # <<<<<<<<<<<<<<
+ *     # b is a Python buffer object
+ *     cdef unsigned int * cbuf = <unsigned int *> 0
+ */
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4xpra_6codecs_4argb_4argb_15premultiply_argb_in_place, NULL, __pyx_n_s_xpra_codecs_argb_argb); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 190, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_premultiply_argb_in_place, __pyx_t_1) < 0) __PYX_ERR(0, 190, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "xpra/codecs/argb/argb.pyx":218
+ *         buf[i] = (a << 24) | (r << 16) | (g << 8) | (b << 0)
+ * 
+ * def unpremultiply_argb_in_place(buf):             # <<<<<<<<<<<<<<
+ *     # b is a Python buffer object
+ *     cdef unsigned int * cbuf = <unsigned int *> 0   #@DuplicateSignature
+ */
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4xpra_6codecs_4argb_4argb_17unpremultiply_argb_in_place, NULL, __pyx_n_s_xpra_codecs_argb_argb); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 218, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_unpremultiply_argb_in_place, __pyx_t_1) < 0) __PYX_ERR(0, 218, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "xpra/codecs/argb/argb.pyx":246
+ *         buf[i] = (a << 24) | (r << 16) | (g << 8) | (b << 0)
+ * 
+ * def unpremultiply_argb(buf):             # <<<<<<<<<<<<<<
+ *     # b is a Python buffer object
+ *     cdef unsigned int * argb = <unsigned int *> 0   #@DuplicateSignature
+ */
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4xpra_6codecs_4argb_4argb_19unpremultiply_argb, NULL, __pyx_n_s_xpra_codecs_argb_argb); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 246, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_unpremultiply_argb, __pyx_t_1) < 0) __PYX_ERR(0, 246, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "xpra/codecs/argb/argb.pyx":257
+ * 
+ * #precalculate indexes in native endianness:
+ * tmp = struct.pack("=L", 0 + 1*(2**8) + 2*(2**16) + 3*(2**24))             # <<<<<<<<<<<<<<
+ * #little endian will give 0, 1, 2, 3
+ * #big endian should give 3, 2, 1, 0 (untested)
+ */
+  __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_n_s_struct); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 257, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_pack); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 257, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_tuple__21, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 257, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_tmp, __pyx_t_1) < 0) __PYX_ERR(0, 257, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "xpra/codecs/argb/argb.pyx":260
+ * #little endian will give 0, 1, 2, 3
+ * #big endian should give 3, 2, 1, 0 (untested)
+ * cdef unsigned char B = tmp.index(b'\0')             # <<<<<<<<<<<<<<
+ * cdef unsigned char G = tmp.index(b'\1')
+ * cdef unsigned char R = tmp.index(b'\2')
+ */
+  __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_n_s_tmp); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 260, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_index); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 260, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_tuple__23, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 260, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_3 = __Pyx_PyInt_As_unsigned_char(__pyx_t_1); if (unlikely((__pyx_t_3 == (unsigned char)-1) && PyErr_Occurred())) __PYX_ERR(0, 260, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_v_4xpra_6codecs_4argb_4argb_B = __pyx_t_3;
+
+  /* "xpra/codecs/argb/argb.pyx":261
+ * #big endian should give 3, 2, 1, 0 (untested)
+ * cdef unsigned char B = tmp.index(b'\0')
+ * cdef unsigned char G = tmp.index(b'\1')             # <<<<<<<<<<<<<<
+ * cdef unsigned char R = tmp.index(b'\2')
+ * cdef unsigned char A = tmp.index(b'\3')
+ */
+  __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_n_s_tmp); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 261, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_index); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 261, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_tuple__25, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 261, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_3 = __Pyx_PyInt_As_unsigned_char(__pyx_t_1); if (unlikely((__pyx_t_3 == (unsigned char)-1) && PyErr_Occurred())) __PYX_ERR(0, 261, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_v_4xpra_6codecs_4argb_4argb_G = __pyx_t_3;
+
+  /* "xpra/codecs/argb/argb.pyx":262
+ * cdef unsigned char B = tmp.index(b'\0')
+ * cdef unsigned char G = tmp.index(b'\1')
+ * cdef unsigned char R = tmp.index(b'\2')             # <<<<<<<<<<<<<<
+ * cdef unsigned char A = tmp.index(b'\3')
+ * 
+ */
+  __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_n_s_tmp); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 262, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_index); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 262, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_tuple__27, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 262, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_3 = __Pyx_PyInt_As_unsigned_char(__pyx_t_1); if (unlikely((__pyx_t_3 == (unsigned char)-1) && PyErr_Occurred())) __PYX_ERR(0, 262, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_v_4xpra_6codecs_4argb_4argb_R = __pyx_t_3;
+
+  /* "xpra/codecs/argb/argb.pyx":263
+ * cdef unsigned char G = tmp.index(b'\1')
+ * cdef unsigned char R = tmp.index(b'\2')
+ * cdef unsigned char A = tmp.index(b'\3')             # <<<<<<<<<<<<<<
+ * 
+ * cdef do_unpremultiply_argb(unsigned int * argb_in, Py_ssize_t argb_len):
+ */
+  __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_n_s_tmp); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 263, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_index); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 263, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_tuple__29, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 263, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_3 = __Pyx_PyInt_As_unsigned_char(__pyx_t_1); if (unlikely((__pyx_t_3 == (unsigned char)-1) && PyErr_Occurred())) __PYX_ERR(0, 263, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_v_4xpra_6codecs_4argb_4argb_A = __pyx_t_3;
+
+  /* "xpra/codecs/argb/argb.pyx":298
+ * 
+ * 
+ * def pack_rgb32(buf, unsigned int width, unsigned int height, unsigned int rowstride, rgb_format, rgb24=False):             # <<<<<<<<<<<<<<
+ *     """
+ *         Prepares 32-bit pixels for sending as plain rgb, in a single pass:
+ */
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4xpra_6codecs_4argb_4argb_21pack_rgb32, NULL, __pyx_n_s_xpra_codecs_argb_argb); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 298, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_pack_rgb32, __pyx_t_1) < 0) __PYX_ERR(0, 298, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "xpra/codecs/argb/argb.pyx":1
+ * # This file is part of Xpra.             # <<<<<<<<<<<<<<
+ * # Copyright (C) 2008, 2009 Nathaniel Smith <njs@pobox.com>
+ * # Copyright (C) 2012-2013 Antoine Martin <antoine@devloop.org.uk>
+ */
+  __pyx_t_1 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_test, __pyx_t_1) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /*--- Wrapped vars code ---*/
+
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  if (__pyx_m) {
+    if (__pyx_d) {
+      __Pyx_AddTraceback("init xpra.codecs.argb.argb", __pyx_clineno, __pyx_lineno, __pyx_filename);
+    }
+    Py_CLEAR(__pyx_m);
+  } else if (!PyErr_Occurred()) {
+    PyErr_SetString(PyExc_ImportError, "init xpra.codecs.argb.argb");
+  }
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  #if CYTHON_PEP489_MULTI_PHASE_INIT
+  return (__pyx_m != NULL) ? 0 : -1;
+  #elif PY_MAJOR_VERSION >= 3
+  return __pyx_m;
+  #else
+  return;
+  #endif
+}
+
+/* --- Runtime support code --- */
+/* Refnanny */
+#if CYTHON_REFNANNY
+static __Pyx_RefNannyAPIStruct *__Pyx_RefNannyImportAPI(const char *modname) {
+    PyObject *m = NULL, *p = NULL;
+    void *r = NULL;
+    m = PyImport_ImportModule(modname);
+    if (!m) goto end;
+    p = PyObject_GetAttrString(m, "RefNannyAPI");
+    if (!p) goto end;
+    r = PyLong_AsVoidPtr(p);
+end:
+    Py_XDECREF(p);
+    Py_XDECREF(m);
+    return (__Pyx_RefNannyAPIStruct *)r;
+}
+#endif
+
+/* PyObjectGetAttrStr */
+#if CYTHON_USE_TYPE_SLOTS
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStr(PyObject* obj, PyObject* attr_name) {
+    PyTypeObject* tp = Py_TYPE(obj);
+    if (likely(tp->tp_getattro))
+        return tp->tp_getattro(obj, attr_name);
+#if PY_MAJOR_VERSION < 3
+    if (likely(tp->tp_getattr))
+        return tp->tp_getattr(obj, PyString_AS_STRING(attr_name));
+#endif
+    return PyObject_GetAttr(obj, attr_name);
+}
+#endif
+
+/* GetBuiltinName */
+static PyObject *__Pyx_GetBuiltinName(PyObject *name) {
+    PyObject* result = __Pyx_PyObject_GetAttrStr(__pyx_b, name);
+    if (unlikely(!result)) {
+        PyErr_Format(PyExc_NameError,
+#if PY_MAJOR_VERSION >= 3
+            "name '%U' is not defined", name);
+#else
+            "name '%.200s' is not defined", PyString_AS_STRING(name));
+#endif
+    }
+    return result;
+}
+
+/* PyCFunctionFastCall */
+#if CYTHON_FAST_PYCCALL
+static CYTHON_INLINE PyObject * __Pyx_PyCFunction_FastCall(PyObject *func_obj, PyObject **args, Py_ssize_t nargs) {
+    PyCFunctionObject *func = (PyCFunctionObject*)func_obj;
+    PyCFunction meth = PyCFunction_GET_FUNCTION(func);
+    PyObject *self = PyCFunction_GET_SELF(func);
+    int flags = PyCFunction_GET_FLAGS(func);
+    assert(PyCFunction_Check(func));
+    assert(METH_FASTCALL == (flags & ~(METH_CLASS | METH_STATIC | METH_COEXIST | METH_KEYWORDS | METH_STACKLESS)));
+    assert(nargs >= 0);
+    assert(nargs == 0 || args != NULL);
+    /* _PyCFunction_FastCallDict() must not be called with an exception set,
+       because it may clear it (directly or indirectly) and so the
+       caller loses its exception */
+    assert(!PyErr_Occurred());
+    if ((PY_VERSION_HEX < 0x030700A0) || unlikely(flags & METH_KEYWORDS)) {
+        return (*((__Pyx_PyCFunctionFastWithKeywords)(void*)meth)) (self, args, nargs, NULL);
+    } else {
+        return (*((__Pyx_PyCFunctionFast)(void*)meth)) (self, args, nargs);
+    }
+}
+#endif
+
+/* PyFunctionFastCall */
+#if CYTHON_FAST_PYCALL
+static PyObject* __Pyx_PyFunction_FastCallNoKw(PyCodeObject *co, PyObject **args, Py_ssize_t na,
+                                               PyObject *globals) {
+    PyFrameObject *f;
+    PyThreadState *tstate = __Pyx_PyThreadState_Current;
+    PyObject **fastlocals;
+    Py_ssize_t i;
+    PyObject *result;
+    assert(globals != NULL);
+    /* XXX Perhaps we should create a specialized
+       PyFrame_New() that doesn't take locals, but does
+       take builtins without sanity checking them.
+       */
+    assert(tstate != NULL);
+    f = PyFrame_New(tstate, co, globals, NULL);
+    if (f == NULL) {
+        return NULL;
+    }
+    fastlocals = __Pyx_PyFrame_GetLocalsplus(f);
+    for (i = 0; i < na; i++) {
+        Py_INCREF(*args);
+        fastlocals[i] = *args++;
+    }
+    result = PyEval_EvalFrameEx(f,0);
+    ++tstate->recursion_depth;
+    Py_DECREF(f);
+    --tstate->recursion_depth;
+    return result;
+}
+#if 1 || PY_VERSION_HEX < 0x030600B1
+static PyObject *__Pyx_PyFunction_FastCallDict(PyObject *func, PyObject **args, Py_ssize_t nargs, PyObject *kwargs) {
+    PyCodeObject *co = (PyCodeObject *)PyFunction_GET_CODE(func);
+    PyObject *globals = PyFunction_GET_GLOBALS(func);
+    PyObject *argdefs = PyFunction_GET_DEFAULTS(func);
+    PyObject *closure;
+#if PY_MAJOR_VERSION >= 3
+    PyObject *kwdefs;
+#endif
+    PyObject *kwtuple, **k;
+    PyObject **d;
+    Py_ssize_t nd;
+    Py_ssize_t nk;
+    PyObject *result;
+    assert(kwargs == NULL || PyDict_Check(kwargs));
+    nk = kwargs ? PyDict_Size(kwargs) : 0;
+    if (Py_EnterRecursiveCall((char*)" while calling a Python object")) {
+        return NULL;
+    }
+    if (
+#if PY_MAJOR_VERSION >= 3
+            co->co_kwonlyargcount == 0 &&
+#endif
+            likely(kwargs == NULL || nk == 0) &&
+            co->co_flags == (CO_OPTIMIZED | CO_NEWLOCALS | CO_NOFREE)) {
+        if (argdefs == NULL && co->co_argcount == nargs) {
+            result = __Pyx_PyFunction_FastCallNoKw(co, args, nargs, globals);
+            goto done;
+        }
+        else if (nargs == 0 && argdefs != NULL
+                 && co->co_argcount == Py_SIZE(argdefs)) {
+            /* function called with no arguments, but all parameters have
+               a default value: use default values as arguments .*/
+            args = &PyTuple_GET_ITEM(argdefs, 0);
+            result =__Pyx_PyFunction_FastCallNoKw(co, args, Py_SIZE(argdefs), globals);
+            goto done;
+        }
+    }
+    if (kwargs != NULL) {
+        Py_ssize_t pos, i;
+        kwtuple = PyTuple_New(2 * nk);
+        if (kwtuple == NULL) {
+            result = NULL;
+            goto done;
+        }
+        k = &PyTuple_GET_ITEM(kwtuple, 0);
+        pos = i = 0;
+        while (PyDict_Next(kwargs, &pos, &k[i], &k[i+1])) {
+            Py_INCREF(k[i]);
+            Py_INCREF(k[i+1]);
+            i += 2;
+        }
+        nk = i / 2;
+    }
+    else {
+        kwtuple = NULL;
+        k = NULL;
+    }
+    closure = PyFunction_GET_CLOSURE(func);
+#if PY_MAJOR_VERSION >= 3
+    kwdefs = PyFunction_GET_KW_DEFAULTS(func);
+#endif
+    if (argdefs != NULL) {
+        d = &PyTuple_GET_ITEM(argdefs, 0);
+        nd = Py_SIZE(argdefs);
+    }
+    else {
+        d = NULL;
+        nd = 0;
+    }
+#if PY_MAJOR_VERSION >= 3
+    result = PyEval_EvalCodeEx((PyObject*)co, globals, (PyObject *)NULL,
+                               args, (int)nargs,
+                               k, (int)nk,
+                               d, (int)nd, kwdefs, closure);
+#else
+    result = PyEval_EvalCodeEx(co, globals, (PyObject *)NULL,
+                               args, (int)nargs,
+                               k, (int)nk,
+                               d, (int)nd, closure);
+#endif
+    Py_XDECREF(kwtuple);
+done:
+    Py_LeaveRecursiveCall();
+    return result;
+}
+#endif
+#endif
+
+/* PyObjectCall */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_Call(PyObject *func, PyObject *arg, PyObject *kw) {
+    PyObject *result;
+    ternaryfunc call = Py_TYPE(func)->tp_call;
+    if (unlikely(!call))
+        return PyObject_Call(func, arg, kw);
+    if (unlikely(Py_EnterRecursiveCall((char*)" while calling a Python object")))
+        return NULL;
+    result = (*call)(func, arg, kw);
+    Py_LeaveRecursiveCall();
+    if (unlikely(!result) && unlikely(!PyErr_Occurred())) {
+        PyErr_SetString(
+            PyExc_SystemError,
+            "NULL result without error in PyObject_Call");
+    }
+    return result;
+}
+#endif
+
+/* PyObjectCallMethO */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallMethO(PyObject *func, PyObject *arg) {
+    PyObject *self, *result;
+    PyCFunction cfunc;
+    cfunc = PyCFunction_GET_FUNCTION(func);
+    self = PyCFunction_GET_SELF(func);
+    if (unlikely(Py_EnterRecursiveCall((char*)" while calling a Python object")))
+        return NULL;
+    result = cfunc(self, arg);
+    Py_LeaveRecursiveCall();
+    if (unlikely(!result) && unlikely(!PyErr_Occurred())) {
+        PyErr_SetString(
+            PyExc_SystemError,
+            "NULL result without error in PyObject_Call");
+    }
+    return result;
+}
+#endif
+
+/* PyObjectCallOneArg */
+#if CYTHON_COMPILING_IN_CPYTHON
+static PyObject* __Pyx__PyObject_CallOneArg(PyObject *func, PyObject *arg) {
+    PyObject *result;
+    PyObject *args = PyTuple_New(1);
+    if (unlikely(!args)) return NULL;
+    Py_INCREF(arg);
+    PyTuple_SET_ITEM(args, 0, arg);
+    result = __Pyx_PyObject_Call(func, args, NULL);
+    Py_DECREF(args);
+    return result;
+}
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallOneArg(PyObject *func, PyObject *arg) {
+#if CYTHON_FAST_PYCALL
+    if (PyFunction_Check(func)) {
+        return __Pyx_PyFunction_FastCall(func, &arg, 1);
+    }
+#endif
+    if (likely(PyCFunction_Check(func))) {
+        if (likely(PyCFunction_GET_FLAGS(func) & METH_O)) {
+            return __Pyx_PyObject_CallMethO(func, arg);
+#if CYTHON_FAST_PYCCALL
+        } else if (__Pyx_PyFastCFunction_Check(func)) {
+            return __Pyx_PyCFunction_FastCall(func, &arg, 1);
+#endif
+        }
+    }
+    return __Pyx__PyObject_CallOneArg(func, arg);
+}
+#else
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallOneArg(PyObject *func, PyObject *arg) {
+    PyObject *result;
+    PyObject *args = PyTuple_Pack(1, arg);
+    if (unlikely(!args)) return NULL;
+    result = __Pyx_PyObject_Call(func, args, NULL);
+    Py_DECREF(args);
+    return result;
+}
+#endif
+
+/* SetItemIntByteArray */
+static CYTHON_INLINE int __Pyx_SetItemInt_ByteArray_Fast(PyObject* string, Py_ssize_t i, unsigned char v,
+                                                         int wraparound, int boundscheck) {
+    Py_ssize_t length;
+    if (wraparound | boundscheck) {
+        length = PyByteArray_GET_SIZE(string);
+        if (wraparound & unlikely(i < 0)) i += length;
+        if ((!boundscheck) || likely(__Pyx_is_valid_index(i, length))) {
+            PyByteArray_AS_STRING(string)[i] = (char) v;
+            return 0;
+        } else {
+            PyErr_SetString(PyExc_IndexError, "bytearray index out of range");
+            return -1;
+        }
+    } else {
+        PyByteArray_AS_STRING(string)[i] = (char) v;
+        return 0;
+    }
+}
+
+/* RaiseArgTupleInvalid */
+static void __Pyx_RaiseArgtupleInvalid(
+    const char* func_name,
+    int exact,
+    Py_ssize_t num_min,
+    Py_ssize_t num_max,
+    Py_ssize_t num_found)
+{
+    Py_ssize_t num_expected;
+    const char *more_or_less;
+    if (num_found < num_min) {
+        num_expected = num_min;
+        more_or_less = "at least";
+    } else {
+        num_expected = num_max;
+        more_or_less = "at most";
+    }
+    if (exact) {
+        more_or_less = "exactly";
+    }
+    PyErr_Format(PyExc_TypeError,
+                 "%.200s() takes %.8s %" CYTHON_FORMAT_SSIZE_T "d positional argument%.1s (%" CYTHON_FORMAT_SSIZE_T "d given)",
+                 func_name, more_or_less, num_expected,
+                 (num_expected == 1) ? "" : "s", num_found);
+}
+
+/* RaiseDoubleKeywords */
+static void __Pyx_RaiseDoubleKeywordsError(
+    const char* func_name,
+    PyObject* kw_name)
+{
+    PyErr_Format(PyExc_TypeError,
+        #if PY_MAJOR_VERSION >= 3
+        "%s() got multiple values for keyword argument '%U'", func_name, kw_name);
+        #else
+        "%s() got multiple values for keyword argument '%s'", func_name,
+        PyString_AsString(kw_name));
+        #endif
+}
+
+/* ParseKeywords */
+static int __Pyx_ParseOptionalKeywords(
+    PyObject *kwds,
+    PyObject **argnames[],
+    PyObject *kwds2,
+    PyObject *values[],
+    Py_ssize_t num_pos_args,
+    const char* function_name)
+{
+    PyObject *key = 0, *value = 0;
+    Py_ssize_t pos = 0;
+    PyObject*** name;
+    PyObject*** first_kw_arg = argnames + num_pos_args;
+    while (PyDict_Next(kwds, &pos, &key, &value)) {
+        name = first_kw_arg;
+        while (*name && (**name != key)) name++;
+        if (*name) {
+            values[name-argnames] = value;
+            continue;
+        }
+        name = first_kw_arg;
+        #if PY_MAJOR_VERSION < 3
+        if (likely(PyString_Check(key))) {
+            while (*name) {
+                if ((CYTHON_COMPILING_IN_PYPY || PyString_GET_SIZE(**name) == PyString_GET_SIZE(key))
+                        && _PyString_Eq(**name, key)) {
+                    values[name-argnames] = value;
+                    break;
+                }
+                name++;
+            }
+            if (*name) continue;
+            else {
+                PyObject*** argname = argnames;
+                while (argname != first_kw_arg) {
+                    if ((**argname == key) || (
+                            (CYTHON_COMPILING_IN_PYPY || PyString_GET_SIZE(**argname) == PyString_GET_SIZE(key))
+                             && _PyString_Eq(**argname, key))) {
+                        goto arg_passed_twice;
+                    }
+                    argname++;
+                }
+            }
+        } else
+        #endif
+        if (likely(PyUnicode_Check(key))) {
+            while (*name) {
+                int cmp = (**name == key) ? 0 :
+                #if !CYTHON_COMPILING_IN_PYPY && PY_MAJOR_VERSION >= 3
+                    (__Pyx_PyUnicode_GET_LENGTH(**name) != __Pyx_PyUnicode_GET_LENGTH(key)) ? 1 :
+                #endif
+                    PyUnicode_Compare(**name, key);
+                if (cmp < 0 && unlikely(PyErr_Occurred())) goto bad;
+                if (cmp == 0) {
+                    values[name-argnames] = value;
+                    break;
+                }
+                name++;
+            }
+            if (*name) continue;
+            else {
+                PyObject*** argname = argnames;
+                while (argname != first_kw_arg) {
+                    int cmp = (**argname == key) ? 0 :
+                    #if !CYTHON_COMPILING_IN_PYPY && PY_MAJOR_VERSION >= 3
+                        (__Pyx_PyUnicode_GET_LENGTH(**argname) != __Pyx_PyUnicode_GET_LENGTH(key)) ? 1 :
+                    #endif
+                        PyUnicode_Compare(**argname, key);
+                    if (cmp < 0 && unlikely(PyErr_Occurred())) goto bad;
+                    if (cmp == 0) goto arg_passed_twice;
+                    argname++;
+                }
+            }
+        } else
+            goto invalid_keyword_type;
+        if (kwds2) {
+            if (unlikely(PyDict_SetItem(kwds2, key, value))) goto bad;
+        } else {
+            goto invalid_keyword;
+        }
+    }
+    return 0;
+arg_passed_twice:
+    __Pyx_RaiseDoubleKeywordsError(function_name, key);
+    goto bad;
+invalid_keyword_type:
+    PyErr_Format(PyExc_TypeError,
+        "%.200s() keywords must be strings", function_name);
+    goto bad;
+invalid_keyword:
+    PyErr_Format(PyExc_TypeError,
+    #if PY_MAJOR_VERSION < 3
+        "%.200s() got an unexpected keyword argument '%.200s'",
+        function_name, PyString_AsString(key));
+    #else
+        "%s() got an unexpected keyword argument '%U'",
+        function_name, key);
+    #endif
+bad:
+    return -1;
+}
+
+/* PyObjectCallNoArg */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallNoArg(PyObject *func) {
+#if CYTHON_FAST_PYCALL
+    if (PyFunction_Check(func)) {
+        return __Pyx_PyFunction_FastCall(func, NULL, 0);
+    }
+#endif
+#if defined(__Pyx_CyFunction_USED) && defined(NDEBUG)
+    if (likely(PyCFunction_Check(func) || __Pyx_CyFunction_Check(func)))
+#else
+    if (likely(PyCFunction_Check(func)))
+#endif
+    {
+        if (likely(PyCFunction_GET_FLAGS(func) & METH_NOARGS)) {
+            return __Pyx_PyObject_CallMethO(func, NULL);
+        }
+    }
+    return __Pyx_PyObject_Call(func, __pyx_empty_tuple, NULL);
+}
+#endif
+
+/* PyObjectCall2Args */
+static CYTHON_UNUSED PyObject* __Pyx_PyObject_Call2Args(PyObject* function, PyObject* arg1, PyObject* arg2) {
+    PyObject *args, *result = NULL;
+    #if CYTHON_FAST_PYCALL
+    if (PyFunction_Check(function)) {
+        PyObject *args[2] = {arg1, arg2};
+        return __Pyx_PyFunction_FastCall(function, args, 2);
+    }
+    #endif
+    #if CYTHON_FAST_PYCCALL
+    if (__Pyx_PyFastCFunction_Check(function)) {
+        PyObject *args[2] = {arg1, arg2};
+        return __Pyx_PyCFunction_FastCall(function, args, 2);
+    }
+    #endif
+    args = PyTuple_New(2);
+    if (unlikely(!args)) goto done;
+    Py_INCREF(arg1);
+    PyTuple_SET_ITEM(args, 0, arg1);
+    Py_INCREF(arg2);
+    PyTuple_SET_ITEM(args, 1, arg2);
+    Py_INCREF(function);
+    result = __Pyx_PyObject_Call(function, args, NULL);
+    Py_DECREF(args);
+    Py_DECREF(function);
+done:
+    return result;
+}
+
+/* SliceObject */
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GetSlice(PyObject* obj,
+        Py_ssize_t cstart, Py_ssize_t cstop,
+        PyObject** _py_start, PyObject** _py_stop, PyObject** _py_slice,
+        int has_cstart, int has_cstop, CYTHON_UNUSED int wraparound) {
+#if CYTHON_USE_TYPE_SLOTS
+    PyMappingMethods* mp;
+#if PY_MAJOR_VERSION < 3
+    PySequenceMethods* ms = Py_TYPE(obj)->tp_as_sequence;
+    if (likely(ms && ms->sq_slice)) {
+        if (!has_cstart) {
+            if (_py_start && (*_py_start != Py_None)) {
+                cstart = __Pyx_PyIndex_AsSsize_t(*_py_start);
+                if ((cstart == (Py_ssize_t)-1) && PyErr_Occurred()) goto bad;
+            } else
+                cstart = 0;
+        }
+        if (!has_cstop) {
+            if (_py_stop && (*_py_stop != Py_None)) {
+                cstop = __Pyx_PyIndex_AsSsize_t(*_py_stop);
+                if ((cstop == (Py_ssize_t)-1) && PyErr_Occurred()) goto bad;
+            } else
+                cstop = PY_SSIZE_T_MAX;
+        }
+        if (wraparound && unlikely((cstart < 0) | (cstop < 0)) && likely(ms->sq_length)) {
+            Py_ssize_t l = ms->sq_length(obj);
+            if (likely(l >= 0)) {
+                if (cstop < 0) {
+                    cstop += l;
+                    if (cstop < 0) cstop = 0;
+                }
+                if (cstart < 0) {
+                    cstart += l;
+                    if (cstart < 0) cstart = 0;
+                }
+            } else {
+                if (!PyErr_ExceptionMatches(PyExc_OverflowError))
+                    goto bad;
+                PyErr_Clear();
+            }
+        }
+        return ms->sq_slice(obj, cstart, cstop);
+    }
+#endif
+    mp = Py_TYPE(obj)->tp_as_mapping;
+    if (likely(mp && mp->mp_subscript))
+#endif
+    {
+        PyObject* result;
+        PyObject *py_slice, *py_start, *py_stop;
+        if (_py_slice) {
+            py_slice = *_py_slice;
+        } else {
+            PyObject* owned_start = NULL;
+            PyObject* owned_stop = NULL;
+            if (_py_start) {
+                py_start = *_py_start;
+            } else {
+                if (has_cstart) {
+                    owned_start = py_start = PyInt_FromSsize_t(cstart);
+                    if (unlikely(!py_start)) goto bad;
+                } else
+                    py_start = Py_None;
+            }
+            if (_py_stop) {
+                py_stop = *_py_stop;
+            } else {
+                if (has_cstop) {
+                    owned_stop = py_stop = PyInt_FromSsize_t(cstop);
+                    if (unlikely(!py_stop)) {
+                        Py_XDECREF(owned_start);
+                        goto bad;
+                    }
+                } else
+                    py_stop = Py_None;
+            }
+            py_slice = PySlice_New(py_start, py_stop, Py_None);
+            Py_XDECREF(owned_start);
+            Py_XDECREF(owned_stop);
+            if (unlikely(!py_slice)) goto bad;
+        }
+#if CYTHON_USE_TYPE_SLOTS
+        result = mp->mp_subscript(obj, py_slice);
+#else
+        result = PyObject_GetItem(obj, py_slice);
+#endif
+        if (!_py_slice) {
+            Py_DECREF(py_slice);
+        }
+        return result;
+    }
+    PyErr_Format(PyExc_TypeError,
+        "'%.200s' object is unsliceable", Py_TYPE(obj)->tp_name);
+bad:
+    return NULL;
+}
+
+/* TypeImport */
+#ifndef __PYX_HAVE_RT_ImportType_0_29_37
+#define __PYX_HAVE_RT_ImportType_0_29_37
+static PyTypeObject *__Pyx_ImportType_0_29_37(PyObject *module, const char *module_name, const char *class_name,
+    size_t size, size_t alignment, enum __Pyx_ImportType_CheckSize_0_29_37 check_size)
+{
+    PyObject *result = 0;
+    char warning[200];
+    Py_ssize_t basicsize;
+    Py_ssize_t itemsize;
+#ifdef Py_LIMITED_API
+    PyObject *py_basicsize;
+    PyObject *py_itemsize;
+#endif
+    result = PyObject_GetAttrString(module, class_name);
+    if (!result)
+        goto bad;
+    if (!PyType_Check(result)) {
+        PyErr_Format(PyExc_TypeError,
+            "%.200s.%.200s is not a type object",
+            module_name, class_name);
+        goto bad;
+    }
+#ifndef Py_LIMITED_API
+    basicsize = ((PyTypeObject *)result)->tp_basicsize;
+    itemsize = ((PyTypeObject *)result)->tp_itemsize;
+#else
+    py_basicsize = PyObject_GetAttrString(result, "__basicsize__");
+    if (!py_basicsize)
+        goto bad;
+    basicsize = PyLong_AsSsize_t(py_basicsize);
+    Py_DECREF(py_basicsize);
+    py_basicsize = 0;
+    if (basicsize == (Py_ssize_t)-1 && PyErr_Occurred())
+        goto bad;
+    py_itemsize = PyObject_GetAttrString(result, "__itemsize__");
+    if (!py_itemsize)
+        goto bad;
+    itemsize = PyLong_AsSsize_t(py_itemsize);
+    Py_DECREF(py_itemsize);
+    py_itemsize = 0;
+    if (itemsize == (Py_ssize_t)-1 && PyErr_Occurred())
+        goto bad;
+#endif
+    if (itemsize) {
+        if (size % alignment) {
+            alignment = size % alignment;
+        }
+        if (itemsize < (Py_ssize_t)alignment)
+            itemsize = (Py_ssize_t)alignment;
+    }
+    if ((size_t)(basicsize + itemsize) < size) {
+        PyErr_Format(PyExc_ValueError,
+            "%.200s.%.200s size changed, may indicate binary incompatibility. "
+            "Expected %zd from C header, got %zd from PyObject",
+            module_name, class_name, size, basicsize);
+        goto bad;
+    }
+    if (check_size == __Pyx_ImportType_CheckSize_Error_0_29_37 && (size_t)basicsize != size) {
+        PyErr_Format(PyExc_ValueError,
+            "%.200s.%.200s size changed, may indicate binary incompatibility. "
+            "Expected %zd from C header, got %zd from PyObject",
+            module_name, class_name, size, basicsize);
+        goto bad;
+    }
+    else if (check_size == __Pyx_ImportType_CheckSize_Warn_0_29_37 && (size_t)basicsize > size) {
+        PyOS_snprintf(warning, sizeof(warning),
+            "%s.%s size changed, may indicate binary incompatibility. "
+            "Expected %zd from C header, got %zd from PyObject",
+            module_name, class_name, size, basicsize);
+        if (PyErr_WarnEx(NULL, warning, 0) < 0) goto bad;
+    }
+    return (PyTypeObject *)result;
+bad:
+    Py_XDECREF(result);
+    return NULL;
+}
+#endif
+
+/* Import */
+static PyObject *__Pyx_Import(PyObject *name, PyObject *from_list, int level) {
+    PyObject *empty_list = 0;
+    PyObject *module = 0;
+    PyObject *global_dict = 0;
+    PyObject *empty_dict = 0;
+    PyObject *list;
+    #if PY_MAJOR_VERSION < 3
+    PyObject *py_import;
+    py_import = __Pyx_PyObject_GetAttrStr(__pyx_b, __pyx_n_s_import);
+    if (!py_import)
+        goto bad;
+    #endif
+    if (from_list)
+        list = from_list;
+    else {
+        empty_list = PyList_New(0);
+        if (!empty_list)
+            goto bad;
+        list = empty_list;
+    }
+    global_dict = PyModule_GetDict(__pyx_m);
+    if (!global_dict)
+        goto bad;
+    empty_dict = PyDict_New();
+    if (!empty_dict)
+        goto bad;
+    {
+        #if PY_MAJOR_VERSION >= 3
+        if (level == -1) {
+            if ((1) && (strchr(__Pyx_MODULE_NAME, '.'))) {
+                module = PyImport_ImportModuleLevelObject(
+                    name, global_dict, empty_dict, list, 1);
+                if (!module) {
+                    if (!PyErr_ExceptionMatches(PyExc_ImportError))
+                        goto bad;
+                    PyErr_Clear();
+                }
+            }
+            level = 0;
+        }
+        #endif
+        if (!module) {
+            #if PY_MAJOR_VERSION < 3
+            PyObject *py_level = PyInt_FromLong(level);
+            if (!py_level)
+                goto bad;
+            module = PyObject_CallFunctionObjArgs(py_import,
+                name, global_dict, empty_dict, list, py_level, (PyObject *)NULL);
+            Py_DECREF(py_level);
+            #else
+            module = PyImport_ImportModuleLevelObject(
+                name, global_dict, empty_dict, list, level);
+            #endif
+        }
+    }
+bad:
+    #if PY_MAJOR_VERSION < 3
+    Py_XDECREF(py_import);
+    #endif
+    Py_XDECREF(empty_list);
+    Py_XDECREF(empty_dict);
+    return module;
+}
+
+/* ImportFrom */
+static PyObject* __Pyx_ImportFrom(PyObject* module, PyObject* name) {
+    PyObject* value = __Pyx_PyObject_GetAttrStr(module, name);
+    if (unlikely(!value) && PyErr_ExceptionMatches(PyExc_AttributeError)) {
+        PyErr_Format(PyExc_ImportError,
+        #if PY_MAJOR_VERSION < 3
+            "cannot import name %.230s", PyString_AS_STRING(name));
+        #else
+            "cannot import name %S", name);
+        #endif
+    }
+    return value;
+}
+
+/* PyDictVersioning */
+#if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_TYPE_SLOTS
+static CYTHON_INLINE PY_UINT64_T __Pyx_get_tp_dict_version(PyObject *obj) {
+    PyObject *dict = Py_TYPE(obj)->tp_dict;
+    return likely(dict) ? __PYX_GET_DICT_VERSION(dict) : 0;
+}
+static CYTHON_INLINE PY_UINT64_T __Pyx_get_object_dict_version(PyObject *obj) {
+    PyObject **dictptr = NULL;
+    Py_ssize_t offset = Py_TYPE(obj)->tp_dictoffset;
+    if (offset) {
+#if CYTHON_COMPILING_IN_CPYTHON
+        dictptr = (likely(offset > 0)) ? (PyObject **) ((char *)obj + offset) : _PyObject_GetDictPtr(obj);
+#else
+        dictptr = _PyObject_GetDictPtr(obj);
+#endif
+    }
+    return (dictptr && *dictptr) ? __PYX_GET_DICT_VERSION(*dictptr) : 0;
+}
+static CYTHON_INLINE int __Pyx_object_dict_version_matches(PyObject* obj, PY_UINT64_T tp_dict_version, PY_UINT64_T obj_dict_version) {
+    PyObject *dict = Py_TYPE(obj)->tp_dict;
+    if (unlikely(!dict) || unlikely(tp_dict_version != __PYX_GET_DICT_VERSION(dict)))
+        return 0;
+    return obj_dict_version == __Pyx_get_object_dict_version(obj);
+}
+#endif
+
+/* GetModuleGlobalName */
+#if CYTHON_USE_DICT_VERSIONS
+static PyObject *__Pyx__GetModuleGlobalName(PyObject *name, PY_UINT64_T *dict_version, PyObject **dict_cached_value)
+#else
+static CYTHON_INLINE PyObject *__Pyx__GetModuleGlobalName(PyObject *name)
+#endif
+{
+    PyObject *result;
+#if !CYTHON_AVOID_BORROWED_REFS
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030500A1
+    result = _PyDict_GetItem_KnownHash(__pyx_d, name, ((PyASCIIObject *) name)->hash);
+    __PYX_UPDATE_DICT_CACHE(__pyx_d, result, *dict_cached_value, *dict_version)
+    if (likely(result)) {
+        return __Pyx_NewRef(result);
+    } else if (unlikely(PyErr_Occurred())) {
+        return NULL;
+    }
+#else
+    result = PyDict_GetItem(__pyx_d, name);
+    __PYX_UPDATE_DICT_CACHE(__pyx_d, result, *dict_cached_value, *dict_version)
+    if (likely(result)) {
+        return __Pyx_NewRef(result);
+    }
+#endif
+#else
+    result = PyObject_GetItem(__pyx_d, name);
+    __PYX_UPDATE_DICT_CACHE(__pyx_d, result, *dict_cached_value, *dict_version)
+    if (likely(result)) {
+        return __Pyx_NewRef(result);
+    }
+    PyErr_Clear();
+#endif
+    return __Pyx_GetBuiltinName(name);
+}
+
+/* PyErrFetchRestore */
+#if CYTHON_FAST_THREAD_STATE
+static CYTHON_INLINE void __Pyx_ErrRestoreInState(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb) {
+    PyObject *tmp_type, *tmp_value, *tmp_tb;
+    tmp_type = tstate->curexc_type;
+    tmp_value = tstate->curexc_value;
+    tmp_tb = tstate->curexc_traceback;
+    tstate->curexc_type = type;
+    tstate->curexc_value = value;
+    tstate->curexc_traceback = tb;
+    Py_XDECREF(tmp_type);
+    Py_XDECREF(tmp_value);
+    Py_XDECREF(tmp_tb);
+}
+static CYTHON_INLINE void __Pyx_ErrFetchInState(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb) {
+    *type = tstate->curexc_type;
+    *value = tstate->curexc_value;
+    *tb = tstate->curexc_traceback;
+    tstate->curexc_type = 0;
+    tstate->curexc_value = 0;
+    tstate->curexc_traceback = 0;
+}
+#endif
+
+/* CLineInTraceback */
+#ifndef CYTHON_CLINE_IN_TRACEBACK
+static int __Pyx_CLineForTraceback(CYTHON_UNUSED PyThreadState *tstate, int c_line) {
+    PyObject *use_cline;
+    PyObject *ptype, *pvalue, *ptraceback;
+#if CYTHON_COMPILING_IN_CPYTHON
+    PyObject **cython_runtime_dict;
+#endif
+    if (unlikely(!__pyx_cython_runtime)) {
+        return c_line;
+    }
+    __Pyx_ErrFetchInState(tstate, &ptype, &pvalue, &ptraceback);
+#if CYTHON_COMPILING_IN_CPYTHON
+    cython_runtime_dict = _PyObject_GetDictPtr(__pyx_cython_runtime);
+    if (likely(cython_runtime_dict)) {
+        __PYX_PY_DICT_LOOKUP_IF_MODIFIED(
+            use_cline, *cython_runtime_dict,
+            __Pyx_PyDict_GetItemStr(*cython_runtime_dict, __pyx_n_s_cline_in_traceback))
+    } else
+#endif
+    {
+      PyObject *use_cline_obj = __Pyx_PyObject_GetAttrStr(__pyx_cython_runtime, __pyx_n_s_cline_in_traceback);
+      if (use_cline_obj) {
+        use_cline = PyObject_Not(use_cline_obj) ? Py_False : Py_True;
+        Py_DECREF(use_cline_obj);
+      } else {
+        PyErr_Clear();
+        use_cline = NULL;
+      }
+    }
+    if (!use_cline) {
+        c_line = 0;
+        (void) PyObject_SetAttr(__pyx_cython_runtime, __pyx_n_s_cline_in_traceback, Py_False);
+    }
+    else if (use_cline == Py_False || (use_cline != Py_True && PyObject_Not(use_cline) != 0)) {
+        c_line = 0;
+    }
+    __Pyx_ErrRestoreInState(tstate, ptype, pvalue, ptraceback);
+    return c_line;
+}
+#endif
+
+/* CodeObjectCache */
+static int __pyx_bisect_code_objects(__Pyx_CodeObjectCacheEntry* entries, int count, int code_line) {
+    int start = 0, mid = 0, end = count - 1;
+    if (end >= 0 && code_line > entries[end].code_line) {
+        return count;
+    }
+    while (start < end) {
+        mid = start + (end - start) / 2;
+        if (code_line < entries[mid].code_line) {
+            end = mid;
+        } else if (code_line > entries[mid].code_line) {
+             start = mid + 1;
+        } else {
+            return mid;
+        }
+    }
+    if (code_line <= entries[mid].code_line) {
+        return mid;
+    } else {
+        return mid + 1;
+    }
+}
+static PyCodeObject *__pyx_find_code_object(int code_line) {
+    PyCodeObject* code_object;
+    int pos;
+    if (unlikely(!code_line) || unlikely(!__pyx_code_cache.entries)) {
+        return NULL;
+    }
+    pos = __pyx_bisect_code_objects(__pyx_code_cache.entries, __pyx_code_cache.count, code_line);
+    if (unlikely(pos >= __pyx_code_cache.count) || unlikely(__pyx_code_cache.entries[pos].code_line != code_line)) {
+        return NULL;
+    }
+    code_object = __pyx_code_cache.entries[pos].code_object;
+    Py_INCREF(code_object);
+    return code_object;
+}
+static void __pyx_insert_code_object(int code_line, PyCodeObject* code_object) {
+    int pos, i;
+    __Pyx_CodeObjectCacheEntry* entries = __pyx_code_cache.entries;
+    if (unlikely(!code_line)) {
+        return;
+    }
+    if (unlikely(!entries)) {
+        entries = (__Pyx_CodeObjectCacheEntry*)PyMem_Malloc(64*sizeof(__Pyx_CodeObjectCacheEntry));
+        if (likely(entries)) {
+            __pyx_code_cache.entries = entries;
+            __pyx_code_cache.max_count = 64;
+            __pyx_code_cache.count = 1;
+            entries[0].code_line = code_line;
+            entries[0].code_object = code_object;
+            Py_INCREF(code_object);
+        }
+        return;
+    }
+    pos = __pyx_bisect_code_objects(__pyx_code_cache.entries, __pyx_code_cache.count, code_line);
+    if ((pos < __pyx_code_cache.count) && unlikely(__pyx_code_cache.entries[pos].code_line == code_line)) {
+        PyCodeObject* tmp = entries[pos].code_object;
+        entries[pos].code_object = code_object;
+        Py_DECREF(tmp);
+        return;
+    }
+    if (__pyx_code_cache.count == __pyx_code_cache.max_count) {
+        int new_max = __pyx_code_cache.max_count + 64;
+        entries = (__Pyx_CodeObjectCacheEntry*)PyMem_Realloc(
+            __pyx_code_cache.entries, ((size_t)new_max) * sizeof(__Pyx_CodeObjectCacheEntry));
+        if (unlikely(!entries)) {
+            return;
+        }
+        __pyx_code_cache.entries = entries;
+        __pyx_code_cache.max_count = new_max;
+    }
+    for (i=__pyx_code_cache.count; i>pos; i--) {
+        entries[i] = entries[i-1];
+    }
+    entries[pos].code_line = code_line;
+    entries[pos].code_object = code_object;
+    __pyx_code_cache.count++;
+    Py_INCREF(code_object);
+}
+
+/* AddTraceback */
+#include "compile.h"
+#include "frameobject.h"
+#include "traceback.h"
+#if PY_VERSION_HEX >= 0x030b00a6
+  #ifndef Py_BUILD_CORE
+    #define Py_BUILD_CORE 1
+  #endif
+  #include "internal/pycore_frame.h"
+#endif
+static PyCodeObject* __Pyx_CreateCodeObjectForTraceback(
+            const char *funcname, int c_line,
+            int py_line, const char *filename) {
+    PyCodeObject *py_code = NULL;
+    PyObject *py_funcname = NULL;
+    #if PY_MAJOR_VERSION < 3
+    PyObject *py_srcfile = NULL;
+    py_srcfile = PyString_FromString(filename);
+    if (!py_srcfile) goto bad;
+    #endif
+    if (c_line) {
+        #if PY_MAJOR_VERSION < 3
+        py_funcname = PyString_FromFormat( "%s (%s:%d)", funcname, __pyx_cfilenm, c_line);
+        if (!py_funcname) goto bad;
+        #else
+        py_funcname = PyUnicode_FromFormat( "%s (%s:%d)", funcname, __pyx_cfilenm, c_line);
+        if (!py_funcname) goto bad;
+        funcname = PyUnicode_AsUTF8(py_funcname);
+        if (!funcname) goto bad;
+        #endif
+    }
+    else {
+        #if PY_MAJOR_VERSION < 3
+        py_funcname = PyString_FromString(funcname);
+        if (!py_funcname) goto bad;
+        #endif
+    }
+    #if PY_MAJOR_VERSION < 3
+    py_code = __Pyx_PyCode_New(
+        0,
+        0,
+        0,
+        0,
+        0,
+        __pyx_empty_bytes, /*PyObject *code,*/
+        __pyx_empty_tuple, /*PyObject *consts,*/
+        __pyx_empty_tuple, /*PyObject *names,*/
+        __pyx_empty_tuple, /*PyObject *varnames,*/
+        __pyx_empty_tuple, /*PyObject *freevars,*/
+        __pyx_empty_tuple, /*PyObject *cellvars,*/
+        py_srcfile,   /*PyObject *filename,*/
+        py_funcname,  /*PyObject *name,*/
+        py_line,
+        __pyx_empty_bytes  /*PyObject *lnotab*/
+    );
+    Py_DECREF(py_srcfile);
+    #else
+    py_code = PyCode_NewEmpty(filename, funcname, py_line);
+    #endif
+    Py_XDECREF(py_funcname);  // XDECREF since it's only set on Py3 if cline
+    return py_code;
+bad:
+    Py_XDECREF(py_funcname);
+    #if PY_MAJOR_VERSION < 3
+    Py_XDECREF(py_srcfile);
+    #endif
+    return NULL;
+}
+static void __Pyx_AddTraceback(const char *funcname, int c_line,
+                               int py_line, const char *filename) {
+    PyCodeObject *py_code = 0;
+    PyFrameObject *py_frame = 0;
+    PyThreadState *tstate = __Pyx_PyThreadState_Current;
+    PyObject *ptype, *pvalue, *ptraceback;
+    if (c_line) {
+        c_line = __Pyx_CLineForTraceback(tstate, c_line);
+    }
+    py_code = __pyx_find_code_object(c_line ? -c_line : py_line);
+    if (!py_code) {
+        __Pyx_ErrFetchInState(tstate, &ptype, &pvalue, &ptraceback);
+        py_code = __Pyx_CreateCodeObjectForTraceback(
+            funcname, c_line, py_line, filename);
+        if (!py_code) {
+            /* If the code object creation fails, then we should clear the
+               fetched exception references and propagate the new exception */
+            Py_XDECREF(ptype);
+            Py_XDECREF(pvalue);
+            Py_XDECREF(ptraceback);
+            goto bad;
+        }
+        __Pyx_ErrRestoreInState(tstate, ptype, pvalue, ptraceback);
+        __pyx_insert_code_object(c_line ? -c_line : py_line, py_code);
+    }
+    py_frame = PyFrame_New(
+        tstate,            /*PyThreadState *tstate,*/
+        py_code,           /*PyCodeObject *code,*/
+        __pyx_d,    /*PyObject *globals,*/
+        0                  /*PyObject *locals*/
+    );
+    if (!py_frame) goto bad;
+    __Pyx_PyFrame_SetLineNumber(py_frame, py_line);
+    PyTraceBack_Here(py_frame);
+bad:
+    Py_XDECREF(py_code);
+    Py_XDECREF(py_frame);
+}
+
+/* CIntFromPyVerify */
+#define __PYX_VERIFY_RETURN_INT(target_type, func_type, func_value)\
+    __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, 0)
+#define __PYX_VERIFY_RETURN_INT_EXC(target_type, func_type, func_value)\
+    __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, 1)
+#define __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, exc)\
+    {\
+        func_type value = func_value;\
+        if (sizeof(target_type) < sizeof(func_type)) {\
+            if (unlikely(value != (func_type) (target_type) value)) {\
+                func_type zero = 0;\
+                if (exc && unlikely(value == (func_type)-1 && PyErr_Occurred()))\
+                    return (target_type) -1;\
+                if (is_unsigned && unlikely(value < zero))\
+                    goto raise_neg_overflow;\
+                else\
+                    goto raise_overflow;\
+            }\
+        }\
+        return (target_type) value;\
+    }
+
+/* CIntFromPy */
+static CYTHON_INLINE unsigned char __Pyx_PyInt_As_unsigned_char(PyObject *x) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const unsigned char neg_one = (unsigned char) -1, const_zero = (unsigned char) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+#if PY_MAJOR_VERSION < 3
+    if (likely(PyInt_Check(x))) {
+        if (sizeof(unsigned char) < sizeof(long)) {
+            __PYX_VERIFY_RETURN_INT(unsigned char, long, PyInt_AS_LONG(x))
+        } else {
+            long val = PyInt_AS_LONG(x);
+            if (is_unsigned && unlikely(val < 0)) {
+                goto raise_neg_overflow;
+            }
+            return (unsigned char) val;
+        }
+    } else
+#endif
+    if (likely(PyLong_Check(x))) {
+        if (is_unsigned) {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (unsigned char) 0;
+                case  1: __PYX_VERIFY_RETURN_INT(unsigned char, digit, digits[0])
+                case 2:
+                    if (8 * sizeof(unsigned char) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(unsigned char, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(unsigned char) >= 2 * PyLong_SHIFT) {
+                            return (unsigned char) (((((unsigned char)digits[1]) << PyLong_SHIFT) | (unsigned char)digits[0]));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(unsigned char) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(unsigned char, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(unsigned char) >= 3 * PyLong_SHIFT) {
+                            return (unsigned char) (((((((unsigned char)digits[2]) << PyLong_SHIFT) | (unsigned char)digits[1]) << PyLong_SHIFT) | (unsigned char)digits[0]));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(unsigned char) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(unsigned char, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(unsigned char) >= 4 * PyLong_SHIFT) {
+                            return (unsigned char) (((((((((unsigned char)digits[3]) << PyLong_SHIFT) | (unsigned char)digits[2]) << PyLong_SHIFT) | (unsigned char)digits[1]) << PyLong_SHIFT) | (unsigned char)digits[0]));
+                        }
+                    }
+                    break;
+            }
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030C00A7
+            if (unlikely(Py_SIZE(x) < 0)) {
+                goto raise_neg_overflow;
+            }
+#else
+            {
+                int result = PyObject_RichCompareBool(x, Py_False, Py_LT);
+                if (unlikely(result < 0))
+                    return (unsigned char) -1;
+                if (unlikely(result == 1))
+                    goto raise_neg_overflow;
+            }
+#endif
+            if (sizeof(unsigned char) <= sizeof(unsigned long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(unsigned char, unsigned long, PyLong_AsUnsignedLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(unsigned char) <= sizeof(unsigned PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(unsigned char, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
+#endif
+            }
+        } else {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (unsigned char) 0;
+                case -1: __PYX_VERIFY_RETURN_INT(unsigned char, sdigit, (sdigit) (-(sdigit)digits[0]))
+                case  1: __PYX_VERIFY_RETURN_INT(unsigned char,  digit, +digits[0])
+                case -2:
+                    if (8 * sizeof(unsigned char) - 1 > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(unsigned char, long, -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(unsigned char) - 1 > 2 * PyLong_SHIFT) {
+                            return (unsigned char) (((unsigned char)-1)*(((((unsigned char)digits[1]) << PyLong_SHIFT) | (unsigned char)digits[0])));
+                        }
+                    }
+                    break;
+                case 2:
+                    if (8 * sizeof(unsigned char) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(unsigned char, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(unsigned char) - 1 > 2 * PyLong_SHIFT) {
+                            return (unsigned char) ((((((unsigned char)digits[1]) << PyLong_SHIFT) | (unsigned char)digits[0])));
+                        }
+                    }
+                    break;
+                case -3:
+                    if (8 * sizeof(unsigned char) - 1 > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(unsigned char, long, -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(unsigned char) - 1 > 3 * PyLong_SHIFT) {
+                            return (unsigned char) (((unsigned char)-1)*(((((((unsigned char)digits[2]) << PyLong_SHIFT) | (unsigned char)digits[1]) << PyLong_SHIFT) | (unsigned char)digits[0])));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(unsigned char) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(unsigned char, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(unsigned char) - 1 > 3 * PyLong_SHIFT) {
+                            return (unsigned char) ((((((((unsigned char)digits[2]) << PyLong_SHIFT) | (unsigned char)digits[1]) << PyLong_SHIFT) | (unsigned char)digits[0])));
+                        }
+                    }
+                    break;
+                case -4:
+                    if (8 * sizeof(unsigned char) - 1 > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(unsigned char, long, -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(unsigned char) - 1 > 4 * PyLong_SHIFT) {
+                            return (unsigned char) (((unsigned char)-1)*(((((((((unsigned char)digits[3]) << PyLong_SHIFT) | (unsigned char)digits[2]) << PyLong_SHIFT) | (unsigned char)digits[1]) << PyLong_SHIFT) | (unsigned char)digits[0])));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(unsigned char) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(unsigned char, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(unsigned char) - 1 > 4 * PyLong_SHIFT) {
+                            return (unsigned char) ((((((((((unsigned char)digits[3]) << PyLong_SHIFT) | (unsigned char)digits[2]) << PyLong_SHIFT) | (unsigned char)digits[1]) << PyLong_SHIFT) | (unsigned char)digits[0])));
+                        }
+                    }
+                    break;
+            }
+#endif
+            if (sizeof(unsigned char) <= sizeof(long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(unsigned char, long, PyLong_AsLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(unsigned char) <= sizeof(PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(unsigned char, PY_LONG_LONG, PyLong_AsLongLong(x))
+#endif
+            }
+        }
+        {
+#if CYTHON_COMPILING_IN_PYPY && !defined(_PyLong_AsByteArray)
+            PyErr_SetString(PyExc_RuntimeError,
+                            "_PyLong_AsByteArray() not available in PyPy, cannot convert large numbers");
+#else
+            unsigned char val;
+            PyObject *v = __Pyx_PyNumber_IntOrLong(x);
+ #if PY_MAJOR_VERSION < 3
+            if (likely(v) && !PyLong_Check(v)) {
+                PyObject *tmp = v;
+                v = PyNumber_Long(tmp);
+                Py_DECREF(tmp);
+            }
+ #endif
+            if (likely(v)) {
+                int one = 1; int is_little = (int)*(unsigned char *)&one;
+                unsigned char *bytes = (unsigned char *)&val;
+                int ret = _PyLong_AsByteArray((PyLongObject *)v,
+                                              bytes, sizeof(val),
+                                              is_little, !is_unsigned);
+                Py_DECREF(v);
+                if (likely(!ret))
+                    return val;
+            }
+#endif
+            return (unsigned char) -1;
+        }
+    } else {
+        unsigned char val;
+        PyObject *tmp = __Pyx_PyNumber_IntOrLong(x);
+        if (!tmp) return (unsigned char) -1;
+        val = __Pyx_PyInt_As_unsigned_char(tmp);
+        Py_DECREF(tmp);
+        return val;
+    }
+raise_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "value too large to convert to unsigned char");
+    return (unsigned char) -1;
+raise_neg_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "can't convert negative value to unsigned char");
+    return (unsigned char) -1;
+}
+
+/* CIntFromPy */
+static CYTHON_INLINE unsigned int __Pyx_PyInt_As_unsigned_int(PyObject *x) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const unsigned int neg_one = (unsigned int) -1, const_zero = (unsigned int) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+#if PY_MAJOR_VERSION < 3
+    if (likely(PyInt_Check(x))) {
+        if (sizeof(unsigned int) < sizeof(long)) {
+            __PYX_VERIFY_RETURN_INT(unsigned int, long, PyInt_AS_LONG(x))
+        } else {
+            long val = PyInt_AS_LONG(x);
+            if (is_unsigned && unlikely(val < 0)) {
+                goto raise_neg_overflow;
+            }
+            return (unsigned int) val;
+        }
+    } else
+#endif
+    if (likely(PyLong_Check(x))) {
+        if (is_unsigned) {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (unsigned int) 0;
+                case  1: __PYX_VERIFY_RETURN_INT(unsigned int, digit, digits[0])
+                case 2:
+                    if (8 * sizeof(unsigned int) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(unsigned int, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(unsigned int) >= 2 * PyLong_SHIFT) {
+                            return (unsigned int) (((((unsigned int)digits[1]) << PyLong_SHIFT) | (unsigned int)digits[0]));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(unsigned int) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(unsigned int, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(unsigned int) >= 3 * PyLong_SHIFT) {
+                            return (unsigned int) (((((((unsigned int)digits[2]) << PyLong_SHIFT) | (unsigned int)digits[1]) << PyLong_SHIFT) | (unsigned int)digits[0]));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(unsigned int) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(unsigned int, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(unsigned int) >= 4 * PyLong_SHIFT) {
+                            return (unsigned int) (((((((((unsigned int)digits[3]) << PyLong_SHIFT) | (unsigned int)digits[2]) << PyLong_SHIFT) | (unsigned int)digits[1]) << PyLong_SHIFT) | (unsigned int)digits[0]));
+                        }
+                    }
+                    break;
+            }
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030C00A7
+            if (unlikely(Py_SIZE(x) < 0)) {
+                goto raise_neg_overflow;
+            }
+#else
+            {
+                int result = PyObject_RichCompareBool(x, Py_False, Py_LT);
+                if (unlikely(result < 0))
+                    return (unsigned int) -1;
+                if (unlikely(result == 1))
+                    goto raise_neg_overflow;
+            }
+#endif
+            if (sizeof(unsigned int) <= sizeof(unsigned long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(unsigned int, unsigned long, PyLong_AsUnsignedLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(unsigned int) <= sizeof(unsigned PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(unsigned int, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
+#endif
+            }
+        } else {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (unsigned int) 0;
+                case -1: __PYX_VERIFY_RETURN_INT(unsigned int, sdigit, (sdigit) (-(sdigit)digits[0]))
+                case  1: __PYX_VERIFY_RETURN_INT(unsigned int,  digit, +digits[0])
+                case -2:
+                    if (8 * sizeof(unsigned int) - 1 > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(unsigned int, long, -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(unsigned int) - 1 > 2 * PyLong_SHIFT) {
+                            return (unsigned int) (((unsigned int)-1)*(((((unsigned int)digits[1]) << PyLong_SHIFT) | (unsigned int)digits[0])));
+                        }
+                    }
+                    break;
+                case 2:
+                    if (8 * sizeof(unsigned int) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(unsigned int, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(unsigned int) - 1 > 2 * PyLong_SHIFT) {
+                            return (unsigned int) ((((((unsigned int)digits[1]) << PyLong_SHIFT) | (unsigned int)digits[0])));
+                        }
+                    }
+                    break;
+                case -3:
+                    if (8 * sizeof(unsigned int) - 1 > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(unsigned int, long, -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(unsigned int) - 1 > 3 * PyLong_SHIFT) {
+                            return (unsigned int) (((unsigned int)-1)*(((((((unsigned int)digits[2]) << PyLong_SHIFT) | (unsigned int)digits[1]) << PyLong_SHIFT) | (unsigned int)digits[0])));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(unsigned int) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(unsigned int, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(unsigned int) - 1 > 3 * PyLong_SHIFT) {
+                            return (unsigned int) ((((((((unsigned int)digits[2]) << PyLong_SHIFT) | (unsigned int)digits[1]) << PyLong_SHIFT) | (unsigned int)digits[0])));
+                        }
+                    }
+                    break;
+                case -4:
+                    if (8 * sizeof(unsigned int) - 1 > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(unsigned int, long, -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(unsigned int) - 1 > 4 * PyLong_SHIFT) {
+                            return (unsigned int) (((unsigned int)-1)*(((((((((unsigned int)digits[3]) << PyLong_SHIFT) | (unsigned int)digits[2]) << PyLong_SHIFT) | (unsigned int)digits[1]) << PyLong_SHIFT) | (unsigned int)digits[0])));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(unsigned int) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(unsigned int, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(unsigned int) - 1 > 4 * PyLong_SHIFT) {
+                            return (unsigned int) ((((((((((unsigned int)digits[3]) << PyLong_SHIFT) | (unsigned int)digits[2]) << PyLong_SHIFT) | (unsigned int)digits[1]) << PyLong_SHIFT) | (unsigned int)digits[0])));
+                        }
+                    }
+                    break;
+            }
+#endif
+            if (sizeof(unsigned int) <= sizeof(long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(unsigned int, long, PyLong_AsLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(unsigned int) <= sizeof(PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(unsigned int, PY_LONG_LONG, PyLong_AsLongLong(x))
+#endif
+            }
+        }
+        {
+#if CYTHON_COMPILING_IN_PYPY && !defined(_PyLong_AsByteArray)
+            PyErr_SetString(PyExc_RuntimeError,
+                            "_PyLong_AsByteArray() not available in PyPy, cannot convert large numbers");
+#else
+            unsigned int val;
+            PyObject *v = __Pyx_PyNumber_IntOrLong(x);
+ #if PY_MAJOR_VERSION < 3
+            if (likely(v) && !PyLong_Check(v)) {
+                PyObject *tmp = v;
+                v = PyNumber_Long(tmp);
+                Py_DECREF(tmp);
+            }
+ #endif
+            if (likely(v)) {
+                int one = 1; int is_little = (int)*(unsigned char *)&one;
+                unsigned char *bytes = (unsigned char *)&val;
+                int ret = _PyLong_AsByteArray((PyLongObject *)v,
+                                              bytes, sizeof(val),
+                                              is_little, !is_unsigned);
+                Py_DECREF(v);
+                if (likely(!ret))
+                    return val;
+            }
+#endif
+            return (unsigned int) -1;
+        }
+    } else {
+        unsigned int val;
+        PyObject *tmp = __Pyx_PyNumber_IntOrLong(x);
+        if (!tmp) return (unsigned int) -1;
+        val = __Pyx_PyInt_As_unsigned_int(tmp);
+        Py_DECREF(tmp);
+        return val;
+    }
+raise_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "value too large to convert to unsigned int");
+    return (unsigned int) -1;
+raise_neg_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "can't convert negative value to unsigned int");
+    return (unsigned int) -1;
+}
+
+/* CIntToPy */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_int(int value) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const int neg_one = (int) -1, const_zero = (int) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    if (is_unsigned) {
+        if (sizeof(int) < sizeof(long)) {
+            return PyInt_FromLong((long) value);
+        } else if (sizeof(int) <= sizeof(unsigned long)) {
+            return PyLong_FromUnsignedLong((unsigned long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(int) <= sizeof(unsigned PY_LONG_LONG)) {
+            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
+#endif
+        }
+    } else {
+        if (sizeof(int) <= sizeof(long)) {
+            return PyInt_FromLong((long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(int) <= sizeof(PY_LONG_LONG)) {
+            return PyLong_FromLongLong((PY_LONG_LONG) value);
+#endif
+        }
+    }
+    {
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        unsigned char *bytes = (unsigned char *)&value;
+        return _PyLong_FromByteArray(bytes, sizeof(int),
+                                     little, !is_unsigned);
+    }
+}
+
+/* CIntToPy */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_long(long value) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const long neg_one = (long) -1, const_zero = (long) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    if (is_unsigned) {
+        if (sizeof(long) < sizeof(long)) {
+            return PyInt_FromLong((long) value);
+        } else if (sizeof(long) <= sizeof(unsigned long)) {
+            return PyLong_FromUnsignedLong((unsigned long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(long) <= sizeof(unsigned PY_LONG_LONG)) {
+            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
+#endif
+        }
+    } else {
+        if (sizeof(long) <= sizeof(long)) {
+            return PyInt_FromLong((long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(long) <= sizeof(PY_LONG_LONG)) {
+            return PyLong_FromLongLong((PY_LONG_LONG) value);
+#endif
+        }
+    }
+    {
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        unsigned char *bytes = (unsigned char *)&value;
+        return _PyLong_FromByteArray(bytes, sizeof(long),
+                                     little, !is_unsigned);
+    }
+}
+
+/* CIntToPy */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_unsigned_int(unsigned int value) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const unsigned int neg_one = (unsigned int) -1, const_zero = (unsigned int) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    if (is_unsigned) {
+        if (sizeof(unsigned int) < sizeof(long)) {
+            return PyInt_FromLong((long) value);
+        } else if (sizeof(unsigned int) <= sizeof(unsigned long)) {
+            return PyLong_FromUnsignedLong((unsigned long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(unsigned int) <= sizeof(unsigned PY_LONG_LONG)) {
+            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
+#endif
+        }
+    } else {
+        if (sizeof(unsigned int) <= sizeof(long)) {
+            return PyInt_FromLong((long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(unsigned int) <= sizeof(PY_LONG_LONG)) {
+            return PyLong_FromLongLong((PY_LONG_LONG) value);
+#endif
+        }
+    }
+    {
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        unsigned char *bytes = (unsigned char *)&value;
+        return _PyLong_FromByteArray(bytes, sizeof(unsigned int),
+                                     little, !is_unsigned);
+    }
+}
+
+/* CIntFromPy */
+static CYTHON_INLINE int __Pyx_PyInt_As_int(PyObject *x) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const int neg_one = (int) -1, const_zero = (int) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+#if PY_MAJOR_VERSION < 3
+    if (likely(PyInt_Check(x))) {
+        if (sizeof(int) < sizeof(long)) {
+            __PYX_VERIFY_RETURN_INT(int, long, PyInt_AS_LONG(x))
+        } else {
+            long val = PyInt_AS_LONG(x);
+            if (is_unsigned && unlikely(val < 0)) {
+                goto raise_neg_overflow;
+            }
+            return (int) val;
+        }
+    } else
+#endif
+    if (likely(PyLong_Check(x))) {
+        if (is_unsigned) {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (int) 0;
+                case  1: __PYX_VERIFY_RETURN_INT(int, digit, digits[0])
+                case 2:
+                    if (8 * sizeof(int) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) >= 2 * PyLong_SHIFT) {
+                            return (int) (((((int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(int) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) >= 3 * PyLong_SHIFT) {
+                            return (int) (((((((int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(int) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) >= 4 * PyLong_SHIFT) {
+                            return (int) (((((((((int)digits[3]) << PyLong_SHIFT) | (int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
+                        }
+                    }
+                    break;
+            }
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030C00A7
+            if (unlikely(Py_SIZE(x) < 0)) {
+                goto raise_neg_overflow;
+            }
+#else
+            {
+                int result = PyObject_RichCompareBool(x, Py_False, Py_LT);
+                if (unlikely(result < 0))
+                    return (int) -1;
+                if (unlikely(result == 1))
+                    goto raise_neg_overflow;
+            }
+#endif
+            if (sizeof(int) <= sizeof(unsigned long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(int, unsigned long, PyLong_AsUnsignedLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(int) <= sizeof(unsigned PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(int, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
+#endif
+            }
+        } else {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (int) 0;
+                case -1: __PYX_VERIFY_RETURN_INT(int, sdigit, (sdigit) (-(sdigit)digits[0]))
+                case  1: __PYX_VERIFY_RETURN_INT(int,  digit, +digits[0])
+                case -2:
+                    if (8 * sizeof(int) - 1 > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, long, -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 2 * PyLong_SHIFT) {
+                            return (int) (((int)-1)*(((((int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case 2:
+                    if (8 * sizeof(int) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 2 * PyLong_SHIFT) {
+                            return (int) ((((((int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case -3:
+                    if (8 * sizeof(int) - 1 > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, long, -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 3 * PyLong_SHIFT) {
+                            return (int) (((int)-1)*(((((((int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(int) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 3 * PyLong_SHIFT) {
+                            return (int) ((((((((int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case -4:
+                    if (8 * sizeof(int) - 1 > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, long, -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 4 * PyLong_SHIFT) {
+                            return (int) (((int)-1)*(((((((((int)digits[3]) << PyLong_SHIFT) | (int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(int) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 4 * PyLong_SHIFT) {
+                            return (int) ((((((((((int)digits[3]) << PyLong_SHIFT) | (int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+            }
+#endif
+            if (sizeof(int) <= sizeof(long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(int, long, PyLong_AsLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(int) <= sizeof(PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(int, PY_LONG_LONG, PyLong_AsLongLong(x))
+#endif
+            }
+        }
+        {
+#if CYTHON_COMPILING_IN_PYPY && !defined(_PyLong_AsByteArray)
+            PyErr_SetString(PyExc_RuntimeError,
+                            "_PyLong_AsByteArray() not available in PyPy, cannot convert large numbers");
+#else
+            int val;
+            PyObject *v = __Pyx_PyNumber_IntOrLong(x);
+ #if PY_MAJOR_VERSION < 3
+            if (likely(v) && !PyLong_Check(v)) {
+                PyObject *tmp = v;
+                v = PyNumber_Long(tmp);
+                Py_DECREF(tmp);
+            }
+ #endif
+            if (likely(v)) {
+                int one = 1; int is_little = (int)*(unsigned char *)&one;
+                unsigned char *bytes = (unsigned char *)&val;
+                int ret = _PyLong_AsByteArray((PyLongObject *)v,
+                                              bytes, sizeof(val),
+                                              is_little, !is_unsigned);
+                Py_DECREF(v);
+                if (likely(!ret))
+                    return val;
+            }
+#endif
+            return (int) -1;
+        }
+    } else {
+        int val;
+        PyObject *tmp = __Pyx_PyNumber_IntOrLong(x);
+        if (!tmp) return (int) -1;
+        val = __Pyx_PyInt_As_int(tmp);
+        Py_DECREF(tmp);
+        return val;
+    }
+raise_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "value too large to convert to int");
+    return (int) -1;
+raise_neg_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "can't convert negative value to int");
+    return (int) -1;
+}
+
+/* CIntFromPy */
+static CYTHON_INLINE long __Pyx_PyInt_As_long(PyObject *x) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const long neg_one = (long) -1, const_zero = (long) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+#if PY_MAJOR_VERSION < 3
+    if (likely(PyInt_Check(x))) {
+        if (sizeof(long) < sizeof(long)) {
+            __PYX_VERIFY_RETURN_INT(long, long, PyInt_AS_LONG(x))
+        } else {
+            long val = PyInt_AS_LONG(x);
+            if (is_unsigned && unlikely(val < 0)) {
+                goto raise_neg_overflow;
+            }
+            return (long) val;
+        }
+    } else
+#endif
+    if (likely(PyLong_Check(x))) {
+        if (is_unsigned) {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (long) 0;
+                case  1: __PYX_VERIFY_RETURN_INT(long, digit, digits[0])
+                case 2:
+                    if (8 * sizeof(long) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) >= 2 * PyLong_SHIFT) {
+                            return (long) (((((long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(long) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) >= 3 * PyLong_SHIFT) {
+                            return (long) (((((((long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(long) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) >= 4 * PyLong_SHIFT) {
+                            return (long) (((((((((long)digits[3]) << PyLong_SHIFT) | (long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
+                        }
+                    }
+                    break;
+            }
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030C00A7
+            if (unlikely(Py_SIZE(x) < 0)) {
+                goto raise_neg_overflow;
+            }
+#else
+            {
+                int result = PyObject_RichCompareBool(x, Py_False, Py_LT);
+                if (unlikely(result < 0))
+                    return (long) -1;
+                if (unlikely(result == 1))
+                    goto raise_neg_overflow;
+            }
+#endif
+            if (sizeof(long) <= sizeof(unsigned long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(long, unsigned long, PyLong_AsUnsignedLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(long) <= sizeof(unsigned PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(long, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
+#endif
+            }
+        } else {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (long) 0;
+                case -1: __PYX_VERIFY_RETURN_INT(long, sdigit, (sdigit) (-(sdigit)digits[0]))
+                case  1: __PYX_VERIFY_RETURN_INT(long,  digit, +digits[0])
+                case -2:
+                    if (8 * sizeof(long) - 1 > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, long, -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT) {
+                            return (long) (((long)-1)*(((((long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+                case 2:
+                    if (8 * sizeof(long) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT) {
+                            return (long) ((((((long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+                case -3:
+                    if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, long, -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT) {
+                            return (long) (((long)-1)*(((((((long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(long) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT) {
+                            return (long) ((((((((long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+                case -4:
+                    if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, long, -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 4 * PyLong_SHIFT) {
+                            return (long) (((long)-1)*(((((((((long)digits[3]) << PyLong_SHIFT) | (long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(long) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 4 * PyLong_SHIFT) {
+                            return (long) ((((((((((long)digits[3]) << PyLong_SHIFT) | (long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+            }
+#endif
+            if (sizeof(long) <= sizeof(long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(long, long, PyLong_AsLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(long) <= sizeof(PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(long, PY_LONG_LONG, PyLong_AsLongLong(x))
+#endif
+            }
+        }
+        {
+#if CYTHON_COMPILING_IN_PYPY && !defined(_PyLong_AsByteArray)
+            PyErr_SetString(PyExc_RuntimeError,
+                            "_PyLong_AsByteArray() not available in PyPy, cannot convert large numbers");
+#else
+            long val;
+            PyObject *v = __Pyx_PyNumber_IntOrLong(x);
+ #if PY_MAJOR_VERSION < 3
+            if (likely(v) && !PyLong_Check(v)) {
+                PyObject *tmp = v;
+                v = PyNumber_Long(tmp);
+                Py_DECREF(tmp);
+            }
+ #endif
+            if (likely(v)) {
+                int one = 1; int is_little = (int)*(unsigned char *)&one;
+                unsigned char *bytes = (unsigned char *)&val;
+                int ret = _PyLong_AsByteArray((PyLongObject *)v,
+                                              bytes, sizeof(val),
+                                              is_little, !is_unsigned);
+                Py_DECREF(v);
+                if (likely(!ret))
+                    return val;
+            }
+#endif
+            return (long) -1;
+        }
+    } else {
+        long val;
+        PyObject *tmp = __Pyx_PyNumber_IntOrLong(x);
+        if (!tmp) return (long) -1;
+        val = __Pyx_PyInt_As_long(tmp);
+        Py_DECREF(tmp);
+        return val;
+    }
+raise_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "value too large to convert to long");
+    return (long) -1;
+raise_neg_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "can't convert negative value to long");
+    return (long) -1;
+}
+
+/* FastTypeChecks */
+#if CYTHON_COMPILING_IN_CPYTHON
+static int __Pyx_InBases(PyTypeObject *a, PyTypeObject *b) {
+    while (a) {
+        a = a->tp_base;
+        if (a == b)
+            return 1;
+    }
+    return b == &PyBaseObject_Type;
+}
+static CYTHON_INLINE int __Pyx_IsSubtype(PyTypeObject *a, PyTypeObject *b) {
+    PyObject *mro;
+    if (a == b) return 1;
+    mro = a->tp_mro;
+    if (likely(mro)) {
+        Py_ssize_t i, n;
+        n = PyTuple_GET_SIZE(mro);
+        for (i = 0; i < n; i++) {
+            if (PyTuple_GET_ITEM(mro, i) == (PyObject *)b)
+                return 1;
+        }
+        return 0;
+    }
+    return __Pyx_InBases(a, b);
+}
+#if PY_MAJOR_VERSION == 2
+static int __Pyx_inner_PyErr_GivenExceptionMatches2(PyObject *err, PyObject* exc_type1, PyObject* exc_type2) {
+    PyObject *exception, *value, *tb;
+    int res;
+    __Pyx_PyThreadState_declare
+    __Pyx_PyThreadState_assign
+    __Pyx_ErrFetch(&exception, &value, &tb);
+    res = exc_type1 ? PyObject_IsSubclass(err, exc_type1) : 0;
+    if (unlikely(res == -1)) {
+        PyErr_WriteUnraisable(err);
+        res = 0;
+    }
+    if (!res) {
+        res = PyObject_IsSubclass(err, exc_type2);
+        if (unlikely(res == -1)) {
+            PyErr_WriteUnraisable(err);
+            res = 0;
+        }
+    }
+    __Pyx_ErrRestore(exception, value, tb);
+    return res;
+}
+#else
+static CYTHON_INLINE int __Pyx_inner_PyErr_GivenExceptionMatches2(PyObject *err, PyObject* exc_type1, PyObject *exc_type2) {
+    int res = exc_type1 ? __Pyx_IsSubtype((PyTypeObject*)err, (PyTypeObject*)exc_type1) : 0;
+    if (!res) {
+        res = __Pyx_IsSubtype((PyTypeObject*)err, (PyTypeObject*)exc_type2);
+    }
+    return res;
+}
+#endif
+static int __Pyx_PyErr_GivenExceptionMatchesTuple(PyObject *exc_type, PyObject *tuple) {
+    Py_ssize_t i, n;
+    assert(PyExceptionClass_Check(exc_type));
+    n = PyTuple_GET_SIZE(tuple);
+#if PY_MAJOR_VERSION >= 3
+    for (i=0; i<n; i++) {
+        if (exc_type == PyTuple_GET_ITEM(tuple, i)) return 1;
+    }
+#endif
+    for (i=0; i<n; i++) {
+        PyObject *t = PyTuple_GET_ITEM(tuple, i);
+        #if PY_MAJOR_VERSION < 3
+        if (likely(exc_type == t)) return 1;
+        #endif
+        if (likely(PyExceptionClass_Check(t))) {
+            if (__Pyx_inner_PyErr_GivenExceptionMatches2(exc_type, NULL, t)) return 1;
+        } else {
+        }
+    }
+    return 0;
+}
+static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches(PyObject *err, PyObject* exc_type) {
+    if (likely(err == exc_type)) return 1;
+    if (likely(PyExceptionClass_Check(err))) {
+        if (likely(PyExceptionClass_Check(exc_type))) {
+            return __Pyx_inner_PyErr_GivenExceptionMatches2(err, NULL, exc_type);
+        } else if (likely(PyTuple_Check(exc_type))) {
+            return __Pyx_PyErr_GivenExceptionMatchesTuple(err, exc_type);
+        } else {
+        }
+    }
+    return PyErr_GivenExceptionMatches(err, exc_type);
+}
+static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches2(PyObject *err, PyObject *exc_type1, PyObject *exc_type2) {
+    assert(PyExceptionClass_Check(exc_type1));
+    assert(PyExceptionClass_Check(exc_type2));
+    if (likely(err == exc_type1 || err == exc_type2)) return 1;
+    if (likely(PyExceptionClass_Check(err))) {
+        return __Pyx_inner_PyErr_GivenExceptionMatches2(err, exc_type1, exc_type2);
+    }
+    return (PyErr_GivenExceptionMatches(err, exc_type1) || PyErr_GivenExceptionMatches(err, exc_type2));
+}
+#endif
+
+/* CheckBinaryVersion */
+static int __Pyx_check_binary_version(void) {
+    char ctversion[5];
+    int same=1, i, found_dot;
+    const char* rt_from_call = Py_GetVersion();
+    PyOS_snprintf(ctversion, 5, "%d.%d", PY_MAJOR_VERSION, PY_MINOR_VERSION);
+    found_dot = 0;
+    for (i = 0; i < 4; i++) {
+        if (!ctversion[i]) {
+            same = (rt_from_call[i] < '0' || rt_from_call[i] > '9');
+            break;
+        }
+        if (rt_from_call[i] != ctversion[i]) {
+            same = 0;
+            break;
+        }
+    }
+    if (!same) {
+        char rtversion[5] = {'\0'};
+        char message[200];
+        for (i=0; i<4; ++i) {
+            if (rt_from_call[i] == '.') {
+                if (found_dot) break;
+                found_dot = 1;
+            } else if (rt_from_call[i] < '0' || rt_from_call[i] > '9') {
+                break;
+            }
+            rtversion[i] = rt_from_call[i];
+        }
+        PyOS_snprintf(message, sizeof(message),
+                      "compiletime version %s of module '%.100s' "
+                      "does not match runtime version %s",
+                      ctversion, __Pyx_MODULE_NAME, rtversion);
+        return PyErr_WarnEx(NULL, message, 1);
+    }
+    return 0;
+}
+
+/* FunctionExport */
+static int __Pyx_ExportFunction(const char *name, void (*f)(void), const char *sig) {
+    PyObject *d = 0;
+    PyObject *cobj = 0;
+    union {
+        void (*fp)(void);
+        void *p;
+    } tmp;
+    d = PyObject_GetAttrString(__pyx_m, (char *)"__pyx_capi__");
+    if (!d) {
+        PyErr_Clear();
+        d = PyDict_New();
+        if (!d)
+            goto bad;
+        Py_INCREF(d);
+        if (PyModule_AddObject(__pyx_m, (char *)"__pyx_capi__", d) < 0)
+            goto bad;
+    }
+    tmp.fp = f;
+#if PY_VERSION_HEX >= 0x02070000
+    cobj = PyCapsule_New(tmp.p, sig, 0);
+#else
+    cobj = PyCObject_FromVoidPtrAndDesc(tmp.p, (void *)sig, 0);
+#endif
+    if (!cobj)
+        goto bad;
+    if (PyDict_SetItemString(d, name, cobj) < 0)
+        goto bad;
+    Py_DECREF(cobj);
+    Py_DECREF(d);
+    return 0;
+bad:
+    Py_XDECREF(cobj);
+    Py_XDECREF(d);
+    return -1;
+}
+
+/* InitStrings */
+static int __Pyx_InitStrings(__Pyx_StringTabEntry *t) {
+    while (t->p) {
+        #if PY_MAJOR_VERSION < 3
+        if (t->is_unicode) {
+            *t->p = PyUnicode_DecodeUTF8(t->s, t->n - 1, NULL);
+        } else if (t->intern) {
+            *t->p = PyString_InternFromString(t->s);
+        } else {
+            *t->p = PyString_FromStringAndSize(t->s, t->n - 1);
+        }
+        #else
+        if (t->is_unicode | t->is_str) {
+            if (t->intern) {
+                *t->p = PyUnicode_InternFromString(t->s);
+            } else if (t->encoding) {
+                *t->p = PyUnicode_Decode(t->s, t->n - 1, t->encoding, NULL);
+            } else {
+                *t->p = PyUnicode_FromStringAndSize(t->s, t->n - 1);
+            }
+        } else {
+            *t->p = PyBytes_FromStringAndSize(t->s, t->n - 1);
+        }
+        #endif
+        if (!*t->p)
+            return -1;
+        if (PyObject_Hash(*t->p) == -1)
+            return -1;
+        ++t;
+    }
+    return 0;
+}
+
+static CYTHON_INLINE PyObject* __Pyx_PyUnicode_FromString(const char* c_str) {
+    return __Pyx_PyUnicode_FromStringAndSize(c_str, (Py_ssize_t)strlen(c_str));
+}
+static CYTHON_INLINE const char* __Pyx_PyObject_AsString(PyObject* o) {
+    Py_ssize_t ignore;
+    return __Pyx_PyObject_AsStringAndSize(o, &ignore);
+}
+#if __PYX_DEFAULT_STRING_ENCODING_IS_ASCII || __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT
+#if !CYTHON_PEP393_ENABLED
+static const char* __Pyx_PyUnicode_AsStringAndSize(PyObject* o, Py_ssize_t *length) {
+    char* defenc_c;
+    PyObject* defenc = _PyUnicode_AsDefaultEncodedString(o, NULL);
+    if (!defenc) return NULL;
+    defenc_c = PyBytes_AS_STRING(defenc);
+#if __PYX_DEFAULT_STRING_ENCODING_IS_ASCII
+    {
+        char* end = defenc_c + PyBytes_GET_SIZE(defenc);
+        char* c;
+        for (c = defenc_c; c < end; c++) {
+            if ((unsigned char) (*c) >= 128) {
+                PyUnicode_AsASCIIString(o);
+                return NULL;
+            }
+        }
+    }
+#endif
+    *length = PyBytes_GET_SIZE(defenc);
+    return defenc_c;
+}
+#else
+static CYTHON_INLINE const char* __Pyx_PyUnicode_AsStringAndSize(PyObject* o, Py_ssize_t *length) {
+    if (unlikely(__Pyx_PyUnicode_READY(o) == -1)) return NULL;
+#if __PYX_DEFAULT_STRING_ENCODING_IS_ASCII
+    if (likely(PyUnicode_IS_ASCII(o))) {
+        *length = PyUnicode_GET_LENGTH(o);
+        return PyUnicode_AsUTF8(o);
+    } else {
+        PyUnicode_AsASCIIString(o);
+        return NULL;
+    }
+#else
+    return PyUnicode_AsUTF8AndSize(o, length);
+#endif
+}
+#endif
+#endif
+static CYTHON_INLINE const char* __Pyx_PyObject_AsStringAndSize(PyObject* o, Py_ssize_t *length) {
+#if __PYX_DEFAULT_STRING_ENCODING_IS_ASCII || __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT
+    if (
+#if PY_MAJOR_VERSION < 3 && __PYX_DEFAULT_STRING_ENCODING_IS_ASCII
+            __Pyx_sys_getdefaultencoding_not_ascii &&
+#endif
+            PyUnicode_Check(o)) {
+        return __Pyx_PyUnicode_AsStringAndSize(o, length);
+    } else
+#endif
+#if (!CYTHON_COMPILING_IN_PYPY) || (defined(PyByteArray_AS_STRING) && defined(PyByteArray_GET_SIZE))
+    if (PyByteArray_Check(o)) {
+        *length = PyByteArray_GET_SIZE(o);
+        return PyByteArray_AS_STRING(o);
+    } else
+#endif
+    {
+        char* result;
+        int r = PyBytes_AsStringAndSize(o, &result, length);
+        if (unlikely(r < 0)) {
+            return NULL;
+        } else {
+            return result;
+        }
+    }
+}
+static CYTHON_INLINE int __Pyx_PyObject_IsTrue(PyObject* x) {
+   int is_true = x == Py_True;
+   if (is_true | (x == Py_False) | (x == Py_None)) return is_true;
+   else return PyObject_IsTrue(x);
+}
+static CYTHON_INLINE int __Pyx_PyObject_IsTrueAndDecref(PyObject* x) {
+    int retval;
+    if (unlikely(!x)) return -1;
+    retval = __Pyx_PyObject_IsTrue(x);
+    Py_DECREF(x);
+    return retval;
+}
+static PyObject* __Pyx_PyNumber_IntOrLongWrongResultType(PyObject* result, const char* type_name) {
+#if PY_MAJOR_VERSION >= 3
+    if (PyLong_Check(result)) {
+        if (PyErr_WarnFormat(PyExc_DeprecationWarning, 1,
+                "__int__ returned non-int (type %.200s).  "
+                "The ability to return an instance of a strict subclass of int "
+                "is deprecated, and may be removed in a future version of Python.",
+                Py_TYPE(result)->tp_name)) {
+            Py_DECREF(result);
+            return NULL;
+        }
+        return result;
+    }
+#endif
+    PyErr_Format(PyExc_TypeError,
+                 "__%.4s__ returned non-%.4s (type %.200s)",
+                 type_name, type_name, Py_TYPE(result)->tp_name);
+    Py_DECREF(result);
+    return NULL;
+}
+static CYTHON_INLINE PyObject* __Pyx_PyNumber_IntOrLong(PyObject* x) {
+#if CYTHON_USE_TYPE_SLOTS
+  PyNumberMethods *m;
+#endif
+  const char *name = NULL;
+  PyObject *res = NULL;
+#if PY_MAJOR_VERSION < 3
+  if (likely(PyInt_Check(x) || PyLong_Check(x)))
+#else
+  if (likely(PyLong_Check(x)))
+#endif
+    return __Pyx_NewRef(x);
+#if CYTHON_USE_TYPE_SLOTS
+  m = Py_TYPE(x)->tp_as_number;
+  #if PY_MAJOR_VERSION < 3
+  if (m && m->nb_int) {
+    name = "int";
+    res = m->nb_int(x);
+  }
+  else if (m && m->nb_long) {
+    name = "long";
+    res = m->nb_long(x);
+  }
+  #else
+  if (likely(m && m->nb_int)) {
+    name = "int";
+    res = m->nb_int(x);
+  }
+  #endif
+#else
+  if (!PyBytes_CheckExact(x) && !PyUnicode_CheckExact(x)) {
+    res = PyNumber_Int(x);
+  }
+#endif
+  if (likely(res)) {
+#if PY_MAJOR_VERSION < 3
+    if (unlikely(!PyInt_Check(res) && !PyLong_Check(res))) {
+#else
+    if (unlikely(!PyLong_CheckExact(res))) {
+#endif
+        return __Pyx_PyNumber_IntOrLongWrongResultType(res, name);
+    }
+  }
+  else if (!PyErr_Occurred()) {
+    PyErr_SetString(PyExc_TypeError,
+                    "an integer is required");
+  }
+  return res;
+}
+static CYTHON_INLINE Py_ssize_t __Pyx_PyIndex_AsSsize_t(PyObject* b) {
+  Py_ssize_t ival;
+  PyObject *x;
+#if PY_MAJOR_VERSION < 3
+  if (likely(PyInt_CheckExact(b))) {
+    if (sizeof(Py_ssize_t) >= sizeof(long))
+        return PyInt_AS_LONG(b);
+    else
+        return PyInt_AsSsize_t(b);
+  }
+#endif
+  if (likely(PyLong_CheckExact(b))) {
+    #if CYTHON_USE_PYLONG_INTERNALS
+    const digit* digits = ((PyLongObject*)b)->ob_digit;
+    const Py_ssize_t size = Py_SIZE(b);
+    if (likely(__Pyx_sst_abs(size) <= 1)) {
+        ival = likely(size) ? digits[0] : 0;
+        if (size == -1) ival = -ival;
+        return ival;
+    } else {
+      switch (size) {
+         case 2:
+           if (8 * sizeof(Py_ssize_t) > 2 * PyLong_SHIFT) {
+             return (Py_ssize_t) (((((size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+         case -2:
+           if (8 * sizeof(Py_ssize_t) > 2 * PyLong_SHIFT) {
+             return -(Py_ssize_t) (((((size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+         case 3:
+           if (8 * sizeof(Py_ssize_t) > 3 * PyLong_SHIFT) {
+             return (Py_ssize_t) (((((((size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+         case -3:
+           if (8 * sizeof(Py_ssize_t) > 3 * PyLong_SHIFT) {
+             return -(Py_ssize_t) (((((((size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+         case 4:
+           if (8 * sizeof(Py_ssize_t) > 4 * PyLong_SHIFT) {
+             return (Py_ssize_t) (((((((((size_t)digits[3]) << PyLong_SHIFT) | (size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+         case -4:
+           if (8 * sizeof(Py_ssize_t) > 4 * PyLong_SHIFT) {
+             return -(Py_ssize_t) (((((((((size_t)digits[3]) << PyLong_SHIFT) | (size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+      }
+    }
+    #endif
+    return PyLong_AsSsize_t(b);
+  }
+  x = PyNumber_Index(b);
+  if (!x) return -1;
+  ival = PyInt_AsSsize_t(x);
+  Py_DECREF(x);
+  return ival;
+}
+static CYTHON_INLINE Py_hash_t __Pyx_PyIndex_AsHash_t(PyObject* o) {
+  if (sizeof(Py_hash_t) == sizeof(Py_ssize_t)) {
+    return (Py_hash_t) __Pyx_PyIndex_AsSsize_t(o);
+#if PY_MAJOR_VERSION < 3
+  } else if (likely(PyInt_CheckExact(o))) {
+    return PyInt_AS_LONG(o);
+#endif
+  } else {
+    Py_ssize_t ival;
+    PyObject *x;
+    x = PyNumber_Index(o);
+    if (!x) return -1;
+    ival = PyInt_AsLong(x);
+    Py_DECREF(x);
+    return ival;
+  }
+}
+static CYTHON_INLINE PyObject * __Pyx_PyBool_FromLong(long b) {
+  return b ? __Pyx_NewRef(Py_True) : __Pyx_NewRef(Py_False);
+}
+static CYTHON_INLINE PyObject * __Pyx_PyInt_FromSize_t(size_t ival) {
+    return PyInt_FromSize_t(ival);
+}
+
+
+#endif /* Py_PYTHON_H */
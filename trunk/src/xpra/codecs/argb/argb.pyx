@@ -12,12 +12,14 @@ cdef extern from "../../buffers/buffers.h":
     int    object_as_write_buffer(object obj, const void ** buffer, Py_ssize_t * buffer_len)
     int get_buffer_api_version()
 
-cdef extern from "string.h":
+cdef extern from "string.h" nogil:
     void * memcpy(void * destination, void * source, size_t num)
+    void * memset(void * ptr, int value, size_t num)
 
 cdef extern from "stdlib.h":
     void free(void* mem)
 
+from cpython.bytes cimport PyBytes_FromStringAndSize, PyBytes_AS_STRING
 
 import struct
 from xpra.log import Logger
@@ -291,3 +293,69 @@ cdef do_unpremultiply_argb(unsigned int * argb_in, Py_ssize_t argb_len):
         argb_out[i*4+R] = r
         argb_out[i*4+A] = a
     return argb_out
+
+
+def pack_rgb32(buf, unsigned int width, unsigned int height, unsigned int rowstride, rgb_format, rgb24=False):
+    """
+        Prepares 32-bit pixels for sending as plain rgb, in a single pass:
+        * the padding channel ("X") is set to 255 (its value may be garbage)
+        * or, when rgb24 is set, the padding or alpha channel is dropped
+        * the rows are packed together (no rowstride padding)
+        Returns the new pixel format, the new pixel data and its rowstride.
+    """
+    assert len(rgb_format)==4, "invalid rgb32 pixel format: %s" % rgb_format
+    cdef const unsigned char *src = NULL
+    cdef Py_ssize_t src_len = 0
+    assert object_as_buffer(buf, <const void**> &src, &src_len)==0, "cannot convert %s to a readable buffer" % type(buf)
+    assert width>0 and height>0, "invalid dimensions: %ix%i" % (width, height)
+    assert rowstride>=width*4, "invalid rowstride %i for width %i" % (rowstride, width)
+    assert src_len>=(<Py_ssize_t> rowstride)*(height-1)+width*4, "buffer is too small: %i bytes for %ix%i with rowstride=%i" % (src_len, width, height, rowstride)
+    cdef int alpha_index = rgb_format.upper().find("X")
+    if rgb24 and alpha_index<0:
+        alpha_index = rgb_format.upper().find("A")
+    cdef unsigned int bpp = 4
+    if rgb24:
+        assert alpha_index>=0, "no alpha or padding channel to drop from %s" % rgb_format
+        bpp = 3
+        rgb_format = rgb_format[:alpha_index]+rgb_format[alpha_index+1:]
+    cdef unsigned int out_stride = width*bpp
+    #we fill in the new bytes object before anything else can see it:
+    out = PyBytes_FromStringAndSize(NULL, out_stride*height)
+    cdef unsigned char *dst = <unsigned char *> PyBytes_AS_STRING(out)
+    #channel indexes for rgb24:
+    cdef unsigned char i0 = 0, i1 = 1, i2 = 2
+    if alpha_index==0:
+        i0, i1, i2 = 1, 2, 3
+    elif alpha_index==1:
+        i0, i1, i2 = 0, 2, 3
+    elif alpha_index==2:
+        i0, i1, i2 = 0, 1, 3
+    #mask for forcing the padding channel to 255,
+    #built from bytes so that it matches the native endianness of the 32-bit loads:
+    cdef unsigned int mask = 0
+    cdef unsigned char mask_bytes[4]
+    memset(mask_bytes, 0, 4)
+    if alpha_index>=0:
+        mask_bytes[alpha_index] = 255
+    memcpy(&mask, mask_bytes, 4)
+    cdef unsigned int x, y
+    cdef unsigned int v
+    cdef const unsigned char *s
+    cdef unsigned char *d
+    with nogil:
+        for y in range(height):
+            s = src + y*rowstride
+            d = dst + y*out_stride
+            if bpp==4:
+                for x in range(width):
+                    memcpy(&v, <void*> (s+x*4), 4)
+                    v = v | mask
+                    memcpy(d+x*4, &v, 4)
+            else:
+                for x in range(width):
+                    d[0] = s[i0]
+                    d[1] = s[i1]
+                    d[2] = s[i2]
+                    s += 4
+                    d += 3
+    return rgb_format, out, out_stride
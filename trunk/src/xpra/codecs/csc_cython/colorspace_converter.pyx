@@ -20,6 +20,10 @@ except ImportError:
 from xpra.log import Logger
 log = Logger("csc", "cython")
 
+from xpra.os_util import Queue
+from xpra.util import envint
+from xpra.make_thread import start_thread
+
 from xpra.codecs.codec_constants import csc_spec
 from xpra.codecs.image_wrapper import ImageWrapper
 
@@ -38,7 +42,7 @@ cdef extern from "../../buffers/memalign.h":
 
 from libc.stdint cimport uint8_t
 
-cdef inline int roundup(int n, int m):
+cdef inline int roundup(int n, int m) nogil:
     return (n + m - 1) & ~(m - 1)
 
 #precalculate indexes in native endianness:
@@ -100,6 +104,17 @@ if dp:
 
 CSC_CYTHON_VERSION = [1]
 
+def get_default_threads():
+    try:
+        from multiprocessing import cpu_count
+        return min(4, cpu_count())
+    except:
+        return 1
+#number of threads used by the threaded converter (including the caller's):
+THREADS = max(1, envint("XPRA_CSC_CYTHON_THREADS", get_default_threads()))
+#don't bother splitting frames into bands smaller than this many rows:
+MIN_BAND_ROWS = max(1, envint("XPRA_CSC_CYTHON_MIN_BAND_ROWS", 64))
+
 
 def init_module():
     #nothing to do!
@@ -118,6 +133,7 @@ def get_info():
     info = {
             "version"   : CSC_CYTHON_VERSION,
             "buffer_api": get_buffer_api_version(),
+            "threads"   : THREADS,
             }
     if CYTHON_VERSION:
         info["Cython"] = CYTHON_VERSION
@@ -135,6 +151,63 @@ def get_spec(in_colorspace, out_colorspace):
     #low score as this should be used as fallback only:
     return csc_spec(ColorspaceConverter, codec_type=get_type(), quality=50, speed=10, setup_cost=10, min_w=2, min_h=2, max_w=16*1024, max_h=16*1024, can_scale=True)
 
+def get_specs(in_colorspace, out_colorspace):
+    specs = [get_spec(in_colorspace, out_colorspace)]
+    if THREADS>1:
+        #the threaded converter scales with the number of threads,
+        #but it is still slower than the native converters:
+        spec = csc_spec(ThreadedColorspaceConverter, codec_type="%s_mt" % get_type(), quality=50, speed=min(40, 10*THREADS),
+                        setup_cost=10, min_w=2, min_h=2, max_w=16*1024, max_h=16*1024, can_scale=True)
+        #smaller frames are converted by a single thread,
+        #so the speed above only applies from this output height:
+        spec.threaded_min_h = get_threaded_min_height()
+        specs.append(spec)
+    return specs
+
+def get_threaded_min_height():
+    #we need at least two bands to use more than one thread,
+    #and the YUV420P conversions work on pairs of lines:
+    return 2*2*MIN_BAND_ROWS
+
+
+class BandWorkers(object):
+    """
+        The threads used by the threaded converter,
+        the caller converts the first band itself and waits for the others.
+    """
+
+    def __init__(self, count):
+        self.pid = os.getpid()
+        self.queue = Queue()
+        self.threads = [start_thread(self.run, "csc-cython-%i" % i, daemon=True) for i in range(count)]
+
+    def run(self):
+        while True:
+            fn, args, done = self.queue.get()
+            try:
+                fn(*args)
+                done.put(None)
+            except Exception as e:
+                log.error("Error in csc_cython worker calling %s%s", fn, args, exc_info=True)
+                done.put(e)
+
+    def process(self, fn, jobs):
+        done = Queue()
+        for args in jobs[1:]:
+            self.queue.put((fn, args, done))
+        fn(*jobs[0])
+        errors = [x for x in (done.get() for _ in jobs[1:]) if x is not None]
+        if errors:
+            raise errors[0]
+
+workers = None
+def get_band_workers():
+    global workers
+    #(the proxy server forks new processes, which must create their own threads)
+    if workers is None or workers.pid!=os.getpid():
+        workers = BandWorkers(THREADS-1)
+    return workers
+
 
 class CythonImageWrapper(ImageWrapper):
 
@@ -216,6 +289,244 @@ cdef inline unsigned char clamp(const long v) nogil:
         return <unsigned char> (v>>shift)
 
 
+#the conversion functions, each one processes the rows [start, end[
+#using the parameters of the current frame:
+DEF RGB_TO_YUV420P = 0
+DEF R210_TO_YUV420P = 1
+DEF YUV420P_TO_RGB = 2
+DEF GBRP_TO_RGB = 3
+
+cdef struct csc_params:
+    #input: packed pixels or planes
+    const unsigned char *input[3]
+    unsigned int input_stride[3]
+    #output: planes or packed pixels
+    unsigned char *output[3]
+    unsigned int output_stride[3]
+    unsigned int src_width
+    unsigned int src_height
+    unsigned int dst_width
+    unsigned int dst_height
+    #bytes per pixel and channel indexes:
+    uint8_t Bpp
+    uint8_t Rindex
+    uint8_t Gindex
+    uint8_t Bindex
+    uint8_t Xindex
+    #source plane indexes:
+    uint8_t Rsrc
+    uint8_t Gsrc
+    uint8_t Bsrc
+
+cdef void RGB_to_YUV420P_rows(const csc_params *p, unsigned int start, unsigned int end) nogil:
+    #copy to local variables (ensures C code will be optimized correctly)
+    cdef const unsigned char *input_image = p.input[0]
+    cdef unsigned int input_stride = p.input_stride[0]
+    cdef unsigned char *Y = p.output[0]
+    cdef unsigned char *U = p.output[1]
+    cdef unsigned char *V = p.output[2]
+    cdef unsigned int Ystride = p.output_stride[0]
+    cdef unsigned int Ustride = p.output_stride[1]
+    cdef unsigned int Vstride = p.output_stride[2]
+    cdef unsigned int src_width = p.src_width
+    cdef unsigned int src_height = p.src_height
+    cdef unsigned int dst_width = p.dst_width
+    cdef unsigned int dst_height = p.dst_height
+    cdef uint8_t Bpp = p.Bpp
+    cdef uint8_t Rindex = p.Rindex
+    cdef uint8_t Gindex = p.Gindex
+    cdef uint8_t Bindex = p.Bindex
+    cdef unsigned int x, y, o
+    cdef unsigned int sx, sy, ox, oy
+    cdef unsigned char R, G, B
+    cdef unsigned short Rsum, Gsum, Bsum
+    cdef unsigned char sum, dx, dy
+    #we process 4 pixels at a time:
+    cdef unsigned int workw = (dst_width+1)//2
+    for y in range(start, end):
+        for x in range(workw):
+            R = G = B = 0
+            Rsum = Gsum = Bsum = 0
+            sum = 0
+            for dy in range(2):
+                oy = y*2 + dy
+                if oy>=dst_height:
+                    break
+                sy = oy*src_height//dst_height
+                for dx in range(2):
+                    ox = x*2 + dx
+                    if ox>=dst_width:
+                        break
+                    sx = ox*src_width//dst_width
+                    o = sy*input_stride + sx*Bpp
+                    R = input_image[o + Rindex]
+                    G = input_image[o + Gindex]
+                    B = input_image[o + Bindex]
+                    o = oy*Ystride + ox
+                    Y[o] = clamp(YR * R + YG * G + YB * B + YC)
+                    sum += 1
+                    Rsum += R
+                    Gsum += G
+                    Bsum += B
+            #write 1U and 1V:
+            if sum>0:
+                Rsum /= sum
+                Gsum /= sum
+                Bsum /= sum
+                U[y*Ustride + x] = clamp(UR * Rsum + UG * Gsum + UB * Bsum + UC)
+                V[y*Vstride + x] = clamp(VR * Rsum + VG * Gsum + VB * Bsum + VC)
+
+cdef void r210_to_YUV420P_rows(const csc_params *p, unsigned int start, unsigned int end) nogil:
+    cdef const unsigned int *input_r210 = <const unsigned int*> p.input[0]
+    cdef unsigned int input_stride = p.input_stride[0]
+    cdef unsigned char *Y = p.output[0]
+    cdef unsigned char *U = p.output[1]
+    cdef unsigned char *V = p.output[2]
+    cdef unsigned int Ystride = p.output_stride[0]
+    cdef unsigned int Ustride = p.output_stride[1]
+    cdef unsigned int Vstride = p.output_stride[2]
+    cdef unsigned int src_width = p.src_width
+    cdef unsigned int src_height = p.src_height
+    cdef unsigned int dst_width = p.dst_width
+    cdef unsigned int dst_height = p.dst_height
+    cdef unsigned int x, y, o
+    cdef unsigned int sx, sy, ox, oy
+    cdef unsigned int r210
+    cdef unsigned char R, G, B
+    cdef unsigned short Rsum, Gsum, Bsum
+    cdef unsigned char sum, dx, dy
+    cdef unsigned int workw = (dst_width+1)//2
+    for y in range(start, end):
+        for x in range(workw):
+            R = G = B = 0
+            Rsum = Gsum = Bsum = 0
+            sum = 0
+            for dy in range(2):
+                oy = y*2 + dy
+                if oy>=dst_height:
+                    break
+                sy = oy*src_height//dst_height
+                for dx in range(2):
+                    ox = x*2 + dx
+                    if ox>=dst_width:
+                        break
+                    sx = ox*src_width//dst_width
+                    o = sy*input_stride + sx*4
+                    r210 = input_r210[o//4]
+                    B = (r210&0x3ff00000) >> 22
+                    G = (r210&0x000ffc00) >> 12
+                    R = (r210&0x000003ff) >> 2
+                    o = oy*Ystride + ox
+                    Y[o] = clamp(YR * R + YG * G + YB * B + YC)
+                    sum += 1
+                    Rsum += R
+                    Gsum += G
+                    Bsum += B
+            #write 1U and 1V:
+            if sum>0:
+                Rsum /= sum
+                Gsum /= sum
+                Bsum /= sum
+                U[y*Ustride + x] = clamp(UR * Rsum + UG * Gsum + UB * Bsum + UC)
+                V[y*Vstride + x] = clamp(VR * Rsum + VG * Gsum + VB * Bsum + VC)
+
+cdef void YUV420P_to_RGB_rows(const csc_params *p, unsigned int start, unsigned int end) nogil:
+    cdef const unsigned char *Ybuf = p.input[0]
+    cdef const unsigned char *Ubuf = p.input[1]
+    cdef const unsigned char *Vbuf = p.input[2]
+    cdef unsigned int Ystride = p.input_stride[0]
+    cdef unsigned int Ustride = p.input_stride[1]
+    cdef unsigned int Vstride = p.input_stride[2]
+    cdef unsigned char *output_image = p.output[0]
+    cdef unsigned int stride = p.output_stride[0]
+    cdef unsigned int src_width = p.src_width
+    cdef unsigned int src_height = p.src_height
+    cdef unsigned int dst_width = p.dst_width
+    cdef unsigned int dst_height = p.dst_height
+    cdef uint8_t Bpp = p.Bpp
+    cdef uint8_t Rindex = p.Rindex
+    cdef uint8_t Gindex = p.Gindex
+    cdef uint8_t Bindex = p.Bindex
+    cdef uint8_t Xindex = p.Xindex
+    cdef unsigned int x, y, o
+    cdef unsigned int sx, sy, ox, oy
+    cdef unsigned char dx, dy
+    cdef short Y, U, V
+    cdef unsigned int workw = (dst_width+1)//2
+    for y in range(start, end):
+        for x in range(workw):
+            #assert x*2<=src_width and y*2<=src_height
+            #read U and V for the next 4 pixels:
+            sx = x*src_width//dst_width
+            sy = y*src_height//dst_height
+            U = Ubuf[sy*Ustride + sx] - Uc
+            V = Vbuf[sy*Vstride + sx] - Vc
+            #now read up to 4 Y values and write an RGBX pixel for each:
+            for dy in range(2):
+                oy = y*2 + dy
+                if oy>=dst_height:
+                    break
+                sy = oy*src_height//dst_height
+                for dx in range(2):
+                    ox = x*2 + dx
+                    if ox>=dst_width:
+                        break
+                    sx = ox*src_width//dst_width
+                    Y = Ybuf[sy*Ystride + sx] - Yc
+                    o = oy*stride + ox * Bpp
+                    output_image[o + Rindex] = clamp(RY * Y + RU * U + RV * V)
+                    output_image[o + Gindex] = clamp(GY * Y + GU * U + GV * V)
+                    output_image[o + Bindex] = clamp(BY * Y + BU * U + BV * V)
+                    if Bpp==4:
+                        output_image[o + Xindex] = 255
+
+cdef void GBRP_to_RGB_rows(const csc_params *p, unsigned int start, unsigned int end) nogil:
+    cdef const unsigned char *Rbuf = p.input[p.Rsrc]
+    cdef const unsigned char *Gbuf = p.input[p.Gsrc]
+    cdef const unsigned char *Bbuf = p.input[p.Bsrc]
+    cdef unsigned int Rstride = p.input_stride[p.Rsrc]
+    cdef unsigned int Gstride = p.input_stride[p.Gsrc]
+    cdef unsigned int Bstride = p.input_stride[p.Bsrc]
+    cdef unsigned char *output_image = p.output[0]
+    cdef unsigned int stride = p.output_stride[0]
+    cdef unsigned int src_width = p.src_width
+    cdef unsigned int src_height = p.src_height
+    cdef unsigned int dst_width = p.dst_width
+    cdef unsigned int dst_height = p.dst_height
+    cdef uint8_t Rdst = p.Rindex
+    cdef uint8_t Gdst = p.Gindex
+    cdef uint8_t Bdst = p.Bindex
+    cdef uint8_t Xdst = p.Xindex
+    cdef unsigned int x, y, o
+    cdef unsigned int sx, sy
+    cdef const unsigned char *Rptr
+    cdef const unsigned char *Gptr
+    cdef const unsigned char *Bptr
+    for y in range(start, end):
+        o = stride*y
+        sy = y*src_height/dst_height
+        Rptr  = Rbuf + (sy * Rstride)
+        Gptr  = Gbuf + (sy * Gstride)
+        Bptr  = Bbuf + (sy * Bstride)
+        for x in range(dst_width):
+            sx = x*src_width/dst_width
+            output_image[o+Rdst] = Rptr[sx]
+            output_image[o+Gdst] = Gptr[sx]
+            output_image[o+Bdst] = Bptr[sx]
+            output_image[o+Xdst] = 255
+            o += 4
+
+cdef void convert_rows(const csc_params *p, int function, unsigned int start, unsigned int end) nogil:
+    if function==RGB_TO_YUV420P:
+        RGB_to_YUV420P_rows(p, start, end)
+    elif function==R210_TO_YUV420P:
+        r210_to_YUV420P_rows(p, start, end)
+    elif function==YUV420P_TO_RGB:
+        YUV420P_to_RGB_rows(p, start, end)
+    elif function==GBRP_TO_RGB:
+        GBRP_to_RGB_rows(p, start, end)
+
+
 cdef class ColorspaceConverter:
     cdef unsigned int src_width
     cdef unsigned int src_height
@@ -233,6 +544,9 @@ cdef class ColorspaceConverter:
     cdef double time
     cdef unsigned long buffer_size
 
+    cdef unsigned int threads
+    cdef csc_params params
+
     cdef object __weakref__
 
     def init_context(self, int src_width, int src_height, src_format,
@@ -250,6 +564,7 @@ cdef class ColorspaceConverter:
 
         self.time = 0
         self.frames = 0
+        self.threads = self.get_threads()
 
         #explicity clear all strides / sizes / offsets:
         for i in range(2):
@@ -259,17 +574,17 @@ cdef class ColorspaceConverter:
 
         if src_format in ("BGRX", "RGBX", "RGB", "BGR", "r210") and dst_format=="YUV420P":
             self.dst_strides[0] = roundup(self.dst_width,   STRIDE_ROUNDUP)
-            self.dst_strides[1] = roundup(self.dst_width/2, STRIDE_ROUNDUP)
-            self.dst_strides[2] = roundup(self.dst_width/2, STRIDE_ROUNDUP)
+            self.dst_strides[1] = roundup((self.dst_width+1)//2, STRIDE_ROUNDUP)
+            self.dst_strides[2] = roundup((self.dst_width+1)//2, STRIDE_ROUNDUP)
             self.dst_sizes[0] = self.dst_strides[0] * self.dst_height
-            self.dst_sizes[1] = self.dst_strides[1] * self.dst_height/2
-            self.dst_sizes[2] = self.dst_strides[2] * self.dst_height/2
+            self.dst_sizes[1] = self.dst_strides[1] * ((self.dst_height+1)//2)
+            self.dst_sizes[2] = self.dst_strides[2] * ((self.dst_height+1)//2)
             #U channel follows Y with 1 line padding, V follows U with another line of padding:
             self.offsets[0] = 0
             self.offsets[1] = self.dst_strides[0] * (self.dst_height+1)
-            self.offsets[2] = self.offsets[1] + (self.dst_strides[1] * (self.dst_height/2+1))
+            self.offsets[2] = self.offsets[1] + (self.dst_strides[1] * ((self.dst_height+1)//2+1))
             #output buffer ends after V + 1 line of padding:
-            self.buffer_size = self.offsets[2] + (self.dst_strides[2] * (self.dst_height/2+1))
+            self.buffer_size = self.offsets[2] + (self.dst_strides[2] * ((self.dst_height+1)//2+1))
             if src_format=="BGRX":
                 self.convert_image_function = self.BGRX_to_YUV420P
             elif src_format=="RGBX":
@@ -346,6 +661,8 @@ cdef class ColorspaceConverter:
             info["src_format"] = self.src_format
         if self.dst_format:
             info["dst_format"] = self.dst_format
+        if self.threads>1:
+            info["threads"] = self.threads
         if self.frames>0 and self.time>0:
             pps = float(self.src_width) * float(self.src_height) * float(self.frames) / self.time
             info["total_time_ms"] = int(self.time*1000.0)
@@ -381,9 +698,26 @@ cdef class ColorspaceConverter:
         return  "cython"
 
 
+    def get_threads(self):
+        return 1
+
     def convert_image(self, image):
         return self.convert_image_function(image)
 
+    def convert_rows(self, int function, unsigned int start, unsigned int end):
+        cdef const csc_params *p = &self.params
+        with nogil:
+            convert_rows(p, function, start, end)
+
+    cdef convert_bands(self, int function, unsigned int rows):
+        #split the rows into bands and convert them in parallel:
+        cdef unsigned int bands = min(self.threads, rows//MIN_BAND_ROWS)
+        if bands<=1:
+            self.convert_rows(function, 0, rows)
+            return
+        jobs = [(function, rows*i//bands, rows*(i+1)//bands) for i in range(bands)]
+        get_band_workers().process(self.convert_rows, jobs)
+
 
     def r210_to_YUV420P(self, image):
         return self.do_RGB_to_YUV420P(image, 4, 0, 0, 0)
@@ -403,17 +737,11 @@ cdef class ColorspaceConverter:
     cdef do_RGB_to_YUV420P(self, image, const uint8_t Bpp, const uint8_t Rindex, const uint8_t Gindex, const uint8_t Bindex):
         cdef Py_ssize_t pic_buf_len = 0
         cdef const unsigned char *input_image
-        cdef const unsigned int *input_r210
         cdef unsigned char *output_image
         cdef unsigned int input_stride
         cdef unsigned int x,y,o             #@DuplicatedSignature
-        cdef unsigned int sx, sy, ox, oy
-        cdef unsigned int workw, workh
+        cdef unsigned int workh
         cdef unsigned int Ystride, Ustride, Vstride
-        cdef unsigned unsigned int r210
-        cdef unsigned char R, G, B
-        cdef unsigned short Rsum, Gsum, Bsum
-        cdef unsigned char sum, i, dx, dy
         cdef unsigned char *Y
         cdef unsigned char *U
         cdef unsigned char *V
@@ -435,7 +763,6 @@ cdef class ColorspaceConverter:
         U = output_image + self.offsets[1]
         V = output_image + self.offsets[2]
 
-        #copy to local variables (ensures C code will be optimized correctly)
         Ystride = self.dst_strides[0]
         Ustride = self.dst_strides[1]
         Vstride = self.dst_strides[2]
@@ -444,81 +771,31 @@ cdef class ColorspaceConverter:
         cdef unsigned int dst_width = self.dst_width
         cdef unsigned int dst_height = self.dst_height
 
+        cdef csc_params *p = &self.params
+        p.input[0] = input_image
+        p.input_stride[0] = input_stride
+        p.output[0] = Y
+        p.output[1] = U
+        p.output[2] = V
+        p.output_stride[0] = Ystride
+        p.output_stride[1] = Ustride
+        p.output_stride[2] = Vstride
+        p.src_width = src_width
+        p.src_height = src_height
+        p.dst_width = dst_width
+        p.dst_height = dst_height
+        p.Bpp = Bpp
+        p.Rindex = Rindex
+        p.Gindex = Gindex
+        p.Bindex = Bindex
         #we process 4 pixels at a time:
-        workw = roundup(dst_width/2, 2)
-        workh = roundup(dst_height/2, 2)
-        #from now on, we can release the gil:
+        #one row of U and V for every pair of lines, including the last (odd) line:
+        workh = (dst_height+1)//2
         if self.src_format=="r210":
             assert Bpp==4
-            input_r210 = <unsigned int*> input_image
-            with nogil:
-                for y in range(workh):
-                    for x in range(workw):
-                        R = G = B = 0
-                        Rsum = Gsum = Bsum = 0
-                        sum = 0
-                        for dy in range(2):
-                            oy = y*2 + dy
-                            if oy>=dst_height:
-                                break
-                            sy = oy*src_height//dst_height
-                            for dx in range(2):
-                                ox = x*2 + dx
-                                if ox>=dst_width:
-                                    break
-                                sx = ox*src_width//dst_width
-                                o = sy*input_stride + sx*Bpp
-                                r210 = input_r210[o//4]
-                                B = (r210&0x3ff00000) >> 22
-                                G = (r210&0x000ffc00) >> 12
-                                R = (r210&0x000003ff) >> 2
-                                o = oy*Ystride + ox
-                                Y[o] = clamp(YR * R + YG * G + YB * B + YC)
-                                sum += 1
-                                Rsum += R
-                                Gsum += G
-                                Bsum += B
-                        #write 1U and 1V:
-                        if sum>0:
-                            Rsum /= sum
-                            Gsum /= sum
-                            Bsum /= sum
-                            U[y*Ustride + x] = clamp(UR * Rsum + UG * Gsum + UB * Bsum + UC)
-                            V[y*Vstride + x] = clamp(VR * Rsum + VG * Gsum + VB * Bsum + VC)
+            self.convert_bands(R210_TO_YUV420P, workh)
         else:
-            with nogil:
-                for y in range(workh):
-                    for x in range(workw):
-                        R = G = B = 0
-                        Rsum = Gsum = Bsum = 0
-                        sum = 0
-                        for dy in range(2):
-                            oy = y*2 + dy
-                            if oy>=dst_height:
-                                break
-                            sy = oy*src_height//dst_height
-                            for dx in range(2):
-                                ox = x*2 + dx
-                                if ox>=dst_width:
-                                    break
-                                sx = ox*src_width//dst_width
-                                o = sy*input_stride + sx*Bpp
-                                R = input_image[o + Rindex]
-                                G = input_image[o + Gindex]
-                                B = input_image[o + Bindex]
-                                o = oy*Ystride + ox
-                                Y[o] = clamp(YR * R + YG * G + YB * B + YC)
-                                sum += 1
-                                Rsum += R
-                                Gsum += G
-                                Bsum += B
-                        #write 1U and 1V:
-                        if sum>0:
-                            Rsum /= sum
-                            Gsum /= sum
-                            Bsum /= sum
-                            U[y*Ustride + x] = clamp(UR * Rsum + UG * Gsum + UB * Bsum + UC)
-                            V[y*Vstride + x] = clamp(VR * Rsum + VG * Gsum + VB * Bsum + VC)
+            self.convert_bands(RGB_TO_YUV420P, workh)
 
         if DEBUG_POINTS:
             for x,y in DEBUG_POINTS:
@@ -566,14 +843,11 @@ cdef class ColorspaceConverter:
         cdef Py_ssize_t buf_len = 0
         cdef unsigned char *output_image        #
         cdef unsigned int x,y,o                 #@DuplicatedSignature
-        cdef unsigned int sx, sy, ox, oy
-        cdef unsigned int workw, workh          #
+        cdef unsigned int workh                 #
         cdef unsigned int stride
         cdef unsigned char *Ybuf
         cdef unsigned char *Ubuf
         cdef unsigned char *Vbuf
-        cdef unsigned char dx, dy
-        cdef short Y, U, V
         cdef unsigned int Ystride, Ustride, Vstride      #
         cdef object rgb
 
@@ -607,37 +881,27 @@ cdef class ColorspaceConverter:
         #allocate output buffer:
         output_image = <unsigned char*> xmemalign(self.buffer_size)
 
+        cdef csc_params *p = &self.params
+        p.input[0] = Ybuf
+        p.input[1] = Ubuf
+        p.input[2] = Vbuf
+        p.input_stride[0] = Ystride
+        p.input_stride[1] = Ustride
+        p.input_stride[2] = Vstride
+        p.output[0] = output_image
+        p.output_stride[0] = stride
+        p.src_width = src_width
+        p.src_height = src_height
+        p.dst_width = dst_width
+        p.dst_height = dst_height
+        p.Bpp = Bpp
+        p.Rindex = Rindex
+        p.Gindex = Gindex
+        p.Bindex = Bindex
+        p.Xindex = Xindex
         #we process 4 pixels at a time:
-        workw = roundup(dst_width//2, 2)
-        workh = roundup(dst_height//2, 2)
-        #from now on, we can release the gil:
-        with nogil:
-            for y in range(workh):
-                for x in range(workw):
-                    #assert x*2<=src_width and y*2<=src_height
-                    #read U and V for the next 4 pixels:
-                    sx = x*src_width//dst_width
-                    sy = y*src_height//dst_height
-                    U = Ubuf[sy*Ustride + sx] - Uc
-                    V = Vbuf[sy*Vstride + sx] - Vc
-                    #now read up to 4 Y values and write an RGBX pixel for each:
-                    for dy in range(2):
-                        oy = y*2 + dy
-                        if oy>=dst_height:
-                            break
-                        sy = oy*src_height//dst_height
-                        for dx in range(2):
-                            ox = x*2 + dx
-                            if ox>=dst_width:
-                                break
-                            sx = ox*src_width//dst_width
-                            Y = Ybuf[sy*Ystride + sx] - Yc
-                            o = oy*stride + ox * Bpp
-                            output_image[o + Rindex] = clamp(RY * Y + RU * U + RV * V)
-                            output_image[o + Gindex] = clamp(GY * Y + GU * U + GV * V)
-                            output_image[o + Bindex] = clamp(BY * Y + BU * U + BV * V)
-                            if Bpp==4:
-                                output_image[o + Xindex] = 255
+        workh = (dst_height+1)//2
+        self.convert_bands(YUV420P_TO_RGB, workh)
         if DEBUG_POINTS:
             for x,y in DEBUG_POINTS:
                 o = min(y, dst_height)*stride + min(x, dst_width) * Bpp
@@ -673,16 +937,10 @@ cdef class ColorspaceConverter:
                                      const uint8_t Rdst, const uint8_t Gdst, const uint8_t Bdst, const uint8_t Xdst):
         cdef Py_ssize_t buf_len = 0             #
         cdef unsigned char *output_image        #@DuplicatedSignature
-        cdef unsigned int x,y,o                 #@DuplicatedSignature
-        cdef unsigned int sx, sy                #@DuplicatedSignature
         cdef unsigned int stride                #@DuplicatedSignature
         cdef unsigned char *Gbuf                #@DuplicatedSignature
-        cdef unsigned char *Gptr
         cdef unsigned char *Bbuf                #@DuplicatedSignature
-        cdef unsigned char *Bptr
         cdef unsigned char *Rbuf                #@DuplicatedSignature
-        cdef unsigned char *Rptr
-        cdef unsigned char sum
         cdef unsigned int Gstride, Bstride, Rstride
         cdef object rgb                         #@DuplicatedSignature
 
@@ -716,21 +974,27 @@ cdef class ColorspaceConverter:
         #allocate output buffer:
         output_image = <unsigned char*> xmemalign(self.buffer_size)
 
-        #from now on, we can release the gil:
-        with nogil:
-            for y in range(dst_height):
-                o = stride*y
-                sy = y*src_height/dst_height
-                Rptr  = Rbuf + (sy * Rstride)
-                Gptr  = Gbuf + (sy * Gstride)
-                Bptr  = Bbuf + (sy * Bstride)
-                for x in range(dst_width):
-                    sx = x*src_width/dst_width
-                    output_image[o+Rdst] = Rptr[sx]
-                    output_image[o+Gdst] = Gptr[sx]
-                    output_image[o+Bdst] = Bptr[sx]
-                    output_image[o+Xdst] = 255
-                    o += 4
+        cdef csc_params *p = &self.params
+        p.input[Rsrc] = Rbuf
+        p.input[Gsrc] = Gbuf
+        p.input[Bsrc] = Bbuf
+        p.input_stride[Rsrc] = Rstride
+        p.input_stride[Gsrc] = Gstride
+        p.input_stride[Bsrc] = Bstride
+        p.Rsrc = Rsrc
+        p.Gsrc = Gsrc
+        p.Bsrc = Bsrc
+        p.output[0] = output_image
+        p.output_stride[0] = stride
+        p.src_width = src_width
+        p.src_height = src_height
+        p.dst_width = dst_width
+        p.dst_height = dst_height
+        p.Rindex = Rdst
+        p.Gindex = Gdst
+        p.Bindex = Bdst
+        p.Xindex = Xdst
+        self.convert_bands(GBRP_TO_RGB, dst_height)
 
         rgb = memory_as_pybuffer(<void *> output_image, self.dst_sizes[0], True)
         elapsed = time.time()-start
@@ -742,6 +1006,20 @@ cdef class ColorspaceConverter:
         return out_image
 
 
+cdef class ThreadedColorspaceConverter(ColorspaceConverter):
+    """
+        Same as ColorspaceConverter, but large frames are split into bands of rows
+        which are converted in parallel without holding the GIL.
+    """
+
+    def get_threads(self):
+        return THREADS
+
+    def __repr__(self):
+        return "csc_cython_mt(%s %sx%s - %s %sx%s)" % (self.src_format, self.src_width, self.src_height,
+                                                    self.dst_format, self.dst_width, self.dst_height)
+
+
 def selftest(full=False):
     from xpra.codecs.codec_checks import testcsc
     from xpra.codecs.csc_cython import colorspace_converter
@@ -338,8 +338,15 @@ class VideoHelper(object):
             out_cscs = csc_module.get_output_colorspaces(in_csc)
             log("%s output colorspaces for %s: %s", csc_module.get_type(), in_csc, csv(out_cscs))
             for out_csc in out_cscs:
-                spec = csc_module.get_spec(in_csc, out_csc)
-                self.add_csc_spec(in_csc, out_csc, spec)
+                #some modules provide more than one spec for the same conversion:
+                #(ie: csc_cython has a threaded variant)
+                get_specs = getattr(csc_module, "get_specs", None)
+                if get_specs:
+                    specs = get_specs(in_csc, out_csc)
+                else:
+                    specs = [csc_module.get_spec(in_csc, out_csc)]
+                for spec in specs:
+                    self.add_csc_spec(in_csc, out_csc, spec)
 
     def add_csc_spec(self, in_csc, out_csc, spec):
         self._csc_encoder_specs.setdefault(in_csc, {}).setdefault(out_csc, []).append(spec)
@@ -1,13 +1,38 @@
 # This file is part of Xpra.
-# Copyright (C) 2012-2013 Antoine Martin <antoine@devloop.org.uk>
+# Copyright (C) 2012-2016 Antoine Martin <antoine@devloop.org.uk>
 # Xpra is released under the terms of the GNU GPL v2, or, at your option, any
 # later version. See the file COPYING for details.
 
+#!python
+#cython: boundscheck=False, wraparound=False
+
+from libc.stdint cimport uint8_t, uint64_t, uintptr_t
 
 cdef extern from "../../buffers/buffers.h":
     int    object_as_buffer(object obj, const void ** buffer, Py_ssize_t * buffer_len)
 
 
+cdef inline void xor_bytes(uint8_t *obuf, const uint8_t *cbuf, const uint8_t *xbuf, Py_ssize_t l) nogil:
+    cdef Py_ssize_t i = 0
+    cdef Py_ssize_t words
+    cdef uint64_t *obuf64
+    cdef const uint64_t *cbuf64
+    cdef const uint64_t *xbuf64
+    #xor 8 bytes at a time when all the buffers are aligned the same way:
+    if (<uintptr_t> obuf) % 8==0 and (<uintptr_t> cbuf) % 8==0 and (<uintptr_t> xbuf) % 8==0:
+        words = l//8
+        obuf64 = <uint64_t *> obuf
+        cbuf64 = <const uint64_t *> cbuf
+        xbuf64 = <const uint64_t *> xbuf
+        while i<words:
+            obuf64[i] = cbuf64[i] ^ xbuf64[i]
+            i += 1
+        i = words*8
+    while i<l:
+        obuf[i] = cbuf[i] ^ xbuf[i]
+        i += 1
+
+
 def xor_str(buf, xor):
     assert len(buf)==len(xor), "cyxor cannot xor strings of different lengths (%s:%s vs %s:%s)" % (type(buf), len(buf), type(xor), len(xor))
     cdef const unsigned char * cbuf                 #@DuplicatedSignature
@@ -22,7 +47,35 @@ def xor_str(buf, xor):
     cdef Py_ssize_t obuf_len = 0                    #@DuplicatedSignature
     assert object_as_buffer(out_bytes, <const void**> &obuf, &obuf_len)==0, "cannot get buffer pointer for %s: %s" % (type(obuf), obuf)
     assert obuf_len==cbuf_len
-    cdef int i                                      #@DuplicatedSignature
-    for 0 <= i < cbuf_len:
-        obuf[i] = cbuf[i] ^ xbuf[i]
+    with nogil:
+        xor_bytes(obuf, cbuf, xbuf, cbuf_len)
+    return out_bytes
+
+
+def xor_rows(buf, xor, unsigned int rowstride, rows):
+    """
+        Same as xor_str, but only xors the rows specified,
+        the other rows are known to be identical so they are left zeroed.
+    """
+    assert len(buf)==len(xor), "cyxor cannot xor strings of different lengths (%s:%s vs %s:%s)" % (type(buf), len(buf), type(xor), len(xor))
+    cdef const unsigned char * cbuf                 #@DuplicatedSignature
+    cdef Py_ssize_t cbuf_len = 0                    #@DuplicatedSignature
+    assert object_as_buffer(buf, <const void**> &cbuf, &cbuf_len)==0, "cannot get buffer pointer for %s: %s" % (type(buf), buf)
+    cdef const unsigned char * xbuf                 #@DuplicatedSignature
+    cdef Py_ssize_t xbuf_len = 0                    #@DuplicatedSignature
+    assert object_as_buffer(xor, <const void**> &xbuf, &xbuf_len)==0, "cannot get buffer pointer for %s: %s" % (type(xor), xor)
+    assert cbuf_len == xbuf_len, "python or cython bug? buffers don't have the same length?"
+    #bytearray is zero initialized:
+    out_bytes = bytearray(cbuf_len)
+    cdef unsigned char * obuf                 #@DuplicatedSignature
+    cdef Py_ssize_t obuf_len = 0                    #@DuplicatedSignature
+    assert object_as_buffer(out_bytes, <const void**> &obuf, &obuf_len)==0, "cannot get buffer pointer for %s: %s" % (type(obuf), obuf)
+    assert obuf_len==cbuf_len
+    cdef Py_ssize_t offset
+    cdef Py_ssize_t l
+    for row in rows:
+        offset = (<Py_ssize_t> row)*rowstride
+        assert 0<=offset<cbuf_len, "invalid row %s" % row
+        l = min(rowstride, cbuf_len-offset)
+        xor_bytes(obuf+offset, cbuf+offset, xbuf+offset, l)
     return out_bytes
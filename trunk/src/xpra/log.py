@@ -239,6 +239,7 @@ STRUCT_KNOWN_FILTERS = OrderedDict([
                 ("protocol"     , "Packet input and output (formatting, parsing, sending and receiving)"),
                 ("websocket"    , "Websocket layer"),
                 ("crypto"       , "Encryption"),
+                ("bandwidth"    , "Bandwidth estimation and pacing"),
                 ("auth"         , "Authentication"),
                 ])),
     ("Server", OrderedDict([
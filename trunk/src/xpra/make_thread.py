@@ -13,12 +13,12 @@ This is used by the pycallgraph test wrapper.
  as only our code will be affected)
 """
 
-def make_thread(target, name, daemon=False):
-    t = Thread(target=target, name=name)
+def make_thread(target, name, daemon=False, args=()):
+    t = Thread(target=target, name=name, args=args)
     t.daemon = daemon
     return t
 
-def start_thread(target, name, daemon=False):
-    t = make_thread(target, name, daemon)
+def start_thread(target, name, daemon=False, args=()):
+    t = make_thread(target, name, daemon, args)
     t.start()
     return t
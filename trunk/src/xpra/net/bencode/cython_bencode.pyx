@@ -27,9 +27,10 @@ if sys.version_info[0]>=3:
     BooleanType = bool
     import codecs
     def b(x):
-        if type(x)==bytes:
-            return x
-        return codecs.latin_1_encode(x)[0]
+        if type(x)==str:
+            return codecs.latin_1_encode(x)[0]
+        #bytes and buffers (ie: memoryview) are parsed in place:
+        return x
 else:
     from types import (StringType, UnicodeType, IntType, LongType, DictType, ListType,
                        TupleType, BooleanType)
@@ -20,6 +20,10 @@ from xpra.util import envint, envbool
 TCP_NODELAY = envbool("XPRA_TCP_NODELAY", True)
 VSOCK_TIMEOUT = envint("XPRA_VSOCK_TIMEOUT", 5)
 SOCKET_TIMEOUT = envint("XPRA_SOCKET_TIMEOUT", 10)
+#scatter/gather writes (python 3.3 or later only):
+WRITEV = envbool("XPRA_WRITEV", True)
+IOV_MAX = envint("XPRA_IOV_MAX", 64)
+READ_INTO = envbool("XPRA_READ_INTO", sys.version_info[0]>=3)
 
 
 #on some platforms (ie: OpenBSD), reading and writing from sockets
@@ -173,6 +177,20 @@ class Connection(object):
         #not implemented
         return None
 
+    def get_writev(self):
+        """
+            Returns a function which can write a list of buffers in one call
+            and returns the number of bytes written, or None if not supported.
+        """
+        return None
+
+    def get_read_into(self):
+        """
+            Returns a function which reads into the buffer given
+            and returns the number of bytes read, or None if not supported.
+        """
+        return None
+
     def _write(self, *args):
         """ wraps do_write with packet accounting """
         w = self.untilConcludes(*args)
@@ -187,6 +205,13 @@ class Connection(object):
         self.input_readcount += 1
         return r
 
+    def _read_into(self, *args):
+        """ wraps do_read_into with packet accounting """
+        r = self.untilConcludes(*args)
+        self.input_bytecount += r or 0
+        self.input_readcount += 1
+        return r
+
     def get_info(self):
         return {
                 "type"              : self.socktype or "",
@@ -238,6 +263,15 @@ class TwoFileConnection(Connection):
         self.may_abort("write")
         return self._write(self._oswrite, self._write_fd, buf)
 
+    def get_writev(self):
+        if not WRITEV or not hasattr(os, "writev") or self._oswrite!=OS_WRITE:
+            return None
+        return self.writev
+
+    def writev(self, buffers):
+        self.may_abort("write")
+        return self._write(os.writev, self._write_fd, buffers)
+
     def close(self):
         log("%s.close() close callback=%s, readable=%s, writeable=%s", self, self._close_cb, self._readable, self._writeable)
         Connection.close(self)
@@ -288,9 +322,26 @@ class SocketConnection(Connection):
     def read(self, n):
         return self._read(self._socket.recv, n)
 
+    def get_read_into(self):
+        if not READ_INTO or type(self._socket)!=socket.socket:
+            return None
+        return self.read_into
+
+    def read_into(self, buf):
+        return self._read_into(self._socket.recv_into, buf)
+
     def write(self, buf):
         return self._write(self._socket.send, buf)
 
+    def get_writev(self):
+        #ssl sockets do not support sendmsg:
+        if not WRITEV or type(self._socket)!=socket.socket or not hasattr(self._socket, "sendmsg"):
+            return None
+        return self.writev
+
+    def writev(self, buffers):
+        return self._write(self._socket.sendmsg, buffers)
+
     def close(self):
         s = self._socket
         try:
@@ -6,16 +6,32 @@
 # later version. See the file COPYING for details.
 
 import sys
+import time
 import zlib
+import threading
 
 from xpra.log import Logger
 log = Logger("network", "protocol")
-from xpra.net.header import LZ4_FLAG, ZLIB_FLAG, LZO_FLAG
+from xpra.net.header import LZ4_FLAG, ZLIB_FLAG, LZO_FLAG, ZSTD_FLAG
 from xpra.os_util import _memoryview
+from xpra.util import envint, envbool
 
 
 MAX_SIZE = 256*1024*1024
 
+#choose the compressor for each packet type based on the results we get:
+ADAPTIVE_COMPRESSION = envbool("XPRA_ADAPTIVE_COMPRESSION", True)
+#how many packets of each type we compress with each compressor before choosing one:
+COMPRESSION_SAMPLES = envint("XPRA_COMPRESSION_SAMPLES", 2)
+#re-evaluate one of the compressors every N packets of the same type:
+COMPRESSION_RESAMPLE = envint("XPRA_COMPRESSION_RESAMPLE", 64)
+#don't bother compressing if the data does not shrink below this percentage:
+COMPRESSION_MAX_RATIO = envint("XPRA_COMPRESSION_MAX_RATIO", 90)
+#link speed used for weighing the compression time against the bytes saved, in KB/s:
+COMPRESSION_LINK_SPEED = envint("XPRA_COMPRESSION_LINK_SPEED", 1024)
+#with a zstd dictionary, even small packets can be compressed efficiently:
+ZSTD_DICTIONARY_MIN_SIZE = envint("XPRA_ZSTD_DICTIONARY_MIN_SIZE", 64)
+
 
 python_lz4_version = None
 lz4_version = None
@@ -82,6 +98,65 @@ except Exception as e:
         raise Exception("lzo is not supported!")
 
 
+python_zstd_version = None
+zstd_version = None
+zstd_dictionary = None
+ZSTD_DICTIONARY_ID = 0
+try:
+    import zstandard                                #@UnresolvedImport
+    has_zstd = True
+    python_zstd_version = zstandard.__version__
+    zstd_version = ".".join(str(x) for x in zstandard.ZSTD_VERSION)
+    try:
+        from xpra.net.zstd_dictionary import get_dictionary_data
+        zstd_dictionary = zstandard.ZstdCompressionDict(get_dictionary_data())
+        ZSTD_DICTIONARY_ID = zstd_dictionary.dict_id()
+    except Exception as e:
+        log.warn("Warning: failed to load the zstd dictionary:")
+        log.warn(" %s", e)
+    #zstd compressor and decompressor objects must not be shared between threads:
+    zstd_local = threading.local()
+    def get_zstd_codec(name, key, make):
+        codecs = getattr(zstd_local, name, None)
+        if codecs is None:
+            codecs = {}
+            setattr(zstd_local, name, codecs)
+        codec = codecs.get(key)
+        if codec is None:
+            codec = make()
+            codecs[key] = codec
+        return codec
+
+    def zstd_compress(packet, level, dictionary=False):
+        dict_data = None
+        if dictionary:
+            dict_data = zstd_dictionary
+        def make_compressor():
+            return zstandard.ZstdCompressor(level=level, dict_data=dict_data, write_content_size=True)
+        compressor = get_zstd_codec("compressors", (level, dict_data is not None), make_compressor)
+        return level | ZSTD_FLAG, compressor.compress(packet)
+
+    def zstd_decompress(data):
+        params = zstandard.get_frame_parameters(data)
+        if params.content_size>MAX_SIZE:
+            raise Exception("uncompressed data is too large: %iMB, limit is %iMB" % (params.content_size//1024//1024, MAX_SIZE//1024//1024))
+        dict_id = params.dict_id
+        if dict_id and dict_id!=ZSTD_DICTIONARY_ID:
+            raise InvalidCompressionException("unknown zstd dictionary %#x" % dict_id)
+        def make_decompressor():
+            if dict_id:
+                return zstandard.ZstdDecompressor(dict_data=zstd_dictionary)
+            return zstandard.ZstdDecompressor()
+        decompressor = get_zstd_codec("decompressors", dict_id, make_decompressor)
+        return decompressor.decompress(data, max_output_size=MAX_SIZE)
+except Exception as e:
+    log("zstd not found: %s", e)
+    zstd_decompress = None
+    has_zstd = False
+    def zstd_compress(packet, level, dictionary=False):
+        raise Exception("zstd is not supported!")
+
+
 #stupid python version breakage:
 if sys.version > '3':
     def zcompress(packet, level):
@@ -103,18 +178,20 @@ else:
 use_zlib = True
 use_lzo = has_lzo
 use_lz4 = has_lz4
+use_zstd = has_zstd
 
 #all the compressors we know about, in best compatibility order:
-ALL_COMPRESSORS = ["zlib", "lz4", "lzo"]
+ALL_COMPRESSORS = ["zlib", "lz4", "lzo", "zstd"]
 
 #order for performance:
-PERFORMANCE_ORDER = ["lz4", "lzo", "zlib"]
+PERFORMANCE_ORDER = ["lz4", "zstd", "lzo", "zlib"]
 
 
 _COMPRESSORS = {
         "zlib"  : zcompress,
         "lz4"   : lz4_compress,
         "lzo"   : lzo_compress,
+        "zstd"  : zstd_compress,
         "none"  : nocompress,
                }
 
@@ -136,6 +213,16 @@ def get_compression_caps():
                               ""            : True,
                               "version"     : python_lz4_version,
                               }
+    _zstd = {""  : use_zstd}
+    if zstd_version:
+        _zstd["version"] = zstd_version
+    if ZSTD_DICTIONARY_ID:
+        _zstd["dictionary"] = ZSTD_DICTIONARY_ID
+    if python_zstd_version:
+        caps["python-zstandard"] = {
+                              ""            : True,
+                              "version"     : python_zstd_version,
+                              }
     _zlib = {
              ""             : use_zlib,
              "version"      : zlib.__version__
@@ -143,6 +230,7 @@ def get_compression_caps():
     caps.update({
                  "lz4"                   : _lz4,
                  "lzo"                   : _lzo,
+                 "zstd"                  : _zstd,
                  "zlib"                  : _zlib,
                  })
     return caps
@@ -151,6 +239,7 @@ def get_enabled_compressors(order=ALL_COMPRESSORS):
     enabled = [x for x,b in {
             "lz4"                   : use_lz4,
             "lzo"                   : use_lzo,
+            "zstd"                  : use_zstd,
             "zlib"                  : use_zlib,
             }.items() if b]
     #order them:
@@ -169,13 +258,189 @@ def get_compressor_name(c):
 
 
 def sanity_checks():
-    if not use_lzo and not use_lz4:
+    if not use_lzo and not use_lz4 and not use_zstd:
         if not use_zlib:
             log.warn("Warning: all the compressors are disabled,")
             log.warn(" unless you have a gigabit connection or better, performance will suffer")
         else:
             log.warn("Warning: zlib is the only compressor enabled")
-            log.warn(" install and enable lzo or lz4 support for better performance")
+            log.warn(" install and enable lz4, zstd or lzo support for better performance")
+
+
+class CompressorStats(object):
+    """ moving averages of the compression ratio and speed """
+
+    WEIGHT = 0.25
+
+    def __init__(self):
+        self.count = 0
+        self.ratio = 1.0            #compressed size / input size
+        self.time_per_byte = 0      #in seconds
+
+    def update(self, size, csize, elapsed):
+        ratio = float(csize)/max(1, size)
+        tpb = elapsed/max(1, size)
+        if self.count==0:
+            self.ratio = ratio
+            self.time_per_byte = tpb
+        elif self.count==1:
+            #the first call may include the cost of setting up the compressor,
+            #(ie: loading a zstd dictionary) so don't use it for the timing:
+            self.ratio = (self.ratio+ratio)/2.0
+            self.time_per_byte = tpb
+        else:
+            w = self.WEIGHT
+            self.ratio = self.ratio*(1-w) + ratio*w
+            self.time_per_byte = self.time_per_byte*(1-w) + tpb*w
+        self.count += 1
+
+    def get_cost(self, size):
+        """
+            The estimated cost of compressing 'size' bytes, expressed in bytes:
+            the compressed size plus the number of bytes we could have sent
+            in the time it takes to compress the data.
+            Returns None if this compressor is not worth using.
+        """
+        if self.ratio*100>COMPRESSION_MAX_RATIO:
+            return None
+        return self.ratio*size + self.time_per_byte*size*COMPRESSION_LINK_SPEED*1024
+
+    def get_info(self):
+        return {
+                "samples"   : self.count,
+                "ratio"     : int(self.ratio*100),
+                #KB/s:
+                "speed"     : int(1.0/max(self.time_per_byte, 0.000000001)/1024),
+                }
+
+
+class PacketCompressionStats(object):
+    """ tracks the compressors used for one packet type and the savings they made """
+
+    def __init__(self):
+        self.packets = 0
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.elapsed = 0
+        self.choice = None
+        self.resample_index = 0
+        self.compressors = {}
+
+    def select(self, compressors, size):
+        self.packets += 1
+        #make sure we have samples for each compressor:
+        for c in compressors:
+            cs = self.compressors.get(c)
+            if cs is None or cs.count<COMPRESSION_SAMPLES:
+                return c
+        if self.packets % COMPRESSION_RESAMPLE==0:
+            #the data may have changed, re-sample each compressor in turn:
+            self.resample_index = (self.resample_index+1) % len(compressors)
+            return compressors[self.resample_index]
+        best, best_cost = "none", size
+        for c in compressors:
+            cost = self.compressors[c].get_cost(size)
+            if cost is not None and cost<best_cost:
+                best, best_cost = c, cost
+        self.choice = best
+        return best
+
+    def record(self, compressor, size, csize, elapsed):
+        self.bytes_in += size
+        self.bytes_out += csize
+        self.elapsed += elapsed
+        if compressor!="none":
+            cs = self.compressors.get(compressor)
+            if cs is None:
+                cs = CompressorStats()
+                self.compressors[compressor] = cs
+            cs.update(size, csize, elapsed)
+
+    def get_info(self):
+        info = {
+                "packets"   : self.packets,
+                "bytes-in"  : self.bytes_in,
+                "bytes-out" : self.bytes_out,
+                "saved"     : self.bytes_in-self.bytes_out,
+                "time"      : int(self.elapsed*1000),
+                "choice"    : self.choice or "",
+                }
+        for c, cs in list(self.compressors.items()):
+            info[c] = cs.get_info()
+        return info
+
+
+class CompressionPolicy(object):
+    """
+        Chooses the compressor to use for each type of packet:
+        already compressed or random data should not be compressed again,
+        small repetitive control packets may compress better with one compressor
+        whereas larger structures may benefit from a faster one.
+        We sample the compression ratio and speed of each compressor
+        supported by both ends for each packet type
+        and pick the one with the lowest estimated cost.
+    """
+
+    def __init__(self):
+        self.default = "none"
+        self.compressors = []
+        self.zstd_dictionary = False
+        self.stats = {}
+
+    def set_compressors(self, default, compressors=()):
+        """
+            The default compressor is the one negotiated with the peer,
+            the other compressors must also be supported by the peer.
+        """
+        self.default = default
+        self.compressors = [x for x in compressors if x!="none"]
+        if default!="none" and default not in self.compressors:
+            self.compressors.insert(0, default)
+
+    def set_zstd_dictionary(self, dict_id):
+        """ only use the dictionary if the peer has the same one """
+        self.zstd_dictionary = bool(dict_id) and dict_id==ZSTD_DICTIONARY_ID
+
+    def get_min_compress_size(self, default_size):
+        if self.zstd_dictionary and ((ADAPTIVE_COMPRESSION and "zstd" in self.compressors) or self.default=="zstd"):
+            return min(default_size, ZSTD_DICTIONARY_MIN_SIZE)
+        return default_size
+
+    def _compress(self, compressor, data, level):
+        if compressor=="zstd":
+            return zstd_compress(data, level, self.zstd_dictionary)
+        return _COMPRESSORS[compressor](data, level)
+
+    def compress(self, packet_type, data, level):
+        compressors = self.compressors
+        if not ADAPTIVE_COMPRESSION or not compressors:
+            return self._compress(self.default, data, level)
+        size = len(data)
+        ps = self.stats.get(packet_type)
+        if ps is None:
+            ps = PacketCompressionStats()
+            self.stats[packet_type] = ps
+        c = ps.select(compressors, size)
+        start = time.time()
+        cl, cdata = self._compress(c, data, level)
+        ps.record(c, size, len(cdata), time.time()-start)
+        return cl, cdata
+
+    def get_info(self):
+        info = {
+                "adaptive"      : ADAPTIVE_COMPRESSION,
+                "default"       : self.default,
+                "compressors"   : self.compressors,
+                "zstd-dictionary" : self.zstd_dictionary,
+                "max-ratio"     : COMPRESSION_MAX_RATIO,
+                "link-speed"    : COMPRESSION_LINK_SPEED,
+                }
+        pinfo = {}
+        for packet_type, ps in list(self.stats.items()):
+            pinfo[packet_type] = ps.get_info()
+        if pinfo:
+            info["packet"] = pinfo
+        return info
 
 
 class Compressed(object):
@@ -216,7 +481,7 @@ class Compressible(LargeStructure):
         raise Exception("compress() not defined on %s" % self)
 
 
-def compressed_wrapper(datatype, data, level=5, zlib=False, lz4=False, lzo=False, can_inline=True):
+def compressed_wrapper(datatype, data, level=5, zlib=False, lz4=False, lzo=False, zstd=False, can_inline=True):
     if _memoryview and isinstance(data, _memoryview):
         data = data.tobytes()
     size = len(data)
@@ -230,6 +495,10 @@ def compressed_wrapper(datatype, data, level=5, zlib=False, lz4=False, lzo=False
         assert use_lzo, "cannot use lzo"
         algo = "lzo"
         cl, cdata = lzo_compress(data, level)
+    elif zstd:
+        assert use_zstd, "cannot use zstd"
+        algo = "zstd"
+        cl, cdata = zstd_compress(data, level)
     else:
         assert use_zlib, "cannot use zlib"
         algo = "zlib"
@@ -246,6 +515,8 @@ def get_compression_type(level):
         return "lz4"
     elif level & LZO_FLAG:
         return "lzo"
+    elif level & ZSTD_FLAG:
+        return "zstd"
     else:
         return "zlib"
 
@@ -271,6 +542,12 @@ def decompress(data, level):
         if not use_lzo:
             raise InvalidCompressionException("lzo is not enabled")
         return LZO_decompress(data)
+    elif level & ZSTD_FLAG:
+        if not has_zstd:
+            raise InvalidCompressionException("zstd is not available")
+        if not use_zstd:
+            raise InvalidCompressionException("zstd is not enabled")
+        return zstd_decompress(data)
     else:
         if not use_zlib:
             raise InvalidCompressionException("zlib is not enabled")
@@ -280,6 +557,7 @@ NAME_TO_FLAG = {
                 "lz4"   : LZ4_FLAG,
                 "zlib"  : 0,
                 "lzo"   : LZO_FLAG,
+                "zstd"  : ZSTD_FLAG,
                 }
 
 def decompress_by_name(data, algo):
@@ -5,6 +5,9 @@
 # later version. See the file COPYING for details.
 
 import os
+import struct
+from threading import Lock
+
 from xpra.util import envint, envbool
 from xpra.log import Logger
 log = Logger("network", "crypto")
@@ -31,6 +34,23 @@ PADDING_OPTIONS = [PREFERRED_PADDING]
 for x in ALL_PADDING_OPTIONS:
     if x not in PADDING_OPTIONS:
         PADDING_OPTIONS.append(x)
+#the cipher modes: "CBC" is what older versions use,
+#"GCM" is an AEAD mode: each chunk is authenticated and encrypted independently (no padding, no chaining)
+MODE_CBC = "CBC"
+MODE_GCM = "GCM"
+ALL_MODES = (MODE_CBC, MODE_GCM)
+DEFAULT_MODE = MODE_CBC
+PREFERRED_MODE = os.environ.get("XPRA_CRYPTO_PREFERRED_MODE", MODE_GCM)
+assert PREFERRED_MODE in ALL_MODES, "invalid preferred mode: %s" % PREFERRED_MODE
+#the modes supported by the backend, the preferred one first:
+MODES = []
+#AEAD: random nonce prefix + chunk counter, authentication tag:
+AEAD_NONCE_SIZE = 12
+AEAD_TAG_SIZE = 16
+AEAD_OVERHEAD = AEAD_NONCE_SIZE+AEAD_TAG_SIZE
+#with AEAD modes, the chunks larger than this are encrypted by a pool of worker threads:
+PARALLEL_ENCRYPT_SIZE = envint("XPRA_CRYPTO_PARALLEL_SIZE", 64*1024)
+CRYPTO_THREADS = envint("XPRA_CRYPTO_THREADS", 4)
 CRYPTO_LIBRARY = os.environ.get("XPRA_CRYPTO_BACKEND", "python-cryptography")    #pycrypto
 
 
@@ -62,6 +82,11 @@ def crypto_backend_init():
             #validate it:
             validate_backend(try_backend)
             ENCRYPTION_CIPHERS[:] = try_backend.ENCRYPTION_CIPHERS[:]
+            modes = [x for x in try_backend.MODES if x in ALL_MODES]
+            MODES[:] = sorted(modes, key=lambda x : x!=PREFERRED_MODE)
+            #the ciphers can also be specified with a mode, ie: "AES-GCM":
+            for cipher in try_backend.ENCRYPTION_CIPHERS:
+                ENCRYPTION_CIPHERS += ["%s-%s" % (cipher, mode) for mode in MODES]
             backend = try_backend
             break
         except ImportError as e:
@@ -80,7 +105,7 @@ def crypto_backend_init():
             log.error("Error: no encryption libraries could be loaded")
             for k,e in errors.items():
                 log.error(" %s is not available: %s", k, e)
-    log("crypto_backend_init() backend=%s, ENCRYPTION_CIPHERS=%s", backend, ENCRYPTION_CIPHERS)
+    log("crypto_backend_init() backend=%s, ENCRYPTION_CIPHERS=%s, MODES=%s", backend, ENCRYPTION_CIPHERS, MODES)
 
 def validate_backend(try_backend):
     import binascii
@@ -106,14 +131,22 @@ def validate_backend(try_backend):
     dv = dec.decrypt(ev)
     log("validate_backend(%s) decrypted(%s)=%s", try_backend, evs, dv)
     assert dv==message
+    if MODE_GCM in try_backend.MODES:
+        nonce = os.urandom(AEAD_NONCE_SIZE)
+        aead = try_backend.get_aead(key)
+        ev = aead.encrypt(nonce, message, b"header")
+        assert len(ev)==len(message)+AEAD_TAG_SIZE
+        dv = aead.decrypt(nonce, ev, b"header")
+        log("validate_backend(%s) %s decrypted(%s)=%s", try_backend, MODE_GCM, binascii.hexlify(strtobytes(ev)), dv)
+        assert dv==message
     log("validate_backend(%s) passed", try_backend)
 
 
 def pad(padding, size):
     if padding==PADDING_LEGACY:
-        return " "*size
+        return b" "*size
     elif padding==PADDING_PKCS7:
-        return chr(size)*size
+        return struct.pack("B", size)*size
     else:
         raise Exception("invalid padding: %s" % padding)
 
@@ -124,6 +157,20 @@ def choose_padding(options):
     raise Exception("cannot find a valid padding in %s" % str(options))
 
 
+def choose_mode(options):
+    for x in MODES:
+        if x in options:
+            return x
+    raise Exception("cannot find a valid cipher mode in %s" % str(options))
+
+def get_cipher_mode(ciphername):
+    """ splits a cipher name like "AES-GCM" into ("AES", "GCM"), the mode is None if unspecified """
+    parts = (ciphername or "").split("-", 1)
+    if len(parts)==2:
+        return parts[0], parts[1]
+    return parts[0], None
+
+
 def get_hex_uuid():
     from xpra.os_util import get_hex_uuid as ghu
     return ghu()
@@ -152,13 +199,14 @@ def get_iterations():
     return DEFAULT_ITERATIONS
 
 
-def new_cipher_caps(proto, cipher, encryption_key, padding_options):
+def new_cipher_caps(proto, cipher, encryption_key, padding_options, mode_options=(DEFAULT_MODE, )):
     assert backend
     iv = get_iv()
     key_salt = get_salt()
     iterations = get_iterations()
     padding = choose_padding(padding_options)
-    proto.set_cipher_in(cipher, iv, encryption_key, key_salt, iterations, padding)
+    mode = choose_mode(mode_options)
+    proto.set_cipher_in(cipher, iv, encryption_key, key_salt, iterations, padding, mode)
     return {
          "cipher"                       : cipher,
          "cipher.iv"                    : iv,
@@ -166,6 +214,8 @@ def new_cipher_caps(proto, cipher, encryption_key, padding_options):
          "cipher.key_stretch_iterations": iterations,
          "cipher.padding"               : padding,
          "cipher.padding.options"       : PADDING_OPTIONS,
+         "cipher.mode"                  : mode,
+         "cipher.mode.options"          : MODES,
          }
 
 def get_crypto_caps():
@@ -173,13 +223,14 @@ def get_crypto_caps():
         return {}
     caps = {
             "padding"       : {"options"    : PADDING_OPTIONS},
+            "mode"          : {"options"    : MODES},
             }
     caps.update(backend.get_info())
     return caps
 
 
-def get_encryptor(ciphername, iv, password, key_salt, iterations):
-    log("get_encryptor(%s, %s, %s, %s, %s)", ciphername, iv, password, key_salt, iterations)
+def get_encryptor(ciphername, iv, password, key_salt, iterations, mode=DEFAULT_MODE):
+    log("get_encryptor(%s, %s, %s, %s, %s, %s)", ciphername, iv, password, key_salt, iterations, mode)
     if not ciphername:
         return None, 0
     assert iterations>=100
@@ -187,10 +238,13 @@ def get_encryptor(ciphername, iv, password, key_salt, iterations):
     assert password and iv
     block_size = DEFAULT_BLOCKSIZE
     key = backend.get_key(password, key_salt, block_size, iterations)
+    if mode==MODE_GCM:
+        return AEADEncryptor(backend.get_aead(key)), block_size
+    assert mode==MODE_CBC, "invalid cipher mode: %s" % mode
     return backend.get_encryptor(key, iv), block_size
 
-def get_decryptor(ciphername, iv, password, key_salt, iterations):
-    log("get_decryptor(%s, %s, %s, %s, %s)", ciphername, iv, password, key_salt, iterations)
+def get_decryptor(ciphername, iv, password, key_salt, iterations, mode=DEFAULT_MODE):
+    log("get_decryptor(%s, %s, %s, %s, %s, %s)", ciphername, iv, password, key_salt, iterations, mode)
     if not ciphername:
         return None, 0
     assert iterations>=100
@@ -198,9 +252,84 @@ def get_decryptor(ciphername, iv, password, key_salt, iterations):
     assert password and iv
     block_size = DEFAULT_BLOCKSIZE
     key = backend.get_key(password, key_salt, block_size, iterations)
+    if mode==MODE_GCM:
+        return AEADDecryptor(backend.get_aead(key)), block_size
+    assert mode==MODE_CBC, "invalid cipher mode: %s" % mode
     return backend.get_decryptor(key, iv), block_size
 
 
+class AEADEncryptor(object):
+    """
+        Each chunk is encrypted independently using its own nonce,
+        so the chunks can be encrypted in any order and from multiple threads.
+        The nonce is made of a random prefix and a counter:
+        the key is unique to this connection and direction, so the nonces are never re-used.
+        The receiver expects the counter values in order, so the nonces must be allocated
+        in the order the chunks are written.
+    """
+    def __init__(self, aead):
+        self.aead = aead
+        self.nonce_prefix = os.urandom(AEAD_NONCE_SIZE-8)
+        self.counter = 0
+        self.lock = Lock()
+
+    def next_nonce(self):
+        with self.lock:
+            self.counter += 1
+            return self.nonce_prefix+struct.pack("!Q", self.counter)
+
+    def encrypt(self, nonce, data, aad):
+        """ returns the encrypted data followed by the authentication tag """
+        return self.aead.encrypt(nonce, data, aad)
+
+
+encrypt_pool = None
+encrypt_pool_lock = Lock()
+def get_encrypt_pool():
+    """
+        The worker threads shared by all the connections,
+        the encryption backends release the GIL so the chunks are encrypted in parallel.
+    """
+    global encrypt_pool
+    if CRYPTO_THREADS<=0:
+        return None
+    with encrypt_pool_lock:
+        if encrypt_pool is None:
+            from multiprocessing.pool import ThreadPool
+            encrypt_pool = ThreadPool(CRYPTO_THREADS)
+            import atexit
+            atexit.register(encrypt_pool.terminate)
+            log("get_encrypt_pool() created %s with %i threads", encrypt_pool, CRYPTO_THREADS)
+    return encrypt_pool
+
+
+class AEADDecryptor(object):
+    """
+        The chunks must all use the same nonce prefix and consecutive counter values,
+        so they cannot be replayed, dropped or re-ordered.
+    """
+    def __init__(self, aead):
+        self.aead = aead
+        self.nonce_prefix = None
+        self.counter = 0
+
+    def decrypt(self, nonce, data, aad):
+        """ raises an exception if the data fails authentication """
+        if len(nonce)!=AEAD_NONCE_SIZE:
+            raise Exception("invalid nonce size: %i" % len(nonce))
+        prefix = nonce[:AEAD_NONCE_SIZE-8]
+        counter = struct.unpack("!Q", nonce[AEAD_NONCE_SIZE-8:])[0]
+        if self.nonce_prefix is not None and prefix!=self.nonce_prefix:
+            raise Exception("invalid nonce prefix")
+        if counter!=self.counter+1:
+            raise Exception("expected nonce counter %i but got %i" % (self.counter+1, counter))
+        v = self.aead.decrypt(nonce, data, aad)
+        #only advance once the chunk has been authenticated:
+        self.nonce_prefix = prefix
+        self.counter = counter
+        return v
+
+
 def main():
     from xpra.util import print_nested_dict
     crypto_backend_init()
@@ -22,6 +22,10 @@ DELETE_PRINTER_FILE = envbool("XPRA_DELETE_PRINTER_FILE", True)
 FILE_CHUNKS_SIZE = max(0, envint("XPRA_FILE_CHUNKS_SIZE", 65536))
 MAX_CONCURRENT_FILES = max(1, envint("XPRA_MAX_CONCURRENT_FILES", 10))
 CHUNK_TIMEOUT = 10*1000
+#how many chunks we can send without waiting for their ack (streaming mode only):
+FILE_CHUNKS_WINDOW = max(1, envint("XPRA_FILE_CHUNKS_WINDOW", 8))
+#how long we keep the partial transfers we can resume after a reconnection (in seconds):
+RESUME_TIMEOUT = max(0, envint("XPRA_FILE_RESUME_TIMEOUT", 10*60))
 
 MIMETYPE_EXTS = {
                  "application/postscript"   : "ps",
@@ -59,6 +63,152 @@ def safe_open_download_file(basefilename, mimetype):
     return filename, fd
 
 
+def get_binary_flags():
+    try:
+        return os.O_BINARY                  #@UndefinedVariable (win32 only)
+    except:
+        return 0
+
+try:
+    from os import pread
+except ImportError:
+    #python2 and win32:
+    def pread(fd, size, offset):
+        os.lseek(fd, offset, os.SEEK_SET)
+        return os.read(fd, size)
+
+def read_file_chunk(fd, offset, size):
+    data = b""
+    while len(data)<size:
+        buf = pread(fd, size-len(data), offset+len(data))
+        if not buf:
+            break
+        data += buf
+    return data
+
+def get_file_id(filename, stat):
+    """
+        A stable identifier for the contents of this file,
+        so the receiver can recognize a file it has already started to receive
+        even if the transfer is restarted by a new process.
+    """
+    u = hashlib.sha1()
+    for x in (filename, stat.st_size, int(stat.st_mtime)):
+        u.update(str(x).encode("utf8"))
+    return u.hexdigest()
+
+
+#the partial downloads we can resume, indexed by (scope, remote uuid, file-id):
+suspended_downloads = {}
+#the uploads we were streaming when the connection was lost, indexed by (scope, remote uuid):
+suspended_uploads = {}
+
+def expire_suspended_transfers(now=None):
+    now = now or time.time()
+    for key, state in list(suspended_downloads.items()):
+        if now-state.suspended>RESUME_TIMEOUT:
+            filelog("removing partial download '%s'", state.filename)
+            del suspended_downloads[key]
+            try:
+                os.unlink(state.filename)
+            except OSError as e:
+                filelog("failed to remove partial download '%s': %s", state.filename, e)
+    for key, uploads in list(suspended_uploads.items()):
+        uploads = [x for x in uploads if now-x[0]<=RESUME_TIMEOUT]
+        if uploads:
+            suspended_uploads[key] = uploads
+        else:
+            del suspended_uploads[key]
+
+
+class ReceiveFileState(object):
+    """ a file we are receiving in chunks, written to disk as they arrive """
+    def __init__(self, chunk_id, fd, filename, basefilename, mimetype, printit, openit, filesize, options):
+        self.start = time.time()
+        self.chunk_id = chunk_id
+        self.fd = fd
+        self.filename = filename
+        self.basefilename = basefilename
+        self.mimetype = mimetype
+        self.printit = printit
+        self.openit = openit
+        self.filesize = filesize
+        self.options = options
+        self.digest = hashlib.sha1()
+        self.written = 0
+        self.timer = 0
+        self.chunk = 0
+        self.suspended = 0
+
+    def close(self):
+        fd = self.fd
+        if fd is not None:
+            self.fd = None
+            try:
+                os.close(fd)
+            except OSError as e:
+                filelog("error closing file descriptor %s: %s", fd, e)
+
+    def is_resumable(self):
+        return self.options.boolget("file-stream") and bool(self.options.strget("file-id"))
+
+
+class SendFileState(object):
+    """
+        A file we are sending in chunks,
+        either from a buffer in memory or read from disk one chunk at a time.
+    """
+    def __init__(self, filename, mimetype, printit, openit, filesize, options, data=None, fd=None, file_id=None):
+        self.start = time.time()
+        self.chunk_id = None
+        self.filename = filename
+        self.mimetype = mimetype
+        self.printit = printit
+        self.openit = openit
+        self.filesize = filesize
+        self.options = options      #the options given by the caller
+        self.data = data
+        self.fd = fd
+        self.file_id = file_id
+        self.chunk_size = 0
+        self.window = 1
+        self.stream = False
+        #for the streaming mode, the digest is calculated as we send the data:
+        self.digest = None
+        self.hashed = 0
+        #the position of the next chunk to send:
+        self.offset = 0
+        self.sent = 0
+        self.acked = 0
+        self.timer = 0
+
+    def read(self, offset, size):
+        if self.data is not None:
+            return self.data[offset:offset+size]
+        return read_file_chunk(self.fd, offset, size)
+
+    def update_digest(self, offset, data):
+        #catch up with the data the receiver already has, if any:
+        while self.hashed<offset:
+            buf = self.read(self.hashed, min(offset-self.hashed, max(self.chunk_size, FILE_CHUNKS_SIZE)))
+            if not buf:
+                raise Exception("file '%s' is truncated" % self.filename)
+            self.digest.update(buf)
+            self.hashed += len(buf)
+        self.digest.update(data)
+        self.hashed += len(data)
+
+    def close(self):
+        self.data = None
+        fd = self.fd
+        if fd is not None:
+            self.fd = None
+            try:
+                os.close(fd)
+            except OSError as e:
+                filelog("error closing file descriptor %s: %s", fd, e)
+
+
 class FileTransferAttributes(object):
     def __init__(self, opts=None):
         if opts:
@@ -85,6 +235,7 @@ class FileTransferAttributes(object):
                 "file-transfer"     : self.file_transfer,
                 "file-size-limit"   : self.file_size_limit,
                 "file-chunks"       : self.file_chunks,
+                "file-stream"       : True,
                 "open-files"        : self.open_files,
                 "printing"          : self.printing,
                 }
@@ -95,6 +246,8 @@ class FileTransferAttributes(object):
         return {
                 "enabled"           : self.file_transfer,
                 "size-limit"        : self.file_size_limit,
+                "chunks"            : self.file_chunks,
+                "chunks-window"     : FILE_CHUNKS_WINDOW,
                 "open"              : self.open_files,
                 }
 
@@ -112,9 +265,11 @@ class FileTransferHandler(FileTransferAttributes):
         self.remote_open_files = False
         self.remote_file_size_limit = 0
         self.remote_file_chunks = 0
+        self.remote_file_stream = False
+        self.remote_file_uuid = ""
+        self.remote_file_scope = ""
         self.send_chunks_in_progress = {}
         self.receive_chunks_in_progress = {}
-        self.file_descriptors = set()
         if not getattr(self, "timeout_add", None):
             from xpra.gtk_common.gobject_compat import import_glib
             glib = import_glib()
@@ -123,19 +278,58 @@ class FileTransferHandler(FileTransferAttributes):
             self.source_remove = glib.source_remove
 
     def cleanup(self):
-        for x in list(self.file_descriptors):
-            try:
-                x.close()
-            except:
-                pass
+        #keep what we need to resume the streaming transfers if the remote end reconnects:
+        now = time.time()
+        for state in list(self.receive_chunks_in_progress.values()):
+            self._cancel_timer(state)
+            state.close()
+            if self.remote_file_uuid and state.is_resumable() and RESUME_TIMEOUT>0:
+                filelog("suspending download of '%s' at %i bytes", state.filename, state.written)
+                state.suspended = now
+                suspended_downloads[(self.remote_file_scope, self.remote_file_uuid, state.options.strget("file-id"))] = state
+        for state in list(self.send_chunks_in_progress.values()):
+            self._cancel_timer(state)
+            resumable = state.stream and state.fd is not None
+            state.close()
+            if self.remote_file_uuid and resumable and RESUME_TIMEOUT>0:
+                filelog("suspending upload of '%s' at %i bytes", state.filename, state.offset)
+                upload = (now, state.filename, state.mimetype, state.printit, state.openit, state.options)
+                suspended_uploads.setdefault((self.remote_file_scope, self.remote_file_uuid), []).append(upload)
         self.init_attributes()
 
+    def _cancel_timer(self, state):
+        timer = state.timer
+        if timer:
+            state.timer = 0
+            self.source_remove(timer)
+
+    def get_file_transfer_scope(self):
+        """
+            The uuid is supplied by the remote end,
+            so the transfers can only be resumed within the same scope:
+            the authenticated user or the server we are connected to.
+        """
+        return ""
+
     def parse_file_transfer_caps(self, c):
         self.remote_file_transfer = c.boolget("file-transfer")
         self.remote_printing = c.boolget("printing")
         self.remote_open_files = c.boolget("open-files")
         self.remote_file_size_limit = c.intget("file-size-limit")
         self.remote_file_chunks = max(0, min(self.remote_file_size_limit*1024*1024, c.intget("file-chunks")))
+        self.remote_file_stream = c.boolget("file-stream")
+        self.remote_file_uuid = c.strget("uuid")
+        self.remote_file_scope = self.get_file_transfer_scope()
+        expire_suspended_transfers()
+        if self.remote_file_stream and (self.remote_file_scope, self.remote_file_uuid) in suspended_uploads:
+            #once the connection is fully established:
+            self.idle_add(self._resume_uploads)
+
+    def _resume_uploads(self):
+        uploads = suspended_uploads.pop((self.remote_file_scope, self.remote_file_uuid), [])
+        for _, filename, mimetype, printit, openit, options in uploads:
+            filelog.info("resuming the transfer of '%s'", filename)
+            self.send_file_from_path(filename, mimetype, printit, openit, options)
 
     def get_info(self):
         info = FileTransferAttributes.get_info(self)
@@ -143,9 +337,12 @@ class FileTransferHandler(FileTransferAttributes):
                           "file-transfer"   : self.remote_file_transfer,
                           "file-size-limit" : self.remote_file_size_limit,
                           "file-chunks"     : self.remote_file_chunks,
+                          "file-stream"     : self.remote_file_stream,
                           "open-files"      : self.remote_open_files,
                           "printing"        : self.remote_printing,
                           }
+        info["sending"] = len(self.send_chunks_in_progress)
+        info["receiving"] = len(self.receive_chunks_in_progress)
         return info
 
     def check_digest(self, filename, digest, expected_digest, algo="sha1"):
@@ -157,14 +354,20 @@ class FileTransferHandler(FileTransferAttributes):
             filelog("%s digest matches: %s", algo, digest)
 
 
+    def _cancel_receiving(self, state, message):
+        self.send("ack-file-chunk", state.chunk_id, False, message, state.chunk)
+        self.receive_chunks_in_progress.pop(state.chunk_id, None)
+        self._cancel_timer(state)
+        state.close()
+
     def _check_chunk_receiving(self, chunk_id, chunk_no):
         chunk_state = self.receive_chunks_in_progress.get(chunk_id)
         filelog("_check_chunk_receiving(%s, %s) chunk_state=%s", chunk_id, chunk_no, chunk_state)
         if chunk_state:
-            chunk_state[-2] = 0     #this timer has been used
-            if chunk_state[-1]==0:
+            chunk_state.timer = 0   #this timer has been used
+            if chunk_state.chunk==chunk_no:
                 filelog.error("Error: chunked file transfer timed out")
-                del self.receive_chunks_in_progress[chunk_id]
+                self._cancel_receiving(chunk_state, "timeout")
 
     def _process_send_file_chunk(self, packet):
         chunk_id, chunk, file_data, has_more = packet[1:5]
@@ -174,55 +377,85 @@ class FileTransferHandler(FileTransferAttributes):
             filelog.error("Error: cannot find the file transfer id '%s'", nonl(chunk_id))
             self.send("ack-file-chunk", chunk_id, False, "file transfer id not found", chunk)
             return
-        fd = chunk_state[1]
-        if chunk_state[-1]+1!=chunk:
-            filelog.error("Error: chunk number mismatch, expected %i but got %i", chunk_state[-1]+1, chunk)
-            self.send("ack-file-chunk", chunk_id, False, "chunk number mismatch", chunk)
-            del self.receive_chunks_in_progress[chunk_id]
-            os.close(fd)
+        if chunk_state.chunk+1!=chunk:
+            filelog.error("Error: chunk number mismatch, expected %i but got %i", chunk_state.chunk+1, chunk)
+            self._cancel_receiving(chunk_state, "chunk number mismatch")
             return
         #update chunk number:
-        chunk_state[-1] = chunk
-        digest = chunk_state[8]
-        written = chunk_state[9]
+        chunk_state.chunk = chunk
         try:
-            os.write(fd, file_data)
-            digest.update(file_data)
-            written += len(file_data)
-            chunk_state[9] = written
+            os.write(chunk_state.fd, file_data)
+            chunk_state.digest.update(file_data)
+            chunk_state.written += len(file_data)
         except OSError as e:
             filelog.error("Error: cannot write file chunk")
             filelog.error(" %s", e)
-            self.send("ack-file-chunk", chunk_id, False, "write error: %s" % e, chunk)
-            del self.receive_chunks_in_progress[chunk_id]
-            try:
-                os.close(fd)
-            except:
-                pass
+            self._cancel_receiving(chunk_state, "write error: %s" % e)
             return
         self.send("ack-file-chunk", chunk_id, True, "", chunk)
+        self._cancel_timer(chunk_state)
         if has_more:
-            timer = chunk_state[-2]
-            if timer:
-                self.source_remove(timer)
             #remote end will send more after receiving the ack
-            timer = self.timeout_add(CHUNK_TIMEOUT, self._check_chunk_receiving, chunk_id, chunk)
-            chunk_state[-2] = timer
+            chunk_state.timer = self.timeout_add(CHUNK_TIMEOUT, self._check_chunk_receiving, chunk_id, chunk)
             return
         del self.receive_chunks_in_progress[chunk_id]
-        os.close(fd)
+        chunk_state.close()
         #check file size and digest then process it:
-        filename, mimetype, printit, openit, filesize, options = chunk_state[2:8]
-        if written!=filesize:
-            filelog.error("Error: expected a file of %i bytes, got %i", filesize, written)
+        filename = chunk_state.filename
+        filesize = chunk_state.filesize
+        options = chunk_state.options
+        if chunk_state.written!=filesize:
+            filelog.error("Error: expected a file of %i bytes, got %i", filesize, chunk_state.written)
             return
-        expected_digest = options.get("sha1")
+        #in streaming mode, the digest is only known once all the data has been sent:
+        extra = typedict(packet[5] if len(packet)>5 else {})
+        expected_digest = extra.strget("sha1") or options.strget("sha1")
         if expected_digest:
-            self.check_digest(filename, digest.hexdigest(), expected_digest)
-        start_time = chunk_state[0]
-        elapsed = time.time()-start_time
+            self.check_digest(filename, chunk_state.digest.hexdigest(), expected_digest)
+        elapsed = time.time()-chunk_state.start
         filelog("%i bytes received in %i chunks, took %ims", filesize, chunk, elapsed*1000)
-        self.do_process_downloaded_file(filename, mimetype, printit, openit, filesize, options)
+        self.do_process_downloaded_file(filename, chunk_state.mimetype, chunk_state.printit, chunk_state.openit, filesize, options)
+
+    def _resume_download(self, chunk_id, basefilename, mimetype, printit, openit, filesize, options):
+        """ finds the partial download of this file, if we have one we can append to """
+        file_id = options.strget("file-id")
+        if not file_id or not self.remote_file_uuid:
+            return None
+        expire_suspended_transfers()
+        state = suspended_downloads.pop((self.remote_file_scope, self.remote_file_uuid, file_id), None)
+        if not state:
+            return None
+        if state.basefilename!=basefilename or state.filesize!=filesize or state.written>=filesize:
+            filelog("partial download does not match: %s", (state.basefilename, state.filesize))
+            return None
+        try:
+            fd = os.open(state.filename, os.O_RDWR | get_binary_flags())
+        except OSError as e:
+            filelog("cannot resume the download of '%s': %s", state.filename, e)
+            return None
+        try:
+            if os.fstat(fd).st_size<state.written:
+                filelog("partial download '%s' has been truncated", state.filename)
+                os.close(fd)
+                return None
+            #discard anything we have written but not acknowledged:
+            os.ftruncate(fd, state.written)
+            os.lseek(fd, state.written, os.SEEK_SET)
+        except OSError as e:
+            filelog("cannot resume the download of '%s': %s", state.filename, e)
+            os.close(fd)
+            return None
+        filelog.info("resuming the download of '%s' at %s", state.filename, std_unit(state.written, unit=1024))
+        state.fd = fd
+        state.chunk_id = chunk_id
+        state.chunk = 0
+        #what to do with the file is decided by this request:
+        state.mimetype = mimetype
+        state.printit = printit
+        state.openit = openit
+        state.options = options
+        state.suspended = 0
+        return state
 
     def _process_send_file(self, packet):
         #the remote end is sending us a file
@@ -240,20 +473,24 @@ class FileTransferHandler(FileTransferAttributes):
             l.error("Error: file '%s' is too large:", basefilename)
             l.error(" %iMB, the file size limit is %iMB", filesize//1024//1024, self.file_size_limit)
             return
-        filename, fd = safe_open_download_file(basefilename, mimetype)
-        self.file_descriptors.add(fd)
-        chunk_id = options.get("file-chunk-id")
+        chunk_id = options.strget("file-chunk-id")
         if chunk_id:
             if len(self.receive_chunks_in_progress)>=MAX_CONCURRENT_FILES:
                 self.send("ack-file-chunk", chunk_id, False, "too many file transfers in progress", 0)
-                os.close(fd)
                 return
-            digest = hashlib.sha1()
-            chunk = 0
-            timer = self.timeout_add(CHUNK_TIMEOUT, self._check_chunk_receiving, chunk_id, chunk)
-            chunk_state = [time.time(), fd, filename, mimetype, printit, openit, filesize, options, digest, 0, timer, chunk]
+            chunk_state = None
+            if options.boolget("file-stream"):
+                chunk_state = self._resume_download(chunk_id, basefilename, mimetype, printit, openit, filesize, options)
+            if not chunk_state:
+                filename, fd = safe_open_download_file(basefilename, mimetype)
+                chunk_state = ReceiveFileState(chunk_id, fd, filename, basefilename, mimetype, printit, openit, filesize, options)
+            chunk_state.timer = self.timeout_add(CHUNK_TIMEOUT, self._check_chunk_receiving, chunk_id, 0)
             self.receive_chunks_in_progress[chunk_id] = chunk_state
-            self.send("ack-file-chunk", chunk_id, True, "", chunk)
+            if options.boolget("file-stream"):
+                #tell the sender where to start from:
+                self.send("ack-file-chunk", chunk_id, True, "", 0, chunk_state.written)
+            else:
+                self.send("ack-file-chunk", chunk_id, True, "", 0)
             return
         #not chunked, full file:
         assert file_data, "no data!"
@@ -271,6 +508,7 @@ class FileTransferHandler(FileTransferAttributes):
                 self.check_digest(basefilename, u.hexdigest(), digest, algo)
         check_digest("sha1", hashlib.sha1)
         check_digest("md5", hashlib.md5)
+        filename, fd = safe_open_download_file(basefilename, mimetype)
         try:
             os.write(fd, file_data)
         finally:
@@ -359,6 +597,39 @@ class FileTransferHandler(FileTransferAttributes):
 
 
     def send_file(self, filename, mimetype, data, filesize=0, printit=False, openit=False, options={}):
+        assert len(data)>=filesize, "data is smaller then the given file size!"
+        data = data[:filesize]          #gio may null terminate it
+        state = SendFileState(filename, mimetype, printit, openit, filesize, options, data=data)
+        return self.do_send_file(state)
+
+    def send_file_from_path(self, filename, mimetype="", printit=False, openit=False, options={}):
+        """
+            Sends the file without loading it in memory:
+            the chunks are read from disk as they are needed.
+        """
+        absfile = os.path.abspath(os.path.expanduser(filename))
+        try:
+            fd = os.open(absfile, os.O_RDONLY | get_binary_flags())
+        except OSError as e:
+            filelog.error("Error: cannot read file '%s'", filename)
+            filelog.error(" %s", e)
+            return False
+        try:
+            stat = os.fstat(fd)
+        except OSError as e:
+            filelog.error("Error: cannot read file '%s'", filename)
+            filelog.error(" %s", e)
+            os.close(fd)
+            return False
+        state = SendFileState(absfile, mimetype, printit, openit, stat.st_size, options, fd=fd, file_id=get_file_id(absfile, stat))
+        try:
+            return self.do_send_file(state)
+        finally:
+            if state.chunk_id not in self.send_chunks_in_progress:
+                state.close()
+
+    def do_send_file(self, state):
+        filename, filesize, printit = state.filename, state.filesize, state.printit
         if printit:
             if not self.printing:
                 printlog.warn("Warning: printing is not enabled for %s", self)
@@ -377,88 +648,148 @@ class FileTransferHandler(FileTransferAttributes):
                 return False
             action = "upload"
             l = filelog
+        openit = state.openit
         if not printit and openit and not self.remote_open_files:
             l.warn("Warning: opening the file after transfer is disabled on the remote end")
             openit = False
-        assert len(data)>=filesize, "data is smaller then the given file size!"
-        data = data[:filesize]          #gio may null terminate it
-        l("send_file%s", (filename, mimetype, type(data), "%i bytes" % filesize, printit, openit, options))
+        l("send_file%s", (filename, state.mimetype, type(state.data), "%i bytes" % filesize, printit, openit, state.options))
         absfile = os.path.abspath(filename)
         basefilename = os.path.basename(filename)
         def sizewarn(location, limit):
             filelog.warn("Warning: cannot %s the file '%s'", action, basefilename)
             filelog.warn(" this file is too large: %sB", std_unit(filesize, unit=1024))
             filelog.warn(" the %s file size limit is %iMB", location, limit)
-        if filesize>self.file_size_limit*1024*1024:
+        chunk_size = min(self.file_chunks, self.remote_file_chunks)
+        chunked = chunk_size>0 and filesize>chunk_size
+        stream = chunked and self.remote_file_stream
+        #when streaming from disk, the local limit does not apply since we never hold the whole file:
+        if not (stream and state.fd is not None) and filesize>self.file_size_limit*1024*1024:
             sizewarn("local", self.file_size_limit)
             return False
         if filesize>self.remote_file_size_limit*1024*1024:
             sizewarn("remote", self.remote_file_size_limit)
             return False
-        u = hashlib.sha1()
-        u.update(data)
-        filelog("sha1 digest(%s)=%s", absfile, u.hexdigest())
-        options["sha1"] = u.hexdigest()
-        chunk_size = min(self.file_chunks, self.remote_file_chunks)
-        if chunk_size>0 and filesize>chunk_size:
+        options = dict(state.options)
+        if stream:
+            #the digest is calculated as we send the chunks,
+            #and sent with the last one
+            state.digest = hashlib.sha1()
+        else:
+            u = hashlib.sha1()
+            pos = 0
+            while pos<filesize:
+                buf = state.read(pos, max(chunk_size, FILE_CHUNKS_SIZE))
+                if not buf:
+                    filelog.error("Error: file '%s' is truncated", filename)
+                    return False
+                u.update(buf)
+                pos += len(buf)
+            filelog("sha1 digest(%s)=%s", absfile, u.hexdigest())
+            options["sha1"] = u.hexdigest()
+        if chunked:
             if len(self.send_chunks_in_progress)>=MAX_CONCURRENT_FILES:
                 raise Exception("too many file transfers in progress")
             #chunking is supported and the file is big enough
             chunk_id = uuid.uuid4().hex
             options["file-chunk-id"] = chunk_id
-            timer = self.timeout_add(CHUNK_TIMEOUT, self._check_chunk_sending, chunk_id, 0)
-            chunk_state = [time.time(), data, chunk_size, timer, 0]
-            self.send_chunks_in_progress[chunk_id] = chunk_state
-            cdata = ""
+            if stream:
+                options["file-stream"] = True
+                if state.file_id:
+                    options["file-id"] = state.file_id
+                state.stream = True
+                state.window = FILE_CHUNKS_WINDOW
+            state.chunk_id = chunk_id
+            state.chunk_size = chunk_size
             #timer to check that the other end is requesting more chunks:
+            state.timer = self.timeout_add(CHUNK_TIMEOUT, self._check_chunk_sending, chunk_id, 0)
+            self.send_chunks_in_progress[chunk_id] = state
+            cdata = ""
         else:
             #send everything now:
+            data = state.read(0, filesize)
             cdata = self.compressed_wrapper("file-data", data)
             assert len(cdata)<=filesize     #compressed wrapper ensures this is true
-        self.send("send-file", basefilename, mimetype, printit, openit, filesize, cdata, options)
+        self.send("send-file", basefilename, state.mimetype, printit, openit, filesize, cdata, options)
         return True
 
+    def _cancel_sending(self, chunk_state):
+        self.send_chunks_in_progress.pop(chunk_state.chunk_id, None)
+        self._cancel_timer(chunk_state)
+        chunk_state.close()
+
     def _check_chunk_sending(self, chunk_id, chunk_no):
         chunk_state = self.send_chunks_in_progress.get(chunk_id)
         filelog("_check_chunk_sending(%s, %s) chunk_state found: %s", chunk_id, chunk_no, bool(chunk_state))
         if chunk_state:
-            chunk_state[-2] = 0         #timer has fired
-            if chunk_state[-1]==chunk_no:
+            chunk_state.timer = 0       #timer has fired
+            if chunk_state.acked==chunk_no:
                 filelog.error("Error: chunked file transfer timed out on chunk %i", chunk_no)
-                del self.send_chunks_in_progress[chunk_id]
+                self._cancel_sending(chunk_state)
 
     def _process_ack_file_chunk(self, packet):
         #the other end received our send-file or send-file-chunk,
         #send some more file data
         filelog("ack-file-chunk: %s", packet[1:])
         chunk_id, state, error_message, chunk = packet[1:5]
+        chunk_state = self.send_chunks_in_progress.get(chunk_id)
         if not state:
             filelog.error("Error: remote end is cancelling the file transfer:")
             filelog.error(" %s", error_message)
-            del self.send_chunks_in_progress[chunk_id]
+            if chunk_state:
+                self._cancel_sending(chunk_state)
             return
-        chunk_state = self.send_chunks_in_progress.get(chunk_id)
         if not chunk_state:
             filelog.error("Error: cannot find the file transfer id '%s'", nonl(chunk_id))
             return
-        if chunk_state[-1]!=chunk:
-            filelog.error("Error: chunk number mismatch (%i vs %i)", chunk_state, chunk)
-            del self.send_chunks_in_progress[chunk_id]
+        #with streaming, we can have multiple chunks in flight,
+        #but they must still be acknowledged in order:
+        expected = chunk_state.acked+1 if chunk_state.sent>0 else 0
+        if chunk!=expected:
+            filelog.error("Error: chunk number mismatch (%i vs %i)", expected, chunk)
+            self._cancel_sending(chunk_state)
             return
-        start_time, data, chunk_size, timer, chunk = chunk_state
-        if not data:
+        if chunk==0 and len(packet)>5:
+            #the receiver may already have the start of this file:
+            offset = packet[5]
+            if offset<0 or offset>chunk_state.filesize or (offset>0 and not chunk_state.stream):
+                filelog.error("Error: invalid file offset %i", offset)
+                self._cancel_sending(chunk_state)
+                return
+            if offset>0:
+                filelog.info("resuming the transfer of '%s' at %s", chunk_state.filename, std_unit(offset, unit=1024))
+            chunk_state.offset = offset
+        chunk_state.acked = chunk
+        self._cancel_timer(chunk_state)
+        if chunk_state.acked==chunk_state.sent and chunk_state.offset>=chunk_state.filesize:
             #all sent!
-            elapsed = time.time()-start_time
-            filelog("%i chunks of %i bytes sent in %ims (%sB/s)", chunk, chunk_size, elapsed*1000, std_unit(chunk*chunk_size/elapsed))
-            del self.send_chunks_in_progress[chunk_id]
+            elapsed = max(0.001, time.time()-chunk_state.start)
+            filelog("%i chunks of %i bytes sent in %ims (%sB/s)", chunk, chunk_state.chunk_size, elapsed*1000, std_unit(chunk*chunk_state.chunk_size/elapsed))
+            self._cancel_sending(chunk_state)
             return
-        assert chunk_size>0
-        #carve out another chunk:
-        cdata = self.compressed_wrapper("file-data", data[:chunk_size])
-        data = data[chunk_size:]
-        chunk += 1
-        if timer:
-            self.source_remove(timer)
-        timer = self.timeout_add(CHUNK_TIMEOUT, self._check_chunk_sending, chunk_id, chunk)
-        self.send_chunks_in_progress[chunk_id] = [start_time, data, chunk_size, timer, chunk]
-        self.send("send-file-chunk", chunk_id, chunk, cdata, bool(data))
+        try:
+            self._send_file_chunks(chunk_state)
+        except Exception as e:
+            filelog("_send_file_chunks(%s)", chunk_state, exc_info=True)
+            filelog.error("Error: cannot send file '%s'", chunk_state.filename)
+            filelog.error(" %s", e)
+            self._cancel_sending(chunk_state)
+            return
+        chunk_state.timer = self.timeout_add(CHUNK_TIMEOUT, self._check_chunk_sending, chunk_id, chunk)
+
+    def _send_file_chunks(self, chunk_state):
+        #send as many chunks as the window allows:
+        while chunk_state.sent-chunk_state.acked<chunk_state.window and chunk_state.offset<chunk_state.filesize:
+            #carve out another chunk:
+            data = chunk_state.read(chunk_state.offset, chunk_state.chunk_size)
+            if not data:
+                raise Exception("file '%s' is truncated" % chunk_state.filename)
+            if chunk_state.digest:
+                chunk_state.update_digest(chunk_state.offset, data)
+            chunk_state.offset += len(data)
+            chunk_state.sent += 1
+            has_more = chunk_state.offset<chunk_state.filesize
+            cdata = self.compressed_wrapper("file-data", data)
+            if has_more or not chunk_state.digest:
+                self.send("send-file-chunk", chunk_state.chunk_id, chunk_state.sent, cdata, has_more)
+            else:
+                self.send("send-file-chunk", chunk_state.chunk_id, chunk_state.sent, cdata, has_more, {"sha1" : chunk_state.digest.hexdigest()})
@@ -10,6 +10,7 @@ FLAGS_BENCODE   = 0x0       #assume bencode if not other flag is set
 FLAGS_RENCODE   = 0x1
 FLAGS_CIPHER    = 0x2
 FLAGS_YAML      = 0x4
+FLAGS_CHUNK     = 0x8       #part of a split packet, see Protocol._add_chunks_to_queue
 
 #compression flags are carried in the "level" field,
 #the low bits contain the compression level, the high bits the compression algo:
@@ -17,6 +18,7 @@ ZLIB_FLAG       = 0x0       #assume zlib if no other compression flag is set
 LZ4_FLAG        = 0x10
 LZO_FLAG        = 0x20
 FLAGS_NOHEADER  = 0x40
+ZSTD_FLAG       = 0x80
 
 
 _header_unpack_struct = struct.Struct('!cBBBL')
@@ -5,8 +5,11 @@
 
 import os
 import ctypes
+from bisect import bisect
+from threading import Lock
 from xpra.os_util import memoryview_to_bytes
 from xpra.simple_stats import to_std_unit
+from xpra.util import envint, envbool
 from xpra.log import Logger
 log = Logger("mmap")
 
@@ -14,6 +17,24 @@ log = Logger("mmap")
 Utility functions for communicating via mmap
 """
 
+#use the slot allocator if the client supports it:
+MMAP_SLOTS = envbool("XPRA_MMAP_SLOTS", True)
+#slots are aligned to this many bytes:
+SLOT_ALIGN = envint("XPRA_MMAP_SLOT_ALIGN", 64)
+
+#Slot mode memory layout:
+#[S&M-- token -- W&R&ring-------- slots ... ]
+#S=data_start (unused in slot mode)
+#M=SLOTS_MAGIC, written by the server in place of data_end to enable slot mode
+#W=ring write index, only updated by the client
+#R=ring read index, only updated by the server
+#ring=the offsets of the slots the client has finished with
+SLOTS_MAGIC = 0xFFFFFFFF        #data_end can never be that big
+RING_OFFSET = 1024
+RING_SIZE = 1024                #must be a power of 2
+DATA_OFFSET = 8192
+assert RING_OFFSET+8+RING_SIZE*4<=DATA_OFFSET
+
 def can_use_mmap():
     return hasattr(ctypes.c_ubyte, "from_buffer")
 
@@ -160,13 +181,23 @@ def int_from_buffer(mmap_area, pos):
     return ctypes.c_uint32.from_buffer(mmap_area, pos)      #@UndefinedVariable
 
 
+def is_slot_mode(mmap_area):
+    return int_from_buffer(mmap_area, 4).value==SLOTS_MAGIC
+
 #descr_data is a list of (offset, length)
 #areas from the mmap region
 def mmap_read(mmap_area, descr_data):
     """
-        Reads data from the mmap_area as written by 'mmap_write'.
+        Reads data from the mmap_area as written by 'mmap_write'
+        or by the MmapAllocator.
         The descr_data is the list of mmap chunks used.
+        In slot mode, the caller must call mmap_free once it is done with the data.
     """
+    if is_slot_mode(mmap_area):
+        #slots are always contiguous:
+        offset, length = descr_data[0]
+        arraytype = ctypes.c_char * length
+        return arraytype.from_buffer(mmap_area, offset)
     data_start = int_from_buffer(mmap_area, 0)
     if len(descr_data)==1:
         #construct an array directly from the mmap zone:
@@ -182,6 +213,28 @@ def mmap_read(mmap_area, descr_data):
         data_start.value = offset+length
     return data
 
+def mmap_free(mmap_area, descr_data):
+    """
+        Tells the server that it can re-use the area used by this data.
+        In slot mode, the slots can be freed in any order,
+        otherwise this moves the data_start index past this data,
+        which is only needed for data that is skipped without calling mmap_read.
+    """
+    if not is_slot_mode(mmap_area):
+        data_start = int_from_buffer(mmap_area, 0)
+        offset, length = descr_data[-1]
+        data_start.value = offset+length
+        return
+    #the server never allocates more slots than the ring can hold,
+    #so there is always room for this entry:
+    write_index = int_from_buffer(mmap_area, RING_OFFSET)
+    w = write_index.value
+    for offset, _ in descr_data:
+        int_from_buffer(mmap_area, RING_OFFSET+8+(w % RING_SIZE)*4).value = offset
+        w = (w+1) & 0xFFFFFFFF
+    #publish the new entries:
+    write_index.value = w
+
 
 def mmap_write(mmap_area, mmap_size, data):
     """
@@ -263,3 +316,139 @@ def mmap_write(mmap_area, mmap_size, data):
             mmap_data_end.value = 8+l2
     log("sending damage with mmap: %s", data)
     return data, mmap_free_size
+
+
+class MmapAllocator(object):
+    """
+        Allocates a slot in the mmap area for each frame we send,
+        the client releases the slots as soon as it has painted them,
+        in any order, by adding them to a ring buffer which we drain
+        when we need more space.
+        Unlike the single circular buffer used by mmap_write,
+        a large frame can use any free space in the mmap area
+        and slots can be written to from multiple threads.
+    """
+
+    def __init__(self, mmap_area, mmap_size):
+        self.mmap_area = mmap_area
+        self.mmap_size = mmap_size
+        self.lock = Lock()
+        self.free_list = [(DATA_OFFSET, mmap_size-DATA_OFFSET)]      #sorted (offset, size)
+        self.slots = {}             #offset -> (size, wid)
+        self.window_slots = {}      #wid -> number of slots
+        self.allocations = 0
+        self.failures = 0
+        self.reclaimed = 0
+        self.write_index = int_from_buffer(mmap_area, RING_OFFSET)
+        self.read_index = int_from_buffer(mmap_area, RING_OFFSET+4)
+        self.write_index.value = 0
+        self.read_index.value = 0
+        #this tells the client that we use slot mode:
+        int_from_buffer(mmap_area, 4).value = SLOTS_MAGIC
+
+    def __repr__(self):
+        return "MmapAllocator(%i slots)" % len(self.slots)
+
+    def get_free_size(self):
+        return sum(size for _, size in self.free_list)
+
+    def reclaim(self):
+        #must be called with the lock held
+        w = self.write_index.value
+        r = self.read_index.value
+        while r!=w:
+            offset = int_from_buffer(self.mmap_area, RING_OFFSET+8+(r % RING_SIZE)*4).value
+            r = (r+1) & 0xFFFFFFFF
+            self.free_slot(offset)
+        self.read_index.value = r
+
+    def free_slot(self, offset):
+        slot = self.slots.pop(offset, None)
+        if slot is None:
+            log.warn("Warning: client freed an invalid mmap slot at offset %i", offset)
+            return
+        size, wid = slot
+        count = self.window_slots.get(wid, 0)-1
+        if count>0:
+            self.window_slots[wid] = count
+        else:
+            self.window_slots.pop(wid, None)
+        self.reclaimed += 1
+        #insert in the free list and merge with the adjacent free blocks:
+        fl = self.free_list
+        i = bisect(fl, (offset, ))
+        if i<len(fl) and offset+size==fl[i][0]:
+            size += fl[i][1]
+            del fl[i]
+        if i>0 and fl[i-1][0]+fl[i-1][1]==offset:
+            offset = fl[i-1][0]
+            size += fl[i-1][1]
+            i -= 1
+            del fl[i]
+        fl.insert(i, (offset, size))
+
+    def allocate(self, size, wid=0):
+        """ returns the offset of the new slot, or -1 if we don't have enough space """
+        size = roundup(size, SLOT_ALIGN)
+        with self.lock:
+            self.reclaim()
+            if len(self.slots)<RING_SIZE-1:
+                #best fit:
+                best = -1
+                for i, (offset, block_size) in enumerate(self.free_list):
+                    if block_size>=size and (best<0 or block_size<self.free_list[best][1]):
+                        best = i
+                        if block_size==size:
+                            break
+                if best>=0:
+                    offset, block_size = self.free_list[best]
+                    if block_size==size:
+                        del self.free_list[best]
+                    else:
+                        self.free_list[best] = (offset+size, block_size-size)
+                    self.slots[offset] = (size, wid)
+                    self.window_slots[wid] = self.window_slots.get(wid, 0)+1
+                    self.allocations += 1
+                    return offset
+            self.failures += 1
+            return -1
+
+    def write(self, data, wid=0):
+        """
+            Copies the data to a new slot and returns:
+            the chunks used (or None if it failed) and the free space left.
+        """
+        l = len(data)
+        offset = self.allocate(l, wid)
+        if offset<0:
+            free_size = self.get_free_size()
+            log("mmap area is full: cannot allocate %i bytes, %i free in %i blocks", l, free_size, len(self.free_list))
+            return None, free_size-l
+        #we own this slot, so we can write to it without holding the lock:
+        try:
+            self.mmap_area[offset:offset+l] = data
+        except TypeError:
+            self.mmap_area[offset:offset+l] = memoryview_to_bytes(data)
+        log("mmap slot for window %i: %i bytes at %i", wid, l, offset)
+        return [(offset, l)], self.get_free_size()
+
+    def get_info(self):
+        with self.lock:
+            free_size = self.get_free_size()
+            largest = max([size for _, size in self.free_list] or [0])
+            return {
+                    "slots"         : {
+                                       ""       : len(self.slots),
+                                       "window" : dict(self.window_slots),
+                                       },
+                    "free"          : {
+                                       ""       : free_size,
+                                       "blocks" : len(self.free_list),
+                                       "largest": largest,
+                                       },
+                    #0 when all the free space is contiguous:
+                    "fragmentation" : int(100-100*largest//max(1, free_size)),
+                    "allocations"   : self.allocations,
+                    "failures"      : self.failures,
+                    "reclaimed"     : self.reclaimed,
+                    }
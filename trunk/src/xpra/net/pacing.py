@@ -0,0 +1,93 @@
+# This file is part of Xpra.
+# Copyright (C) 2016 Antoine Martin <antoine@devloop.org.uk>
+# Xpra is released under the terms of the GNU GPL v2, or, at your option, any
+# later version. See the file COPYING for details.
+
+import time
+
+from xpra.util import envint
+from xpra.log import Logger
+log = Logger("network", "bandwidth")
+
+from xpra.net.compression import Compressed, LargeStructure
+
+#how much data we can send in one go (in milliseconds worth of the current rate):
+BURST = envint("XPRA_PACING_BURST", 50)
+#but always allow at least this many bytes:
+MIN_BURST = envint("XPRA_PACING_MIN_BURST", 64*1024)
+
+
+def get_packet_size(packet):
+    """
+        Returns the approximate size of a packet before it is encoded,
+        this only counts the binary payloads which is all that matters for large packets.
+    """
+    size = 0
+    for x in packet:
+        if isinstance(x, (Compressed, LargeStructure, bytes, bytearray, memoryview)):
+            size += len(x)
+    return size
+
+
+class Pacer(object):
+    """
+        A token bucket which spreads the packets we send over time
+        so we don't fill the socket buffers faster than the link can drain them.
+        The bucket can go into debt, so that packets larger than the burst size
+        are never blocked forever: we just wait for the debt to be repaid.
+        A rate of zero disables pacing.
+    """
+
+    def __init__(self, rate=0):
+        self.rate = 0
+        self.burst = MIN_BURST
+        self.tokens = MIN_BURST
+        self.last_update = time.time()
+        self.delayed = 0
+        self.total_delay = 0.0
+        self.set_rate(rate)
+
+    def __repr__(self):
+        return "Pacer(%iKB/s)" % (self.rate//1024)
+
+    def set_rate(self, rate):
+        """ the rate is in bytes per second """
+        self.refill()
+        self.rate = max(0, int(rate))
+        self.burst = max(MIN_BURST, self.rate*BURST//1000)
+        self.tokens = min(self.tokens, self.burst)
+
+    def refill(self):
+        now = time.time()
+        elapsed = max(0, now-self.last_update)
+        self.last_update = now
+        if self.rate>0:
+            self.tokens = min(self.burst, self.tokens+elapsed*self.rate)
+        else:
+            self.tokens = self.burst
+
+    def consume(self, size):
+        self.refill()
+        if self.rate>0:
+            self.tokens -= size
+
+    def get_delay(self):
+        """ returns how long we have to wait before we can send more data, in seconds """
+        if self.rate<=0:
+            return 0
+        self.refill()
+        if self.tokens>=0:
+            return 0
+        delay = -float(self.tokens)/self.rate
+        self.delayed += 1
+        self.total_delay += delay
+        return delay
+
+    def get_info(self):
+        return {
+                "rate"      : self.rate,
+                "burst"     : self.burst,
+                "tokens"    : int(self.tokens),
+                "delayed"   : self.delayed,
+                "delay"     : int(1000*self.total_delay),
+                }
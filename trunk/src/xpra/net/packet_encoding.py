@@ -10,6 +10,7 @@ log = Logger("network", "protocol")
 from xpra.net.header import FLAGS_RENCODE, FLAGS_YAML, FLAGS_BENCODE
 
 from xpra.util import envbool
+from xpra.os_util import bytestostr, memoryview_to_bytes
 #those are also modified from the command line switch:
 use_rencode = envbool("XPRA_USE_RENCODER", True)
 use_bencode = envbool("XPRA_USE_BENCODER", True)
@@ -18,8 +19,10 @@ use_yaml    = envbool("XPRA_USE_YAML", True)
 
 has_rencode = None
 rencode_dumps, rencode_loads, rencode_version = None, None, None
+#whether rencode can parse a memoryview without copying it to bytes first:
+rencode_buffers = False
 def init_rencode():
-    global use_rencode, has_rencode, rencode_dumps, rencode_loads, rencode_version
+    global use_rencode, has_rencode, rencode_dumps, rencode_loads, rencode_version, rencode_buffers
     try:
         import rencode
         rencode_dumps = rencode.dumps
@@ -30,6 +33,11 @@ def init_rencode():
         except:
             log.warn("rencode at '%s' lacks versioning information", rencode.__file__)
             rencode_version = "unknown"
+        try:
+            rencode_loads(memoryview(rencode_dumps([0])))
+            rencode_buffers = True
+        except TypeError:
+            rencode_buffers = False
     except ImportError as e:
         log("init_rencode()", exc_info=True)
         if use_rencode:
@@ -39,15 +47,18 @@ def init_rencode():
         log.error("error loading rencode", exc_info=True)
     has_rencode = rencode_dumps is not None and rencode_loads is not None and rencode_version is not None
     use_rencode = has_rencode and use_rencode
-    log("packet_encoding.init_rencode() has_rencode=%s, use_rencode=%s, version=%s", has_rencode, use_rencode, rencode_version)
+    log("packet_encoding.init_rencode() has_rencode=%s, use_rencode=%s, version=%s, buffers=%s", has_rencode, use_rencode, rencode_version, rencode_buffers)
 
 
 has_bencode = None
 bencode, bdecode, bencode_version = None, None, None
+#only the cython bdecode can parse a memoryview without copying it:
+bencode_buffers = False
 def init_bencode():
-    global use_bencode, has_bencode, bencode, bdecode, bencode_version
+    global use_bencode, has_bencode, bencode, bdecode, bencode_version, bencode_buffers
     try:
         from xpra.net.bencode import bencode, bdecode, __version__ as bencode_version
+        from xpra.net.bencode import cython_bencode_loaded as bencode_buffers
     except ImportError as e:
         log("init_bencode()", exc_info=True)
         if use_bencode:
@@ -166,24 +177,69 @@ class InvalidPacketEncodingException(Exception):
     pass
 
 
+#rencode type codes:
+RENCODE_CHR_LIST = 59
+RENCODE_LIST_FIXED_START = 192
+RENCODE_STR_FIXED_START = 128
+RENCODE_STR_FIXED_END = 192
+
+def peek_packet_type(data, protocol_flags):
+    """
+        Returns the packet type (a string) without decoding the whole packet,
+        or None if we can't tell: yaml encoding, packet aliases, etc.
+    """
+    data = bytearray(data[:64])
+    if protocol_flags & FLAGS_YAML:
+        return None
+    if protocol_flags & FLAGS_RENCODE:
+        if len(data)<2 or not (data[0]==RENCODE_CHR_LIST or data[0]>=RENCODE_LIST_FIXED_START):
+            return None
+        c = data[1]
+        if RENCODE_STR_FIXED_START<=c<RENCODE_STR_FIXED_END:
+            l = c-RENCODE_STR_FIXED_START
+            if len(data)<2+l:
+                return None
+            return bytestostr(bytes(data[2:2+l]))
+        #long strings use the same format as bencode: "LENGTH:STRING"
+        pos = 1
+    else:
+        if len(data)<1 or data[0]!=ord("l"):
+            return None
+        pos = 1
+    colon = data.find(b":", pos)
+    if colon<=pos or not data[pos:colon].isdigit():
+        return None
+    l = int(data[pos:colon])
+    if len(data)<colon+1+l:
+        return None
+    return bytestostr(bytes(data[colon+1:colon+1+l]))
+
+
 def decode(data, protocol_flags):
+    #'data' may be a memoryview into the read buffer,
+    #only copy it for the decoders that cannot parse buffers:
     if protocol_flags & FLAGS_RENCODE:
         if not has_rencode:
             raise InvalidPacketEncodingException("rencode is not available")
         if not use_rencode:
             raise InvalidPacketEncodingException("rencode is disabled")
+        if not rencode_buffers:
+            data = memoryview_to_bytes(data)
         return list(rencode_loads(data))
     elif protocol_flags & FLAGS_YAML:
         if not has_yaml:
             raise InvalidPacketEncodingException("yaml is not available")
         if not use_yaml:
             raise InvalidPacketEncodingException("yaml is disabled")
-        return list(yaml_decode(data))
+        return list(yaml_decode(memoryview_to_bytes(data)))
     else:
         if not has_bencode:
             raise InvalidPacketEncodingException("bencode is not available")
         if not use_bencode:
             raise InvalidPacketEncodingException("bencode is disabled")
+        if not bencode_buffers:
+            #the python bdecode would return memoryview slices:
+            data = memoryview_to_bytes(data)
         packet, l = bdecode(data)
         assert l==len(data)
         return packet
@@ -18,17 +18,20 @@ from xpra.log import Logger
 log = Logger("network", "protocol")
 cryptolog = Logger("network", "crypto")
 
-from xpra.os_util import Queue, strtobytes
+from xpra.os_util import Queue, strtobytes, memoryview_to_bytes
 from xpra.util import repr_ellipsized, csv, envint, envbool
 from xpra.net import ConnectionClosedException
-from xpra.net.bytestreams import ABORT
+from xpra.net.bytestreams import ABORT, IOV_MAX
 from xpra.net import compression
 from xpra.net import packet_encoding
 from xpra.net.compression import get_compression_caps, decompress, sanity_checks as compression_sanity_checks,\
         InvalidCompressionException, Compressed, LevelCompressed, Compressible, LargeStructure
 from xpra.net.packet_encoding import get_packet_encoding_caps, decode, sanity_checks as packet_encoding_sanity_checks, InvalidPacketEncodingException
-from xpra.net.header import unpack_header, pack_header, FLAGS_CIPHER, FLAGS_NOHEADER
-from xpra.net.crypto import get_crypto_caps, get_encryptor, get_decryptor, pad, INITIAL_PADDING
+from xpra.net.header import unpack_header, pack_header, FLAGS_CIPHER, FLAGS_NOHEADER, FLAGS_CHUNK
+from xpra.net.crypto import get_crypto_caps, get_encryptor, get_decryptor, get_encrypt_pool, pad, INITIAL_PADDING, \
+    DEFAULT_MODE, MODE_GCM, AEAD_NONCE_SIZE, AEAD_OVERHEAD, PARALLEL_ENCRYPT_SIZE
+from xpra.net.read_buffer import ReadBuffer
+from xpra.net.write_queue import PriorityWriteQueue, PRIORITY_CONTROL, PRIORITY_FOCUSED, PRIORITY_BACKGROUND, PRIORITY_BULK, BULK_PACKETS, WINDOW_PACKETS
 
 
 #stupid python version breakage:
@@ -61,6 +64,11 @@ LARGE_PACKET_SIZE = envint("XPRA_LARGE_PACKET_SIZE", 4096)
 INLINE_SIZE = envint("XPRA_INLINE_SIZE", 32768)
 FAKE_JITTER = envint("XPRA_FAKE_JITTER", 0)
 MIN_COMPRESS_SIZE = envint("XPRA_MIN_COMPRESS_SIZE", 378)
+#write the packets in order of priority (see write_queue):
+PRIORITY_WRITES = envbool("XPRA_PRIORITY_WRITES", True)
+#split the large draw and bulk packets into pieces of this size,
+#so more urgent packets can be sent in between:
+SPLIT_SIZE = envint("XPRA_PACKET_SPLIT_SIZE", 64*1024)
 
 
 def get_network_caps():
@@ -74,6 +82,7 @@ def get_network_caps():
                 "compressors"           : compression.get_enabled_compressors(),
                 "encoders"              : packet_encoding.get_enabled_encoders(),
                 "mmap"                  : mmap,
+                "split-packets"         : True,
                }
     caps.update(get_crypto_caps())
     caps.update(get_compression_caps())
@@ -86,6 +95,52 @@ def sanity_checks():
     packet_encoding_sanity_checks()
 
 
+def split_chunks(chunks, size):
+    """
+        Splits the raw items of a packet into pieces of the given size,
+        all the chunks are flagged so the receiver knows that the pieces belong together
+        and that they must not be merged with other packets sent in between.
+    """
+    split = []
+    for proto_flags, index, level, data in chunks:
+        proto_flags |= FLAGS_CHUNK
+        if index==0:
+            split.append((proto_flags, index, level, data))
+            continue
+        for i in range(0, max(1, len(data)), size):
+            split.append((proto_flags, index, level, data[i:i+size]))
+    return split
+
+
+class SplicedPacket(object):
+    """
+        A packet received by one Protocol instance and sent by another,
+        without being decoded and re-encoded.
+    """
+    __slots__ = ("packet_type", "chunks")
+    def __init__(self, packet_type, chunks):
+        self.packet_type = packet_type
+        self.chunks = chunks
+
+    def __repr__(self):
+        return "SplicedPacket(%s: %i bytes)" % (self.packet_type, sum(len(x[3]) for x in self.chunks))
+
+
+class AEADChunk(object):
+    """
+        A chunk which is only encrypted when the write thread is about to write it,
+        because the receiver expects the nonces in the order the chunks are written
+        and the write queue may re-order the packets.
+    """
+    __slots__ = ("header", "data")
+    def __init__(self, header, data):
+        self.header = header
+        self.data = data
+
+    def __repr__(self):
+        return "AEADChunk(%i bytes)" % len(self.data)
+
+
 class Protocol(object):
     CONNECTION_LOST = "connection-lost"
     GIBBERISH = "gibberish"
@@ -100,13 +155,18 @@ class Protocol(object):
         self.timeout_add = scheduler.timeout_add
         self.idle_add = scheduler.idle_add
         self._conn = conn
+        #scatter/gather write function, if the connection supports it:
+        self._writev = conn.get_writev()
+        #read directly into our own buffer, if the connection supports it:
+        self._read_into = conn.get_read_into()
+        self._recv_buffer = None
         if FAKE_JITTER>0:
             from xpra.net.fake_jitter import FakeJitter
             fj = FakeJitter(self.timeout_add, process_packet_cb)
             self._process_packet_cb =  fj.process_packet_cb
         else:
             self._process_packet_cb = process_packet_cb
-        self._write_queue = Queue(1)
+        self._write_queue = PriorityWriteQueue()
         self._read_queue = Queue(20)
         self._read_queue_put = self.read_queue_put
         # Invariant: if .source is None, then _source_has_more == False
@@ -130,15 +190,28 @@ class Protocol(object):
         self._encoder = self.noencode
         self.compressor = "none"
         self._compress = compression.nocompress
+        self.compressors = []           #the compressors supported by both ends
+        self._compression_policy = compression.CompressionPolicy()
         self.compression_level = 0
+        #forwards packets without decoding them, see enable_splice:
+        self._splice_cb = None
+        self.spliced_packetcount = 0
+        self.spliced_bytecount = 0
         self.cipher_in = None
         self.cipher_in_name = None
         self.cipher_in_block_size = 0
         self.cipher_in_padding = INITIAL_PADDING
+        self.cipher_in_mode = DEFAULT_MODE
         self.cipher_out = None
         self.cipher_out_name = None
         self.cipher_out_block_size = 0
         self.cipher_out_padding = INITIAL_PADDING
+        self.cipher_out_mode = DEFAULT_MODE
+        self._parallel_encrypt = True               #use the worker pool for large AEAD chunks
+        self.parallel_encrypted = 0
+        self._split_packets = False                 #can the peer receive split packets?
+        self._focused_window_cb = None
+        self._ordered_window_packets = False        #legacy mmap: the client reads the draws in the order we write them
         self._write_lock = Lock()
         from xpra.make_thread import make_thread
         self._write_thread = make_thread(self._write_thread_loop, "write", daemon=True)
@@ -148,9 +221,9 @@ class Protocol(object):
         self._source_has_more = Event()
 
     STATE_FIELDS = ("max_packet_size", "large_packets", "send_aliases", "receive_aliases",
-                    "cipher_in", "cipher_in_name", "cipher_in_block_size", "cipher_in_padding",
-                    "cipher_out", "cipher_out_name", "cipher_out_block_size", "cipher_out_padding",
-                    "compression_level", "encoder", "compressor")
+                    "cipher_in", "cipher_in_name", "cipher_in_block_size", "cipher_in_padding", "cipher_in_mode",
+                    "cipher_out", "cipher_out_name", "cipher_out_block_size", "cipher_out_padding", "cipher_out_mode",
+                    "compression_level", "encoder", "compressor", "compressors")
     def save_state(self):
         state = {}
         for x in Protocol.STATE_FIELDS:
@@ -181,22 +254,76 @@ class Protocol(object):
     def set_packet_source(self, get_packet_cb):
         self._get_packet_cb = get_packet_cb
 
+    def set_split_packets(self, enabled):
+        self._split_packets = enabled and SPLIT_SIZE>0
+
+    def set_focused_window_cb(self, focused_window_cb):
+        """ the callback returns the id of the window that has focus, its draw packets are more urgent """
+        self._focused_window_cb = focused_window_cb
+
+    def set_ordered_window_packets(self, ordered):
+        """
+            Without the slot allocator, the client reads the mmap area in the order we write it,
+            so the window packets of all the windows must be written in the order they were queued.
+        """
+        self._ordered_window_packets = ordered
+
+    def can_reorder_writes(self):
+        """
+            The packets are encrypted in the order they are formatted,
+            and chained cipher modes (ie: CBC) encrypt each packet using the previous one,
+            so they must also be written in that order.
+            (AEAD chunks are encrypted independently, when they are written)
+        """
+        if not PRIORITY_WRITES:
+            return False
+        return not self.cipher_out or self.cipher_out_mode==MODE_GCM
 
-    def set_cipher_in(self, ciphername, iv, password, key_salt, iterations, padding):
-        if self.cipher_in_name!=ciphername:
-            cryptolog.info("receiving data using %s encryption", ciphername)
+    def get_packet_priority(self, packet):
+        if not self.can_reorder_writes():
+            return PRIORITY_CONTROL
+        if isinstance(packet, SplicedPacket):
+            packet_type = packet.packet_type
+        else:
+            packet_type = packet[0]
+        if packet_type=="draw":
+            if self._ordered_window_packets:
+                #all in the same class (and stream, see get_packet_stream):
+                return PRIORITY_BACKGROUND
+            fwcb = self._focused_window_cb
+            if fwcb and not isinstance(packet, SplicedPacket) and packet[1]==fwcb():
+                return PRIORITY_FOCUSED
+            return PRIORITY_BACKGROUND
+        if packet_type in BULK_PACKETS:
+            return PRIORITY_BULK
+        return PRIORITY_CONTROL
+
+    def get_packet_stream(self, packet):
+        """ the packets of the same window must be written in the order they were queued """
+        if isinstance(packet, SplicedPacket) or len(packet)<2 or packet[0] not in WINDOW_PACKETS:
+            return None
+        if self._ordered_window_packets:
+            return "mmap"
+        return packet[1]
+
+
+    def set_cipher_in(self, ciphername, iv, password, key_salt, iterations, padding, mode=DEFAULT_MODE):
+        if self.cipher_in_name!=ciphername or self.cipher_in_mode!=mode:
+            cryptolog.info("receiving data using %s-%s encryption", ciphername, mode)
             self.cipher_in_name = ciphername
-        cryptolog("set_cipher_in%s", (ciphername, iv, password, key_salt, iterations))
-        self.cipher_in, self.cipher_in_block_size = get_decryptor(ciphername, iv, password, key_salt, iterations)
+        cryptolog("set_cipher_in%s", (ciphername, iv, password, key_salt, iterations, padding, mode))
+        self.cipher_in, self.cipher_in_block_size = get_decryptor(ciphername, iv, password, key_salt, iterations, mode)
         self.cipher_in_padding = padding
+        self.cipher_in_mode = mode
 
-    def set_cipher_out(self, ciphername, iv, password, key_salt, iterations, padding):
-        if self.cipher_out_name!=ciphername:
-            cryptolog.info("sending data using %s encryption", ciphername)
+    def set_cipher_out(self, ciphername, iv, password, key_salt, iterations, padding, mode=DEFAULT_MODE):
+        if self.cipher_out_name!=ciphername or self.cipher_out_mode!=mode:
+            cryptolog.info("sending data using %s-%s encryption", ciphername, mode)
             self.cipher_out_name = ciphername
-        cryptolog("set_cipher_out%s", (ciphername, iv, password, key_salt, iterations, padding))
-        self.cipher_out, self.cipher_out_block_size = get_encryptor(ciphername, iv, password, key_salt, iterations)
+        cryptolog("set_cipher_out%s", (ciphername, iv, password, key_salt, iterations, padding, mode))
+        self.cipher_out, self.cipher_out_block_size = get_encryptor(ciphername, iv, password, key_salt, iterations, mode)
         self.cipher_out_padding = padding
+        self.cipher_out_mode = mode
 
 
     def __repr__(self):
@@ -214,29 +341,41 @@ class Protocol(object):
             "aliases"               : USE_ALIASES,
             "input" : {
                        "buffer-size"            : READ_BUFFER_SIZE,
+                       "read-into"              : self._read_into is not None,
                        "packetcount"            : self.input_packetcount,
                        "raw_packetcount"        : self.input_raw_packetcount,
                        "count"                  : self.input_stats,
                        "cipher"                 : {"": self.cipher_in_name or "",
                                                    "padding"        : self.cipher_in_padding,
+                                                   "mode"           : self.cipher_in_mode,
                                                    },
                         },
             "output" : {
+                        "writev"                : self._writev is not None,
                         "packet-join-size"      : PACKET_JOIN_SIZE,
                         "large-packet-size"     : LARGE_PACKET_SIZE,
                         "inline-size"           : INLINE_SIZE,
                         "min-compress-size"     : MIN_COMPRESS_SIZE,
+                        "split-size"            : SPLIT_SIZE*int(self._split_packets),
                         "packetcount"           : self.output_packetcount,
                         "raw_packetcount"       : self.output_raw_packetcount,
                         "count"                 : self.output_stats,
                         "cipher"                : {"": self.cipher_out_name or "",
-                                                   "padding" : self.cipher_out_padding
+                                                   "padding" : self.cipher_out_padding,
+                                                   "mode"    : self.cipher_out_mode,
+                                                   "parallel": self.parallel_encrypted,
                                                    },
                         },
             }
         c = self._compress
         if c:
             info["compressor"] = compression.get_compressor_name(self._compress)
+        info["compression"] = self._compression_policy.get_info()
+        if self._splice_cb:
+            info["splice"] = {
+                              "packetcount"     : self.spliced_packetcount,
+                              "bytecount"       : self.spliced_bytecount,
+                              }
         e = self._encoder
         if e:
             if self._encoder==self.noencode:
@@ -253,6 +392,9 @@ class Protocol(object):
             except:
                 log.error("error collecting connection information on %s", self._conn, exc_info=True)
         info["has_more"] = self._source_has_more.is_set()
+        wq = self._write_queue
+        if PRIORITY_WRITES and isinstance(wq, PriorityWriteQueue):
+            info["output"]["priority"] = wq.get_info()
         for t in (self._write_thread, self._read_thread, self._read_parser_thread, self._write_format_thread):
             if t:
                 info.setdefault("thread", {})[t.name] = t.is_alive()
@@ -278,7 +420,8 @@ class Protocol(object):
         self._get_packet_cb = packet_cb
         self.source_has_more()
 
-    def source_has_more(self):
+    def source_has_more(self, priority=PRIORITY_CONTROL):
+        self._write_queue.announce(priority)
         self._source_has_more.set()
         #start the format thread:
         if not self._write_format_thread and not self._closed:
@@ -295,6 +438,9 @@ class Protocol(object):
                 gpc = self._get_packet_cb
                 if self._closed or not gpc:
                     return
+                #don't take more packets from the source than we can write:
+                if not self._write_queue.wait_for_room():
+                    return
                 self._source_has_more.clear()
                 self._add_packet_to_queue(*gpc())
         except Exception as e:
@@ -307,16 +453,34 @@ class Protocol(object):
             self._source_has_more.set()
         if packet is None:
             return
-        log("add_packet_to_queue(%s ...)", packet[0])
-        chunks = self.encode(packet)
+        priority = self.get_packet_priority(packet)
+        stream = self.get_packet_stream(packet)
+        if has_more:
+            #the next packet cannot be more urgent than this one, unless the source tells us:
+            self._write_queue.fetched(priority)
+        if isinstance(packet, SplicedPacket):
+            #already encoded and compressed:
+            chunks = packet.chunks
+            self.output_stats[packet.packet_type] = self.output_stats.get(packet.packet_type, 0)+1
+        else:
+            log("add_packet_to_queue(%s ...)", packet[0])
+            chunks = self.encode(packet)
         with self._write_lock:
             if self._closed:
                 return
-            self._add_chunks_to_queue(chunks, start_send_cb, end_send_cb)
+            self._add_chunks_to_queue(chunks, start_send_cb, end_send_cb, priority, stream)
 
-    def _add_chunks_to_queue(self, chunks, start_send_cb=None, end_send_cb=None):
+    def _add_chunks_to_queue(self, chunks, start_send_cb=None, end_send_cb=None, priority=PRIORITY_CONTROL, stream=None):
         """ the write_lock must be held when calling this function """
+        #large packets which are not urgent are split into pieces,
+        #(not with chained ciphers: the encryption must be done in the order the data is written)
+        aead = self.cipher_out and self.cipher_out_mode==MODE_GCM
+        split = self._split_packets and (not self.cipher_out or aead) and priority>=PRIORITY_BACKGROUND and \
+                sum(len(chunk[3]) for chunk in chunks)>SPLIT_SIZE
+        if split:
+            chunks = split_chunks(chunks, SPLIT_SIZE)
         counter = 0
+        units = []
         items = []
         for proto_flags,index,level,data in chunks:
             scb, ecb = None, None
@@ -328,7 +492,7 @@ class Protocol(object):
                 ecb = end_send_cb
             payload_size = len(data)
             actual_size = payload_size
-            if self.cipher_out:
+            if self.cipher_out and not aead:
                 proto_flags |= FLAGS_CIPHER
                 #note: since we are padding: l!=len(data)
                 padding_size = self.cipher_out_block_size - (payload_size % self.cipher_out_block_size)
@@ -342,12 +506,15 @@ class Protocol(object):
                 data = self.cipher_out.encrypt(padded)
                 assert len(data)==actual_size, "expected encrypted size to be %i, but got %i" % (len(data), actual_size)
                 cryptolog("sending %s bytes %s encrypted with %s padding", payload_size, self.cipher_out_name, padding_size)
-            if proto_flags & FLAGS_NOHEADER:
+            if aead:
+                header = pack_header(proto_flags | FLAGS_CIPHER, level, index, payload_size)
+                items.append((AEADChunk(header, data), scb, ecb))
+            elif proto_flags & FLAGS_NOHEADER:
                 assert not self.cipher_out
                 #for plain/text packets (ie: gibberish response)
                 log("sending %s bytes without header", payload_size)
                 items.append((data, scb, ecb))
-            elif actual_size<PACKET_JOIN_SIZE:
+            elif actual_size<PACKET_JOIN_SIZE and not self._writev:
                 if type(data) not in JOIN_TYPES:
                     data = bytes(data)
                 header_and_data = pack_header(proto_flags, level, index, payload_size) + data
@@ -355,14 +522,58 @@ class Protocol(object):
             else:
                 header = pack_header(proto_flags, level, index, payload_size)
                 items.append((header, scb, None))
-                items.append((strtobytes(data), None, ecb))
+                if not self._writev:
+                    #writev can use the buffer as it is:
+                    data = strtobytes(data)
+                items.append((data, None, ecb))
             counter += 1
-        self._write_queue.put(items)
+            if split:
+                #each piece can be interrupted by more urgent packets:
+                units.append(items)
+                items = []
+        if items:
+            units.append(items)
+        self._write_queue.put(units, priority, stream)
         self.output_packetcount += 1
 
+    def _encrypt_items(self, items):
+        """ encrypts the AEAD chunks, in the order they are going to be written """
+        if not any(isinstance(buf, AEADChunk) for buf, _, _ in items):
+            return items
+        encrypted = []
+        for buf, scb, ecb in items:
+            if isinstance(buf, AEADChunk):
+                encrypted += self._aead_encrypt(buf.header, buf.data, scb, ecb)
+            else:
+                encrypted.append((buf, scb, ecb))
+        return encrypted
+
+    def _aead_encrypt(self, header, data, scb, ecb):
+        """
+            Each chunk is encrypted and authenticated independently, without padding:
+            the nonce goes after the header, which is authenticated with the data,
+            and the tag after the encrypted data.
+            The large chunks are encrypted by the worker pool, the write thread waits for the result.
+        """
+        payload_size = len(data)
+        nonce = self.cipher_out.next_nonce()
+        join = payload_size+AEAD_OVERHEAD<PACKET_JOIN_SIZE and not self._writev
+        pool = None
+        if payload_size>=PARALLEL_ENCRYPT_SIZE and not join and self._parallel_encrypt:
+            pool = get_encrypt_pool()
+        if pool:
+            data = pool.apply_async(self.cipher_out.encrypt, (nonce, memoryview_to_bytes(data), header)).get
+            self.parallel_encrypted += 1
+        else:
+            data = self.cipher_out.encrypt(nonce, memoryview_to_bytes(data), header)
+        cryptolog("sending %s bytes %s-%s encrypted", payload_size, self.cipher_out_name, self.cipher_out_mode)
+        if join:
+            return [(header+nonce+data, scb, ecb)]
+        return [(header+nonce, scb, None), (data, None, ecb)]
+
     def raw_write(self, contents, start_cb=None, end_cb=None):
         """ Warning: this bypasses the compression and packet encoder! """
-        self._write_queue.put(((contents, start_cb, end_cb), ))
+        self._write_queue.put((((contents, start_cb, end_cb), ), ))
 
     def verify_packet(self, packet):
         """ look for None values which may have caused the packet to fail encoding """
@@ -390,6 +601,34 @@ class Protocol(object):
                 self.do_verify_packet(new_tree("value for key='%s'" % str(k)), v)
 
 
+    def enable_splice(self, splice_cb):
+        """
+            The splice callback is called with the packet type and the raw chunks
+            (still compressed) of every packet we receive, before it is decoded.
+            If the callback returns True, it has taken care of the packet,
+            otherwise the packet is decoded and processed as usual.
+        """
+        self._splice_cb = splice_cb
+
+    def accepts_chunks(self, chunks):
+        """
+            Can the raw chunks of a packet be sent as they are to our peer?
+            The packet encoder and the compressors used must be supported by it.
+        """
+        for proto_flags, index, level, _ in chunks:
+            if index==0:
+                encoder = packet_encoding.get_packet_encoding_type(proto_flags)
+                if encoder not in (self.encoder, "bencode"):
+                    return False
+            if level>0:
+                compressor = compression.get_compression_type(level)
+                if compressor not in self.compressors and compressor!=self.compressor:
+                    return False
+                if compressor=="zstd" and not self._compression_policy.zstd_dictionary:
+                    #the chunk may use our dictionary:
+                    return False
+        return True
+
     def enable_default_encoder(self):
         opts = packet_encoding.get_enabled_encoders()
         assert len(opts)>0, "no packet encoders available!"
@@ -424,16 +663,19 @@ class Protocol(object):
             return
         opts = compression.get_enabled_compressors(order=compression.PERFORMANCE_ORDER)
         log("enable_compressor_from_caps(..) options=%s", opts)
-        for c in opts:      #ie: [zlib, lz4, lzo]
-            if caps.boolget(c):
-                self.enable_compressor(c)
-                return
+        #the adaptive compression policy can use any of the compressors we have in common:
+        self.compressors = [c for c in opts if caps.boolget(c)]
+        self._compression_policy.set_zstd_dictionary(caps.intget("zstd.dictionary", 0))
+        if self.compressors:            #ie: [lz4, lzo, zlib]
+            self.enable_compressor(self.compressors[0])
+            return
         log.warn("compression disabled: no matching compressor found")
         self.enable_compressor("none")
 
     def enable_compressor(self, compressor):
         self._compress = compression.get_compressor(compressor)
         self.compressor = compressor
+        self._compression_policy.set_compressors(compressor, self.compressors)
         log("enable_compressor(%s): %s", compressor, self._compress)
 
 
@@ -469,7 +711,7 @@ class Protocol(object):
         packet = list(packet_in)
         level = self.compression_level
         size_check = LARGE_PACKET_SIZE
-        min_comp_size = MIN_COMPRESS_SIZE
+        min_comp_size = self._compression_policy.get_min_compress_size(MIN_COMPRESS_SIZE)
         for i in range(1, len(packet)):
             item = packet[i]
             if item is None:
@@ -512,7 +754,7 @@ class Protocol(object):
             elif ti in (str, bytes) and level>0 and l>LARGE_PACKET_SIZE:
                 log.warn("found a large uncompressed item in packet '%s' at position %s: %s bytes", packet[0], i, len(item))
                 #add new binary packet with large item:
-                cl, cdata = self._compress(item, level)
+                cl, cdata = self._compression_policy.compress("%s[%i]" % (packet[0], i), item, level)
                 packets.append((0, i, cl, cdata))
                 #replace this item with an empty string placeholder:
                 packet[i] = ''
@@ -539,7 +781,7 @@ class Protocol(object):
                      len(main_packet), packet_in[0], [type(x) for x in packet[1:]], [len(str(x)) for x in packet[1:]], repr_ellipsized(packet))
         #compress, but don't bother for small packets:
         if level>0 and len(main_packet)>min_comp_size:
-            cl, cdata = self._compress(main_packet, level)
+            cl, cdata = self._compression_policy.compress(packet_type, main_packet, level)
             packets.append((proto_flags, 0, cl, cdata))
         else:
             packets.append((proto_flags, 0, 0, main_packet))
@@ -579,33 +821,86 @@ class Protocol(object):
             log("write thread: empty marker, exiting")
             self.close()
             return False
+        items = self._encrypt_items(items)
+        writev = self._writev
+        if writev and len(items)>1:
+            return self._writev_items(writev, items)
         for buf, start_cb, end_cb in items:
             con = self._conn
             if not con:
                 return False
+            if callable(buf):
+                #encrypted by the worker pool:
+                buf = buf()
             if start_cb:
-                try:
-                    start_cb(con.output_bytecount)
-                except:
-                    if not self._closed:
-                        log.error("error on %s", start_cb, exc_info=True)
+                self._call_send_cb(start_cb, con.output_bytecount)
             while buf and not self._closed:
                 written = con.write(buf)
                 if written:
-                    buf = buf[written:]
+                    if written<len(buf):
+                        #partial write, don't copy what is left:
+                        buf = memoryview(buf)[written:]
+                    else:
+                        buf = None
                     self.output_raw_packetcount += 1
             if end_cb:
-                try:
-                    end_cb(self._conn.output_bytecount)
-                except:
-                    if not self._closed:
-                        log.error("error on %s", end_cb, exc_info=True)
+                self._call_send_cb(end_cb, self._conn.output_bytecount)
         return True
 
+    def _writev_items(self, writev, items):
+        """
+            Writes all the buffers using scatter/gather I/O without joining them,
+            partial writes are tracked using an index and an offset into the buffers.
+            The callbacks are given the exact byte position of the start and end of their buffer.
+        """
+        con = self._conn
+        if not con:
+            return False
+        #the callables are the buffers encrypted by the worker pool:
+        bufs = [memoryview(buf() if callable(buf) else buf) for buf, _, _ in items]
+        base = con.output_bytecount
+        ends = []
+        pos = base
+        for i, item in enumerate(items):
+            start_cb = item[1]
+            if start_cb:
+                self._call_send_cb(start_cb, pos)
+            pos += len(bufs[i])
+            ends.append(pos)
+        index = 0           #the first buffer that has not been fully written yet
+        offset = 0          #how much of this buffer has already been written
+        total = base        #how much we have written so far
+        while index<len(bufs) and not self._closed:
+            iov = [bufs[index][offset:]] + bufs[index+1:index+IOV_MAX]
+            written = writev(iov)
+            if not written:
+                continue
+            self.output_raw_packetcount += 1
+            total += written
+            #skip the buffers that have been fully written:
+            while index<len(bufs) and ends[index]<=total:
+                end_cb = items[index][2]
+                if end_cb:
+                    self._call_send_cb(end_cb, ends[index])
+                index += 1
+            if index<len(bufs):
+                offset = len(bufs[index])-(ends[index]-total)
+        return True
+
+    def _call_send_cb(self, cb, bytecount):
+        try:
+            cb(bytecount)
+        except:
+            if not self._closed:
+                log.error("error on %s", cb, exc_info=True)
+
     def _read_thread_loop(self):
         self._io_thread_loop("read", self._read)
     def _read(self):
-        buf = self._conn.read(READ_BUFFER_SIZE)
+        if self._read_into:
+            buf = self._read_into_buffer()
+        else:
+            buf = self._conn.read(READ_BUFFER_SIZE)
         #log("read thread: got data of size %s: %s", len(buf), repr_ellipsized(buf))
         #add to the read queue (or whatever takes its place - see steal_connection)
         self._read_queue_put(buf)
@@ -618,6 +913,22 @@ class Protocol(object):
         self.input_raw_packetcount += 1
         return True
 
+    def _read_into_buffer(self):
+        rbuf = self._recv_buffer
+        if rbuf is None:
+            rbuf = bytearray(READ_BUFFER_SIZE)
+            self._recv_buffer = rbuf
+        n = self._read_into(rbuf)
+        if not n:
+            return None
+        if n>=READ_BUFFER_SIZE//2:
+            #hand over the whole buffer without copying it,
+            #we will allocate a new one for the next read:
+            self._recv_buffer = None
+            return memoryview(rbuf)[:n]
+        #small read: copy it so we can re-use our buffer
+        return memoryview(rbuf)[:n].tobytes()
+
     def _internal_error(self, message="", exc=None, exc_info=False):
         #log exception info with last log message
         if self._closed:
@@ -679,8 +990,26 @@ class Protocol(object):
 
     def do_read_parse_thread_loop(self):
         """
-            Process the individual network packets placed in _read_queue.
-            Concatenate the raw packet data, then try to parse it.
+            Process the individual network packets placed in _read_queue,
+            by feeding them to the packet parser.
+        """
+        parser = self.packet_parser()
+        next(parser)
+        while not self._closed:
+            buf = self._read_queue.get()
+            if not buf:
+                log("parse thread: empty marker, exiting")
+                self.idle_add(self.close)
+                return
+            try:
+                parser.send(buf)
+            except StopIteration:
+                return
+
+    def packet_parser(self):
+        """
+            Generator which receives the raw packet data via 'send'.
+            Accumulate the raw packet data, then try to parse it.
             Extract the individual packets from the potentially large buffer,
             saving the rest of the buffer for later, and optionally decompress this data
             and re-construct the one python-object-packet from potentially multiple packets (see packet_index).
@@ -689,23 +1018,17 @@ class Protocol(object):
             this will be called from this parsing thread so any calls that need to be made
             from the UI thread will need to use a callback (usually via 'idle_add')
         """
-        read_buffer = None
+        read_buffer = ReadBuffer()
         payload_size = -1
         padding_size = 0
         packet_index = 0
         compression_level = False
         packet = None
         raw_packets = {}
+        split_packets = {}          #the pieces of the raw items of a split packet
         while not self._closed:
-            buf = self._read_queue.get()
-            if not buf:
-                log("parse thread: empty marker, exiting")
-                self.idle_add(self.close)
-                return
-            if read_buffer:
-                read_buffer = read_buffer + buf
-            else:
-                read_buffer = buf
+            buf = yield
+            read_buffer.append(buf)
             bl = len(read_buffer)
             while not self._closed:
                 packet = None
@@ -713,33 +1036,39 @@ class Protocol(object):
                 if bl<=0:
                     break
                 if payload_size<0:
-                    if read_buffer[0] not in ("P", ord("P")):
-                        self._invalid_header(read_buffer)
+                    header = read_buffer.peek(8)
+                    if header[0] not in ("P", ord("P")):
+                        self._invalid_header(read_buffer.peek(bl))
                         return
                     if bl<8:
                         break   #packet still too small
                     #packet format: struct.pack('cBBBL', ...) - 8 bytes
-                    _, protocol_flags, compression_level, packet_index, data_size = unpack_header(read_buffer[:8])
+                    _, protocol_flags, compression_level, packet_index, data_size = unpack_header(header)
 
                     #sanity check size (will often fail if not an xpra client):
                     if data_size>self.abs_max_packet_size:
-                        self._invalid_header(read_buffer)
+                        self._invalid_header(read_buffer.peek(bl))
                         return
 
                     bl = len(read_buffer)-8
                     if protocol_flags & FLAGS_CIPHER:
                         if self.cipher_in_block_size==0 or not self.cipher_in_name:
                             cryptolog.warn("received cipher block but we don't have a cipher to decrypt it with, not an xpra client?")
-                            self._invalid_header(read_buffer)
+                            self._invalid_header(read_buffer.peek(bl))
                             return
-                        padding_size = self.cipher_in_block_size - (data_size % self.cipher_in_block_size)
-                        payload_size = data_size + padding_size
+                        if self.cipher_in_mode==MODE_GCM:
+                            #no padding, but the nonce and tag:
+                            padding_size = 0
+                            payload_size = data_size + AEAD_OVERHEAD
+                        else:
+                            padding_size = self.cipher_in_block_size - (data_size % self.cipher_in_block_size)
+                            payload_size = data_size + padding_size
                     else:
                         #no cipher, no padding:
                         padding_size = 0
                         payload_size = data_size
                     assert payload_size>0, "invalid payload size: %i" % payload_size
-                    read_buffer = read_buffer[8:]
+                    read_buffer.skip(8)
 
                     if payload_size>self.max_packet_size:
                         #this packet is seemingly too big, but check again from the main UI thread
@@ -753,24 +1082,29 @@ class Protocol(object):
                                               (size_to_check, self.max_packet_size)
                                 self.invalid(msg, packet_header)
                             return False
-                        self.timeout_add(1000, check_packet_size, payload_size, read_buffer[:32])
+                        self.timeout_add(1000, check_packet_size, payload_size, read_buffer.peek(32))
 
                 if bl<payload_size:
                     # incomplete packet, wait for the rest to arrive
                     break
 
-                #chop this packet from the buffer:
-                if len(read_buffer)==payload_size:
-                    raw_string = read_buffer
-                    read_buffer = ''
-                else:
-                    raw_string = read_buffer[:payload_size]
-                    read_buffer = read_buffer[payload_size:]
+                #chop this packet from the buffer,
+                #this may be a memoryview which we can pass directly to the decompressor:
+                data = read_buffer.read(payload_size)
                 #decrypt if needed:
-                data = raw_string
-                if self.cipher_in and protocol_flags & FLAGS_CIPHER:
+                if self.cipher_in and protocol_flags & FLAGS_CIPHER and self.cipher_in_mode==MODE_GCM:
+                    cryptolog("received %i %s-%s encrypted bytes", payload_size, self.cipher_in_name, self.cipher_in_mode)
+                    nonce = memoryview_to_bytes(data[:AEAD_NONCE_SIZE])
+                    try:
+                        data = self.cipher_in.decrypt(nonce, memoryview_to_bytes(data[AEAD_NONCE_SIZE:]), header)
+                    except Exception as e:
+                        cryptolog("%s.decrypt(..)", self.cipher_in, exc_info=True)
+                        cryptolog.warn("Warning: %s-%s decryption failed: %s", self.cipher_in_name, self.cipher_in_mode, e or type(e))
+                        self._internal_error("%s authentication error - wrong key?" % self.cipher_in_name)
+                        return
+                elif self.cipher_in and protocol_flags & FLAGS_CIPHER:
                     cryptolog("received %i %s encrypted bytes with %s padding", payload_size, self.cipher_in_name, padding_size)
-                    data = self.cipher_in.decrypt(raw_string)
+                    data = self.cipher_in.decrypt(memoryview_to_bytes(data))
                     if padding_size > 0:
                         def debug_str(s):
                             try:
@@ -787,46 +1121,66 @@ class Protocol(object):
                             cryptolog(" data does not end with %s padding bytes %s", self.cipher_in_padding, debug_str(padtext))
                             cryptolog(" but with %s (%s)", debug_str(actual_padding), type(data))
                             cryptolog(" decrypted data: %s", debug_str(data[:128]))
-                            return self._internal_error("%s encryption padding error - wrong key?" % self.cipher_in_name)
+                            self._internal_error("%s encryption padding error - wrong key?" % self.cipher_in_name)
+                            return
                         data = data[:-padding_size]
-                #uncompress if needed:
-                if compression_level>0:
-                    try:
-                        data = decompress(data, compression_level)
-                    except InvalidCompressionException as e:
-                        self.invalid("invalid compression: %s" % e, data)
-                        return
-                    except Exception as e:
-                        ctype = compression.get_compression_type(compression_level)
-                        log("%s packet decompression failed", ctype, exc_info=True)
-                        msg = "%s packet decompression failed" % ctype
-                        if self.cipher_in:
-                            msg += " (invalid encryption key?)"
-                        else:
-                            #only include the exception text when not using encryption
-                            #as this may leak crypto information:
-                            msg += " %s" % e
-                        return self.gibberish(msg, data)
-
                 if self.cipher_in and not (protocol_flags & FLAGS_CIPHER):
                     self.invalid("unencrypted packet dropped", data)
                     return
-
                 if self._closed:
                     return
+                if packet_index>0 and protocol_flags & FLAGS_CHUNK:
+                    #a piece of a raw item from a split packet, more may follow:
+                    level, pieces = split_packets.setdefault(packet_index, (compression_level, []))
+                    pieces.append(memoryview_to_bytes(data))
+                    payload_size = -1
+                    packet_index = 0
+                    if len(split_packets)>=4:
+                        self.invalid("too many split packets: %s" % len(split_packets), data)
+                        return
+                    if sum(len(x) for x in pieces)>self.abs_max_packet_size:
+                        self.invalid("split packet is too large", data)
+                        return
+                    continue
                 if packet_index>0:
                     #raw packet, store it and continue:
-                    raw_packets[packet_index] = data
+                    raw_packets[packet_index] = (compression_level, data)
                     payload_size = -1
                     packet_index = 0
                     if len(raw_packets)>=4:
                         self.invalid("too many raw packets: %s" % len(raw_packets), data)
                         return
                     continue
-                #final packet (packet_index==0), decode it:
+                if protocol_flags & FLAGS_CHUNK:
+                    #the end of a split packet, the raw items are now complete:
+                    raw_packets = dict((index, (level, b"".join(pieces))) for index, (level, pieces) in split_packets.items())
+                    split_packets = {}
+                    protocol_flags &= ~FLAGS_CHUNK
+                compressed_data = data
+                data = self.decompress_payload(data, compression_level)
+                if data is None:
+                    return
+                if self._splice_cb:
+                    packet_type = packet_encoding.peek_packet_type(data, protocol_flags)
+                    if packet_type:
+                        chunks = [(0, index, level, memoryview_to_bytes(raw_data)) for index, (level, raw_data) in sorted(raw_packets.items())]
+                        chunks.append((protocol_flags & ~FLAGS_CIPHER, 0, compression_level, memoryview_to_bytes(compressed_data)))
+                        if self._splice_cb(self, packet_type, chunks):
+                            #the packet has been forwarded as it is:
+                            self.input_stats[packet_type] = self.input_stats.get(packet_type, 0)+1
+                            self.input_packetcount += 1
+                            self.spliced_packetcount += 1
+                            self.spliced_bytecount += sum(len(x[3]) for x in chunks)
+                            payload_size = -1
+                            padding_size = 0
+                            raw_packets = {}
+                            continue
+                #final packet (packet_index==0), decode it,
+                #the decoders copy 'data' to bytes only if they need to:
                 try:
                     packet = decode(data, protocol_flags)
                 except InvalidPacketEncodingException as e:
+                    data = memoryview_to_bytes(data)
                     self.invalid("invalid packet encoding: %s" % e, data)
                     return
                 except ValueError as e:
@@ -835,6 +1189,7 @@ class Protocol(object):
                     log.error(" %s", e)
                     if self._closed:
                         return
+                    data = memoryview_to_bytes(data)
                     log("failed to parse %s packet: %s", etype, binascii.hexlify(data[:128]))
                     log(" %s", e)
                     log(" data: %s", repr_ellipsized(data))
@@ -848,9 +1203,12 @@ class Protocol(object):
                 padding_size = 0
                 #add any raw packets back into it:
                 if raw_packets:
-                    for index,raw_data in raw_packets.items():
+                    for index, (level, raw_data) in raw_packets.items():
+                        raw_data = self.decompress_payload(raw_data, level)
+                        if raw_data is None:
+                            return
                         #replace placeholder with the raw_data packet data:
-                        packet[index] = raw_data
+                        packet[index] = memoryview_to_bytes(raw_data)
                     raw_packets = {}
 
                 packet_type = packet[0]
@@ -865,6 +1223,31 @@ class Protocol(object):
                 packet = None
                 INJECT_FAULT(self)
 
+    def decompress_payload(self, data, compression_level):
+        """
+            Returns the decompressed data,
+            or None if it failed (the connection is then closed)
+        """
+        if compression_level<=0:
+            return data
+        try:
+            return decompress(data, compression_level)
+        except InvalidCompressionException as e:
+            self.invalid("invalid compression: %s" % e, data)
+            return None
+        except Exception as e:
+            ctype = compression.get_compression_type(compression_level)
+            log("%s packet decompression failed", ctype, exc_info=True)
+            msg = "%s packet decompression failed" % ctype
+            if self.cipher_in:
+                msg += " (invalid encryption key?)"
+            else:
+                #only include the exception text when not using encryption
+                #as this may leak crypto information:
+                msg += " %s" % e
+            self.gibberish(msg, data)
+            return None
+
     def flush_then_close(self, last_packet, done_callback=None):
         """ Note: this is best effort only
             the packet may not get sent.
@@ -1008,22 +1391,12 @@ class Protocol(object):
         #the format thread will exit:
         self._get_packet_cb = None
         self._source_has_more.set()
+        #the write thread will exit, the pending packets are discarded:
+        self._write_queue.close()
         #make all the queue based threads exit by adding the empty marker:
         exit_queue = Queue()
         for _ in range(10):     #just 2 should be enough!
             exit_queue.put(None)
-        try:
-            owq = self._write_queue
-            self._write_queue = exit_queue
-            #discard all elements in the old queue and push the None marker:
-            try:
-                while owq.qsize()>0:
-                    owq.read(False)
-            except:
-                pass
-            owq.put_nowait(None)
-        except:
-            pass
         try:
             orq = self._read_queue
             self._read_queue = exit_queue
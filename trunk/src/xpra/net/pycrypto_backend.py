@@ -12,8 +12,12 @@ import Crypto
 from Crypto.Protocol.KDF import PBKDF2
 from Crypto.Cipher import AES
 ENCRYPTION_CIPHERS = ["AES"]
+MODES = ["CBC"]
+#only pycryptodome supports GCM:
+if hasattr(AES, "MODE_GCM"):
+    MODES.append("GCM")
 
-__all__ = ("get_info", "get_key", "get_encryptor", "get_decryptor", "ENCRYPTION_CIPHERS")
+__all__ = ("get_info", "get_key", "get_encryptor", "get_decryptor", "get_aead", "ENCRYPTION_CIPHERS", "MODES")
 
 
 def init():
@@ -43,6 +47,26 @@ def get_decryptor(secret, iv):
     return AES.new(secret, AES.MODE_CBC, iv)
 
 
+class GCMCipher(object):
+    def __init__(self, key):
+        self.key = key
+
+    def encrypt(self, nonce, data, aad):
+        cipher = AES.new(self.key, AES.MODE_GCM, nonce=nonce)
+        cipher.update(aad)
+        data, tag = cipher.encrypt_and_digest(data)
+        return data+tag
+
+    def decrypt(self, nonce, data, aad):
+        cipher = AES.new(self.key, AES.MODE_GCM, nonce=nonce)
+        cipher.update(aad)
+        return cipher.decrypt_and_verify(data[:-16], data[-16:])
+
+def get_aead(key):
+    assert "GCM" in MODES, "GCM mode is not supported by this version of pycrypto"
+    return GCMCipher(key)
+
+
 
 def main():
     from xpra.platform import program_context
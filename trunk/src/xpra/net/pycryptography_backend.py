@@ -8,9 +8,10 @@ from xpra.os_util import strtobytes
 from xpra.log import Logger
 log = Logger("network", "crypto")
 
-__all__ = ("get_info", "get_key", "get_encryptor", "get_decryptor", "ENCRYPTION_CIPHERS")
+__all__ = ("get_info", "get_key", "get_encryptor", "get_decryptor", "get_aead", "ENCRYPTION_CIPHERS", "MODES")
 
 ENCRYPTION_CIPHERS = []
+MODES = []
 backend = None
 
 
@@ -44,7 +45,7 @@ def init():
     import sys
     if getattr(sys, 'frozen', False) or sys.platform.startswith("darwin"):
         patch_crypto_be_discovery()
-    global backend, ENCRYPTION_CIPHERS
+    global backend, ENCRYPTION_CIPHERS, MODES
     import cryptography
     assert cryptography
     from cryptography.hazmat.backends import default_backend
@@ -55,6 +56,7 @@ def init():
     from cryptography.hazmat.primitives import hashes
     assert Cipher and algorithms and modes and hashes
     ENCRYPTION_CIPHERS[:] = ["AES"]
+    MODES[:] = ["CBC", "GCM"]
 
 def ci(v):
     try:
@@ -95,6 +97,37 @@ def get_decryptor(key, iv):
     return decryptor
 
 
+class GCMCipher(object):
+    """ same interface as AESGCM, for older versions of python-cryptography """
+    def __init__(self, key):
+        self.key = key
+
+    def encrypt(self, nonce, data, aad):
+        from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+        encryptor = Cipher(algorithms.AES(self.key), modes.GCM(nonce), backend=backend).encryptor()
+        encryptor.authenticate_additional_data(aad)
+        return encryptor.update(data)+encryptor.finalize()+encryptor.tag
+
+    def decrypt(self, nonce, data, aad):
+        from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+        tag = bytes(data[-16:])
+        decryptor = Cipher(algorithms.AES(self.key), modes.GCM(nonce, tag), backend=backend).decryptor()
+        decryptor.authenticate_additional_data(aad)
+        return decryptor.update(data[:-16])+decryptor.finalize()
+
+def get_aead(key):
+    """
+        Returns an object with encrypt(nonce, data, aad) and decrypt(nonce, data, aad) methods,
+        the tag is appended to the encrypted data.
+    """
+    try:
+        from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+    except ImportError:
+        log("no AESGCM class, using GCM mode", exc_info=True)
+        return GCMCipher(key)
+    return AESGCM(key)
+
+
 def main():
     from xpra.platform import program_context
     from xpra.util import print_nested_dict
@@ -0,0 +1,106 @@
+# This file is part of Xpra.
+# Copyright (C) 2016 Antoine Martin <antoine@devloop.org.uk>
+# Xpra is released under the terms of the GNU GPL v2, or, at your option, any
+# later version. See the file COPYING for details.
+
+import sys
+from collections import deque
+
+from xpra.os_util import memoryview_to_bytes
+from xpra.util import envbool
+
+#with python3, the decompressors can use memoryviews directly:
+ZERO_COPY = envbool("XPRA_READ_ZERO_COPY", sys.version_info[0]>=3)
+
+
+class ReadBuffer(object):
+    """
+        Accumulates the chunks of data received from the network without concatenating them,
+        so that a large packet which arrives in many small reads is only copied once,
+        and a packet which is fully contained in a single chunk is not copied at all.
+    """
+
+    def __init__(self):
+        self.chunks = deque()
+        self.offset = 0         #how much of the first chunk has already been consumed
+        self.size = 0           #total number of bytes available
+
+    def __len__(self):
+        return self.size
+
+    def __repr__(self):
+        return "ReadBuffer(%i bytes in %i chunks)" % (self.size, len(self.chunks))
+
+    def append(self, data):
+        l = len(data)
+        if l>0:
+            self.chunks.append(data)
+            self.size += l
+
+    def _consume(self, n):
+        self.size -= n
+        self.offset += n
+        if self.offset==len(self.chunks[0]):
+            self.chunks.popleft()
+            self.offset = 0
+
+    def _slice(self, chunk, start, end):
+        if ZERO_COPY or type(chunk)!=bytes:
+            return memoryview_to_bytes(memoryview(chunk)[start:end])
+        return chunk[start:end]
+
+    def _get_pieces(self, n):
+        #returns the first 'n' bytes as a list of views (zero copy) or bytestrings
+        pieces = []
+        offset = self.offset
+        for chunk in self.chunks:
+            if n<=0:
+                break
+            take = min(len(chunk)-offset, n)
+            if ZERO_COPY:
+                pieces.append(memoryview(chunk)[offset:offset+take])
+            else:
+                pieces.append(self._slice(chunk, offset, offset+take))
+            n -= take
+            offset = 0
+        return pieces
+
+    def peek(self, n):
+        """ returns a copy of the first 'n' bytes (or less if we don't have that many) """
+        if not self.chunks:
+            return b""
+        chunk = self.chunks[0]
+        if len(chunk)-self.offset>=n:
+            return self._slice(chunk, self.offset, self.offset+n)
+        pieces = self._get_pieces(min(n, self.size))
+        return b"".join(memoryview_to_bytes(x) for x in pieces)
+
+    def skip(self, n):
+        assert n<=self.size, "cannot skip %i bytes, only %i available" % (n, self.size)
+        while n>0:
+            take = min(len(self.chunks[0])-self.offset, n)
+            self._consume(take)
+            n -= take
+
+    def read(self, n):
+        """
+            Returns the next 'n' bytes, either as the original chunk,
+            as a memoryview into it (zero copy mode),
+            or as a new bytestring if the data spans multiple chunks.
+        """
+        assert 0<n<=self.size, "cannot read %i bytes, only %i available" % (n, self.size)
+        chunk = self.chunks[0]
+        available = len(chunk)-self.offset
+        if available>=n:
+            if self.offset==0 and available==n:
+                v = chunk
+            elif ZERO_COPY:
+                v = memoryview(chunk)[self.offset:self.offset+n]
+            else:
+                v = self._slice(chunk, self.offset, self.offset+n)
+            self._consume(n)
+            return v
+        #spans multiple chunks, we have to copy it:
+        pieces = self._get_pieces(n)
+        self.skip(n)
+        return b"".join(pieces)
@@ -0,0 +1,420 @@
+# This file is part of Xpra.
+# Copyright (C) 2016 Antoine Martin <antoine@devloop.org.uk>
+# Xpra is released under the terms of the GNU GPL v2, or, at your option, any
+# later version. See the file COPYING for details.
+
+import os
+import socket
+from collections import deque
+from threading import Lock
+
+from xpra.log import Logger
+log = Logger("network", "protocol")
+
+from xpra.os_util import Queue
+from xpra.util import envint, envbool
+from xpra.make_thread import start_thread
+from xpra.net.bytestreams import CONTINUE, ABORT
+from xpra.net.protocol import Protocol, READ_BUFFER_SIZE
+
+"""
+An alternative to the threaded Protocol class:
+instead of using 3 or 4 threads per connection (read, write, parse and format),
+all the connections are multiplexed on a single selector thread
+and only the packet formatting (encoding and compression) is done
+by a small pool of worker threads.
+This is useful for servers that handle many mostly idle connections, like the proxy server.
+"""
+
+SELECTOR_PROTOCOL = envbool("XPRA_SELECTOR_PROTOCOL", False)
+FORMAT_THREADS = envint("XPRA_SELECTOR_FORMAT_THREADS", 4)
+#stop formatting new packets when we have this many buffers waiting to be written:
+MAX_PENDING_WRITES = envint("XPRA_SELECTOR_MAX_PENDING_WRITES", 4)
+
+selectors = None
+try:
+    import selectors                #@UnresolvedImport
+except ImportError:
+    try:
+        import selectors2 as selectors      #@UnresolvedImport @Reimport
+    except ImportError:
+        log("no selectors module, cannot use the selector protocol")
+
+
+def get_protocol_class(conn):
+    """
+        Returns the selector based protocol class if it is enabled
+        and can be used with this connection, the regular threaded Protocol otherwise.
+    """
+    if SELECTOR_PROTOCOL and selectors and SelectorProtocol.can_use(conn):
+        return SelectorProtocol
+    return Protocol
+
+
+class SelectorLoop(object):
+    """
+        Runs a single thread which waits for socket events
+        and dispatches them to the SelectorProtocol instances registered with it.
+    """
+
+    def __init__(self):
+        self.pid = os.getpid()
+        self.selector = selectors.DefaultSelector()
+        self.pending = deque()
+        #used for waking up the selector thread:
+        self.wake_read, self.wake_write = socket.socketpair()
+        self.wake_read.setblocking(False)
+        self.wake_write.setblocking(False)
+        self.selector.register(self.wake_read, selectors.EVENT_READ, None)
+        self.format_queue = Queue()
+        self.format_threads = [start_thread(self.format_loop, "format-%i" % i, daemon=True) for i in range(FORMAT_THREADS)]
+        self.thread = start_thread(self.run, "selector", daemon=True)
+
+    def __repr__(self):
+        return "SelectorLoop(%i connections)" % (len(self.selector.get_map())-1)
+
+    def call(self, fn, *args):
+        """ runs the function from the selector thread """
+        self.pending.append((fn, args))
+        try:
+            self.wake_write.send(b"\0")
+        except socket.error:
+            #buffer full: the selector thread will wake up anyway
+            pass
+
+    def format(self, fn):
+        """ runs the function from one of the format worker threads """
+        self.format_queue.put(fn)
+
+    def format_loop(self):
+        while True:
+            fn = self.format_queue.get()
+            try:
+                fn()
+            except:
+                log.error("Error in selector format worker calling %s", fn, exc_info=True)
+
+    def set_events(self, fileobj, events, protocol):
+        #must be called from the selector thread
+        key = self.selector.get_map().get(fileobj)
+        if events==0:
+            if key:
+                self.selector.unregister(fileobj)
+        elif key is None:
+            self.selector.register(fileobj, events, protocol)
+        elif key.events!=events:
+            self.selector.modify(fileobj, events, protocol)
+
+    def get_info(self):
+        return {
+                "connections"   : len(self.selector.get_map())-1,
+                "format"        : {
+                                   "threads"    : len(self.format_threads),
+                                   "queue"      : self.format_queue.qsize(),
+                                   },
+                }
+
+    def run(self):
+        log("selector loop starting")
+        while True:
+            for key, events in self.selector.select():
+                protocol = key.data
+                if protocol is None:
+                    try:
+                        while self.wake_read.recv(4096):
+                            pass
+                    except socket.error:
+                        pass
+                    continue
+                try:
+                    if events & selectors.EVENT_READ:
+                        protocol._handle_read()
+                    if events & selectors.EVENT_WRITE:
+                        protocol._handle_write()
+                except Exception as e:
+                    protocol._handle_error(e)
+            while self.pending:
+                fn, args = self.pending.popleft()
+                try:
+                    fn(*args)
+                except:
+                    log.error("Error in selector loop calling %s", fn, exc_info=True)
+
+
+#only one selector loop per process:
+loop = None
+loop_lock = Lock()
+
+def get_selector_loop():
+    global loop
+    #(the proxy server forks new processes, which must create their own loop)
+    if loop is not None and loop.pid==os.getpid():
+        return loop
+    with loop_lock:
+        if not loop or loop.pid!=os.getpid():
+            loop = SelectorLoop()
+    return loop
+
+
+class WriteQueue(object):
+    """
+        Replaces the write Queue of the threaded Protocol,
+        the items are written by the selector thread when the socket is writable.
+    """
+    def __init__(self, protocol):
+        self.protocol = protocol
+        self.items = deque()
+
+    def put(self, units, priority=0, stream=None):
+        #the packets are written in order, so we can join the units,
+        #and encrypt them now (in the formatting thread):
+        items = [item for unit in units for item in unit]
+        self.items.append(self.protocol._encrypt_items(items))
+        self.protocol._write_pending()
+
+    def put_nowait(self, items):
+        self.items.append(items)
+        self.protocol._write_pending()
+
+    def announce(self, priority):
+        pass
+
+    def fetched(self, priority):
+        pass
+
+    def qsize(self):
+        return len(self.items)
+
+    def empty(self):
+        return len(self.items)==0 and not self.protocol._write_buffers
+
+
+class SelectorProtocol(Protocol):
+    """
+        A Protocol which does not use any threads of its own:
+        socket I/O and packet parsing happen in the selector thread,
+        packet formatting is done by the selector's worker threads.
+    """
+
+    @staticmethod
+    def can_use(conn):
+        #we need a plain socket we can access directly:
+        return type(conn).__name__=="SocketConnection" and type(getattr(conn, "_socket", None))==socket.socket
+
+    def __init__(self, *args):
+        Protocol.__init__(self, *args)
+        self._loop = get_selector_loop()
+        self._socket = self._conn._socket
+        #small packets are joined with their header, so we can use plain send calls:
+        self._writev = None
+        self._read_into = None
+        #the selector thread must not wait for the encryption worker pool,
+        #the packets are already formatted (and encrypted) by the worker threads:
+        self._parallel_encrypt = False
+        self._write_queue = WriteQueue(self)
+        self._write_buffers = deque()       #(memoryview, start_cb, end_cb)
+        self._write_offset = 0
+        self._formatting = False
+        self._format_lock = Lock()
+        self._parser = None
+        self._registered = False
+        self._read_paused = False
+
+    def __repr__(self):
+        return "SelectorProtocol(%s)" % self._conn
+
+    def get_threads(self):
+        return []
+
+    def wait_for_io_threads_exit(self, timeout=None):
+        return True
+
+    def get_info(self, alias_info=True):
+        info = Protocol.get_info(self, alias_info)
+        #we don't start any threads:
+        info.pop("thread", None)
+        info["selector"] = self._loop.get_info()
+        info["read-paused"] = self._read_paused
+        return info
+
+    def start(self):
+        def do_start():
+            if not self._closed:
+                self._socket.setblocking(False)
+                self._parser = self.packet_parser()
+                next(self._parser)
+                self._registered = True
+                self._update_events()
+        self._loop.call(do_start)
+
+    def _update_events(self):
+        events = 0
+        if self._registered and not self._closed:
+            if not self._read_paused:
+                events = selectors.EVENT_READ
+            if self._write_buffers or self._write_queue.items:
+                events |= selectors.EVENT_WRITE
+        self._loop.set_events(self._socket, events, self)
+
+    def pause_read(self):
+        """
+            Stops reading from the socket until resume_read() is called,
+            the selector thread must never block, so this is how its users apply backpressure.
+            (can be called from any thread)
+        """
+        if not self._read_paused:
+            self._read_paused = True
+            self._loop.call(self._update_events)
+
+    def resume_read(self):
+        if self._read_paused:
+            self._read_paused = False
+            self._loop.call(self._update_events)
+
+    def source_has_more(self, priority=0):
+        self._source_has_more.set()
+        self._may_format()
+
+    def _may_format(self):
+        with self._format_lock:
+            if self._formatting or self._closed:
+                return
+            if len(self._write_queue.items)>=MAX_PENDING_WRITES:
+                #we'll be called again once the writes complete
+                return
+            if not self._source_has_more.is_set():
+                return
+            self._formatting = True
+        self._loop.format(self._format)
+
+    def _format(self):
+        try:
+            while not self._closed and len(self._write_queue.items)<MAX_PENDING_WRITES:
+                gpc = self._get_packet_cb
+                if not self._source_has_more.is_set() or not gpc:
+                    break
+                self._source_has_more.clear()
+                self._add_packet_to_queue(*gpc())
+        except Exception as e:
+            if not self._closed:
+                self._internal_error("error in network packet write/format", e, exc_info=True)
+        finally:
+            with self._format_lock:
+                self._formatting = False
+        #more packets may have been added whilst we were exiting:
+        self._may_format()
+
+    def _write_pending(self):
+        #called from any thread when new items are queued
+        self._loop.call(self._update_events)
+
+    def _handle_read(self):
+        conn = self._conn
+        if not conn or self._closed:
+            return
+        try:
+            buf = self._socket.recv(READ_BUFFER_SIZE)
+        except socket.error as e:
+            if e.args and e.args[0] in CONTINUE:
+                return
+            raise
+        if not buf:
+            log("selector read: eof")
+            self._close_from_loop()
+            return
+        conn.input_bytecount += len(buf)
+        conn.input_readcount += 1
+        self.input_raw_packetcount += 1
+        try:
+            self._parser.send(buf)
+        except StopIteration:
+            #the parser has hit an error, it will close the connection
+            self._loop.set_events(self._socket, 0, self)
+
+    def _handle_write(self):
+        conn = self._conn
+        if not conn or self._closed:
+            return
+        while not self._closed:
+            if not self._write_buffers:
+                if not self._write_queue.items:
+                    break
+                items = self._write_queue.items.popleft()
+                if items is None:
+                    self._close_from_loop()
+                    return
+                for buf, start_cb, end_cb in items:
+                    self._write_buffers.append((memoryview(buf), start_cb, end_cb))
+                #there is room for more packets:
+                self._may_format()
+                continue
+            buf, start_cb, end_cb = self._write_buffers[0]
+            if start_cb and self._write_offset==0:
+                self._call_send_cb(start_cb, conn.output_bytecount)
+            try:
+                written = self._socket.send(buf[self._write_offset:])
+            except socket.error as e:
+                if e.args and e.args[0] in CONTINUE:
+                    break
+                raise
+            if not written:
+                break
+            conn.output_bytecount += written
+            conn.output_writecount += 1
+            self.output_raw_packetcount += 1
+            self._write_offset += written
+            if self._write_offset<len(buf):
+                #partial write: wait for the socket to become writable again
+                break
+            self._write_buffers.popleft()
+            self._write_offset = 0
+            if end_cb:
+                self._call_send_cb(end_cb, conn.output_bytecount)
+        self._update_events()
+
+    def _handle_error(self, e):
+        if self._closed:
+            return
+        code = e.args[0] if e.args else None
+        if code in ABORT:
+            log("%s connection reset: %s", self._conn, ABORT[code])
+            self._connection_lost("connection %s reset" % self._conn)
+        else:
+            self._internal_error("connection %s failed" % self._conn, e, exc_info=True)
+        self._loop.call(self._update_events)
+
+    def _close_from_loop(self):
+        self._registered = False
+        self._update_events()
+        self.idle_add(self.close)
+
+    def close(self):
+        if self._closed:
+            return
+        sock = self._socket
+        def unregister():
+            self._registered = False
+            self._loop.set_events(sock, 0, self)
+        self._loop.call(unregister)
+        Protocol.close(self)
+
+    def steal_connection(self, read_callback=None):
+        assert not self._closed, "cannot steal a closed connection"
+        sock = self._socket
+        def unregister():
+            self._registered = False
+            self._loop.set_events(sock, 0, self)
+        self._loop.call(unregister)
+        return Protocol.steal_connection(self, read_callback)
+
+    def terminate_queue_threads(self):
+        log("terminate_queue_threads()")
+        self._get_packet_cb = None
+        self._source_has_more.set()
+        self._write_queue.items.clear()
+        self._write_buffers.clear()
+
+    def clean(self):
+        Protocol.clean(self)
+        self._parser = None
+
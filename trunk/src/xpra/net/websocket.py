@@ -4,38 +4,217 @@
 # later version. See the file COPYING for details.
 
 import os
+import base64
+import hashlib
 import posixpath
-import urllib
+import socket
+import struct
+from threading import Lock
+
+try:
+    from SimpleHTTPServer import SimpleHTTPRequestHandler       #@UnusedImport
+except ImportError:
+    from http.server import SimpleHTTPRequestHandler            #@Reimport
+try:
+    from urllib import unquote                                  #@UnusedImport
+except ImportError:
+    from urllib.parse import unquote                            #@Reimport
 
 from xpra.log import Logger
 log = Logger("network", "websocket")
 
-from xpra.util import AdHocStruct, envbool
-from xpra.net.bytestreams import SocketConnection
-from websockify.websocket import WebSocketRequestHandler
+from xpra.util import AdHocStruct, envbool, envint
+from xpra.os_util import strtobytes, bytestostr, memoryview_to_bytes
+from xpra.net.bytestreams import SocketConnection, WRITEV, IOV_MAX
 
 WEBSOCKET_TCP_NODELAY = envbool("WEBSOCKET_TCP_NODELAY", True)
 WEBSOCKET_TCP_KEEPALIVE = envbool("WEBSOCKET_TCP_KEEPALIVE", True)
 WEBSOCKET_DEBUG = envbool("XPRA_WEBSOCKET_DEBUG", False)
+#each write becomes a single websocket message, unless it is larger than this:
+#(the browser only gives us the data once the whole message has arrived)
+FRAME_SIZE = envint("XPRA_WEBSOCKET_FRAME_SIZE", 256*1024)
+#the buffer used for reading the frame headers and control frames:
+READ_AHEAD = max(1024, envint("XPRA_WEBSOCKET_READ_AHEAD", 4096))
+
+GUID = b"258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+
+OPCODE_CONTINUATION = 0
+OPCODE_TEXT = 1
+OPCODE_BINARY = 2
+OPCODE_CLOSE = 8
+OPCODE_PING = 9
+OPCODE_PONG = 10
+OPCODE_NAMES = {
+                OPCODE_CONTINUATION : "continuation",
+                OPCODE_TEXT         : "text",
+                OPCODE_BINARY       : "binary",
+                OPCODE_CLOSE        : "close",
+                OPCODE_PING         : "ping",
+                OPCODE_PONG         : "pong",
+                }
+DATA_OPCODES = (OPCODE_CONTINUATION, OPCODE_TEXT, OPCODE_BINARY)
+#control frames cannot have a payload larger than this:
+MAX_CONTROL_PAYLOAD = 125
+MAX_HEADER_SIZE = 14
+
+CLOSE_NORMAL = 1000
+
+
+def python_mask_into(buf, key, offset=0):
+    """ applies the masking key to the writeable buffer given, in place """
+    l = len(buf)
+    if l==0:
+        return
+    o = offset % 4
+    key = bytearray(key)
+    key = key[o:]+key[:o]
+    keys = bytes(key*(l//4+1))[:l]
+    if hasattr(int, "from_bytes"):
+        #python3: let the big integer code do the work
+        v = int.from_bytes(buf, "little") ^ int.from_bytes(keys, "little")
+        buf[:] = v.to_bytes(l, "little")
+    else:
+        data = bytearray(memoryview_to_bytes(buf))
+        for i in range(l):
+            data[i] ^= key[i & 3]
+        buf[:] = bytes(data)
+
+def get_numpy_mask_into():
+    import numpy
+    def numpy_mask_into(buf, key, offset=0):
+        """ applies the masking key to the writeable buffer given, in place """
+        l = len(buf)
+        if l==0:
+            return
+        o = offset % 4
+        key = bytearray(key)
+        key = key[o:]+key[:o]
+        data = numpy.frombuffer(buf, dtype=numpy.uint8)
+        words = l//4
+        if words>0:
+            data[:words*4].view(numpy.uint32)[:] ^= numpy.frombuffer(bytes(key), dtype=numpy.uint32)[0]
+        for i in range(words*4, l):
+            data[i] ^= key[i & 3]
+    return numpy_mask_into
+
+def get_mask_into():
+    try:
+        from xpra.net.websocket_mask import mask_into    #@UnresolvedImport
+        return "cython", mask_into
+    except ImportError as e:
+        log("no cython websocket mask module: %s", e)
+    try:
+        return "numpy", get_numpy_mask_into()
+    except ImportError as e:
+        log("no numpy: %s", e)
+    return "python", python_mask_into
 
+MASK_IMPLEMENTATION, mask_into = get_mask_into()
 
-class WSRequestHandler(WebSocketRequestHandler):
 
+def encode_header(opcode, payload_len, fin=True, mask=None):
+    """ returns the websocket frame header for a payload of the given size """
+    b0 = opcode | (0x80*int(fin))
+    b1 = 0x80*int(bool(mask))
+    if payload_len<126:
+        header = struct.pack("!BB", b0, b1 | payload_len)
+    elif payload_len<0x10000:
+        header = struct.pack("!BBH", b0, b1 | 126, payload_len)
+    else:
+        header = struct.pack("!BBQ", b0, b1 | 127, payload_len)
+    if mask:
+        header += mask
+    return header
+
+def parse_header(buf, start=0, end=None):
+    """
+        Parses the frame header found in the bytearray at the given position,
+        returns (fin, opcode, payload_len, mask, header_len)
+        or None if we don't have the whole header yet.
+    """
+    if end is None:
+        end = len(buf)
+    avail = end-start
+    if avail<2:
+        return None
+    b0, b1 = buf[start], buf[start+1]
+    fin = bool(b0 & 0x80)
+    opcode = b0 & 0xf
+    payload_len = b1 & 0x7f
+    header_len = 2
+    if payload_len==126:
+        header_len = 4
+        if avail<header_len:
+            return None
+        payload_len = struct.unpack_from("!H", buf, start+2)[0]
+    elif payload_len==127:
+        header_len = 10
+        if avail<header_len:
+            return None
+        payload_len = struct.unpack_from("!Q", buf, start+2)[0]
+    mask = None
+    if b1 & 0x80:
+        if avail<header_len+4:
+            return None
+        mask = bytes(buf[start+header_len:start+header_len+4])
+        header_len += 4
+    return fin, opcode, payload_len, mask, header_len
+
+
+class WSRequestHandler(SimpleHTTPRequestHandler):
+    """
+        Serves the html5 client files and upgrades the websocket requests,
+        the websocket connection is handed over to the callback given.
+    """
+
+    protocol_version = "HTTP/1.1"
     disable_nagle_algorithm = WEBSOCKET_TCP_NODELAY
-    keep_alive = WEBSOCKET_TCP_KEEPALIVE
 
     def __init__(self, sock, addr, new_websocket_client, web_root="/usr/share/xpra/www/"):
         self.web_root = web_root
         self._new_websocket_client = new_websocket_client
         server = AdHocStruct()
         server.logger = log
-        server.run_once = True
-        server.verbose = WEBSOCKET_DEBUG
-        WebSocketRequestHandler.__init__(self, sock, addr, server)
+        SimpleHTTPRequestHandler.__init__(self, sock, addr, server)
+
+    def setup(self):
+        SimpleHTTPRequestHandler.setup(self)
+        if WEBSOCKET_TCP_KEEPALIVE:
+            try:
+                self.connection.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+            except Exception as e:
+                log("cannot set SO_KEEPALIVE: %s", e)
 
     def new_websocket_client(self):
         self._new_websocket_client(self)
 
+    def do_GET(self):
+        if (self.headers.get("upgrade") or "").lower()=="websocket":
+            self.handle_upgrade()
+        else:
+            SimpleHTTPRequestHandler.do_GET(self)
+
+    def handle_upgrade(self):
+        key = self.headers.get("Sec-WebSocket-Key")
+        version = self.headers.get("Sec-WebSocket-Version")
+        if not key or version!="13":
+            log("invalid websocket request: key=%s, version=%s", key, version)
+            self.send_error(400, "Unsupported websocket request")
+            return
+        accept = base64.b64encode(hashlib.sha1(strtobytes(key.strip())+GUID).digest())
+        self.send_response(101, "Switching Protocols")
+        self.send_header("Upgrade", "websocket")
+        self.send_header("Connection", "Upgrade")
+        self.send_header("Sec-WebSocket-Accept", bytestostr(accept))
+        protocols = [x.strip() for x in (self.headers.get("Sec-WebSocket-Protocol") or "").split(",")]
+        if "binary" in protocols:
+            self.send_header("Sec-WebSocket-Protocol", "binary")
+        self.end_headers()
+        self.wfile.flush()
+        #the socket belongs to the websocket connection from now on:
+        self.close_connection = True
+        self.new_websocket_client()
+
     def translate_path(self, path):
         #code duplicated from superclass since we can't easily inject the web_root..
         s = path
@@ -44,7 +223,7 @@ class WSRequestHandler(WebSocketRequestHandler):
         path = path.split('#',1)[0]
         # Don't forget explicit trailing slash when normalizing. Issue17324
         trailing_slash = path.rstrip().endswith('/')
-        path = posixpath.normpath(urllib.unquote(path))
+        path = posixpath.normpath(unquote(path))
         words = path.split('/')
         words = filter(None, words)
         path = self.web_root
@@ -68,36 +247,237 @@ class WSRequestHandler(WebSocketRequestHandler):
             log.error(fmt, *args)
 
     def log_message(self, fmt, *args):
-        #log.warn("%s", (fmt, args))
-        log(fmt, *args)
-
-    def print_traffic(self, token="."):
-        """ Show traffic flow mode. """
-        if self.traffic:
-            log(token)
+        if WEBSOCKET_DEBUG:
+            log.info(fmt, *args)
+        else:
+            log(fmt, *args)
 
 
 class WebSocketConnection(SocketConnection):
+    """
+        Reads and writes the xpra byte stream using websocket frames.
+        The xpra protocol does not care about message boundaries,
+        so the payload of the data frames is returned as soon as it arrives,
+        it is unmasked in place and can be received directly into the caller's buffer.
+        Each write becomes a single websocket message, so the packets are not fragmented
+        unless they are larger than FRAME_SIZE.
+    """
 
-    def __init__(self, socket, local, remote, target, info, ws_handler):
-        SocketConnection.__init__(self, socket, local, remote, target, info)
+    def __init__(self, sock, local, remote, target, info, ws_handler=None):
+        SocketConnection.__init__(self, sock, local, remote, target, info)
         self.protocol_type = "websocket"
         self.ws_handler = ws_handler
+        #no need to poll, closing the connection wakes up the blocked reads and writes:
+        sock.settimeout(None)
+        self.write_lock = Lock()
+        #the data frame we are reading the payload of:
+        self.frame_remaining = 0
+        self.frame_mask = None
+        self.frame_offset = 0
+        #the frame headers and control frames are read into this buffer:
+        self.rbuf = bytearray(READ_AHEAD)
+        self.rview = memoryview(self.rbuf)
+        self.rstart = 0
+        self.rend = 0
+        self.close_received = False
+        self.close_sent = False
+        self.frames_in = 0
+        self.frames_out = 0
+        self._sendmsg = None
+        #ssl sockets do not support sendmsg:
+        if WRITEV and type(sock)==socket.socket and hasattr(sock, "sendmsg"):
+            self._sendmsg = sock.sendmsg
+
+    def peek(self, n):
+        #the socket data is framed, we can't peek at it
+        return None
+
+    def get_read_into(self):
+        return self.read_into
+
+    def get_writev(self):
+        return self.writev
 
     def read(self, n):
-        while self.is_active():
-            bufs, closed_string = self.ws_handler.recv_frames()
-            if closed_string:
-                self.active = False
-            if len(bufs) == 1:
-                self.input_bytecount += len(bufs[0])
-                return bufs[0]
-            elif len(bufs) > 1:
-                buf = b''.join(bufs)
-                self.input_bytecount += len(buf)
-                return buf
+        buf = bytearray(n)
+        r = self.read_into(buf)
+        if not r:
+            return b""
+        if r<n:
+            del buf[r:]
+        return buf
+
+    def read_into(self, buf):
+        view = memoryview(buf)
+        while self.is_active() and not self.close_received:
+            if self.frame_remaining==0:
+                if not self._read_frame_header():
+                    return 0
+                continue
+            n = min(len(view), self.frame_remaining)
+            avail = self.rend-self.rstart
+            if avail>0:
+                #some of the payload was read with the header:
+                n = min(n, avail)
+                view[:n] = self.rview[self.rstart:self.rstart+n]
+                self.rstart += n
+            else:
+                n = self.untilConcludes(self._socket.recv_into, view[:n])
+                if not n:
+                    return 0
+            if self.frame_mask:
+                mask_into(view[:n], self.frame_mask, self.frame_offset)
+            self.frame_offset += n
+            self.frame_remaining -= n
+            self.input_bytecount += n
+            self.input_readcount += 1
+            return n
+        return 0
+
+    def _fill(self):
+        """ reads more data into the read ahead buffer, returns False on EOF """
+        if self.rstart==self.rend:
+            self.rstart = self.rend = 0
+        elif len(self.rbuf)-self.rend<MAX_HEADER_SIZE+MAX_CONTROL_PAYLOAD:
+            #move the partial frame to the start of the buffer:
+            avail = self.rend-self.rstart
+            self.rbuf[:avail] = self.rbuf[self.rstart:self.rend]
+            self.rstart = 0
+            self.rend = avail
+        n = self.untilConcludes(self._socket.recv_into, self.rview[self.rend:])
+        if not n:
+            return False
+        self.rend += n
+        return True
+
+    def _read_frame_header(self):
+        """
+            Parses the next frame header and processes the control frames,
+            returns False if the connection is closed.
+        """
+        header = parse_header(self.rbuf, self.rstart, self.rend)
+        while header is None:
+            if not self._fill():
+                return False
+            header = parse_header(self.rbuf, self.rstart, self.rend)
+        _, opcode, payload_len, mask, header_len = header
+        self.rstart += header_len
+        self.frames_in += 1
+        if opcode in DATA_OPCODES:
+            self.frame_remaining = payload_len
+            self.frame_mask = mask
+            self.frame_offset = 0
+            return True
+        if opcode not in OPCODE_NAMES or payload_len>MAX_CONTROL_PAYLOAD:
+            log.warn("Warning: invalid websocket frame, opcode %#x with %i bytes of payload", opcode, payload_len)
+            self.close_received = True
+            return False
+        #control frames are small and never fragmented, read them whole:
+        while self.rend-self.rstart<payload_len:
+            if not self._fill():
+                return False
+        payload = self.rbuf[self.rstart:self.rstart+payload_len]
+        self.rstart += payload_len
+        if mask:
+            mask_into(payload, mask)
+        return self._process_control_frame(opcode, payload)
+
+    def _process_control_frame(self, opcode, payload):
+        log("websocket %s frame with %i bytes of payload", OPCODE_NAMES.get(opcode), len(payload))
+        if opcode==OPCODE_PING:
+            self._send_frame(OPCODE_PONG, payload)
+        elif opcode==OPCODE_CLOSE:
+            if len(payload)>=2:
+                code = struct.unpack_from("!H", payload)[0]
+                log("websocket close code %i: %s", code, bytestostr(bytes(payload[2:])))
+            self.close_received = True
+            if not self.close_sent:
+                self.close_sent = True
+                self._send_frame(OPCODE_CLOSE, payload[:2])
+            return False
+        return True
+
+    def _send_frame(self, opcode, payload):
+        with self.write_lock:
+            self._send_all([encode_header(opcode, len(payload)), payload])
+            self.frames_out += 1
 
     def write(self, buf):
-        self.ws_handler.send_frames([buf])
-        self.output_bytecount += len(buf)
-        return len(buf)
+        return self.writev([buf])
+
+    def writev(self, buffers):
+        """ sends all the buffers as one websocket message, or more if they are larger than FRAME_SIZE """
+        views = [memoryview(x) for x in buffers]
+        total = sum(len(x) for x in views)
+        with self.write_lock:
+            while views:
+                #collect the buffers for the next message:
+                size = 0
+                message = []
+                while views and (FRAME_SIZE<=0 or size<FRAME_SIZE):
+                    v = views.pop(0)
+                    if FRAME_SIZE>0 and size+len(v)>FRAME_SIZE:
+                        #split this buffer:
+                        views.insert(0, v[FRAME_SIZE-size:])
+                        v = v[:FRAME_SIZE-size]
+                    message.append(v)
+                    size += len(v)
+                self._send_all([encode_header(OPCODE_BINARY, size)]+message)
+                self.frames_out += 1
+                self.output_bytecount += size
+        return total
+
+    def _send_all(self, iov):
+        """ sends all the data, a partial write would corrupt the stream """
+        sendmsg = self._sendmsg
+        if not sendmsg:
+            data = memoryview(b"".join(memoryview_to_bytes(x) for x in iov))
+            while data:
+                n = self.untilConcludes(self._socket.send, data)
+                if n is None:
+                    return
+                data = data[n:]
+                self.output_writecount += 1
+            return
+        views = [memoryview(x) for x in iov]
+        while views:
+            n = self.untilConcludes(sendmsg, views[:IOV_MAX])
+            if n is None:
+                return
+            self.output_writecount += 1
+            #drop what has been sent:
+            while views and n>=len(views[0]):
+                n -= len(views.pop(0))
+            if n>0:
+                views[0] = views[0][n:]
+
+    def close(self):
+        s = self._socket
+        if self.is_active() and not self.close_sent and self.write_lock.acquire(False):
+            #try to tell the client, but don't wait for it:
+            try:
+                self.close_sent = True
+                s.settimeout(0)
+                s.send(encode_header(OPCODE_CLOSE, 2)+struct.pack("!H", CLOSE_NORMAL))
+            except Exception as e:
+                log("failed to send the websocket close frame: %s", e)
+            finally:
+                self.write_lock.release()
+        try:
+            #wake up the threads blocked reading from or writing to this socket:
+            s.shutdown(socket.SHUT_RDWR)
+        except Exception as e:
+            log("socket shutdown error: %s", e)
+        SocketConnection.close(self)
+
+    def get_info(self):
+        d = SocketConnection.get_info(self)
+        d["websocket"] = {
+                          "mask"        : MASK_IMPLEMENTATION,
+                          "frame-size"  : FRAME_SIZE,
+                          "frames"      : {
+                                           "in"     : self.frames_in,
+                                           "out"    : self.frames_out,
+                                           },
+                          }
+        return d
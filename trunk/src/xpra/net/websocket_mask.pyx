@@ -0,0 +1,55 @@
+# This file is part of Xpra.
+# Copyright (C) 2016 Antoine Martin <antoine@devloop.org.uk>
+# Xpra is released under the terms of the GNU GPL v2, or, at your option, any
+# later version. See the file COPYING for details.
+
+#!python
+#cython: boundscheck=False, wraparound=False
+
+from libc.stdint cimport uint8_t, uint32_t, uint64_t, uintptr_t
+
+cdef extern from "../buffers/buffers.h":
+    int    object_as_write_buffer(object obj, void ** buffer, Py_ssize_t * buffer_len)
+
+
+cdef inline void mask_bytes(uint8_t *buf, Py_ssize_t l, const uint8_t *key, unsigned int offset) nogil:
+    cdef Py_ssize_t i = 0
+    cdef Py_ssize_t words
+    cdef uint64_t *buf64
+    cdef uint64_t key64
+    cdef uint8_t *k = <uint8_t*> &key64
+    #xor the bytes until the buffer is aligned:
+    while i<l and (<uintptr_t> (buf+i)) % 8!=0:
+        buf[i] ^= key[(offset+i) & 3]
+        i += 1
+    #then 8 bytes at a time, with the key rotated to match the position:
+    cdef unsigned int j
+    for j in range(8):
+        k[j] = key[(offset+i+j) & 3]
+    words = (l-i)//8
+    buf64 = <uint64_t*> (buf+i)
+    cdef Py_ssize_t w = 0
+    while w<words:
+        buf64[w] ^= key64
+        w += 1
+    i += words*8
+    while i<l:
+        buf[i] ^= key[(offset+i) & 3]
+        i += 1
+
+
+def mask_into(buf, key, unsigned int offset=0):
+    """
+        Applies the websocket masking key to the writeable buffer given, in place.
+        The offset is the position of the buffer in the frame payload.
+    """
+    assert len(key)==4, "invalid masking key length: %i" % len(key)
+    cdef uint8_t k[4]
+    cdef unsigned int i
+    for i in range(4):
+        k[i] = key[i]
+    cdef uint8_t *cbuf = NULL
+    cdef Py_ssize_t cbuf_len = 0
+    assert object_as_write_buffer(buf, <void**> &cbuf, &cbuf_len)==0, "cannot get a writeable buffer for %s" % type(buf)
+    with nogil:
+        mask_bytes(cbuf, cbuf_len, k, offset)
@@ -0,0 +1,210 @@
+# This file is part of Xpra.
+# Copyright (C) 2016 Antoine Martin <antoine@devloop.org.uk>
+# Xpra is released under the terms of the GNU GPL v2, or, at your option, any
+# later version. See the file COPYING for details.
+
+import time
+from collections import deque
+from threading import Condition
+
+from xpra.util import envint
+from xpra.simple_stats import get_list_stats
+from xpra.log import Logger
+log = Logger("network", "protocol")
+
+#the priority classes, the most urgent first:
+PRIORITY_CONTROL = 0        #control packets, input echo, cursors, clipboard, etc
+PRIORITY_FOCUSED = 1        #draw packets for the window which has focus
+PRIORITY_BACKGROUND = 2     #draw packets for all the other windows
+PRIORITY_BULK = 3           #sound, file transfers and printing
+PRIORITY_NAMES = ("control", "focused", "background", "bulk")
+
+BULK_PACKETS = ("sound-data", "send-file", "send-file-chunk")
+#the packets which belong to the window stream identified by the window id in the packet:
+WINDOW_PACKETS = ("draw", "new-window", "new-override-redirect", "new-tray", "lost-window",
+                  "window-metadata", "window-icon", "window-move-resize", "configure-override-redirect",
+                  "raise-window", "initiate-moveresize", "pointer-grab", "pointer-ungrab", "bell")
+
+#how many packets of each class can be waiting to be written:
+MAX_QUEUED = max(1, envint("XPRA_WRITE_QUEUE_MAX", 4))
+#how many latency records we keep for each class:
+NRECS = 100
+
+
+class WriteEntry(object):
+    __slots__ = ("priority", "stream", "units", "queued", "started")
+    def __init__(self, priority, stream, units):
+        self.priority = priority
+        self.stream = stream
+        self.units = deque(units)
+        self.queued = time.time()
+        self.started = False
+
+
+class PriorityWriteQueue(object):
+    """
+        Replaces the FIFO write queue of the Protocol class:
+        the packets are written in order of priority, and the packets which have been split
+        into multiple units (see Protocol._add_chunks_to_queue) can be interrupted
+        by more urgent packets between each unit.
+        Only one split packet can be in progress at any time,
+        since the receiver reassembles the pieces of only one split packet at a time.
+        The packets of the same class are always written in the order they were queued,
+        and so are the packets of the same stream (ie: the draw packets of a window):
+        a stream keeps the class of its first packet until all its packets have been written,
+        even if the window gains or loses focus in the meantime.
+    """
+
+    def __init__(self, max_queued=MAX_QUEUED):
+        self.max_queued = max_queued
+        self.cond = Condition()
+        self.queues = tuple(deque() for _ in PRIORITY_NAMES)
+        self.current = None         #the split packet being written
+        self.streams = {}           #stream -> [priority, number of packets queued]
+        self.closed = False
+        #the most urgent class the packet source may give us next:
+        self.source_priority = PRIORITY_BULK
+        #statistics:
+        self.latency = tuple(deque(maxlen=NRECS) for _ in PRIORITY_NAMES)
+        self.packets = [0]*len(PRIORITY_NAMES)
+        self.units = [0]*len(PRIORITY_NAMES)
+        self.interleaved = 0
+
+    def __repr__(self):
+        return "PriorityWriteQueue(%s)" % (tuple(len(q) for q in self.queues), )
+
+    def qsize(self):
+        return sum(len(q) for q in self.queues)
+
+    def empty(self):
+        return self.qsize()==0
+
+    def waiting(self, priority):
+        """ the number of packets not started yet in this class or any of the more urgent ones """
+        return sum(sum(1 for e in self.queues[p] if not e.started) for p in range(priority+1))
+
+    def get_stream_priority(self, stream, priority):
+        """ the stream's packets must use the same class as the ones still queued """
+        s = self.streams.get(stream)
+        if s is None:
+            return priority
+        return s[0]
+
+    def put(self, units, priority=PRIORITY_CONTROL, stream=None):
+        """
+            Adds a packet to write, the units are lists of (buffer, start_cb, end_cb) items.
+            Blocks if there are too many packets of this class already waiting.
+        """
+        with self.cond:
+            while not self.closed:
+                p = self.get_stream_priority(stream, priority)
+                if self.waiting(p)<self.max_queued or len(self.queues[p])==0:
+                    break
+                self.cond.wait()
+            if self.closed:
+                return
+            entry = WriteEntry(p, stream, units)
+            if stream is not None:
+                self.streams.setdefault(stream, [p, 0])[1] += 1
+            self.queues[p].append(entry)
+            self.cond.notify_all()
+
+    def put_nowait(self, items):
+        if items is None:
+            self.close()
+        else:
+            self.put((items, ))
+
+    def close(self):
+        with self.cond:
+            self.closed = True
+            for q in self.queues:
+                q.clear()
+            self.streams = {}
+            self.current = None
+            self.cond.notify_all()
+
+    def announce(self, priority):
+        """ the packet source has more packets for us, the most urgent one is of this class """
+        with self.cond:
+            self.source_priority = min(self.source_priority, priority)
+            self.cond.notify_all()
+
+    def wait_for_room(self):
+        """
+            Waits until we can accept more packets of the class announced by the packet source,
+            so the less urgent classes don't get flooded, but we can still get the urgent packets.
+            Returns False if the queue has been closed.
+        """
+        with self.cond:
+            while not self.closed and self.waiting(self.source_priority)>=self.max_queued:
+                self.cond.wait()
+            #the source will tell us again if it has more urgent packets:
+            self.source_priority = PRIORITY_BULK
+            return not self.closed
+
+    def fetched(self, priority):
+        """ we got a packet of this class from the source, and it has more after it """
+        with self.cond:
+            self.source_priority = min(self.source_priority, priority)
+
+    def get(self):
+        """ returns the next unit to write, or None if the queue has been closed """
+        with self.cond:
+            while not self.closed:
+                entry = self.next_entry()
+                if entry:
+                    return self.pop_unit(entry)
+                self.cond.wait()
+            return None
+
+    def next_entry(self):
+        for q in self.queues:
+            if not q:
+                continue
+            entry = q[0]
+            if entry is self.current or len(entry.units)==1:
+                return entry
+            if self.current is None:
+                self.current = entry
+                return entry
+            #this split packet must wait for the current one to complete,
+            #and so must all the other packets in this class
+        return self.current
+
+    def pop_unit(self, entry):
+        priority = entry.priority
+        if self.current is not None and entry is not self.current:
+            self.interleaved += 1
+        unit = entry.units.popleft()
+        entry.started = True
+        self.units[priority] += 1
+        if not entry.units:
+            #all done with this packet:
+            self.queues[priority].popleft()
+            if entry is self.current:
+                self.current = None
+            self.packets[priority] += 1
+            self.latency[priority].append(time.time()-entry.queued)
+            s = self.streams.get(entry.stream)
+            if s:
+                s[1] -= 1
+                if s[1]==0:
+                    del self.streams[entry.stream]
+        self.cond.notify_all()
+        return unit
+
+    def get_info(self):
+        info = {
+                "max-queued"    : self.max_queued,
+                "interleaved"   : self.interleaved,
+                "streams"       : len(self.streams),
+                }
+        for priority, name in enumerate(PRIORITY_NAMES):
+            info[name] = {
+                          "queued"  : len(self.queues[priority]),
+                          "packets" : self.packets[priority],
+                          "units"   : self.units[priority],
+                          "latency" : get_list_stats(int(1000*x) for x in list(self.latency[priority])),
+                          }
+        return info
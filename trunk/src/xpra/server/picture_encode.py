@@ -266,7 +266,7 @@ def rgb_reformat(image, rgb_formats, supports_transparency):
     return True
 
 
-def mmap_send(mmap, mmap_size, image, rgb_formats, supports_transparency):
+def mmap_send(mmap, mmap_size, image, rgb_formats, supports_transparency, mmap_allocator=None, wid=0):
     if mmap_write is None:
         warn_encoding_once("mmap_write missing", "cannot use mmap!")
         return None
@@ -278,7 +278,10 @@ def mmap_send(mmap, mmap_size, image, rgb_formats, supports_transparency):
     start = time.time()
     data = image.get_pixels()
     assert data, "failed to get pixels from %s" % image
-    mmap_data, mmap_free_size = mmap_write(mmap, mmap_size, data)
+    if mmap_allocator:
+        mmap_data, mmap_free_size = mmap_allocator.write(data, wid)
+    else:
+        mmap_data, mmap_free_size = mmap_write(mmap, mmap_size, data)
     elapsed = time.time()-start+0.000000001 #make sure never zero!
     log("%s MBytes/s - %s bytes written to mmap in %.1f ms", int(len(data)/elapsed/1024/1024), len(data), 1000*elapsed)
     if mmap_data is None:
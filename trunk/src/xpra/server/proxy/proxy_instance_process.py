@@ -8,7 +8,7 @@ import time
 import socket
 import os
 import signal
-from threading import Timer
+from threading import Timer, Lock
 
 from xpra.log import Logger
 log = Logger("proxy")
@@ -19,9 +19,11 @@ from xpra.server.server_core import get_server_info, get_thread_info
 from xpra.scripts.server import deadly_signal
 from xpra.net import compression
 from xpra.net.compression import Compressed, compressed_wrapper
-from xpra.net.protocol import Protocol, get_network_caps
+from xpra.net.protocol import Protocol, SplicedPacket, get_network_caps
+from xpra.net.selector_protocol import get_protocol_class, SelectorProtocol
 from xpra.codecs.loader import load_codecs, get_codec
 from xpra.codecs.image_wrapper import ImageWrapper
+from xpra.codecs.argb.argb import pack_rgb32         #@UnresolvedImport
 from xpra.codecs.video_helper import getVideoHelper, PREFERRED_ENCODER_ORDER
 from xpra.os_util import Queue, SIGNAMES, strtobytes
 from xpra.util import flatten_dict, typedict, updict, repr_ellipsized, xor, std, envint, envbool, \
@@ -44,6 +46,11 @@ except:
 PROXY_QUEUE_SIZE = envint("XPRA_PROXY_QUEUE_SIZE", 10)
 #for testing only: passthrough as RGB:
 PASSTHROUGH = envbool("XPRA_PROXY_PASSTHROUGH", False)
+#forward the packets we don't need to modify without decoding and re-encoding them:
+SPLICE = envbool("XPRA_PROXY_SPLICE", True)
+#the packets we always need to look at:
+SERVER_INTERCEPT_PACKETS = ("hello", "disconnect", "info-response", "lost-window", "challenge")
+CLIENT_INTERCEPT_PACKETS = ("hello", "disconnect", "set_deflate")
 MAX_CONCURRENT_CONNECTIONS = 20
 VIDEO_TIMEOUT = 5                  #destroy video encoder after N seconds of idle state
 
@@ -84,6 +91,9 @@ class ProxyInstanceProcess(Process):
                                "%s: %s.." % (type(caps), repr_ellipsized(caps)), message_queue))
         self.client_protocol = None
         self.server_protocol = None
+        self.client_packets = None
+        self.server_packets = None
+        self.flow_lock = Lock()
         self.exit = False
         self.main_queue = None
         self.message_queue = message_queue
@@ -192,11 +202,13 @@ class ProxyInstanceProcess(Process):
 
         self.main_queue = Queue()
         #setup protocol wrappers:
-        self.server_packets = Queue(PROXY_QUEUE_SIZE)
-        self.client_packets = Queue(PROXY_QUEUE_SIZE)
-        self.client_protocol = Protocol(self, self.client_conn, self.process_client_packet, self.get_client_packet)
+        client_protocol_class = get_protocol_class(self.client_conn)
+        self.client_protocol = client_protocol_class(self, self.client_conn, self.process_client_packet, self.get_client_packet)
         self.client_protocol.restore_state(self.client_state)
-        self.server_protocol = Protocol(self, self.server_conn, self.process_server_packet, self.get_server_packet)
+        self.client_protocol._compression_policy.set_zstd_dictionary(self.caps.intget("zstd.dictionary", 0))
+        server_protocol_class = get_protocol_class(self.server_conn)
+        self.server_protocol = server_protocol_class(self, self.server_conn, self.process_server_packet, self.get_server_packet)
+        self.init_packet_queues()
         #server connection tweaks:
         self.server_protocol.large_packets.append("draw")
         self.server_protocol.large_packets.append("window-icon")
@@ -399,6 +411,7 @@ class ProxyInstanceProcess(Process):
         OPTION_WHITELIST = {"compression_level" : number,
                             "lz4"               : parse_bool,
                             "lzo"               : parse_bool,
+                            "zstd"              : parse_bool,
                             "zlib"              : parse_bool,
                             "rencode"           : parse_bool,
                             "bencode"           : parse_bool,
@@ -414,7 +427,7 @@ class ProxyInstanceProcess(Process):
         return d
 
     def filter_client_caps(self, caps):
-        fc = self.filter_caps(caps, ("cipher", "challenge", "digest", "aliases", "compression", "lz4", "lz0", "zlib"))
+        fc = self.filter_caps(caps, ("cipher", "challenge", "digest", "aliases", "compression", "lz4", "lz0", "zstd", "zlib"))
         #update with options provided via config if any:
         fc.update(self.sanitize_session_options(self.session_options))
         #add video proxies if any:
@@ -502,16 +515,46 @@ class ProxyInstanceProcess(Process):
                 proto.flush_then_close(["disconnect", SERVER_SHUTDOWN, reason])
 
 
+    def init_packet_queues(self):
+        self.client_packets = self.new_packet_queue(self.server_protocol)
+        self.server_packets = self.new_packet_queue(self.client_protocol)
+
+    def new_packet_queue(self, source):
+        if isinstance(source, SelectorProtocol):
+            #the selector thread must never block on a full queue,
+            #so we stop reading from the source connection instead (see queue_packet)
+            return Queue()
+        return Queue(PROXY_QUEUE_SIZE)
+
+    def queue_packet(self, packets, protocol, source, packet):
+        if packets.maxsize>0:
+            #blocks the source's parse thread when the queue is full:
+            packets.put(packet)
+        else:
+            with self.flow_lock:
+                packets.put_nowait(packet)
+                if packets.qsize()>=PROXY_QUEUE_SIZE:
+                    log("%i packets queued for %s, pausing %s", packets.qsize(), protocol, source)
+                    source.pause_read()
+        protocol.source_has_more()
+
+    def get_packet(self, packets, source):
+        p = packets.get()
+        if packets.maxsize==0:
+            with self.flow_lock:
+                if packets.qsize()<PROXY_QUEUE_SIZE:
+                    source.resume_read()
+        return p, None, None, packets.qsize()>0
+
     def queue_client_packet(self, packet):
         log("queueing client packet: %s", packet[0])
-        self.client_packets.put(packet)
-        self.client_protocol.source_has_more()
+        self.queue_packet(self.client_packets, self.client_protocol, self.server_protocol, packet)
 
     def get_client_packet(self):
         #server wants a packet
-        p = self.client_packets.get()
-        log("sending to client: %s", p[0])
-        return p, None, None, self.client_packets.qsize()>0
+        v = self.get_packet(self.client_packets, self.server_protocol)
+        log("sending to client: %s", v[0])
+        return v
 
     def process_client_packet(self, proto, packet):
         packet_type = packet[0]
@@ -527,8 +570,7 @@ class ProxyInstanceProcess(Process):
                 self.stop("disconnect from client: %s" % packet[1])
         elif packet_type=="set_deflate":
             #echo it back to the client:
-            self.client_packets.put(packet)
-            self.client_protocol.source_has_more()
+            self.queue_client_packet(packet)
             return
         elif packet_type=="hello":
             log.warn("invalid hello packet received after initial authentication (dropped)")
@@ -538,14 +580,40 @@ class ProxyInstanceProcess(Process):
 
     def queue_server_packet(self, packet):
         log("queueing server packet: %s", packet[0])
-        self.server_packets.put(packet)
-        self.server_protocol.source_has_more()
+        self.queue_packet(self.server_packets, self.server_protocol, self.client_protocol, packet)
 
     def get_server_packet(self):
         #server wants a packet
-        p = self.server_packets.get()
-        log("sending to server: %s", p[0])
-        return p, None, None, self.server_packets.qsize()>0
+        v = self.get_packet(self.server_packets, self.client_protocol)
+        log("sending to server: %s", v[0])
+        return v
+
+
+    def enable_splice(self):
+        if not SPLICE:
+            return
+        log("enabling splice mode")
+        self.server_protocol.enable_splice(self.splice_server_packet)
+        self.client_protocol.enable_splice(self.splice_client_packet)
+
+    def splice_server_packet(self, proto, packet_type, chunks):
+        if packet_type in SERVER_INTERCEPT_PACKETS:
+            return False
+        if packet_type=="draw" and (PASSTHROUGH or self.video_encoder_types):
+            #we may need to re-encode it
+            return False
+        if not self.client_protocol.accepts_chunks(chunks):
+            return False
+        self.queue_packet(self.client_packets, self.client_protocol, self.server_protocol, SplicedPacket(packet_type, chunks))
+        return True
+
+    def splice_client_packet(self, proto, packet_type, chunks):
+        if packet_type in CLIENT_INTERCEPT_PACKETS:
+            return False
+        if not self.server_protocol.accepts_chunks(chunks):
+            return False
+        self.queue_packet(self.server_packets, self.server_protocol, self.client_protocol, SplicedPacket(packet_type, chunks))
+        return True
 
 
     def _packet_recompress(self, packet, index, name):
@@ -582,10 +650,11 @@ class ProxyInstanceProcess(Process):
             caps = self.filter_server_caps(c)
             #add new encryption caps:
             if self.cipher:
-                from xpra.net.crypto import crypto_backend_init, new_cipher_caps, DEFAULT_PADDING
+                from xpra.net.crypto import crypto_backend_init, new_cipher_caps, DEFAULT_PADDING, DEFAULT_MODE
                 crypto_backend_init()
                 padding_options = self.caps.strlistget("cipher.padding.options", [DEFAULT_PADDING])
-                auth_caps = new_cipher_caps(self.client_protocol, self.cipher, self.encryption_key, padding_options)
+                mode_options = self.caps.strlistget("cipher.mode.options", [DEFAULT_MODE])
+                auth_caps = new_cipher_caps(self.client_protocol, self.cipher, self.encryption_key, padding_options, mode_options)
                 caps.update(auth_caps)
             #may need to bump packet size:
             proto.max_packet_size = maxw*maxh*4*4
@@ -595,6 +664,10 @@ class ProxyInstanceProcess(Process):
             self.client_protocol.max_packet_size = max(self.client_protocol.max_packet_size, file_max_packet_size)
             self.server_protocol.max_packet_size = max(self.server_protocol.max_packet_size, file_max_packet_size)
             packet = ("hello", caps)
+            #send the hello before any spliced packets:
+            self.queue_client_packet(packet)
+            self.enable_splice()
+            return
         elif packet_type=="info-response":
             #adds proxy info:
             #note: this is only seen by the client application
@@ -695,6 +768,9 @@ class ProxyInstanceProcess(Process):
                 enclog.warn("error encoding packet", exc_info=True)
 
 
+    def client_supports_rgb32(self):
+        return "rgb32" in self.caps.strlistget("encodings.core", self.caps.strlistget("encodings"))
+
     def process_draw(self, packet):
         wid, x, y, width, height, encoding, pixels, _, rowstride, client_options = packet[1:11]
         #never modify mmap packets
@@ -715,27 +791,26 @@ class ProxyInstanceProcess(Process):
 
         def passthrough(strip_alpha=True):
             enclog("proxy draw: %s passthrough (rowstride: %s vs %s, strip alpha=%s)", rgb_format, rowstride, client_options.get("rowstride", 0), strip_alpha)
-            if strip_alpha:
-                #passthrough as plain RGB:
-                Xindex = rgb_format.upper().find("X")
-                if Xindex>=0 and len(rgb_format)==4:
-                    #force clear alpha (which may be garbage):
-                    newdata = bytearray(pixels)
-                    for i in range(len(pixels)/4):
-                        newdata[i*4+Xindex] = chr(255)
-                    packet[9] = client_options.get("rowstride", 0)
-                    cdata = bytes(newdata)
-                else:
-                    cdata = pixels
-                new_client_options = {"rgb_format" : rgb_format}
-            else:
+            if not strip_alpha:
                 #preserve
-                cdata = pixels
-                new_client_options = client_options
+                wrapped = Compressed("%s pixels" % encoding, pixels)
+                return send_updated(encoding, wrapped, client_options)
+            #passthrough as plain RGB:
+            cdata = pixels
+            new_rgb_format = rgb_format
+            new_encoding = "rgb24"
+            if len(rgb_format)==4:
+                #force clear alpha (which may be garbage),
+                #or drop it if the client does not support rgb32,
+                #and remove any rowstride padding:
+                src_rowstride = client_options.get("rowstride", rowstride)
+                rgb24 = not self.client_supports_rgb32()
+                new_rgb_format, cdata, new_rowstride = pack_rgb32(pixels, width, height, src_rowstride, rgb_format, rgb24)
+                packet[9] = new_rowstride
+                if not rgb24:
+                    new_encoding = "rgb32"
             wrapped = Compressed("%s pixels" % encoding, cdata)
-            #FIXME: we should not assume that rgb32 is supported here...
-            #(we may have to convert to rgb24..)
-            return send_updated("rgb32", wrapped, new_client_options)
+            return send_updated(new_encoding, wrapped, {"rgb_format" : new_rgb_format})
 
         proxy_video = client_options.get("proxy", False)
         if PASSTHROUGH and (encoding in ("rgb32", "rgb24") or proxy_video):
@@ -36,7 +36,7 @@ from xpra.server.server_core import ServerCore, get_thread_info
 from xpra.server.control_command import ArgsControlCommand, ControlError
 from xpra.simple_stats import to_std_unit
 from xpra.child_reaper import getChildReaper
-from xpra.os_util import BytesIOClass, thread, get_hex_uuid, livefds, load_binary_file
+from xpra.os_util import BytesIOClass, thread, get_hex_uuid, livefds
 from xpra.util import typedict, flatten_dict, updict, envbool, log_screen_sizes, engs, repr_ellipsized, csv, iround, \
     SERVER_EXIT, SERVER_ERROR, SERVER_SHUTDOWN, DETACH_REQUEST, NEW_CLIENT, DONE, IDLE_TIMEOUT
 from xpra.net.bytestreams import set_socket_timeout
@@ -1516,7 +1516,7 @@ class ServerBase(ServerCore):
 
     def control_command_send_file(self, filename, openit, client_uuids, maxbitrate=0):
         openit = str(openit).lower() in ("open", "true", "1")
-        return self.do_control_file_command("send file", client_uuids, filename, "file_tranfer", (False, openit))
+        return self.do_control_file_command("send file", client_uuids, filename, "file_transfer", (False, openit))
 
     def control_command_print(self, filename, printer, client_uuids, maxbitrate=0, title="", *options_strs):
         #parse options into a dict:
@@ -1532,32 +1532,27 @@ class ServerBase(ServerCore):
         sources = self._control_get_sources(client_uuids)
         if not sources:
             raise ControlError("no clients found matching: %s" % client_uuids)
-        #find the file and load it:
+        #find the file:
         actual_filename = os.path.abspath(os.path.expanduser(filename))
         try:
             stat = os.stat(actual_filename)
             filelog("os.stat(%s)=%s", actual_filename, stat)
         except os.error:
             filelog("os.stat(%s)", actual_filename, exc_info=True)
-        if not os.path.exists(actual_filename):
             raise ControlError("file '%s' does not exist" % filename)
-        data = load_binary_file(actual_filename)
         #verify size:
-        file_size_MB = len(data)//1024//1024
-        if file_size_MB>self.file_size_limit:
-            raise ControlError("file '%s' is too large: %iMB (limit is %iMB)" % (filename, file_size_MB, self.file_size_limit))
-        return sources, data
-        #send it to each client:
+        file_size_MB = stat.st_size//1024//1024
+        #send it to each client, the file is read from disk one chunk at a time:
         for ss in sources:
             if not getattr(ss, source_flag_name):       #ie: ServerSource.file_transfer
                 log.warn("Warning: cannot %s '%s'", command_type, filename)
                 log.warn(" client %s does not support this feature", ss)
-            elif file_size_MB>ss.file_size_limit:
+            elif file_size_MB>ss.remote_file_size_limit:
                 log.warn("Warning: cannot %s '%s'", command_type, filename)
-                log.warn(" client %s file size limit is %iMB (file is %iMB)", ss, ss.file_size_limit, file_size_MB)
+                log.warn(" client %s file size limit is %iMB (file is %iMB)", ss, ss.remote_file_size_limit, file_size_MB)
             else:
-                ss.send_file(filename, "", data, *send_file_args)
-        return "%s of '%s' to %s initiated" % (command_type, client_uuids)
+                ss.send_file_from_path(actual_filename, "", *send_file_args)
+        return "%s of '%s' to %s initiated" % (command_type, filename, client_uuids)
 
 
     def control_command_compression(self, compression):
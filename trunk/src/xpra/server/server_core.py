@@ -34,8 +34,10 @@ from xpra.platform import set_name
 from xpra.os_util import load_binary_file, get_machine_id, get_user_uuid, platform_name, SIGNAMES
 from xpra.version_util import version_compat_check, get_version_info_full, get_platform_info, get_host_info, local_version
 from xpra.net.protocol import Protocol, get_network_caps, sanity_checks
-from xpra.net.crypto import crypto_backend_init, new_cipher_caps, get_salt, \
-        ENCRYPTION_CIPHERS, ENCRYPT_FIRST_PACKET, DEFAULT_IV, DEFAULT_SALT, DEFAULT_ITERATIONS, INITIAL_PADDING, DEFAULT_PADDING, ALL_PADDING_OPTIONS
+from xpra.net.selector_protocol import get_protocol_class
+from xpra.net.crypto import crypto_backend_init, new_cipher_caps, get_salt, get_cipher_mode, \
+        ENCRYPTION_CIPHERS, ENCRYPT_FIRST_PACKET, DEFAULT_IV, DEFAULT_SALT, DEFAULT_ITERATIONS, INITIAL_PADDING, DEFAULT_PADDING, ALL_PADDING_OPTIONS, \
+        DEFAULT_MODE, MODES
 from xpra.server.background_worker import stop_worker, get_worker
 from xpra.make_thread import start_thread
 from xpra.scripts.fdproxy import XpraProxy
@@ -234,9 +236,9 @@ class ServerCore(object):
                 self._html = True
             except ImportError as e:
                 if self._html is None:  #auto mode
-                    log.info("html server unavailable, cannot find websockify module")
+                    log.info("html server unavailable, cannot load the websocket module")
                 else:
-                    log.error("Error: cannot import websockify connection handler:")
+                    log.error("Error: cannot import the websocket connection handler:")
                     log.error(" %s", e)
                     log.error(" the html server will not be available")
                 self._html = False
@@ -585,7 +587,8 @@ class ServerCore(object):
 
 
     def make_protocol(self, socktype, conn, frominfo=""):
-        protocol = Protocol(self, conn, self.process_packet)
+        protocol_class = get_protocol_class(conn)
+        protocol = protocol_class(self, conn, self.process_packet)
         self._potential_protocols.append(protocol)
         protocol.large_packets.append("info-response")
         protocol.challenge_sent = False
@@ -610,7 +613,8 @@ class ServerCore(object):
         authlog("socktype=%s, auth class=%s, encryption=%s, keyfile=%s", socktype, protocol.auth_class, protocol.encryption, protocol.keyfile)
         if protocol.encryption and ENCRYPT_FIRST_PACKET:
             password = self.get_encryption_key(None, protocol.keyfile)
-            protocol.set_cipher_in(protocol.encryption, DEFAULT_IV, password, DEFAULT_SALT, DEFAULT_ITERATIONS, INITIAL_PADDING)
+            cipher = get_cipher_mode(protocol.encryption)[0]
+            protocol.set_cipher_in(cipher, DEFAULT_IV, password, DEFAULT_SALT, DEFAULT_ITERATIONS, INITIAL_PADDING)
         protocol.start()
         self.timeout_add(SOCKET_TIMEOUT*1000, self.verify_connection_accepted, protocol)
 
@@ -691,13 +695,11 @@ class ServerCore(object):
         from xpra.net.websocket import WebSocketConnection, WSRequestHandler
         try:
             sock = conn._socket
-            #set the websocket to non-blocking because:
+            #use a timeout for the http requests,
+            #(the websocket connection switches to blocking mode)
             # * win32 servers don't seem to honour our request to use blocking sockets anyway
-            #   (this should not be needed on any other platform,
-            #   maybe this should go in websockify somewhere instead)
             # * the proxy server needs this to steal the connection?
-            sock.setblocking(False)
-            sock.settimeout(1.0)
+            sock.settimeout(SOCKET_TIMEOUT)
             if sys.platform.startswith("win"):
                 from xpra.net.bytestreams import untilConcludes
                 saved_recv = sock.recv
@@ -848,6 +850,7 @@ class ServerCore(object):
         c = typedict(capabilities)
         proto.set_compression_level(c.intget("compression_level", self.compression_level))
         proto.enable_compressor_from_caps(c)
+        proto.set_split_packets(c.boolget("split-packets"))
         if not proto.enable_encoder_from_caps(c):
             #this should never happen:
             #if we got here, we parsed a packet from the client!
@@ -923,6 +926,8 @@ class ServerCore(object):
         iterations = c.intget("cipher.key_stretch_iterations")
         padding = c.strget("cipher.padding", DEFAULT_PADDING)
         padding_options = c.strlistget("cipher.padding.options", [DEFAULT_PADDING])
+        mode = c.strget("cipher.mode", DEFAULT_MODE)
+        mode_options = c.strlistget("cipher.mode.options", [DEFAULT_MODE])
         auth_caps = {}
         if cipher and cipher_iv:
             if cipher not in ENCRYPTION_CIPHERS:
@@ -936,10 +941,20 @@ class ServerCore(object):
             if padding not in ALL_PADDING_OPTIONS:
                 auth_failed("unsupported padding: %s" % padding)
                 return False
+            #the mode may be specified in the server configuration, ie: "AES-GCM":
+            required_mode = get_cipher_mode(proto.encryption)[1]
+            if mode not in MODES or (required_mode and mode!=required_mode):
+                auth_failed("unsupported cipher mode: %s" % mode)
+                return False
+            if required_mode:
+                mode_options = [x for x in mode_options if x==required_mode]
+                if not mode_options:
+                    auth_failed("the client does not support the %s cipher mode" % required_mode)
+                    return False
             authlog("set output cipher using encryption key '%s'", repr_ellipsized(encryption_key))
-            proto.set_cipher_out(cipher, cipher_iv, encryption_key, key_salt, iterations, padding)
+            proto.set_cipher_out(cipher, cipher_iv, encryption_key, key_salt, iterations, padding, mode)
             #use the same cipher as used by the client:
-            auth_caps = new_cipher_caps(proto, cipher, encryption_key, padding_options)
+            auth_caps = new_cipher_caps(proto, cipher, encryption_key, padding_options, mode_options)
             authlog("server cipher=%s", auth_caps)
         else:
             if proto.encryption:
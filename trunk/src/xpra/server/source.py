@@ -28,18 +28,22 @@ mmaplog = Logger("mmap")
 dbuslog = Logger("dbus")
 statslog = Logger("stats")
 notifylog = Logger("notify")
+bandwidthlog = Logger("bandwidth")
 
 
 from xpra.server.source_stats import GlobalPerformanceStatistics
 from xpra.server.window.window_video_source import WindowVideoSource
 from xpra.server.window.window_source import WindowSource
 from xpra.server.window.batch_config import DamageBatchConfig
+from xpra.server.window.shared_encode import get_shared_encode_cache
 from xpra.simple_stats import get_list_stats, std_unit
 from xpra.codecs.video_helper import getVideoHelper
 from xpra.codecs.codec_constants import video_spec
 from xpra.net import compression
 from xpra.net.compression import compressed_wrapper, Compressed, Compressible
 from xpra.net.file_transfer import FileTransferHandler
+from xpra.net.pacing import Pacer, get_packet_size
+from xpra.net.write_queue import PRIORITY_FOCUSED, PRIORITY_BACKGROUND
 from xpra.make_thread import start_thread
 from xpra.os_util import platform_name, Queue, get_machine_id, get_user_uuid, BytesIOClass
 from xpra.server.background_worker import add_work_item
@@ -63,6 +67,19 @@ PRINTER_LOCATION_STRING = os.environ.get("XPRA_PRINTER_LOCATION_STRING", "via xp
 PROPERTIES_DEBUG = [x.strip() for x in os.environ.get("XPRA_WINDOW_PROPERTIES_DEBUG", "").split(",")]
 
 MIN_PIXEL_RECALCULATE = envint("XPRA_MIN_PIXEL_RECALCULATE", 2000)
+#spread the damage packets using the bandwidth estimate:
+PACING = envbool("XPRA_PACING", True)
+#send faster than the estimate (in percent) so we can detect when more bandwidth becomes available:
+PACING_GAIN = envint("XPRA_PACING_GAIN", 125)
+
+def get_default_encode_threads():
+    try:
+        import multiprocessing
+        cpus = multiprocessing.cpu_count()
+    except:
+        cpus = 1
+    return max(1, min(4, cpus//2))
+ENCODE_THREADS = max(1, envint("XPRA_ENCODE_THREADS", get_default_encode_threads()))
 
 counter = AtomicInteger()
 
@@ -216,9 +233,12 @@ class ServerSource(FileTransferHandler):
     See 'next_packet'.
 
     The UI thread calls damage(), which goes into WindowSource and eventually (batching may be involved)
-    adds the damage pixels ready for processing to the encode_work_queue,
-    items are picked off by the separate 'encode' thread (see 'encode_loop')
+    adds the damage pixels ready for processing to one of the encode_work_queues,
+    items are picked off by the separate 'encode' threads (see 'encode_loop')
     and added to the damage_packet_queue.
+    Each window is bound to a single encode thread (see 'get_encode_index'),
+    so its packets are generated in sequence order and its video encoder
+    contexts are only ever used from the same thread.
     """
 
     def __init__(self, protocol, disconnect_cb, idle_add, timeout_add, source_remove,
@@ -278,6 +298,8 @@ class ServerSource(FileTransferHandler):
         WindowSource.staticinit(idle_add, timeout_add, source_remove)
         self.get_transient_for = get_transient_for
         self.get_focus = get_focus
+        #the draw packets of the window that has focus are sent first:
+        protocol.set_focused_window_cb(get_focus)
         self.get_cursor_data_cb = get_cursor_data_cb
         self.get_window_id = get_window_id
         self.window_filters = window_filters
@@ -285,6 +307,7 @@ class ServerSource(FileTransferHandler):
         self.supports_mmap = supports_mmap
         self.mmap = None
         self.mmap_size = 0
+        self.mmap_allocator = None
         self.mmap_client_token = None                   #the token we write that the client may check
         # mouse echo:
         self.mouse_echo = False
@@ -321,8 +344,9 @@ class ServerSource(FileTransferHandler):
         self.connection_time = time.time()
 
         # the queues of damage requests we work through:
-        self.encode_work_queue = Queue()            #holds functions to call to compress data (pixels, clipboard)
-                                                    #items placed in this queue are picked off by the "encode" thread,
+        self.encode_work_queues = [Queue() for _ in range(ENCODE_THREADS)]
+                                                    #each queue holds functions to call to compress data (pixels, clipboard)
+                                                    #items placed in these queues are picked off by the "encode" threads,
                                                     #the functions should add the packets they generate to the 'packet_queue'
         self.packet_queue = deque()                 #holds actual packets ready for sending (already encoded)
                                                     #these packets are picked off by the "protocol" via 'next_packet()'
@@ -334,6 +358,8 @@ class ServerSource(FileTransferHandler):
         self.video_helper = getVideoHelper().clone()
         #these statistics are shared by all WindowSource instances:
         self.statistics = GlobalPerformanceStatistics()
+        self.pacer = Pacer()
+        self.pacing_timer = None
         self.last_user_event = time.time()
         self.last_ping_echoed_time = 0
 
@@ -343,7 +369,12 @@ class ServerSource(FileTransferHandler):
 
         # ready for processing:
         protocol.set_packet_source(self.next_packet)
-        self.encode_thread = start_thread(self.encode_loop, "encode")
+        self.encode_threads = []
+        for i, q in enumerate(self.encode_work_queues):
+            name = "encode"
+            if i>0:
+                name = "encode-%i" % i
+            self.encode_threads.append(start_thread(self.encode_loop, name, False, (q, )))
         #dbus:
         if self.dbus_control:
             try:
@@ -449,15 +480,22 @@ class ServerSource(FileTransferHandler):
         log("%s.close()", self)
         FileTransferHandler.cleanup(self)
         self.close_event.set()
+        get_shared_encode_cache().remove_source(self)
+        pt = self.pacing_timer
+        if pt:
+            self.pacing_timer = None
+            self.source_remove(pt)
         for window_source in self.window_sources.values():
             window_source.cleanup()
         self.window_sources = {}
-        #it is now safe to add the end of queue marker:
+        #it is now safe to add the end of queue markers:
         #(all window sources will have stopped queuing data)
-        self.encode_work_queue.put(None)
+        for q in self.encode_work_queues:
+            q.put(None)
         #this should be a noop since we inherit an initialized helper:
         self.video_helper.cleanup()
         if self.mmap:
+            self.mmap_allocator = None
             self.mmap.close()
             self.mmap = None
             self.mmap_size = 0
@@ -479,6 +517,8 @@ class ServerSource(FileTransferHandler):
         if self.is_closed():
             return
         self.statistics.update_averages()
+        if PACING:
+            self.pacer.set_rate(self.statistics.bandwidth_estimate*PACING_GAIN//100)
         wids = list(self.calculate_window_ids)  #make a copy so we don't clobber new wids
         focus = self.get_focus()
         sources = self.window_sources.items()
@@ -712,6 +752,8 @@ class ServerSource(FileTransferHandler):
         self.clipboard_notifications = c.boolget("clipboard.notifications")
         self.clipboard_set_enabled = c.boolget("clipboard.set_enabled")
         self.share = c.boolget("share")
+        if self.share:
+            get_shared_encode_cache().add_source(self)
         self.window_initiate_moveresize = c.boolget("window.initiate-moveresize")
         self.system_tray = c.boolget("system_tray")
         self.control_commands = c.strlistget("control_commands")
@@ -898,9 +940,15 @@ class ServerSource(FileTransferHandler):
                         self.mmap_size = 0
                     else:
                         self.mmap_client_token = new_token
+                        from xpra.net.mmap_pipe import MMAP_SLOTS, MmapAllocator
+                        if MMAP_SLOTS and c.boolget("mmap_slots"):
+                            self.mmap_allocator = MmapAllocator(self.mmap, self.mmap_size)
 
+        #without the slot allocator, the client must read the mmap area in the order we write it:
+        self.protocol.set_ordered_window_packets(self.mmap_size>0 and self.mmap_allocator is None)
         if self.mmap_size>0:
             mmaplog.info(" mmap is enabled using %sB area in %s", std_unit(self.mmap_size, unit=1024), mmap_filename)
+            mmaplog(" slot allocator: %s", self.mmap_allocator)
         else:
             others = [x for x in self.core_encodings if x in self.server_core_encodings and x!=self.encoding]
             if self.encoding=="auto":
@@ -1313,11 +1361,34 @@ class ServerSource(FileTransferHandler):
         if not self.is_closed():
             if len(self.ordinary_packets)>0:
                 packet = self.ordinary_packets.pop(0)
-            elif len(self.packet_queue)>0:
+            elif len(self.packet_queue)>0 and not self.pacing_delayed():
                 packet, _, _, start_send_cb, end_send_cb = self.packet_queue.popleft()
+            if packet is not None:
+                self.pacer.consume(get_packet_size(packet))
             have_more = packet is not None and (len(self.ordinary_packets)>0 or len(self.packet_queue)>0)
         return packet, start_send_cb, end_send_cb, have_more
 
+    def pacing_delayed(self):
+        """
+            Returns True if we have to wait before sending more damage packets,
+            in which case a timer will tell the protocol layer when it can send again.
+            (the ordinary packets are never delayed)
+        """
+        if self.pacing_timer:
+            return True
+        delay = self.pacer.get_delay()
+        if delay<=0:
+            return False
+        bandwidthlog("pacing: delaying damage packets by %ims", 1000*delay)
+        def pacing_done():
+            self.pacing_timer = None
+            p = self.protocol
+            if p:
+                p.source_has_more(PRIORITY_BACKGROUND)
+            return False
+        self.pacing_timer = self.timeout_add(max(1, int(1000*delay)), pacing_done)
+        return True
+
     def send(self, *parts):
         """ This method queues non-damage packets (higher priority) """
         self.ordinary_packets.append(parts)
@@ -1394,6 +1465,7 @@ class ServerSource(FileTransferHandler):
         if self.wants_features:
             capabilities.update({
                          "mmap_enabled"         : self.mmap_size>0,
+                         "mmap_slots"           : self.mmap_allocator is not None,
                          "auto_refresh_delay"   : self.auto_refresh_delay,
                          })
         if self.mmap_client_token:
@@ -1471,6 +1543,8 @@ class ServerSource(FileTransferHandler):
                     i += 1
             info["window-filter"] = finfo
         info["file-transfers"] = FileTransferHandler.get_info(self)
+        if self.mmap_allocator:
+            info["mmap"] = self.mmap_allocator.get_info()
         info["sound"] = self.get_sound_info()
         info.update(self.get_features_info())
         info.update(self.get_screen_info())
@@ -1534,13 +1608,17 @@ class ServerSource(FileTransferHandler):
         if len(pqpixels)>0:
             pqpi["current"] = pqpixels[-1]
         info = {"damage"    : {
-                               "compression_queue"      : {"size" : {"current" : self.encode_work_queue.qsize()}},
+                               "compression_queue"      : {"size"       : {"current" : self.get_encode_qsize()},
+                                                           "threads"    : len(self.encode_work_queues),
+                                                           },
                                "packet_queue"           : {"size" : {"current" : len(self.packet_queue)}},
                                "packet_queue_pixels"    : pqpi,
                                },
                 "batch"     : self.global_batch_config.get_info(),
                 }
         info.update(self.statistics.get_info())
+        info.setdefault("bandwidth", {})["pacing"] = self.pacer.get_info()
+        info.setdefault("encoding", {})["shared"] = get_shared_encode_cache().get_info()
 
         if len(window_ids)>0:
             total_pixels = 0
@@ -1600,7 +1678,7 @@ class ServerSource(FileTransferHandler):
                 self.send_clipboard_enabled(msg)
                 return
         #call compress_clibboard via the work queue:
-        self.encode_work_queue.put((True, self.compress_clipboard, packet))
+        self.encode_work_queues[0].put((True, self.compress_clipboard, packet))
 
     def compress_clipboard(self, packet):
         #Note: this runs in the 'encode' thread!
@@ -1711,6 +1789,11 @@ class ServerSource(FileTransferHandler):
         self.send("webcam-stop", device, message)
 
 
+    def get_file_transfer_scope(self):
+        #the user this connection has been authenticated as:
+        auth = getattr(self.protocol, "authenticator", None)
+        return getattr(auth, "username", "") or ""
+
     def set_printers(self, printers, password_file, auth, encryption, encryption_keyfile):
         printlog("set_printers(%s, %s, %s, %s, %s) for %s", printers, password_file, auth, encryption, encryption_keyfile, self)
         if self.machine_id==get_machine_id() and not ADD_LOCAL_PRINTERS:
@@ -2071,7 +2154,12 @@ class ServerSource(FileTransferHandler):
         ws = self.window_sources.get(wid)
         if ws is None:
             batch_config = self.make_batch_config(wid, window)
-            ws = WindowVideoSource(self.queue_size, self.call_in_encode_thread, self.queue_packet, self.compressed_wrapper,
+            index = self.get_encode_index(wid)
+            def queue_size():
+                return self.encode_work_queues[index].qsize()
+            def call_in_encode_thread(*fn_and_args):
+                self.call_in_encode_thread_index(index, *fn_and_args)
+            ws = WindowVideoSource(queue_size, call_in_encode_thread, self.queue_packet, self.compressed_wrapper,
                               self.statistics,
                               wid, window, batch_config, self.auto_refresh_delay,
                               self.av_sync, self.av_sync_delay,
@@ -2080,7 +2168,10 @@ class ServerSource(FileTransferHandler):
                               self.encoding, self.encodings, self.core_encodings, self.window_icon_encodings, self.encoding_options, self.icons_encoding_options,
                               self.rgb_formats,
                               self.default_encoding_options,
-                              self.mmap, self.mmap_size)
+                              self.mmap, self.mmap_size, self.mmap_allocator)
+            #start with the encoding costs measured for our other windows:
+            for ows in list(self.window_sources.values()):
+                ws.encoding_model.seed(ows.encoding_model)
             self.window_sources[wid] = ws
         return ws
 
@@ -2120,16 +2211,28 @@ class ServerSource(FileTransferHandler):
 #
 # Methods used by WindowSource:
 #
-    def queue_size(self):
-        return self.encode_work_queue.qsize()
+    def get_encode_qsize(self):
+        return sum(q.qsize() for q in self.encode_work_queues)
+
+    def get_encode_index(self, wid):
+        """
+            Each window is always processed by the same encode thread,
+            this preserves the packet ordering and keeps video encoder contexts on one thread.
+        """
+        if self.mmap and not self.mmap_allocator:
+            #mmap writes must be serialized and queued in the same order,
+            #unless we use the slot allocator:
+            return 0
+        return wid % len(self.encode_work_queues)
 
-    def call_in_encode_thread(self, *fn_and_args):
+    def call_in_encode_thread_index(self, index, *fn_and_args):
         """
-            This is used by WindowSource to queue damage processing to be done in the 'encode' thread.
+            This is used by WindowSource to queue damage processing to be done in its 'encode' thread.
             The 'encode_and_send_cb' will then add the resulting packet to the 'packet_queue' via 'queue_packet'.
         """
-        self.statistics.compression_work_qsizes.append((time.time(), self.encode_work_queue.qsize()))
-        self.encode_work_queue.put(fn_and_args)
+        q = self.encode_work_queues[index]
+        self.statistics.compression_work_qsizes.append((time.time(), q.qsize()))
+        q.put(fn_and_args)
 
     def queue_packet(self, packet, wid=0, pixels=0, start_send_cb=None, end_send_cb=None):
         """
@@ -2143,20 +2246,23 @@ class ServerSource(FileTransferHandler):
         self.packet_queue.append((packet, wid, pixels, start_send_cb, end_send_cb))
         p = self.protocol
         if p:
-            p.source_has_more()
+            if wid>0 and wid==self.get_focus():
+                p.source_has_more(PRIORITY_FOCUSED)
+            else:
+                p.source_has_more(PRIORITY_BACKGROUND)
 
 #
 # The damage packet thread loop:
 #
-    def encode_loop(self):
+    def encode_loop(self, encode_work_queue):
         """
             This runs in a separate thread and calls all the function callbacks
-            which are added to the 'encode_work_queue'.
+            which are added to its 'encode_work_queue'.
             Must run until we hit the end of queue marker,
             to ensure all the queued items get called.
         """
         while True:
-            fn_and_args = self.encode_work_queue.get(True)
+            fn_and_args = encode_work_queue.get(True)
             if fn_and_args is None:
                 return              #empty marker
             #some function calls are optional and can be skipped when closing:
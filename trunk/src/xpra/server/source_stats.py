@@ -12,11 +12,19 @@ from collections import deque
 
 from xpra.log import Logger
 log = Logger("stats")
+bandwidthlog = Logger("stats", "bandwidth")
 
 from xpra.server.cystats import logp, calculate_time_weighted_average, calculate_for_target, queue_inspect  #@UnresolvedImport
 from xpra.simple_stats import get_list_stats
+from xpra.util import envint
 
 NRECS = 500
+#only use the records from this many seconds for estimating the bandwidth:
+BANDWIDTH_PERIOD = envint("XPRA_BANDWIDTH_PERIOD", 5)
+#smaller packets are dominated by the latency, don't use them for measuring the throughput:
+BANDWIDTH_MIN_PACKET = envint("XPRA_BANDWIDTH_MIN_PACKET", 16*1024)
+#user defined upper limit (in bits per second):
+BANDWIDTH_LIMIT = envint("XPRA_BANDWIDTH_LIMIT", 0)
 
 
 class GlobalPerformanceStatistics(object):
@@ -52,6 +60,10 @@ class GlobalPerformanceStatistics(object):
                                                             #(event_time, elapsed_time_in_seconds)
         self.server_ping_latency = deque(maxlen=NRECS)      #time it took for the client to get a ping_echo back from us:
                                                             #(event_time, elapsed_time_in_seconds)
+        self.socket_writes = deque(maxlen=NRECS)            #how long it took to write the damage packets to the socket:
+                                                            #(event_time, bytecount, elapsed_time_in_seconds)
+        self.client_throughput = deque(maxlen=NRECS)        #how long it took for the damage packets to reach the client (excluding decoding):
+                                                            #(event_time, bytecount, elapsed_time_in_seconds)
         self.client_load = None
         self.damage_events_count = 0
         self.packet_count = 0
@@ -66,6 +78,11 @@ class GlobalPerformanceStatistics(object):
         self.min_server_ping_latency = self.DEFAULT_LATENCY
         self.avg_server_ping_latency = self.DEFAULT_LATENCY
         self.recent_server_ping_latency = self.DEFAULT_LATENCY
+        #bytes per second, zero until we have enough data:
+        self.write_speed = 0
+        self.ack_speed = 0
+        self.bandwidth_estimate = 0
+        self.send_rate = 0
 
     def record_latency(self, wid, decode_time, start_send_at, end_send_at, pixels, bytecount):
         now = time.time()
@@ -78,6 +95,11 @@ class GlobalPerformanceStatistics(object):
         if self.min_client_latency is None or self.min_client_latency>send_latency:
             self.min_client_latency = send_latency
         self.client_latency.append((wid, time.time(), pixels, send_latency))
+        if bytecount>=BANDWIDTH_MIN_PACKET:
+            self.client_throughput.append((now, bytecount, send_latency))
+
+    def record_write(self, bytecount, elapsed):
+        self.socket_writes.append((time.time(), bytecount, elapsed))
 
     def get_damage_pixels(self, wid):
         """ returns the list of (event_time, pixelcount) for the given window id """
@@ -98,6 +120,50 @@ class GlobalPerformanceStatistics(object):
             data = list(self.server_ping_latency)
             self.min_server_ping_latency = min([x for _,x in data])
             self.avg_server_ping_latency, self.recent_server_ping_latency = calculate_time_weighted_average(data)
+        self.update_bandwidth()
+
+    def update_bandwidth(self):
+        """
+            Estimates the bandwidth available using two measurements:
+            * the socket write speed, which is only slow when the socket buffers are full,
+              (in which case it tells us how fast the link is draining them)
+            * the speed at which the data reaches the client, using the ack latency
+              minus the lowest latency we have seen (which we assume is the network round trip time)
+            Each one can overestimate the bandwidth, so we use the lowest value.
+        """
+        now = time.time()
+        cutoff = now-BANDWIDTH_PERIOD
+        writes = [(t-elapsed, t, bytecount) for t, bytecount, elapsed in list(self.socket_writes) if t>=cutoff]
+        self.write_speed = 0
+        self.send_rate = 0
+        if writes:
+            total = sum(bytecount for _, _, bytecount in writes)
+            #the packets may be written together (writev), so we count the time spent writing only once:
+            busy = 0
+            busy_end = 0
+            for start, end, _ in sorted(writes):
+                if end>busy_end:
+                    busy += end-max(start, busy_end)
+                    busy_end = end
+            self.write_speed = int(total/max(0.001, busy))
+            self.send_rate = int(total/BANDWIDTH_PERIOD)
+        acks = [(bytecount, elapsed) for t, bytecount, elapsed in list(self.client_throughput) if t>=cutoff]
+        self.ack_speed = 0
+        if acks:
+            rtt = self.min_client_latency or 0
+            self.ack_speed = int(sum(bytecount for bytecount, _ in acks)/sum(max(0.001, elapsed-rtt) for _, elapsed in acks))
+        estimates = [x for x in (self.write_speed, self.ack_speed, BANDWIDTH_LIMIT//8) if x>0]
+        self.bandwidth_estimate = 0
+        if estimates:
+            self.bandwidth_estimate = min(estimates)
+        bandwidthlog("update_bandwidth() write speed=%iKB/s, ack speed=%iKB/s, estimate=%iKB/s, send rate=%iKB/s",
+                     self.write_speed//1024, self.ack_speed//1024, self.bandwidth_estimate//1024, self.send_rate//1024)
+
+    def get_bandwidth_usage(self):
+        """ how much of the estimated bandwidth we have been using recently, as a ratio (0 if unknown) """
+        if self.bandwidth_estimate<=0:
+            return 0
+        return float(self.send_rate)/self.bandwidth_estimate
 
     def get_factors(self, target_latency, pixel_count):
         factors = []
@@ -164,6 +230,13 @@ class GlobalPerformanceStatistics(object):
                                                },
                             },
                 "encoding" : {"decode_errors"   : self.decode_errors},
+                "bandwidth" : {
+                            ""              : self.bandwidth_estimate,
+                            "write-speed"   : self.write_speed,
+                            "ack-speed"     : self.ack_speed,
+                            "send-rate"     : self.send_rate,
+                            "limit"         : BANDWIDTH_LIMIT,
+                            },
             }
         #client pixels per second:
         now = time.time()
@@ -165,6 +165,14 @@ def get_target_speed(wid, window_dimensions, batch, global_statistics, statistic
     #combine factors: use the highest one:
     target = min(1.0, max(dam_lat_abs, dam_lat_rel, dec_lat, pps, 0.0))
 
+    #if we are sending more than the estimated bandwidth,
+    #spend more time compressing:
+    bandwidth_usage = global_statistics.get_bandwidth_usage()
+    bandwidth_factor = 1.0
+    if bandwidth_usage>1.0:
+        bandwidth_factor = 1.0/bandwidth_usage
+        target *= bandwidth_factor
+
     #scale target between min_speed and 100:
     ms = min(100.0, max(min_speed, 0.0))
     target_speed = int(ms + (100.0-ms) * target)
@@ -186,6 +194,10 @@ def get_target_speed(wid, window_dimensions, batch, global_statistics, statistic
                                            "target"   : int(target_decode_speed),
                                            "factor"   : int(100.0*dec_lat),
                                            },
+            "bandwidth"                 : {
+                                           "usage"    : int(100.0*bandwidth_usage),
+                                           "factor"   : int(100.0*bandwidth_factor),
+                                           },
             }
     return info, target_speed
 
@@ -240,6 +252,12 @@ def get_target_quality(wid, window_dimensions, batch, global_statistics, statist
         #if the latency is too high, lower quality target:
         latency_q = 3.0 * statistics.target_latency / global_statistics.recent_client_latency
         target = min(target, latency_q)
+    bandwidth_q = -1
+    bandwidth_usage = global_statistics.get_bandwidth_usage()
+    if bandwidth_usage>0:
+        #if we are sending more than the estimated bandwidth, lower the quality:
+        bandwidth_q = 1.0 / bandwidth_usage
+        target = min(target, bandwidth_q)
     target = min(1.0, max(0.0, target))
     if min_speed>0:
         #discount the quality more aggressively if we have speed requirements to satisfy:
@@ -262,4 +280,6 @@ def get_target_quality(wid, window_dimensions, batch, global_statistics, statist
         info["batch-delay-ratio"] = int(100.0*batch_q)
     if latency_q>=0:
         info["latency"] = int(100.0*latency_q)
+    if bandwidth_q>=0:
+        info["bandwidth"] = int(100.0*bandwidth_q)
     return info, target_quality
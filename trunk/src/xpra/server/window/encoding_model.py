@@ -0,0 +1,226 @@
+# This file is part of Xpra.
+# Copyright (C) 2016 Antoine Martin <antoine@devloop.org.uk>
+# Xpra is released under the terms of the GNU GPL v2, or, at your option, any
+# later version. See the file COPYING for details.
+
+import time
+
+from xpra.util import envint, envbool
+from xpra.log import Logger
+log = Logger("encoding")
+
+ENCODING_MODEL = envbool("XPRA_ENCODING_MODEL", True)
+#we need this many samples before trusting the predictions for a bucket:
+MIN_SAMPLES = max(1, envint("XPRA_ENCODING_MODEL_MIN_SAMPLES", 3))
+#weight of the new samples in the moving averages (in percent):
+SAMPLE_WEIGHT = max(1, min(100, envint("XPRA_ENCODING_MODEL_WEIGHT", 20)))
+#try an encoding we have no recent data for once every N decisions (0 to disable):
+EXPLORE = envint("XPRA_ENCODING_MODEL_EXPLORE", 10)
+#samples older than this many seconds are measured again when exploring (0 to disable):
+STALE = envint("XPRA_ENCODING_MODEL_STALE", 30)
+#only try an encoding if its estimated latency is within this percentage of the default encoding's:
+EXPLORE_MAX_COST = envint("XPRA_ENCODING_MODEL_EXPLORE_MAX_COST", 200)
+#only try an encoding we know nothing about for regions up to this many pixels:
+EXPLORE_MAX_PIXELS = envint("XPRA_ENCODING_MODEL_EXPLORE_MAX_PIXELS", 128*128)
+#bandwidth assumed until we have measured it (bytes per second):
+DEFAULT_BANDWIDTH = envint("XPRA_ENCODING_MODEL_BANDWIDTH", 10*1024*1024)
+
+#the encodings the model chooses from:
+MODEL_ENCODINGS = ("rgb24", "rgb32", "png", "webp", "jpeg")
+#the output of the lossy encodings varies a lot with the quality,
+#so their statistics are recorded separately for each quality band:
+LOSSY_ENCODINGS = ("webp", "jpeg")
+QUALITY_BAND = 25
+
+#the region sizes are grouped in buckets: up to 4K pixels, then doubling up to 4M pixels
+MIN_BUCKET_BITS = 12
+MAX_BUCKET = 10
+
+
+def get_size_bucket(pixels):
+    return max(0, min(MAX_BUCKET, int(pixels).bit_length()-MIN_BUCKET_BITS))
+
+def get_bucket_name(bucket):
+    if bucket==0:
+        return "<%i" % (1<<MIN_BUCKET_BITS)
+    return ">=%i" % (1<<(MIN_BUCKET_BITS+bucket-1))
+
+def get_quality_band(encoding, quality):
+    if encoding not in LOSSY_ENCODINGS:
+        return 0
+    #(quality=100 is lossless and gets a band of its own)
+    return max(0, min(100, int(quality)))//QUALITY_BAND
+
+
+class EncodingCostModel(object):
+    """
+        Learns how long each picture encoding takes and how much data it produces for a window,
+        using the moving averages of the actual encoding times and compressed sizes per pixel,
+        for each region size bucket (small regions have a much higher overhead per pixel)
+        and for each quality band of the lossy encodings.
+        We can then predict the latency of sending a region with each encoding:
+        the encoding time plus the time it takes to transmit the compressed data.
+    """
+
+    def __init__(self):
+        self.stats = {}             #(encoding, bucket, band) -> [samples, seconds per pixel, bytes per pixel, last sample time]
+        self.last = {}              #bucket -> last decision
+        self.decisions = 0
+        self.overrides = 0
+        self.explored = 0
+
+    def __repr__(self):
+        return "EncodingCostModel(%i)" % len(self.stats)
+
+    def reset(self):
+        self.__init__()
+
+    def record(self, encoding, pixels, size, elapsed, quality=100):
+        """ records the result of encoding this many pixels """
+        if pixels<=0 or size<=0 or elapsed<0:
+            return
+        key = (encoding, get_size_bucket(pixels), get_quality_band(encoding, quality))
+        tpp = float(elapsed)/pixels
+        bpp = float(size)/pixels
+        now = time.time()
+        s = self.stats.get(key)
+        if s is None:
+            self.stats[key] = [1, tpp, bpp, now]
+            return
+        w = SAMPLE_WEIGHT/100.0
+        s[0] += 1
+        s[1] = s[1]*(1-w) + tpp*w
+        s[2] = s[2]*(1-w) + bpp*w
+        s[3] = now
+
+    def seed(self, model):
+        """
+            Copies the statistics of another window's model for the buckets we have no samples for,
+            so we can make predictions without waiting for samples of our own.
+        """
+        for key, s in list(model.stats.items()):
+            if key not in self.stats:
+                self.stats[key] = list(s)
+
+    def get_samples(self, encoding, bucket, band=0):
+        s = self.stats.get((encoding, bucket, band))
+        if not s:
+            return 0
+        return s[0]
+
+    def get_sample_time(self, encoding, bucket, band=0):
+        s = self.stats.get((encoding, bucket, band))
+        if not s:
+            return 0
+        return s[3]
+
+    def predict(self, encoding, pixels, bandwidth, quality=100):
+        """
+            Returns the estimated latency in seconds for sending this many pixels with the given encoding,
+            or None if we don't have enough samples yet.
+        """
+        s = self.stats.get((encoding, get_size_bucket(pixels), get_quality_band(encoding, quality)))
+        if not s or s[0]<MIN_SAMPLES:
+            return None
+        tpp, bpp = s[1:3]
+        return pixels*tpp + pixels*bpp/max(1, bandwidth)
+
+    def estimate(self, encoding, pixels, bandwidth, quality=100):
+        """
+            Returns the latency estimated from the bucket closest to this region size
+            that we have samples for, or None if we have never used this encoding at this quality.
+        """
+        bucket = get_size_bucket(pixels)
+        band = get_quality_band(encoding, quality)
+        closest = None
+        for (e, b, q), s in list(self.stats.items()):
+            if e==encoding and q==band and (closest is None or abs(b-bucket)<abs(closest[0]-bucket)):
+                closest = b, s
+        if closest is None:
+            return None
+        tpp, bpp = closest[1][1:3]
+        return pixels*tpp + pixels*bpp/max(1, bandwidth)
+
+    def can_explore(self, encoding, pixels, bandwidth, default, quality=100):
+        """
+            We only try an encoding if it should not cost much more than the default one,
+            or for small regions if we have never used one of them.
+        """
+        cost = self.estimate(encoding, pixels, bandwidth, quality)
+        default_cost = self.estimate(default, pixels, bandwidth, quality)
+        if cost is None or default_cost is None:
+            #we can't compare them:
+            return pixels<=EXPLORE_MAX_PIXELS
+        return cost<=default_cost*EXPLORE_MAX_COST/100.0
+
+    def is_stale(self, encoding, bucket, band, now):
+        return STALE>0 and now-self.get_sample_time(encoding, bucket, band)>STALE
+
+    def choose(self, candidates, pixels, bandwidth, default, quality=100):
+        """
+            Returns the candidate encoding with the lowest predicted latency.
+            We only override the default choice when we have predictions for it,
+            and we occasionally try the cheap candidates we don't have enough data for yet,
+            or whose samples are getting old (the content of the window may have changed).
+        """
+        if not candidates or default not in candidates:
+            return default
+        self.decisions += 1
+        bucket = get_size_bucket(pixels)
+        predictions = {}
+        for encoding in candidates:
+            p = self.predict(encoding, pixels, bandwidth, quality)
+            if p is not None:
+                predictions[encoding] = p
+        choice = default
+        reason = "default"
+        if default in predictions:
+            best = min(predictions, key=predictions.get)
+            if predictions[best]<predictions[default]:
+                choice = best
+                reason = "predicted"
+                self.overrides += 1
+        if EXPLORE>0 and self.decisions%EXPLORE==0:
+            now = time.time()
+            def band(encoding):
+                return get_quality_band(encoding, quality)
+            explore = [x for x in candidates if x!=choice and (x not in predictions or self.is_stale(x, bucket, band(x), now))
+                       and self.can_explore(x, pixels, bandwidth, default, quality)]
+            if explore:
+                #the encodings we have never tried first, then the oldest samples:
+                choice = min(explore, key=lambda x : self.get_sample_time(x, bucket, band(x)))
+                reason = "explore"
+                self.explored += 1
+        self.last[bucket] = (pixels, default, choice, reason, predictions)
+        log("choose%s=%s (%s) predictions=%s", (candidates, pixels, bandwidth, default), choice, reason, predictions)
+        return choice
+
+    def get_info(self):
+        info = {
+                "decisions" : self.decisions,
+                "overrides" : self.overrides,
+                "explored"  : self.explored,
+                }
+        now = time.time()
+        for (encoding, bucket, band), (samples, tpp, bpp, last) in list(self.stats.items()):
+            einfo = info.setdefault(encoding, {})
+            if encoding in LOSSY_ENCODINGS:
+                einfo = einfo.setdefault("quality>=%i" % (band*QUALITY_BAND), {})
+            einfo[get_bucket_name(bucket)] = {
+                "samples"           : samples,
+                "ns-per-pixel"      : int(tpp*1000*1000*1000),
+                "bytes-per-kpixel"  : int(bpp*1000),
+                "age"               : int(now-last),
+                }
+        last = {}
+        for bucket, (pixels, default, choice, reason, predictions) in list(self.last.items()):
+            last[get_bucket_name(bucket)] = {
+                "pixels"    : pixels,
+                "default"   : default,
+                "choice"    : choice,
+                "reason"    : reason,
+                "predicted" : dict((k, int(v*1000*1000)) for k,v in predictions.items()),   #in microseconds
+                }
+        if last:
+            info["last"] = last
+        return info
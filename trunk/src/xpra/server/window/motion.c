@@ -0,0 +1,11665 @@
+/* Generated by Cython 0.29.37 */
+
+/* BEGIN: Cython Metadata
+{
+    "distutils": {
+        "depends": [
+            "xpra/buffers/buffers.h",
+            "xpra/buffers/memalign.h"
+        ],
+        "include_dirs": [
+            "xpra/server/window"
+        ],
+        "name": "xpra.server.window.motion",
+        "sources": [
+            "xpra/server/window/motion.pyx",
+            "xpra/buffers/memalign.c",
+            "xpra/buffers/new_buffers.c"
+        ]
+    },
+    "module_name": "xpra.server.window.motion"
+}
+END: Cython Metadata */
+
+#ifndef PY_SSIZE_T_CLEAN
+#define PY_SSIZE_T_CLEAN
+#endif /* PY_SSIZE_T_CLEAN */
+#include "Python.h"
+#ifndef Py_PYTHON_H
+    #error Python headers needed to compile C extensions, please install development version of Python.
+#elif PY_VERSION_HEX < 0x02060000 || (0x03000000 <= PY_VERSION_HEX && PY_VERSION_HEX < 0x03030000)
+    #error Cython requires Python 2.6+ or Python 3.3+.
+#else
+#define CYTHON_ABI "0_29_37"
+#define CYTHON_HEX_VERSION 0x001D25F0
+#define CYTHON_FUTURE_DIVISION 0
+#include <stddef.h>
+#ifndef offsetof
+  #define offsetof(type, member) ( (size_t) & ((type*)0) -> member )
+#endif
+#if !defined(WIN32) && !defined(MS_WINDOWS)
+  #ifndef __stdcall
+    #define __stdcall
+  #endif
+  #ifndef __cdecl
+    #define __cdecl
+  #endif
+  #ifndef __fastcall
+    #define __fastcall
+  #endif
+#endif
+#ifndef DL_IMPORT
+  #define DL_IMPORT(t) t
+#endif
+#ifndef DL_EXPORT
+  #define DL_EXPORT(t) t
+#endif
+#define __PYX_COMMA ,
+#ifndef HAVE_LONG_LONG
+  #if PY_VERSION_HEX >= 0x02070000
+    #define HAVE_LONG_LONG
+  #endif
+#endif
+#ifndef PY_LONG_LONG
+  #define PY_LONG_LONG LONG_LONG
+#endif
+#ifndef Py_HUGE_VAL
+  #define Py_HUGE_VAL HUGE_VAL
+#endif
+#ifdef PYPY_VERSION
+  #define CYTHON_COMPILING_IN_PYPY 1
+  #define CYTHON_COMPILING_IN_PYSTON 0
+  #define CYTHON_COMPILING_IN_CPYTHON 0
+  #define CYTHON_COMPILING_IN_NOGIL 0
+  #undef CYTHON_USE_TYPE_SLOTS
+  #define CYTHON_USE_TYPE_SLOTS 0
+  #undef CYTHON_USE_PYTYPE_LOOKUP
+  #define CYTHON_USE_PYTYPE_LOOKUP 0
+  #if PY_VERSION_HEX < 0x03050000
+    #undef CYTHON_USE_ASYNC_SLOTS
+    #define CYTHON_USE_ASYNC_SLOTS 0
+  #elif !defined(CYTHON_USE_ASYNC_SLOTS)
+    #define CYTHON_USE_ASYNC_SLOTS 1
+  #endif
+  #undef CYTHON_USE_PYLIST_INTERNALS
+  #define CYTHON_USE_PYLIST_INTERNALS 0
+  #undef CYTHON_USE_UNICODE_INTERNALS
+  #define CYTHON_USE_UNICODE_INTERNALS 0
+  #undef CYTHON_USE_UNICODE_WRITER
+  #define CYTHON_USE_UNICODE_WRITER 0
+  #undef CYTHON_USE_PYLONG_INTERNALS
+  #define CYTHON_USE_PYLONG_INTERNALS 0
+  #undef CYTHON_AVOID_BORROWED_REFS
+  #define CYTHON_AVOID_BORROWED_REFS 1
+  #undef CYTHON_ASSUME_SAFE_MACROS
+  #define CYTHON_ASSUME_SAFE_MACROS 0
+  #undef CYTHON_UNPACK_METHODS
+  #define CYTHON_UNPACK_METHODS 0
+  #undef CYTHON_FAST_THREAD_STATE
+  #define CYTHON_FAST_THREAD_STATE 0
+  #undef CYTHON_FAST_PYCALL
+  #define CYTHON_FAST_PYCALL 0
+  #if PY_VERSION_HEX < 0x03090000
+    #undef CYTHON_PEP489_MULTI_PHASE_INIT
+    #define CYTHON_PEP489_MULTI_PHASE_INIT 0
+  #elif !defined(CYTHON_PEP489_MULTI_PHASE_INIT)
+    #define CYTHON_PEP489_MULTI_PHASE_INIT 1
+  #endif
+  #undef CYTHON_USE_TP_FINALIZE
+  #define CYTHON_USE_TP_FINALIZE (PY_VERSION_HEX >= 0x030400a1 && PYPY_VERSION_NUM >= 0x07030C00)
+  #undef CYTHON_USE_DICT_VERSIONS
+  #define CYTHON_USE_DICT_VERSIONS 0
+  #undef CYTHON_USE_EXC_INFO_STACK
+  #define CYTHON_USE_EXC_INFO_STACK 0
+  #ifndef CYTHON_UPDATE_DESCRIPTOR_DOC
+    #define CYTHON_UPDATE_DESCRIPTOR_DOC 0
+  #endif
+#elif defined(PYSTON_VERSION)
+  #define CYTHON_COMPILING_IN_PYPY 0
+  #define CYTHON_COMPILING_IN_PYSTON 1
+  #define CYTHON_COMPILING_IN_CPYTHON 0
+  #define CYTHON_COMPILING_IN_NOGIL 0
+  #ifndef CYTHON_USE_TYPE_SLOTS
+    #define CYTHON_USE_TYPE_SLOTS 1
+  #endif
+  #undef CYTHON_USE_PYTYPE_LOOKUP
+  #define CYTHON_USE_PYTYPE_LOOKUP 0
+  #undef CYTHON_USE_ASYNC_SLOTS
+  #define CYTHON_USE_ASYNC_SLOTS 0
+  #undef CYTHON_USE_PYLIST_INTERNALS
+  #define CYTHON_USE_PYLIST_INTERNALS 0
+  #ifndef CYTHON_USE_UNICODE_INTERNALS
+    #define CYTHON_USE_UNICODE_INTERNALS 1
+  #endif
+  #undef CYTHON_USE_UNICODE_WRITER
+  #define CYTHON_USE_UNICODE_WRITER 0
+  #undef CYTHON_USE_PYLONG_INTERNALS
+  #define CYTHON_USE_PYLONG_INTERNALS 0
+  #ifndef CYTHON_AVOID_BORROWED_REFS
+    #define CYTHON_AVOID_BORROWED_REFS 0
+  #endif
+  #ifndef CYTHON_ASSUME_SAFE_MACROS
+    #define CYTHON_ASSUME_SAFE_MACROS 1
+  #endif
+  #ifndef CYTHON_UNPACK_METHODS
+    #define CYTHON_UNPACK_METHODS 1
+  #endif
+  #undef CYTHON_FAST_THREAD_STATE
+  #define CYTHON_FAST_THREAD_STATE 0
+  #undef CYTHON_FAST_PYCALL
+  #define CYTHON_FAST_PYCALL 0
+  #undef CYTHON_PEP489_MULTI_PHASE_INIT
+  #define CYTHON_PEP489_MULTI_PHASE_INIT 0
+  #undef CYTHON_USE_TP_FINALIZE
+  #define CYTHON_USE_TP_FINALIZE 0
+  #undef CYTHON_USE_DICT_VERSIONS
+  #define CYTHON_USE_DICT_VERSIONS 0
+  #undef CYTHON_USE_EXC_INFO_STACK
+  #define CYTHON_USE_EXC_INFO_STACK 0
+  #ifndef CYTHON_UPDATE_DESCRIPTOR_DOC
+    #define CYTHON_UPDATE_DESCRIPTOR_DOC 0
+  #endif
+#elif defined(PY_NOGIL)
+  #define CYTHON_COMPILING_IN_PYPY 0
+  #define CYTHON_COMPILING_IN_PYSTON 0
+  #define CYTHON_COMPILING_IN_CPYTHON 0
+  #define CYTHON_COMPILING_IN_NOGIL 1
+  #ifndef CYTHON_USE_TYPE_SLOTS
+    #define CYTHON_USE_TYPE_SLOTS 1
+  #endif
+  #undef CYTHON_USE_PYTYPE_LOOKUP
+  #define CYTHON_USE_PYTYPE_LOOKUP 0
+  #ifndef CYTHON_USE_ASYNC_SLOTS
+    #define CYTHON_USE_ASYNC_SLOTS 1
+  #endif
+  #undef CYTHON_USE_PYLIST_INTERNALS
+  #define CYTHON_USE_PYLIST_INTERNALS 0
+  #ifndef CYTHON_USE_UNICODE_INTERNALS
+    #define CYTHON_USE_UNICODE_INTERNALS 1
+  #endif
+  #undef CYTHON_USE_UNICODE_WRITER
+  #define CYTHON_USE_UNICODE_WRITER 0
+  #undef CYTHON_USE_PYLONG_INTERNALS
+  #define CYTHON_USE_PYLONG_INTERNALS 0
+  #ifndef CYTHON_AVOID_BORROWED_REFS
+    #define CYTHON_AVOID_BORROWED_REFS 0
+  #endif
+  #ifndef CYTHON_ASSUME_SAFE_MACROS
+    #define CYTHON_ASSUME_SAFE_MACROS 1
+  #endif
+  #ifndef CYTHON_UNPACK_METHODS
+    #define CYTHON_UNPACK_METHODS 1
+  #endif
+  #undef CYTHON_FAST_THREAD_STATE
+  #define CYTHON_FAST_THREAD_STATE 0
+  #undef CYTHON_FAST_PYCALL
+  #define CYTHON_FAST_PYCALL 0
+  #ifndef CYTHON_PEP489_MULTI_PHASE_INIT
+    #define CYTHON_PEP489_MULTI_PHASE_INIT 1
+  #endif
+  #ifndef CYTHON_USE_TP_FINALIZE
+    #define CYTHON_USE_TP_FINALIZE 1
+  #endif
+  #undef CYTHON_USE_DICT_VERSIONS
+  #define CYTHON_USE_DICT_VERSIONS 0
+  #undef CYTHON_USE_EXC_INFO_STACK
+  #define CYTHON_USE_EXC_INFO_STACK 0
+#else
+  #define CYTHON_COMPILING_IN_PYPY 0
+  #define CYTHON_COMPILING_IN_PYSTON 0
+  #define CYTHON_COMPILING_IN_CPYTHON 1
+  #define CYTHON_COMPILING_IN_NOGIL 0
+  #ifndef CYTHON_USE_TYPE_SLOTS
+    #define CYTHON_USE_TYPE_SLOTS 1
+  #endif
+  #if PY_VERSION_HEX < 0x02070000
+    #undef CYTHON_USE_PYTYPE_LOOKUP
+    #define CYTHON_USE_PYTYPE_LOOKUP 0
+  #elif !defined(CYTHON_USE_PYTYPE_LOOKUP)
+    #define CYTHON_USE_PYTYPE_LOOKUP 1
+  #endif
+  #if PY_MAJOR_VERSION < 3
+    #undef CYTHON_USE_ASYNC_SLOTS
+    #define CYTHON_USE_ASYNC_SLOTS 0
+  #elif !defined(CYTHON_USE_ASYNC_SLOTS)
+    #define CYTHON_USE_ASYNC_SLOTS 1
+  #endif
+  #if PY_VERSION_HEX < 0x02070000
+    #undef CYTHON_USE_PYLONG_INTERNALS
+    #define CYTHON_USE_PYLONG_INTERNALS 0
+  #elif !defined(CYTHON_USE_PYLONG_INTERNALS)
+    #define CYTHON_USE_PYLONG_INTERNALS (PY_VERSION_HEX < 0x030C00A5)
+  #endif
+  #ifndef CYTHON_USE_PYLIST_INTERNALS
+    #define CYTHON_USE_PYLIST_INTERNALS 1
+  #endif
+  #ifndef CYTHON_USE_UNICODE_INTERNALS
+    #define CYTHON_USE_UNICODE_INTERNALS 1
+  #endif
+  #if PY_VERSION_HEX < 0x030300F0 || PY_VERSION_HEX >= 0x030B00A2
+    #undef CYTHON_USE_UNICODE_WRITER
+    #define CYTHON_USE_UNICODE_WRITER 0
+  #elif !defined(CYTHON_USE_UNICODE_WRITER)
+    #define CYTHON_USE_UNICODE_WRITER 1
+  #endif
+  #ifndef CYTHON_AVOID_BORROWED_REFS
+    #define CYTHON_AVOID_BORROWED_REFS 0
+  #endif
+  #ifndef CYTHON_ASSUME_SAFE_MACROS
+    #define CYTHON_ASSUME_SAFE_MACROS 1
+  #endif
+  #ifndef CYTHON_UNPACK_METHODS
+    #define CYTHON_UNPACK_METHODS 1
+  #endif
+  #if PY_VERSION_HEX >= 0x030B00A4
+    #undef CYTHON_FAST_THREAD_STATE
+    #define CYTHON_FAST_THREAD_STATE 0
+  #elif !defined(CYTHON_FAST_THREAD_STATE)
+    #define CYTHON_FAST_THREAD_STATE 1
+  #endif
+  #ifndef CYTHON_FAST_PYCALL
+    #define CYTHON_FAST_PYCALL (PY_VERSION_HEX < 0x030A0000)
+  #endif
+  #ifndef CYTHON_PEP489_MULTI_PHASE_INIT
+    #define CYTHON_PEP489_MULTI_PHASE_INIT (PY_VERSION_HEX >= 0x03050000)
+  #endif
+  #ifndef CYTHON_USE_TP_FINALIZE
+    #define CYTHON_USE_TP_FINALIZE (PY_VERSION_HEX >= 0x030400a1)
+  #endif
+  #ifndef CYTHON_USE_DICT_VERSIONS
+    #define CYTHON_USE_DICT_VERSIONS ((PY_VERSION_HEX >= 0x030600B1) && (PY_VERSION_HEX < 0x030C00A5))
+  #endif
+  #if PY_VERSION_HEX >= 0x030B00A4
+    #undef CYTHON_USE_EXC_INFO_STACK
+    #define CYTHON_USE_EXC_INFO_STACK 0
+  #elif !defined(CYTHON_USE_EXC_INFO_STACK)
+    #define CYTHON_USE_EXC_INFO_STACK (PY_VERSION_HEX >= 0x030700A3)
+  #endif
+  #ifndef CYTHON_UPDATE_DESCRIPTOR_DOC
+    #define CYTHON_UPDATE_DESCRIPTOR_DOC 1
+  #endif
+#endif
+#if !defined(CYTHON_FAST_PYCCALL)
+#define CYTHON_FAST_PYCCALL  (CYTHON_FAST_PYCALL && PY_VERSION_HEX >= 0x030600B1)
+#endif
+#if CYTHON_USE_PYLONG_INTERNALS
+  #if PY_MAJOR_VERSION < 3
+    #include "longintrepr.h"
+  #endif
+  #undef SHIFT
+  #undef BASE
+  #undef MASK
+  #ifdef SIZEOF_VOID_P
+    enum { __pyx_check_sizeof_voidp = 1 / (int)(SIZEOF_VOID_P == sizeof(void*)) };
+  #endif
+#endif
+#ifndef __has_attribute
+  #define __has_attribute(x) 0
+#endif
+#ifndef __has_cpp_attribute
+  #define __has_cpp_attribute(x) 0
+#endif
+#ifndef CYTHON_RESTRICT
+  #if defined(__GNUC__)
+    #define CYTHON_RESTRICT __restrict__
+  #elif defined(_MSC_VER) && _MSC_VER >= 1400
+    #define CYTHON_RESTRICT __restrict
+  #elif defined (__STDC_VERSION__) && __STDC_VERSION__ >= 199901L
+    #define CYTHON_RESTRICT restrict
+  #else
+    #define CYTHON_RESTRICT
+  #endif
+#endif
+#ifndef CYTHON_UNUSED
+# if defined(__GNUC__)
+#   if !(defined(__cplusplus)) || (__GNUC__ > 3 || (__GNUC__ == 3 && __GNUC_MINOR__ >= 4))
+#     define CYTHON_UNUSED __attribute__ ((__unused__))
+#   else
+#     define CYTHON_UNUSED
+#   endif
+# elif defined(__ICC) || (defined(__INTEL_COMPILER) && !defined(_MSC_VER))
+#   define CYTHON_UNUSED __attribute__ ((__unused__))
+# else
+#   define CYTHON_UNUSED
+# endif
+#endif
+#ifndef CYTHON_MAYBE_UNUSED_VAR
+#  if defined(__cplusplus)
+     template<class T> void CYTHON_MAYBE_UNUSED_VAR( const T& ) { }
+#  else
+#    define CYTHON_MAYBE_UNUSED_VAR(x) (void)(x)
+#  endif
+#endif
+#ifndef CYTHON_NCP_UNUSED
+# if CYTHON_COMPILING_IN_CPYTHON
+#  define CYTHON_NCP_UNUSED
+# else
+#  define CYTHON_NCP_UNUSED CYTHON_UNUSED
+# endif
+#endif
+#define __Pyx_void_to_None(void_result) ((void)(void_result), Py_INCREF(Py_None), Py_None)
+#ifdef _MSC_VER
+    #ifndef _MSC_STDINT_H_
+        #if _MSC_VER < 1300
+           typedef unsigned char     uint8_t;
+           typedef unsigned int      uint32_t;
+        #else
+           typedef unsigned __int8   uint8_t;
+           typedef unsigned __int32  uint32_t;
+        #endif
+    #endif
+#else
+   #include <stdint.h>
+#endif
+#ifndef CYTHON_FALLTHROUGH
+  #if defined(__cplusplus) && __cplusplus >= 201103L
+    #if __has_cpp_attribute(fallthrough)
+      #define CYTHON_FALLTHROUGH [[fallthrough]]
+    #elif __has_cpp_attribute(clang::fallthrough)
+      #define CYTHON_FALLTHROUGH [[clang::fallthrough]]
+    #elif __has_cpp_attribute(gnu::fallthrough)
+      #define CYTHON_FALLTHROUGH [[gnu::fallthrough]]
+    #endif
+  #endif
+  #ifndef CYTHON_FALLTHROUGH
+    #if __has_attribute(fallthrough)
+      #define CYTHON_FALLTHROUGH __attribute__((fallthrough))
+    #else
+      #define CYTHON_FALLTHROUGH
+    #endif
+  #endif
+  #if defined(__clang__ ) && defined(__apple_build_version__)
+    #if __apple_build_version__ < 7000000
+      #undef  CYTHON_FALLTHROUGH
+      #define CYTHON_FALLTHROUGH
+    #endif
+  #endif
+#endif
+
+#ifndef CYTHON_INLINE
+  #if defined(__clang__)
+    #define CYTHON_INLINE __inline__ __attribute__ ((__unused__))
+  #elif defined(__GNUC__)
+    #define CYTHON_INLINE __inline__
+  #elif defined(_MSC_VER)
+    #define CYTHON_INLINE __inline
+  #elif defined (__STDC_VERSION__) && __STDC_VERSION__ >= 199901L
+    #define CYTHON_INLINE inline
+  #else
+    #define CYTHON_INLINE
+  #endif
+#endif
+
+#define __PYX_BUILD_PY_SSIZE_T "n"
+#define CYTHON_FORMAT_SSIZE_T "z"
+#if PY_MAJOR_VERSION < 3
+  #define __Pyx_BUILTIN_MODULE_NAME "__builtin__"
+  #define __Pyx_PyCode_New(a, k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)\
+          PyCode_New(a+k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)
+  #define __Pyx_DefaultClassType PyClass_Type
+#else
+  #define __Pyx_BUILTIN_MODULE_NAME "builtins"
+  #define __Pyx_DefaultClassType PyType_Type
+#if PY_VERSION_HEX >= 0x030B00A1
+    static CYTHON_INLINE PyCodeObject* __Pyx_PyCode_New(int a, int k, int l, int s, int f,
+                                                    PyObject *code, PyObject *c, PyObject* n, PyObject *v,
+                                                    PyObject *fv, PyObject *cell, PyObject* fn,
+                                                    PyObject *name, int fline, PyObject *lnos) {
+        PyObject *kwds=NULL, *argcount=NULL, *posonlyargcount=NULL, *kwonlyargcount=NULL;
+        PyObject *nlocals=NULL, *stacksize=NULL, *flags=NULL, *replace=NULL, *call_result=NULL, *empty=NULL;
+        const char *fn_cstr=NULL;
+        const char *name_cstr=NULL;
+        PyCodeObject* co=NULL;
+        PyObject *type, *value, *traceback;
+        PyErr_Fetch(&type, &value, &traceback);
+        if (!(kwds=PyDict_New())) goto end;
+        if (!(argcount=PyLong_FromLong(a))) goto end;
+        if (PyDict_SetItemString(kwds, "co_argcount", argcount) != 0) goto end;
+        if (!(posonlyargcount=PyLong_FromLong(0))) goto end;
+        if (PyDict_SetItemString(kwds, "co_posonlyargcount", posonlyargcount) != 0) goto end;
+        if (!(kwonlyargcount=PyLong_FromLong(k))) goto end;
+        if (PyDict_SetItemString(kwds, "co_kwonlyargcount", kwonlyargcount) != 0) goto end;
+        if (!(nlocals=PyLong_FromLong(l))) goto end;
+        if (PyDict_SetItemString(kwds, "co_nlocals", nlocals) != 0) goto end;
+        if (!(stacksize=PyLong_FromLong(s))) goto end;
+        if (PyDict_SetItemString(kwds, "co_stacksize", stacksize) != 0) goto end;
+        if (!(flags=PyLong_FromLong(f))) goto end;
+        if (PyDict_SetItemString(kwds, "co_flags", flags) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_code", code) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_consts", c) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_names", n) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_varnames", v) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_freevars", fv) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_cellvars", cell) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_linetable", lnos) != 0) goto end;
+        if (!(fn_cstr=PyUnicode_AsUTF8AndSize(fn, NULL))) goto end;
+        if (!(name_cstr=PyUnicode_AsUTF8AndSize(name, NULL))) goto end;
+        if (!(co = PyCode_NewEmpty(fn_cstr, name_cstr, fline))) goto end;
+        if (!(replace = PyObject_GetAttrString((PyObject*)co, "replace"))) goto cleanup_code_too;
+        if (!(empty = PyTuple_New(0))) goto cleanup_code_too; // unfortunately __pyx_empty_tuple isn't available here
+        if (!(call_result = PyObject_Call(replace, empty, kwds))) goto cleanup_code_too;
+        Py_XDECREF((PyObject*)co);
+        co = (PyCodeObject*)call_result;
+        call_result = NULL;
+        if (0) {
+            cleanup_code_too:
+            Py_XDECREF((PyObject*)co);
+            co = NULL;
+        }
+        end:
+        Py_XDECREF(kwds);
+        Py_XDECREF(argcount);
+        Py_XDECREF(posonlyargcount);
+        Py_XDECREF(kwonlyargcount);
+        Py_XDECREF(nlocals);
+        Py_XDECREF(stacksize);
+        Py_XDECREF(replace);
+        Py_XDECREF(call_result);
+        Py_XDECREF(empty);
+        if (type) {
+            PyErr_Restore(type, value, traceback);
+        }
+        return co;
+    }
+#else
+  #define __Pyx_PyCode_New(a, k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)\
+          PyCode_New(a, k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)
+#endif
+  #define __Pyx_DefaultClassType PyType_Type
+#endif
+#if PY_VERSION_HEX >= 0x030900F0 && !CYTHON_COMPILING_IN_PYPY
+  #define __Pyx_PyObject_GC_IsFinalized(o) PyObject_GC_IsFinalized(o)
+#else
+  #define __Pyx_PyObject_GC_IsFinalized(o) _PyGC_FINALIZED(o)
+#endif
+#ifndef Py_TPFLAGS_CHECKTYPES
+  #define Py_TPFLAGS_CHECKTYPES 0
+#endif
+#ifndef Py_TPFLAGS_HAVE_INDEX
+  #define Py_TPFLAGS_HAVE_INDEX 0
+#endif
+#ifndef Py_TPFLAGS_HAVE_NEWBUFFER
+  #define Py_TPFLAGS_HAVE_NEWBUFFER 0
+#endif
+#ifndef Py_TPFLAGS_HAVE_FINALIZE
+  #define Py_TPFLAGS_HAVE_FINALIZE 0
+#endif
+#ifndef METH_STACKLESS
+  #define METH_STACKLESS 0
+#endif
+#if PY_VERSION_HEX <= 0x030700A3 || !defined(METH_FASTCALL)
+  #ifndef METH_FASTCALL
+     #define METH_FASTCALL 0x80
+  #endif
+  typedef PyObject *(*__Pyx_PyCFunctionFast) (PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+  typedef PyObject *(*__Pyx_PyCFunctionFastWithKeywords) (PyObject *self, PyObject *const *args,
+                                                          Py_ssize_t nargs, PyObject *kwnames);
+#else
+  #define __Pyx_PyCFunctionFast _PyCFunctionFast
+  #define __Pyx_PyCFunctionFastWithKeywords _PyCFunctionFastWithKeywords
+#endif
+#if CYTHON_FAST_PYCCALL
+#define __Pyx_PyFastCFunction_Check(func)\
+    ((PyCFunction_Check(func) && (METH_FASTCALL == (PyCFunction_GET_FLAGS(func) & ~(METH_CLASS | METH_STATIC | METH_COEXIST | METH_KEYWORDS | METH_STACKLESS)))))
+#else
+#define __Pyx_PyFastCFunction_Check(func) 0
+#endif
+#if CYTHON_COMPILING_IN_PYPY && !defined(PyObject_Malloc)
+  #define PyObject_Malloc(s)   PyMem_Malloc(s)
+  #define PyObject_Free(p)     PyMem_Free(p)
+  #define PyObject_Realloc(p)  PyMem_Realloc(p)
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030400A1
+  #define PyMem_RawMalloc(n)           PyMem_Malloc(n)
+  #define PyMem_RawRealloc(p, n)       PyMem_Realloc(p, n)
+  #define PyMem_RawFree(p)             PyMem_Free(p)
+#endif
+#if CYTHON_COMPILING_IN_PYSTON
+  #define __Pyx_PyCode_HasFreeVars(co)  PyCode_HasFreeVars(co)
+  #define __Pyx_PyFrame_SetLineNumber(frame, lineno) PyFrame_SetLineNumber(frame, lineno)
+#else
+  #define __Pyx_PyCode_HasFreeVars(co)  (PyCode_GetNumFree(co) > 0)
+  #define __Pyx_PyFrame_SetLineNumber(frame, lineno)  (frame)->f_lineno = (lineno)
+#endif
+#if !CYTHON_FAST_THREAD_STATE || PY_VERSION_HEX < 0x02070000
+  #define __Pyx_PyThreadState_Current PyThreadState_GET()
+#elif PY_VERSION_HEX >= 0x03060000
+  #define __Pyx_PyThreadState_Current _PyThreadState_UncheckedGet()
+#elif PY_VERSION_HEX >= 0x03000000
+  #define __Pyx_PyThreadState_Current PyThreadState_GET()
+#else
+  #define __Pyx_PyThreadState_Current _PyThreadState_Current
+#endif
+#if PY_VERSION_HEX < 0x030700A2 && !defined(PyThread_tss_create) && !defined(Py_tss_NEEDS_INIT)
+#include "pythread.h"
+#define Py_tss_NEEDS_INIT 0
+typedef int Py_tss_t;
+static CYTHON_INLINE int PyThread_tss_create(Py_tss_t *key) {
+  *key = PyThread_create_key();
+  return 0;
+}
+static CYTHON_INLINE Py_tss_t * PyThread_tss_alloc(void) {
+  Py_tss_t *key = (Py_tss_t *)PyObject_Malloc(sizeof(Py_tss_t));
+  *key = Py_tss_NEEDS_INIT;
+  return key;
+}
+static CYTHON_INLINE void PyThread_tss_free(Py_tss_t *key) {
+  PyObject_Free(key);
+}
+static CYTHON_INLINE int PyThread_tss_is_created(Py_tss_t *key) {
+  return *key != Py_tss_NEEDS_INIT;
+}
+static CYTHON_INLINE void PyThread_tss_delete(Py_tss_t *key) {
+  PyThread_delete_key(*key);
+  *key = Py_tss_NEEDS_INIT;
+}
+static CYTHON_INLINE int PyThread_tss_set(Py_tss_t *key, void *value) {
+  return PyThread_set_key_value(*key, value);
+}
+static CYTHON_INLINE void * PyThread_tss_get(Py_tss_t *key) {
+  return PyThread_get_key_value(*key);
+}
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON || defined(_PyDict_NewPresized)
+#define __Pyx_PyDict_NewPresized(n)  ((n <= 8) ? PyDict_New() : _PyDict_NewPresized(n))
+#else
+#define __Pyx_PyDict_NewPresized(n)  PyDict_New()
+#endif
+#if PY_MAJOR_VERSION >= 3 || CYTHON_FUTURE_DIVISION
+  #define __Pyx_PyNumber_Divide(x,y)         PyNumber_TrueDivide(x,y)
+  #define __Pyx_PyNumber_InPlaceDivide(x,y)  PyNumber_InPlaceTrueDivide(x,y)
+#else
+  #define __Pyx_PyNumber_Divide(x,y)         PyNumber_Divide(x,y)
+  #define __Pyx_PyNumber_InPlaceDivide(x,y)  PyNumber_InPlaceDivide(x,y)
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030500A1 && CYTHON_USE_UNICODE_INTERNALS
+#define __Pyx_PyDict_GetItemStr(dict, name)  _PyDict_GetItem_KnownHash(dict, name, ((PyASCIIObject *) name)->hash)
+#else
+#define __Pyx_PyDict_GetItemStr(dict, name)  PyDict_GetItem(dict, name)
+#endif
+#if PY_VERSION_HEX > 0x03030000 && defined(PyUnicode_KIND)
+  #define CYTHON_PEP393_ENABLED 1
+  #if PY_VERSION_HEX >= 0x030C0000
+    #define __Pyx_PyUnicode_READY(op)       (0)
+  #else
+    #define __Pyx_PyUnicode_READY(op)       (likely(PyUnicode_IS_READY(op)) ?\
+                                                0 : _PyUnicode_Ready((PyObject *)(op)))
+  #endif
+  #define __Pyx_PyUnicode_GET_LENGTH(u)   PyUnicode_GET_LENGTH(u)
+  #define __Pyx_PyUnicode_READ_CHAR(u, i) PyUnicode_READ_CHAR(u, i)
+  #define __Pyx_PyUnicode_MAX_CHAR_VALUE(u)   PyUnicode_MAX_CHAR_VALUE(u)
+  #define __Pyx_PyUnicode_KIND(u)         PyUnicode_KIND(u)
+  #define __Pyx_PyUnicode_DATA(u)         PyUnicode_DATA(u)
+  #define __Pyx_PyUnicode_READ(k, d, i)   PyUnicode_READ(k, d, i)
+  #define __Pyx_PyUnicode_WRITE(k, d, i, ch)  PyUnicode_WRITE(k, d, i, ch)
+  #if PY_VERSION_HEX >= 0x030C0000
+    #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != PyUnicode_GET_LENGTH(u))
+  #else
+    #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x03090000
+    #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != (likely(PyUnicode_IS_READY(u)) ? PyUnicode_GET_LENGTH(u) : ((PyCompactUnicodeObject *)(u))->wstr_length))
+    #else
+    #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != (likely(PyUnicode_IS_READY(u)) ? PyUnicode_GET_LENGTH(u) : PyUnicode_GET_SIZE(u)))
+    #endif
+  #endif
+#else
+  #define CYTHON_PEP393_ENABLED 0
+  #define PyUnicode_1BYTE_KIND  1
+  #define PyUnicode_2BYTE_KIND  2
+  #define PyUnicode_4BYTE_KIND  4
+  #define __Pyx_PyUnicode_READY(op)       (0)
+  #define __Pyx_PyUnicode_GET_LENGTH(u)   PyUnicode_GET_SIZE(u)
+  #define __Pyx_PyUnicode_READ_CHAR(u, i) ((Py_UCS4)(PyUnicode_AS_UNICODE(u)[i]))
+  #define __Pyx_PyUnicode_MAX_CHAR_VALUE(u)   ((sizeof(Py_UNICODE) == 2) ? 65535 : 1114111)
+  #define __Pyx_PyUnicode_KIND(u)         (sizeof(Py_UNICODE))
+  #define __Pyx_PyUnicode_DATA(u)         ((void*)PyUnicode_AS_UNICODE(u))
+  #define __Pyx_PyUnicode_READ(k, d, i)   ((void)(k), (Py_UCS4)(((Py_UNICODE*)d)[i]))
+  #define __Pyx_PyUnicode_WRITE(k, d, i, ch)  (((void)(k)), ((Py_UNICODE*)d)[i] = ch)
+  #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != PyUnicode_GET_SIZE(u))
+#endif
+#if CYTHON_COMPILING_IN_PYPY
+  #define __Pyx_PyUnicode_Concat(a, b)      PyNumber_Add(a, b)
+  #define __Pyx_PyUnicode_ConcatSafe(a, b)  PyNumber_Add(a, b)
+#else
+  #define __Pyx_PyUnicode_Concat(a, b)      PyUnicode_Concat(a, b)
+  #define __Pyx_PyUnicode_ConcatSafe(a, b)  ((unlikely((a) == Py_None) || unlikely((b) == Py_None)) ?\
+      PyNumber_Add(a, b) : __Pyx_PyUnicode_Concat(a, b))
+#endif
+#if CYTHON_COMPILING_IN_PYPY && !defined(PyUnicode_Contains)
+  #define PyUnicode_Contains(u, s)  PySequence_Contains(u, s)
+#endif
+#if CYTHON_COMPILING_IN_PYPY && !defined(PyByteArray_Check)
+  #define PyByteArray_Check(obj)  PyObject_TypeCheck(obj, &PyByteArray_Type)
+#endif
+#if CYTHON_COMPILING_IN_PYPY && !defined(PyObject_Format)
+  #define PyObject_Format(obj, fmt)  PyObject_CallMethod(obj, "__format__", "O", fmt)
+#endif
+#define __Pyx_PyString_FormatSafe(a, b)   ((unlikely((a) == Py_None || (PyString_Check(b) && !PyString_CheckExact(b)))) ? PyNumber_Remainder(a, b) : __Pyx_PyString_Format(a, b))
+#define __Pyx_PyUnicode_FormatSafe(a, b)  ((unlikely((a) == Py_None || (PyUnicode_Check(b) && !PyUnicode_CheckExact(b)))) ? PyNumber_Remainder(a, b) : PyUnicode_Format(a, b))
+#if PY_MAJOR_VERSION >= 3
+  #define __Pyx_PyString_Format(a, b)  PyUnicode_Format(a, b)
+#else
+  #define __Pyx_PyString_Format(a, b)  PyString_Format(a, b)
+#endif
+#if PY_MAJOR_VERSION < 3 && !defined(PyObject_ASCII)
+  #define PyObject_ASCII(o)            PyObject_Repr(o)
+#endif
+#if PY_MAJOR_VERSION >= 3
+  #define PyBaseString_Type            PyUnicode_Type
+  #define PyStringObject               PyUnicodeObject
+  #define PyString_Type                PyUnicode_Type
+  #define PyString_Check               PyUnicode_Check
+  #define PyString_CheckExact          PyUnicode_CheckExact
+#ifndef PyObject_Unicode
+  #define PyObject_Unicode             PyObject_Str
+#endif
+#endif
+#if PY_MAJOR_VERSION >= 3
+  #define __Pyx_PyBaseString_Check(obj) PyUnicode_Check(obj)
+  #define __Pyx_PyBaseString_CheckExact(obj) PyUnicode_CheckExact(obj)
+#else
+  #define __Pyx_PyBaseString_Check(obj) (PyString_Check(obj) || PyUnicode_Check(obj))
+  #define __Pyx_PyBaseString_CheckExact(obj) (PyString_CheckExact(obj) || PyUnicode_CheckExact(obj))
+#endif
+#ifndef PySet_CheckExact
+  #define PySet_CheckExact(obj)        (Py_TYPE(obj) == &PySet_Type)
+#endif
+#if PY_VERSION_HEX >= 0x030900A4
+  #define __Pyx_SET_REFCNT(obj, refcnt) Py_SET_REFCNT(obj, refcnt)
+  #define __Pyx_SET_SIZE(obj, size) Py_SET_SIZE(obj, size)
+#else
+  #define __Pyx_SET_REFCNT(obj, refcnt) Py_REFCNT(obj) = (refcnt)
+  #define __Pyx_SET_SIZE(obj, size) Py_SIZE(obj) = (size)
+#endif
+#if CYTHON_ASSUME_SAFE_MACROS
+  #define __Pyx_PySequence_SIZE(seq)  Py_SIZE(seq)
+#else
+  #define __Pyx_PySequence_SIZE(seq)  PySequence_Size(seq)
+#endif
+#if PY_MAJOR_VERSION >= 3
+  #define PyIntObject                  PyLongObject
+  #define PyInt_Type                   PyLong_Type
+  #define PyInt_Check(op)              PyLong_Check(op)
+  #define PyInt_CheckExact(op)         PyLong_CheckExact(op)
+  #define PyInt_FromString             PyLong_FromString
+  #define PyInt_FromUnicode            PyLong_FromUnicode
+  #define PyInt_FromLong               PyLong_FromLong
+  #define PyInt_FromSize_t             PyLong_FromSize_t
+  #define PyInt_FromSsize_t            PyLong_FromSsize_t
+  #define PyInt_AsLong                 PyLong_AsLong
+  #define PyInt_AS_LONG                PyLong_AS_LONG
+  #define PyInt_AsSsize_t              PyLong_AsSsize_t
+  #define PyInt_AsUnsignedLongMask     PyLong_AsUnsignedLongMask
+  #define PyInt_AsUnsignedLongLongMask PyLong_AsUnsignedLongLongMask
+  #define PyNumber_Int                 PyNumber_Long
+#endif
+#if PY_MAJOR_VERSION >= 3
+  #define PyBoolObject                 PyLongObject
+#endif
+#if PY_MAJOR_VERSION >= 3 && CYTHON_COMPILING_IN_PYPY
+  #ifndef PyUnicode_InternFromString
+    #define PyUnicode_InternFromString(s) PyUnicode_FromString(s)
+  #endif
+#endif
+#if PY_VERSION_HEX < 0x030200A4
+  typedef long Py_hash_t;
+  #define __Pyx_PyInt_FromHash_t PyInt_FromLong
+  #define __Pyx_PyInt_AsHash_t   __Pyx_PyIndex_AsHash_t
+#else
+  #define __Pyx_PyInt_FromHash_t PyInt_FromSsize_t
+  #define __Pyx_PyInt_AsHash_t   __Pyx_PyIndex_AsSsize_t
+#endif
+#if PY_MAJOR_VERSION >= 3
+  #define __Pyx_PyMethod_New(func, self, klass) ((self) ? ((void)(klass), PyMethod_New(func, self)) : __Pyx_NewRef(func))
+#else
+  #define __Pyx_PyMethod_New(func, self, klass) PyMethod_New(func, self, klass)
+#endif
+#if CYTHON_USE_ASYNC_SLOTS
+  #if PY_VERSION_HEX >= 0x030500B1
+    #define __Pyx_PyAsyncMethodsStruct PyAsyncMethods
+    #define __Pyx_PyType_AsAsync(obj) (Py_TYPE(obj)->tp_as_async)
+  #else
+    #define __Pyx_PyType_AsAsync(obj) ((__Pyx_PyAsyncMethodsStruct*) (Py_TYPE(obj)->tp_reserved))
+  #endif
+#else
+  #define __Pyx_PyType_AsAsync(obj) NULL
+#endif
+#ifndef __Pyx_PyAsyncMethodsStruct
+    typedef struct {
+        unaryfunc am_await;
+        unaryfunc am_aiter;
+        unaryfunc am_anext;
+    } __Pyx_PyAsyncMethodsStruct;
+#endif
+
+#if defined(_WIN32) || defined(WIN32) || defined(MS_WINDOWS)
+  #if !defined(_USE_MATH_DEFINES)
+    #define _USE_MATH_DEFINES
+  #endif
+#endif
+#include <math.h>
+#ifdef NAN
+#define __PYX_NAN() ((float) NAN)
+#else
+static CYTHON_INLINE float __PYX_NAN() {
+  float value;
+  memset(&value, 0xFF, sizeof(value));
+  return value;
+}
+#endif
+#if defined(__CYGWIN__) && defined(_LDBL_EQ_DBL)
+#define __Pyx_truncl trunc
+#else
+#define __Pyx_truncl truncl
+#endif
+
+#define __PYX_MARK_ERR_POS(f_index, lineno) \
+    { __pyx_filename = __pyx_f[f_index]; (void)__pyx_filename; __pyx_lineno = lineno; (void)__pyx_lineno; __pyx_clineno = __LINE__; (void)__pyx_clineno; }
+#define __PYX_ERR(f_index, lineno, Ln_error) \
+    { __PYX_MARK_ERR_POS(f_index, lineno) goto Ln_error; }
+
+#ifndef __PYX_EXTERN_C
+  #ifdef __cplusplus
+    #define __PYX_EXTERN_C extern "C"
+  #else
+    #define __PYX_EXTERN_C extern
+  #endif
+#endif
+
+#define __PYX_HAVE__xpra__server__window__motion
+#define __PYX_HAVE_API__xpra__server__window__motion
+/* Early includes */
+#include "math.h"
+#include <stdint.h>
+#include "stdlib.h"
+#include "string.h"
+#include "../../buffers/memalign.h"
+#include "../../buffers/buffers.h"
+#ifdef _OPENMP
+#include <omp.h>
+#endif /* _OPENMP */
+
+#if defined(PYREX_WITHOUT_ASSERTIONS) && !defined(CYTHON_WITHOUT_ASSERTIONS)
+#define CYTHON_WITHOUT_ASSERTIONS
+#endif
+
+typedef struct {PyObject **p; const char *s; const Py_ssize_t n; const char* encoding;
+                const char is_unicode; const char is_str; const char intern; } __Pyx_StringTabEntry;
+
+#define __PYX_DEFAULT_STRING_ENCODING_IS_ASCII 0
+#define __PYX_DEFAULT_STRING_ENCODING_IS_UTF8 0
+#define __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT (PY_MAJOR_VERSION >= 3 && __PYX_DEFAULT_STRING_ENCODING_IS_UTF8)
+#define __PYX_DEFAULT_STRING_ENCODING ""
+#define __Pyx_PyObject_FromString __Pyx_PyBytes_FromString
+#define __Pyx_PyObject_FromStringAndSize __Pyx_PyBytes_FromStringAndSize
+#define __Pyx_uchar_cast(c) ((unsigned char)c)
+#define __Pyx_long_cast(x) ((long)x)
+#define __Pyx_fits_Py_ssize_t(v, type, is_signed)  (\
+    (sizeof(type) < sizeof(Py_ssize_t))  ||\
+    (sizeof(type) > sizeof(Py_ssize_t) &&\
+          likely(v < (type)PY_SSIZE_T_MAX ||\
+                 v == (type)PY_SSIZE_T_MAX)  &&\
+          (!is_signed || likely(v > (type)PY_SSIZE_T_MIN ||\
+                                v == (type)PY_SSIZE_T_MIN)))  ||\
+    (sizeof(type) == sizeof(Py_ssize_t) &&\
+          (is_signed || likely(v < (type)PY_SSIZE_T_MAX ||\
+                               v == (type)PY_SSIZE_T_MAX)))  )
+static CYTHON_INLINE int __Pyx_is_valid_index(Py_ssize_t i, Py_ssize_t limit) {
+    return (size_t) i < (size_t) limit;
+}
+#if defined (__cplusplus) && __cplusplus >= 201103L
+    #include <cstdlib>
+    #define __Pyx_sst_abs(value) std::abs(value)
+#elif SIZEOF_INT >= SIZEOF_SIZE_T
+    #define __Pyx_sst_abs(value) abs(value)
+#elif SIZEOF_LONG >= SIZEOF_SIZE_T
+    #define __Pyx_sst_abs(value) labs(value)
+#elif defined (_MSC_VER)
+    #define __Pyx_sst_abs(value) ((Py_ssize_t)_abs64(value))
+#elif defined (__STDC_VERSION__) && __STDC_VERSION__ >= 199901L
+    #define __Pyx_sst_abs(value) llabs(value)
+#elif defined (__GNUC__)
+    #define __Pyx_sst_abs(value) __builtin_llabs(value)
+#else
+    #define __Pyx_sst_abs(value) ((value<0) ? -value : value)
+#endif
+static CYTHON_INLINE const char* __Pyx_PyObject_AsString(PyObject*);
+static CYTHON_INLINE const char* __Pyx_PyObject_AsStringAndSize(PyObject*, Py_ssize_t* length);
+#define __Pyx_PyByteArray_FromString(s) PyByteArray_FromStringAndSize((const char*)s, strlen((const char*)s))
+#define __Pyx_PyByteArray_FromStringAndSize(s, l) PyByteArray_FromStringAndSize((const char*)s, l)
+#define __Pyx_PyBytes_FromString        PyBytes_FromString
+#define __Pyx_PyBytes_FromStringAndSize PyBytes_FromStringAndSize
+static CYTHON_INLINE PyObject* __Pyx_PyUnicode_FromString(const char*);
+#if PY_MAJOR_VERSION < 3
+    #define __Pyx_PyStr_FromString        __Pyx_PyBytes_FromString
+    #define __Pyx_PyStr_FromStringAndSize __Pyx_PyBytes_FromStringAndSize
+#else
+    #define __Pyx_PyStr_FromString        __Pyx_PyUnicode_FromString
+    #define __Pyx_PyStr_FromStringAndSize __Pyx_PyUnicode_FromStringAndSize
+#endif
+#define __Pyx_PyBytes_AsWritableString(s)     ((char*) PyBytes_AS_STRING(s))
+#define __Pyx_PyBytes_AsWritableSString(s)    ((signed char*) PyBytes_AS_STRING(s))
+#define __Pyx_PyBytes_AsWritableUString(s)    ((unsigned char*) PyBytes_AS_STRING(s))
+#define __Pyx_PyBytes_AsString(s)     ((const char*) PyBytes_AS_STRING(s))
+#define __Pyx_PyBytes_AsSString(s)    ((const signed char*) PyBytes_AS_STRING(s))
+#define __Pyx_PyBytes_AsUString(s)    ((const unsigned char*) PyBytes_AS_STRING(s))
+#define __Pyx_PyObject_AsWritableString(s)    ((char*) __Pyx_PyObject_AsString(s))
+#define __Pyx_PyObject_AsWritableSString(s)    ((signed char*) __Pyx_PyObject_AsString(s))
+#define __Pyx_PyObject_AsWritableUString(s)    ((unsigned char*) __Pyx_PyObject_AsString(s))
+#define __Pyx_PyObject_AsSString(s)    ((const signed char*) __Pyx_PyObject_AsString(s))
+#define __Pyx_PyObject_AsUString(s)    ((const unsigned char*) __Pyx_PyObject_AsString(s))
+#define __Pyx_PyObject_FromCString(s)  __Pyx_PyObject_FromString((const char*)s)
+#define __Pyx_PyBytes_FromCString(s)   __Pyx_PyBytes_FromString((const char*)s)
+#define __Pyx_PyByteArray_FromCString(s)   __Pyx_PyByteArray_FromString((const char*)s)
+#define __Pyx_PyStr_FromCString(s)     __Pyx_PyStr_FromString((const char*)s)
+#define __Pyx_PyUnicode_FromCString(s) __Pyx_PyUnicode_FromString((const char*)s)
+static CYTHON_INLINE size_t __Pyx_Py_UNICODE_strlen(const Py_UNICODE *u) {
+    const Py_UNICODE *u_end = u;
+    while (*u_end++) ;
+    return (size_t)(u_end - u - 1);
+}
+#define __Pyx_PyUnicode_FromUnicode(u)       PyUnicode_FromUnicode(u, __Pyx_Py_UNICODE_strlen(u))
+#define __Pyx_PyUnicode_FromUnicodeAndLength PyUnicode_FromUnicode
+#define __Pyx_PyUnicode_AsUnicode            PyUnicode_AsUnicode
+#define __Pyx_NewRef(obj) (Py_INCREF(obj), obj)
+#define __Pyx_Owned_Py_None(b) __Pyx_NewRef(Py_None)
+static CYTHON_INLINE PyObject * __Pyx_PyBool_FromLong(long b);
+static CYTHON_INLINE int __Pyx_PyObject_IsTrue(PyObject*);
+static CYTHON_INLINE int __Pyx_PyObject_IsTrueAndDecref(PyObject*);
+static CYTHON_INLINE PyObject* __Pyx_PyNumber_IntOrLong(PyObject* x);
+#define __Pyx_PySequence_Tuple(obj)\
+    (likely(PyTuple_CheckExact(obj)) ? __Pyx_NewRef(obj) : PySequence_Tuple(obj))
+static CYTHON_INLINE Py_ssize_t __Pyx_PyIndex_AsSsize_t(PyObject*);
+static CYTHON_INLINE PyObject * __Pyx_PyInt_FromSize_t(size_t);
+static CYTHON_INLINE Py_hash_t __Pyx_PyIndex_AsHash_t(PyObject*);
+#if CYTHON_ASSUME_SAFE_MACROS
+#define __pyx_PyFloat_AsDouble(x) (PyFloat_CheckExact(x) ? PyFloat_AS_DOUBLE(x) : PyFloat_AsDouble(x))
+#else
+#define __pyx_PyFloat_AsDouble(x) PyFloat_AsDouble(x)
+#endif
+#define __pyx_PyFloat_AsFloat(x) ((float) __pyx_PyFloat_AsDouble(x))
+#if PY_MAJOR_VERSION >= 3
+#define __Pyx_PyNumber_Int(x) (PyLong_CheckExact(x) ? __Pyx_NewRef(x) : PyNumber_Long(x))
+#else
+#define __Pyx_PyNumber_Int(x) (PyInt_CheckExact(x) ? __Pyx_NewRef(x) : PyNumber_Int(x))
+#endif
+#define __Pyx_PyNumber_Float(x) (PyFloat_CheckExact(x) ? __Pyx_NewRef(x) : PyNumber_Float(x))
+#if PY_MAJOR_VERSION < 3 && __PYX_DEFAULT_STRING_ENCODING_IS_ASCII
+static int __Pyx_sys_getdefaultencoding_not_ascii;
+static int __Pyx_init_sys_getdefaultencoding_params(void) {
+    PyObject* sys;
+    PyObject* default_encoding = NULL;
+    PyObject* ascii_chars_u = NULL;
+    PyObject* ascii_chars_b = NULL;
+    const char* default_encoding_c;
+    sys = PyImport_ImportModule("sys");
+    if (!sys) goto bad;
+    default_encoding = PyObject_CallMethod(sys, (char*) "getdefaultencoding", NULL);
+    Py_DECREF(sys);
+    if (!default_encoding) goto bad;
+    default_encoding_c = PyBytes_AsString(default_encoding);
+    if (!default_encoding_c) goto bad;
+    if (strcmp(default_encoding_c, "ascii") == 0) {
+        __Pyx_sys_getdefaultencoding_not_ascii = 0;
+    } else {
+        char ascii_chars[128];
+        int c;
+        for (c = 0; c < 128; c++) {
+            ascii_chars[c] = c;
+        }
+        __Pyx_sys_getdefaultencoding_not_ascii = 1;
+        ascii_chars_u = PyUnicode_DecodeASCII(ascii_chars, 128, NULL);
+        if (!ascii_chars_u) goto bad;
+        ascii_chars_b = PyUnicode_AsEncodedString(ascii_chars_u, default_encoding_c, NULL);
+        if (!ascii_chars_b || !PyBytes_Check(ascii_chars_b) || memcmp(ascii_chars, PyBytes_AS_STRING(ascii_chars_b), 128) != 0) {
+            PyErr_Format(
+                PyExc_ValueError,
+                "This module compiled with c_string_encoding=ascii, but default encoding '%.200s' is not a superset of ascii.",
+                default_encoding_c);
+            goto bad;
+        }
+        Py_DECREF(ascii_chars_u);
+        Py_DECREF(ascii_chars_b);
+    }
+    Py_DECREF(default_encoding);
+    return 0;
+bad:
+    Py_XDECREF(default_encoding);
+    Py_XDECREF(ascii_chars_u);
+    Py_XDECREF(ascii_chars_b);
+    return -1;
+}
+#endif
+#if __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT && PY_MAJOR_VERSION >= 3
+#define __Pyx_PyUnicode_FromStringAndSize(c_str, size) PyUnicode_DecodeUTF8(c_str, size, NULL)
+#else
+#define __Pyx_PyUnicode_FromStringAndSize(c_str, size) PyUnicode_Decode(c_str, size, __PYX_DEFAULT_STRING_ENCODING, NULL)
+#if __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT
+static char* __PYX_DEFAULT_STRING_ENCODING;
+static int __Pyx_init_sys_getdefaultencoding_params(void) {
+    PyObject* sys;
+    PyObject* default_encoding = NULL;
+    char* default_encoding_c;
+    sys = PyImport_ImportModule("sys");
+    if (!sys) goto bad;
+    default_encoding = PyObject_CallMethod(sys, (char*) (const char*) "getdefaultencoding", NULL);
+    Py_DECREF(sys);
+    if (!default_encoding) goto bad;
+    default_encoding_c = PyBytes_AsString(default_encoding);
+    if (!default_encoding_c) goto bad;
+    __PYX_DEFAULT_STRING_ENCODING = (char*) malloc(strlen(default_encoding_c) + 1);
+    if (!__PYX_DEFAULT_STRING_ENCODING) goto bad;
+    strcpy(__PYX_DEFAULT_STRING_ENCODING, default_encoding_c);
+    Py_DECREF(default_encoding);
+    return 0;
+bad:
+    Py_XDECREF(default_encoding);
+    return -1;
+}
+#endif
+#endif
+
+
+/* Test for GCC > 2.95 */
+#if defined(__GNUC__)     && (__GNUC__ > 2 || (__GNUC__ == 2 && (__GNUC_MINOR__ > 95)))
+  #define likely(x)   __builtin_expect(!!(x), 1)
+  #define unlikely(x) __builtin_expect(!!(x), 0)
+#else /* !__GNUC__ or GCC < 2.95 */
+  #define likely(x)   (x)
+  #define unlikely(x) (x)
+#endif /* __GNUC__ */
+static CYTHON_INLINE void __Pyx_pretend_to_initialize(void* ptr) { (void)ptr; }
+
+static PyObject *__pyx_m = NULL;
+static PyObject *__pyx_d;
+static PyObject *__pyx_b;
+static PyObject *__pyx_cython_runtime = NULL;
+static PyObject *__pyx_empty_tuple;
+static PyObject *__pyx_empty_bytes;
+static PyObject *__pyx_empty_unicode;
+static int __pyx_lineno;
+static int __pyx_clineno = 0;
+static const char * __pyx_cfilenm= __FILE__;
+static const char *__pyx_filename;
+
+
+static const char *__pyx_f[] = {
+  "xpra/server/window/motion.pyx",
+  "stringsource",
+};
+/* NoFastGil.proto */
+#define __Pyx_PyGILState_Ensure PyGILState_Ensure
+#define __Pyx_PyGILState_Release PyGILState_Release
+#define __Pyx_FastGIL_Remember()
+#define __Pyx_FastGIL_Forget()
+#define __Pyx_FastGilFuncInit()
+
+/* ForceInitThreads.proto */
+#ifndef __PYX_FORCE_INIT_THREADS
+  #define __PYX_FORCE_INIT_THREADS 0
+#endif
+
+
+/*--- Type declarations ---*/
+struct __pyx_obj_4xpra_6server_6window_6motion_ScrollData;
+
+/* "xpra/server/window/motion.pyx":257
+ * 
+ * 
+ * cdef class ScrollData:             # <<<<<<<<<<<<<<
+ *     """
+ *         Keeps the hash of each row of a window, so that we only need to hash the rows
+ */
+struct __pyx_obj_4xpra_6server_6window_6motion_ScrollData {
+  PyObject_HEAD
+  struct __pyx_vtabstruct_4xpra_6server_6window_6motion_ScrollData *__pyx_vtab;
+  unsigned int width;
+  unsigned int height;
+  int x;
+  unsigned int w;
+  uint64_t *row_hashes;
+  uint64_t *old_row_hashes;
+  uint8_t *row_known;
+  uint8_t *old_row_known;
+  uint64_t *col_hashes;
+  uint64_t *old_col_hashes;
+  int col_geometry[4];
+  int old_col_geometry[4];
+  int update_y;
+  int update_h;
+  PyObject *pixels;
+  unsigned int rowstride;
+  unsigned char bpp;
+  unsigned long updates;
+  unsigned long rows_hashed;
+};
+
+
+
+struct __pyx_vtabstruct_4xpra_6server_6window_6motion_ScrollData {
+  int (*hash_columns)(struct __pyx_obj_4xpra_6server_6window_6motion_ScrollData *);
+  PyObject *(*do_detect)(struct __pyx_obj_4xpra_6server_6window_6motion_ScrollData *, int, int, int);
+};
+static struct __pyx_vtabstruct_4xpra_6server_6window_6motion_ScrollData *__pyx_vtabptr_4xpra_6server_6window_6motion_ScrollData;
+
+/* --- Runtime support code (head) --- */
+/* Refnanny.proto */
+#ifndef CYTHON_REFNANNY
+  #define CYTHON_REFNANNY 0
+#endif
+#if CYTHON_REFNANNY
+  typedef struct {
+    void (*INCREF)(void*, PyObject*, int);
+    void (*DECREF)(void*, PyObject*, int);
+    void (*GOTREF)(void*, PyObject*, int);
+    void (*GIVEREF)(void*, PyObject*, int);
+    void* (*SetupContext)(const char*, int, const char*);
+    void (*FinishContext)(void**);
+  } __Pyx_RefNannyAPIStruct;
+  static __Pyx_RefNannyAPIStruct *__Pyx_RefNanny = NULL;
+  static __Pyx_RefNannyAPIStruct *__Pyx_RefNannyImportAPI(const char *modname);
+  #define __Pyx_RefNannyDeclarations void *__pyx_refnanny = NULL;
+#ifdef WITH_THREAD
+  #define __Pyx_RefNannySetupContext(name, acquire_gil)\
+          if (acquire_gil) {\
+              PyGILState_STATE __pyx_gilstate_save = PyGILState_Ensure();\
+              __pyx_refnanny = __Pyx_RefNanny->SetupContext((name), __LINE__, __FILE__);\
+              PyGILState_Release(__pyx_gilstate_save);\
+          } else {\
+              __pyx_refnanny = __Pyx_RefNanny->SetupContext((name), __LINE__, __FILE__);\
+          }
+#else
+  #define __Pyx_RefNannySetupContext(name, acquire_gil)\
+          __pyx_refnanny = __Pyx_RefNanny->SetupContext((name), __LINE__, __FILE__)
+#endif
+  #define __Pyx_RefNannyFinishContext()\
+          __Pyx_RefNanny->FinishContext(&__pyx_refnanny)
+  #define __Pyx_INCREF(r)  __Pyx_RefNanny->INCREF(__pyx_refnanny, (PyObject *)(r), __LINE__)
+  #define __Pyx_DECREF(r)  __Pyx_RefNanny->DECREF(__pyx_refnanny, (PyObject *)(r), __LINE__)
+  #define __Pyx_GOTREF(r)  __Pyx_RefNanny->GOTREF(__pyx_refnanny, (PyObject *)(r), __LINE__)
+  #define __Pyx_GIVEREF(r) __Pyx_RefNanny->GIVEREF(__pyx_refnanny, (PyObject *)(r), __LINE__)
+  #define __Pyx_XINCREF(r)  do { if((r) != NULL) {__Pyx_INCREF(r); }} while(0)
+  #define __Pyx_XDECREF(r)  do { if((r) != NULL) {__Pyx_DECREF(r); }} while(0)
+  #define __Pyx_XGOTREF(r)  do { if((r) != NULL) {__Pyx_GOTREF(r); }} while(0)
+  #define __Pyx_XGIVEREF(r) do { if((r) != NULL) {__Pyx_GIVEREF(r);}} while(0)
+#else
+  #define __Pyx_RefNannyDeclarations
+  #define __Pyx_RefNannySetupContext(name, acquire_gil)
+  #define __Pyx_RefNannyFinishContext()
+  #define __Pyx_INCREF(r) Py_INCREF(r)
+  #define __Pyx_DECREF(r) Py_DECREF(r)
+  #define __Pyx_GOTREF(r)
+  #define __Pyx_GIVEREF(r)
+  #define __Pyx_XINCREF(r) Py_XINCREF(r)
+  #define __Pyx_XDECREF(r) Py_XDECREF(r)
+  #define __Pyx_XGOTREF(r)
+  #define __Pyx_XGIVEREF(r)
+#endif
+#define __Pyx_XDECREF_SET(r, v) do {\
+        PyObject *tmp = (PyObject *) r;\
+        r = v; __Pyx_XDECREF(tmp);\
+    } while (0)
+#define __Pyx_DECREF_SET(r, v) do {\
+        PyObject *tmp = (PyObject *) r;\
+        r = v; __Pyx_DECREF(tmp);\
+    } while (0)
+#define __Pyx_CLEAR(r)    do { PyObject* tmp = ((PyObject*)(r)); r = NULL; __Pyx_DECREF(tmp);} while(0)
+#define __Pyx_XCLEAR(r)   do { if((r) != NULL) {PyObject* tmp = ((PyObject*)(r)); r = NULL; __Pyx_DECREF(tmp);}} while(0)
+
+/* PyObjectGetAttrStr.proto */
+#if CYTHON_USE_TYPE_SLOTS
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStr(PyObject* obj, PyObject* attr_name);
+#else
+#define __Pyx_PyObject_GetAttrStr(o,n) PyObject_GetAttr(o,n)
+#endif
+
+/* GetBuiltinName.proto */
+static PyObject *__Pyx_GetBuiltinName(PyObject *name);
+
+/* PyDictVersioning.proto */
+#if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_TYPE_SLOTS
+#define __PYX_DICT_VERSION_INIT  ((PY_UINT64_T) -1)
+#define __PYX_GET_DICT_VERSION(dict)  (((PyDictObject*)(dict))->ma_version_tag)
+#define __PYX_UPDATE_DICT_CACHE(dict, value, cache_var, version_var)\
+    (version_var) = __PYX_GET_DICT_VERSION(dict);\
+    (cache_var) = (value);
+#define __PYX_PY_DICT_LOOKUP_IF_MODIFIED(VAR, DICT, LOOKUP) {\
+    static PY_UINT64_T __pyx_dict_version = 0;\
+    static PyObject *__pyx_dict_cached_value = NULL;\
+    if (likely(__PYX_GET_DICT_VERSION(DICT) == __pyx_dict_version)) {\
+        (VAR) = __pyx_dict_cached_value;\
+    } else {\
+        (VAR) = __pyx_dict_cached_value = (LOOKUP);\
+        __pyx_dict_version = __PYX_GET_DICT_VERSION(DICT);\
+    }\
+}
+static CYTHON_INLINE PY_UINT64_T __Pyx_get_tp_dict_version(PyObject *obj);
+static CYTHON_INLINE PY_UINT64_T __Pyx_get_object_dict_version(PyObject *obj);
+static CYTHON_INLINE int __Pyx_object_dict_version_matches(PyObject* obj, PY_UINT64_T tp_dict_version, PY_UINT64_T obj_dict_version);
+#else
+#define __PYX_GET_DICT_VERSION(dict)  (0)
+#define __PYX_UPDATE_DICT_CACHE(dict, value, cache_var, version_var)
+#define __PYX_PY_DICT_LOOKUP_IF_MODIFIED(VAR, DICT, LOOKUP)  (VAR) = (LOOKUP);
+#endif
+
+/* GetModuleGlobalName.proto */
+#if CYTHON_USE_DICT_VERSIONS
+#define __Pyx_GetModuleGlobalName(var, name)  do {\
+    static PY_UINT64_T __pyx_dict_version = 0;\
+    static PyObject *__pyx_dict_cached_value = NULL;\
+    (var) = (likely(__pyx_dict_version == __PYX_GET_DICT_VERSION(__pyx_d))) ?\
+        (likely(__pyx_dict_cached_value) ? __Pyx_NewRef(__pyx_dict_cached_value) : __Pyx_GetBuiltinName(name)) :\
+        __Pyx__GetModuleGlobalName(name, &__pyx_dict_version, &__pyx_dict_cached_value);\
+} while(0)
+#define __Pyx_GetModuleGlobalNameUncached(var, name)  do {\
+    PY_UINT64_T __pyx_dict_version;\
+    PyObject *__pyx_dict_cached_value;\
+    (var) = __Pyx__GetModuleGlobalName(name, &__pyx_dict_version, &__pyx_dict_cached_value);\
+} while(0)
+static PyObject *__Pyx__GetModuleGlobalName(PyObject *name, PY_UINT64_T *dict_version, PyObject **dict_cached_value);
+#else
+#define __Pyx_GetModuleGlobalName(var, name)  (var) = __Pyx__GetModuleGlobalName(name)
+#define __Pyx_GetModuleGlobalNameUncached(var, name)  (var) = __Pyx__GetModuleGlobalName(name)
+static CYTHON_INLINE PyObject *__Pyx__GetModuleGlobalName(PyObject *name);
+#endif
+
+/* PyCFunctionFastCall.proto */
+#if CYTHON_FAST_PYCCALL
+static CYTHON_INLINE PyObject *__Pyx_PyCFunction_FastCall(PyObject *func, PyObject **args, Py_ssize_t nargs);
+#else
+#define __Pyx_PyCFunction_FastCall(func, args, nargs)  (assert(0), NULL)
+#endif
+
+/* PyFunctionFastCall.proto */
+#if CYTHON_FAST_PYCALL
+#define __Pyx_PyFunction_FastCall(func, args, nargs)\
+    __Pyx_PyFunction_FastCallDict((func), (args), (nargs), NULL)
+#if 1 || PY_VERSION_HEX < 0x030600B1
+static PyObject *__Pyx_PyFunction_FastCallDict(PyObject *func, PyObject **args, Py_ssize_t nargs, PyObject *kwargs);
+#else
+#define __Pyx_PyFunction_FastCallDict(func, args, nargs, kwargs) _PyFunction_FastCallDict(func, args, nargs, kwargs)
+#endif
+#define __Pyx_BUILD_ASSERT_EXPR(cond)\
+    (sizeof(char [1 - 2*!(cond)]) - 1)
+#ifndef Py_MEMBER_SIZE
+#define Py_MEMBER_SIZE(type, member) sizeof(((type *)0)->member)
+#endif
+#if CYTHON_FAST_PYCALL
+  static size_t __pyx_pyframe_localsplus_offset = 0;
+  #include "frameobject.h"
+#if PY_VERSION_HEX >= 0x030b00a6
+  #ifndef Py_BUILD_CORE
+    #define Py_BUILD_CORE 1
+  #endif
+  #include "internal/pycore_frame.h"
+#endif
+  #define __Pxy_PyFrame_Initialize_Offsets()\
+    ((void)__Pyx_BUILD_ASSERT_EXPR(sizeof(PyFrameObject) == offsetof(PyFrameObject, f_localsplus) + Py_MEMBER_SIZE(PyFrameObject, f_localsplus)),\
+     (void)(__pyx_pyframe_localsplus_offset = ((size_t)PyFrame_Type.tp_basicsize) - Py_MEMBER_SIZE(PyFrameObject, f_localsplus)))
+  #define __Pyx_PyFrame_GetLocalsplus(frame)\
+    (assert(__pyx_pyframe_localsplus_offset), (PyObject **)(((char *)(frame)) + __pyx_pyframe_localsplus_offset))
+#endif // CYTHON_FAST_PYCALL
+#endif
+
+/* PyObjectCall.proto */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_Call(PyObject *func, PyObject *arg, PyObject *kw);
+#else
+#define __Pyx_PyObject_Call(func, arg, kw) PyObject_Call(func, arg, kw)
+#endif
+
+/* PyObjectCall2Args.proto */
+static CYTHON_UNUSED PyObject* __Pyx_PyObject_Call2Args(PyObject* function, PyObject* arg1, PyObject* arg2);
+
+/* PyObjectCallMethO.proto */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallMethO(PyObject *func, PyObject *arg);
+#endif
+
+/* PyObjectCallOneArg.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallOneArg(PyObject *func, PyObject *arg);
+
+/* PyObjectCallNoArg.proto */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallNoArg(PyObject *func);
+#else
+#define __Pyx_PyObject_CallNoArg(func) __Pyx_PyObject_Call(func, __pyx_empty_tuple, NULL)
+#endif
+
+/* RaiseArgTupleInvalid.proto */
+static void __Pyx_RaiseArgtupleInvalid(const char* func_name, int exact,
+    Py_ssize_t num_min, Py_ssize_t num_max, Py_ssize_t num_found);
+
+/* RaiseDoubleKeywords.proto */
+static void __Pyx_RaiseDoubleKeywordsError(const char* func_name, PyObject* kw_name);
+
+/* ParseKeywords.proto */
+static int __Pyx_ParseOptionalKeywords(PyObject *kwds, PyObject **argnames[],\
+    PyObject *kwds2, PyObject *values[], Py_ssize_t num_pos_args,\
+    const char* function_name);
+
+/* AssertionsEnabled.proto */
+#define __Pyx_init_assertions_enabled()
+#if CYTHON_COMPILING_IN_PYPY && PY_VERSION_HEX < 0x02070600 && !defined(Py_OptimizeFlag)
+  #define __pyx_assertions_enabled() (1)
+#elif PY_VERSION_HEX < 0x03080000  ||  CYTHON_COMPILING_IN_PYPY  ||  defined(Py_LIMITED_API)
+  #define __pyx_assertions_enabled() (!Py_OptimizeFlag)
+#elif CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030900A6
+  static int __pyx_assertions_enabled_flag;
+  #define __pyx_assertions_enabled() (__pyx_assertions_enabled_flag)
+  #undef __Pyx_init_assertions_enabled
+  static void __Pyx_init_assertions_enabled(void) {
+    __pyx_assertions_enabled_flag = ! _PyInterpreterState_GetConfig(__Pyx_PyThreadState_Current->interp)->optimization_level;
+  }
+#else
+  #define __pyx_assertions_enabled() (!Py_OptimizeFlag)
+#endif
+
+/* ListAppend.proto */
+#if CYTHON_USE_PYLIST_INTERNALS && CYTHON_ASSUME_SAFE_MACROS
+static CYTHON_INLINE int __Pyx_PyList_Append(PyObject* list, PyObject* x) {
+    PyListObject* L = (PyListObject*) list;
+    Py_ssize_t len = Py_SIZE(list);
+    if (likely(L->allocated > len) & likely(len > (L->allocated >> 1))) {
+        Py_INCREF(x);
+        PyList_SET_ITEM(list, len, x);
+        __Pyx_SET_SIZE(list, len + 1);
+        return 0;
+    }
+    return PyList_Append(list, x);
+}
+#else
+#define __Pyx_PyList_Append(L,x) PyList_Append(L,x)
+#endif
+
+/* ListCompAppend.proto */
+#if CYTHON_USE_PYLIST_INTERNALS && CYTHON_ASSUME_SAFE_MACROS
+static CYTHON_INLINE int __Pyx_ListComp_Append(PyObject* list, PyObject* x) {
+    PyListObject* L = (PyListObject*) list;
+    Py_ssize_t len = Py_SIZE(list);
+    if (likely(L->allocated > len)) {
+        Py_INCREF(x);
+        PyList_SET_ITEM(list, len, x);
+        __Pyx_SET_SIZE(list, len + 1);
+        return 0;
+    }
+    return PyList_Append(list, x);
+}
+#else
+#define __Pyx_ListComp_Append(L,x) PyList_Append(L,x)
+#endif
+
+/* PyThreadStateGet.proto */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_PyThreadState_declare  PyThreadState *__pyx_tstate;
+#define __Pyx_PyThreadState_assign  __pyx_tstate = __Pyx_PyThreadState_Current;
+#define __Pyx_PyErr_Occurred()  __pyx_tstate->curexc_type
+#else
+#define __Pyx_PyThreadState_declare
+#define __Pyx_PyThreadState_assign
+#define __Pyx_PyErr_Occurred()  PyErr_Occurred()
+#endif
+
+/* PyErrFetchRestore.proto */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_PyErr_Clear() __Pyx_ErrRestore(NULL, NULL, NULL)
+#define __Pyx_ErrRestoreWithState(type, value, tb)  __Pyx_ErrRestoreInState(PyThreadState_GET(), type, value, tb)
+#define __Pyx_ErrFetchWithState(type, value, tb)    __Pyx_ErrFetchInState(PyThreadState_GET(), type, value, tb)
+#define __Pyx_ErrRestore(type, value, tb)  __Pyx_ErrRestoreInState(__pyx_tstate, type, value, tb)
+#define __Pyx_ErrFetch(type, value, tb)    __Pyx_ErrFetchInState(__pyx_tstate, type, value, tb)
+static CYTHON_INLINE void __Pyx_ErrRestoreInState(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb);
+static CYTHON_INLINE void __Pyx_ErrFetchInState(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb);
+#if CYTHON_COMPILING_IN_CPYTHON
+#define __Pyx_PyErr_SetNone(exc) (Py_INCREF(exc), __Pyx_ErrRestore((exc), NULL, NULL))
+#else
+#define __Pyx_PyErr_SetNone(exc) PyErr_SetNone(exc)
+#endif
+#else
+#define __Pyx_PyErr_Clear() PyErr_Clear()
+#define __Pyx_PyErr_SetNone(exc) PyErr_SetNone(exc)
+#define __Pyx_ErrRestoreWithState(type, value, tb)  PyErr_Restore(type, value, tb)
+#define __Pyx_ErrFetchWithState(type, value, tb)  PyErr_Fetch(type, value, tb)
+#define __Pyx_ErrRestoreInState(tstate, type, value, tb)  PyErr_Restore(type, value, tb)
+#define __Pyx_ErrFetchInState(tstate, type, value, tb)  PyErr_Fetch(type, value, tb)
+#define __Pyx_ErrRestore(type, value, tb)  PyErr_Restore(type, value, tb)
+#define __Pyx_ErrFetch(type, value, tb)  PyErr_Fetch(type, value, tb)
+#endif
+
+/* GetException.proto */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_GetException(type, value, tb)  __Pyx__GetException(__pyx_tstate, type, value, tb)
+static int __Pyx__GetException(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb);
+#else
+static int __Pyx_GetException(PyObject **type, PyObject **value, PyObject **tb);
+#endif
+
+/* SwapException.proto */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_ExceptionSwap(type, value, tb)  __Pyx__ExceptionSwap(__pyx_tstate, type, value, tb)
+static CYTHON_INLINE void __Pyx__ExceptionSwap(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb);
+#else
+static CYTHON_INLINE void __Pyx_ExceptionSwap(PyObject **type, PyObject **value, PyObject **tb);
+#endif
+
+/* GetTopmostException.proto */
+#if CYTHON_USE_EXC_INFO_STACK
+static _PyErr_StackItem * __Pyx_PyErr_GetTopmostException(PyThreadState *tstate);
+#endif
+
+/* SaveResetException.proto */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_ExceptionSave(type, value, tb)  __Pyx__ExceptionSave(__pyx_tstate, type, value, tb)
+static CYTHON_INLINE void __Pyx__ExceptionSave(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb);
+#define __Pyx_ExceptionReset(type, value, tb)  __Pyx__ExceptionReset(__pyx_tstate, type, value, tb)
+static CYTHON_INLINE void __Pyx__ExceptionReset(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb);
+#else
+#define __Pyx_ExceptionSave(type, value, tb)   PyErr_GetExcInfo(type, value, tb)
+#define __Pyx_ExceptionReset(type, value, tb)  PyErr_SetExcInfo(type, value, tb)
+#endif
+
+/* IncludeStringH.proto */
+#include <string.h>
+
+/* WriteUnraisableException.proto */
+static void __Pyx_WriteUnraisable(const char *name, int clineno,
+                                  int lineno, const char *filename,
+                                  int full_traceback, int nogil);
+
+/* RaiseTooManyValuesToUnpack.proto */
+static CYTHON_INLINE void __Pyx_RaiseTooManyValuesError(Py_ssize_t expected);
+
+/* RaiseNeedMoreValuesToUnpack.proto */
+static CYTHON_INLINE void __Pyx_RaiseNeedMoreValuesError(Py_ssize_t index);
+
+/* IterFinish.proto */
+static CYTHON_INLINE int __Pyx_IterFinish(void);
+
+/* UnpackItemEndCheck.proto */
+static int __Pyx_IternextUnpackEndCheck(PyObject *retval, Py_ssize_t expected);
+
+/* RaiseException.proto */
+static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb, PyObject *cause);
+
+/* PyObject_GenericGetAttrNoDict.proto */
+#if CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP && PY_VERSION_HEX < 0x03070000
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GenericGetAttrNoDict(PyObject* obj, PyObject* attr_name);
+#else
+#define __Pyx_PyObject_GenericGetAttrNoDict PyObject_GenericGetAttr
+#endif
+
+/* PyObject_GenericGetAttr.proto */
+#if CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP && PY_VERSION_HEX < 0x03070000
+static PyObject* __Pyx_PyObject_GenericGetAttr(PyObject* obj, PyObject* attr_name);
+#else
+#define __Pyx_PyObject_GenericGetAttr PyObject_GenericGetAttr
+#endif
+
+/* SetVTable.proto */
+static int __Pyx_SetVtable(PyObject *dict, void *vtable);
+
+/* PyErrExceptionMatches.proto */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_PyErr_ExceptionMatches(err) __Pyx_PyErr_ExceptionMatchesInState(__pyx_tstate, err)
+static CYTHON_INLINE int __Pyx_PyErr_ExceptionMatchesInState(PyThreadState* tstate, PyObject* err);
+#else
+#define __Pyx_PyErr_ExceptionMatches(err)  PyErr_ExceptionMatches(err)
+#endif
+
+/* PyObjectGetAttrStrNoError.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStrNoError(PyObject* obj, PyObject* attr_name);
+
+/* SetupReduce.proto */
+static int __Pyx_setup_reduce(PyObject* type_obj);
+
+/* Import.proto */
+static PyObject *__Pyx_Import(PyObject *name, PyObject *from_list, int level);
+
+/* ImportFrom.proto */
+static PyObject* __Pyx_ImportFrom(PyObject* module, PyObject* name);
+
+/* CLineInTraceback.proto */
+#ifdef CYTHON_CLINE_IN_TRACEBACK
+#define __Pyx_CLineForTraceback(tstate, c_line)  (((CYTHON_CLINE_IN_TRACEBACK)) ? c_line : 0)
+#else
+static int __Pyx_CLineForTraceback(PyThreadState *tstate, int c_line);
+#endif
+
+/* CodeObjectCache.proto */
+typedef struct {
+    PyCodeObject* code_object;
+    int code_line;
+} __Pyx_CodeObjectCacheEntry;
+struct __Pyx_CodeObjectCache {
+    int count;
+    int max_count;
+    __Pyx_CodeObjectCacheEntry* entries;
+};
+static struct __Pyx_CodeObjectCache __pyx_code_cache = {0,0,NULL};
+static int __pyx_bisect_code_objects(__Pyx_CodeObjectCacheEntry* entries, int count, int code_line);
+static PyCodeObject *__pyx_find_code_object(int code_line);
+static void __pyx_insert_code_object(int code_line, PyCodeObject* code_object);
+
+/* AddTraceback.proto */
+static void __Pyx_AddTraceback(const char *funcname, int c_line,
+                               int py_line, const char *filename);
+
+/* GCCDiagnostics.proto */
+#if defined(__GNUC__) && (__GNUC__ > 4 || (__GNUC__ == 4 && __GNUC_MINOR__ >= 6))
+#define __Pyx_HAS_GCC_DIAGNOSTIC
+#endif
+
+/* CIntFromPy.proto */
+static CYTHON_INLINE unsigned int __Pyx_PyInt_As_unsigned_int(PyObject *);
+
+/* CIntFromPy.proto */
+static CYTHON_INLINE unsigned char __Pyx_PyInt_As_unsigned_char(PyObject *);
+
+/* CIntFromPy.proto */
+static CYTHON_INLINE int __Pyx_PyInt_As_int(PyObject *);
+
+/* CIntToPy.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_unsigned_int(unsigned int value);
+
+/* CIntToPy.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_long(long value);
+
+/* CIntToPy.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_uint64_t(uint64_t value);
+
+/* CIntToPy.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_int(int value);
+
+/* CIntToPy.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_uint8_t(uint8_t value);
+
+/* CIntToPy.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_unsigned_long(unsigned long value);
+
+/* CIntFromPy.proto */
+static CYTHON_INLINE long __Pyx_PyInt_As_long(PyObject *);
+
+/* FastTypeChecks.proto */
+#if CYTHON_COMPILING_IN_CPYTHON
+#define __Pyx_TypeCheck(obj, type) __Pyx_IsSubtype(Py_TYPE(obj), (PyTypeObject *)type)
+static CYTHON_INLINE int __Pyx_IsSubtype(PyTypeObject *a, PyTypeObject *b);
+static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches(PyObject *err, PyObject *type);
+static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches2(PyObject *err, PyObject *type1, PyObject *type2);
+#else
+#define __Pyx_TypeCheck(obj, type) PyObject_TypeCheck(obj, (PyTypeObject *)type)
+#define __Pyx_PyErr_GivenExceptionMatches(err, type) PyErr_GivenExceptionMatches(err, type)
+#define __Pyx_PyErr_GivenExceptionMatches2(err, type1, type2) (PyErr_GivenExceptionMatches(err, type1) || PyErr_GivenExceptionMatches(err, type2))
+#endif
+#define __Pyx_PyException_Check(obj) __Pyx_TypeCheck(obj, PyExc_Exception)
+
+/* CheckBinaryVersion.proto */
+static int __Pyx_check_binary_version(void);
+
+/* InitStrings.proto */
+static int __Pyx_InitStrings(__Pyx_StringTabEntry *t);
+
+static int __pyx_f_4xpra_6server_6window_6motion_10ScrollData_hash_columns(struct __pyx_obj_4xpra_6server_6window_6motion_ScrollData *__pyx_v_self); /* proto*/
+static PyObject *__pyx_f_4xpra_6server_6window_6motion_10ScrollData_do_detect(struct __pyx_obj_4xpra_6server_6window_6motion_ScrollData *__pyx_v_self, int __pyx_v_min_percent, int __pyx_v_max_distance, int __pyx_v_horizontal); /* proto*/
+
+/* Module declarations from 'libc.stdint' */
+
+/* Module declarations from 'xpra.server.window.motion' */
+static PyTypeObject *__pyx_ptype_4xpra_6server_6window_6motion_ScrollData = 0;
+static uint64_t __pyx_v_4xpra_6server_6window_6motion_PRIME64_1;
+static uint64_t __pyx_v_4xpra_6server_6window_6motion_PRIME64_2;
+static uint64_t __pyx_v_4xpra_6server_6window_6motion_PRIME64_3;
+static uint64_t __pyx_v_4xpra_6server_6window_6motion_PRIME64_4;
+static uint64_t __pyx_v_4xpra_6server_6window_6motion_PRIME64_5;
+static CYTHON_INLINE uint64_t __pyx_f_4xpra_6server_6window_6motion_rotl64(uint64_t, int); /*proto*/
+static CYTHON_INLINE uint64_t __pyx_f_4xpra_6server_6window_6motion_xxh64_round(uint64_t, uint64_t); /*proto*/
+static uint64_t __pyx_f_4xpra_6server_6window_6motion_hash_tile(uint8_t const *, unsigned int, size_t, unsigned int); /*proto*/
+static PyObject *__pyx_f_4xpra_6server_6window_6motion_match_lines(uint64_t const *, uint8_t const *, uint64_t const *, int, int, int, int, int); /*proto*/
+#define __Pyx_MODULE_NAME "xpra.server.window.motion"
+extern int __pyx_module_is_main_xpra__server__window__motion;
+int __pyx_module_is_main_xpra__server__window__motion = 0;
+
+/* Implementation of 'xpra.server.window.motion' */
+static PyObject *__pyx_builtin_ImportError;
+static PyObject *__pyx_builtin_range;
+static PyObject *__pyx_builtin_TypeError;
+static const char __pyx_k_e[] = "e";
+static const char __pyx_k_f[] = "f";
+static const char __pyx_k_h[] = "h";
+static const char __pyx_k_i[] = "i";
+static const char __pyx_k_x[] = "x";
+static const char __pyx_k_y[] = "y";
+static const char __pyx_k_os[] = "os";
+static const char __pyx_k_th[] = "th";
+static const char __pyx_k_tw[] = "tw";
+static const char __pyx_k_tx[] = "tx";
+static const char __pyx_k_ty[] = "ty";
+static const char __pyx_k_bpp[] = "bpp";
+static const char __pyx_k_buf[] = "buf";
+static const char __pyx_k_col[] = "col";
+static const char __pyx_k_row[] = "row";
+static const char __pyx_k_crcs[] = "crcs";
+static const char __pyx_k_main[] = "__main__";
+static const char __pyx_k_name[] = "__name__";
+static const char __pyx_k_size[] = "size";
+static const char __pyx_k_test[] = "__test__";
+static const char __pyx_k_time[] = "time";
+static const char __pyx_k_warn[] = "warn";
+static const char __pyx_k_zlib[] = "zlib";
+static const char __pyx_k_range[] = "range";
+static const char __pyx_k_tiles[] = "tiles";
+static const char __pyx_k_width[] = "width";
+static const char __pyx_k_xxh64[] = "xxh64";
+static const char __pyx_k_Logger[] = "Logger";
+static const char __pyx_k_hashfn[] = "hashfn";
+static const char __pyx_k_height[] = "height";
+static const char __pyx_k_import[] = "__import__";
+static const char __pyx_k_logger[] = "logger";
+static const char __pyx_k_pixels[] = "pixels";
+static const char __pyx_k_reduce[] = "__reduce__";
+static const char __pyx_k_xxhash[] = "xxhash";
+static const char __pyx_k_buf_len[] = "buf_len";
+static const char __pyx_k_envbool[] = "envbool";
+static const char __pyx_k_row_len[] = "row_len";
+static const char __pyx_k_updates[] = "updates";
+static const char __pyx_k_encoding[] = "encoding";
+static const char __pyx_k_getstate[] = "__getstate__";
+static const char __pyx_k_setstate[] = "__setstate__";
+static const char __pyx_k_xpra_log[] = "xpra.log";
+static const char __pyx_k_CRC_Image[] = "CRC_Image";
+static const char __pyx_k_TypeError[] = "TypeError";
+static const char __pyx_k_intdigest[] = "intdigest";
+static const char __pyx_k_reduce_ex[] = "__reduce_ex__";
+static const char __pyx_k_rowstride[] = "rowstride";
+static const char __pyx_k_tile_size[] = "tile_size";
+static const char __pyx_k_xpra_util[] = "xpra.util";
+static const char __pyx_k_ScrollData[] = "ScrollData";
+static const char __pyx_k_hash_tiles[] = "hash_tiles";
+static const char __pyx_k_horizontal[] = "horizontal";
+static const char __pyx_k_pyx_vtable[] = "__pyx_vtable__";
+static const char __pyx_k_ImportError[] = "ImportError";
+static const char __pyx_k_XPRA_XXHASH[] = "XPRA_XXHASH";
+static const char __pyx_k_min_percent[] = "min_percent";
+static const char __pyx_k_rows_hashed[] = "rows-hashed";
+static const char __pyx_k_max_distance[] = "max_distance";
+static const char __pyx_k_reduce_cython[] = "__reduce_cython__";
+static const char __pyx_k_ScrollData_ix_i[] = "ScrollData(%ix%i)";
+static const char __pyx_k_setstate_cython[] = "__setstate_cython__";
+static const char __pyx_k_cline_in_traceback[] = "cline_in_traceback";
+static const char __pyx_k_no_scrolling_detection[] = " no scrolling detection";
+static const char __pyx_k_Warning_xxhash_disabled[] = "Warning: xxhash disabled";
+static const char __pyx_k_xpra_server_window_motion[] = "xpra.server.window.motion";
+static const char __pyx_k_buffer_is_too_small_for_ix_i[] = "buffer is too small for %ix%i";
+static const char __pyx_k_region_s_does_not_fit_in_ix_i[] = "region %s does not fit in %ix%i";
+static const char __pyx_k_xpra_server_window_motion_pyx[] = "xpra/server/window/motion.pyx";
+static const char __pyx_k_failed_to_allocate_scroll_data[] = "failed to allocate scroll data";
+static const char __pyx_k_Warning_xxhash_python_bindings_n[] = "Warning: xxhash python bindings not found";
+static const char __pyx_k_failed_to_allocate_scroll_detect[] = "failed to allocate scroll detection memory";
+static const char __pyx_k_no_default___reduce___due_to_non[] = "no default __reduce__ due to non-trivial __cinit__";
+static PyObject *__pyx_n_s_CRC_Image;
+static PyObject *__pyx_n_s_ImportError;
+static PyObject *__pyx_n_s_Logger;
+static PyObject *__pyx_n_s_ScrollData;
+static PyObject *__pyx_kp_s_ScrollData_ix_i;
+static PyObject *__pyx_n_s_TypeError;
+static PyObject *__pyx_kp_s_Warning_xxhash_disabled;
+static PyObject *__pyx_kp_s_Warning_xxhash_python_bindings_n;
+static PyObject *__pyx_n_s_XPRA_XXHASH;
+static PyObject *__pyx_n_s_bpp;
+static PyObject *__pyx_n_s_buf;
+static PyObject *__pyx_n_s_buf_len;
+static PyObject *__pyx_kp_s_buffer_is_too_small_for_ix_i;
+static PyObject *__pyx_n_s_cline_in_traceback;
+static PyObject *__pyx_n_s_col;
+static PyObject *__pyx_n_s_crcs;
+static PyObject *__pyx_n_s_e;
+static PyObject *__pyx_n_s_encoding;
+static PyObject *__pyx_n_s_envbool;
+static PyObject *__pyx_n_s_f;
+static PyObject *__pyx_kp_s_failed_to_allocate_scroll_data;
+static PyObject *__pyx_kp_s_failed_to_allocate_scroll_detect;
+static PyObject *__pyx_n_s_getstate;
+static PyObject *__pyx_n_s_h;
+static PyObject *__pyx_n_s_hash_tiles;
+static PyObject *__pyx_n_s_hashfn;
+static PyObject *__pyx_n_s_height;
+static PyObject *__pyx_n_s_horizontal;
+static PyObject *__pyx_n_s_i;
+static PyObject *__pyx_n_s_import;
+static PyObject *__pyx_n_s_intdigest;
+static PyObject *__pyx_n_s_logger;
+static PyObject *__pyx_n_s_main;
+static PyObject *__pyx_n_s_max_distance;
+static PyObject *__pyx_n_s_min_percent;
+static PyObject *__pyx_n_s_name;
+static PyObject *__pyx_kp_s_no_default___reduce___due_to_non;
+static PyObject *__pyx_kp_s_no_scrolling_detection;
+static PyObject *__pyx_n_s_os;
+static PyObject *__pyx_n_s_pixels;
+static PyObject *__pyx_n_s_pyx_vtable;
+static PyObject *__pyx_n_s_range;
+static PyObject *__pyx_n_s_reduce;
+static PyObject *__pyx_n_s_reduce_cython;
+static PyObject *__pyx_n_s_reduce_ex;
+static PyObject *__pyx_kp_s_region_s_does_not_fit_in_ix_i;
+static PyObject *__pyx_n_s_row;
+static PyObject *__pyx_n_s_row_len;
+static PyObject *__pyx_kp_s_rows_hashed;
+static PyObject *__pyx_n_s_rowstride;
+static PyObject *__pyx_n_s_setstate;
+static PyObject *__pyx_n_s_setstate_cython;
+static PyObject *__pyx_n_s_size;
+static PyObject *__pyx_n_s_test;
+static PyObject *__pyx_n_s_th;
+static PyObject *__pyx_n_s_tile_size;
+static PyObject *__pyx_n_s_tiles;
+static PyObject *__pyx_n_s_time;
+static PyObject *__pyx_n_s_tw;
+static PyObject *__pyx_n_s_tx;
+static PyObject *__pyx_n_s_ty;
+static PyObject *__pyx_n_s_updates;
+static PyObject *__pyx_n_s_warn;
+static PyObject *__pyx_n_s_width;
+static PyObject *__pyx_n_s_x;
+static PyObject *__pyx_n_s_xpra_log;
+static PyObject *__pyx_n_s_xpra_server_window_motion;
+static PyObject *__pyx_kp_s_xpra_server_window_motion_pyx;
+static PyObject *__pyx_n_s_xpra_util;
+static PyObject *__pyx_n_s_xxh64;
+static PyObject *__pyx_n_s_xxhash;
+static PyObject *__pyx_n_s_y;
+static PyObject *__pyx_n_s_zlib;
+static PyObject *__pyx_pf_4xpra_6server_6window_6motion_hashfn(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_x); /* proto */
+static PyObject *__pyx_pf_4xpra_6server_6window_6motion_2CRC_Image(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_pixels, unsigned int __pyx_v_width, unsigned int __pyx_v_height, unsigned int __pyx_v_rowstride, unsigned char __pyx_v_bpp); /* proto */
+static PyObject *__pyx_pf_4xpra_6server_6window_6motion_4hash_tiles(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_pixels, unsigned int __pyx_v_x, unsigned int __pyx_v_y, unsigned int __pyx_v_width, unsigned int __pyx_v_height, unsigned int __pyx_v_rowstride, unsigned int __pyx_v_tile_size, unsigned char __pyx_v_bpp); /* proto */
+static int __pyx_pf_4xpra_6server_6window_6motion_10ScrollData___cinit__(struct __pyx_obj_4xpra_6server_6window_6motion_ScrollData *__pyx_v_self, unsigned int __pyx_v_width, unsigned int __pyx_v_height); /* proto */
+static void __pyx_pf_4xpra_6server_6window_6motion_10ScrollData_2__dealloc__(struct __pyx_obj_4xpra_6server_6window_6motion_ScrollData *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_4xpra_6server_6window_6motion_10ScrollData_4__repr__(struct __pyx_obj_4xpra_6server_6window_6motion_ScrollData *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_4xpra_6server_6window_6motion_10ScrollData_6get_info(struct __pyx_obj_4xpra_6server_6window_6motion_ScrollData *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_4xpra_6server_6window_6motion_10ScrollData_8invalidate(struct __pyx_obj_4xpra_6server_6window_6motion_ScrollData *__pyx_v_self, int __pyx_v_x, int __pyx_v_y, int __pyx_v_width, int __pyx_v_height); /* proto */
+static PyObject *__pyx_pf_4xpra_6server_6window_6motion_10ScrollData_10update(struct __pyx_obj_4xpra_6server_6window_6motion_ScrollData *__pyx_v_self, PyObject *__pyx_v_pixels, int __pyx_v_x, int __pyx_v_y, unsigned int __pyx_v_width, unsigned int __pyx_v_height, unsigned int __pyx_v_rowstride, unsigned char __pyx_v_bpp); /* proto */
+static PyObject *__pyx_pf_4xpra_6server_6window_6motion_10ScrollData_12detect(struct __pyx_obj_4xpra_6server_6window_6motion_ScrollData *__pyx_v_self, int __pyx_v_min_percent, int __pyx_v_max_distance, int __pyx_v_horizontal); /* proto */
+static PyObject *__pyx_pf_4xpra_6server_6window_6motion_10ScrollData_5width___get__(struct __pyx_obj_4xpra_6server_6window_6motion_ScrollData *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_4xpra_6server_6window_6motion_10ScrollData_6height___get__(struct __pyx_obj_4xpra_6server_6window_6motion_ScrollData *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_4xpra_6server_6window_6motion_10ScrollData_14__reduce_cython__(CYTHON_UNUSED struct __pyx_obj_4xpra_6server_6window_6motion_ScrollData *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_4xpra_6server_6window_6motion_10ScrollData_16__setstate_cython__(CYTHON_UNUSED struct __pyx_obj_4xpra_6server_6window_6motion_ScrollData *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v___pyx_state); /* proto */
+static PyObject *__pyx_tp_new_4xpra_6server_6window_6motion_ScrollData(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
+static PyObject *__pyx_int_0;
+static PyObject *__pyx_tuple_;
+static PyObject *__pyx_tuple__2;
+static PyObject *__pyx_tuple__3;
+static PyObject *__pyx_tuple__4;
+static PyObject *__pyx_tuple__5;
+static PyObject *__pyx_tuple__7;
+static PyObject *__pyx_tuple__8;
+static PyObject *__pyx_tuple__9;
+static PyObject *__pyx_tuple__10;
+static PyObject *__pyx_tuple__12;
+static PyObject *__pyx_codeobj__6;
+static PyObject *__pyx_codeobj__11;
+static PyObject *__pyx_codeobj__13;
+/* Late includes */
+
+/* "xpra/server/window/motion.pyx":22
+ *     try:
+ *         import xxhash
+ *         def hashfn(x):             # <<<<<<<<<<<<<<
+ *             return xxhash.xxh64(x).intdigest()
+ *     except ImportError as e:
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_4xpra_6server_6window_6motion_1hashfn(PyObject *__pyx_self, PyObject *__pyx_v_x); /*proto*/
+static PyMethodDef __pyx_mdef_4xpra_6server_6window_6motion_1hashfn = {"hashfn", (PyCFunction)__pyx_pw_4xpra_6server_6window_6motion_1hashfn, METH_O, 0};
+static PyObject *__pyx_pw_4xpra_6server_6window_6motion_1hashfn(PyObject *__pyx_self, PyObject *__pyx_v_x) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("hashfn (wrapper)", 0);
+  __pyx_r = __pyx_pf_4xpra_6server_6window_6motion_hashfn(__pyx_self, ((PyObject *)__pyx_v_x));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_4xpra_6server_6window_6motion_hashfn(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_x) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("hashfn", 0);
+
+  /* "xpra/server/window/motion.pyx":23
+ *         import xxhash
+ *         def hashfn(x):
+ *             return xxhash.xxh64(x).intdigest()             # <<<<<<<<<<<<<<
+ *     except ImportError as e:
+ *         logger.warn("Warning: xxhash python bindings not found")
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_xxhash); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 23, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_xxh64); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 23, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_3 = NULL;
+  if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_4))) {
+    __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_4);
+    if (likely(__pyx_t_3)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
+      __Pyx_INCREF(__pyx_t_3);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_4, function);
+    }
+  }
+  __pyx_t_2 = (__pyx_t_3) ? __Pyx_PyObject_Call2Args(__pyx_t_4, __pyx_t_3, __pyx_v_x) : __Pyx_PyObject_CallOneArg(__pyx_t_4, __pyx_v_x);
+  __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+  if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 23, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_intdigest); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 23, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = NULL;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_4))) {
+    __pyx_t_2 = PyMethod_GET_SELF(__pyx_t_4);
+    if (likely(__pyx_t_2)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
+      __Pyx_INCREF(__pyx_t_2);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_4, function);
+    }
+  }
+  __pyx_t_1 = (__pyx_t_2) ? __Pyx_PyObject_CallOneArg(__pyx_t_4, __pyx_t_2) : __Pyx_PyObject_CallNoArg(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
+  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 23, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* "xpra/server/window/motion.pyx":22
+ *     try:
+ *         import xxhash
+ *         def hashfn(x):             # <<<<<<<<<<<<<<
+ *             return xxhash.xxh64(x).intdigest()
+ *     except ImportError as e:
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_AddTraceback("xpra.server.window.motion.hashfn", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "xpra/server/window/motion.pyx":53
+ * 
+ * 
+ * def CRC_Image(pixels, unsigned int width, unsigned int height, unsigned int rowstride, unsigned char bpp=4):             # <<<<<<<<<<<<<<
+ *     global hashfn
+ *     if not hashfn:
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_4xpra_6server_6window_6motion_3CRC_Image(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static PyMethodDef __pyx_mdef_4xpra_6server_6window_6motion_3CRC_Image = {"CRC_Image", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_4xpra_6server_6window_6motion_3CRC_Image, METH_VARARGS|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_4xpra_6server_6window_6motion_3CRC_Image(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_pixels = 0;
+  unsigned int __pyx_v_width;
+  unsigned int __pyx_v_height;
+  unsigned int __pyx_v_rowstride;
+  unsigned char __pyx_v_bpp;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("CRC_Image (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_pixels,&__pyx_n_s_width,&__pyx_n_s_height,&__pyx_n_s_rowstride,&__pyx_n_s_bpp,0};
+    PyObject* values[5] = {0,0,0,0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  5: values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+        CYTHON_FALLTHROUGH;
+        case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+        CYTHON_FALLTHROUGH;
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_pixels)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_width)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("CRC_Image", 0, 4, 5, 1); __PYX_ERR(0, 53, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  2:
+        if (likely((values[2] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_height)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("CRC_Image", 0, 4, 5, 2); __PYX_ERR(0, 53, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  3:
+        if (likely((values[3] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_rowstride)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("CRC_Image", 0, 4, 5, 3); __PYX_ERR(0, 53, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  4:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_bpp);
+          if (value) { values[4] = value; kw_args--; }
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "CRC_Image") < 0)) __PYX_ERR(0, 53, __pyx_L3_error)
+      }
+    } else {
+      switch (PyTuple_GET_SIZE(__pyx_args)) {
+        case  5: values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+        CYTHON_FALLTHROUGH;
+        case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+        values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+    }
+    __pyx_v_pixels = values[0];
+    __pyx_v_width = __Pyx_PyInt_As_unsigned_int(values[1]); if (unlikely((__pyx_v_width == (unsigned int)-1) && PyErr_Occurred())) __PYX_ERR(0, 53, __pyx_L3_error)
+    __pyx_v_height = __Pyx_PyInt_As_unsigned_int(values[2]); if (unlikely((__pyx_v_height == (unsigned int)-1) && PyErr_Occurred())) __PYX_ERR(0, 53, __pyx_L3_error)
+    __pyx_v_rowstride = __Pyx_PyInt_As_unsigned_int(values[3]); if (unlikely((__pyx_v_rowstride == (unsigned int)-1) && PyErr_Occurred())) __PYX_ERR(0, 53, __pyx_L3_error)
+    if (values[4]) {
+      __pyx_v_bpp = __Pyx_PyInt_As_unsigned_char(values[4]); if (unlikely((__pyx_v_bpp == (unsigned char)-1) && PyErr_Occurred())) __PYX_ERR(0, 53, __pyx_L3_error)
+    } else {
+      __pyx_v_bpp = ((unsigned char)4);
+    }
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("CRC_Image", 0, 4, 5, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 53, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("xpra.server.window.motion.CRC_Image", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_4xpra_6server_6window_6motion_2CRC_Image(__pyx_self, __pyx_v_pixels, __pyx_v_width, __pyx_v_height, __pyx_v_rowstride, __pyx_v_bpp);
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_4xpra_6server_6window_6motion_2CRC_Image(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_pixels, unsigned int __pyx_v_width, unsigned int __pyx_v_height, unsigned int __pyx_v_rowstride, unsigned char __pyx_v_bpp) {
+  uint8_t *__pyx_v_buf;
+  Py_ssize_t __pyx_v_buf_len;
+  CYTHON_UNUSED unsigned int __pyx_v_i;
+  size_t __pyx_v_row_len;
+  PyObject *__pyx_v_f = NULL;
+  PyObject *__pyx_v_crcs = NULL;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  unsigned int __pyx_t_6;
+  unsigned int __pyx_t_7;
+  unsigned int __pyx_t_8;
+  PyObject *__pyx_t_9 = NULL;
+  int __pyx_t_10;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("CRC_Image", 0);
+
+  /* "xpra/server/window/motion.pyx":55
+ * def CRC_Image(pixels, unsigned int width, unsigned int height, unsigned int rowstride, unsigned char bpp=4):
+ *     global hashfn
+ *     if not hashfn:             # <<<<<<<<<<<<<<
+ *         return None
+ *     cdef uint8_t *buf = NULL
+ */
+  __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_n_s_hashfn); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 55, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely(__pyx_t_2 < 0)) __PYX_ERR(0, 55, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_3 = ((!__pyx_t_2) != 0);
+  if (__pyx_t_3) {
+
+    /* "xpra/server/window/motion.pyx":56
+ *     global hashfn
+ *     if not hashfn:
+ *         return None             # <<<<<<<<<<<<<<
+ *     cdef uint8_t *buf = NULL
+ *     cdef Py_ssize_t buf_len = 0
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+    goto __pyx_L0;
+
+    /* "xpra/server/window/motion.pyx":55
+ * def CRC_Image(pixels, unsigned int width, unsigned int height, unsigned int rowstride, unsigned char bpp=4):
+ *     global hashfn
+ *     if not hashfn:             # <<<<<<<<<<<<<<
+ *         return None
+ *     cdef uint8_t *buf = NULL
+ */
+  }
+
+  /* "xpra/server/window/motion.pyx":57
+ *     if not hashfn:
+ *         return None
+ *     cdef uint8_t *buf = NULL             # <<<<<<<<<<<<<<
+ *     cdef Py_ssize_t buf_len = 0
+ *     assert object_as_buffer(pixels, <const void**> &buf, &buf_len)==0
+ */
+  __pyx_v_buf = NULL;
+
+  /* "xpra/server/window/motion.pyx":58
+ *         return None
+ *     cdef uint8_t *buf = NULL
+ *     cdef Py_ssize_t buf_len = 0             # <<<<<<<<<<<<<<
+ *     assert object_as_buffer(pixels, <const void**> &buf, &buf_len)==0
+ *     assert buf_len>=0 and (<unsigned int> buf_len)>=rowstride*height, "buffer is too small for %ix%i" % (rowstride, height)
+ */
+  __pyx_v_buf_len = 0;
+
+  /* "xpra/server/window/motion.pyx":59
+ *     cdef uint8_t *buf = NULL
+ *     cdef Py_ssize_t buf_len = 0
+ *     assert object_as_buffer(pixels, <const void**> &buf, &buf_len)==0             # <<<<<<<<<<<<<<
+ *     assert buf_len>=0 and (<unsigned int> buf_len)>=rowstride*height, "buffer is too small for %ix%i" % (rowstride, height)
+ *     cdef unsigned int i
+ */
+  #ifndef CYTHON_WITHOUT_ASSERTIONS
+  if (unlikely(__pyx_assertions_enabled())) {
+    if (unlikely(!((object_as_buffer(__pyx_v_pixels, ((void const **)(&__pyx_v_buf)), (&__pyx_v_buf_len)) == 0) != 0))) {
+      PyErr_SetNone(PyExc_AssertionError);
+      __PYX_ERR(0, 59, __pyx_L1_error)
+    }
+  }
+  #endif
+
+  /* "xpra/server/window/motion.pyx":60
+ *     cdef Py_ssize_t buf_len = 0
+ *     assert object_as_buffer(pixels, <const void**> &buf, &buf_len)==0
+ *     assert buf_len>=0 and (<unsigned int> buf_len)>=rowstride*height, "buffer is too small for %ix%i" % (rowstride, height)             # <<<<<<<<<<<<<<
+ *     cdef unsigned int i
+ *     cdef size_t row_len = width*bpp
+ */
+  #ifndef CYTHON_WITHOUT_ASSERTIONS
+  if (unlikely(__pyx_assertions_enabled())) {
+    __pyx_t_2 = ((__pyx_v_buf_len >= 0) != 0);
+    if (__pyx_t_2) {
+    } else {
+      __pyx_t_3 = __pyx_t_2;
+      goto __pyx_L4_bool_binop_done;
+    }
+    __pyx_t_2 = ((((unsigned int)__pyx_v_buf_len) >= (__pyx_v_rowstride * __pyx_v_height)) != 0);
+    __pyx_t_3 = __pyx_t_2;
+    __pyx_L4_bool_binop_done:;
+    if (unlikely(!__pyx_t_3)) {
+      __pyx_t_1 = __Pyx_PyInt_From_unsigned_int(__pyx_v_rowstride); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 60, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      __pyx_t_4 = __Pyx_PyInt_From_unsigned_int(__pyx_v_height); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 60, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_4);
+      __pyx_t_5 = PyTuple_New(2); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 60, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_5);
+      __Pyx_GIVEREF(__pyx_t_1);
+      PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_1);
+      __Pyx_GIVEREF(__pyx_t_4);
+      PyTuple_SET_ITEM(__pyx_t_5, 1, __pyx_t_4);
+      __pyx_t_1 = 0;
+      __pyx_t_4 = 0;
+      __pyx_t_4 = __Pyx_PyString_Format(__pyx_kp_s_buffer_is_too_small_for_ix_i, __pyx_t_5); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 60, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_4);
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      PyErr_SetObject(PyExc_AssertionError, __pyx_t_4);
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+      __PYX_ERR(0, 60, __pyx_L1_error)
+    }
+  }
+  #endif
+
+  /* "xpra/server/window/motion.pyx":62
+ *     assert buf_len>=0 and (<unsigned int> buf_len)>=rowstride*height, "buffer is too small for %ix%i" % (rowstride, height)
+ *     cdef unsigned int i
+ *     cdef size_t row_len = width*bpp             # <<<<<<<<<<<<<<
+ *     f = hashfn
+ *     crcs = []
+ */
+  __pyx_v_row_len = (__pyx_v_width * __pyx_v_bpp);
+
+  /* "xpra/server/window/motion.pyx":63
+ *     cdef unsigned int i
+ *     cdef size_t row_len = width*bpp
+ *     f = hashfn             # <<<<<<<<<<<<<<
+ *     crcs = []
+ *     for i in range(height):
+ */
+  __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_hashfn); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 63, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_v_f = __pyx_t_4;
+  __pyx_t_4 = 0;
+
+  /* "xpra/server/window/motion.pyx":64
+ *     cdef size_t row_len = width*bpp
+ *     f = hashfn
+ *     crcs = []             # <<<<<<<<<<<<<<
+ *     for i in range(height):
+ *         crcs.append(f(buf[:row_len]))
+ */
+  __pyx_t_4 = PyList_New(0); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 64, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_v_crcs = ((PyObject*)__pyx_t_4);
+  __pyx_t_4 = 0;
+
+  /* "xpra/server/window/motion.pyx":65
+ *     f = hashfn
+ *     crcs = []
+ *     for i in range(height):             # <<<<<<<<<<<<<<
+ *         crcs.append(f(buf[:row_len]))
+ *         buf += rowstride
+ */
+  __pyx_t_6 = __pyx_v_height;
+  __pyx_t_7 = __pyx_t_6;
+  for (__pyx_t_8 = 0; __pyx_t_8 < __pyx_t_7; __pyx_t_8+=1) {
+    __pyx_v_i = __pyx_t_8;
+
+    /* "xpra/server/window/motion.pyx":66
+ *     crcs = []
+ *     for i in range(height):
+ *         crcs.append(f(buf[:row_len]))             # <<<<<<<<<<<<<<
+ *         buf += rowstride
+ *     return crcs
+ */
+    __pyx_t_5 = __Pyx_PyBytes_FromStringAndSize(((const char*)__pyx_v_buf) + 0, __pyx_v_row_len - 0); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 66, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_INCREF(__pyx_v_f);
+    __pyx_t_1 = __pyx_v_f; __pyx_t_9 = NULL;
+    if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_1))) {
+      __pyx_t_9 = PyMethod_GET_SELF(__pyx_t_1);
+      if (likely(__pyx_t_9)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_1);
+        __Pyx_INCREF(__pyx_t_9);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_1, function);
+      }
+    }
+    __pyx_t_4 = (__pyx_t_9) ? __Pyx_PyObject_Call2Args(__pyx_t_1, __pyx_t_9, __pyx_t_5) : __Pyx_PyObject_CallOneArg(__pyx_t_1, __pyx_t_5);
+    __Pyx_XDECREF(__pyx_t_9); __pyx_t_9 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 66, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __pyx_t_10 = __Pyx_PyList_Append(__pyx_v_crcs, __pyx_t_4); if (unlikely(__pyx_t_10 == ((int)-1))) __PYX_ERR(0, 66, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+    /* "xpra/server/window/motion.pyx":67
+ *     for i in range(height):
+ *         crcs.append(f(buf[:row_len]))
+ *         buf += rowstride             # <<<<<<<<<<<<<<
+ *     return crcs
+ * 
+ */
+    __pyx_v_buf = (__pyx_v_buf + __pyx_v_rowstride);
+  }
+
+  /* "xpra/server/window/motion.pyx":68
+ *         crcs.append(f(buf[:row_len]))
+ *         buf += rowstride
+ *     return crcs             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v_crcs);
+  __pyx_r = __pyx_v_crcs;
+  goto __pyx_L0;
+
+  /* "xpra/server/window/motion.pyx":53
+ * 
+ * 
+ * def CRC_Image(pixels, unsigned int width, unsigned int height, unsigned int rowstride, unsigned char bpp=4):             # <<<<<<<<<<<<<<
+ *     global hashfn
+ *     if not hashfn:
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_9);
+  __Pyx_AddTraceback("xpra.server.window.motion.CRC_Image", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_f);
+  __Pyx_XDECREF(__pyx_v_crcs);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "xpra/server/window/motion.pyx":78
+ * cdef uint64_t PRIME64_5 = 2870177450012600261ULL
+ * 
+ * cdef inline uint64_t rotl64(uint64_t v, int r) nogil:             # <<<<<<<<<<<<<<
+ *     return (v<<r) | (v>>(64-r))
+ * 
+ */
+
+static CYTHON_INLINE uint64_t __pyx_f_4xpra_6server_6window_6motion_rotl64(uint64_t __pyx_v_v, int __pyx_v_r) {
+  uint64_t __pyx_r;
+
+  /* "xpra/server/window/motion.pyx":79
+ * 
+ * cdef inline uint64_t rotl64(uint64_t v, int r) nogil:
+ *     return (v<<r) | (v>>(64-r))             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline uint64_t xxh64_round(uint64_t acc, uint64_t v) nogil:
+ */
+  __pyx_r = ((__pyx_v_v << __pyx_v_r) | (__pyx_v_v >> (64 - __pyx_v_r)));
+  goto __pyx_L0;
+
+  /* "xpra/server/window/motion.pyx":78
+ * cdef uint64_t PRIME64_5 = 2870177450012600261ULL
+ * 
+ * cdef inline uint64_t rotl64(uint64_t v, int r) nogil:             # <<<<<<<<<<<<<<
+ *     return (v<<r) | (v>>(64-r))
+ * 
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "xpra/server/window/motion.pyx":81
+ *     return (v<<r) | (v>>(64-r))
+ * 
+ * cdef inline uint64_t xxh64_round(uint64_t acc, uint64_t v) nogil:             # <<<<<<<<<<<<<<
+ *     acc += v*PRIME64_2
+ *     acc = rotl64(acc, 31)
+ */
+
+static CYTHON_INLINE uint64_t __pyx_f_4xpra_6server_6window_6motion_xxh64_round(uint64_t __pyx_v_acc, uint64_t __pyx_v_v) {
+  uint64_t __pyx_r;
+
+  /* "xpra/server/window/motion.pyx":82
+ * 
+ * cdef inline uint64_t xxh64_round(uint64_t acc, uint64_t v) nogil:
+ *     acc += v*PRIME64_2             # <<<<<<<<<<<<<<
+ *     acc = rotl64(acc, 31)
+ *     return acc*PRIME64_1
+ */
+  __pyx_v_acc = (__pyx_v_acc + (__pyx_v_v * __pyx_v_4xpra_6server_6window_6motion_PRIME64_2));
+
+  /* "xpra/server/window/motion.pyx":83
+ * cdef inline uint64_t xxh64_round(uint64_t acc, uint64_t v) nogil:
+ *     acc += v*PRIME64_2
+ *     acc = rotl64(acc, 31)             # <<<<<<<<<<<<<<
+ *     return acc*PRIME64_1
+ * 
+ */
+  __pyx_v_acc = __pyx_f_4xpra_6server_6window_6motion_rotl64(__pyx_v_acc, 31);
+
+  /* "xpra/server/window/motion.pyx":84
+ *     acc += v*PRIME64_2
+ *     acc = rotl64(acc, 31)
+ *     return acc*PRIME64_1             # <<<<<<<<<<<<<<
+ * 
+ * cdef uint64_t hash_tile(const uint8_t *buf, unsigned int rowstride, size_t row_len, unsigned int rows) nogil:
+ */
+  __pyx_r = (__pyx_v_acc * __pyx_v_4xpra_6server_6window_6motion_PRIME64_1);
+  goto __pyx_L0;
+
+  /* "xpra/server/window/motion.pyx":81
+ *     return (v<<r) | (v>>(64-r))
+ * 
+ * cdef inline uint64_t xxh64_round(uint64_t acc, uint64_t v) nogil:             # <<<<<<<<<<<<<<
+ *     acc += v*PRIME64_2
+ *     acc = rotl64(acc, 31)
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "xpra/server/window/motion.pyx":86
+ *     return acc*PRIME64_1
+ * 
+ * cdef uint64_t hash_tile(const uint8_t *buf, unsigned int rowstride, size_t row_len, unsigned int rows) nogil:             # <<<<<<<<<<<<<<
+ *     #hashes a tile using the xxh64 round function,
+ *     #the rows of the tile are not contiguous in memory so we can't use the python bindings
+ */
+
+static uint64_t __pyx_f_4xpra_6server_6window_6motion_hash_tile(uint8_t const *__pyx_v_buf, unsigned int __pyx_v_rowstride, size_t __pyx_v_row_len, unsigned int __pyx_v_rows) {
+  uint64_t __pyx_v_h;
+  uint64_t __pyx_v_v;
+  uint32_t __pyx_v_v32;
+  size_t __pyx_v_i;
+  CYTHON_UNUSED unsigned int __pyx_v_y;
+  uint64_t __pyx_r;
+  unsigned int __pyx_t_1;
+  unsigned int __pyx_t_2;
+  unsigned int __pyx_t_3;
+  int __pyx_t_4;
+
+  /* "xpra/server/window/motion.pyx":89
+ *     #hashes a tile using the xxh64 round function,
+ *     #the rows of the tile are not contiguous in memory so we can't use the python bindings
+ *     cdef uint64_t h = PRIME64_5 + row_len*rows             # <<<<<<<<<<<<<<
+ *     cdef uint64_t v = 0
+ *     cdef uint32_t v32 = 0
+ */
+  __pyx_v_h = (__pyx_v_4xpra_6server_6window_6motion_PRIME64_5 + (__pyx_v_row_len * __pyx_v_rows));
+
+  /* "xpra/server/window/motion.pyx":90
+ *     #the rows of the tile are not contiguous in memory so we can't use the python bindings
+ *     cdef uint64_t h = PRIME64_5 + row_len*rows
+ *     cdef uint64_t v = 0             # <<<<<<<<<<<<<<
+ *     cdef uint32_t v32 = 0
+ *     cdef size_t i
+ */
+  __pyx_v_v = 0;
+
+  /* "xpra/server/window/motion.pyx":91
+ *     cdef uint64_t h = PRIME64_5 + row_len*rows
+ *     cdef uint64_t v = 0
+ *     cdef uint32_t v32 = 0             # <<<<<<<<<<<<<<
+ *     cdef size_t i
+ *     cdef unsigned int y
+ */
+  __pyx_v_v32 = 0;
+
+  /* "xpra/server/window/motion.pyx":94
+ *     cdef size_t i
+ *     cdef unsigned int y
+ *     for y in range(rows):             # <<<<<<<<<<<<<<
+ *         i = 0
+ *         while i+8<=row_len:
+ */
+  __pyx_t_1 = __pyx_v_rows;
+  __pyx_t_2 = __pyx_t_1;
+  for (__pyx_t_3 = 0; __pyx_t_3 < __pyx_t_2; __pyx_t_3+=1) {
+    __pyx_v_y = __pyx_t_3;
+
+    /* "xpra/server/window/motion.pyx":95
+ *     cdef unsigned int y
+ *     for y in range(rows):
+ *         i = 0             # <<<<<<<<<<<<<<
+ *         while i+8<=row_len:
+ *             memcpy(&v, buf+i, 8)
+ */
+    __pyx_v_i = 0;
+
+    /* "xpra/server/window/motion.pyx":96
+ *     for y in range(rows):
+ *         i = 0
+ *         while i+8<=row_len:             # <<<<<<<<<<<<<<
+ *             memcpy(&v, buf+i, 8)
+ *             h = rotl64(h ^ xxh64_round(0, v), 27)*PRIME64_1 + PRIME64_4
+ */
+    while (1) {
+      __pyx_t_4 = (((__pyx_v_i + 8) <= __pyx_v_row_len) != 0);
+      if (!__pyx_t_4) break;
+
+      /* "xpra/server/window/motion.pyx":97
+ *         i = 0
+ *         while i+8<=row_len:
+ *             memcpy(&v, buf+i, 8)             # <<<<<<<<<<<<<<
+ *             h = rotl64(h ^ xxh64_round(0, v), 27)*PRIME64_1 + PRIME64_4
+ *             i += 8
+ */
+      (void)(memcpy((&__pyx_v_v), (__pyx_v_buf + __pyx_v_i), 8));
+
+      /* "xpra/server/window/motion.pyx":98
+ *         while i+8<=row_len:
+ *             memcpy(&v, buf+i, 8)
+ *             h = rotl64(h ^ xxh64_round(0, v), 27)*PRIME64_1 + PRIME64_4             # <<<<<<<<<<<<<<
+ *             i += 8
+ *         if i+4<=row_len:
+ */
+      __pyx_v_h = ((__pyx_f_4xpra_6server_6window_6motion_rotl64((__pyx_v_h ^ __pyx_f_4xpra_6server_6window_6motion_xxh64_round(0, __pyx_v_v)), 27) * __pyx_v_4xpra_6server_6window_6motion_PRIME64_1) + __pyx_v_4xpra_6server_6window_6motion_PRIME64_4);
+
+      /* "xpra/server/window/motion.pyx":99
+ *             memcpy(&v, buf+i, 8)
+ *             h = rotl64(h ^ xxh64_round(0, v), 27)*PRIME64_1 + PRIME64_4
+ *             i += 8             # <<<<<<<<<<<<<<
+ *         if i+4<=row_len:
+ *             memcpy(&v32, buf+i, 4)
+ */
+      __pyx_v_i = (__pyx_v_i + 8);
+    }
+
+    /* "xpra/server/window/motion.pyx":100
+ *             h = rotl64(h ^ xxh64_round(0, v), 27)*PRIME64_1 + PRIME64_4
+ *             i += 8
+ *         if i+4<=row_len:             # <<<<<<<<<<<<<<
+ *             memcpy(&v32, buf+i, 4)
+ *             h = rotl64(h ^ (v32*PRIME64_1), 23)*PRIME64_2 + PRIME64_3
+ */
+    __pyx_t_4 = (((__pyx_v_i + 4) <= __pyx_v_row_len) != 0);
+    if (__pyx_t_4) {
+
+      /* "xpra/server/window/motion.pyx":101
+ *             i += 8
+ *         if i+4<=row_len:
+ *             memcpy(&v32, buf+i, 4)             # <<<<<<<<<<<<<<
+ *             h = rotl64(h ^ (v32*PRIME64_1), 23)*PRIME64_2 + PRIME64_3
+ *             i += 4
+ */
+      (void)(memcpy((&__pyx_v_v32), (__pyx_v_buf + __pyx_v_i), 4));
+
+      /* "xpra/server/window/motion.pyx":102
+ *         if i+4<=row_len:
+ *             memcpy(&v32, buf+i, 4)
+ *             h = rotl64(h ^ (v32*PRIME64_1), 23)*PRIME64_2 + PRIME64_3             # <<<<<<<<<<<<<<
+ *             i += 4
+ *         while i<row_len:
+ */
+      __pyx_v_h = ((__pyx_f_4xpra_6server_6window_6motion_rotl64((__pyx_v_h ^ (__pyx_v_v32 * __pyx_v_4xpra_6server_6window_6motion_PRIME64_1)), 23) * __pyx_v_4xpra_6server_6window_6motion_PRIME64_2) + __pyx_v_4xpra_6server_6window_6motion_PRIME64_3);
+
+      /* "xpra/server/window/motion.pyx":103
+ *             memcpy(&v32, buf+i, 4)
+ *             h = rotl64(h ^ (v32*PRIME64_1), 23)*PRIME64_2 + PRIME64_3
+ *             i += 4             # <<<<<<<<<<<<<<
+ *         while i<row_len:
+ *             h = rotl64(h ^ (buf[i]*PRIME64_5), 11)*PRIME64_1
+ */
+      __pyx_v_i = (__pyx_v_i + 4);
+
+      /* "xpra/server/window/motion.pyx":100
+ *             h = rotl64(h ^ xxh64_round(0, v), 27)*PRIME64_1 + PRIME64_4
+ *             i += 8
+ *         if i+4<=row_len:             # <<<<<<<<<<<<<<
+ *             memcpy(&v32, buf+i, 4)
+ *             h = rotl64(h ^ (v32*PRIME64_1), 23)*PRIME64_2 + PRIME64_3
+ */
+    }
+
+    /* "xpra/server/window/motion.pyx":104
+ *             h = rotl64(h ^ (v32*PRIME64_1), 23)*PRIME64_2 + PRIME64_3
+ *             i += 4
+ *         while i<row_len:             # <<<<<<<<<<<<<<
+ *             h = rotl64(h ^ (buf[i]*PRIME64_5), 11)*PRIME64_1
+ *             i += 1
+ */
+    while (1) {
+      __pyx_t_4 = ((__pyx_v_i < __pyx_v_row_len) != 0);
+      if (!__pyx_t_4) break;
+
+      /* "xpra/server/window/motion.pyx":105
+ *             i += 4
+ *         while i<row_len:
+ *             h = rotl64(h ^ (buf[i]*PRIME64_5), 11)*PRIME64_1             # <<<<<<<<<<<<<<
+ *             i += 1
+ *         buf += rowstride
+ */
+      __pyx_v_h = (__pyx_f_4xpra_6server_6window_6motion_rotl64((__pyx_v_h ^ ((__pyx_v_buf[__pyx_v_i]) * __pyx_v_4xpra_6server_6window_6motion_PRIME64_5)), 11) * __pyx_v_4xpra_6server_6window_6motion_PRIME64_1);
+
+      /* "xpra/server/window/motion.pyx":106
+ *         while i<row_len:
+ *             h = rotl64(h ^ (buf[i]*PRIME64_5), 11)*PRIME64_1
+ *             i += 1             # <<<<<<<<<<<<<<
+ *         buf += rowstride
+ *     #avalanche:
+ */
+      __pyx_v_i = (__pyx_v_i + 1);
+    }
+
+    /* "xpra/server/window/motion.pyx":107
+ *             h = rotl64(h ^ (buf[i]*PRIME64_5), 11)*PRIME64_1
+ *             i += 1
+ *         buf += rowstride             # <<<<<<<<<<<<<<
+ *     #avalanche:
+ *     h ^= h >> 33
+ */
+    __pyx_v_buf = (__pyx_v_buf + __pyx_v_rowstride);
+  }
+
+  /* "xpra/server/window/motion.pyx":109
+ *         buf += rowstride
+ *     #avalanche:
+ *     h ^= h >> 33             # <<<<<<<<<<<<<<
+ *     h *= PRIME64_2
+ *     h ^= h >> 29
+ */
+  __pyx_v_h = (__pyx_v_h ^ (__pyx_v_h >> 33));
+
+  /* "xpra/server/window/motion.pyx":110
+ *     #avalanche:
+ *     h ^= h >> 33
+ *     h *= PRIME64_2             # <<<<<<<<<<<<<<
+ *     h ^= h >> 29
+ *     h *= PRIME64_3
+ */
+  __pyx_v_h = (__pyx_v_h * __pyx_v_4xpra_6server_6window_6motion_PRIME64_2);
+
+  /* "xpra/server/window/motion.pyx":111
+ *     h ^= h >> 33
+ *     h *= PRIME64_2
+ *     h ^= h >> 29             # <<<<<<<<<<<<<<
+ *     h *= PRIME64_3
+ *     h ^= h >> 32
+ */
+  __pyx_v_h = (__pyx_v_h ^ (__pyx_v_h >> 29));
+
+  /* "xpra/server/window/motion.pyx":112
+ *     h *= PRIME64_2
+ *     h ^= h >> 29
+ *     h *= PRIME64_3             # <<<<<<<<<<<<<<
+ *     h ^= h >> 32
+ *     return h
+ */
+  __pyx_v_h = (__pyx_v_h * __pyx_v_4xpra_6server_6window_6motion_PRIME64_3);
+
+  /* "xpra/server/window/motion.pyx":113
+ *     h ^= h >> 29
+ *     h *= PRIME64_3
+ *     h ^= h >> 32             # <<<<<<<<<<<<<<
+ *     return h
+ * 
+ */
+  __pyx_v_h = (__pyx_v_h ^ (__pyx_v_h >> 32));
+
+  /* "xpra/server/window/motion.pyx":114
+ *     h *= PRIME64_3
+ *     h ^= h >> 32
+ *     return h             # <<<<<<<<<<<<<<
+ * 
+ * def hash_tiles(pixels, unsigned int x, unsigned int y, unsigned int width, unsigned int height, unsigned int rowstride, unsigned int tile_size=64, unsigned char bpp=4):
+ */
+  __pyx_r = __pyx_v_h;
+  goto __pyx_L0;
+
+  /* "xpra/server/window/motion.pyx":86
+ *     return acc*PRIME64_1
+ * 
+ * cdef uint64_t hash_tile(const uint8_t *buf, unsigned int rowstride, size_t row_len, unsigned int rows) nogil:             # <<<<<<<<<<<<<<
+ *     #hashes a tile using the xxh64 round function,
+ *     #the rows of the tile are not contiguous in memory so we can't use the python bindings
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "xpra/server/window/motion.pyx":116
+ *     return h
+ * 
+ * def hash_tiles(pixels, unsigned int x, unsigned int y, unsigned int width, unsigned int height, unsigned int rowstride, unsigned int tile_size=64, unsigned char bpp=4):             # <<<<<<<<<<<<<<
+ *     """
+ *         Hashes the pixels of the region (x, y, width, height) one tile at a time,
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_4xpra_6server_6window_6motion_5hash_tiles(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_4xpra_6server_6window_6motion_4hash_tiles[] = "\n        Hashes the pixels of the region (x, y, width, height) one tile at a time,\n        the tiles are aligned on a grid of tile_size pixels,\n        so the tiles on the edges of the region may be smaller.\n        Returns a dictionary with the (column, row) of each tile as key\n        and the geometry of the tile and its hash as value.\n    ";
+static PyMethodDef __pyx_mdef_4xpra_6server_6window_6motion_5hash_tiles = {"hash_tiles", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_4xpra_6server_6window_6motion_5hash_tiles, METH_VARARGS|METH_KEYWORDS, __pyx_doc_4xpra_6server_6window_6motion_4hash_tiles};
+static PyObject *__pyx_pw_4xpra_6server_6window_6motion_5hash_tiles(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_pixels = 0;
+  unsigned int __pyx_v_x;
+  unsigned int __pyx_v_y;
+  unsigned int __pyx_v_width;
+  unsigned int __pyx_v_height;
+  unsigned int __pyx_v_rowstride;
+  unsigned int __pyx_v_tile_size;
+  unsigned char __pyx_v_bpp;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("hash_tiles (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_pixels,&__pyx_n_s_x,&__pyx_n_s_y,&__pyx_n_s_width,&__pyx_n_s_height,&__pyx_n_s_rowstride,&__pyx_n_s_tile_size,&__pyx_n_s_bpp,0};
+    PyObject* values[8] = {0,0,0,0,0,0,0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  8: values[7] = PyTuple_GET_ITEM(__pyx_args, 7);
+        CYTHON_FALLTHROUGH;
+        case  7: values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
+        CYTHON_FALLTHROUGH;
+        case  6: values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
+        CYTHON_FALLTHROUGH;
+        case  5: values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+        CYTHON_FALLTHROUGH;
+        case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+        CYTHON_FALLTHROUGH;
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_pixels)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_x)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("hash_tiles", 0, 6, 8, 1); __PYX_ERR(0, 116, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  2:
+        if (likely((values[2] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_y)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("hash_tiles", 0, 6, 8, 2); __PYX_ERR(0, 116, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  3:
+        if (likely((values[3] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_width)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("hash_tiles", 0, 6, 8, 3); __PYX_ERR(0, 116, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  4:
+        if (likely((values[4] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_height)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("hash_tiles", 0, 6, 8, 4); __PYX_ERR(0, 116, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  5:
+        if (likely((values[5] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_rowstride)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("hash_tiles", 0, 6, 8, 5); __PYX_ERR(0, 116, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  6:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_tile_size);
+          if (value) { values[6] = value; kw_args--; }
+        }
+        CYTHON_FALLTHROUGH;
+        case  7:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_bpp);
+          if (value) { values[7] = value; kw_args--; }
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "hash_tiles") < 0)) __PYX_ERR(0, 116, __pyx_L3_error)
+      }
+    } else {
+      switch (PyTuple_GET_SIZE(__pyx_args)) {
+        case  8: values[7] = PyTuple_GET_ITEM(__pyx_args, 7);
+        CYTHON_FALLTHROUGH;
+        case  7: values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
+        CYTHON_FALLTHROUGH;
+        case  6: values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
+        values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+        values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+        values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+    }
+    __pyx_v_pixels = values[0];
+    __pyx_v_x = __Pyx_PyInt_As_unsigned_int(values[1]); if (unlikely((__pyx_v_x == (unsigned int)-1) && PyErr_Occurred())) __PYX_ERR(0, 116, __pyx_L3_error)
+    __pyx_v_y = __Pyx_PyInt_As_unsigned_int(values[2]); if (unlikely((__pyx_v_y == (unsigned int)-1) && PyErr_Occurred())) __PYX_ERR(0, 116, __pyx_L3_error)
+    __pyx_v_width = __Pyx_PyInt_As_unsigned_int(values[3]); if (unlikely((__pyx_v_width == (unsigned int)-1) && PyErr_Occurred())) __PYX_ERR(0, 116, __pyx_L3_error)
+    __pyx_v_height = __Pyx_PyInt_As_unsigned_int(values[4]); if (unlikely((__pyx_v_height == (unsigned int)-1) && PyErr_Occurred())) __PYX_ERR(0, 116, __pyx_L3_error)
+    __pyx_v_rowstride = __Pyx_PyInt_As_unsigned_int(values[5]); if (unlikely((__pyx_v_rowstride == (unsigned int)-1) && PyErr_Occurred())) __PYX_ERR(0, 116, __pyx_L3_error)
+    if (values[6]) {
+      __pyx_v_tile_size = __Pyx_PyInt_As_unsigned_int(values[6]); if (unlikely((__pyx_v_tile_size == (unsigned int)-1) && PyErr_Occurred())) __PYX_ERR(0, 116, __pyx_L3_error)
+    } else {
+      __pyx_v_tile_size = ((unsigned int)64);
+    }
+    if (values[7]) {
+      __pyx_v_bpp = __Pyx_PyInt_As_unsigned_char(values[7]); if (unlikely((__pyx_v_bpp == (unsigned char)-1) && PyErr_Occurred())) __PYX_ERR(0, 116, __pyx_L3_error)
+    } else {
+      __pyx_v_bpp = ((unsigned char)4);
+    }
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("hash_tiles", 0, 6, 8, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 116, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("xpra.server.window.motion.hash_tiles", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_4xpra_6server_6window_6motion_4hash_tiles(__pyx_self, __pyx_v_pixels, __pyx_v_x, __pyx_v_y, __pyx_v_width, __pyx_v_height, __pyx_v_rowstride, __pyx_v_tile_size, __pyx_v_bpp);
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_4xpra_6server_6window_6motion_4hash_tiles(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_pixels, unsigned int __pyx_v_x, unsigned int __pyx_v_y, unsigned int __pyx_v_width, unsigned int __pyx_v_height, unsigned int __pyx_v_rowstride, unsigned int __pyx_v_tile_size, unsigned char __pyx_v_bpp) {
+  uint8_t *__pyx_v_buf;
+  Py_ssize_t __pyx_v_buf_len;
+  unsigned int __pyx_v_col;
+  unsigned int __pyx_v_row;
+  unsigned int __pyx_v_tx;
+  unsigned int __pyx_v_ty;
+  unsigned int __pyx_v_tw;
+  unsigned int __pyx_v_th;
+  uint64_t __pyx_v_h;
+  PyObject *__pyx_v_tiles = NULL;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  long __pyx_t_6;
+  long __pyx_t_7;
+  unsigned int __pyx_t_8;
+  unsigned int __pyx_t_9;
+  unsigned int __pyx_t_10;
+  unsigned int __pyx_t_11;
+  long __pyx_t_12;
+  long __pyx_t_13;
+  unsigned int __pyx_t_14;
+  long __pyx_t_15;
+  long __pyx_t_16;
+  PyObject *__pyx_t_17 = NULL;
+  PyObject *__pyx_t_18 = NULL;
+  PyObject *__pyx_t_19 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("hash_tiles", 0);
+
+  /* "xpra/server/window/motion.pyx":124
+ *         and the geometry of the tile and its hash as value.
+ *     """
+ *     assert tile_size>0 and width>0 and height>0             # <<<<<<<<<<<<<<
+ *     cdef uint8_t *buf = NULL
+ *     cdef Py_ssize_t buf_len = 0
+ */
+  #ifndef CYTHON_WITHOUT_ASSERTIONS
+  if (unlikely(__pyx_assertions_enabled())) {
+    __pyx_t_2 = ((__pyx_v_tile_size > 0) != 0);
+    if (__pyx_t_2) {
+    } else {
+      __pyx_t_1 = __pyx_t_2;
+      goto __pyx_L3_bool_binop_done;
+    }
+    __pyx_t_2 = ((__pyx_v_width > 0) != 0);
+    if (__pyx_t_2) {
+    } else {
+      __pyx_t_1 = __pyx_t_2;
+      goto __pyx_L3_bool_binop_done;
+    }
+    __pyx_t_2 = ((__pyx_v_height > 0) != 0);
+    __pyx_t_1 = __pyx_t_2;
+    __pyx_L3_bool_binop_done:;
+    if (unlikely(!__pyx_t_1)) {
+      PyErr_SetNone(PyExc_AssertionError);
+      __PYX_ERR(0, 124, __pyx_L1_error)
+    }
+  }
+  #endif
+
+  /* "xpra/server/window/motion.pyx":125
+ *     """
+ *     assert tile_size>0 and width>0 and height>0
+ *     cdef uint8_t *buf = NULL             # <<<<<<<<<<<<<<
+ *     cdef Py_ssize_t buf_len = 0
+ *     assert object_as_buffer(pixels, <const void**> &buf, &buf_len)==0
+ */
+  __pyx_v_buf = NULL;
+
+  /* "xpra/server/window/motion.pyx":126
+ *     assert tile_size>0 and width>0 and height>0
+ *     cdef uint8_t *buf = NULL
+ *     cdef Py_ssize_t buf_len = 0             # <<<<<<<<<<<<<<
+ *     assert object_as_buffer(pixels, <const void**> &buf, &buf_len)==0
+ *     assert buf_len>=0 and (<unsigned int> buf_len)>=rowstride*(height-1)+width*bpp, "buffer is too small for %ix%i" % (rowstride, height)
+ */
+  __pyx_v_buf_len = 0;
+
+  /* "xpra/server/window/motion.pyx":127
+ *     cdef uint8_t *buf = NULL
+ *     cdef Py_ssize_t buf_len = 0
+ *     assert object_as_buffer(pixels, <const void**> &buf, &buf_len)==0             # <<<<<<<<<<<<<<
+ *     assert buf_len>=0 and (<unsigned int> buf_len)>=rowstride*(height-1)+width*bpp, "buffer is too small for %ix%i" % (rowstride, height)
+ *     cdef unsigned int col, row
+ */
+  #ifndef CYTHON_WITHOUT_ASSERTIONS
+  if (unlikely(__pyx_assertions_enabled())) {
+    if (unlikely(!((object_as_buffer(__pyx_v_pixels, ((void const **)(&__pyx_v_buf)), (&__pyx_v_buf_len)) == 0) != 0))) {
+      PyErr_SetNone(PyExc_AssertionError);
+      __PYX_ERR(0, 127, __pyx_L1_error)
+    }
+  }
+  #endif
+
+  /* "xpra/server/window/motion.pyx":128
+ *     cdef Py_ssize_t buf_len = 0
+ *     assert object_as_buffer(pixels, <const void**> &buf, &buf_len)==0
+ *     assert buf_len>=0 and (<unsigned int> buf_len)>=rowstride*(height-1)+width*bpp, "buffer is too small for %ix%i" % (rowstride, height)             # <<<<<<<<<<<<<<
+ *     cdef unsigned int col, row
+ *     cdef unsigned int tx, ty, tw, th
+ */
+  #ifndef CYTHON_WITHOUT_ASSERTIONS
+  if (unlikely(__pyx_assertions_enabled())) {
+    __pyx_t_2 = ((__pyx_v_buf_len >= 0) != 0);
+    if (__pyx_t_2) {
+    } else {
+      __pyx_t_1 = __pyx_t_2;
+      goto __pyx_L6_bool_binop_done;
+    }
+    __pyx_t_2 = ((((unsigned int)__pyx_v_buf_len) >= ((__pyx_v_rowstride * (__pyx_v_height - 1)) + (__pyx_v_width * __pyx_v_bpp))) != 0);
+    __pyx_t_1 = __pyx_t_2;
+    __pyx_L6_bool_binop_done:;
+    if (unlikely(!__pyx_t_1)) {
+      __pyx_t_3 = __Pyx_PyInt_From_unsigned_int(__pyx_v_rowstride); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 128, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_3);
+      __pyx_t_4 = __Pyx_PyInt_From_unsigned_int(__pyx_v_height); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 128, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_4);
+      __pyx_t_5 = PyTuple_New(2); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 128, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_5);
+      __Pyx_GIVEREF(__pyx_t_3);
+      PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_3);
+      __Pyx_GIVEREF(__pyx_t_4);
+      PyTuple_SET_ITEM(__pyx_t_5, 1, __pyx_t_4);
+      __pyx_t_3 = 0;
+      __pyx_t_4 = 0;
+      __pyx_t_4 = __Pyx_PyString_Format(__pyx_kp_s_buffer_is_too_small_for_ix_i, __pyx_t_5); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 128, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_4);
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      PyErr_SetObject(PyExc_AssertionError, __pyx_t_4);
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+      __PYX_ERR(0, 128, __pyx_L1_error)
+    }
+  }
+  #endif
+
+  /* "xpra/server/window/motion.pyx":132
+ *     cdef unsigned int tx, ty, tw, th
+ *     cdef uint64_t h
+ *     tiles = {}             # <<<<<<<<<<<<<<
+ *     for row in range(y//tile_size, (y+height-1)//tile_size+1):
+ *         ty = max(y, row*tile_size)
+ */
+  __pyx_t_4 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 132, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_v_tiles = ((PyObject*)__pyx_t_4);
+  __pyx_t_4 = 0;
+
+  /* "xpra/server/window/motion.pyx":133
+ *     cdef uint64_t h
+ *     tiles = {}
+ *     for row in range(y//tile_size, (y+height-1)//tile_size+1):             # <<<<<<<<<<<<<<
+ *         ty = max(y, row*tile_size)
+ *         th = min(y+height, (row+1)*tile_size)-ty
+ */
+  __pyx_t_6 = ((((__pyx_v_y + __pyx_v_height) - 1) / __pyx_v_tile_size) + 1);
+  __pyx_t_7 = __pyx_t_6;
+  for (__pyx_t_8 = (__pyx_v_y / __pyx_v_tile_size); __pyx_t_8 < __pyx_t_7; __pyx_t_8+=1) {
+    __pyx_v_row = __pyx_t_8;
+
+    /* "xpra/server/window/motion.pyx":134
+ *     tiles = {}
+ *     for row in range(y//tile_size, (y+height-1)//tile_size+1):
+ *         ty = max(y, row*tile_size)             # <<<<<<<<<<<<<<
+ *         th = min(y+height, (row+1)*tile_size)-ty
+ *         for col in range(x//tile_size, (x+width-1)//tile_size+1):
+ */
+    __pyx_t_9 = (__pyx_v_row * __pyx_v_tile_size);
+    __pyx_t_10 = __pyx_v_y;
+    if (((__pyx_t_9 > __pyx_t_10) != 0)) {
+      __pyx_t_11 = __pyx_t_9;
+    } else {
+      __pyx_t_11 = __pyx_t_10;
+    }
+    __pyx_v_ty = __pyx_t_11;
+
+    /* "xpra/server/window/motion.pyx":135
+ *     for row in range(y//tile_size, (y+height-1)//tile_size+1):
+ *         ty = max(y, row*tile_size)
+ *         th = min(y+height, (row+1)*tile_size)-ty             # <<<<<<<<<<<<<<
+ *         for col in range(x//tile_size, (x+width-1)//tile_size+1):
+ *             tx = max(x, col*tile_size)
+ */
+    __pyx_t_12 = ((__pyx_v_row + 1) * __pyx_v_tile_size);
+    __pyx_t_11 = (__pyx_v_y + __pyx_v_height);
+    if (((__pyx_t_12 < __pyx_t_11) != 0)) {
+      __pyx_t_13 = __pyx_t_12;
+    } else {
+      __pyx_t_13 = __pyx_t_11;
+    }
+    __pyx_v_th = (__pyx_t_13 - __pyx_v_ty);
+
+    /* "xpra/server/window/motion.pyx":136
+ *         ty = max(y, row*tile_size)
+ *         th = min(y+height, (row+1)*tile_size)-ty
+ *         for col in range(x//tile_size, (x+width-1)//tile_size+1):             # <<<<<<<<<<<<<<
+ *             tx = max(x, col*tile_size)
+ *             tw = min(x+width, (col+1)*tile_size)-tx
+ */
+    __pyx_t_13 = ((((__pyx_v_x + __pyx_v_width) - 1) / __pyx_v_tile_size) + 1);
+    __pyx_t_12 = __pyx_t_13;
+    for (__pyx_t_11 = (__pyx_v_x / __pyx_v_tile_size); __pyx_t_11 < __pyx_t_12; __pyx_t_11+=1) {
+      __pyx_v_col = __pyx_t_11;
+
+      /* "xpra/server/window/motion.pyx":137
+ *         th = min(y+height, (row+1)*tile_size)-ty
+ *         for col in range(x//tile_size, (x+width-1)//tile_size+1):
+ *             tx = max(x, col*tile_size)             # <<<<<<<<<<<<<<
+ *             tw = min(x+width, (col+1)*tile_size)-tx
+ *             with nogil:
+ */
+      __pyx_t_9 = (__pyx_v_col * __pyx_v_tile_size);
+      __pyx_t_10 = __pyx_v_x;
+      if (((__pyx_t_9 > __pyx_t_10) != 0)) {
+        __pyx_t_14 = __pyx_t_9;
+      } else {
+        __pyx_t_14 = __pyx_t_10;
+      }
+      __pyx_v_tx = __pyx_t_14;
+
+      /* "xpra/server/window/motion.pyx":138
+ *         for col in range(x//tile_size, (x+width-1)//tile_size+1):
+ *             tx = max(x, col*tile_size)
+ *             tw = min(x+width, (col+1)*tile_size)-tx             # <<<<<<<<<<<<<<
+ *             with nogil:
+ *                 h = hash_tile(buf+(ty-y)*rowstride+(tx-x)*bpp, rowstride, tw*bpp, th)
+ */
+      __pyx_t_15 = ((__pyx_v_col + 1) * __pyx_v_tile_size);
+      __pyx_t_14 = (__pyx_v_x + __pyx_v_width);
+      if (((__pyx_t_15 < __pyx_t_14) != 0)) {
+        __pyx_t_16 = __pyx_t_15;
+      } else {
+        __pyx_t_16 = __pyx_t_14;
+      }
+      __pyx_v_tw = (__pyx_t_16 - __pyx_v_tx);
+
+      /* "xpra/server/window/motion.pyx":139
+ *             tx = max(x, col*tile_size)
+ *             tw = min(x+width, (col+1)*tile_size)-tx
+ *             with nogil:             # <<<<<<<<<<<<<<
+ *                 h = hash_tile(buf+(ty-y)*rowstride+(tx-x)*bpp, rowstride, tw*bpp, th)
+ *             tiles[(col, row)] = (tx, ty, tw, th, h)
+ */
+      {
+          #ifdef WITH_THREAD
+          PyThreadState *_save;
+          Py_UNBLOCK_THREADS
+          __Pyx_FastGIL_Remember();
+          #endif
+          /*try:*/ {
+
+            /* "xpra/server/window/motion.pyx":140
+ *             tw = min(x+width, (col+1)*tile_size)-tx
+ *             with nogil:
+ *                 h = hash_tile(buf+(ty-y)*rowstride+(tx-x)*bpp, rowstride, tw*bpp, th)             # <<<<<<<<<<<<<<
+ *             tiles[(col, row)] = (tx, ty, tw, th, h)
+ *     return tiles
+ */
+            __pyx_v_h = __pyx_f_4xpra_6server_6window_6motion_hash_tile(((__pyx_v_buf + ((__pyx_v_ty - __pyx_v_y) * __pyx_v_rowstride)) + ((__pyx_v_tx - __pyx_v_x) * __pyx_v_bpp)), __pyx_v_rowstride, (__pyx_v_tw * __pyx_v_bpp), __pyx_v_th);
+          }
+
+          /* "xpra/server/window/motion.pyx":139
+ *             tx = max(x, col*tile_size)
+ *             tw = min(x+width, (col+1)*tile_size)-tx
+ *             with nogil:             # <<<<<<<<<<<<<<
+ *                 h = hash_tile(buf+(ty-y)*rowstride+(tx-x)*bpp, rowstride, tw*bpp, th)
+ *             tiles[(col, row)] = (tx, ty, tw, th, h)
+ */
+          /*finally:*/ {
+            /*normal exit:*/{
+              #ifdef WITH_THREAD
+              __Pyx_FastGIL_Forget();
+              Py_BLOCK_THREADS
+              #endif
+              goto __pyx_L16;
+            }
+            __pyx_L16:;
+          }
+      }
+
+      /* "xpra/server/window/motion.pyx":141
+ *             with nogil:
+ *                 h = hash_tile(buf+(ty-y)*rowstride+(tx-x)*bpp, rowstride, tw*bpp, th)
+ *             tiles[(col, row)] = (tx, ty, tw, th, h)             # <<<<<<<<<<<<<<
+ *     return tiles
+ * 
+ */
+      __pyx_t_4 = __Pyx_PyInt_From_unsigned_int(__pyx_v_tx); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 141, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_4);
+      __pyx_t_5 = __Pyx_PyInt_From_unsigned_int(__pyx_v_ty); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 141, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_5);
+      __pyx_t_3 = __Pyx_PyInt_From_unsigned_int(__pyx_v_tw); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 141, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_3);
+      __pyx_t_17 = __Pyx_PyInt_From_unsigned_int(__pyx_v_th); if (unlikely(!__pyx_t_17)) __PYX_ERR(0, 141, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_17);
+      __pyx_t_18 = __Pyx_PyInt_From_uint64_t(__pyx_v_h); if (unlikely(!__pyx_t_18)) __PYX_ERR(0, 141, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_18);
+      __pyx_t_19 = PyTuple_New(5); if (unlikely(!__pyx_t_19)) __PYX_ERR(0, 141, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_19);
+      __Pyx_GIVEREF(__pyx_t_4);
+      PyTuple_SET_ITEM(__pyx_t_19, 0, __pyx_t_4);
+      __Pyx_GIVEREF(__pyx_t_5);
+      PyTuple_SET_ITEM(__pyx_t_19, 1, __pyx_t_5);
+      __Pyx_GIVEREF(__pyx_t_3);
+      PyTuple_SET_ITEM(__pyx_t_19, 2, __pyx_t_3);
+      __Pyx_GIVEREF(__pyx_t_17);
+      PyTuple_SET_ITEM(__pyx_t_19, 3, __pyx_t_17);
+      __Pyx_GIVEREF(__pyx_t_18);
+      PyTuple_SET_ITEM(__pyx_t_19, 4, __pyx_t_18);
+      __pyx_t_4 = 0;
+      __pyx_t_5 = 0;
+      __pyx_t_3 = 0;
+      __pyx_t_17 = 0;
+      __pyx_t_18 = 0;
+      __pyx_t_18 = __Pyx_PyInt_From_unsigned_int(__pyx_v_col); if (unlikely(!__pyx_t_18)) __PYX_ERR(0, 141, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_18);
+      __pyx_t_17 = __Pyx_PyInt_From_unsigned_int(__pyx_v_row); if (unlikely(!__pyx_t_17)) __PYX_ERR(0, 141, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_17);
+      __pyx_t_3 = PyTuple_New(2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 141, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_3);
+      __Pyx_GIVEREF(__pyx_t_18);
+      PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_t_18);
+      __Pyx_GIVEREF(__pyx_t_17);
+      PyTuple_SET_ITEM(__pyx_t_3, 1, __pyx_t_17);
+      __pyx_t_18 = 0;
+      __pyx_t_17 = 0;
+      if (unlikely(PyDict_SetItem(__pyx_v_tiles, __pyx_t_3, __pyx_t_19) < 0)) __PYX_ERR(0, 141, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      __Pyx_DECREF(__pyx_t_19); __pyx_t_19 = 0;
+    }
+  }
+
+  /* "xpra/server/window/motion.pyx":142
+ *                 h = hash_tile(buf+(ty-y)*rowstride+(tx-x)*bpp, rowstride, tw*bpp, th)
+ *             tiles[(col, row)] = (tx, ty, tw, th, h)
+ *     return tiles             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v_tiles);
+  __pyx_r = __pyx_v_tiles;
+  goto __pyx_L0;
+
+  /* "xpra/server/window/motion.pyx":116
+ *     return h
+ * 
+ * def hash_tiles(pixels, unsigned int x, unsigned int y, unsigned int width, unsigned int height, unsigned int rowstride, unsigned int tile_size=64, unsigned char bpp=4):             # <<<<<<<<<<<<<<
+ *     """
+ *         Hashes the pixels of the region (x, y, width, height) one tile at a time,
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_17);
+  __Pyx_XDECREF(__pyx_t_18);
+  __Pyx_XDECREF(__pyx_t_19);
+  __Pyx_AddTraceback("xpra.server.window.motion.hash_tiles", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_tiles);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "xpra/server/window/motion.pyx":150
+ * DEF MAX_SCROLLS = 1000
+ * 
+ * cdef match_lines(const uint64_t *old, const uint8_t *known, const uint64_t *cur, int n, int start, int end, int max_distance, int min_percent):             # <<<<<<<<<<<<<<
+ *     """
+ *         Finds the lines in [start, end[ whose new hash can be found in the old hashes,
+ */
+
+static PyObject *__pyx_f_4xpra_6server_6window_6motion_match_lines(uint64_t const *__pyx_v_old, uint8_t const *__pyx_v_known, uint64_t const *__pyx_v_cur, int __pyx_v_n, int __pyx_v_start, int __pyx_v_end, int __pyx_v_max_distance, int __pyx_v_min_percent) {
+  int __pyx_v_lines;
+  int __pyx_v_maxd;
+  int __pyx_v_hsize;
+  int32_t *__pyx_v_hist;
+  uint8_t *__pyx_v_handled;
+  int __pyx_v_values[(50 + 1)];
+  int __pyx_v_nvalues;
+  int __pyx_v_scroll_start[0x3E8];
+  int __pyx_v_scroll_count[0x3E8];
+  int __pyx_v_scroll_distance[0x3E8];
+  int __pyx_v_nscrolls;
+  int __pyx_v_unchanged;
+  int __pyx_v_handled_count;
+  int __pyx_v_r;
+  int __pyx_v_s;
+  int __pyx_v_i;
+  int __pyx_v_k;
+  int __pyx_v_src;
+  int __pyx_v_lo;
+  int __pyx_v_hi;
+  int __pyx_v_best;
+  int __pyx_v_besthits;
+  int __pyx_v_run_start;
+  int __pyx_v_ok;
+  uint8_t __pyx_v_pass_id;
+  uint64_t __pyx_v_v;
+  PyObject *__pyx_v_scrolls = NULL;
+  PyObject *__pyx_v_non_scroll = NULL;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_t_2;
+  long __pyx_t_3;
+  int __pyx_t_4;
+  long __pyx_t_5;
+  int __pyx_t_6;
+  int __pyx_t_7;
+  int __pyx_t_8;
+  int __pyx_t_9;
+  int __pyx_t_10;
+  PyObject *__pyx_t_11 = NULL;
+  PyObject *__pyx_t_12 = NULL;
+  PyObject *__pyx_t_13 = NULL;
+  PyObject *__pyx_t_14 = NULL;
+  PyObject *__pyx_t_15 = NULL;
+  int __pyx_t_16;
+  char const *__pyx_t_17;
+  PyObject *__pyx_t_18 = NULL;
+  PyObject *__pyx_t_19 = NULL;
+  PyObject *__pyx_t_20 = NULL;
+  PyObject *__pyx_t_21 = NULL;
+  PyObject *__pyx_t_22 = NULL;
+  PyObject *__pyx_t_23 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("match_lines", 0);
+
+  /* "xpra/server/window/motion.pyx":159
+ *         Returns None if less than min_percent of the lines can be handled with scrolling.
+ *     """
+ *     cdef int lines = end-start             # <<<<<<<<<<<<<<
+ *     if lines<=0 or n<=0:
+ *         return None
+ */
+  __pyx_v_lines = (__pyx_v_end - __pyx_v_start);
+
+  /* "xpra/server/window/motion.pyx":160
+ *     """
+ *     cdef int lines = end-start
+ *     if lines<=0 or n<=0:             # <<<<<<<<<<<<<<
+ *         return None
+ *     cdef int maxd = min(max_distance, n-1)
+ */
+  __pyx_t_2 = ((__pyx_v_lines <= 0) != 0);
+  if (!__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L4_bool_binop_done;
+  }
+  __pyx_t_2 = ((__pyx_v_n <= 0) != 0);
+  __pyx_t_1 = __pyx_t_2;
+  __pyx_L4_bool_binop_done:;
+  if (__pyx_t_1) {
+
+    /* "xpra/server/window/motion.pyx":161
+ *     cdef int lines = end-start
+ *     if lines<=0 or n<=0:
+ *         return None             # <<<<<<<<<<<<<<
+ *     cdef int maxd = min(max_distance, n-1)
+ *     cdef int hsize = 2*maxd+1
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+    goto __pyx_L0;
+
+    /* "xpra/server/window/motion.pyx":160
+ *     """
+ *     cdef int lines = end-start
+ *     if lines<=0 or n<=0:             # <<<<<<<<<<<<<<
+ *         return None
+ *     cdef int maxd = min(max_distance, n-1)
+ */
+  }
+
+  /* "xpra/server/window/motion.pyx":162
+ *     if lines<=0 or n<=0:
+ *         return None
+ *     cdef int maxd = min(max_distance, n-1)             # <<<<<<<<<<<<<<
+ *     cdef int hsize = 2*maxd+1
+ *     cdef int32_t *hist = NULL
+ */
+  __pyx_t_3 = (__pyx_v_n - 1);
+  __pyx_t_4 = __pyx_v_max_distance;
+  if (((__pyx_t_3 < __pyx_t_4) != 0)) {
+    __pyx_t_5 = __pyx_t_3;
+  } else {
+    __pyx_t_5 = __pyx_t_4;
+  }
+  __pyx_v_maxd = __pyx_t_5;
+
+  /* "xpra/server/window/motion.pyx":163
+ *         return None
+ *     cdef int maxd = min(max_distance, n-1)
+ *     cdef int hsize = 2*maxd+1             # <<<<<<<<<<<<<<
+ *     cdef int32_t *hist = NULL
+ *     cdef uint8_t *handled = NULL
+ */
+  __pyx_v_hsize = ((2 * __pyx_v_maxd) + 1);
+
+  /* "xpra/server/window/motion.pyx":164
+ *     cdef int maxd = min(max_distance, n-1)
+ *     cdef int hsize = 2*maxd+1
+ *     cdef int32_t *hist = NULL             # <<<<<<<<<<<<<<
+ *     cdef uint8_t *handled = NULL
+ *     cdef int values[MAX_SCROLL_VALUES+1]
+ */
+  __pyx_v_hist = NULL;
+
+  /* "xpra/server/window/motion.pyx":165
+ *     cdef int hsize = 2*maxd+1
+ *     cdef int32_t *hist = NULL
+ *     cdef uint8_t *handled = NULL             # <<<<<<<<<<<<<<
+ *     cdef int values[MAX_SCROLL_VALUES+1]
+ *     cdef int nvalues = 0
+ */
+  __pyx_v_handled = NULL;
+
+  /* "xpra/server/window/motion.pyx":167
+ *     cdef uint8_t *handled = NULL
+ *     cdef int values[MAX_SCROLL_VALUES+1]
+ *     cdef int nvalues = 0             # <<<<<<<<<<<<<<
+ *     cdef int scroll_start[MAX_SCROLLS]
+ *     cdef int scroll_count[MAX_SCROLLS]
+ */
+  __pyx_v_nvalues = 0;
+
+  /* "xpra/server/window/motion.pyx":171
+ *     cdef int scroll_count[MAX_SCROLLS]
+ *     cdef int scroll_distance[MAX_SCROLLS]
+ *     cdef int nscrolls = 0             # <<<<<<<<<<<<<<
+ *     cdef int unchanged = 0
+ *     cdef int handled_count = 0
+ */
+  __pyx_v_nscrolls = 0;
+
+  /* "xpra/server/window/motion.pyx":172
+ *     cdef int scroll_distance[MAX_SCROLLS]
+ *     cdef int nscrolls = 0
+ *     cdef int unchanged = 0             # <<<<<<<<<<<<<<
+ *     cdef int handled_count = 0
+ *     cdef int r, s, i, k, src, lo, hi, best, besthits, run_start, ok
+ */
+  __pyx_v_unchanged = 0;
+
+  /* "xpra/server/window/motion.pyx":173
+ *     cdef int nscrolls = 0
+ *     cdef int unchanged = 0
+ *     cdef int handled_count = 0             # <<<<<<<<<<<<<<
+ *     cdef int r, s, i, k, src, lo, hi, best, besthits, run_start, ok
+ *     cdef uint8_t pass_id
+ */
+  __pyx_v_handled_count = 0;
+
+  /* "xpra/server/window/motion.pyx":177
+ *     cdef uint8_t pass_id
+ *     cdef uint64_t v
+ *     try:             # <<<<<<<<<<<<<<
+ *         hist = <int32_t*> xmemalign(hsize*sizeof(int32_t))
+ *         handled = <uint8_t*> xmemalign(n)
+ */
+  /*try:*/ {
+
+    /* "xpra/server/window/motion.pyx":178
+ *     cdef uint64_t v
+ *     try:
+ *         hist = <int32_t*> xmemalign(hsize*sizeof(int32_t))             # <<<<<<<<<<<<<<
+ *         handled = <uint8_t*> xmemalign(n)
+ *         assert hist!=NULL and handled!=NULL, "failed to allocate scroll detection memory"
+ */
+    __pyx_v_hist = ((int32_t *)xmemalign((__pyx_v_hsize * (sizeof(int32_t)))));
+
+    /* "xpra/server/window/motion.pyx":179
+ *     try:
+ *         hist = <int32_t*> xmemalign(hsize*sizeof(int32_t))
+ *         handled = <uint8_t*> xmemalign(n)             # <<<<<<<<<<<<<<
+ *         assert hist!=NULL and handled!=NULL, "failed to allocate scroll detection memory"
+ *         with nogil:
+ */
+    __pyx_v_handled = ((uint8_t *)xmemalign(__pyx_v_n));
+
+    /* "xpra/server/window/motion.pyx":180
+ *         hist = <int32_t*> xmemalign(hsize*sizeof(int32_t))
+ *         handled = <uint8_t*> xmemalign(n)
+ *         assert hist!=NULL and handled!=NULL, "failed to allocate scroll detection memory"             # <<<<<<<<<<<<<<
+ *         with nogil:
+ *             memset(<void*> hist, 0, hsize*sizeof(int32_t))
+ */
+    #ifndef CYTHON_WITHOUT_ASSERTIONS
+    if (unlikely(__pyx_assertions_enabled())) {
+      __pyx_t_2 = ((__pyx_v_hist != NULL) != 0);
+      if (__pyx_t_2) {
+      } else {
+        __pyx_t_1 = __pyx_t_2;
+        goto __pyx_L9_bool_binop_done;
+      }
+      __pyx_t_2 = ((__pyx_v_handled != NULL) != 0);
+      __pyx_t_1 = __pyx_t_2;
+      __pyx_L9_bool_binop_done:;
+      if (unlikely(!__pyx_t_1)) {
+        PyErr_SetObject(PyExc_AssertionError, __pyx_kp_s_failed_to_allocate_scroll_detect);
+        __PYX_ERR(0, 180, __pyx_L7_error)
+      }
+    }
+    #endif
+
+    /* "xpra/server/window/motion.pyx":181
+ *         handled = <uint8_t*> xmemalign(n)
+ *         assert hist!=NULL and handled!=NULL, "failed to allocate scroll detection memory"
+ *         with nogil:             # <<<<<<<<<<<<<<
+ *             memset(<void*> hist, 0, hsize*sizeof(int32_t))
+ *             memset(<void*> handled, 0, n)
+ */
+    {
+        #ifdef WITH_THREAD
+        PyThreadState *_save;
+        Py_UNBLOCK_THREADS
+        __Pyx_FastGIL_Remember();
+        #endif
+        /*try:*/ {
+
+          /* "xpra/server/window/motion.pyx":182
+ *         assert hist!=NULL and handled!=NULL, "failed to allocate scroll detection memory"
+ *         with nogil:
+ *             memset(<void*> hist, 0, hsize*sizeof(int32_t))             # <<<<<<<<<<<<<<
+ *             memset(<void*> handled, 0, n)
+ *             #histogram of the distances between matching lines:
+ */
+          (void)(memset(((void *)__pyx_v_hist), 0, (__pyx_v_hsize * (sizeof(int32_t)))));
+
+          /* "xpra/server/window/motion.pyx":183
+ *         with nogil:
+ *             memset(<void*> hist, 0, hsize*sizeof(int32_t))
+ *             memset(<void*> handled, 0, n)             # <<<<<<<<<<<<<<
+ *             #histogram of the distances between matching lines:
+ *             for r in range(start, end):
+ */
+          (void)(memset(((void *)__pyx_v_handled), 0, __pyx_v_n));
+
+          /* "xpra/server/window/motion.pyx":185
+ *             memset(<void*> handled, 0, n)
+ *             #histogram of the distances between matching lines:
+ *             for r in range(start, end):             # <<<<<<<<<<<<<<
+ *                 v = cur[r]
+ *                 lo = max(0, r-maxd)
+ */
+          __pyx_t_4 = __pyx_v_end;
+          __pyx_t_6 = __pyx_t_4;
+          for (__pyx_t_7 = __pyx_v_start; __pyx_t_7 < __pyx_t_6; __pyx_t_7+=1) {
+            __pyx_v_r = __pyx_t_7;
+
+            /* "xpra/server/window/motion.pyx":186
+ *             #histogram of the distances between matching lines:
+ *             for r in range(start, end):
+ *                 v = cur[r]             # <<<<<<<<<<<<<<
+ *                 lo = max(0, r-maxd)
+ *                 hi = min(n-1, r+maxd)
+ */
+            __pyx_v_v = (__pyx_v_cur[__pyx_v_r]);
+
+            /* "xpra/server/window/motion.pyx":187
+ *             for r in range(start, end):
+ *                 v = cur[r]
+ *                 lo = max(0, r-maxd)             # <<<<<<<<<<<<<<
+ *                 hi = min(n-1, r+maxd)
+ *                 for src in range(lo, hi+1):
+ */
+            __pyx_t_8 = (__pyx_v_r - __pyx_v_maxd);
+            __pyx_t_5 = 0;
+            if (((__pyx_t_8 > __pyx_t_5) != 0)) {
+              __pyx_t_3 = __pyx_t_8;
+            } else {
+              __pyx_t_3 = __pyx_t_5;
+            }
+            __pyx_v_lo = __pyx_t_3;
+
+            /* "xpra/server/window/motion.pyx":188
+ *                 v = cur[r]
+ *                 lo = max(0, r-maxd)
+ *                 hi = min(n-1, r+maxd)             # <<<<<<<<<<<<<<
+ *                 for src in range(lo, hi+1):
+ *                     if old[src]==v and (known==NULL or known[src]):
+ */
+            __pyx_t_8 = (__pyx_v_r + __pyx_v_maxd);
+            __pyx_t_3 = (__pyx_v_n - 1);
+            if (((__pyx_t_8 < __pyx_t_3) != 0)) {
+              __pyx_t_5 = __pyx_t_8;
+            } else {
+              __pyx_t_5 = __pyx_t_3;
+            }
+            __pyx_v_hi = __pyx_t_5;
+
+            /* "xpra/server/window/motion.pyx":189
+ *                 lo = max(0, r-maxd)
+ *                 hi = min(n-1, r+maxd)
+ *                 for src in range(lo, hi+1):             # <<<<<<<<<<<<<<
+ *                     if old[src]==v and (known==NULL or known[src]):
+ *                         hist[r-src+maxd] += 1
+ */
+            __pyx_t_5 = (__pyx_v_hi + 1);
+            __pyx_t_3 = __pyx_t_5;
+            for (__pyx_t_8 = __pyx_v_lo; __pyx_t_8 < __pyx_t_3; __pyx_t_8+=1) {
+              __pyx_v_src = __pyx_t_8;
+
+              /* "xpra/server/window/motion.pyx":190
+ *                 hi = min(n-1, r+maxd)
+ *                 for src in range(lo, hi+1):
+ *                     if old[src]==v and (known==NULL or known[src]):             # <<<<<<<<<<<<<<
+ *                         hist[r-src+maxd] += 1
+ *             #pick the distances with the most hits first,
+ */
+              __pyx_t_2 = (((__pyx_v_old[__pyx_v_src]) == __pyx_v_v) != 0);
+              if (__pyx_t_2) {
+              } else {
+                __pyx_t_1 = __pyx_t_2;
+                goto __pyx_L19_bool_binop_done;
+              }
+              __pyx_t_2 = ((__pyx_v_known == NULL) != 0);
+              if (!__pyx_t_2) {
+              } else {
+                __pyx_t_1 = __pyx_t_2;
+                goto __pyx_L19_bool_binop_done;
+              }
+              __pyx_t_2 = ((__pyx_v_known[__pyx_v_src]) != 0);
+              __pyx_t_1 = __pyx_t_2;
+              __pyx_L19_bool_binop_done:;
+              if (__pyx_t_1) {
+
+                /* "xpra/server/window/motion.pyx":191
+ *                 for src in range(lo, hi+1):
+ *                     if old[src]==v and (known==NULL or known[src]):
+ *                         hist[r-src+maxd] += 1             # <<<<<<<<<<<<<<
+ *             #pick the distances with the most hits first,
+ *             #(ignoring those with a single hit as those are likely to be false positives)
+ */
+                __pyx_t_9 = ((__pyx_v_r - __pyx_v_src) + __pyx_v_maxd);
+                (__pyx_v_hist[__pyx_t_9]) = ((__pyx_v_hist[__pyx_t_9]) + 1);
+
+                /* "xpra/server/window/motion.pyx":190
+ *                 hi = min(n-1, r+maxd)
+ *                 for src in range(lo, hi+1):
+ *                     if old[src]==v and (known==NULL or known[src]):             # <<<<<<<<<<<<<<
+ *                         hist[r-src+maxd] += 1
+ *             #pick the distances with the most hits first,
+ */
+              }
+            }
+          }
+
+          /* "xpra/server/window/motion.pyx":195
+ *             #(ignoring those with a single hit as those are likely to be false positives)
+ *             #picked values are flagged by negating their hits:
+ *             for k in range(MAX_SCROLL_VALUES):             # <<<<<<<<<<<<<<
+ *                 best = -1
+ *                 besthits = 1
+ */
+          for (__pyx_t_4 = 0; __pyx_t_4 < 50; __pyx_t_4+=1) {
+            __pyx_v_k = __pyx_t_4;
+
+            /* "xpra/server/window/motion.pyx":196
+ *             #picked values are flagged by negating their hits:
+ *             for k in range(MAX_SCROLL_VALUES):
+ *                 best = -1             # <<<<<<<<<<<<<<
+ *                 besthits = 1
+ *                 for i in range(hsize):
+ */
+            __pyx_v_best = -1;
+
+            /* "xpra/server/window/motion.pyx":197
+ *             for k in range(MAX_SCROLL_VALUES):
+ *                 best = -1
+ *                 besthits = 1             # <<<<<<<<<<<<<<
+ *                 for i in range(hsize):
+ *                     if hist[i]>besthits:
+ */
+            __pyx_v_besthits = 1;
+
+            /* "xpra/server/window/motion.pyx":198
+ *                 best = -1
+ *                 besthits = 1
+ *                 for i in range(hsize):             # <<<<<<<<<<<<<<
+ *                     if hist[i]>besthits:
+ *                         best = i
+ */
+            __pyx_t_6 = __pyx_v_hsize;
+            __pyx_t_7 = __pyx_t_6;
+            for (__pyx_t_8 = 0; __pyx_t_8 < __pyx_t_7; __pyx_t_8+=1) {
+              __pyx_v_i = __pyx_t_8;
+
+              /* "xpra/server/window/motion.pyx":199
+ *                 besthits = 1
+ *                 for i in range(hsize):
+ *                     if hist[i]>besthits:             # <<<<<<<<<<<<<<
+ *                         best = i
+ *                         besthits = hist[i]
+ */
+              __pyx_t_1 = (((__pyx_v_hist[__pyx_v_i]) > __pyx_v_besthits) != 0);
+              if (__pyx_t_1) {
+
+                /* "xpra/server/window/motion.pyx":200
+ *                 for i in range(hsize):
+ *                     if hist[i]>besthits:
+ *                         best = i             # <<<<<<<<<<<<<<
+ *                         besthits = hist[i]
+ *                 if best<0:
+ */
+                __pyx_v_best = __pyx_v_i;
+
+                /* "xpra/server/window/motion.pyx":201
+ *                     if hist[i]>besthits:
+ *                         best = i
+ *                         besthits = hist[i]             # <<<<<<<<<<<<<<
+ *                 if best<0:
+ *                     break
+ */
+                __pyx_v_besthits = (__pyx_v_hist[__pyx_v_i]);
+
+                /* "xpra/server/window/motion.pyx":199
+ *                 besthits = 1
+ *                 for i in range(hsize):
+ *                     if hist[i]>besthits:             # <<<<<<<<<<<<<<
+ *                         best = i
+ *                         besthits = hist[i]
+ */
+              }
+            }
+
+            /* "xpra/server/window/motion.pyx":202
+ *                         best = i
+ *                         besthits = hist[i]
+ *                 if best<0:             # <<<<<<<<<<<<<<
+ *                     break
+ *                 hist[best] = -hist[best]
+ */
+            __pyx_t_1 = ((__pyx_v_best < 0) != 0);
+            if (__pyx_t_1) {
+
+              /* "xpra/server/window/motion.pyx":203
+ *                         besthits = hist[i]
+ *                 if best<0:
+ *                     break             # <<<<<<<<<<<<<<
+ *                 hist[best] = -hist[best]
+ *                 values[nvalues] = best-maxd
+ */
+              goto __pyx_L23_break;
+
+              /* "xpra/server/window/motion.pyx":202
+ *                         best = i
+ *                         besthits = hist[i]
+ *                 if best<0:             # <<<<<<<<<<<<<<
+ *                     break
+ *                 hist[best] = -hist[best]
+ */
+            }
+
+            /* "xpra/server/window/motion.pyx":204
+ *                 if best<0:
+ *                     break
+ *                 hist[best] = -hist[best]             # <<<<<<<<<<<<<<
+ *                 values[nvalues] = best-maxd
+ *                 nvalues += 1
+ */
+            (__pyx_v_hist[__pyx_v_best]) = (-(__pyx_v_hist[__pyx_v_best]));
+
+            /* "xpra/server/window/motion.pyx":205
+ *                     break
+ *                 hist[best] = -hist[best]
+ *                 values[nvalues] = best-maxd             # <<<<<<<<<<<<<<
+ *                 nvalues += 1
+ *             #always include "no change", so we can drop those lines:
+ */
+            (__pyx_v_values[__pyx_v_nvalues]) = (__pyx_v_best - __pyx_v_maxd);
+
+            /* "xpra/server/window/motion.pyx":206
+ *                 hist[best] = -hist[best]
+ *                 values[nvalues] = best-maxd
+ *                 nvalues += 1             # <<<<<<<<<<<<<<
+ *             #always include "no change", so we can drop those lines:
+ *             if hist[maxd]>0:
+ */
+            __pyx_v_nvalues = (__pyx_v_nvalues + 1);
+          }
+          __pyx_L23_break:;
+
+          /* "xpra/server/window/motion.pyx":208
+ *                 nvalues += 1
+ *             #always include "no change", so we can drop those lines:
+ *             if hist[maxd]>0:             # <<<<<<<<<<<<<<
+ *                 values[nvalues] = 0
+ *                 nvalues += 1
+ */
+          __pyx_t_1 = (((__pyx_v_hist[__pyx_v_maxd]) > 0) != 0);
+          if (__pyx_t_1) {
+
+            /* "xpra/server/window/motion.pyx":209
+ *             #always include "no change", so we can drop those lines:
+ *             if hist[maxd]>0:
+ *                 values[nvalues] = 0             # <<<<<<<<<<<<<<
+ *                 nvalues += 1
+ *             #assign each line to the first distance that matches it,
+ */
+            (__pyx_v_values[__pyx_v_nvalues]) = 0;
+
+            /* "xpra/server/window/motion.pyx":210
+ *             if hist[maxd]>0:
+ *                 values[nvalues] = 0
+ *                 nvalues += 1             # <<<<<<<<<<<<<<
+ *             #assign each line to the first distance that matches it,
+ *             #the 'handled' value records which pass the line was assigned in:
+ */
+            __pyx_v_nvalues = (__pyx_v_nvalues + 1);
+
+            /* "xpra/server/window/motion.pyx":208
+ *                 nvalues += 1
+ *             #always include "no change", so we can drop those lines:
+ *             if hist[maxd]>0:             # <<<<<<<<<<<<<<
+ *                 values[nvalues] = 0
+ *                 nvalues += 1
+ */
+          }
+
+          /* "xpra/server/window/motion.pyx":213
+ *             #assign each line to the first distance that matches it,
+ *             #the 'handled' value records which pass the line was assigned in:
+ *             for k in range(nvalues):             # <<<<<<<<<<<<<<
+ *                 s = values[k]
+ *                 pass_id = k+1
+ */
+          __pyx_t_4 = __pyx_v_nvalues;
+          __pyx_t_6 = __pyx_t_4;
+          for (__pyx_t_7 = 0; __pyx_t_7 < __pyx_t_6; __pyx_t_7+=1) {
+            __pyx_v_k = __pyx_t_7;
+
+            /* "xpra/server/window/motion.pyx":214
+ *             #the 'handled' value records which pass the line was assigned in:
+ *             for k in range(nvalues):
+ *                 s = values[k]             # <<<<<<<<<<<<<<
+ *                 pass_id = k+1
+ *                 run_start = -1
+ */
+            __pyx_v_s = (__pyx_v_values[__pyx_v_k]);
+
+            /* "xpra/server/window/motion.pyx":215
+ *             for k in range(nvalues):
+ *                 s = values[k]
+ *                 pass_id = k+1             # <<<<<<<<<<<<<<
+ *                 run_start = -1
+ *                 for r in range(start, end+1):
+ */
+            __pyx_v_pass_id = (__pyx_v_k + 1);
+
+            /* "xpra/server/window/motion.pyx":216
+ *                 s = values[k]
+ *                 pass_id = k+1
+ *                 run_start = -1             # <<<<<<<<<<<<<<
+ *                 for r in range(start, end+1):
+ *                     ok = 0
+ */
+            __pyx_v_run_start = -1;
+
+            /* "xpra/server/window/motion.pyx":217
+ *                 pass_id = k+1
+ *                 run_start = -1
+ *                 for r in range(start, end+1):             # <<<<<<<<<<<<<<
+ *                     ok = 0
+ *                     src = r-s
+ */
+            __pyx_t_5 = (__pyx_v_end + 1);
+            __pyx_t_3 = __pyx_t_5;
+            for (__pyx_t_8 = __pyx_v_start; __pyx_t_8 < __pyx_t_3; __pyx_t_8+=1) {
+              __pyx_v_r = __pyx_t_8;
+
+              /* "xpra/server/window/motion.pyx":218
+ *                 run_start = -1
+ *                 for r in range(start, end+1):
+ *                     ok = 0             # <<<<<<<<<<<<<<
+ *                     src = r-s
+ *                     if r<end and handled[r]==0 and nscrolls<MAX_SCROLLS and 0<=src<n and old[src]==cur[r] and (known==NULL or known[src]):
+ */
+              __pyx_v_ok = 0;
+
+              /* "xpra/server/window/motion.pyx":219
+ *                 for r in range(start, end+1):
+ *                     ok = 0
+ *                     src = r-s             # <<<<<<<<<<<<<<
+ *                     if r<end and handled[r]==0 and nscrolls<MAX_SCROLLS and 0<=src<n and old[src]==cur[r] and (known==NULL or known[src]):
+ *                         #don't use a source line which has already been overwritten by a previous pass:
+ */
+              __pyx_v_src = (__pyx_v_r - __pyx_v_s);
+
+              /* "xpra/server/window/motion.pyx":220
+ *                     ok = 0
+ *                     src = r-s
+ *                     if r<end and handled[r]==0 and nscrolls<MAX_SCROLLS and 0<=src<n and old[src]==cur[r] and (known==NULL or known[src]):             # <<<<<<<<<<<<<<
+ *                         #don't use a source line which has already been overwritten by a previous pass:
+ *                         ok = handled[src]==0 or handled[src]==pass_id
+ */
+              __pyx_t_2 = ((__pyx_v_r < __pyx_v_end) != 0);
+              if (__pyx_t_2) {
+              } else {
+                __pyx_t_1 = __pyx_t_2;
+                goto __pyx_L34_bool_binop_done;
+              }
+              __pyx_t_2 = (((__pyx_v_handled[__pyx_v_r]) == 0) != 0);
+              if (__pyx_t_2) {
+              } else {
+                __pyx_t_1 = __pyx_t_2;
+                goto __pyx_L34_bool_binop_done;
+              }
+              __pyx_t_2 = ((__pyx_v_nscrolls < 0x3E8) != 0);
+              if (__pyx_t_2) {
+              } else {
+                __pyx_t_1 = __pyx_t_2;
+                goto __pyx_L34_bool_binop_done;
+              }
+              __pyx_t_2 = (0 <= __pyx_v_src);
+              if (__pyx_t_2) {
+                __pyx_t_2 = (__pyx_v_src < __pyx_v_n);
+              }
+              __pyx_t_10 = (__pyx_t_2 != 0);
+              if (__pyx_t_10) {
+              } else {
+                __pyx_t_1 = __pyx_t_10;
+                goto __pyx_L34_bool_binop_done;
+              }
+              __pyx_t_10 = (((__pyx_v_old[__pyx_v_src]) == (__pyx_v_cur[__pyx_v_r])) != 0);
+              if (__pyx_t_10) {
+              } else {
+                __pyx_t_1 = __pyx_t_10;
+                goto __pyx_L34_bool_binop_done;
+              }
+              __pyx_t_10 = ((__pyx_v_known == NULL) != 0);
+              if (!__pyx_t_10) {
+              } else {
+                __pyx_t_1 = __pyx_t_10;
+                goto __pyx_L34_bool_binop_done;
+              }
+              __pyx_t_10 = ((__pyx_v_known[__pyx_v_src]) != 0);
+              __pyx_t_1 = __pyx_t_10;
+              __pyx_L34_bool_binop_done:;
+              if (__pyx_t_1) {
+
+                /* "xpra/server/window/motion.pyx":222
+ *                     if r<end and handled[r]==0 and nscrolls<MAX_SCROLLS and 0<=src<n and old[src]==cur[r] and (known==NULL or known[src]):
+ *                         #don't use a source line which has already been overwritten by a previous pass:
+ *                         ok = handled[src]==0 or handled[src]==pass_id             # <<<<<<<<<<<<<<
+ *                     if ok:
+ *                         handled[r] = pass_id
+ */
+                __pyx_t_1 = ((__pyx_v_handled[__pyx_v_src]) == 0);
+                if (!__pyx_t_1) {
+                } else {
+                  __pyx_t_9 = __pyx_t_1;
+                  goto __pyx_L41_bool_binop_done;
+                }
+                __pyx_t_1 = ((__pyx_v_handled[__pyx_v_src]) == __pyx_v_pass_id);
+                __pyx_t_9 = __pyx_t_1;
+                __pyx_L41_bool_binop_done:;
+                __pyx_v_ok = __pyx_t_9;
+
+                /* "xpra/server/window/motion.pyx":220
+ *                     ok = 0
+ *                     src = r-s
+ *                     if r<end and handled[r]==0 and nscrolls<MAX_SCROLLS and 0<=src<n and old[src]==cur[r] and (known==NULL or known[src]):             # <<<<<<<<<<<<<<
+ *                         #don't use a source line which has already been overwritten by a previous pass:
+ *                         ok = handled[src]==0 or handled[src]==pass_id
+ */
+              }
+
+              /* "xpra/server/window/motion.pyx":223
+ *                         #don't use a source line which has already been overwritten by a previous pass:
+ *                         ok = handled[src]==0 or handled[src]==pass_id
+ *                     if ok:             # <<<<<<<<<<<<<<
+ *                         handled[r] = pass_id
+ *                         handled_count += 1
+ */
+              __pyx_t_1 = (__pyx_v_ok != 0);
+              if (__pyx_t_1) {
+
+                /* "xpra/server/window/motion.pyx":224
+ *                         ok = handled[src]==0 or handled[src]==pass_id
+ *                     if ok:
+ *                         handled[r] = pass_id             # <<<<<<<<<<<<<<
+ *                         handled_count += 1
+ *                         if s==0:
+ */
+                (__pyx_v_handled[__pyx_v_r]) = __pyx_v_pass_id;
+
+                /* "xpra/server/window/motion.pyx":225
+ *                     if ok:
+ *                         handled[r] = pass_id
+ *                         handled_count += 1             # <<<<<<<<<<<<<<
+ *                         if s==0:
+ *                             unchanged += 1
+ */
+                __pyx_v_handled_count = (__pyx_v_handled_count + 1);
+
+                /* "xpra/server/window/motion.pyx":226
+ *                         handled[r] = pass_id
+ *                         handled_count += 1
+ *                         if s==0:             # <<<<<<<<<<<<<<
+ *                             unchanged += 1
+ *                         elif run_start<0:
+ */
+                __pyx_t_1 = ((__pyx_v_s == 0) != 0);
+                if (__pyx_t_1) {
+
+                  /* "xpra/server/window/motion.pyx":227
+ *                         handled_count += 1
+ *                         if s==0:
+ *                             unchanged += 1             # <<<<<<<<<<<<<<
+ *                         elif run_start<0:
+ *                             run_start = r
+ */
+                  __pyx_v_unchanged = (__pyx_v_unchanged + 1);
+
+                  /* "xpra/server/window/motion.pyx":226
+ *                         handled[r] = pass_id
+ *                         handled_count += 1
+ *                         if s==0:             # <<<<<<<<<<<<<<
+ *                             unchanged += 1
+ *                         elif run_start<0:
+ */
+                  goto __pyx_L44;
+                }
+
+                /* "xpra/server/window/motion.pyx":228
+ *                         if s==0:
+ *                             unchanged += 1
+ *                         elif run_start<0:             # <<<<<<<<<<<<<<
+ *                             run_start = r
+ *                     elif run_start>=0:
+ */
+                __pyx_t_1 = ((__pyx_v_run_start < 0) != 0);
+                if (__pyx_t_1) {
+
+                  /* "xpra/server/window/motion.pyx":229
+ *                             unchanged += 1
+ *                         elif run_start<0:
+ *                             run_start = r             # <<<<<<<<<<<<<<
+ *                     elif run_start>=0:
+ *                         scroll_start[nscrolls] = run_start
+ */
+                  __pyx_v_run_start = __pyx_v_r;
+
+                  /* "xpra/server/window/motion.pyx":228
+ *                         if s==0:
+ *                             unchanged += 1
+ *                         elif run_start<0:             # <<<<<<<<<<<<<<
+ *                             run_start = r
+ *                     elif run_start>=0:
+ */
+                }
+                __pyx_L44:;
+
+                /* "xpra/server/window/motion.pyx":223
+ *                         #don't use a source line which has already been overwritten by a previous pass:
+ *                         ok = handled[src]==0 or handled[src]==pass_id
+ *                     if ok:             # <<<<<<<<<<<<<<
+ *                         handled[r] = pass_id
+ *                         handled_count += 1
+ */
+                goto __pyx_L43;
+              }
+
+              /* "xpra/server/window/motion.pyx":230
+ *                         elif run_start<0:
+ *                             run_start = r
+ *                     elif run_start>=0:             # <<<<<<<<<<<<<<
+ *                         scroll_start[nscrolls] = run_start
+ *                         scroll_count[nscrolls] = r-run_start
+ */
+              __pyx_t_1 = ((__pyx_v_run_start >= 0) != 0);
+              if (__pyx_t_1) {
+
+                /* "xpra/server/window/motion.pyx":231
+ *                             run_start = r
+ *                     elif run_start>=0:
+ *                         scroll_start[nscrolls] = run_start             # <<<<<<<<<<<<<<
+ *                         scroll_count[nscrolls] = r-run_start
+ *                         scroll_distance[nscrolls] = s
+ */
+                (__pyx_v_scroll_start[__pyx_v_nscrolls]) = __pyx_v_run_start;
+
+                /* "xpra/server/window/motion.pyx":232
+ *                     elif run_start>=0:
+ *                         scroll_start[nscrolls] = run_start
+ *                         scroll_count[nscrolls] = r-run_start             # <<<<<<<<<<<<<<
+ *                         scroll_distance[nscrolls] = s
+ *                         nscrolls += 1
+ */
+                (__pyx_v_scroll_count[__pyx_v_nscrolls]) = (__pyx_v_r - __pyx_v_run_start);
+
+                /* "xpra/server/window/motion.pyx":233
+ *                         scroll_start[nscrolls] = run_start
+ *                         scroll_count[nscrolls] = r-run_start
+ *                         scroll_distance[nscrolls] = s             # <<<<<<<<<<<<<<
+ *                         nscrolls += 1
+ *                         run_start = -1
+ */
+                (__pyx_v_scroll_distance[__pyx_v_nscrolls]) = __pyx_v_s;
+
+                /* "xpra/server/window/motion.pyx":234
+ *                         scroll_count[nscrolls] = r-run_start
+ *                         scroll_distance[nscrolls] = s
+ *                         nscrolls += 1             # <<<<<<<<<<<<<<
+ *                         run_start = -1
+ *         if handled_count*100<min_percent*lines:
+ */
+                __pyx_v_nscrolls = (__pyx_v_nscrolls + 1);
+
+                /* "xpra/server/window/motion.pyx":235
+ *                         scroll_distance[nscrolls] = s
+ *                         nscrolls += 1
+ *                         run_start = -1             # <<<<<<<<<<<<<<
+ *         if handled_count*100<min_percent*lines:
+ *             return None
+ */
+                __pyx_v_run_start = -1;
+
+                /* "xpra/server/window/motion.pyx":230
+ *                         elif run_start<0:
+ *                             run_start = r
+ *                     elif run_start>=0:             # <<<<<<<<<<<<<<
+ *                         scroll_start[nscrolls] = run_start
+ *                         scroll_count[nscrolls] = r-run_start
+ */
+              }
+              __pyx_L43:;
+            }
+          }
+        }
+
+        /* "xpra/server/window/motion.pyx":181
+ *         handled = <uint8_t*> xmemalign(n)
+ *         assert hist!=NULL and handled!=NULL, "failed to allocate scroll detection memory"
+ *         with nogil:             # <<<<<<<<<<<<<<
+ *             memset(<void*> hist, 0, hsize*sizeof(int32_t))
+ *             memset(<void*> handled, 0, n)
+ */
+        /*finally:*/ {
+          /*normal exit:*/{
+            #ifdef WITH_THREAD
+            __Pyx_FastGIL_Forget();
+            Py_BLOCK_THREADS
+            #endif
+            goto __pyx_L13;
+          }
+          __pyx_L13:;
+        }
+    }
+
+    /* "xpra/server/window/motion.pyx":236
+ *                         nscrolls += 1
+ *                         run_start = -1
+ *         if handled_count*100<min_percent*lines:             # <<<<<<<<<<<<<<
+ *             return None
+ *         scrolls = [(scroll_start[i], scroll_count[i], scroll_distance[i]) for i in range(nscrolls)]
+ */
+    __pyx_t_1 = (((__pyx_v_handled_count * 0x64) < (__pyx_v_min_percent * __pyx_v_lines)) != 0);
+    if (__pyx_t_1) {
+
+      /* "xpra/server/window/motion.pyx":237
+ *                         run_start = -1
+ *         if handled_count*100<min_percent*lines:
+ *             return None             # <<<<<<<<<<<<<<
+ *         scrolls = [(scroll_start[i], scroll_count[i], scroll_distance[i]) for i in range(nscrolls)]
+ *         #everything else must be sent:
+ */
+      __Pyx_XDECREF(__pyx_r);
+      __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+      goto __pyx_L6_return;
+
+      /* "xpra/server/window/motion.pyx":236
+ *                         nscrolls += 1
+ *                         run_start = -1
+ *         if handled_count*100<min_percent*lines:             # <<<<<<<<<<<<<<
+ *             return None
+ *         scrolls = [(scroll_start[i], scroll_count[i], scroll_distance[i]) for i in range(nscrolls)]
+ */
+    }
+
+    /* "xpra/server/window/motion.pyx":238
+ *         if handled_count*100<min_percent*lines:
+ *             return None
+ *         scrolls = [(scroll_start[i], scroll_count[i], scroll_distance[i]) for i in range(nscrolls)]             # <<<<<<<<<<<<<<
+ *         #everything else must be sent:
+ *         non_scroll = []
+ */
+    __pyx_t_11 = PyList_New(0); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 238, __pyx_L7_error)
+    __Pyx_GOTREF(__pyx_t_11);
+    __pyx_t_4 = __pyx_v_nscrolls;
+    __pyx_t_6 = __pyx_t_4;
+    for (__pyx_t_7 = 0; __pyx_t_7 < __pyx_t_6; __pyx_t_7+=1) {
+      __pyx_v_i = __pyx_t_7;
+      __pyx_t_12 = __Pyx_PyInt_From_int((__pyx_v_scroll_start[__pyx_v_i])); if (unlikely(!__pyx_t_12)) __PYX_ERR(0, 238, __pyx_L7_error)
+      __Pyx_GOTREF(__pyx_t_12);
+      __pyx_t_13 = __Pyx_PyInt_From_int((__pyx_v_scroll_count[__pyx_v_i])); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 238, __pyx_L7_error)
+      __Pyx_GOTREF(__pyx_t_13);
+      __pyx_t_14 = __Pyx_PyInt_From_int((__pyx_v_scroll_distance[__pyx_v_i])); if (unlikely(!__pyx_t_14)) __PYX_ERR(0, 238, __pyx_L7_error)
+      __Pyx_GOTREF(__pyx_t_14);
+      __pyx_t_15 = PyTuple_New(3); if (unlikely(!__pyx_t_15)) __PYX_ERR(0, 238, __pyx_L7_error)
+      __Pyx_GOTREF(__pyx_t_15);
+      __Pyx_GIVEREF(__pyx_t_12);
+      PyTuple_SET_ITEM(__pyx_t_15, 0, __pyx_t_12);
+      __Pyx_GIVEREF(__pyx_t_13);
+      PyTuple_SET_ITEM(__pyx_t_15, 1, __pyx_t_13);
+      __Pyx_GIVEREF(__pyx_t_14);
+      PyTuple_SET_ITEM(__pyx_t_15, 2, __pyx_t_14);
+      __pyx_t_12 = 0;
+      __pyx_t_13 = 0;
+      __pyx_t_14 = 0;
+      if (unlikely(__Pyx_ListComp_Append(__pyx_t_11, (PyObject*)__pyx_t_15))) __PYX_ERR(0, 238, __pyx_L7_error)
+      __Pyx_DECREF(__pyx_t_15); __pyx_t_15 = 0;
+    }
+    __pyx_v_scrolls = ((PyObject*)__pyx_t_11);
+    __pyx_t_11 = 0;
+
+    /* "xpra/server/window/motion.pyx":240
+ *         scrolls = [(scroll_start[i], scroll_count[i], scroll_distance[i]) for i in range(nscrolls)]
+ *         #everything else must be sent:
+ *         non_scroll = []             # <<<<<<<<<<<<<<
+ *         run_start = -1
+ *         for r in range(start, end+1):
+ */
+    __pyx_t_11 = PyList_New(0); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 240, __pyx_L7_error)
+    __Pyx_GOTREF(__pyx_t_11);
+    __pyx_v_non_scroll = ((PyObject*)__pyx_t_11);
+    __pyx_t_11 = 0;
+
+    /* "xpra/server/window/motion.pyx":241
+ *         #everything else must be sent:
+ *         non_scroll = []
+ *         run_start = -1             # <<<<<<<<<<<<<<
+ *         for r in range(start, end+1):
+ *             if r<end and handled[r]==0:
+ */
+    __pyx_v_run_start = -1;
+
+    /* "xpra/server/window/motion.pyx":242
+ *         non_scroll = []
+ *         run_start = -1
+ *         for r in range(start, end+1):             # <<<<<<<<<<<<<<
+ *             if r<end and handled[r]==0:
+ *                 if run_start<0:
+ */
+    __pyx_t_5 = (__pyx_v_end + 1);
+    __pyx_t_3 = __pyx_t_5;
+    for (__pyx_t_4 = __pyx_v_start; __pyx_t_4 < __pyx_t_3; __pyx_t_4+=1) {
+      __pyx_v_r = __pyx_t_4;
+
+      /* "xpra/server/window/motion.pyx":243
+ *         run_start = -1
+ *         for r in range(start, end+1):
+ *             if r<end and handled[r]==0:             # <<<<<<<<<<<<<<
+ *                 if run_start<0:
+ *                     run_start = r
+ */
+      __pyx_t_10 = ((__pyx_v_r < __pyx_v_end) != 0);
+      if (__pyx_t_10) {
+      } else {
+        __pyx_t_1 = __pyx_t_10;
+        goto __pyx_L51_bool_binop_done;
+      }
+      __pyx_t_10 = (((__pyx_v_handled[__pyx_v_r]) == 0) != 0);
+      __pyx_t_1 = __pyx_t_10;
+      __pyx_L51_bool_binop_done:;
+      if (__pyx_t_1) {
+
+        /* "xpra/server/window/motion.pyx":244
+ *         for r in range(start, end+1):
+ *             if r<end and handled[r]==0:
+ *                 if run_start<0:             # <<<<<<<<<<<<<<
+ *                     run_start = r
+ *             elif run_start>=0:
+ */
+        __pyx_t_1 = ((__pyx_v_run_start < 0) != 0);
+        if (__pyx_t_1) {
+
+          /* "xpra/server/window/motion.pyx":245
+ *             if r<end and handled[r]==0:
+ *                 if run_start<0:
+ *                     run_start = r             # <<<<<<<<<<<<<<
+ *             elif run_start>=0:
+ *                 non_scroll.append((run_start, r-run_start))
+ */
+          __pyx_v_run_start = __pyx_v_r;
+
+          /* "xpra/server/window/motion.pyx":244
+ *         for r in range(start, end+1):
+ *             if r<end and handled[r]==0:
+ *                 if run_start<0:             # <<<<<<<<<<<<<<
+ *                     run_start = r
+ *             elif run_start>=0:
+ */
+        }
+
+        /* "xpra/server/window/motion.pyx":243
+ *         run_start = -1
+ *         for r in range(start, end+1):
+ *             if r<end and handled[r]==0:             # <<<<<<<<<<<<<<
+ *                 if run_start<0:
+ *                     run_start = r
+ */
+        goto __pyx_L50;
+      }
+
+      /* "xpra/server/window/motion.pyx":246
+ *                 if run_start<0:
+ *                     run_start = r
+ *             elif run_start>=0:             # <<<<<<<<<<<<<<
+ *                 non_scroll.append((run_start, r-run_start))
+ *                 run_start = -1
+ */
+      __pyx_t_1 = ((__pyx_v_run_start >= 0) != 0);
+      if (__pyx_t_1) {
+
+        /* "xpra/server/window/motion.pyx":247
+ *                     run_start = r
+ *             elif run_start>=0:
+ *                 non_scroll.append((run_start, r-run_start))             # <<<<<<<<<<<<<<
+ *                 run_start = -1
+ *         return scrolls, non_scroll, unchanged
+ */
+        __pyx_t_11 = __Pyx_PyInt_From_int(__pyx_v_run_start); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 247, __pyx_L7_error)
+        __Pyx_GOTREF(__pyx_t_11);
+        __pyx_t_15 = __Pyx_PyInt_From_int((__pyx_v_r - __pyx_v_run_start)); if (unlikely(!__pyx_t_15)) __PYX_ERR(0, 247, __pyx_L7_error)
+        __Pyx_GOTREF(__pyx_t_15);
+        __pyx_t_14 = PyTuple_New(2); if (unlikely(!__pyx_t_14)) __PYX_ERR(0, 247, __pyx_L7_error)
+        __Pyx_GOTREF(__pyx_t_14);
+        __Pyx_GIVEREF(__pyx_t_11);
+        PyTuple_SET_ITEM(__pyx_t_14, 0, __pyx_t_11);
+        __Pyx_GIVEREF(__pyx_t_15);
+        PyTuple_SET_ITEM(__pyx_t_14, 1, __pyx_t_15);
+        __pyx_t_11 = 0;
+        __pyx_t_15 = 0;
+        __pyx_t_16 = __Pyx_PyList_Append(__pyx_v_non_scroll, __pyx_t_14); if (unlikely(__pyx_t_16 == ((int)-1))) __PYX_ERR(0, 247, __pyx_L7_error)
+        __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
+
+        /* "xpra/server/window/motion.pyx":248
+ *             elif run_start>=0:
+ *                 non_scroll.append((run_start, r-run_start))
+ *                 run_start = -1             # <<<<<<<<<<<<<<
+ *         return scrolls, non_scroll, unchanged
+ *     finally:
+ */
+        __pyx_v_run_start = -1;
+
+        /* "xpra/server/window/motion.pyx":246
+ *                 if run_start<0:
+ *                     run_start = r
+ *             elif run_start>=0:             # <<<<<<<<<<<<<<
+ *                 non_scroll.append((run_start, r-run_start))
+ *                 run_start = -1
+ */
+      }
+      __pyx_L50:;
+    }
+
+    /* "xpra/server/window/motion.pyx":249
+ *                 non_scroll.append((run_start, r-run_start))
+ *                 run_start = -1
+ *         return scrolls, non_scroll, unchanged             # <<<<<<<<<<<<<<
+ *     finally:
+ *         if hist!=NULL:
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_14 = __Pyx_PyInt_From_int(__pyx_v_unchanged); if (unlikely(!__pyx_t_14)) __PYX_ERR(0, 249, __pyx_L7_error)
+    __Pyx_GOTREF(__pyx_t_14);
+    __pyx_t_15 = PyTuple_New(3); if (unlikely(!__pyx_t_15)) __PYX_ERR(0, 249, __pyx_L7_error)
+    __Pyx_GOTREF(__pyx_t_15);
+    __Pyx_INCREF(__pyx_v_scrolls);
+    __Pyx_GIVEREF(__pyx_v_scrolls);
+    PyTuple_SET_ITEM(__pyx_t_15, 0, __pyx_v_scrolls);
+    __Pyx_INCREF(__pyx_v_non_scroll);
+    __Pyx_GIVEREF(__pyx_v_non_scroll);
+    PyTuple_SET_ITEM(__pyx_t_15, 1, __pyx_v_non_scroll);
+    __Pyx_GIVEREF(__pyx_t_14);
+    PyTuple_SET_ITEM(__pyx_t_15, 2, __pyx_t_14);
+    __pyx_t_14 = 0;
+    __pyx_r = __pyx_t_15;
+    __pyx_t_15 = 0;
+    goto __pyx_L6_return;
+  }
+
+  /* "xpra/server/window/motion.pyx":251
+ *         return scrolls, non_scroll, unchanged
+ *     finally:
+ *         if hist!=NULL:             # <<<<<<<<<<<<<<
+ *             free(hist)
+ *         if handled!=NULL:
+ */
+  /*finally:*/ {
+    __pyx_L7_error:;
+    /*exception exit:*/{
+      __Pyx_PyThreadState_declare
+      __Pyx_PyThreadState_assign
+      __pyx_t_18 = 0; __pyx_t_19 = 0; __pyx_t_20 = 0; __pyx_t_21 = 0; __pyx_t_22 = 0; __pyx_t_23 = 0;
+      __Pyx_XDECREF(__pyx_t_11); __pyx_t_11 = 0;
+      __Pyx_XDECREF(__pyx_t_12); __pyx_t_12 = 0;
+      __Pyx_XDECREF(__pyx_t_13); __pyx_t_13 = 0;
+      __Pyx_XDECREF(__pyx_t_14); __pyx_t_14 = 0;
+      __Pyx_XDECREF(__pyx_t_15); __pyx_t_15 = 0;
+      if (PY_MAJOR_VERSION >= 3) __Pyx_ExceptionSwap(&__pyx_t_21, &__pyx_t_22, &__pyx_t_23);
+      if ((PY_MAJOR_VERSION < 3) || unlikely(__Pyx_GetException(&__pyx_t_18, &__pyx_t_19, &__pyx_t_20) < 0)) __Pyx_ErrFetch(&__pyx_t_18, &__pyx_t_19, &__pyx_t_20);
+      __Pyx_XGOTREF(__pyx_t_18);
+      __Pyx_XGOTREF(__pyx_t_19);
+      __Pyx_XGOTREF(__pyx_t_20);
+      __Pyx_XGOTREF(__pyx_t_21);
+      __Pyx_XGOTREF(__pyx_t_22);
+      __Pyx_XGOTREF(__pyx_t_23);
+      __pyx_t_4 = __pyx_lineno; __pyx_t_6 = __pyx_clineno; __pyx_t_17 = __pyx_filename;
+      {
+        __pyx_t_1 = ((__pyx_v_hist != NULL) != 0);
+        if (__pyx_t_1) {
+
+          /* "xpra/server/window/motion.pyx":252
+ *     finally:
+ *         if hist!=NULL:
+ *             free(hist)             # <<<<<<<<<<<<<<
+ *         if handled!=NULL:
+ *             free(handled)
+ */
+          free(__pyx_v_hist);
+
+          /* "xpra/server/window/motion.pyx":251
+ *         return scrolls, non_scroll, unchanged
+ *     finally:
+ *         if hist!=NULL:             # <<<<<<<<<<<<<<
+ *             free(hist)
+ *         if handled!=NULL:
+ */
+        }
+
+        /* "xpra/server/window/motion.pyx":253
+ *         if hist!=NULL:
+ *             free(hist)
+ *         if handled!=NULL:             # <<<<<<<<<<<<<<
+ *             free(handled)
+ * 
+ */
+        __pyx_t_1 = ((__pyx_v_handled != NULL) != 0);
+        if (__pyx_t_1) {
+
+          /* "xpra/server/window/motion.pyx":254
+ *             free(hist)
+ *         if handled!=NULL:
+ *             free(handled)             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+          free(__pyx_v_handled);
+
+          /* "xpra/server/window/motion.pyx":253
+ *         if hist!=NULL:
+ *             free(hist)
+ *         if handled!=NULL:             # <<<<<<<<<<<<<<
+ *             free(handled)
+ * 
+ */
+        }
+      }
+      if (PY_MAJOR_VERSION >= 3) {
+        __Pyx_XGIVEREF(__pyx_t_21);
+        __Pyx_XGIVEREF(__pyx_t_22);
+        __Pyx_XGIVEREF(__pyx_t_23);
+        __Pyx_ExceptionReset(__pyx_t_21, __pyx_t_22, __pyx_t_23);
+      }
+      __Pyx_XGIVEREF(__pyx_t_18);
+      __Pyx_XGIVEREF(__pyx_t_19);
+      __Pyx_XGIVEREF(__pyx_t_20);
+      __Pyx_ErrRestore(__pyx_t_18, __pyx_t_19, __pyx_t_20);
+      __pyx_t_18 = 0; __pyx_t_19 = 0; __pyx_t_20 = 0; __pyx_t_21 = 0; __pyx_t_22 = 0; __pyx_t_23 = 0;
+      __pyx_lineno = __pyx_t_4; __pyx_clineno = __pyx_t_6; __pyx_filename = __pyx_t_17;
+      goto __pyx_L1_error;
+    }
+    __pyx_L6_return: {
+      __pyx_t_23 = __pyx_r;
+      __pyx_r = 0;
+
+      /* "xpra/server/window/motion.pyx":251
+ *         return scrolls, non_scroll, unchanged
+ *     finally:
+ *         if hist!=NULL:             # <<<<<<<<<<<<<<
+ *             free(hist)
+ *         if handled!=NULL:
+ */
+      __pyx_t_1 = ((__pyx_v_hist != NULL) != 0);
+      if (__pyx_t_1) {
+
+        /* "xpra/server/window/motion.pyx":252
+ *     finally:
+ *         if hist!=NULL:
+ *             free(hist)             # <<<<<<<<<<<<<<
+ *         if handled!=NULL:
+ *             free(handled)
+ */
+        free(__pyx_v_hist);
+
+        /* "xpra/server/window/motion.pyx":251
+ *         return scrolls, non_scroll, unchanged
+ *     finally:
+ *         if hist!=NULL:             # <<<<<<<<<<<<<<
+ *             free(hist)
+ *         if handled!=NULL:
+ */
+      }
+
+      /* "xpra/server/window/motion.pyx":253
+ *         if hist!=NULL:
+ *             free(hist)
+ *         if handled!=NULL:             # <<<<<<<<<<<<<<
+ *             free(handled)
+ * 
+ */
+      __pyx_t_1 = ((__pyx_v_handled != NULL) != 0);
+      if (__pyx_t_1) {
+
+        /* "xpra/server/window/motion.pyx":254
+ *             free(hist)
+ *         if handled!=NULL:
+ *             free(handled)             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+        free(__pyx_v_handled);
+
+        /* "xpra/server/window/motion.pyx":253
+ *         if hist!=NULL:
+ *             free(hist)
+ *         if handled!=NULL:             # <<<<<<<<<<<<<<
+ *             free(handled)
+ * 
+ */
+      }
+      __pyx_r = __pyx_t_23;
+      __pyx_t_23 = 0;
+      goto __pyx_L0;
+    }
+  }
+
+  /* "xpra/server/window/motion.pyx":150
+ * DEF MAX_SCROLLS = 1000
+ * 
+ * cdef match_lines(const uint64_t *old, const uint8_t *known, const uint64_t *cur, int n, int start, int end, int max_distance, int min_percent):             # <<<<<<<<<<<<<<
+ *     """
+ *         Finds the lines in [start, end[ whose new hash can be found in the old hashes,
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_11);
+  __Pyx_XDECREF(__pyx_t_12);
+  __Pyx_XDECREF(__pyx_t_13);
+  __Pyx_XDECREF(__pyx_t_14);
+  __Pyx_XDECREF(__pyx_t_15);
+  __Pyx_AddTraceback("xpra.server.window.motion.match_lines", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_scrolls);
+  __Pyx_XDECREF(__pyx_v_non_scroll);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "xpra/server/window/motion.pyx":284
+ *     cdef unsigned long rows_hashed
+ * 
+ *     def __cinit__(self, unsigned int width, unsigned int height):             # <<<<<<<<<<<<<<
+ *         assert width>0 and height>0
+ *         self.width = width
+ */
+
+/* Python wrapper */
+static int __pyx_pw_4xpra_6server_6window_6motion_10ScrollData_1__cinit__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static int __pyx_pw_4xpra_6server_6window_6motion_10ScrollData_1__cinit__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  unsigned int __pyx_v_width;
+  unsigned int __pyx_v_height;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__cinit__ (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_width,&__pyx_n_s_height,0};
+    PyObject* values[2] = {0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_width)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_height)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("__cinit__", 1, 2, 2, 1); __PYX_ERR(0, 284, __pyx_L3_error)
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "__cinit__") < 0)) __PYX_ERR(0, 284, __pyx_L3_error)
+      }
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 2) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+    }
+    __pyx_v_width = __Pyx_PyInt_As_unsigned_int(values[0]); if (unlikely((__pyx_v_width == (unsigned int)-1) && PyErr_Occurred())) __PYX_ERR(0, 284, __pyx_L3_error)
+    __pyx_v_height = __Pyx_PyInt_As_unsigned_int(values[1]); if (unlikely((__pyx_v_height == (unsigned int)-1) && PyErr_Occurred())) __PYX_ERR(0, 284, __pyx_L3_error)
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("__cinit__", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 284, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("xpra.server.window.motion.ScrollData.__cinit__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return -1;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_4xpra_6server_6window_6motion_10ScrollData___cinit__(((struct __pyx_obj_4xpra_6server_6window_6motion_ScrollData *)__pyx_v_self), __pyx_v_width, __pyx_v_height);
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static int __pyx_pf_4xpra_6server_6window_6motion_10ScrollData___cinit__(struct __pyx_obj_4xpra_6server_6window_6motion_ScrollData *__pyx_v_self, unsigned int __pyx_v_width, unsigned int __pyx_v_height) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__cinit__", 0);
+
+  /* "xpra/server/window/motion.pyx":285
+ * 
+ *     def __cinit__(self, unsigned int width, unsigned int height):
+ *         assert width>0 and height>0             # <<<<<<<<<<<<<<
+ *         self.width = width
+ *         self.height = height
+ */
+  #ifndef CYTHON_WITHOUT_ASSERTIONS
+  if (unlikely(__pyx_assertions_enabled())) {
+    __pyx_t_2 = ((__pyx_v_width > 0) != 0);
+    if (__pyx_t_2) {
+    } else {
+      __pyx_t_1 = __pyx_t_2;
+      goto __pyx_L3_bool_binop_done;
+    }
+    __pyx_t_2 = ((__pyx_v_height > 0) != 0);
+    __pyx_t_1 = __pyx_t_2;
+    __pyx_L3_bool_binop_done:;
+    if (unlikely(!__pyx_t_1)) {
+      PyErr_SetNone(PyExc_AssertionError);
+      __PYX_ERR(0, 285, __pyx_L1_error)
+    }
+  }
+  #endif
+
+  /* "xpra/server/window/motion.pyx":286
+ *     def __cinit__(self, unsigned int width, unsigned int height):
+ *         assert width>0 and height>0
+ *         self.width = width             # <<<<<<<<<<<<<<
+ *         self.height = height
+ *         self.x = -1
+ */
+  __pyx_v_self->width = __pyx_v_width;
+
+  /* "xpra/server/window/motion.pyx":287
+ *         assert width>0 and height>0
+ *         self.width = width
+ *         self.height = height             # <<<<<<<<<<<<<<
+ *         self.x = -1
+ *         self.w = 0
+ */
+  __pyx_v_self->height = __pyx_v_height;
+
+  /* "xpra/server/window/motion.pyx":288
+ *         self.width = width
+ *         self.height = height
+ *         self.x = -1             # <<<<<<<<<<<<<<
+ *         self.w = 0
+ *         self.row_hashes = <uint64_t*> xmemalign(height*sizeof(uint64_t))
+ */
+  __pyx_v_self->x = -1;
+
+  /* "xpra/server/window/motion.pyx":289
+ *         self.height = height
+ *         self.x = -1
+ *         self.w = 0             # <<<<<<<<<<<<<<
+ *         self.row_hashes = <uint64_t*> xmemalign(height*sizeof(uint64_t))
+ *         self.old_row_hashes = <uint64_t*> xmemalign(height*sizeof(uint64_t))
+ */
+  __pyx_v_self->w = 0;
+
+  /* "xpra/server/window/motion.pyx":290
+ *         self.x = -1
+ *         self.w = 0
+ *         self.row_hashes = <uint64_t*> xmemalign(height*sizeof(uint64_t))             # <<<<<<<<<<<<<<
+ *         self.old_row_hashes = <uint64_t*> xmemalign(height*sizeof(uint64_t))
+ *         self.row_known = <uint8_t*> xmemalign(height)
+ */
+  __pyx_v_self->row_hashes = ((uint64_t *)xmemalign((__pyx_v_height * (sizeof(uint64_t)))));
+
+  /* "xpra/server/window/motion.pyx":291
+ *         self.w = 0
+ *         self.row_hashes = <uint64_t*> xmemalign(height*sizeof(uint64_t))
+ *         self.old_row_hashes = <uint64_t*> xmemalign(height*sizeof(uint64_t))             # <<<<<<<<<<<<<<
+ *         self.row_known = <uint8_t*> xmemalign(height)
+ *         self.old_row_known = <uint8_t*> xmemalign(height)
+ */
+  __pyx_v_self->old_row_hashes = ((uint64_t *)xmemalign((__pyx_v_height * (sizeof(uint64_t)))));
+
+  /* "xpra/server/window/motion.pyx":292
+ *         self.row_hashes = <uint64_t*> xmemalign(height*sizeof(uint64_t))
+ *         self.old_row_hashes = <uint64_t*> xmemalign(height*sizeof(uint64_t))
+ *         self.row_known = <uint8_t*> xmemalign(height)             # <<<<<<<<<<<<<<
+ *         self.old_row_known = <uint8_t*> xmemalign(height)
+ *         self.col_hashes = <uint64_t*> xmemalign(width*sizeof(uint64_t))
+ */
+  __pyx_v_self->row_known = ((uint8_t *)xmemalign(__pyx_v_height));
+
+  /* "xpra/server/window/motion.pyx":293
+ *         self.old_row_hashes = <uint64_t*> xmemalign(height*sizeof(uint64_t))
+ *         self.row_known = <uint8_t*> xmemalign(height)
+ *         self.old_row_known = <uint8_t*> xmemalign(height)             # <<<<<<<<<<<<<<
+ *         self.col_hashes = <uint64_t*> xmemalign(width*sizeof(uint64_t))
+ *         self.old_col_hashes = <uint64_t*> xmemalign(width*sizeof(uint64_t))
+ */
+  __pyx_v_self->old_row_known = ((uint8_t *)xmemalign(__pyx_v_height));
+
+  /* "xpra/server/window/motion.pyx":294
+ *         self.row_known = <uint8_t*> xmemalign(height)
+ *         self.old_row_known = <uint8_t*> xmemalign(height)
+ *         self.col_hashes = <uint64_t*> xmemalign(width*sizeof(uint64_t))             # <<<<<<<<<<<<<<
+ *         self.old_col_hashes = <uint64_t*> xmemalign(width*sizeof(uint64_t))
+ *         assert self.row_hashes!=NULL and self.old_row_hashes!=NULL and self.row_known!=NULL and self.old_row_known!=NULL, "failed to allocate scroll data"
+ */
+  __pyx_v_self->col_hashes = ((uint64_t *)xmemalign((__pyx_v_width * (sizeof(uint64_t)))));
+
+  /* "xpra/server/window/motion.pyx":295
+ *         self.old_row_known = <uint8_t*> xmemalign(height)
+ *         self.col_hashes = <uint64_t*> xmemalign(width*sizeof(uint64_t))
+ *         self.old_col_hashes = <uint64_t*> xmemalign(width*sizeof(uint64_t))             # <<<<<<<<<<<<<<
+ *         assert self.row_hashes!=NULL and self.old_row_hashes!=NULL and self.row_known!=NULL and self.old_row_known!=NULL, "failed to allocate scroll data"
+ *         assert self.col_hashes!=NULL and self.old_col_hashes!=NULL, "failed to allocate scroll data"
+ */
+  __pyx_v_self->old_col_hashes = ((uint64_t *)xmemalign((__pyx_v_width * (sizeof(uint64_t)))));
+
+  /* "xpra/server/window/motion.pyx":296
+ *         self.col_hashes = <uint64_t*> xmemalign(width*sizeof(uint64_t))
+ *         self.old_col_hashes = <uint64_t*> xmemalign(width*sizeof(uint64_t))
+ *         assert self.row_hashes!=NULL and self.old_row_hashes!=NULL and self.row_known!=NULL and self.old_row_known!=NULL, "failed to allocate scroll data"             # <<<<<<<<<<<<<<
+ *         assert self.col_hashes!=NULL and self.old_col_hashes!=NULL, "failed to allocate scroll data"
+ *         memset(self.row_known, 0, height)
+ */
+  #ifndef CYTHON_WITHOUT_ASSERTIONS
+  if (unlikely(__pyx_assertions_enabled())) {
+    __pyx_t_2 = ((__pyx_v_self->row_hashes != NULL) != 0);
+    if (__pyx_t_2) {
+    } else {
+      __pyx_t_1 = __pyx_t_2;
+      goto __pyx_L5_bool_binop_done;
+    }
+    __pyx_t_2 = ((__pyx_v_self->old_row_hashes != NULL) != 0);
+    if (__pyx_t_2) {
+    } else {
+      __pyx_t_1 = __pyx_t_2;
+      goto __pyx_L5_bool_binop_done;
+    }
+    __pyx_t_2 = ((__pyx_v_self->row_known != NULL) != 0);
+    if (__pyx_t_2) {
+    } else {
+      __pyx_t_1 = __pyx_t_2;
+      goto __pyx_L5_bool_binop_done;
+    }
+    __pyx_t_2 = ((__pyx_v_self->old_row_known != NULL) != 0);
+    __pyx_t_1 = __pyx_t_2;
+    __pyx_L5_bool_binop_done:;
+    if (unlikely(!__pyx_t_1)) {
+      PyErr_SetObject(PyExc_AssertionError, __pyx_kp_s_failed_to_allocate_scroll_data);
+      __PYX_ERR(0, 296, __pyx_L1_error)
+    }
+  }
+  #endif
+
+  /* "xpra/server/window/motion.pyx":297
+ *         self.old_col_hashes = <uint64_t*> xmemalign(width*sizeof(uint64_t))
+ *         assert self.row_hashes!=NULL and self.old_row_hashes!=NULL and self.row_known!=NULL and self.old_row_known!=NULL, "failed to allocate scroll data"
+ *         assert self.col_hashes!=NULL and self.old_col_hashes!=NULL, "failed to allocate scroll data"             # <<<<<<<<<<<<<<
+ *         memset(self.row_known, 0, height)
+ *         memset(self.old_row_known, 0, height)
+ */
+  #ifndef CYTHON_WITHOUT_ASSERTIONS
+  if (unlikely(__pyx_assertions_enabled())) {
+    __pyx_t_2 = ((__pyx_v_self->col_hashes != NULL) != 0);
+    if (__pyx_t_2) {
+    } else {
+      __pyx_t_1 = __pyx_t_2;
+      goto __pyx_L9_bool_binop_done;
+    }
+    __pyx_t_2 = ((__pyx_v_self->old_col_hashes != NULL) != 0);
+    __pyx_t_1 = __pyx_t_2;
+    __pyx_L9_bool_binop_done:;
+    if (unlikely(!__pyx_t_1)) {
+      PyErr_SetObject(PyExc_AssertionError, __pyx_kp_s_failed_to_allocate_scroll_data);
+      __PYX_ERR(0, 297, __pyx_L1_error)
+    }
+  }
+  #endif
+
+  /* "xpra/server/window/motion.pyx":298
+ *         assert self.row_hashes!=NULL and self.old_row_hashes!=NULL and self.row_known!=NULL and self.old_row_known!=NULL, "failed to allocate scroll data"
+ *         assert self.col_hashes!=NULL and self.old_col_hashes!=NULL, "failed to allocate scroll data"
+ *         memset(self.row_known, 0, height)             # <<<<<<<<<<<<<<
+ *         memset(self.old_row_known, 0, height)
+ *         memset(self.col_geometry, 0, sizeof(self.col_geometry))
+ */
+  (void)(memset(__pyx_v_self->row_known, 0, __pyx_v_height));
+
+  /* "xpra/server/window/motion.pyx":299
+ *         assert self.col_hashes!=NULL and self.old_col_hashes!=NULL, "failed to allocate scroll data"
+ *         memset(self.row_known, 0, height)
+ *         memset(self.old_row_known, 0, height)             # <<<<<<<<<<<<<<
+ *         memset(self.col_geometry, 0, sizeof(self.col_geometry))
+ *         memset(self.old_col_geometry, 0, sizeof(self.old_col_geometry))
+ */
+  (void)(memset(__pyx_v_self->old_row_known, 0, __pyx_v_height));
+
+  /* "xpra/server/window/motion.pyx":300
+ *         memset(self.row_known, 0, height)
+ *         memset(self.old_row_known, 0, height)
+ *         memset(self.col_geometry, 0, sizeof(self.col_geometry))             # <<<<<<<<<<<<<<
+ *         memset(self.old_col_geometry, 0, sizeof(self.old_col_geometry))
+ * 
+ */
+  (void)(memset(__pyx_v_self->col_geometry, 0, (sizeof(__pyx_v_self->col_geometry))));
+
+  /* "xpra/server/window/motion.pyx":301
+ *         memset(self.old_row_known, 0, height)
+ *         memset(self.col_geometry, 0, sizeof(self.col_geometry))
+ *         memset(self.old_col_geometry, 0, sizeof(self.old_col_geometry))             # <<<<<<<<<<<<<<
+ * 
+ *     def __dealloc__(self):
+ */
+  (void)(memset(__pyx_v_self->old_col_geometry, 0, (sizeof(__pyx_v_self->old_col_geometry))));
+
+  /* "xpra/server/window/motion.pyx":284
+ *     cdef unsigned long rows_hashed
+ * 
+ *     def __cinit__(self, unsigned int width, unsigned int height):             # <<<<<<<<<<<<<<
+ *         assert width>0 and height>0
+ *         self.width = width
+ */
+
+  /* function exit code */
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("xpra.server.window.motion.ScrollData.__cinit__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "xpra/server/window/motion.pyx":303
+ *         memset(self.old_col_geometry, 0, sizeof(self.old_col_geometry))
+ * 
+ *     def __dealloc__(self):             # <<<<<<<<<<<<<<
+ *         free(self.row_hashes)
+ *         free(self.old_row_hashes)
+ */
+
+/* Python wrapper */
+static void __pyx_pw_4xpra_6server_6window_6motion_10ScrollData_3__dealloc__(PyObject *__pyx_v_self); /*proto*/
+static void __pyx_pw_4xpra_6server_6window_6motion_10ScrollData_3__dealloc__(PyObject *__pyx_v_self) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__dealloc__ (wrapper)", 0);
+  __pyx_pf_4xpra_6server_6window_6motion_10ScrollData_2__dealloc__(((struct __pyx_obj_4xpra_6server_6window_6motion_ScrollData *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+}
+
+static void __pyx_pf_4xpra_6server_6window_6motion_10ScrollData_2__dealloc__(struct __pyx_obj_4xpra_6server_6window_6motion_ScrollData *__pyx_v_self) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__dealloc__", 0);
+
+  /* "xpra/server/window/motion.pyx":304
+ * 
+ *     def __dealloc__(self):
+ *         free(self.row_hashes)             # <<<<<<<<<<<<<<
+ *         free(self.old_row_hashes)
+ *         free(self.row_known)
+ */
+  free(__pyx_v_self->row_hashes);
+
+  /* "xpra/server/window/motion.pyx":305
+ *     def __dealloc__(self):
+ *         free(self.row_hashes)
+ *         free(self.old_row_hashes)             # <<<<<<<<<<<<<<
+ *         free(self.row_known)
+ *         free(self.old_row_known)
+ */
+  free(__pyx_v_self->old_row_hashes);
+
+  /* "xpra/server/window/motion.pyx":306
+ *         free(self.row_hashes)
+ *         free(self.old_row_hashes)
+ *         free(self.row_known)             # <<<<<<<<<<<<<<
+ *         free(self.old_row_known)
+ *         free(self.col_hashes)
+ */
+  free(__pyx_v_self->row_known);
+
+  /* "xpra/server/window/motion.pyx":307
+ *         free(self.old_row_hashes)
+ *         free(self.row_known)
+ *         free(self.old_row_known)             # <<<<<<<<<<<<<<
+ *         free(self.col_hashes)
+ *         free(self.old_col_hashes)
+ */
+  free(__pyx_v_self->old_row_known);
+
+  /* "xpra/server/window/motion.pyx":308
+ *         free(self.row_known)
+ *         free(self.old_row_known)
+ *         free(self.col_hashes)             # <<<<<<<<<<<<<<
+ *         free(self.old_col_hashes)
+ * 
+ */
+  free(__pyx_v_self->col_hashes);
+
+  /* "xpra/server/window/motion.pyx":309
+ *         free(self.old_row_known)
+ *         free(self.col_hashes)
+ *         free(self.old_col_hashes)             # <<<<<<<<<<<<<<
+ * 
+ *     def __repr__(self):
+ */
+  free(__pyx_v_self->old_col_hashes);
+
+  /* "xpra/server/window/motion.pyx":303
+ *         memset(self.old_col_geometry, 0, sizeof(self.old_col_geometry))
+ * 
+ *     def __dealloc__(self):             # <<<<<<<<<<<<<<
+ *         free(self.row_hashes)
+ *         free(self.old_row_hashes)
+ */
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+}
+
+/* "xpra/server/window/motion.pyx":311
+ *         free(self.old_col_hashes)
+ * 
+ *     def __repr__(self):             # <<<<<<<<<<<<<<
+ *         return "ScrollData(%ix%i)" % (self.width, self.height)
+ * 
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_4xpra_6server_6window_6motion_10ScrollData_5__repr__(PyObject *__pyx_v_self); /*proto*/
+static PyObject *__pyx_pw_4xpra_6server_6window_6motion_10ScrollData_5__repr__(PyObject *__pyx_v_self) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__repr__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_4xpra_6server_6window_6motion_10ScrollData_4__repr__(((struct __pyx_obj_4xpra_6server_6window_6motion_ScrollData *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_4xpra_6server_6window_6motion_10ScrollData_4__repr__(struct __pyx_obj_4xpra_6server_6window_6motion_ScrollData *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__repr__", 0);
+
+  /* "xpra/server/window/motion.pyx":312
+ * 
+ *     def __repr__(self):
+ *         return "ScrollData(%ix%i)" % (self.width, self.height)             # <<<<<<<<<<<<<<
+ * 
+ *     def get_info(self):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __Pyx_PyInt_From_unsigned_int(__pyx_v_self->width); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 312, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = __Pyx_PyInt_From_unsigned_int(__pyx_v_self->height); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 312, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_3 = PyTuple_New(2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 312, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_GIVEREF(__pyx_t_1);
+  PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_t_1);
+  __Pyx_GIVEREF(__pyx_t_2);
+  PyTuple_SET_ITEM(__pyx_t_3, 1, __pyx_t_2);
+  __pyx_t_1 = 0;
+  __pyx_t_2 = 0;
+  __pyx_t_2 = __Pyx_PyString_Format(__pyx_kp_s_ScrollData_ix_i, __pyx_t_3); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 312, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_r = __pyx_t_2;
+  __pyx_t_2 = 0;
+  goto __pyx_L0;
+
+  /* "xpra/server/window/motion.pyx":311
+ *         free(self.old_col_hashes)
+ * 
+ *     def __repr__(self):             # <<<<<<<<<<<<<<
+ *         return "ScrollData(%ix%i)" % (self.width, self.height)
+ * 
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_AddTraceback("xpra.server.window.motion.ScrollData.__repr__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "xpra/server/window/motion.pyx":314
+ *         return "ScrollData(%ix%i)" % (self.width, self.height)
+ * 
+ *     def get_info(self):             # <<<<<<<<<<<<<<
+ *         return {
+ *                 "size"          : (self.width, self.height),
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_4xpra_6server_6window_6motion_10ScrollData_7get_info(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static PyObject *__pyx_pw_4xpra_6server_6window_6motion_10ScrollData_7get_info(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("get_info (wrapper)", 0);
+  __pyx_r = __pyx_pf_4xpra_6server_6window_6motion_10ScrollData_6get_info(((struct __pyx_obj_4xpra_6server_6window_6motion_ScrollData *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_4xpra_6server_6window_6motion_10ScrollData_6get_info(struct __pyx_obj_4xpra_6server_6window_6motion_ScrollData *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("get_info", 0);
+
+  /* "xpra/server/window/motion.pyx":315
+ * 
+ *     def get_info(self):
+ *         return {             # <<<<<<<<<<<<<<
+ *                 "size"          : (self.width, self.height),
+ *                 "updates"       : self.updates,
+ */
+  __Pyx_XDECREF(__pyx_r);
+
+  /* "xpra/server/window/motion.pyx":316
+ *     def get_info(self):
+ *         return {
+ *                 "size"          : (self.width, self.height),             # <<<<<<<<<<<<<<
+ *                 "updates"       : self.updates,
+ *                 "rows-hashed"   : self.rows_hashed,
+ */
+  __pyx_t_1 = __Pyx_PyDict_NewPresized(3); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 316, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = __Pyx_PyInt_From_unsigned_int(__pyx_v_self->width); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 316, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_3 = __Pyx_PyInt_From_unsigned_int(__pyx_v_self->height); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 316, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_4 = PyTuple_New(2); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 316, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_GIVEREF(__pyx_t_2);
+  PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_t_2);
+  __Pyx_GIVEREF(__pyx_t_3);
+  PyTuple_SET_ITEM(__pyx_t_4, 1, __pyx_t_3);
+  __pyx_t_2 = 0;
+  __pyx_t_3 = 0;
+  if (PyDict_SetItem(__pyx_t_1, __pyx_n_s_size, __pyx_t_4) < 0) __PYX_ERR(0, 316, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+  /* "xpra/server/window/motion.pyx":317
+ *         return {
+ *                 "size"          : (self.width, self.height),
+ *                 "updates"       : self.updates,             # <<<<<<<<<<<<<<
+ *                 "rows-hashed"   : self.rows_hashed,
+ *                 }
+ */
+  __pyx_t_4 = __Pyx_PyInt_From_unsigned_long(__pyx_v_self->updates); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 317, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  if (PyDict_SetItem(__pyx_t_1, __pyx_n_s_updates, __pyx_t_4) < 0) __PYX_ERR(0, 316, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+  /* "xpra/server/window/motion.pyx":318
+ *                 "size"          : (self.width, self.height),
+ *                 "updates"       : self.updates,
+ *                 "rows-hashed"   : self.rows_hashed,             # <<<<<<<<<<<<<<
+ *                 }
+ * 
+ */
+  __pyx_t_4 = __Pyx_PyInt_From_unsigned_long(__pyx_v_self->rows_hashed); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 318, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  if (PyDict_SetItem(__pyx_t_1, __pyx_kp_s_rows_hashed, __pyx_t_4) < 0) __PYX_ERR(0, 316, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* "xpra/server/window/motion.pyx":314
+ *         return "ScrollData(%ix%i)" % (self.width, self.height)
+ * 
+ *     def get_info(self):             # <<<<<<<<<<<<<<
+ *         return {
+ *                 "size"          : (self.width, self.height),
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_AddTraceback("xpra.server.window.motion.ScrollData.get_info", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "xpra/server/window/motion.pyx":321
+ *                 }
+ * 
+ *     def invalidate(self, int x, int y, int width, int height):             # <<<<<<<<<<<<<<
+ *         """
+ *             Forget the hash values for this region,
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_4xpra_6server_6window_6motion_10ScrollData_9invalidate(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_4xpra_6server_6window_6motion_10ScrollData_8invalidate[] = "\n            Forget the hash values for this region,\n            which is being sent to the client without updating the hashes.\n        ";
+static PyObject *__pyx_pw_4xpra_6server_6window_6motion_10ScrollData_9invalidate(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  int __pyx_v_x;
+  int __pyx_v_y;
+  int __pyx_v_width;
+  int __pyx_v_height;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("invalidate (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_x,&__pyx_n_s_y,&__pyx_n_s_width,&__pyx_n_s_height,0};
+    PyObject* values[4] = {0,0,0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+        CYTHON_FALLTHROUGH;
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_x)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_y)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("invalidate", 1, 4, 4, 1); __PYX_ERR(0, 321, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  2:
+        if (likely((values[2] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_width)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("invalidate", 1, 4, 4, 2); __PYX_ERR(0, 321, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  3:
+        if (likely((values[3] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_height)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("invalidate", 1, 4, 4, 3); __PYX_ERR(0, 321, __pyx_L3_error)
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "invalidate") < 0)) __PYX_ERR(0, 321, __pyx_L3_error)
+      }
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 4) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+      values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+      values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+    }
+    __pyx_v_x = __Pyx_PyInt_As_int(values[0]); if (unlikely((__pyx_v_x == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 321, __pyx_L3_error)
+    __pyx_v_y = __Pyx_PyInt_As_int(values[1]); if (unlikely((__pyx_v_y == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 321, __pyx_L3_error)
+    __pyx_v_width = __Pyx_PyInt_As_int(values[2]); if (unlikely((__pyx_v_width == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 321, __pyx_L3_error)
+    __pyx_v_height = __Pyx_PyInt_As_int(values[3]); if (unlikely((__pyx_v_height == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 321, __pyx_L3_error)
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("invalidate", 1, 4, 4, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 321, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("xpra.server.window.motion.ScrollData.invalidate", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_4xpra_6server_6window_6motion_10ScrollData_8invalidate(((struct __pyx_obj_4xpra_6server_6window_6motion_ScrollData *)__pyx_v_self), __pyx_v_x, __pyx_v_y, __pyx_v_width, __pyx_v_height);
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_4xpra_6server_6window_6motion_10ScrollData_8invalidate(struct __pyx_obj_4xpra_6server_6window_6motion_ScrollData *__pyx_v_self, int __pyx_v_x, int __pyx_v_y, int __pyx_v_width, int __pyx_v_height) {
+  int __pyx_v_start;
+  int __pyx_v_end;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  long __pyx_t_2;
+  long __pyx_t_3;
+  int __pyx_t_4;
+  int __pyx_t_5;
+  int __pyx_t_6;
+  int __pyx_t_7;
+  __Pyx_RefNannySetupContext("invalidate", 0);
+
+  /* "xpra/server/window/motion.pyx":326
+ *             which is being sent to the client without updating the hashes.
+ *         """
+ *         cdef int start = max(0, y)             # <<<<<<<<<<<<<<
+ *         cdef int end = min(<int> self.height, y+height)
+ *         if end<=start or x>=self.x+<int> self.w or x+width<=self.x:
+ */
+  __pyx_t_1 = __pyx_v_y;
+  __pyx_t_2 = 0;
+  if (((__pyx_t_1 > __pyx_t_2) != 0)) {
+    __pyx_t_3 = __pyx_t_1;
+  } else {
+    __pyx_t_3 = __pyx_t_2;
+  }
+  __pyx_v_start = __pyx_t_3;
+
+  /* "xpra/server/window/motion.pyx":327
+ *         """
+ *         cdef int start = max(0, y)
+ *         cdef int end = min(<int> self.height, y+height)             # <<<<<<<<<<<<<<
+ *         if end<=start or x>=self.x+<int> self.w or x+width<=self.x:
+ *             return
+ */
+  __pyx_t_1 = (__pyx_v_y + __pyx_v_height);
+  __pyx_t_4 = ((int)__pyx_v_self->height);
+  if (((__pyx_t_1 < __pyx_t_4) != 0)) {
+    __pyx_t_5 = __pyx_t_1;
+  } else {
+    __pyx_t_5 = __pyx_t_4;
+  }
+  __pyx_v_end = __pyx_t_5;
+
+  /* "xpra/server/window/motion.pyx":328
+ *         cdef int start = max(0, y)
+ *         cdef int end = min(<int> self.height, y+height)
+ *         if end<=start or x>=self.x+<int> self.w or x+width<=self.x:             # <<<<<<<<<<<<<<
+ *             return
+ *         memset(self.row_known+start, 0, end-start)
+ */
+  __pyx_t_7 = ((__pyx_v_end <= __pyx_v_start) != 0);
+  if (!__pyx_t_7) {
+  } else {
+    __pyx_t_6 = __pyx_t_7;
+    goto __pyx_L4_bool_binop_done;
+  }
+  __pyx_t_7 = ((__pyx_v_x >= (__pyx_v_self->x + ((int)__pyx_v_self->w))) != 0);
+  if (!__pyx_t_7) {
+  } else {
+    __pyx_t_6 = __pyx_t_7;
+    goto __pyx_L4_bool_binop_done;
+  }
+  __pyx_t_7 = (((__pyx_v_x + __pyx_v_width) <= __pyx_v_self->x) != 0);
+  __pyx_t_6 = __pyx_t_7;
+  __pyx_L4_bool_binop_done:;
+  if (__pyx_t_6) {
+
+    /* "xpra/server/window/motion.pyx":329
+ *         cdef int end = min(<int> self.height, y+height)
+ *         if end<=start or x>=self.x+<int> self.w or x+width<=self.x:
+ *             return             # <<<<<<<<<<<<<<
+ *         memset(self.row_known+start, 0, end-start)
+ *         memset(self.col_geometry, 0, sizeof(self.col_geometry))
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+    goto __pyx_L0;
+
+    /* "xpra/server/window/motion.pyx":328
+ *         cdef int start = max(0, y)
+ *         cdef int end = min(<int> self.height, y+height)
+ *         if end<=start or x>=self.x+<int> self.w or x+width<=self.x:             # <<<<<<<<<<<<<<
+ *             return
+ *         memset(self.row_known+start, 0, end-start)
+ */
+  }
+
+  /* "xpra/server/window/motion.pyx":330
+ *         if end<=start or x>=self.x+<int> self.w or x+width<=self.x:
+ *             return
+ *         memset(self.row_known+start, 0, end-start)             # <<<<<<<<<<<<<<
+ *         memset(self.col_geometry, 0, sizeof(self.col_geometry))
+ * 
+ */
+  (void)(memset((__pyx_v_self->row_known + __pyx_v_start), 0, (__pyx_v_end - __pyx_v_start)));
+
+  /* "xpra/server/window/motion.pyx":331
+ *             return
+ *         memset(self.row_known+start, 0, end-start)
+ *         memset(self.col_geometry, 0, sizeof(self.col_geometry))             # <<<<<<<<<<<<<<
+ * 
+ *     def update(self, pixels, int x, int y, unsigned int width, unsigned int height, unsigned int rowstride, unsigned char bpp=4):
+ */
+  (void)(memset(__pyx_v_self->col_geometry, 0, (sizeof(__pyx_v_self->col_geometry))));
+
+  /* "xpra/server/window/motion.pyx":321
+ *                 }
+ * 
+ *     def invalidate(self, int x, int y, int width, int height):             # <<<<<<<<<<<<<<
+ *         """
+ *             Forget the hash values for this region,
+ */
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "xpra/server/window/motion.pyx":333
+ *         memset(self.col_geometry, 0, sizeof(self.col_geometry))
+ * 
+ *     def update(self, pixels, int x, int y, unsigned int width, unsigned int height, unsigned int rowstride, unsigned char bpp=4):             # <<<<<<<<<<<<<<
+ *         """
+ *             Hashes the rows of the region given, in window coordinates,
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_4xpra_6server_6window_6motion_10ScrollData_11update(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_4xpra_6server_6window_6motion_10ScrollData_10update[] = "\n            Hashes the rows of the region given, in window coordinates,\n            the other rows keep their previous hash value.\n        ";
+static PyObject *__pyx_pw_4xpra_6server_6window_6motion_10ScrollData_11update(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_pixels = 0;
+  int __pyx_v_x;
+  int __pyx_v_y;
+  unsigned int __pyx_v_width;
+  unsigned int __pyx_v_height;
+  unsigned int __pyx_v_rowstride;
+  unsigned char __pyx_v_bpp;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("update (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_pixels,&__pyx_n_s_x,&__pyx_n_s_y,&__pyx_n_s_width,&__pyx_n_s_height,&__pyx_n_s_rowstride,&__pyx_n_s_bpp,0};
+    PyObject* values[7] = {0,0,0,0,0,0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  7: values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
+        CYTHON_FALLTHROUGH;
+        case  6: values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
+        CYTHON_FALLTHROUGH;
+        case  5: values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+        CYTHON_FALLTHROUGH;
+        case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+        CYTHON_FALLTHROUGH;
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_pixels)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_x)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("update", 0, 6, 7, 1); __PYX_ERR(0, 333, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  2:
+        if (likely((values[2] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_y)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("update", 0, 6, 7, 2); __PYX_ERR(0, 333, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  3:
+        if (likely((values[3] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_width)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("update", 0, 6, 7, 3); __PYX_ERR(0, 333, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  4:
+        if (likely((values[4] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_height)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("update", 0, 6, 7, 4); __PYX_ERR(0, 333, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  5:
+        if (likely((values[5] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_rowstride)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("update", 0, 6, 7, 5); __PYX_ERR(0, 333, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  6:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_bpp);
+          if (value) { values[6] = value; kw_args--; }
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "update") < 0)) __PYX_ERR(0, 333, __pyx_L3_error)
+      }
+    } else {
+      switch (PyTuple_GET_SIZE(__pyx_args)) {
+        case  7: values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
+        CYTHON_FALLTHROUGH;
+        case  6: values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
+        values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+        values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+        values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+    }
+    __pyx_v_pixels = values[0];
+    __pyx_v_x = __Pyx_PyInt_As_int(values[1]); if (unlikely((__pyx_v_x == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 333, __pyx_L3_error)
+    __pyx_v_y = __Pyx_PyInt_As_int(values[2]); if (unlikely((__pyx_v_y == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 333, __pyx_L3_error)
+    __pyx_v_width = __Pyx_PyInt_As_unsigned_int(values[3]); if (unlikely((__pyx_v_width == (unsigned int)-1) && PyErr_Occurred())) __PYX_ERR(0, 333, __pyx_L3_error)
+    __pyx_v_height = __Pyx_PyInt_As_unsigned_int(values[4]); if (unlikely((__pyx_v_height == (unsigned int)-1) && PyErr_Occurred())) __PYX_ERR(0, 333, __pyx_L3_error)
+    __pyx_v_rowstride = __Pyx_PyInt_As_unsigned_int(values[5]); if (unlikely((__pyx_v_rowstride == (unsigned int)-1) && PyErr_Occurred())) __PYX_ERR(0, 333, __pyx_L3_error)
+    if (values[6]) {
+      __pyx_v_bpp = __Pyx_PyInt_As_unsigned_char(values[6]); if (unlikely((__pyx_v_bpp == (unsigned char)-1) && PyErr_Occurred())) __PYX_ERR(0, 333, __pyx_L3_error)
+    } else {
+      __pyx_v_bpp = ((unsigned char)4);
+    }
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("update", 0, 6, 7, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 333, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("xpra.server.window.motion.ScrollData.update", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_4xpra_6server_6window_6motion_10ScrollData_10update(((struct __pyx_obj_4xpra_6server_6window_6motion_ScrollData *)__pyx_v_self), __pyx_v_pixels, __pyx_v_x, __pyx_v_y, __pyx_v_width, __pyx_v_height, __pyx_v_rowstride, __pyx_v_bpp);
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_4xpra_6server_6window_6motion_10ScrollData_10update(struct __pyx_obj_4xpra_6server_6window_6motion_ScrollData *__pyx_v_self, PyObject *__pyx_v_pixels, int __pyx_v_x, int __pyx_v_y, unsigned int __pyx_v_width, unsigned int __pyx_v_height, unsigned int __pyx_v_rowstride, unsigned char __pyx_v_bpp) {
+  uint8_t *__pyx_v_buf;
+  Py_ssize_t __pyx_v_buf_len;
+  uint64_t *__pyx_v_tmp;
+  size_t __pyx_v_row_len;
+  uint64_t *__pyx_v_rows;
+  uint8_t *__pyx_v_row;
+  unsigned int __pyx_v_i;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  PyObject *__pyx_t_7 = NULL;
+  uint64_t *__pyx_t_8;
+  unsigned int __pyx_t_9;
+  unsigned int __pyx_t_10;
+  unsigned int __pyx_t_11;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("update", 0);
+
+  /* "xpra/server/window/motion.pyx":338
+ *             the other rows keep their previous hash value.
+ *         """
+ *         assert x>=0 and y>=0 and width>0 and height>0             # <<<<<<<<<<<<<<
+ *         assert x+width<=self.width and y+height<=self.height, "region %s does not fit in %ix%i" % ((x, y, width, height), self.width, self.height)
+ *         cdef uint8_t *buf = NULL
+ */
+  #ifndef CYTHON_WITHOUT_ASSERTIONS
+  if (unlikely(__pyx_assertions_enabled())) {
+    __pyx_t_2 = ((__pyx_v_x >= 0) != 0);
+    if (__pyx_t_2) {
+    } else {
+      __pyx_t_1 = __pyx_t_2;
+      goto __pyx_L3_bool_binop_done;
+    }
+    __pyx_t_2 = ((__pyx_v_y >= 0) != 0);
+    if (__pyx_t_2) {
+    } else {
+      __pyx_t_1 = __pyx_t_2;
+      goto __pyx_L3_bool_binop_done;
+    }
+    __pyx_t_2 = ((__pyx_v_width > 0) != 0);
+    if (__pyx_t_2) {
+    } else {
+      __pyx_t_1 = __pyx_t_2;
+      goto __pyx_L3_bool_binop_done;
+    }
+    __pyx_t_2 = ((__pyx_v_height > 0) != 0);
+    __pyx_t_1 = __pyx_t_2;
+    __pyx_L3_bool_binop_done:;
+    if (unlikely(!__pyx_t_1)) {
+      PyErr_SetNone(PyExc_AssertionError);
+      __PYX_ERR(0, 338, __pyx_L1_error)
+    }
+  }
+  #endif
+
+  /* "xpra/server/window/motion.pyx":339
+ *         """
+ *         assert x>=0 and y>=0 and width>0 and height>0
+ *         assert x+width<=self.width and y+height<=self.height, "region %s does not fit in %ix%i" % ((x, y, width, height), self.width, self.height)             # <<<<<<<<<<<<<<
+ *         cdef uint8_t *buf = NULL
+ *         cdef Py_ssize_t buf_len = 0
+ */
+  #ifndef CYTHON_WITHOUT_ASSERTIONS
+  if (unlikely(__pyx_assertions_enabled())) {
+    __pyx_t_2 = (((__pyx_v_x + __pyx_v_width) <= __pyx_v_self->width) != 0);
+    if (__pyx_t_2) {
+    } else {
+      __pyx_t_1 = __pyx_t_2;
+      goto __pyx_L7_bool_binop_done;
+    }
+    __pyx_t_2 = (((__pyx_v_y + __pyx_v_height) <= __pyx_v_self->height) != 0);
+    __pyx_t_1 = __pyx_t_2;
+    __pyx_L7_bool_binop_done:;
+    if (unlikely(!__pyx_t_1)) {
+      __pyx_t_3 = __Pyx_PyInt_From_int(__pyx_v_x); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 339, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_3);
+      __pyx_t_4 = __Pyx_PyInt_From_int(__pyx_v_y); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 339, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_4);
+      __pyx_t_5 = __Pyx_PyInt_From_unsigned_int(__pyx_v_width); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 339, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_5);
+      __pyx_t_6 = __Pyx_PyInt_From_unsigned_int(__pyx_v_height); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 339, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_6);
+      __pyx_t_7 = PyTuple_New(4); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 339, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_7);
+      __Pyx_GIVEREF(__pyx_t_3);
+      PyTuple_SET_ITEM(__pyx_t_7, 0, __pyx_t_3);
+      __Pyx_GIVEREF(__pyx_t_4);
+      PyTuple_SET_ITEM(__pyx_t_7, 1, __pyx_t_4);
+      __Pyx_GIVEREF(__pyx_t_5);
+      PyTuple_SET_ITEM(__pyx_t_7, 2, __pyx_t_5);
+      __Pyx_GIVEREF(__pyx_t_6);
+      PyTuple_SET_ITEM(__pyx_t_7, 3, __pyx_t_6);
+      __pyx_t_3 = 0;
+      __pyx_t_4 = 0;
+      __pyx_t_5 = 0;
+      __pyx_t_6 = 0;
+      __pyx_t_6 = __Pyx_PyInt_From_unsigned_int(__pyx_v_self->width); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 339, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_6);
+      __pyx_t_5 = __Pyx_PyInt_From_unsigned_int(__pyx_v_self->height); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 339, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_5);
+      __pyx_t_4 = PyTuple_New(3); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 339, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_4);
+      __Pyx_GIVEREF(__pyx_t_7);
+      PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_t_7);
+      __Pyx_GIVEREF(__pyx_t_6);
+      PyTuple_SET_ITEM(__pyx_t_4, 1, __pyx_t_6);
+      __Pyx_GIVEREF(__pyx_t_5);
+      PyTuple_SET_ITEM(__pyx_t_4, 2, __pyx_t_5);
+      __pyx_t_7 = 0;
+      __pyx_t_6 = 0;
+      __pyx_t_5 = 0;
+      __pyx_t_5 = __Pyx_PyString_Format(__pyx_kp_s_region_s_does_not_fit_in_ix_i, __pyx_t_4); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 339, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_5);
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+      PyErr_SetObject(PyExc_AssertionError, __pyx_t_5);
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      __PYX_ERR(0, 339, __pyx_L1_error)
+    }
+  }
+  #endif
+
+  /* "xpra/server/window/motion.pyx":340
+ *         assert x>=0 and y>=0 and width>0 and height>0
+ *         assert x+width<=self.width and y+height<=self.height, "region %s does not fit in %ix%i" % ((x, y, width, height), self.width, self.height)
+ *         cdef uint8_t *buf = NULL             # <<<<<<<<<<<<<<
+ *         cdef Py_ssize_t buf_len = 0
+ *         assert object_as_buffer(pixels, <const void**> &buf, &buf_len)==0
+ */
+  __pyx_v_buf = NULL;
+
+  /* "xpra/server/window/motion.pyx":341
+ *         assert x+width<=self.width and y+height<=self.height, "region %s does not fit in %ix%i" % ((x, y, width, height), self.width, self.height)
+ *         cdef uint8_t *buf = NULL
+ *         cdef Py_ssize_t buf_len = 0             # <<<<<<<<<<<<<<
+ *         assert object_as_buffer(pixels, <const void**> &buf, &buf_len)==0
+ *         assert buf_len>=0 and (<unsigned int> buf_len)>=rowstride*(height-1)+width*bpp, "buffer is too small for %ix%i" % (rowstride, height)
+ */
+  __pyx_v_buf_len = 0;
+
+  /* "xpra/server/window/motion.pyx":342
+ *         cdef uint8_t *buf = NULL
+ *         cdef Py_ssize_t buf_len = 0
+ *         assert object_as_buffer(pixels, <const void**> &buf, &buf_len)==0             # <<<<<<<<<<<<<<
+ *         assert buf_len>=0 and (<unsigned int> buf_len)>=rowstride*(height-1)+width*bpp, "buffer is too small for %ix%i" % (rowstride, height)
+ *         if x!=self.x or width!=self.w:
+ */
+  #ifndef CYTHON_WITHOUT_ASSERTIONS
+  if (unlikely(__pyx_assertions_enabled())) {
+    if (unlikely(!((object_as_buffer(__pyx_v_pixels, ((void const **)(&__pyx_v_buf)), (&__pyx_v_buf_len)) == 0) != 0))) {
+      PyErr_SetNone(PyExc_AssertionError);
+      __PYX_ERR(0, 342, __pyx_L1_error)
+    }
+  }
+  #endif
+
+  /* "xpra/server/window/motion.pyx":343
+ *         cdef Py_ssize_t buf_len = 0
+ *         assert object_as_buffer(pixels, <const void**> &buf, &buf_len)==0
+ *         assert buf_len>=0 and (<unsigned int> buf_len)>=rowstride*(height-1)+width*bpp, "buffer is too small for %ix%i" % (rowstride, height)             # <<<<<<<<<<<<<<
+ *         if x!=self.x or width!=self.w:
+ *             #the hashes of the other rows cover different columns, we can't use them:
+ */
+  #ifndef CYTHON_WITHOUT_ASSERTIONS
+  if (unlikely(__pyx_assertions_enabled())) {
+    __pyx_t_2 = ((__pyx_v_buf_len >= 0) != 0);
+    if (__pyx_t_2) {
+    } else {
+      __pyx_t_1 = __pyx_t_2;
+      goto __pyx_L9_bool_binop_done;
+    }
+    __pyx_t_2 = ((((unsigned int)__pyx_v_buf_len) >= ((__pyx_v_rowstride * (__pyx_v_height - 1)) + (__pyx_v_width * __pyx_v_bpp))) != 0);
+    __pyx_t_1 = __pyx_t_2;
+    __pyx_L9_bool_binop_done:;
+    if (unlikely(!__pyx_t_1)) {
+      __pyx_t_5 = __Pyx_PyInt_From_unsigned_int(__pyx_v_rowstride); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 343, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_5);
+      __pyx_t_4 = __Pyx_PyInt_From_unsigned_int(__pyx_v_height); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 343, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_4);
+      __pyx_t_6 = PyTuple_New(2); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 343, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_6);
+      __Pyx_GIVEREF(__pyx_t_5);
+      PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_t_5);
+      __Pyx_GIVEREF(__pyx_t_4);
+      PyTuple_SET_ITEM(__pyx_t_6, 1, __pyx_t_4);
+      __pyx_t_5 = 0;
+      __pyx_t_4 = 0;
+      __pyx_t_4 = __Pyx_PyString_Format(__pyx_kp_s_buffer_is_too_small_for_ix_i, __pyx_t_6); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 343, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_4);
+      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+      PyErr_SetObject(PyExc_AssertionError, __pyx_t_4);
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+      __PYX_ERR(0, 343, __pyx_L1_error)
+    }
+  }
+  #endif
+
+  /* "xpra/server/window/motion.pyx":344
+ *         assert object_as_buffer(pixels, <const void**> &buf, &buf_len)==0
+ *         assert buf_len>=0 and (<unsigned int> buf_len)>=rowstride*(height-1)+width*bpp, "buffer is too small for %ix%i" % (rowstride, height)
+ *         if x!=self.x or width!=self.w:             # <<<<<<<<<<<<<<
+ *             #the hashes of the other rows cover different columns, we can't use them:
+ *             memset(self.row_known, 0, self.height)
+ */
+  __pyx_t_2 = ((__pyx_v_x != __pyx_v_self->x) != 0);
+  if (!__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L12_bool_binop_done;
+  }
+  __pyx_t_2 = ((__pyx_v_width != __pyx_v_self->w) != 0);
+  __pyx_t_1 = __pyx_t_2;
+  __pyx_L12_bool_binop_done:;
+  if (__pyx_t_1) {
+
+    /* "xpra/server/window/motion.pyx":346
+ *         if x!=self.x or width!=self.w:
+ *             #the hashes of the other rows cover different columns, we can't use them:
+ *             memset(self.row_known, 0, self.height)             # <<<<<<<<<<<<<<
+ *             self.x = x
+ *             self.w = width
+ */
+    (void)(memset(__pyx_v_self->row_known, 0, __pyx_v_self->height));
+
+    /* "xpra/server/window/motion.pyx":347
+ *             #the hashes of the other rows cover different columns, we can't use them:
+ *             memset(self.row_known, 0, self.height)
+ *             self.x = x             # <<<<<<<<<<<<<<
+ *             self.w = width
+ *         memcpy(self.old_row_hashes, self.row_hashes, self.height*sizeof(uint64_t))
+ */
+    __pyx_v_self->x = __pyx_v_x;
+
+    /* "xpra/server/window/motion.pyx":348
+ *             memset(self.row_known, 0, self.height)
+ *             self.x = x
+ *             self.w = width             # <<<<<<<<<<<<<<
+ *         memcpy(self.old_row_hashes, self.row_hashes, self.height*sizeof(uint64_t))
+ *         memcpy(self.old_row_known, self.row_known, self.height)
+ */
+    __pyx_v_self->w = __pyx_v_width;
+
+    /* "xpra/server/window/motion.pyx":344
+ *         assert object_as_buffer(pixels, <const void**> &buf, &buf_len)==0
+ *         assert buf_len>=0 and (<unsigned int> buf_len)>=rowstride*(height-1)+width*bpp, "buffer is too small for %ix%i" % (rowstride, height)
+ *         if x!=self.x or width!=self.w:             # <<<<<<<<<<<<<<
+ *             #the hashes of the other rows cover different columns, we can't use them:
+ *             memset(self.row_known, 0, self.height)
+ */
+  }
+
+  /* "xpra/server/window/motion.pyx":349
+ *             self.x = x
+ *             self.w = width
+ *         memcpy(self.old_row_hashes, self.row_hashes, self.height*sizeof(uint64_t))             # <<<<<<<<<<<<<<
+ *         memcpy(self.old_row_known, self.row_known, self.height)
+ *         #swap the column hashes:
+ */
+  (void)(memcpy(__pyx_v_self->old_row_hashes, __pyx_v_self->row_hashes, (__pyx_v_self->height * (sizeof(uint64_t)))));
+
+  /* "xpra/server/window/motion.pyx":350
+ *             self.w = width
+ *         memcpy(self.old_row_hashes, self.row_hashes, self.height*sizeof(uint64_t))
+ *         memcpy(self.old_row_known, self.row_known, self.height)             # <<<<<<<<<<<<<<
+ *         #swap the column hashes:
+ *         cdef uint64_t *tmp = self.old_col_hashes
+ */
+  (void)(memcpy(__pyx_v_self->old_row_known, __pyx_v_self->row_known, __pyx_v_self->height));
+
+  /* "xpra/server/window/motion.pyx":352
+ *         memcpy(self.old_row_known, self.row_known, self.height)
+ *         #swap the column hashes:
+ *         cdef uint64_t *tmp = self.old_col_hashes             # <<<<<<<<<<<<<<
+ *         self.old_col_hashes = self.col_hashes
+ *         self.col_hashes = tmp
+ */
+  __pyx_t_8 = __pyx_v_self->old_col_hashes;
+  __pyx_v_tmp = __pyx_t_8;
+
+  /* "xpra/server/window/motion.pyx":353
+ *         #swap the column hashes:
+ *         cdef uint64_t *tmp = self.old_col_hashes
+ *         self.old_col_hashes = self.col_hashes             # <<<<<<<<<<<<<<
+ *         self.col_hashes = tmp
+ *         memcpy(self.old_col_geometry, self.col_geometry, sizeof(self.col_geometry))
+ */
+  __pyx_t_8 = __pyx_v_self->col_hashes;
+  __pyx_v_self->old_col_hashes = __pyx_t_8;
+
+  /* "xpra/server/window/motion.pyx":354
+ *         cdef uint64_t *tmp = self.old_col_hashes
+ *         self.old_col_hashes = self.col_hashes
+ *         self.col_hashes = tmp             # <<<<<<<<<<<<<<
+ *         memcpy(self.old_col_geometry, self.col_geometry, sizeof(self.col_geometry))
+ *         #the column hashes are only calculated if detect() needs them:
+ */
+  __pyx_v_self->col_hashes = __pyx_v_tmp;
+
+  /* "xpra/server/window/motion.pyx":355
+ *         self.old_col_hashes = self.col_hashes
+ *         self.col_hashes = tmp
+ *         memcpy(self.old_col_geometry, self.col_geometry, sizeof(self.col_geometry))             # <<<<<<<<<<<<<<
+ *         #the column hashes are only calculated if detect() needs them:
+ *         memset(self.col_geometry, 0, sizeof(self.col_geometry))
+ */
+  (void)(memcpy(__pyx_v_self->old_col_geometry, __pyx_v_self->col_geometry, (sizeof(__pyx_v_self->col_geometry))));
+
+  /* "xpra/server/window/motion.pyx":357
+ *         memcpy(self.old_col_geometry, self.col_geometry, sizeof(self.col_geometry))
+ *         #the column hashes are only calculated if detect() needs them:
+ *         memset(self.col_geometry, 0, sizeof(self.col_geometry))             # <<<<<<<<<<<<<<
+ *         cdef size_t row_len = width*bpp
+ *         cdef uint64_t *rows = self.row_hashes + y
+ */
+  (void)(memset(__pyx_v_self->col_geometry, 0, (sizeof(__pyx_v_self->col_geometry))));
+
+  /* "xpra/server/window/motion.pyx":358
+ *         #the column hashes are only calculated if detect() needs them:
+ *         memset(self.col_geometry, 0, sizeof(self.col_geometry))
+ *         cdef size_t row_len = width*bpp             # <<<<<<<<<<<<<<
+ *         cdef uint64_t *rows = self.row_hashes + y
+ *         cdef uint8_t *row = buf
+ */
+  __pyx_v_row_len = (__pyx_v_width * __pyx_v_bpp);
+
+  /* "xpra/server/window/motion.pyx":359
+ *         memset(self.col_geometry, 0, sizeof(self.col_geometry))
+ *         cdef size_t row_len = width*bpp
+ *         cdef uint64_t *rows = self.row_hashes + y             # <<<<<<<<<<<<<<
+ *         cdef uint8_t *row = buf
+ *         cdef unsigned int i
+ */
+  __pyx_v_rows = (__pyx_v_self->row_hashes + __pyx_v_y);
+
+  /* "xpra/server/window/motion.pyx":360
+ *         cdef size_t row_len = width*bpp
+ *         cdef uint64_t *rows = self.row_hashes + y
+ *         cdef uint8_t *row = buf             # <<<<<<<<<<<<<<
+ *         cdef unsigned int i
+ *         with nogil:
+ */
+  __pyx_v_row = __pyx_v_buf;
+
+  /* "xpra/server/window/motion.pyx":362
+ *         cdef uint8_t *row = buf
+ *         cdef unsigned int i
+ *         with nogil:             # <<<<<<<<<<<<<<
+ *             for i in range(height):
+ *                 rows[i] = hash_tile(row, rowstride, row_len, 1)
+ */
+  {
+      #ifdef WITH_THREAD
+      PyThreadState *_save;
+      Py_UNBLOCK_THREADS
+      __Pyx_FastGIL_Remember();
+      #endif
+      /*try:*/ {
+
+        /* "xpra/server/window/motion.pyx":363
+ *         cdef unsigned int i
+ *         with nogil:
+ *             for i in range(height):             # <<<<<<<<<<<<<<
+ *                 rows[i] = hash_tile(row, rowstride, row_len, 1)
+ *                 row += rowstride
+ */
+        __pyx_t_9 = __pyx_v_height;
+        __pyx_t_10 = __pyx_t_9;
+        for (__pyx_t_11 = 0; __pyx_t_11 < __pyx_t_10; __pyx_t_11+=1) {
+          __pyx_v_i = __pyx_t_11;
+
+          /* "xpra/server/window/motion.pyx":364
+ *         with nogil:
+ *             for i in range(height):
+ *                 rows[i] = hash_tile(row, rowstride, row_len, 1)             # <<<<<<<<<<<<<<
+ *                 row += rowstride
+ *             memset(self.row_known+y, 1, height)
+ */
+          (__pyx_v_rows[__pyx_v_i]) = __pyx_f_4xpra_6server_6window_6motion_hash_tile(__pyx_v_row, __pyx_v_rowstride, __pyx_v_row_len, 1);
+
+          /* "xpra/server/window/motion.pyx":365
+ *             for i in range(height):
+ *                 rows[i] = hash_tile(row, rowstride, row_len, 1)
+ *                 row += rowstride             # <<<<<<<<<<<<<<
+ *             memset(self.row_known+y, 1, height)
+ *         self.pixels = pixels
+ */
+          __pyx_v_row = (__pyx_v_row + __pyx_v_rowstride);
+        }
+
+        /* "xpra/server/window/motion.pyx":366
+ *                 rows[i] = hash_tile(row, rowstride, row_len, 1)
+ *                 row += rowstride
+ *             memset(self.row_known+y, 1, height)             # <<<<<<<<<<<<<<
+ *         self.pixels = pixels
+ *         self.rowstride = rowstride
+ */
+        (void)(memset((__pyx_v_self->row_known + __pyx_v_y), 1, __pyx_v_height));
+      }
+
+      /* "xpra/server/window/motion.pyx":362
+ *         cdef uint8_t *row = buf
+ *         cdef unsigned int i
+ *         with nogil:             # <<<<<<<<<<<<<<
+ *             for i in range(height):
+ *                 rows[i] = hash_tile(row, rowstride, row_len, 1)
+ */
+      /*finally:*/ {
+        /*normal exit:*/{
+          #ifdef WITH_THREAD
+          __Pyx_FastGIL_Forget();
+          Py_BLOCK_THREADS
+          #endif
+          goto __pyx_L16;
+        }
+        __pyx_L16:;
+      }
+  }
+
+  /* "xpra/server/window/motion.pyx":367
+ *                 row += rowstride
+ *             memset(self.row_known+y, 1, height)
+ *         self.pixels = pixels             # <<<<<<<<<<<<<<
+ *         self.rowstride = rowstride
+ *         self.bpp = bpp
+ */
+  __Pyx_INCREF(__pyx_v_pixels);
+  __Pyx_GIVEREF(__pyx_v_pixels);
+  __Pyx_GOTREF(__pyx_v_self->pixels);
+  __Pyx_DECREF(__pyx_v_self->pixels);
+  __pyx_v_self->pixels = __pyx_v_pixels;
+
+  /* "xpra/server/window/motion.pyx":368
+ *             memset(self.row_known+y, 1, height)
+ *         self.pixels = pixels
+ *         self.rowstride = rowstride             # <<<<<<<<<<<<<<
+ *         self.bpp = bpp
+ *         self.update_y = y
+ */
+  __pyx_v_self->rowstride = __pyx_v_rowstride;
+
+  /* "xpra/server/window/motion.pyx":369
+ *         self.pixels = pixels
+ *         self.rowstride = rowstride
+ *         self.bpp = bpp             # <<<<<<<<<<<<<<
+ *         self.update_y = y
+ *         self.update_h = height
+ */
+  __pyx_v_self->bpp = __pyx_v_bpp;
+
+  /* "xpra/server/window/motion.pyx":370
+ *         self.rowstride = rowstride
+ *         self.bpp = bpp
+ *         self.update_y = y             # <<<<<<<<<<<<<<
+ *         self.update_h = height
+ *         self.updates += 1
+ */
+  __pyx_v_self->update_y = __pyx_v_y;
+
+  /* "xpra/server/window/motion.pyx":371
+ *         self.bpp = bpp
+ *         self.update_y = y
+ *         self.update_h = height             # <<<<<<<<<<<<<<
+ *         self.updates += 1
+ *         self.rows_hashed += height
+ */
+  __pyx_v_self->update_h = __pyx_v_height;
+
+  /* "xpra/server/window/motion.pyx":372
+ *         self.update_y = y
+ *         self.update_h = height
+ *         self.updates += 1             # <<<<<<<<<<<<<<
+ *         self.rows_hashed += height
+ * 
+ */
+  __pyx_v_self->updates = (__pyx_v_self->updates + 1);
+
+  /* "xpra/server/window/motion.pyx":373
+ *         self.update_h = height
+ *         self.updates += 1
+ *         self.rows_hashed += height             # <<<<<<<<<<<<<<
+ * 
+ *     cdef int hash_columns(self):
+ */
+  __pyx_v_self->rows_hashed = (__pyx_v_self->rows_hashed + __pyx_v_height);
+
+  /* "xpra/server/window/motion.pyx":333
+ *         memset(self.col_geometry, 0, sizeof(self.col_geometry))
+ * 
+ *     def update(self, pixels, int x, int y, unsigned int width, unsigned int height, unsigned int rowstride, unsigned char bpp=4):             # <<<<<<<<<<<<<<
+ *         """
+ *             Hashes the rows of the region given, in window coordinates,
+ */
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_AddTraceback("xpra.server.window.motion.ScrollData.update", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "xpra/server/window/motion.pyx":375
+ *         self.rows_hashed += height
+ * 
+ *     cdef int hash_columns(self):             # <<<<<<<<<<<<<<
+ *         if self.pixels is None or self.bpp!=4:
+ *             return 0
+ */
+
+static int __pyx_f_4xpra_6server_6window_6motion_10ScrollData_hash_columns(struct __pyx_obj_4xpra_6server_6window_6motion_ScrollData *__pyx_v_self) {
+  uint8_t *__pyx_v_buf;
+  Py_ssize_t __pyx_v_buf_len;
+  uint64_t *__pyx_v_cols;
+  unsigned int __pyx_v_width;
+  unsigned int __pyx_v_rowstride;
+  uint32_t __pyx_v_v32;
+  CYTHON_UNUSED int __pyx_v_i;
+  int __pyx_v_c;
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  PyObject *__pyx_t_4 = NULL;
+  uint64_t *__pyx_t_5;
+  unsigned int __pyx_t_6;
+  unsigned int __pyx_t_7;
+  int __pyx_t_8;
+  int __pyx_t_9;
+  int __pyx_t_10;
+  int __pyx_t_11;
+  int __pyx_t_12[4];
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("hash_columns", 0);
+
+  /* "xpra/server/window/motion.pyx":376
+ * 
+ *     cdef int hash_columns(self):
+ *         if self.pixels is None or self.bpp!=4:             # <<<<<<<<<<<<<<
+ *             return 0
+ *         cdef uint8_t *buf = NULL
+ */
+  __pyx_t_2 = (__pyx_v_self->pixels == Py_None);
+  __pyx_t_3 = (__pyx_t_2 != 0);
+  if (!__pyx_t_3) {
+  } else {
+    __pyx_t_1 = __pyx_t_3;
+    goto __pyx_L4_bool_binop_done;
+  }
+  __pyx_t_3 = ((__pyx_v_self->bpp != 4) != 0);
+  __pyx_t_1 = __pyx_t_3;
+  __pyx_L4_bool_binop_done:;
+  if (__pyx_t_1) {
+
+    /* "xpra/server/window/motion.pyx":377
+ *     cdef int hash_columns(self):
+ *         if self.pixels is None or self.bpp!=4:
+ *             return 0             # <<<<<<<<<<<<<<
+ *         cdef uint8_t *buf = NULL
+ *         cdef Py_ssize_t buf_len = 0
+ */
+    __pyx_r = 0;
+    goto __pyx_L0;
+
+    /* "xpra/server/window/motion.pyx":376
+ * 
+ *     cdef int hash_columns(self):
+ *         if self.pixels is None or self.bpp!=4:             # <<<<<<<<<<<<<<
+ *             return 0
+ *         cdef uint8_t *buf = NULL
+ */
+  }
+
+  /* "xpra/server/window/motion.pyx":378
+ *         if self.pixels is None or self.bpp!=4:
+ *             return 0
+ *         cdef uint8_t *buf = NULL             # <<<<<<<<<<<<<<
+ *         cdef Py_ssize_t buf_len = 0
+ *         assert object_as_buffer(self.pixels, <const void**> &buf, &buf_len)==0
+ */
+  __pyx_v_buf = NULL;
+
+  /* "xpra/server/window/motion.pyx":379
+ *             return 0
+ *         cdef uint8_t *buf = NULL
+ *         cdef Py_ssize_t buf_len = 0             # <<<<<<<<<<<<<<
+ *         assert object_as_buffer(self.pixels, <const void**> &buf, &buf_len)==0
+ *         cdef uint64_t *cols = self.col_hashes
+ */
+  __pyx_v_buf_len = 0;
+
+  /* "xpra/server/window/motion.pyx":380
+ *         cdef uint8_t *buf = NULL
+ *         cdef Py_ssize_t buf_len = 0
+ *         assert object_as_buffer(self.pixels, <const void**> &buf, &buf_len)==0             # <<<<<<<<<<<<<<
+ *         cdef uint64_t *cols = self.col_hashes
+ *         cdef unsigned int width = self.w
+ */
+  #ifndef CYTHON_WITHOUT_ASSERTIONS
+  if (unlikely(__pyx_assertions_enabled())) {
+    __pyx_t_4 = __pyx_v_self->pixels;
+    __Pyx_INCREF(__pyx_t_4);
+    if (unlikely(!((object_as_buffer(__pyx_t_4, ((void const **)(&__pyx_v_buf)), (&__pyx_v_buf_len)) == 0) != 0))) {
+      PyErr_SetNone(PyExc_AssertionError);
+      __PYX_ERR(0, 380, __pyx_L1_error)
+    }
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  }
+  #endif
+
+  /* "xpra/server/window/motion.pyx":381
+ *         cdef Py_ssize_t buf_len = 0
+ *         assert object_as_buffer(self.pixels, <const void**> &buf, &buf_len)==0
+ *         cdef uint64_t *cols = self.col_hashes             # <<<<<<<<<<<<<<
+ *         cdef unsigned int width = self.w
+ *         cdef unsigned int rowstride = self.rowstride
+ */
+  __pyx_t_5 = __pyx_v_self->col_hashes;
+  __pyx_v_cols = __pyx_t_5;
+
+  /* "xpra/server/window/motion.pyx":382
+ *         assert object_as_buffer(self.pixels, <const void**> &buf, &buf_len)==0
+ *         cdef uint64_t *cols = self.col_hashes
+ *         cdef unsigned int width = self.w             # <<<<<<<<<<<<<<
+ *         cdef unsigned int rowstride = self.rowstride
+ *         cdef uint32_t v32
+ */
+  __pyx_t_6 = __pyx_v_self->w;
+  __pyx_v_width = __pyx_t_6;
+
+  /* "xpra/server/window/motion.pyx":383
+ *         cdef uint64_t *cols = self.col_hashes
+ *         cdef unsigned int width = self.w
+ *         cdef unsigned int rowstride = self.rowstride             # <<<<<<<<<<<<<<
+ *         cdef uint32_t v32
+ *         cdef int i, c
+ */
+  __pyx_t_6 = __pyx_v_self->rowstride;
+  __pyx_v_rowstride = __pyx_t_6;
+
+  /* "xpra/server/window/motion.pyx":386
+ *         cdef uint32_t v32
+ *         cdef int i, c
+ *         with nogil:             # <<<<<<<<<<<<<<
+ *             for c in range(width):
+ *                 cols[c] = PRIME64_5
+ */
+  {
+      #ifdef WITH_THREAD
+      PyThreadState *_save;
+      Py_UNBLOCK_THREADS
+      __Pyx_FastGIL_Remember();
+      #endif
+      /*try:*/ {
+
+        /* "xpra/server/window/motion.pyx":387
+ *         cdef int i, c
+ *         with nogil:
+ *             for c in range(width):             # <<<<<<<<<<<<<<
+ *                 cols[c] = PRIME64_5
+ *             for i in range(self.update_h):
+ */
+        __pyx_t_6 = __pyx_v_width;
+        __pyx_t_7 = __pyx_t_6;
+        for (__pyx_t_8 = 0; __pyx_t_8 < __pyx_t_7; __pyx_t_8+=1) {
+          __pyx_v_c = __pyx_t_8;
+
+          /* "xpra/server/window/motion.pyx":388
+ *         with nogil:
+ *             for c in range(width):
+ *                 cols[c] = PRIME64_5             # <<<<<<<<<<<<<<
+ *             for i in range(self.update_h):
+ *                 for c in range(width):
+ */
+          (__pyx_v_cols[__pyx_v_c]) = __pyx_v_4xpra_6server_6window_6motion_PRIME64_5;
+        }
+
+        /* "xpra/server/window/motion.pyx":389
+ *             for c in range(width):
+ *                 cols[c] = PRIME64_5
+ *             for i in range(self.update_h):             # <<<<<<<<<<<<<<
+ *                 for c in range(width):
+ *                     memcpy(&v32, buf+c*4, 4)
+ */
+        __pyx_t_8 = __pyx_v_self->update_h;
+        __pyx_t_9 = __pyx_t_8;
+        for (__pyx_t_10 = 0; __pyx_t_10 < __pyx_t_9; __pyx_t_10+=1) {
+          __pyx_v_i = __pyx_t_10;
+
+          /* "xpra/server/window/motion.pyx":390
+ *                 cols[c] = PRIME64_5
+ *             for i in range(self.update_h):
+ *                 for c in range(width):             # <<<<<<<<<<<<<<
+ *                     memcpy(&v32, buf+c*4, 4)
+ *                     cols[c] = rotl64(cols[c] ^ (v32*PRIME64_1), 23)*PRIME64_2 + PRIME64_3
+ */
+          __pyx_t_6 = __pyx_v_width;
+          __pyx_t_7 = __pyx_t_6;
+          for (__pyx_t_11 = 0; __pyx_t_11 < __pyx_t_7; __pyx_t_11+=1) {
+            __pyx_v_c = __pyx_t_11;
+
+            /* "xpra/server/window/motion.pyx":391
+ *             for i in range(self.update_h):
+ *                 for c in range(width):
+ *                     memcpy(&v32, buf+c*4, 4)             # <<<<<<<<<<<<<<
+ *                     cols[c] = rotl64(cols[c] ^ (v32*PRIME64_1), 23)*PRIME64_2 + PRIME64_3
+ *                 buf += rowstride
+ */
+            (void)(memcpy((&__pyx_v_v32), (__pyx_v_buf + (__pyx_v_c * 4)), 4));
+
+            /* "xpra/server/window/motion.pyx":392
+ *                 for c in range(width):
+ *                     memcpy(&v32, buf+c*4, 4)
+ *                     cols[c] = rotl64(cols[c] ^ (v32*PRIME64_1), 23)*PRIME64_2 + PRIME64_3             # <<<<<<<<<<<<<<
+ *                 buf += rowstride
+ *         self.col_geometry[:] = [self.x, self.update_y, self.w, self.update_h]
+ */
+            (__pyx_v_cols[__pyx_v_c]) = ((__pyx_f_4xpra_6server_6window_6motion_rotl64(((__pyx_v_cols[__pyx_v_c]) ^ (__pyx_v_v32 * __pyx_v_4xpra_6server_6window_6motion_PRIME64_1)), 23) * __pyx_v_4xpra_6server_6window_6motion_PRIME64_2) + __pyx_v_4xpra_6server_6window_6motion_PRIME64_3);
+          }
+
+          /* "xpra/server/window/motion.pyx":393
+ *                     memcpy(&v32, buf+c*4, 4)
+ *                     cols[c] = rotl64(cols[c] ^ (v32*PRIME64_1), 23)*PRIME64_2 + PRIME64_3
+ *                 buf += rowstride             # <<<<<<<<<<<<<<
+ *         self.col_geometry[:] = [self.x, self.update_y, self.w, self.update_h]
+ *         return 1
+ */
+          __pyx_v_buf = (__pyx_v_buf + __pyx_v_rowstride);
+        }
+      }
+
+      /* "xpra/server/window/motion.pyx":386
+ *         cdef uint32_t v32
+ *         cdef int i, c
+ *         with nogil:             # <<<<<<<<<<<<<<
+ *             for c in range(width):
+ *                 cols[c] = PRIME64_5
+ */
+      /*finally:*/ {
+        /*normal exit:*/{
+          #ifdef WITH_THREAD
+          __Pyx_FastGIL_Forget();
+          Py_BLOCK_THREADS
+          #endif
+          goto __pyx_L8;
+        }
+        __pyx_L8:;
+      }
+  }
+
+  /* "xpra/server/window/motion.pyx":394
+ *                     cols[c] = rotl64(cols[c] ^ (v32*PRIME64_1), 23)*PRIME64_2 + PRIME64_3
+ *                 buf += rowstride
+ *         self.col_geometry[:] = [self.x, self.update_y, self.w, self.update_h]             # <<<<<<<<<<<<<<
+ *         return 1
+ * 
+ */
+  __pyx_t_12[0] = __pyx_v_self->x;
+  __pyx_t_12[1] = __pyx_v_self->update_y;
+  __pyx_t_12[2] = __pyx_v_self->w;
+  __pyx_t_12[3] = __pyx_v_self->update_h;
+  memcpy(&(__pyx_v_self->col_geometry[0]), __pyx_t_12, sizeof(__pyx_v_self->col_geometry[0]) * (4));
+
+  /* "xpra/server/window/motion.pyx":395
+ *                 buf += rowstride
+ *         self.col_geometry[:] = [self.x, self.update_y, self.w, self.update_h]
+ *         return 1             # <<<<<<<<<<<<<<
+ * 
+ *     def detect(self, int min_percent=40, int max_distance=1000, int horizontal=True):
+ */
+  __pyx_r = 1;
+  goto __pyx_L0;
+
+  /* "xpra/server/window/motion.pyx":375
+ *         self.rows_hashed += height
+ * 
+ *     cdef int hash_columns(self):             # <<<<<<<<<<<<<<
+ *         if self.pixels is None or self.bpp!=4:
+ *             return 0
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_WriteUnraisable("xpra.server.window.motion.ScrollData.hash_columns", __pyx_clineno, __pyx_lineno, __pyx_filename, 1, 0);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "xpra/server/window/motion.pyx":397
+ *         return 1
+ * 
+ *     def detect(self, int min_percent=40, int max_distance=1000, int horizontal=True):             # <<<<<<<<<<<<<<
+ *         """
+ *             Compares the region from the last update with the previous hash values.
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_4xpra_6server_6window_6motion_10ScrollData_13detect(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_4xpra_6server_6window_6motion_10ScrollData_12detect[] = "\n            Compares the region from the last update with the previous hash values.\n            Returns None if less than min_percent of the region can be handled\n            by scrolling and dropping unchanged rows (or columns),\n            otherwise (scrolls, non_scroll, unchanged) where:\n            * scrolls is a list of (x, y, w, h, xdelta, ydelta) in window coordinates,\n              suitable for sending as \"scroll\" draw packets\n            * non_scroll is a list of the (x, y, w, h) rectangles which must be sent\n            * unchanged is the number of rows (or columns) which have not changed\n        ";
+static PyObject *__pyx_pw_4xpra_6server_6window_6motion_10ScrollData_13detect(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  int __pyx_v_min_percent;
+  int __pyx_v_max_distance;
+  int __pyx_v_horizontal;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("detect (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_min_percent,&__pyx_n_s_max_distance,&__pyx_n_s_horizontal,0};
+    PyObject* values[3] = {0,0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_min_percent);
+          if (value) { values[0] = value; kw_args--; }
+        }
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_max_distance);
+          if (value) { values[1] = value; kw_args--; }
+        }
+        CYTHON_FALLTHROUGH;
+        case  2:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_horizontal);
+          if (value) { values[2] = value; kw_args--; }
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "detect") < 0)) __PYX_ERR(0, 397, __pyx_L3_error)
+      }
+    } else {
+      switch (PyTuple_GET_SIZE(__pyx_args)) {
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+    }
+    if (values[0]) {
+      __pyx_v_min_percent = __Pyx_PyInt_As_int(values[0]); if (unlikely((__pyx_v_min_percent == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 397, __pyx_L3_error)
+    } else {
+      __pyx_v_min_percent = ((int)40);
+    }
+    if (values[1]) {
+      __pyx_v_max_distance = __Pyx_PyInt_As_int(values[1]); if (unlikely((__pyx_v_max_distance == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 397, __pyx_L3_error)
+    } else {
+      __pyx_v_max_distance = ((int)0x3E8);
+    }
+    if (values[2]) {
+      __pyx_v_horizontal = __Pyx_PyInt_As_int(values[2]); if (unlikely((__pyx_v_horizontal == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 397, __pyx_L3_error)
+    } else {
+      __pyx_v_horizontal = ((int)1);
+    }
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("detect", 0, 0, 3, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 397, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("xpra.server.window.motion.ScrollData.detect", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_4xpra_6server_6window_6motion_10ScrollData_12detect(((struct __pyx_obj_4xpra_6server_6window_6motion_ScrollData *)__pyx_v_self), __pyx_v_min_percent, __pyx_v_max_distance, __pyx_v_horizontal);
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_4xpra_6server_6window_6motion_10ScrollData_12detect(struct __pyx_obj_4xpra_6server_6window_6motion_ScrollData *__pyx_v_self, int __pyx_v_min_percent, int __pyx_v_max_distance, int __pyx_v_horizontal) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  char const *__pyx_t_4;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  PyObject *__pyx_t_7 = NULL;
+  PyObject *__pyx_t_8 = NULL;
+  PyObject *__pyx_t_9 = NULL;
+  PyObject *__pyx_t_10 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("detect", 0);
+
+  /* "xpra/server/window/motion.pyx":408
+ *             * unchanged is the number of rows (or columns) which have not changed
+ *         """
+ *         try:             # <<<<<<<<<<<<<<
+ *             return self.do_detect(min_percent, max_distance, horizontal)
+ *         finally:
+ */
+  /*try:*/ {
+
+    /* "xpra/server/window/motion.pyx":409
+ *         """
+ *         try:
+ *             return self.do_detect(min_percent, max_distance, horizontal)             # <<<<<<<<<<<<<<
+ *         finally:
+ *             #don't keep a reference to the pixels:
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_1 = ((struct __pyx_vtabstruct_4xpra_6server_6window_6motion_ScrollData *)__pyx_v_self->__pyx_vtab)->do_detect(__pyx_v_self, __pyx_v_min_percent, __pyx_v_max_distance, __pyx_v_horizontal); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 409, __pyx_L4_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_r = __pyx_t_1;
+    __pyx_t_1 = 0;
+    goto __pyx_L3_return;
+  }
+
+  /* "xpra/server/window/motion.pyx":412
+ *         finally:
+ *             #don't keep a reference to the pixels:
+ *             self.pixels = None             # <<<<<<<<<<<<<<
+ * 
+ *     cdef do_detect(self, int min_percent, int max_distance, int horizontal):
+ */
+  /*finally:*/ {
+    __pyx_L4_error:;
+    /*exception exit:*/{
+      __Pyx_PyThreadState_declare
+      __Pyx_PyThreadState_assign
+      __pyx_t_5 = 0; __pyx_t_6 = 0; __pyx_t_7 = 0; __pyx_t_8 = 0; __pyx_t_9 = 0; __pyx_t_10 = 0;
+      __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
+      if (PY_MAJOR_VERSION >= 3) __Pyx_ExceptionSwap(&__pyx_t_8, &__pyx_t_9, &__pyx_t_10);
+      if ((PY_MAJOR_VERSION < 3) || unlikely(__Pyx_GetException(&__pyx_t_5, &__pyx_t_6, &__pyx_t_7) < 0)) __Pyx_ErrFetch(&__pyx_t_5, &__pyx_t_6, &__pyx_t_7);
+      __Pyx_XGOTREF(__pyx_t_5);
+      __Pyx_XGOTREF(__pyx_t_6);
+      __Pyx_XGOTREF(__pyx_t_7);
+      __Pyx_XGOTREF(__pyx_t_8);
+      __Pyx_XGOTREF(__pyx_t_9);
+      __Pyx_XGOTREF(__pyx_t_10);
+      __pyx_t_2 = __pyx_lineno; __pyx_t_3 = __pyx_clineno; __pyx_t_4 = __pyx_filename;
+      {
+        __Pyx_INCREF(Py_None);
+        __Pyx_GIVEREF(Py_None);
+        __Pyx_GOTREF(__pyx_v_self->pixels);
+        __Pyx_DECREF(__pyx_v_self->pixels);
+        __pyx_v_self->pixels = Py_None;
+      }
+      if (PY_MAJOR_VERSION >= 3) {
+        __Pyx_XGIVEREF(__pyx_t_8);
+        __Pyx_XGIVEREF(__pyx_t_9);
+        __Pyx_XGIVEREF(__pyx_t_10);
+        __Pyx_ExceptionReset(__pyx_t_8, __pyx_t_9, __pyx_t_10);
+      }
+      __Pyx_XGIVEREF(__pyx_t_5);
+      __Pyx_XGIVEREF(__pyx_t_6);
+      __Pyx_XGIVEREF(__pyx_t_7);
+      __Pyx_ErrRestore(__pyx_t_5, __pyx_t_6, __pyx_t_7);
+      __pyx_t_5 = 0; __pyx_t_6 = 0; __pyx_t_7 = 0; __pyx_t_8 = 0; __pyx_t_9 = 0; __pyx_t_10 = 0;
+      __pyx_lineno = __pyx_t_2; __pyx_clineno = __pyx_t_3; __pyx_filename = __pyx_t_4;
+      goto __pyx_L1_error;
+    }
+    __pyx_L3_return: {
+      __pyx_t_10 = __pyx_r;
+      __pyx_r = 0;
+      __Pyx_INCREF(Py_None);
+      __Pyx_GIVEREF(Py_None);
+      __Pyx_GOTREF(__pyx_v_self->pixels);
+      __Pyx_DECREF(__pyx_v_self->pixels);
+      __pyx_v_self->pixels = Py_None;
+      __pyx_r = __pyx_t_10;
+      __pyx_t_10 = 0;
+      goto __pyx_L0;
+    }
+  }
+
+  /* "xpra/server/window/motion.pyx":397
+ *         return 1
+ * 
+ *     def detect(self, int min_percent=40, int max_distance=1000, int horizontal=True):             # <<<<<<<<<<<<<<
+ *         """
+ *             Compares the region from the last update with the previous hash values.
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("xpra.server.window.motion.ScrollData.detect", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "xpra/server/window/motion.pyx":414
+ *             self.pixels = None
+ * 
+ *     cdef do_detect(self, int min_percent, int max_distance, int horizontal):             # <<<<<<<<<<<<<<
+ *         cdef int x = self.x
+ *         cdef int y = self.update_y
+ */
+
+static PyObject *__pyx_f_4xpra_6server_6window_6motion_10ScrollData_do_detect(struct __pyx_obj_4xpra_6server_6window_6motion_ScrollData *__pyx_v_self, int __pyx_v_min_percent, int __pyx_v_max_distance, int __pyx_v_horizontal) {
+  int __pyx_v_x;
+  int __pyx_v_y;
+  int __pyx_v_w;
+  int __pyx_v_h;
+  PyObject *__pyx_v_r = NULL;
+  PyObject *__pyx_v_scrolls = NULL;
+  PyObject *__pyx_v_non_scroll = NULL;
+  PyObject *__pyx_v_unchanged = NULL;
+  int __pyx_v_i;
+  PyObject *__pyx_v_start = NULL;
+  PyObject *__pyx_v_count = NULL;
+  PyObject *__pyx_v_s = NULL;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  unsigned int __pyx_t_2;
+  int __pyx_t_3;
+  int __pyx_t_4;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  PyObject *__pyx_t_7 = NULL;
+  PyObject *__pyx_t_8 = NULL;
+  PyObject *(*__pyx_t_9)(PyObject *);
+  Py_ssize_t __pyx_t_10;
+  PyObject *(*__pyx_t_11)(PyObject *);
+  PyObject *__pyx_t_12 = NULL;
+  PyObject *__pyx_t_13 = NULL;
+  PyObject *__pyx_t_14 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("do_detect", 0);
+
+  /* "xpra/server/window/motion.pyx":415
+ * 
+ *     cdef do_detect(self, int min_percent, int max_distance, int horizontal):
+ *         cdef int x = self.x             # <<<<<<<<<<<<<<
+ *         cdef int y = self.update_y
+ *         cdef int w = self.w
+ */
+  __pyx_t_1 = __pyx_v_self->x;
+  __pyx_v_x = __pyx_t_1;
+
+  /* "xpra/server/window/motion.pyx":416
+ *     cdef do_detect(self, int min_percent, int max_distance, int horizontal):
+ *         cdef int x = self.x
+ *         cdef int y = self.update_y             # <<<<<<<<<<<<<<
+ *         cdef int w = self.w
+ *         cdef int h = self.update_h
+ */
+  __pyx_t_1 = __pyx_v_self->update_y;
+  __pyx_v_y = __pyx_t_1;
+
+  /* "xpra/server/window/motion.pyx":417
+ *         cdef int x = self.x
+ *         cdef int y = self.update_y
+ *         cdef int w = self.w             # <<<<<<<<<<<<<<
+ *         cdef int h = self.update_h
+ *         if self.updates<2 or h<=0:
+ */
+  __pyx_t_2 = __pyx_v_self->w;
+  __pyx_v_w = __pyx_t_2;
+
+  /* "xpra/server/window/motion.pyx":418
+ *         cdef int y = self.update_y
+ *         cdef int w = self.w
+ *         cdef int h = self.update_h             # <<<<<<<<<<<<<<
+ *         if self.updates<2 or h<=0:
+ *             return None
+ */
+  __pyx_t_1 = __pyx_v_self->update_h;
+  __pyx_v_h = __pyx_t_1;
+
+  /* "xpra/server/window/motion.pyx":419
+ *         cdef int w = self.w
+ *         cdef int h = self.update_h
+ *         if self.updates<2 or h<=0:             # <<<<<<<<<<<<<<
+ *             return None
+ *         r = match_lines(self.old_row_hashes, self.old_row_known, self.row_hashes, self.height, y, y+h, max_distance, min_percent)
+ */
+  __pyx_t_4 = ((__pyx_v_self->updates < 2) != 0);
+  if (!__pyx_t_4) {
+  } else {
+    __pyx_t_3 = __pyx_t_4;
+    goto __pyx_L4_bool_binop_done;
+  }
+  __pyx_t_4 = ((__pyx_v_h <= 0) != 0);
+  __pyx_t_3 = __pyx_t_4;
+  __pyx_L4_bool_binop_done:;
+  if (__pyx_t_3) {
+
+    /* "xpra/server/window/motion.pyx":420
+ *         cdef int h = self.update_h
+ *         if self.updates<2 or h<=0:
+ *             return None             # <<<<<<<<<<<<<<
+ *         r = match_lines(self.old_row_hashes, self.old_row_known, self.row_hashes, self.height, y, y+h, max_distance, min_percent)
+ *         if r:
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+    goto __pyx_L0;
+
+    /* "xpra/server/window/motion.pyx":419
+ *         cdef int w = self.w
+ *         cdef int h = self.update_h
+ *         if self.updates<2 or h<=0:             # <<<<<<<<<<<<<<
+ *             return None
+ *         r = match_lines(self.old_row_hashes, self.old_row_known, self.row_hashes, self.height, y, y+h, max_distance, min_percent)
+ */
+  }
+
+  /* "xpra/server/window/motion.pyx":421
+ *         if self.updates<2 or h<=0:
+ *             return None
+ *         r = match_lines(self.old_row_hashes, self.old_row_known, self.row_hashes, self.height, y, y+h, max_distance, min_percent)             # <<<<<<<<<<<<<<
+ *         if r:
+ *             scrolls, non_scroll, unchanged = r
+ */
+  __pyx_t_5 = __pyx_f_4xpra_6server_6window_6motion_match_lines(__pyx_v_self->old_row_hashes, __pyx_v_self->old_row_known, __pyx_v_self->row_hashes, __pyx_v_self->height, __pyx_v_y, (__pyx_v_y + __pyx_v_h), __pyx_v_max_distance, __pyx_v_min_percent); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 421, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_v_r = __pyx_t_5;
+  __pyx_t_5 = 0;
+
+  /* "xpra/server/window/motion.pyx":422
+ *             return None
+ *         r = match_lines(self.old_row_hashes, self.old_row_known, self.row_hashes, self.height, y, y+h, max_distance, min_percent)
+ *         if r:             # <<<<<<<<<<<<<<
+ *             scrolls, non_scroll, unchanged = r
+ *             return ([(x, start-s, w, count, 0, s) for start, count, s in scrolls],
+ */
+  __pyx_t_3 = __Pyx_PyObject_IsTrue(__pyx_v_r); if (unlikely(__pyx_t_3 < 0)) __PYX_ERR(0, 422, __pyx_L1_error)
+  if (__pyx_t_3) {
+
+    /* "xpra/server/window/motion.pyx":423
+ *         r = match_lines(self.old_row_hashes, self.old_row_known, self.row_hashes, self.height, y, y+h, max_distance, min_percent)
+ *         if r:
+ *             scrolls, non_scroll, unchanged = r             # <<<<<<<<<<<<<<
+ *             return ([(x, start-s, w, count, 0, s) for start, count, s in scrolls],
+ *                     [(x, start, w, count) for start, count in non_scroll],
+ */
+    if ((likely(PyTuple_CheckExact(__pyx_v_r))) || (PyList_CheckExact(__pyx_v_r))) {
+      PyObject* sequence = __pyx_v_r;
+      Py_ssize_t size = __Pyx_PySequence_SIZE(sequence);
+      if (unlikely(size != 3)) {
+        if (size > 3) __Pyx_RaiseTooManyValuesError(3);
+        else if (size >= 0) __Pyx_RaiseNeedMoreValuesError(size);
+        __PYX_ERR(0, 423, __pyx_L1_error)
+      }
+      #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+      if (likely(PyTuple_CheckExact(sequence))) {
+        __pyx_t_5 = PyTuple_GET_ITEM(sequence, 0); 
+        __pyx_t_6 = PyTuple_GET_ITEM(sequence, 1); 
+        __pyx_t_7 = PyTuple_GET_ITEM(sequence, 2); 
+      } else {
+        __pyx_t_5 = PyList_GET_ITEM(sequence, 0); 
+        __pyx_t_6 = PyList_GET_ITEM(sequence, 1); 
+        __pyx_t_7 = PyList_GET_ITEM(sequence, 2); 
+      }
+      __Pyx_INCREF(__pyx_t_5);
+      __Pyx_INCREF(__pyx_t_6);
+      __Pyx_INCREF(__pyx_t_7);
+      #else
+      __pyx_t_5 = PySequence_ITEM(sequence, 0); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 423, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_5);
+      __pyx_t_6 = PySequence_ITEM(sequence, 1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 423, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_6);
+      __pyx_t_7 = PySequence_ITEM(sequence, 2); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 423, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_7);
+      #endif
+    } else {
+      Py_ssize_t index = -1;
+      __pyx_t_8 = PyObject_GetIter(__pyx_v_r); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 423, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_8);
+      __pyx_t_9 = Py_TYPE(__pyx_t_8)->tp_iternext;
+      index = 0; __pyx_t_5 = __pyx_t_9(__pyx_t_8); if (unlikely(!__pyx_t_5)) goto __pyx_L7_unpacking_failed;
+      __Pyx_GOTREF(__pyx_t_5);
+      index = 1; __pyx_t_6 = __pyx_t_9(__pyx_t_8); if (unlikely(!__pyx_t_6)) goto __pyx_L7_unpacking_failed;
+      __Pyx_GOTREF(__pyx_t_6);
+      index = 2; __pyx_t_7 = __pyx_t_9(__pyx_t_8); if (unlikely(!__pyx_t_7)) goto __pyx_L7_unpacking_failed;
+      __Pyx_GOTREF(__pyx_t_7);
+      if (__Pyx_IternextUnpackEndCheck(__pyx_t_9(__pyx_t_8), 3) < 0) __PYX_ERR(0, 423, __pyx_L1_error)
+      __pyx_t_9 = NULL;
+      __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+      goto __pyx_L8_unpacking_done;
+      __pyx_L7_unpacking_failed:;
+      __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+      __pyx_t_9 = NULL;
+      if (__Pyx_IterFinish() == 0) __Pyx_RaiseNeedMoreValuesError(index);
+      __PYX_ERR(0, 423, __pyx_L1_error)
+      __pyx_L8_unpacking_done:;
+    }
+    __pyx_v_scrolls = __pyx_t_5;
+    __pyx_t_5 = 0;
+    __pyx_v_non_scroll = __pyx_t_6;
+    __pyx_t_6 = 0;
+    __pyx_v_unchanged = __pyx_t_7;
+    __pyx_t_7 = 0;
+
+    /* "xpra/server/window/motion.pyx":424
+ *         if r:
+ *             scrolls, non_scroll, unchanged = r
+ *             return ([(x, start-s, w, count, 0, s) for start, count, s in scrolls],             # <<<<<<<<<<<<<<
+ *                     [(x, start, w, count) for start, count in non_scroll],
+ *                     unchanged)
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_7 = PyList_New(0); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 424, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_7);
+    if (likely(PyList_CheckExact(__pyx_v_scrolls)) || PyTuple_CheckExact(__pyx_v_scrolls)) {
+      __pyx_t_6 = __pyx_v_scrolls; __Pyx_INCREF(__pyx_t_6); __pyx_t_10 = 0;
+      __pyx_t_11 = NULL;
+    } else {
+      __pyx_t_10 = -1; __pyx_t_6 = PyObject_GetIter(__pyx_v_scrolls); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 424, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_6);
+      __pyx_t_11 = Py_TYPE(__pyx_t_6)->tp_iternext; if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 424, __pyx_L1_error)
+    }
+    for (;;) {
+      if (likely(!__pyx_t_11)) {
+        if (likely(PyList_CheckExact(__pyx_t_6))) {
+          if (__pyx_t_10 >= PyList_GET_SIZE(__pyx_t_6)) break;
+          #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+          __pyx_t_5 = PyList_GET_ITEM(__pyx_t_6, __pyx_t_10); __Pyx_INCREF(__pyx_t_5); __pyx_t_10++; if (unlikely(0 < 0)) __PYX_ERR(0, 424, __pyx_L1_error)
+          #else
+          __pyx_t_5 = PySequence_ITEM(__pyx_t_6, __pyx_t_10); __pyx_t_10++; if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 424, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_5);
+          #endif
+        } else {
+          if (__pyx_t_10 >= PyTuple_GET_SIZE(__pyx_t_6)) break;
+          #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+          __pyx_t_5 = PyTuple_GET_ITEM(__pyx_t_6, __pyx_t_10); __Pyx_INCREF(__pyx_t_5); __pyx_t_10++; if (unlikely(0 < 0)) __PYX_ERR(0, 424, __pyx_L1_error)
+          #else
+          __pyx_t_5 = PySequence_ITEM(__pyx_t_6, __pyx_t_10); __pyx_t_10++; if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 424, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_5);
+          #endif
+        }
+      } else {
+        __pyx_t_5 = __pyx_t_11(__pyx_t_6);
+        if (unlikely(!__pyx_t_5)) {
+          PyObject* exc_type = PyErr_Occurred();
+          if (exc_type) {
+            if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
+            else __PYX_ERR(0, 424, __pyx_L1_error)
+          }
+          break;
+        }
+        __Pyx_GOTREF(__pyx_t_5);
+      }
+      if ((likely(PyTuple_CheckExact(__pyx_t_5))) || (PyList_CheckExact(__pyx_t_5))) {
+        PyObject* sequence = __pyx_t_5;
+        Py_ssize_t size = __Pyx_PySequence_SIZE(sequence);
+        if (unlikely(size != 3)) {
+          if (size > 3) __Pyx_RaiseTooManyValuesError(3);
+          else if (size >= 0) __Pyx_RaiseNeedMoreValuesError(size);
+          __PYX_ERR(0, 424, __pyx_L1_error)
+        }
+        #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+        if (likely(PyTuple_CheckExact(sequence))) {
+          __pyx_t_8 = PyTuple_GET_ITEM(sequence, 0); 
+          __pyx_t_12 = PyTuple_GET_ITEM(sequence, 1); 
+          __pyx_t_13 = PyTuple_GET_ITEM(sequence, 2); 
+        } else {
+          __pyx_t_8 = PyList_GET_ITEM(sequence, 0); 
+          __pyx_t_12 = PyList_GET_ITEM(sequence, 1); 
+          __pyx_t_13 = PyList_GET_ITEM(sequence, 2); 
+        }
+        __Pyx_INCREF(__pyx_t_8);
+        __Pyx_INCREF(__pyx_t_12);
+        __Pyx_INCREF(__pyx_t_13);
+        #else
+        __pyx_t_8 = PySequence_ITEM(sequence, 0); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 424, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_8);
+        __pyx_t_12 = PySequence_ITEM(sequence, 1); if (unlikely(!__pyx_t_12)) __PYX_ERR(0, 424, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_12);
+        __pyx_t_13 = PySequence_ITEM(sequence, 2); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 424, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_13);
+        #endif
+        __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      } else {
+        Py_ssize_t index = -1;
+        __pyx_t_14 = PyObject_GetIter(__pyx_t_5); if (unlikely(!__pyx_t_14)) __PYX_ERR(0, 424, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_14);
+        __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+        __pyx_t_9 = Py_TYPE(__pyx_t_14)->tp_iternext;
+        index = 0; __pyx_t_8 = __pyx_t_9(__pyx_t_14); if (unlikely(!__pyx_t_8)) goto __pyx_L11_unpacking_failed;
+        __Pyx_GOTREF(__pyx_t_8);
+        index = 1; __pyx_t_12 = __pyx_t_9(__pyx_t_14); if (unlikely(!__pyx_t_12)) goto __pyx_L11_unpacking_failed;
+        __Pyx_GOTREF(__pyx_t_12);
+        index = 2; __pyx_t_13 = __pyx_t_9(__pyx_t_14); if (unlikely(!__pyx_t_13)) goto __pyx_L11_unpacking_failed;
+        __Pyx_GOTREF(__pyx_t_13);
+        if (__Pyx_IternextUnpackEndCheck(__pyx_t_9(__pyx_t_14), 3) < 0) __PYX_ERR(0, 424, __pyx_L1_error)
+        __pyx_t_9 = NULL;
+        __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
+        goto __pyx_L12_unpacking_done;
+        __pyx_L11_unpacking_failed:;
+        __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
+        __pyx_t_9 = NULL;
+        if (__Pyx_IterFinish() == 0) __Pyx_RaiseNeedMoreValuesError(index);
+        __PYX_ERR(0, 424, __pyx_L1_error)
+        __pyx_L12_unpacking_done:;
+      }
+      __Pyx_XDECREF_SET(__pyx_v_start, __pyx_t_8);
+      __pyx_t_8 = 0;
+      __Pyx_XDECREF_SET(__pyx_v_count, __pyx_t_12);
+      __pyx_t_12 = 0;
+      __Pyx_XDECREF_SET(__pyx_v_s, __pyx_t_13);
+      __pyx_t_13 = 0;
+      __pyx_t_5 = __Pyx_PyInt_From_int(__pyx_v_x); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 424, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_5);
+      __pyx_t_13 = PyNumber_Subtract(__pyx_v_start, __pyx_v_s); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 424, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_13);
+      __pyx_t_12 = __Pyx_PyInt_From_int(__pyx_v_w); if (unlikely(!__pyx_t_12)) __PYX_ERR(0, 424, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_12);
+      __pyx_t_8 = PyTuple_New(6); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 424, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_8);
+      __Pyx_GIVEREF(__pyx_t_5);
+      PyTuple_SET_ITEM(__pyx_t_8, 0, __pyx_t_5);
+      __Pyx_GIVEREF(__pyx_t_13);
+      PyTuple_SET_ITEM(__pyx_t_8, 1, __pyx_t_13);
+      __Pyx_GIVEREF(__pyx_t_12);
+      PyTuple_SET_ITEM(__pyx_t_8, 2, __pyx_t_12);
+      __Pyx_INCREF(__pyx_v_count);
+      __Pyx_GIVEREF(__pyx_v_count);
+      PyTuple_SET_ITEM(__pyx_t_8, 3, __pyx_v_count);
+      __Pyx_INCREF(__pyx_int_0);
+      __Pyx_GIVEREF(__pyx_int_0);
+      PyTuple_SET_ITEM(__pyx_t_8, 4, __pyx_int_0);
+      __Pyx_INCREF(__pyx_v_s);
+      __Pyx_GIVEREF(__pyx_v_s);
+      PyTuple_SET_ITEM(__pyx_t_8, 5, __pyx_v_s);
+      __pyx_t_5 = 0;
+      __pyx_t_13 = 0;
+      __pyx_t_12 = 0;
+      if (unlikely(__Pyx_ListComp_Append(__pyx_t_7, (PyObject*)__pyx_t_8))) __PYX_ERR(0, 424, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+    }
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+
+    /* "xpra/server/window/motion.pyx":425
+ *             scrolls, non_scroll, unchanged = r
+ *             return ([(x, start-s, w, count, 0, s) for start, count, s in scrolls],
+ *                     [(x, start, w, count) for start, count in non_scroll],             # <<<<<<<<<<<<<<
+ *                     unchanged)
+ *         if not horizontal:
+ */
+    __pyx_t_6 = PyList_New(0); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 425, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    if (likely(PyList_CheckExact(__pyx_v_non_scroll)) || PyTuple_CheckExact(__pyx_v_non_scroll)) {
+      __pyx_t_8 = __pyx_v_non_scroll; __Pyx_INCREF(__pyx_t_8); __pyx_t_10 = 0;
+      __pyx_t_11 = NULL;
+    } else {
+      __pyx_t_10 = -1; __pyx_t_8 = PyObject_GetIter(__pyx_v_non_scroll); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 425, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_8);
+      __pyx_t_11 = Py_TYPE(__pyx_t_8)->tp_iternext; if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 425, __pyx_L1_error)
+    }
+    for (;;) {
+      if (likely(!__pyx_t_11)) {
+        if (likely(PyList_CheckExact(__pyx_t_8))) {
+          if (__pyx_t_10 >= PyList_GET_SIZE(__pyx_t_8)) break;
+          #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+          __pyx_t_12 = PyList_GET_ITEM(__pyx_t_8, __pyx_t_10); __Pyx_INCREF(__pyx_t_12); __pyx_t_10++; if (unlikely(0 < 0)) __PYX_ERR(0, 425, __pyx_L1_error)
+          #else
+          __pyx_t_12 = PySequence_ITEM(__pyx_t_8, __pyx_t_10); __pyx_t_10++; if (unlikely(!__pyx_t_12)) __PYX_ERR(0, 425, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_12);
+          #endif
+        } else {
+          if (__pyx_t_10 >= PyTuple_GET_SIZE(__pyx_t_8)) break;
+          #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+          __pyx_t_12 = PyTuple_GET_ITEM(__pyx_t_8, __pyx_t_10); __Pyx_INCREF(__pyx_t_12); __pyx_t_10++; if (unlikely(0 < 0)) __PYX_ERR(0, 425, __pyx_L1_error)
+          #else
+          __pyx_t_12 = PySequence_ITEM(__pyx_t_8, __pyx_t_10); __pyx_t_10++; if (unlikely(!__pyx_t_12)) __PYX_ERR(0, 425, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_12);
+          #endif
+        }
+      } else {
+        __pyx_t_12 = __pyx_t_11(__pyx_t_8);
+        if (unlikely(!__pyx_t_12)) {
+          PyObject* exc_type = PyErr_Occurred();
+          if (exc_type) {
+            if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
+            else __PYX_ERR(0, 425, __pyx_L1_error)
+          }
+          break;
+        }
+        __Pyx_GOTREF(__pyx_t_12);
+      }
+      if ((likely(PyTuple_CheckExact(__pyx_t_12))) || (PyList_CheckExact(__pyx_t_12))) {
+        PyObject* sequence = __pyx_t_12;
+        Py_ssize_t size = __Pyx_PySequence_SIZE(sequence);
+        if (unlikely(size != 2)) {
+          if (size > 2) __Pyx_RaiseTooManyValuesError(2);
+          else if (size >= 0) __Pyx_RaiseNeedMoreValuesError(size);
+          __PYX_ERR(0, 425, __pyx_L1_error)
+        }
+        #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+        if (likely(PyTuple_CheckExact(sequence))) {
+          __pyx_t_13 = PyTuple_GET_ITEM(sequence, 0); 
+          __pyx_t_5 = PyTuple_GET_ITEM(sequence, 1); 
+        } else {
+          __pyx_t_13 = PyList_GET_ITEM(sequence, 0); 
+          __pyx_t_5 = PyList_GET_ITEM(sequence, 1); 
+        }
+        __Pyx_INCREF(__pyx_t_13);
+        __Pyx_INCREF(__pyx_t_5);
+        #else
+        __pyx_t_13 = PySequence_ITEM(sequence, 0); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 425, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_13);
+        __pyx_t_5 = PySequence_ITEM(sequence, 1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 425, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_5);
+        #endif
+        __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
+      } else {
+        Py_ssize_t index = -1;
+        __pyx_t_14 = PyObject_GetIter(__pyx_t_12); if (unlikely(!__pyx_t_14)) __PYX_ERR(0, 425, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_14);
+        __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
+        __pyx_t_9 = Py_TYPE(__pyx_t_14)->tp_iternext;
+        index = 0; __pyx_t_13 = __pyx_t_9(__pyx_t_14); if (unlikely(!__pyx_t_13)) goto __pyx_L15_unpacking_failed;
+        __Pyx_GOTREF(__pyx_t_13);
+        index = 1; __pyx_t_5 = __pyx_t_9(__pyx_t_14); if (unlikely(!__pyx_t_5)) goto __pyx_L15_unpacking_failed;
+        __Pyx_GOTREF(__pyx_t_5);
+        if (__Pyx_IternextUnpackEndCheck(__pyx_t_9(__pyx_t_14), 2) < 0) __PYX_ERR(0, 425, __pyx_L1_error)
+        __pyx_t_9 = NULL;
+        __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
+        goto __pyx_L16_unpacking_done;
+        __pyx_L15_unpacking_failed:;
+        __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
+        __pyx_t_9 = NULL;
+        if (__Pyx_IterFinish() == 0) __Pyx_RaiseNeedMoreValuesError(index);
+        __PYX_ERR(0, 425, __pyx_L1_error)
+        __pyx_L16_unpacking_done:;
+      }
+      __Pyx_XDECREF_SET(__pyx_v_start, __pyx_t_13);
+      __pyx_t_13 = 0;
+      __Pyx_XDECREF_SET(__pyx_v_count, __pyx_t_5);
+      __pyx_t_5 = 0;
+      __pyx_t_12 = __Pyx_PyInt_From_int(__pyx_v_x); if (unlikely(!__pyx_t_12)) __PYX_ERR(0, 425, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_12);
+      __pyx_t_5 = __Pyx_PyInt_From_int(__pyx_v_w); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 425, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_5);
+      __pyx_t_13 = PyTuple_New(4); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 425, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_13);
+      __Pyx_GIVEREF(__pyx_t_12);
+      PyTuple_SET_ITEM(__pyx_t_13, 0, __pyx_t_12);
+      __Pyx_INCREF(__pyx_v_start);
+      __Pyx_GIVEREF(__pyx_v_start);
+      PyTuple_SET_ITEM(__pyx_t_13, 1, __pyx_v_start);
+      __Pyx_GIVEREF(__pyx_t_5);
+      PyTuple_SET_ITEM(__pyx_t_13, 2, __pyx_t_5);
+      __Pyx_INCREF(__pyx_v_count);
+      __Pyx_GIVEREF(__pyx_v_count);
+      PyTuple_SET_ITEM(__pyx_t_13, 3, __pyx_v_count);
+      __pyx_t_12 = 0;
+      __pyx_t_5 = 0;
+      if (unlikely(__Pyx_ListComp_Append(__pyx_t_6, (PyObject*)__pyx_t_13))) __PYX_ERR(0, 425, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
+    }
+    __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+
+    /* "xpra/server/window/motion.pyx":424
+ *         if r:
+ *             scrolls, non_scroll, unchanged = r
+ *             return ([(x, start-s, w, count, 0, s) for start, count, s in scrolls],             # <<<<<<<<<<<<<<
+ *                     [(x, start, w, count) for start, count in non_scroll],
+ *                     unchanged)
+ */
+    __pyx_t_8 = PyTuple_New(3); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 424, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_8);
+    __Pyx_GIVEREF(__pyx_t_7);
+    PyTuple_SET_ITEM(__pyx_t_8, 0, __pyx_t_7);
+    __Pyx_GIVEREF(__pyx_t_6);
+    PyTuple_SET_ITEM(__pyx_t_8, 1, __pyx_t_6);
+    __Pyx_INCREF(__pyx_v_unchanged);
+    __Pyx_GIVEREF(__pyx_v_unchanged);
+    PyTuple_SET_ITEM(__pyx_t_8, 2, __pyx_v_unchanged);
+    __pyx_t_7 = 0;
+    __pyx_t_6 = 0;
+    __pyx_r = __pyx_t_8;
+    __pyx_t_8 = 0;
+    goto __pyx_L0;
+
+    /* "xpra/server/window/motion.pyx":422
+ *             return None
+ *         r = match_lines(self.old_row_hashes, self.old_row_known, self.row_hashes, self.height, y, y+h, max_distance, min_percent)
+ *         if r:             # <<<<<<<<<<<<<<
+ *             scrolls, non_scroll, unchanged = r
+ *             return ([(x, start-s, w, count, 0, s) for start, count, s in scrolls],
+ */
+  }
+
+  /* "xpra/server/window/motion.pyx":427
+ *                     [(x, start, w, count) for start, count in non_scroll],
+ *                     unchanged)
+ *         if not horizontal:             # <<<<<<<<<<<<<<
+ *             return None
+ *         #try to find columns that have moved, the region must be the same,
+ */
+  __pyx_t_3 = ((!(__pyx_v_horizontal != 0)) != 0);
+  if (__pyx_t_3) {
+
+    /* "xpra/server/window/motion.pyx":428
+ *                     unchanged)
+ *         if not horizontal:
+ *             return None             # <<<<<<<<<<<<<<
+ *         #try to find columns that have moved, the region must be the same,
+ *         #so this only works if the previous update also needed the column hashes:
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+    goto __pyx_L0;
+
+    /* "xpra/server/window/motion.pyx":427
+ *                     [(x, start, w, count) for start, count in non_scroll],
+ *                     unchanged)
+ *         if not horizontal:             # <<<<<<<<<<<<<<
+ *             return None
+ *         #try to find columns that have moved, the region must be the same,
+ */
+  }
+
+  /* "xpra/server/window/motion.pyx":431
+ *         #try to find columns that have moved, the region must be the same,
+ *         #so this only works if the previous update also needed the column hashes:
+ *         if not self.hash_columns():             # <<<<<<<<<<<<<<
+ *             return None
+ *         cdef int i
+ */
+  __pyx_t_3 = ((!(((struct __pyx_vtabstruct_4xpra_6server_6window_6motion_ScrollData *)__pyx_v_self->__pyx_vtab)->hash_columns(__pyx_v_self) != 0)) != 0);
+  if (__pyx_t_3) {
+
+    /* "xpra/server/window/motion.pyx":432
+ *         #so this only works if the previous update also needed the column hashes:
+ *         if not self.hash_columns():
+ *             return None             # <<<<<<<<<<<<<<
+ *         cdef int i
+ *         for i in range(4):
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+    goto __pyx_L0;
+
+    /* "xpra/server/window/motion.pyx":431
+ *         #try to find columns that have moved, the region must be the same,
+ *         #so this only works if the previous update also needed the column hashes:
+ *         if not self.hash_columns():             # <<<<<<<<<<<<<<
+ *             return None
+ *         cdef int i
+ */
+  }
+
+  /* "xpra/server/window/motion.pyx":434
+ *             return None
+ *         cdef int i
+ *         for i in range(4):             # <<<<<<<<<<<<<<
+ *             if self.col_geometry[i]!=self.old_col_geometry[i]:
+ *                 return None
+ */
+  for (__pyx_t_1 = 0; __pyx_t_1 < 4; __pyx_t_1+=1) {
+    __pyx_v_i = __pyx_t_1;
+
+    /* "xpra/server/window/motion.pyx":435
+ *         cdef int i
+ *         for i in range(4):
+ *             if self.col_geometry[i]!=self.old_col_geometry[i]:             # <<<<<<<<<<<<<<
+ *                 return None
+ *         if self.col_geometry[2]==0:
+ */
+    __pyx_t_3 = (((__pyx_v_self->col_geometry[__pyx_v_i]) != (__pyx_v_self->old_col_geometry[__pyx_v_i])) != 0);
+    if (__pyx_t_3) {
+
+      /* "xpra/server/window/motion.pyx":436
+ *         for i in range(4):
+ *             if self.col_geometry[i]!=self.old_col_geometry[i]:
+ *                 return None             # <<<<<<<<<<<<<<
+ *         if self.col_geometry[2]==0:
+ *             return None
+ */
+      __Pyx_XDECREF(__pyx_r);
+      __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+      goto __pyx_L0;
+
+      /* "xpra/server/window/motion.pyx":435
+ *         cdef int i
+ *         for i in range(4):
+ *             if self.col_geometry[i]!=self.old_col_geometry[i]:             # <<<<<<<<<<<<<<
+ *                 return None
+ *         if self.col_geometry[2]==0:
+ */
+    }
+  }
+
+  /* "xpra/server/window/motion.pyx":437
+ *             if self.col_geometry[i]!=self.old_col_geometry[i]:
+ *                 return None
+ *         if self.col_geometry[2]==0:             # <<<<<<<<<<<<<<
+ *             return None
+ *         r = match_lines(self.old_col_hashes, NULL, self.col_hashes, w, 0, w, max_distance, min_percent)
+ */
+  __pyx_t_3 = (((__pyx_v_self->col_geometry[2]) == 0) != 0);
+  if (__pyx_t_3) {
+
+    /* "xpra/server/window/motion.pyx":438
+ *                 return None
+ *         if self.col_geometry[2]==0:
+ *             return None             # <<<<<<<<<<<<<<
+ *         r = match_lines(self.old_col_hashes, NULL, self.col_hashes, w, 0, w, max_distance, min_percent)
+ *         if not r:
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+    goto __pyx_L0;
+
+    /* "xpra/server/window/motion.pyx":437
+ *             if self.col_geometry[i]!=self.old_col_geometry[i]:
+ *                 return None
+ *         if self.col_geometry[2]==0:             # <<<<<<<<<<<<<<
+ *             return None
+ *         r = match_lines(self.old_col_hashes, NULL, self.col_hashes, w, 0, w, max_distance, min_percent)
+ */
+  }
+
+  /* "xpra/server/window/motion.pyx":439
+ *         if self.col_geometry[2]==0:
+ *             return None
+ *         r = match_lines(self.old_col_hashes, NULL, self.col_hashes, w, 0, w, max_distance, min_percent)             # <<<<<<<<<<<<<<
+ *         if not r:
+ *             return None
+ */
+  __pyx_t_8 = __pyx_f_4xpra_6server_6window_6motion_match_lines(__pyx_v_self->old_col_hashes, NULL, __pyx_v_self->col_hashes, __pyx_v_w, 0, __pyx_v_w, __pyx_v_max_distance, __pyx_v_min_percent); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 439, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_8);
+  __Pyx_DECREF_SET(__pyx_v_r, __pyx_t_8);
+  __pyx_t_8 = 0;
+
+  /* "xpra/server/window/motion.pyx":440
+ *             return None
+ *         r = match_lines(self.old_col_hashes, NULL, self.col_hashes, w, 0, w, max_distance, min_percent)
+ *         if not r:             # <<<<<<<<<<<<<<
+ *             return None
+ *         scrolls, non_scroll, unchanged = r
+ */
+  __pyx_t_3 = __Pyx_PyObject_IsTrue(__pyx_v_r); if (unlikely(__pyx_t_3 < 0)) __PYX_ERR(0, 440, __pyx_L1_error)
+  __pyx_t_4 = ((!__pyx_t_3) != 0);
+  if (__pyx_t_4) {
+
+    /* "xpra/server/window/motion.pyx":441
+ *         r = match_lines(self.old_col_hashes, NULL, self.col_hashes, w, 0, w, max_distance, min_percent)
+ *         if not r:
+ *             return None             # <<<<<<<<<<<<<<
+ *         scrolls, non_scroll, unchanged = r
+ *         return ([(x+start-s, y, count, h, s, 0) for start, count, s in scrolls],
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+    goto __pyx_L0;
+
+    /* "xpra/server/window/motion.pyx":440
+ *             return None
+ *         r = match_lines(self.old_col_hashes, NULL, self.col_hashes, w, 0, w, max_distance, min_percent)
+ *         if not r:             # <<<<<<<<<<<<<<
+ *             return None
+ *         scrolls, non_scroll, unchanged = r
+ */
+  }
+
+  /* "xpra/server/window/motion.pyx":442
+ *         if not r:
+ *             return None
+ *         scrolls, non_scroll, unchanged = r             # <<<<<<<<<<<<<<
+ *         return ([(x+start-s, y, count, h, s, 0) for start, count, s in scrolls],
+ *                 [(x+start, y, count, h) for start, count in non_scroll],
+ */
+  if ((likely(PyTuple_CheckExact(__pyx_v_r))) || (PyList_CheckExact(__pyx_v_r))) {
+    PyObject* sequence = __pyx_v_r;
+    Py_ssize_t size = __Pyx_PySequence_SIZE(sequence);
+    if (unlikely(size != 3)) {
+      if (size > 3) __Pyx_RaiseTooManyValuesError(3);
+      else if (size >= 0) __Pyx_RaiseNeedMoreValuesError(size);
+      __PYX_ERR(0, 442, __pyx_L1_error)
+    }
+    #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+    if (likely(PyTuple_CheckExact(sequence))) {
+      __pyx_t_8 = PyTuple_GET_ITEM(sequence, 0); 
+      __pyx_t_6 = PyTuple_GET_ITEM(sequence, 1); 
+      __pyx_t_7 = PyTuple_GET_ITEM(sequence, 2); 
+    } else {
+      __pyx_t_8 = PyList_GET_ITEM(sequence, 0); 
+      __pyx_t_6 = PyList_GET_ITEM(sequence, 1); 
+      __pyx_t_7 = PyList_GET_ITEM(sequence, 2); 
+    }
+    __Pyx_INCREF(__pyx_t_8);
+    __Pyx_INCREF(__pyx_t_6);
+    __Pyx_INCREF(__pyx_t_7);
+    #else
+    __pyx_t_8 = PySequence_ITEM(sequence, 0); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 442, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_8);
+    __pyx_t_6 = PySequence_ITEM(sequence, 1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 442, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __pyx_t_7 = PySequence_ITEM(sequence, 2); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 442, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_7);
+    #endif
+  } else {
+    Py_ssize_t index = -1;
+    __pyx_t_13 = PyObject_GetIter(__pyx_v_r); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 442, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_13);
+    __pyx_t_9 = Py_TYPE(__pyx_t_13)->tp_iternext;
+    index = 0; __pyx_t_8 = __pyx_t_9(__pyx_t_13); if (unlikely(!__pyx_t_8)) goto __pyx_L24_unpacking_failed;
+    __Pyx_GOTREF(__pyx_t_8);
+    index = 1; __pyx_t_6 = __pyx_t_9(__pyx_t_13); if (unlikely(!__pyx_t_6)) goto __pyx_L24_unpacking_failed;
+    __Pyx_GOTREF(__pyx_t_6);
+    index = 2; __pyx_t_7 = __pyx_t_9(__pyx_t_13); if (unlikely(!__pyx_t_7)) goto __pyx_L24_unpacking_failed;
+    __Pyx_GOTREF(__pyx_t_7);
+    if (__Pyx_IternextUnpackEndCheck(__pyx_t_9(__pyx_t_13), 3) < 0) __PYX_ERR(0, 442, __pyx_L1_error)
+    __pyx_t_9 = NULL;
+    __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
+    goto __pyx_L25_unpacking_done;
+    __pyx_L24_unpacking_failed:;
+    __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
+    __pyx_t_9 = NULL;
+    if (__Pyx_IterFinish() == 0) __Pyx_RaiseNeedMoreValuesError(index);
+    __PYX_ERR(0, 442, __pyx_L1_error)
+    __pyx_L25_unpacking_done:;
+  }
+  __pyx_v_scrolls = __pyx_t_8;
+  __pyx_t_8 = 0;
+  __pyx_v_non_scroll = __pyx_t_6;
+  __pyx_t_6 = 0;
+  __pyx_v_unchanged = __pyx_t_7;
+  __pyx_t_7 = 0;
+
+  /* "xpra/server/window/motion.pyx":443
+ *             return None
+ *         scrolls, non_scroll, unchanged = r
+ *         return ([(x+start-s, y, count, h, s, 0) for start, count, s in scrolls],             # <<<<<<<<<<<<<<
+ *                 [(x+start, y, count, h) for start, count in non_scroll],
+ *                 unchanged)
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_7 = PyList_New(0); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 443, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_7);
+  if (likely(PyList_CheckExact(__pyx_v_scrolls)) || PyTuple_CheckExact(__pyx_v_scrolls)) {
+    __pyx_t_6 = __pyx_v_scrolls; __Pyx_INCREF(__pyx_t_6); __pyx_t_10 = 0;
+    __pyx_t_11 = NULL;
+  } else {
+    __pyx_t_10 = -1; __pyx_t_6 = PyObject_GetIter(__pyx_v_scrolls); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 443, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __pyx_t_11 = Py_TYPE(__pyx_t_6)->tp_iternext; if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 443, __pyx_L1_error)
+  }
+  for (;;) {
+    if (likely(!__pyx_t_11)) {
+      if (likely(PyList_CheckExact(__pyx_t_6))) {
+        if (__pyx_t_10 >= PyList_GET_SIZE(__pyx_t_6)) break;
+        #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+        __pyx_t_8 = PyList_GET_ITEM(__pyx_t_6, __pyx_t_10); __Pyx_INCREF(__pyx_t_8); __pyx_t_10++; if (unlikely(0 < 0)) __PYX_ERR(0, 443, __pyx_L1_error)
+        #else
+        __pyx_t_8 = PySequence_ITEM(__pyx_t_6, __pyx_t_10); __pyx_t_10++; if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 443, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_8);
+        #endif
+      } else {
+        if (__pyx_t_10 >= PyTuple_GET_SIZE(__pyx_t_6)) break;
+        #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+        __pyx_t_8 = PyTuple_GET_ITEM(__pyx_t_6, __pyx_t_10); __Pyx_INCREF(__pyx_t_8); __pyx_t_10++; if (unlikely(0 < 0)) __PYX_ERR(0, 443, __pyx_L1_error)
+        #else
+        __pyx_t_8 = PySequence_ITEM(__pyx_t_6, __pyx_t_10); __pyx_t_10++; if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 443, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_8);
+        #endif
+      }
+    } else {
+      __pyx_t_8 = __pyx_t_11(__pyx_t_6);
+      if (unlikely(!__pyx_t_8)) {
+        PyObject* exc_type = PyErr_Occurred();
+        if (exc_type) {
+          if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
+          else __PYX_ERR(0, 443, __pyx_L1_error)
+        }
+        break;
+      }
+      __Pyx_GOTREF(__pyx_t_8);
+    }
+    if ((likely(PyTuple_CheckExact(__pyx_t_8))) || (PyList_CheckExact(__pyx_t_8))) {
+      PyObject* sequence = __pyx_t_8;
+      Py_ssize_t size = __Pyx_PySequence_SIZE(sequence);
+      if (unlikely(size != 3)) {
+        if (size > 3) __Pyx_RaiseTooManyValuesError(3);
+        else if (size >= 0) __Pyx_RaiseNeedMoreValuesError(size);
+        __PYX_ERR(0, 443, __pyx_L1_error)
+      }
+      #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+      if (likely(PyTuple_CheckExact(sequence))) {
+        __pyx_t_13 = PyTuple_GET_ITEM(sequence, 0); 
+        __pyx_t_5 = PyTuple_GET_ITEM(sequence, 1); 
+        __pyx_t_12 = PyTuple_GET_ITEM(sequence, 2); 
+      } else {
+        __pyx_t_13 = PyList_GET_ITEM(sequence, 0); 
+        __pyx_t_5 = PyList_GET_ITEM(sequence, 1); 
+        __pyx_t_12 = PyList_GET_ITEM(sequence, 2); 
+      }
+      __Pyx_INCREF(__pyx_t_13);
+      __Pyx_INCREF(__pyx_t_5);
+      __Pyx_INCREF(__pyx_t_12);
+      #else
+      __pyx_t_13 = PySequence_ITEM(sequence, 0); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 443, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_13);
+      __pyx_t_5 = PySequence_ITEM(sequence, 1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 443, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_5);
+      __pyx_t_12 = PySequence_ITEM(sequence, 2); if (unlikely(!__pyx_t_12)) __PYX_ERR(0, 443, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_12);
+      #endif
+      __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+    } else {
+      Py_ssize_t index = -1;
+      __pyx_t_14 = PyObject_GetIter(__pyx_t_8); if (unlikely(!__pyx_t_14)) __PYX_ERR(0, 443, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_14);
+      __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+      __pyx_t_9 = Py_TYPE(__pyx_t_14)->tp_iternext;
+      index = 0; __pyx_t_13 = __pyx_t_9(__pyx_t_14); if (unlikely(!__pyx_t_13)) goto __pyx_L28_unpacking_failed;
+      __Pyx_GOTREF(__pyx_t_13);
+      index = 1; __pyx_t_5 = __pyx_t_9(__pyx_t_14); if (unlikely(!__pyx_t_5)) goto __pyx_L28_unpacking_failed;
+      __Pyx_GOTREF(__pyx_t_5);
+      index = 2; __pyx_t_12 = __pyx_t_9(__pyx_t_14); if (unlikely(!__pyx_t_12)) goto __pyx_L28_unpacking_failed;
+      __Pyx_GOTREF(__pyx_t_12);
+      if (__Pyx_IternextUnpackEndCheck(__pyx_t_9(__pyx_t_14), 3) < 0) __PYX_ERR(0, 443, __pyx_L1_error)
+      __pyx_t_9 = NULL;
+      __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
+      goto __pyx_L29_unpacking_done;
+      __pyx_L28_unpacking_failed:;
+      __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
+      __pyx_t_9 = NULL;
+      if (__Pyx_IterFinish() == 0) __Pyx_RaiseNeedMoreValuesError(index);
+      __PYX_ERR(0, 443, __pyx_L1_error)
+      __pyx_L29_unpacking_done:;
+    }
+    __Pyx_XDECREF_SET(__pyx_v_start, __pyx_t_13);
+    __pyx_t_13 = 0;
+    __Pyx_XDECREF_SET(__pyx_v_count, __pyx_t_5);
+    __pyx_t_5 = 0;
+    __Pyx_XDECREF_SET(__pyx_v_s, __pyx_t_12);
+    __pyx_t_12 = 0;
+    __pyx_t_8 = __Pyx_PyInt_From_int(__pyx_v_x); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 443, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_8);
+    __pyx_t_12 = PyNumber_Add(__pyx_t_8, __pyx_v_start); if (unlikely(!__pyx_t_12)) __PYX_ERR(0, 443, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_12);
+    __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+    __pyx_t_8 = PyNumber_Subtract(__pyx_t_12, __pyx_v_s); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 443, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_8);
+    __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
+    __pyx_t_12 = __Pyx_PyInt_From_int(__pyx_v_y); if (unlikely(!__pyx_t_12)) __PYX_ERR(0, 443, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_12);
+    __pyx_t_5 = __Pyx_PyInt_From_int(__pyx_v_h); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 443, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __pyx_t_13 = PyTuple_New(6); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 443, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_13);
+    __Pyx_GIVEREF(__pyx_t_8);
+    PyTuple_SET_ITEM(__pyx_t_13, 0, __pyx_t_8);
+    __Pyx_GIVEREF(__pyx_t_12);
+    PyTuple_SET_ITEM(__pyx_t_13, 1, __pyx_t_12);
+    __Pyx_INCREF(__pyx_v_count);
+    __Pyx_GIVEREF(__pyx_v_count);
+    PyTuple_SET_ITEM(__pyx_t_13, 2, __pyx_v_count);
+    __Pyx_GIVEREF(__pyx_t_5);
+    PyTuple_SET_ITEM(__pyx_t_13, 3, __pyx_t_5);
+    __Pyx_INCREF(__pyx_v_s);
+    __Pyx_GIVEREF(__pyx_v_s);
+    PyTuple_SET_ITEM(__pyx_t_13, 4, __pyx_v_s);
+    __Pyx_INCREF(__pyx_int_0);
+    __Pyx_GIVEREF(__pyx_int_0);
+    PyTuple_SET_ITEM(__pyx_t_13, 5, __pyx_int_0);
+    __pyx_t_8 = 0;
+    __pyx_t_12 = 0;
+    __pyx_t_5 = 0;
+    if (unlikely(__Pyx_ListComp_Append(__pyx_t_7, (PyObject*)__pyx_t_13))) __PYX_ERR(0, 443, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
+  }
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+
+  /* "xpra/server/window/motion.pyx":444
+ *         scrolls, non_scroll, unchanged = r
+ *         return ([(x+start-s, y, count, h, s, 0) for start, count, s in scrolls],
+ *                 [(x+start, y, count, h) for start, count in non_scroll],             # <<<<<<<<<<<<<<
+ *                 unchanged)
+ */
+  __pyx_t_6 = PyList_New(0); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 444, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  if (likely(PyList_CheckExact(__pyx_v_non_scroll)) || PyTuple_CheckExact(__pyx_v_non_scroll)) {
+    __pyx_t_13 = __pyx_v_non_scroll; __Pyx_INCREF(__pyx_t_13); __pyx_t_10 = 0;
+    __pyx_t_11 = NULL;
+  } else {
+    __pyx_t_10 = -1; __pyx_t_13 = PyObject_GetIter(__pyx_v_non_scroll); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 444, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_13);
+    __pyx_t_11 = Py_TYPE(__pyx_t_13)->tp_iternext; if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 444, __pyx_L1_error)
+  }
+  for (;;) {
+    if (likely(!__pyx_t_11)) {
+      if (likely(PyList_CheckExact(__pyx_t_13))) {
+        if (__pyx_t_10 >= PyList_GET_SIZE(__pyx_t_13)) break;
+        #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+        __pyx_t_5 = PyList_GET_ITEM(__pyx_t_13, __pyx_t_10); __Pyx_INCREF(__pyx_t_5); __pyx_t_10++; if (unlikely(0 < 0)) __PYX_ERR(0, 444, __pyx_L1_error)
+        #else
+        __pyx_t_5 = PySequence_ITEM(__pyx_t_13, __pyx_t_10); __pyx_t_10++; if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 444, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_5);
+        #endif
+      } else {
+        if (__pyx_t_10 >= PyTuple_GET_SIZE(__pyx_t_13)) break;
+        #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+        __pyx_t_5 = PyTuple_GET_ITEM(__pyx_t_13, __pyx_t_10); __Pyx_INCREF(__pyx_t_5); __pyx_t_10++; if (unlikely(0 < 0)) __PYX_ERR(0, 444, __pyx_L1_error)
+        #else
+        __pyx_t_5 = PySequence_ITEM(__pyx_t_13, __pyx_t_10); __pyx_t_10++; if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 444, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_5);
+        #endif
+      }
+    } else {
+      __pyx_t_5 = __pyx_t_11(__pyx_t_13);
+      if (unlikely(!__pyx_t_5)) {
+        PyObject* exc_type = PyErr_Occurred();
+        if (exc_type) {
+          if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
+          else __PYX_ERR(0, 444, __pyx_L1_error)
+        }
+        break;
+      }
+      __Pyx_GOTREF(__pyx_t_5);
+    }
+    if ((likely(PyTuple_CheckExact(__pyx_t_5))) || (PyList_CheckExact(__pyx_t_5))) {
+      PyObject* sequence = __pyx_t_5;
+      Py_ssize_t size = __Pyx_PySequence_SIZE(sequence);
+      if (unlikely(size != 2)) {
+        if (size > 2) __Pyx_RaiseTooManyValuesError(2);
+        else if (size >= 0) __Pyx_RaiseNeedMoreValuesError(size);
+        __PYX_ERR(0, 444, __pyx_L1_error)
+      }
+      #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+      if (likely(PyTuple_CheckExact(sequence))) {
+        __pyx_t_12 = PyTuple_GET_ITEM(sequence, 0); 
+        __pyx_t_8 = PyTuple_GET_ITEM(sequence, 1); 
+      } else {
+        __pyx_t_12 = PyList_GET_ITEM(sequence, 0); 
+        __pyx_t_8 = PyList_GET_ITEM(sequence, 1); 
+      }
+      __Pyx_INCREF(__pyx_t_12);
+      __Pyx_INCREF(__pyx_t_8);
+      #else
+      __pyx_t_12 = PySequence_ITEM(sequence, 0); if (unlikely(!__pyx_t_12)) __PYX_ERR(0, 444, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_12);
+      __pyx_t_8 = PySequence_ITEM(sequence, 1); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 444, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_8);
+      #endif
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    } else {
+      Py_ssize_t index = -1;
+      __pyx_t_14 = PyObject_GetIter(__pyx_t_5); if (unlikely(!__pyx_t_14)) __PYX_ERR(0, 444, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_14);
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      __pyx_t_9 = Py_TYPE(__pyx_t_14)->tp_iternext;
+      index = 0; __pyx_t_12 = __pyx_t_9(__pyx_t_14); if (unlikely(!__pyx_t_12)) goto __pyx_L32_unpacking_failed;
+      __Pyx_GOTREF(__pyx_t_12);
+      index = 1; __pyx_t_8 = __pyx_t_9(__pyx_t_14); if (unlikely(!__pyx_t_8)) goto __pyx_L32_unpacking_failed;
+      __Pyx_GOTREF(__pyx_t_8);
+      if (__Pyx_IternextUnpackEndCheck(__pyx_t_9(__pyx_t_14), 2) < 0) __PYX_ERR(0, 444, __pyx_L1_error)
+      __pyx_t_9 = NULL;
+      __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
+      goto __pyx_L33_unpacking_done;
+      __pyx_L32_unpacking_failed:;
+      __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
+      __pyx_t_9 = NULL;
+      if (__Pyx_IterFinish() == 0) __Pyx_RaiseNeedMoreValuesError(index);
+      __PYX_ERR(0, 444, __pyx_L1_error)
+      __pyx_L33_unpacking_done:;
+    }
+    __Pyx_XDECREF_SET(__pyx_v_start, __pyx_t_12);
+    __pyx_t_12 = 0;
+    __Pyx_XDECREF_SET(__pyx_v_count, __pyx_t_8);
+    __pyx_t_8 = 0;
+    __pyx_t_5 = __Pyx_PyInt_From_int(__pyx_v_x); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 444, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __pyx_t_8 = PyNumber_Add(__pyx_t_5, __pyx_v_start); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 444, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_8);
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __pyx_t_5 = __Pyx_PyInt_From_int(__pyx_v_y); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 444, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __pyx_t_12 = __Pyx_PyInt_From_int(__pyx_v_h); if (unlikely(!__pyx_t_12)) __PYX_ERR(0, 444, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_12);
+    __pyx_t_14 = PyTuple_New(4); if (unlikely(!__pyx_t_14)) __PYX_ERR(0, 444, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_14);
+    __Pyx_GIVEREF(__pyx_t_8);
+    PyTuple_SET_ITEM(__pyx_t_14, 0, __pyx_t_8);
+    __Pyx_GIVEREF(__pyx_t_5);
+    PyTuple_SET_ITEM(__pyx_t_14, 1, __pyx_t_5);
+    __Pyx_INCREF(__pyx_v_count);
+    __Pyx_GIVEREF(__pyx_v_count);
+    PyTuple_SET_ITEM(__pyx_t_14, 2, __pyx_v_count);
+    __Pyx_GIVEREF(__pyx_t_12);
+    PyTuple_SET_ITEM(__pyx_t_14, 3, __pyx_t_12);
+    __pyx_t_8 = 0;
+    __pyx_t_5 = 0;
+    __pyx_t_12 = 0;
+    if (unlikely(__Pyx_ListComp_Append(__pyx_t_6, (PyObject*)__pyx_t_14))) __PYX_ERR(0, 444, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
+  }
+  __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
+
+  /* "xpra/server/window/motion.pyx":443
+ *             return None
+ *         scrolls, non_scroll, unchanged = r
+ *         return ([(x+start-s, y, count, h, s, 0) for start, count, s in scrolls],             # <<<<<<<<<<<<<<
+ *                 [(x+start, y, count, h) for start, count in non_scroll],
+ *                 unchanged)
+ */
+  __pyx_t_13 = PyTuple_New(3); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 443, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_13);
+  __Pyx_GIVEREF(__pyx_t_7);
+  PyTuple_SET_ITEM(__pyx_t_13, 0, __pyx_t_7);
+  __Pyx_GIVEREF(__pyx_t_6);
+  PyTuple_SET_ITEM(__pyx_t_13, 1, __pyx_t_6);
+  __Pyx_INCREF(__pyx_v_unchanged);
+  __Pyx_GIVEREF(__pyx_v_unchanged);
+  PyTuple_SET_ITEM(__pyx_t_13, 2, __pyx_v_unchanged);
+  __pyx_t_7 = 0;
+  __pyx_t_6 = 0;
+  __pyx_r = __pyx_t_13;
+  __pyx_t_13 = 0;
+  goto __pyx_L0;
+
+  /* "xpra/server/window/motion.pyx":414
+ *             self.pixels = None
+ * 
+ *     cdef do_detect(self, int min_percent, int max_distance, int horizontal):             # <<<<<<<<<<<<<<
+ *         cdef int x = self.x
+ *         cdef int y = self.update_y
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_XDECREF(__pyx_t_8);
+  __Pyx_XDECREF(__pyx_t_12);
+  __Pyx_XDECREF(__pyx_t_13);
+  __Pyx_XDECREF(__pyx_t_14);
+  __Pyx_AddTraceback("xpra.server.window.motion.ScrollData.do_detect", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_r);
+  __Pyx_XDECREF(__pyx_v_scrolls);
+  __Pyx_XDECREF(__pyx_v_non_scroll);
+  __Pyx_XDECREF(__pyx_v_unchanged);
+  __Pyx_XDECREF(__pyx_v_start);
+  __Pyx_XDECREF(__pyx_v_count);
+  __Pyx_XDECREF(__pyx_v_s);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "xpra/server/window/motion.pyx":264
+ *         and we also hash the columns of the region to detect horizontal scrolling.
+ *     """
+ *     cdef readonly unsigned int width             # <<<<<<<<<<<<<<
+ *     cdef readonly unsigned int height
+ *     cdef int x                          #the columns used for hashing the rows
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_4xpra_6server_6window_6motion_10ScrollData_5width_1__get__(PyObject *__pyx_v_self); /*proto*/
+static PyObject *__pyx_pw_4xpra_6server_6window_6motion_10ScrollData_5width_1__get__(PyObject *__pyx_v_self) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__get__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_4xpra_6server_6window_6motion_10ScrollData_5width___get__(((struct __pyx_obj_4xpra_6server_6window_6motion_ScrollData *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_4xpra_6server_6window_6motion_10ScrollData_5width___get__(struct __pyx_obj_4xpra_6server_6window_6motion_ScrollData *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__get__", 0);
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __Pyx_PyInt_From_unsigned_int(__pyx_v_self->width); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 264, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("xpra.server.window.motion.ScrollData.width.__get__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "xpra/server/window/motion.pyx":265
+ *     """
+ *     cdef readonly unsigned int width
+ *     cdef readonly unsigned int height             # <<<<<<<<<<<<<<
+ *     cdef int x                          #the columns used for hashing the rows
+ *     cdef unsigned int w
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_4xpra_6server_6window_6motion_10ScrollData_6height_1__get__(PyObject *__pyx_v_self); /*proto*/
+static PyObject *__pyx_pw_4xpra_6server_6window_6motion_10ScrollData_6height_1__get__(PyObject *__pyx_v_self) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__get__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_4xpra_6server_6window_6motion_10ScrollData_6height___get__(((struct __pyx_obj_4xpra_6server_6window_6motion_ScrollData *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_4xpra_6server_6window_6motion_10ScrollData_6height___get__(struct __pyx_obj_4xpra_6server_6window_6motion_ScrollData *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__get__", 0);
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __Pyx_PyInt_From_unsigned_int(__pyx_v_self->height); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 265, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("xpra.server.window.motion.ScrollData.height.__get__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "(tree fragment)":1
+ * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
+ * def __setstate_cython__(self, __pyx_state):
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_4xpra_6server_6window_6motion_10ScrollData_15__reduce_cython__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static PyObject *__pyx_pw_4xpra_6server_6window_6motion_10ScrollData_15__reduce_cython__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__reduce_cython__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_4xpra_6server_6window_6motion_10ScrollData_14__reduce_cython__(((struct __pyx_obj_4xpra_6server_6window_6motion_ScrollData *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_4xpra_6server_6window_6motion_10ScrollData_14__reduce_cython__(CYTHON_UNUSED struct __pyx_obj_4xpra_6server_6window_6motion_ScrollData *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__reduce_cython__", 0);
+
+  /* "(tree fragment)":2
+ * def __reduce_cython__(self):
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")             # <<<<<<<<<<<<<<
+ * def __setstate_cython__(self, __pyx_state):
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple_, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 2, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_Raise(__pyx_t_1, 0, 0, 0);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __PYX_ERR(1, 2, __pyx_L1_error)
+
+  /* "(tree fragment)":1
+ * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
+ * def __setstate_cython__(self, __pyx_state):
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("xpra.server.window.motion.ScrollData.__reduce_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "(tree fragment)":3
+ * def __reduce_cython__(self):
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
+ * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_4xpra_6server_6window_6motion_10ScrollData_17__setstate_cython__(PyObject *__pyx_v_self, PyObject *__pyx_v___pyx_state); /*proto*/
+static PyObject *__pyx_pw_4xpra_6server_6window_6motion_10ScrollData_17__setstate_cython__(PyObject *__pyx_v_self, PyObject *__pyx_v___pyx_state) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__setstate_cython__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_4xpra_6server_6window_6motion_10ScrollData_16__setstate_cython__(((struct __pyx_obj_4xpra_6server_6window_6motion_ScrollData *)__pyx_v_self), ((PyObject *)__pyx_v___pyx_state));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_4xpra_6server_6window_6motion_10ScrollData_16__setstate_cython__(CYTHON_UNUSED struct __pyx_obj_4xpra_6server_6window_6motion_ScrollData *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v___pyx_state) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__setstate_cython__", 0);
+
+  /* "(tree fragment)":4
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
+ * def __setstate_cython__(self, __pyx_state):
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")             # <<<<<<<<<<<<<<
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__2, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 4, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_Raise(__pyx_t_1, 0, 0, 0);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __PYX_ERR(1, 4, __pyx_L1_error)
+
+  /* "(tree fragment)":3
+ * def __reduce_cython__(self):
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
+ * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("xpra.server.window.motion.ScrollData.__setstate_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+static struct __pyx_vtabstruct_4xpra_6server_6window_6motion_ScrollData __pyx_vtable_4xpra_6server_6window_6motion_ScrollData;
+
+static PyObject *__pyx_tp_new_4xpra_6server_6window_6motion_ScrollData(PyTypeObject *t, PyObject *a, PyObject *k) {
+  struct __pyx_obj_4xpra_6server_6window_6motion_ScrollData *p;
+  PyObject *o;
+  if (likely((t->tp_flags & Py_TPFLAGS_IS_ABSTRACT) == 0)) {
+    o = (*t->tp_alloc)(t, 0);
+  } else {
+    o = (PyObject *) PyBaseObject_Type.tp_new(t, __pyx_empty_tuple, 0);
+  }
+  if (unlikely(!o)) return 0;
+  p = ((struct __pyx_obj_4xpra_6server_6window_6motion_ScrollData *)o);
+  p->__pyx_vtab = __pyx_vtabptr_4xpra_6server_6window_6motion_ScrollData;
+  p->pixels = Py_None; Py_INCREF(Py_None);
+  if (unlikely(__pyx_pw_4xpra_6server_6window_6motion_10ScrollData_1__cinit__(o, a, k) < 0)) goto bad;
+  return o;
+  bad:
+  Py_DECREF(o); o = 0;
+  return NULL;
+}
+
+static void __pyx_tp_dealloc_4xpra_6server_6window_6motion_ScrollData(PyObject *o) {
+  struct __pyx_obj_4xpra_6server_6window_6motion_ScrollData *p = (struct __pyx_obj_4xpra_6server_6window_6motion_ScrollData *)o;
+  #if CYTHON_USE_TP_FINALIZE
+  if (unlikely(PyType_HasFeature(Py_TYPE(o), Py_TPFLAGS_HAVE_FINALIZE) && Py_TYPE(o)->tp_finalize) && !__Pyx_PyObject_GC_IsFinalized(o)) {
+    if (PyObject_CallFinalizerFromDealloc(o)) return;
+  }
+  #endif
+  PyObject_GC_UnTrack(o);
+  {
+    PyObject *etype, *eval, *etb;
+    PyErr_Fetch(&etype, &eval, &etb);
+    __Pyx_SET_REFCNT(o, Py_REFCNT(o) + 1);
+    __pyx_pw_4xpra_6server_6window_6motion_10ScrollData_3__dealloc__(o);
+    __Pyx_SET_REFCNT(o, Py_REFCNT(o) - 1);
+    PyErr_Restore(etype, eval, etb);
+  }
+  Py_CLEAR(p->pixels);
+  (*Py_TYPE(o)->tp_free)(o);
+}
+
+static int __pyx_tp_traverse_4xpra_6server_6window_6motion_ScrollData(PyObject *o, visitproc v, void *a) {
+  int e;
+  struct __pyx_obj_4xpra_6server_6window_6motion_ScrollData *p = (struct __pyx_obj_4xpra_6server_6window_6motion_ScrollData *)o;
+  if (p->pixels) {
+    e = (*v)(p->pixels, a); if (e) return e;
+  }
+  return 0;
+}
+
+static int __pyx_tp_clear_4xpra_6server_6window_6motion_ScrollData(PyObject *o) {
+  PyObject* tmp;
+  struct __pyx_obj_4xpra_6server_6window_6motion_ScrollData *p = (struct __pyx_obj_4xpra_6server_6window_6motion_ScrollData *)o;
+  tmp = ((PyObject*)p->pixels);
+  p->pixels = Py_None; Py_INCREF(Py_None);
+  Py_XDECREF(tmp);
+  return 0;
+}
+
+static PyObject *__pyx_getprop_4xpra_6server_6window_6motion_10ScrollData_width(PyObject *o, CYTHON_UNUSED void *x) {
+  return __pyx_pw_4xpra_6server_6window_6motion_10ScrollData_5width_1__get__(o);
+}
+
+static PyObject *__pyx_getprop_4xpra_6server_6window_6motion_10ScrollData_height(PyObject *o, CYTHON_UNUSED void *x) {
+  return __pyx_pw_4xpra_6server_6window_6motion_10ScrollData_6height_1__get__(o);
+}
+
+static PyMethodDef __pyx_methods_4xpra_6server_6window_6motion_ScrollData[] = {
+  {"get_info", (PyCFunction)__pyx_pw_4xpra_6server_6window_6motion_10ScrollData_7get_info, METH_NOARGS, 0},
+  {"invalidate", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_4xpra_6server_6window_6motion_10ScrollData_9invalidate, METH_VARARGS|METH_KEYWORDS, __pyx_doc_4xpra_6server_6window_6motion_10ScrollData_8invalidate},
+  {"update", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_4xpra_6server_6window_6motion_10ScrollData_11update, METH_VARARGS|METH_KEYWORDS, __pyx_doc_4xpra_6server_6window_6motion_10ScrollData_10update},
+  {"detect", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_4xpra_6server_6window_6motion_10ScrollData_13detect, METH_VARARGS|METH_KEYWORDS, __pyx_doc_4xpra_6server_6window_6motion_10ScrollData_12detect},
+  {"__reduce_cython__", (PyCFunction)__pyx_pw_4xpra_6server_6window_6motion_10ScrollData_15__reduce_cython__, METH_NOARGS, 0},
+  {"__setstate_cython__", (PyCFunction)__pyx_pw_4xpra_6server_6window_6motion_10ScrollData_17__setstate_cython__, METH_O, 0},
+  {0, 0, 0, 0}
+};
+
+static struct PyGetSetDef __pyx_getsets_4xpra_6server_6window_6motion_ScrollData[] = {
+  {(char *)"width", __pyx_getprop_4xpra_6server_6window_6motion_10ScrollData_width, 0, (char *)0, 0},
+  {(char *)"height", __pyx_getprop_4xpra_6server_6window_6motion_10ScrollData_height, 0, (char *)0, 0},
+  {0, 0, 0, 0, 0}
+};
+
+static PyTypeObject __pyx_type_4xpra_6server_6window_6motion_ScrollData = {
+  PyVarObject_HEAD_INIT(0, 0)
+  "xpra.server.window.motion.ScrollData", /*tp_name*/
+  sizeof(struct __pyx_obj_4xpra_6server_6window_6motion_ScrollData), /*tp_basicsize*/
+  0, /*tp_itemsize*/
+  __pyx_tp_dealloc_4xpra_6server_6window_6motion_ScrollData, /*tp_dealloc*/
+  #if PY_VERSION_HEX < 0x030800b4
+  0, /*tp_print*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b4
+  0, /*tp_vectorcall_offset*/
+  #endif
+  0, /*tp_getattr*/
+  0, /*tp_setattr*/
+  #if PY_MAJOR_VERSION < 3
+  0, /*tp_compare*/
+  #endif
+  #if PY_MAJOR_VERSION >= 3
+  0, /*tp_as_async*/
+  #endif
+  __pyx_pw_4xpra_6server_6window_6motion_10ScrollData_5__repr__, /*tp_repr*/
+  0, /*tp_as_number*/
+  0, /*tp_as_sequence*/
+  0, /*tp_as_mapping*/
+  0, /*tp_hash*/
+  0, /*tp_call*/
+  0, /*tp_str*/
+  0, /*tp_getattro*/
+  0, /*tp_setattro*/
+  0, /*tp_as_buffer*/
+  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_VERSION_TAG|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_HAVE_GC, /*tp_flags*/
+  "\n        Keeps the hash of each row of a window, so that we only need to hash the rows\n        of the regions being updated to find the areas which have been scrolled.\n        The rows are hashed over the same columns (x, w) every time,\n        and we also hash the columns of the region to detect horizontal scrolling.\n    ", /*tp_doc*/
+  __pyx_tp_traverse_4xpra_6server_6window_6motion_ScrollData, /*tp_traverse*/
+  __pyx_tp_clear_4xpra_6server_6window_6motion_ScrollData, /*tp_clear*/
+  0, /*tp_richcompare*/
+  0, /*tp_weaklistoffset*/
+  0, /*tp_iter*/
+  0, /*tp_iternext*/
+  __pyx_methods_4xpra_6server_6window_6motion_ScrollData, /*tp_methods*/
+  0, /*tp_members*/
+  __pyx_getsets_4xpra_6server_6window_6motion_ScrollData, /*tp_getset*/
+  0, /*tp_base*/
+  0, /*tp_dict*/
+  0, /*tp_descr_get*/
+  0, /*tp_descr_set*/
+  0, /*tp_dictoffset*/
+  0, /*tp_init*/
+  0, /*tp_alloc*/
+  __pyx_tp_new_4xpra_6server_6window_6motion_ScrollData, /*tp_new*/
+  0, /*tp_free*/
+  0, /*tp_is_gc*/
+  0, /*tp_bases*/
+  0, /*tp_mro*/
+  0, /*tp_cache*/
+  0, /*tp_subclasses*/
+  0, /*tp_weaklist*/
+  0, /*tp_del*/
+  0, /*tp_version_tag*/
+  #if PY_VERSION_HEX >= 0x030400a1
+  0, /*tp_finalize*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b1 && (!CYTHON_COMPILING_IN_PYPY || PYPY_VERSION_NUM >= 0x07030800)
+  0, /*tp_vectorcall*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b4 && PY_VERSION_HEX < 0x03090000
+  0, /*tp_print*/
+  #endif
+  #if CYTHON_COMPILING_IN_PYPY && PY_VERSION_HEX >= 0x03090000 && PY_VERSION_HEX < 0x030a0000
+  0, /*tp_pypy_flags*/
+  #endif
+};
+
+static PyMethodDef __pyx_methods[] = {
+  {0, 0, 0, 0}
+};
+
+#if PY_MAJOR_VERSION >= 3
+#if CYTHON_PEP489_MULTI_PHASE_INIT
+static PyObject* __pyx_pymod_create(PyObject *spec, PyModuleDef *def); /*proto*/
+static int __pyx_pymod_exec_motion(PyObject* module); /*proto*/
+static PyModuleDef_Slot __pyx_moduledef_slots[] = {
+  {Py_mod_create, (void*)__pyx_pymod_create},
+  {Py_mod_exec, (void*)__pyx_pymod_exec_motion},
+  {0, NULL}
+};
+#endif
+
+static struct PyModuleDef __pyx_moduledef = {
+    PyModuleDef_HEAD_INIT,
+    "motion",
+    0, /* m_doc */
+  #if CYTHON_PEP489_MULTI_PHASE_INIT
+    0, /* m_size */
+  #else
+    -1, /* m_size */
+  #endif
+    __pyx_methods /* m_methods */,
+  #if CYTHON_PEP489_MULTI_PHASE_INIT
+    __pyx_moduledef_slots, /* m_slots */
+  #else
+    NULL, /* m_reload */
+  #endif
+    NULL, /* m_traverse */
+    NULL, /* m_clear */
+    NULL /* m_free */
+};
+#endif
+#ifndef CYTHON_SMALL_CODE
+#if defined(__clang__)
+    #define CYTHON_SMALL_CODE
+#elif defined(__GNUC__) && (__GNUC__ > 4 || (__GNUC__ == 4 && __GNUC_MINOR__ >= 3))
+    #define CYTHON_SMALL_CODE __attribute__((cold))
+#else
+    #define CYTHON_SMALL_CODE
+#endif
+#endif
+
+static __Pyx_StringTabEntry __pyx_string_tab[] = {
+  {&__pyx_n_s_CRC_Image, __pyx_k_CRC_Image, sizeof(__pyx_k_CRC_Image), 0, 0, 1, 1},
+  {&__pyx_n_s_ImportError, __pyx_k_ImportError, sizeof(__pyx_k_ImportError), 0, 0, 1, 1},
+  {&__pyx_n_s_Logger, __pyx_k_Logger, sizeof(__pyx_k_Logger), 0, 0, 1, 1},
+  {&__pyx_n_s_ScrollData, __pyx_k_ScrollData, sizeof(__pyx_k_ScrollData), 0, 0, 1, 1},
+  {&__pyx_kp_s_ScrollData_ix_i, __pyx_k_ScrollData_ix_i, sizeof(__pyx_k_ScrollData_ix_i), 0, 0, 1, 0},
+  {&__pyx_n_s_TypeError, __pyx_k_TypeError, sizeof(__pyx_k_TypeError), 0, 0, 1, 1},
+  {&__pyx_kp_s_Warning_xxhash_disabled, __pyx_k_Warning_xxhash_disabled, sizeof(__pyx_k_Warning_xxhash_disabled), 0, 0, 1, 0},
+  {&__pyx_kp_s_Warning_xxhash_python_bindings_n, __pyx_k_Warning_xxhash_python_bindings_n, sizeof(__pyx_k_Warning_xxhash_python_bindings_n), 0, 0, 1, 0},
+  {&__pyx_n_s_XPRA_XXHASH, __pyx_k_XPRA_XXHASH, sizeof(__pyx_k_XPRA_XXHASH), 0, 0, 1, 1},
+  {&__pyx_n_s_bpp, __pyx_k_bpp, sizeof(__pyx_k_bpp), 0, 0, 1, 1},
+  {&__pyx_n_s_buf, __pyx_k_buf, sizeof(__pyx_k_buf), 0, 0, 1, 1},
+  {&__pyx_n_s_buf_len, __pyx_k_buf_len, sizeof(__pyx_k_buf_len), 0, 0, 1, 1},
+  {&__pyx_kp_s_buffer_is_too_small_for_ix_i, __pyx_k_buffer_is_too_small_for_ix_i, sizeof(__pyx_k_buffer_is_too_small_for_ix_i), 0, 0, 1, 0},
+  {&__pyx_n_s_cline_in_traceback, __pyx_k_cline_in_traceback, sizeof(__pyx_k_cline_in_traceback), 0, 0, 1, 1},
+  {&__pyx_n_s_col, __pyx_k_col, sizeof(__pyx_k_col), 0, 0, 1, 1},
+  {&__pyx_n_s_crcs, __pyx_k_crcs, sizeof(__pyx_k_crcs), 0, 0, 1, 1},
+  {&__pyx_n_s_e, __pyx_k_e, sizeof(__pyx_k_e), 0, 0, 1, 1},
+  {&__pyx_n_s_encoding, __pyx_k_encoding, sizeof(__pyx_k_encoding), 0, 0, 1, 1},
+  {&__pyx_n_s_envbool, __pyx_k_envbool, sizeof(__pyx_k_envbool), 0, 0, 1, 1},
+  {&__pyx_n_s_f, __pyx_k_f, sizeof(__pyx_k_f), 0, 0, 1, 1},
+  {&__pyx_kp_s_failed_to_allocate_scroll_data, __pyx_k_failed_to_allocate_scroll_data, sizeof(__pyx_k_failed_to_allocate_scroll_data), 0, 0, 1, 0},
+  {&__pyx_kp_s_failed_to_allocate_scroll_detect, __pyx_k_failed_to_allocate_scroll_detect, sizeof(__pyx_k_failed_to_allocate_scroll_detect), 0, 0, 1, 0},
+  {&__pyx_n_s_getstate, __pyx_k_getstate, sizeof(__pyx_k_getstate), 0, 0, 1, 1},
+  {&__pyx_n_s_h, __pyx_k_h, sizeof(__pyx_k_h), 0, 0, 1, 1},
+  {&__pyx_n_s_hash_tiles, __pyx_k_hash_tiles, sizeof(__pyx_k_hash_tiles), 0, 0, 1, 1},
+  {&__pyx_n_s_hashfn, __pyx_k_hashfn, sizeof(__pyx_k_hashfn), 0, 0, 1, 1},
+  {&__pyx_n_s_height, __pyx_k_height, sizeof(__pyx_k_height), 0, 0, 1, 1},
+  {&__pyx_n_s_horizontal, __pyx_k_horizontal, sizeof(__pyx_k_horizontal), 0, 0, 1, 1},
+  {&__pyx_n_s_i, __pyx_k_i, sizeof(__pyx_k_i), 0, 0, 1, 1},
+  {&__pyx_n_s_import, __pyx_k_import, sizeof(__pyx_k_import), 0, 0, 1, 1},
+  {&__pyx_n_s_intdigest, __pyx_k_intdigest, sizeof(__pyx_k_intdigest), 0, 0, 1, 1},
+  {&__pyx_n_s_logger, __pyx_k_logger, sizeof(__pyx_k_logger), 0, 0, 1, 1},
+  {&__pyx_n_s_main, __pyx_k_main, sizeof(__pyx_k_main), 0, 0, 1, 1},
+  {&__pyx_n_s_max_distance, __pyx_k_max_distance, sizeof(__pyx_k_max_distance), 0, 0, 1, 1},
+  {&__pyx_n_s_min_percent, __pyx_k_min_percent, sizeof(__pyx_k_min_percent), 0, 0, 1, 1},
+  {&__pyx_n_s_name, __pyx_k_name, sizeof(__pyx_k_name), 0, 0, 1, 1},
+  {&__pyx_kp_s_no_default___reduce___due_to_non, __pyx_k_no_default___reduce___due_to_non, sizeof(__pyx_k_no_default___reduce___due_to_non), 0, 0, 1, 0},
+  {&__pyx_kp_s_no_scrolling_detection, __pyx_k_no_scrolling_detection, sizeof(__pyx_k_no_scrolling_detection), 0, 0, 1, 0},
+  {&__pyx_n_s_os, __pyx_k_os, sizeof(__pyx_k_os), 0, 0, 1, 1},
+  {&__pyx_n_s_pixels, __pyx_k_pixels, sizeof(__pyx_k_pixels), 0, 0, 1, 1},
+  {&__pyx_n_s_pyx_vtable, __pyx_k_pyx_vtable, sizeof(__pyx_k_pyx_vtable), 0, 0, 1, 1},
+  {&__pyx_n_s_range, __pyx_k_range, sizeof(__pyx_k_range), 0, 0, 1, 1},
+  {&__pyx_n_s_reduce, __pyx_k_reduce, sizeof(__pyx_k_reduce), 0, 0, 1, 1},
+  {&__pyx_n_s_reduce_cython, __pyx_k_reduce_cython, sizeof(__pyx_k_reduce_cython), 0, 0, 1, 1},
+  {&__pyx_n_s_reduce_ex, __pyx_k_reduce_ex, sizeof(__pyx_k_reduce_ex), 0, 0, 1, 1},
+  {&__pyx_kp_s_region_s_does_not_fit_in_ix_i, __pyx_k_region_s_does_not_fit_in_ix_i, sizeof(__pyx_k_region_s_does_not_fit_in_ix_i), 0, 0, 1, 0},
+  {&__pyx_n_s_row, __pyx_k_row, sizeof(__pyx_k_row), 0, 0, 1, 1},
+  {&__pyx_n_s_row_len, __pyx_k_row_len, sizeof(__pyx_k_row_len), 0, 0, 1, 1},
+  {&__pyx_kp_s_rows_hashed, __pyx_k_rows_hashed, sizeof(__pyx_k_rows_hashed), 0, 0, 1, 0},
+  {&__pyx_n_s_rowstride, __pyx_k_rowstride, sizeof(__pyx_k_rowstride), 0, 0, 1, 1},
+  {&__pyx_n_s_setstate, __pyx_k_setstate, sizeof(__pyx_k_setstate), 0, 0, 1, 1},
+  {&__pyx_n_s_setstate_cython, __pyx_k_setstate_cython, sizeof(__pyx_k_setstate_cython), 0, 0, 1, 1},
+  {&__pyx_n_s_size, __pyx_k_size, sizeof(__pyx_k_size), 0, 0, 1, 1},
+  {&__pyx_n_s_test, __pyx_k_test, sizeof(__pyx_k_test), 0, 0, 1, 1},
+  {&__pyx_n_s_th, __pyx_k_th, sizeof(__pyx_k_th), 0, 0, 1, 1},
+  {&__pyx_n_s_tile_size, __pyx_k_tile_size, sizeof(__pyx_k_tile_size), 0, 0, 1, 1},
+  {&__pyx_n_s_tiles, __pyx_k_tiles, sizeof(__pyx_k_tiles), 0, 0, 1, 1},
+  {&__pyx_n_s_time, __pyx_k_time, sizeof(__pyx_k_time), 0, 0, 1, 1},
+  {&__pyx_n_s_tw, __pyx_k_tw, sizeof(__pyx_k_tw), 0, 0, 1, 1},
+  {&__pyx_n_s_tx, __pyx_k_tx, sizeof(__pyx_k_tx), 0, 0, 1, 1},
+  {&__pyx_n_s_ty, __pyx_k_ty, sizeof(__pyx_k_ty), 0, 0, 1, 1},
+  {&__pyx_n_s_updates, __pyx_k_updates, sizeof(__pyx_k_updates), 0, 0, 1, 1},
+  {&__pyx_n_s_warn, __pyx_k_warn, sizeof(__pyx_k_warn), 0, 0, 1, 1},
+  {&__pyx_n_s_width, __pyx_k_width, sizeof(__pyx_k_width), 0, 0, 1, 1},
+  {&__pyx_n_s_x, __pyx_k_x, sizeof(__pyx_k_x), 0, 0, 1, 1},
+  {&__pyx_n_s_xpra_log, __pyx_k_xpra_log, sizeof(__pyx_k_xpra_log), 0, 0, 1, 1},
+  {&__pyx_n_s_xpra_server_window_motion, __pyx_k_xpra_server_window_motion, sizeof(__pyx_k_xpra_server_window_motion), 0, 0, 1, 1},
+  {&__pyx_kp_s_xpra_server_window_motion_pyx, __pyx_k_xpra_server_window_motion_pyx, sizeof(__pyx_k_xpra_server_window_motion_pyx), 0, 0, 1, 0},
+  {&__pyx_n_s_xpra_util, __pyx_k_xpra_util, sizeof(__pyx_k_xpra_util), 0, 0, 1, 1},
+  {&__pyx_n_s_xxh64, __pyx_k_xxh64, sizeof(__pyx_k_xxh64), 0, 0, 1, 1},
+  {&__pyx_n_s_xxhash, __pyx_k_xxhash, sizeof(__pyx_k_xxhash), 0, 0, 1, 1},
+  {&__pyx_n_s_y, __pyx_k_y, sizeof(__pyx_k_y), 0, 0, 1, 1},
+  {&__pyx_n_s_zlib, __pyx_k_zlib, sizeof(__pyx_k_zlib), 0, 0, 1, 1},
+  {0, 0, 0, 0, 0, 0, 0}
+};
+static CYTHON_SMALL_CODE int __Pyx_InitCachedBuiltins(void) {
+  __pyx_builtin_ImportError = __Pyx_GetBuiltinName(__pyx_n_s_ImportError); if (!__pyx_builtin_ImportError) __PYX_ERR(0, 24, __pyx_L1_error)
+  __pyx_builtin_range = __Pyx_GetBuiltinName(__pyx_n_s_range); if (!__pyx_builtin_range) __PYX_ERR(0, 65, __pyx_L1_error)
+  __pyx_builtin_TypeError = __Pyx_GetBuiltinName(__pyx_n_s_TypeError); if (!__pyx_builtin_TypeError) __PYX_ERR(1, 2, __pyx_L1_error)
+  return 0;
+  __pyx_L1_error:;
+  return -1;
+}
+
+static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_InitCachedConstants", 0);
+
+  /* "(tree fragment)":2
+ * def __reduce_cython__(self):
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")             # <<<<<<<<<<<<<<
+ * def __setstate_cython__(self, __pyx_state):
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
+ */
+  __pyx_tuple_ = PyTuple_Pack(1, __pyx_kp_s_no_default___reduce___due_to_non); if (unlikely(!__pyx_tuple_)) __PYX_ERR(1, 2, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple_);
+  __Pyx_GIVEREF(__pyx_tuple_);
+
+  /* "(tree fragment)":4
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
+ * def __setstate_cython__(self, __pyx_state):
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")             # <<<<<<<<<<<<<<
+ */
+  __pyx_tuple__2 = PyTuple_Pack(1, __pyx_kp_s_no_default___reduce___due_to_non); if (unlikely(!__pyx_tuple__2)) __PYX_ERR(1, 4, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__2);
+  __Pyx_GIVEREF(__pyx_tuple__2);
+
+  /* "xpra/server/window/motion.pyx":15
+ * from xpra.util import envbool
+ * from xpra.log import Logger
+ * logger = Logger("encoding")             # <<<<<<<<<<<<<<
+ * 
+ * import zlib
+ */
+  __pyx_tuple__3 = PyTuple_Pack(1, __pyx_n_s_encoding); if (unlikely(!__pyx_tuple__3)) __PYX_ERR(0, 15, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__3);
+  __Pyx_GIVEREF(__pyx_tuple__3);
+
+  /* "xpra/server/window/motion.pyx":19
+ * import zlib
+ * hashfn = None
+ * if envbool("XPRA_XXHASH", True):             # <<<<<<<<<<<<<<
+ *     try:
+ *         import xxhash
+ */
+  __pyx_tuple__4 = PyTuple_Pack(2, __pyx_n_s_XPRA_XXHASH, Py_True); if (unlikely(!__pyx_tuple__4)) __PYX_ERR(0, 19, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__4);
+  __Pyx_GIVEREF(__pyx_tuple__4);
+
+  /* "xpra/server/window/motion.pyx":22
+ *     try:
+ *         import xxhash
+ *         def hashfn(x):             # <<<<<<<<<<<<<<
+ *             return xxhash.xxh64(x).intdigest()
+ *     except ImportError as e:
+ */
+  __pyx_tuple__5 = PyTuple_Pack(1, __pyx_n_s_x); if (unlikely(!__pyx_tuple__5)) __PYX_ERR(0, 22, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__5);
+  __Pyx_GIVEREF(__pyx_tuple__5);
+  __pyx_codeobj__6 = (PyObject*)__Pyx_PyCode_New(1, 0, 1, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__5, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_xpra_server_window_motion_pyx, __pyx_n_s_hashfn, 22, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__6)) __PYX_ERR(0, 22, __pyx_L1_error)
+
+  /* "xpra/server/window/motion.pyx":25
+ *             return xxhash.xxh64(x).intdigest()
+ *     except ImportError as e:
+ *         logger.warn("Warning: xxhash python bindings not found")             # <<<<<<<<<<<<<<
+ * else:
+ *     logger.warn("Warning: xxhash disabled")
+ */
+  __pyx_tuple__7 = PyTuple_Pack(1, __pyx_kp_s_Warning_xxhash_python_bindings_n); if (unlikely(!__pyx_tuple__7)) __PYX_ERR(0, 25, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__7);
+  __Pyx_GIVEREF(__pyx_tuple__7);
+
+  /* "xpra/server/window/motion.pyx":27
+ *         logger.warn("Warning: xxhash python bindings not found")
+ * else:
+ *     logger.warn("Warning: xxhash disabled")             # <<<<<<<<<<<<<<
+ * if hashfn is None:
+ *     logger.warn(" no scrolling detection")
+ */
+  __pyx_tuple__8 = PyTuple_Pack(1, __pyx_kp_s_Warning_xxhash_disabled); if (unlikely(!__pyx_tuple__8)) __PYX_ERR(0, 27, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__8);
+  __Pyx_GIVEREF(__pyx_tuple__8);
+
+  /* "xpra/server/window/motion.pyx":29
+ *     logger.warn("Warning: xxhash disabled")
+ * if hashfn is None:
+ *     logger.warn(" no scrolling detection")             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_tuple__9 = PyTuple_Pack(1, __pyx_kp_s_no_scrolling_detection); if (unlikely(!__pyx_tuple__9)) __PYX_ERR(0, 29, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__9);
+  __Pyx_GIVEREF(__pyx_tuple__9);
+
+  /* "xpra/server/window/motion.pyx":53
+ * 
+ * 
+ * def CRC_Image(pixels, unsigned int width, unsigned int height, unsigned int rowstride, unsigned char bpp=4):             # <<<<<<<<<<<<<<
+ *     global hashfn
+ *     if not hashfn:
+ */
+  __pyx_tuple__10 = PyTuple_Pack(11, __pyx_n_s_pixels, __pyx_n_s_width, __pyx_n_s_height, __pyx_n_s_rowstride, __pyx_n_s_bpp, __pyx_n_s_buf, __pyx_n_s_buf_len, __pyx_n_s_i, __pyx_n_s_row_len, __pyx_n_s_f, __pyx_n_s_crcs); if (unlikely(!__pyx_tuple__10)) __PYX_ERR(0, 53, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__10);
+  __Pyx_GIVEREF(__pyx_tuple__10);
+  __pyx_codeobj__11 = (PyObject*)__Pyx_PyCode_New(5, 0, 11, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__10, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_xpra_server_window_motion_pyx, __pyx_n_s_CRC_Image, 53, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__11)) __PYX_ERR(0, 53, __pyx_L1_error)
+
+  /* "xpra/server/window/motion.pyx":116
+ *     return h
+ * 
+ * def hash_tiles(pixels, unsigned int x, unsigned int y, unsigned int width, unsigned int height, unsigned int rowstride, unsigned int tile_size=64, unsigned char bpp=4):             # <<<<<<<<<<<<<<
+ *     """
+ *         Hashes the pixels of the region (x, y, width, height) one tile at a time,
+ */
+  __pyx_tuple__12 = PyTuple_Pack(18, __pyx_n_s_pixels, __pyx_n_s_x, __pyx_n_s_y, __pyx_n_s_width, __pyx_n_s_height, __pyx_n_s_rowstride, __pyx_n_s_tile_size, __pyx_n_s_bpp, __pyx_n_s_buf, __pyx_n_s_buf_len, __pyx_n_s_col, __pyx_n_s_row, __pyx_n_s_tx, __pyx_n_s_ty, __pyx_n_s_tw, __pyx_n_s_th, __pyx_n_s_h, __pyx_n_s_tiles); if (unlikely(!__pyx_tuple__12)) __PYX_ERR(0, 116, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__12);
+  __Pyx_GIVEREF(__pyx_tuple__12);
+  __pyx_codeobj__13 = (PyObject*)__Pyx_PyCode_New(8, 0, 18, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__12, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_xpra_server_window_motion_pyx, __pyx_n_s_hash_tiles, 116, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__13)) __PYX_ERR(0, 116, __pyx_L1_error)
+  __Pyx_RefNannyFinishContext();
+  return 0;
+  __pyx_L1_error:;
+  __Pyx_RefNannyFinishContext();
+  return -1;
+}
+
+static CYTHON_SMALL_CODE int __Pyx_InitGlobals(void) {
+  /* AssertionsEnabled.init */
+  __Pyx_init_assertions_enabled();
+
+if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 1, __pyx_L1_error)
+
+  if (__Pyx_InitStrings(__pyx_string_tab) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_0 = PyInt_FromLong(0); if (unlikely(!__pyx_int_0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  return 0;
+  __pyx_L1_error:;
+  return -1;
+}
+
+static CYTHON_SMALL_CODE int __Pyx_modinit_global_init_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_variable_export_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_function_export_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_type_init_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_type_import_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_variable_import_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_function_import_code(void); /*proto*/
+
+static int __Pyx_modinit_global_init_code(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_modinit_global_init_code", 0);
+  /*--- Global init code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+static int __Pyx_modinit_variable_export_code(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_modinit_variable_export_code", 0);
+  /*--- Variable export code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+static int __Pyx_modinit_function_export_code(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_modinit_function_export_code", 0);
+  /*--- Function export code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+static int __Pyx_modinit_type_init_code(void) {
+  __Pyx_RefNannyDeclarations
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__Pyx_modinit_type_init_code", 0);
+  /*--- Type init code ---*/
+  __pyx_vtabptr_4xpra_6server_6window_6motion_ScrollData = &__pyx_vtable_4xpra_6server_6window_6motion_ScrollData;
+  __pyx_vtable_4xpra_6server_6window_6motion_ScrollData.hash_columns = (int (*)(struct __pyx_obj_4xpra_6server_6window_6motion_ScrollData *))__pyx_f_4xpra_6server_6window_6motion_10ScrollData_hash_columns;
+  __pyx_vtable_4xpra_6server_6window_6motion_ScrollData.do_detect = (PyObject *(*)(struct __pyx_obj_4xpra_6server_6window_6motion_ScrollData *, int, int, int))__pyx_f_4xpra_6server_6window_6motion_10ScrollData_do_detect;
+  if (PyType_Ready(&__pyx_type_4xpra_6server_6window_6motion_ScrollData) < 0) __PYX_ERR(0, 257, __pyx_L1_error)
+  #if PY_VERSION_HEX < 0x030800B1
+  __pyx_type_4xpra_6server_6window_6motion_ScrollData.tp_print = 0;
+  #endif
+  if ((CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP) && likely(!__pyx_type_4xpra_6server_6window_6motion_ScrollData.tp_dictoffset && __pyx_type_4xpra_6server_6window_6motion_ScrollData.tp_getattro == PyObject_GenericGetAttr)) {
+    __pyx_type_4xpra_6server_6window_6motion_ScrollData.tp_getattro = __Pyx_PyObject_GenericGetAttr;
+  }
+  if (__Pyx_SetVtable(__pyx_type_4xpra_6server_6window_6motion_ScrollData.tp_dict, __pyx_vtabptr_4xpra_6server_6window_6motion_ScrollData) < 0) __PYX_ERR(0, 257, __pyx_L1_error)
+  if (PyObject_SetAttr(__pyx_m, __pyx_n_s_ScrollData, (PyObject *)&__pyx_type_4xpra_6server_6window_6motion_ScrollData) < 0) __PYX_ERR(0, 257, __pyx_L1_error)
+  if (__Pyx_setup_reduce((PyObject*)&__pyx_type_4xpra_6server_6window_6motion_ScrollData) < 0) __PYX_ERR(0, 257, __pyx_L1_error)
+  __pyx_ptype_4xpra_6server_6window_6motion_ScrollData = &__pyx_type_4xpra_6server_6window_6motion_ScrollData;
+  __Pyx_RefNannyFinishContext();
+  return 0;
+  __pyx_L1_error:;
+  __Pyx_RefNannyFinishContext();
+  return -1;
+}
+
+static int __Pyx_modinit_type_import_code(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_modinit_type_import_code", 0);
+  /*--- Type import code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+static int __Pyx_modinit_variable_import_code(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_modinit_variable_import_code", 0);
+  /*--- Variable import code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+static int __Pyx_modinit_function_import_code(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_modinit_function_import_code", 0);
+  /*--- Function import code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+
+#ifndef CYTHON_NO_PYINIT_EXPORT
+#define __Pyx_PyMODINIT_FUNC PyMODINIT_FUNC
+#elif PY_MAJOR_VERSION < 3
+#ifdef __cplusplus
+#define __Pyx_PyMODINIT_FUNC extern "C" void
+#else
+#define __Pyx_PyMODINIT_FUNC void
+#endif
+#else
+#ifdef __cplusplus
+#define __Pyx_PyMODINIT_FUNC extern "C" PyObject *
+#else
+#define __Pyx_PyMODINIT_FUNC PyObject *
+#endif
+#endif
+
+
+#if PY_MAJOR_VERSION < 3
+__Pyx_PyMODINIT_FUNC initmotion(void) CYTHON_SMALL_CODE; /*proto*/
+__Pyx_PyMODINIT_FUNC initmotion(void)
+#else
+__Pyx_PyMODINIT_FUNC PyInit_motion(void) CYTHON_SMALL_CODE; /*proto*/
+__Pyx_PyMODINIT_FUNC PyInit_motion(void)
+#if CYTHON_PEP489_MULTI_PHASE_INIT
+{
+  return PyModuleDef_Init(&__pyx_moduledef);
+}
+static CYTHON_SMALL_CODE int __Pyx_check_single_interpreter(void) {
+    #if PY_VERSION_HEX >= 0x030700A1
+    static PY_INT64_T main_interpreter_id = -1;
+    PY_INT64_T current_id = PyInterpreterState_GetID(PyThreadState_Get()->interp);
+    if (main_interpreter_id == -1) {
+        main_interpreter_id = current_id;
+        return (unlikely(current_id == -1)) ? -1 : 0;
+    } else if (unlikely(main_interpreter_id != current_id))
+    #else
+    static PyInterpreterState *main_interpreter = NULL;
+    PyInterpreterState *current_interpreter = PyThreadState_Get()->interp;
+    if (!main_interpreter) {
+        main_interpreter = current_interpreter;
+    } else if (unlikely(main_interpreter != current_interpreter))
+    #endif
+    {
+        PyErr_SetString(
+            PyExc_ImportError,
+            "Interpreter change detected - this module can only be loaded into one interpreter per process.");
+        return -1;
+    }
+    return 0;
+}
+static CYTHON_SMALL_CODE int __Pyx_copy_spec_to_module(PyObject *spec, PyObject *moddict, const char* from_name, const char* to_name, int allow_none) {
+    PyObject *value = PyObject_GetAttrString(spec, from_name);
+    int result = 0;
+    if (likely(value)) {
+        if (allow_none || value != Py_None) {
+            result = PyDict_SetItemString(moddict, to_name, value);
+        }
+        Py_DECREF(value);
+    } else if (PyErr_ExceptionMatches(PyExc_AttributeError)) {
+        PyErr_Clear();
+    } else {
+        result = -1;
+    }
+    return result;
+}
+static CYTHON_SMALL_CODE PyObject* __pyx_pymod_create(PyObject *spec, CYTHON_UNUSED PyModuleDef *def) {
+    PyObject *module = NULL, *moddict, *modname;
+    if (__Pyx_check_single_interpreter())
+        return NULL;
+    if (__pyx_m)
+        return __Pyx_NewRef(__pyx_m);
+    modname = PyObject_GetAttrString(spec, "name");
+    if (unlikely(!modname)) goto bad;
+    module = PyModule_NewObject(modname);
+    Py_DECREF(modname);
+    if (unlikely(!module)) goto bad;
+    moddict = PyModule_GetDict(module);
+    if (unlikely(!moddict)) goto bad;
+    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "loader", "__loader__", 1) < 0)) goto bad;
+    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "origin", "__file__", 1) < 0)) goto bad;
+    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "parent", "__package__", 1) < 0)) goto bad;
+    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "submodule_search_locations", "__path__", 0) < 0)) goto bad;
+    return module;
+bad:
+    Py_XDECREF(module);
+    return NULL;
+}
+
+
+static CYTHON_SMALL_CODE int __pyx_pymod_exec_motion(PyObject *__pyx_pyinit_module)
+#endif
+#endif
+{
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  int __pyx_t_3;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  int __pyx_t_7;
+  PyObject *__pyx_t_8 = NULL;
+  PyObject *__pyx_t_9 = NULL;
+  PyObject *__pyx_t_10 = NULL;
+  int __pyx_t_11;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannyDeclarations
+  #if CYTHON_PEP489_MULTI_PHASE_INIT
+  if (__pyx_m) {
+    if (__pyx_m == __pyx_pyinit_module) return 0;
+    PyErr_SetString(PyExc_RuntimeError, "Module 'motion' has already been imported. Re-initialisation is not supported.");
+    return -1;
+  }
+  #elif PY_MAJOR_VERSION >= 3
+  if (__pyx_m) return __Pyx_NewRef(__pyx_m);
+  #endif
+  #if CYTHON_REFNANNY
+__Pyx_RefNanny = __Pyx_RefNannyImportAPI("refnanny");
+if (!__Pyx_RefNanny) {
+  PyErr_Clear();
+  __Pyx_RefNanny = __Pyx_RefNannyImportAPI("Cython.Runtime.refnanny");
+  if (!__Pyx_RefNanny)
+      Py_FatalError("failed to import 'refnanny' module");
+}
+#endif
+  __Pyx_RefNannySetupContext("__Pyx_PyMODINIT_FUNC PyInit_motion(void)", 0);
+  if (__Pyx_check_binary_version() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #ifdef __Pxy_PyFrame_Initialize_Offsets
+  __Pxy_PyFrame_Initialize_Offsets();
+  #endif
+  __pyx_empty_tuple = PyTuple_New(0); if (unlikely(!__pyx_empty_tuple)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_empty_bytes = PyBytes_FromStringAndSize("", 0); if (unlikely(!__pyx_empty_bytes)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_empty_unicode = PyUnicode_FromStringAndSize("", 0); if (unlikely(!__pyx_empty_unicode)) __PYX_ERR(0, 1, __pyx_L1_error)
+  #ifdef __Pyx_CyFunction_USED
+  if (__pyx_CyFunction_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  #ifdef __Pyx_FusedFunction_USED
+  if (__pyx_FusedFunction_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  #ifdef __Pyx_Coroutine_USED
+  if (__pyx_Coroutine_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  #ifdef __Pyx_Generator_USED
+  if (__pyx_Generator_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  #ifdef __Pyx_AsyncGen_USED
+  if (__pyx_AsyncGen_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  #ifdef __Pyx_StopAsyncIteration_USED
+  if (__pyx_StopAsyncIteration_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  /*--- Library function declarations ---*/
+  /*--- Threads initialization code ---*/
+  #if defined(WITH_THREAD) && PY_VERSION_HEX < 0x030700F0 && defined(__PYX_FORCE_INIT_THREADS) && __PYX_FORCE_INIT_THREADS
+  PyEval_InitThreads();
+  #endif
+  /*--- Module creation code ---*/
+  #if CYTHON_PEP489_MULTI_PHASE_INIT
+  __pyx_m = __pyx_pyinit_module;
+  Py_INCREF(__pyx_m);
+  #else
+  #if PY_MAJOR_VERSION < 3
+  __pyx_m = Py_InitModule4("motion", __pyx_methods, 0, 0, PYTHON_API_VERSION); Py_XINCREF(__pyx_m);
+  #else
+  __pyx_m = PyModule_Create(&__pyx_moduledef);
+  #endif
+  if (unlikely(!__pyx_m)) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  __pyx_d = PyModule_GetDict(__pyx_m); if (unlikely(!__pyx_d)) __PYX_ERR(0, 1, __pyx_L1_error)
+  Py_INCREF(__pyx_d);
+  __pyx_b = PyImport_AddModule(__Pyx_BUILTIN_MODULE_NAME); if (unlikely(!__pyx_b)) __PYX_ERR(0, 1, __pyx_L1_error)
+  Py_INCREF(__pyx_b);
+  __pyx_cython_runtime = PyImport_AddModule((char *) "cython_runtime"); if (unlikely(!__pyx_cython_runtime)) __PYX_ERR(0, 1, __pyx_L1_error)
+  Py_INCREF(__pyx_cython_runtime);
+  if (PyObject_SetAttrString(__pyx_m, "__builtins__", __pyx_b) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  /*--- Initialize various global constants etc. ---*/
+  if (__Pyx_InitGlobals() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #if PY_MAJOR_VERSION < 3 && (__PYX_DEFAULT_STRING_ENCODING_IS_ASCII || __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT)
+  if (__Pyx_init_sys_getdefaultencoding_params() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  if (__pyx_module_is_main_xpra__server__window__motion) {
+    if (PyObject_SetAttr(__pyx_m, __pyx_n_s_name, __pyx_n_s_main) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  }
+  #if PY_MAJOR_VERSION >= 3
+  {
+    PyObject *modules = PyImport_GetModuleDict(); if (unlikely(!modules)) __PYX_ERR(0, 1, __pyx_L1_error)
+    if (!PyDict_GetItemString(modules, "xpra.server.window.motion")) {
+      if (unlikely(PyDict_SetItemString(modules, "xpra.server.window.motion", __pyx_m) < 0)) __PYX_ERR(0, 1, __pyx_L1_error)
+    }
+  }
+  #endif
+  /*--- Builtin init code ---*/
+  if (__Pyx_InitCachedBuiltins() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  /*--- Constants init code ---*/
+  if (__Pyx_InitCachedConstants() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  /*--- Global type/function init code ---*/
+  (void)__Pyx_modinit_global_init_code();
+  (void)__Pyx_modinit_variable_export_code();
+  (void)__Pyx_modinit_function_export_code();
+  if (unlikely(__Pyx_modinit_type_init_code() < 0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  (void)__Pyx_modinit_type_import_code();
+  (void)__Pyx_modinit_variable_import_code();
+  (void)__Pyx_modinit_function_import_code();
+  /*--- Execution code ---*/
+  #if defined(__Pyx_Generator_USED) || defined(__Pyx_Coroutine_USED)
+  if (__Pyx_patch_abc() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+
+  /* "xpra/server/window/motion.pyx":10
+ * #cython: boundscheck=False, wraparound=False, cdivision=True
+ * 
+ * import os             # <<<<<<<<<<<<<<
+ * import time
+ * 
+ */
+  __pyx_t_1 = __Pyx_Import(__pyx_n_s_os, 0, -1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 10, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_os, __pyx_t_1) < 0) __PYX_ERR(0, 10, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "xpra/server/window/motion.pyx":11
+ * 
+ * import os
+ * import time             # <<<<<<<<<<<<<<
+ * 
+ * from xpra.util import envbool
+ */
+  __pyx_t_1 = __Pyx_Import(__pyx_n_s_time, 0, -1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 11, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_time, __pyx_t_1) < 0) __PYX_ERR(0, 11, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "xpra/server/window/motion.pyx":13
+ * import time
+ * 
+ * from xpra.util import envbool             # <<<<<<<<<<<<<<
+ * from xpra.log import Logger
+ * logger = Logger("encoding")
+ */
+  __pyx_t_1 = PyList_New(1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 13, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_INCREF(__pyx_n_s_envbool);
+  __Pyx_GIVEREF(__pyx_n_s_envbool);
+  PyList_SET_ITEM(__pyx_t_1, 0, __pyx_n_s_envbool);
+  __pyx_t_2 = __Pyx_Import(__pyx_n_s_xpra_util, __pyx_t_1, -1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 13, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = __Pyx_ImportFrom(__pyx_t_2, __pyx_n_s_envbool); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 13, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_envbool, __pyx_t_1) < 0) __PYX_ERR(0, 13, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "xpra/server/window/motion.pyx":14
+ * 
+ * from xpra.util import envbool
+ * from xpra.log import Logger             # <<<<<<<<<<<<<<
+ * logger = Logger("encoding")
+ * 
+ */
+  __pyx_t_2 = PyList_New(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 14, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_INCREF(__pyx_n_s_Logger);
+  __Pyx_GIVEREF(__pyx_n_s_Logger);
+  PyList_SET_ITEM(__pyx_t_2, 0, __pyx_n_s_Logger);
+  __pyx_t_1 = __Pyx_Import(__pyx_n_s_xpra_log, __pyx_t_2, -1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 14, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = __Pyx_ImportFrom(__pyx_t_1, __pyx_n_s_Logger); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 14, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_Logger, __pyx_t_2) < 0) __PYX_ERR(0, 14, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "xpra/server/window/motion.pyx":15
+ * from xpra.util import envbool
+ * from xpra.log import Logger
+ * logger = Logger("encoding")             # <<<<<<<<<<<<<<
+ * 
+ * import zlib
+ */
+  __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_n_s_Logger); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 15, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_1, __pyx_tuple__3, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 15, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_logger, __pyx_t_2) < 0) __PYX_ERR(0, 15, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "xpra/server/window/motion.pyx":17
+ * logger = Logger("encoding")
+ * 
+ * import zlib             # <<<<<<<<<<<<<<
+ * hashfn = None
+ * if envbool("XPRA_XXHASH", True):
+ */
+  __pyx_t_2 = __Pyx_Import(__pyx_n_s_zlib, 0, -1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 17, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_zlib, __pyx_t_2) < 0) __PYX_ERR(0, 17, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "xpra/server/window/motion.pyx":18
+ * 
+ * import zlib
+ * hashfn = None             # <<<<<<<<<<<<<<
+ * if envbool("XPRA_XXHASH", True):
+ *     try:
+ */
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_hashfn, Py_None) < 0) __PYX_ERR(0, 18, __pyx_L1_error)
+
+  /* "xpra/server/window/motion.pyx":19
+ * import zlib
+ * hashfn = None
+ * if envbool("XPRA_XXHASH", True):             # <<<<<<<<<<<<<<
+ *     try:
+ *         import xxhash
+ */
+  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_envbool); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 19, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_tuple__4, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 19, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_3 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely(__pyx_t_3 < 0)) __PYX_ERR(0, 19, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  if (__pyx_t_3) {
+
+    /* "xpra/server/window/motion.pyx":20
+ * hashfn = None
+ * if envbool("XPRA_XXHASH", True):
+ *     try:             # <<<<<<<<<<<<<<
+ *         import xxhash
+ *         def hashfn(x):
+ */
+    {
+      __Pyx_PyThreadState_declare
+      __Pyx_PyThreadState_assign
+      __Pyx_ExceptionSave(&__pyx_t_4, &__pyx_t_5, &__pyx_t_6);
+      __Pyx_XGOTREF(__pyx_t_4);
+      __Pyx_XGOTREF(__pyx_t_5);
+      __Pyx_XGOTREF(__pyx_t_6);
+      /*try:*/ {
+
+        /* "xpra/server/window/motion.pyx":21
+ * if envbool("XPRA_XXHASH", True):
+ *     try:
+ *         import xxhash             # <<<<<<<<<<<<<<
+ *         def hashfn(x):
+ *             return xxhash.xxh64(x).intdigest()
+ */
+        __pyx_t_1 = __Pyx_Import(__pyx_n_s_xxhash, 0, -1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 21, __pyx_L3_error)
+        __Pyx_GOTREF(__pyx_t_1);
+        if (PyDict_SetItem(__pyx_d, __pyx_n_s_xxhash, __pyx_t_1) < 0) __PYX_ERR(0, 21, __pyx_L3_error)
+        __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+        /* "xpra/server/window/motion.pyx":22
+ *     try:
+ *         import xxhash
+ *         def hashfn(x):             # <<<<<<<<<<<<<<
+ *             return xxhash.xxh64(x).intdigest()
+ *     except ImportError as e:
+ */
+        __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4xpra_6server_6window_6motion_1hashfn, NULL, __pyx_n_s_xpra_server_window_motion); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 22, __pyx_L3_error)
+        __Pyx_GOTREF(__pyx_t_1);
+        if (PyDict_SetItem(__pyx_d, __pyx_n_s_hashfn, __pyx_t_1) < 0) __PYX_ERR(0, 22, __pyx_L3_error)
+        __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+        /* "xpra/server/window/motion.pyx":20
+ * hashfn = None
+ * if envbool("XPRA_XXHASH", True):
+ *     try:             # <<<<<<<<<<<<<<
+ *         import xxhash
+ *         def hashfn(x):
+ */
+      }
+      __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+      __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+      __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+      goto __pyx_L8_try_end;
+      __pyx_L3_error:;
+      __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
+      __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+      /* "xpra/server/window/motion.pyx":24
+ *         def hashfn(x):
+ *             return xxhash.xxh64(x).intdigest()
+ *     except ImportError as e:             # <<<<<<<<<<<<<<
+ *         logger.warn("Warning: xxhash python bindings not found")
+ * else:
+ */
+      __pyx_t_7 = __Pyx_PyErr_ExceptionMatches(__pyx_builtin_ImportError);
+      if (__pyx_t_7) {
+        __Pyx_AddTraceback("xpra.server.window.motion", __pyx_clineno, __pyx_lineno, __pyx_filename);
+        if (__Pyx_GetException(&__pyx_t_1, &__pyx_t_2, &__pyx_t_8) < 0) __PYX_ERR(0, 24, __pyx_L5_except_error)
+        __Pyx_GOTREF(__pyx_t_1);
+        __Pyx_GOTREF(__pyx_t_2);
+        __Pyx_GOTREF(__pyx_t_8);
+        if (PyDict_SetItem(__pyx_d, __pyx_n_s_e, __pyx_t_2) < 0) __PYX_ERR(0, 24, __pyx_L5_except_error)
+
+        /* "xpra/server/window/motion.pyx":25
+ *             return xxhash.xxh64(x).intdigest()
+ *     except ImportError as e:
+ *         logger.warn("Warning: xxhash python bindings not found")             # <<<<<<<<<<<<<<
+ * else:
+ *     logger.warn("Warning: xxhash disabled")
+ */
+        __Pyx_GetModuleGlobalName(__pyx_t_9, __pyx_n_s_logger); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 25, __pyx_L5_except_error)
+        __Pyx_GOTREF(__pyx_t_9);
+        __pyx_t_10 = __Pyx_PyObject_GetAttrStr(__pyx_t_9, __pyx_n_s_warn); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 25, __pyx_L5_except_error)
+        __Pyx_GOTREF(__pyx_t_10);
+        __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+        __pyx_t_9 = __Pyx_PyObject_Call(__pyx_t_10, __pyx_tuple__7, NULL); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 25, __pyx_L5_except_error)
+        __Pyx_GOTREF(__pyx_t_9);
+        __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+        __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+        __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
+        __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
+        __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
+        goto __pyx_L4_exception_handled;
+      }
+      goto __pyx_L5_except_error;
+      __pyx_L5_except_error:;
+
+      /* "xpra/server/window/motion.pyx":20
+ * hashfn = None
+ * if envbool("XPRA_XXHASH", True):
+ *     try:             # <<<<<<<<<<<<<<
+ *         import xxhash
+ *         def hashfn(x):
+ */
+      __Pyx_XGIVEREF(__pyx_t_4);
+      __Pyx_XGIVEREF(__pyx_t_5);
+      __Pyx_XGIVEREF(__pyx_t_6);
+      __Pyx_ExceptionReset(__pyx_t_4, __pyx_t_5, __pyx_t_6);
+      goto __pyx_L1_error;
+      __pyx_L4_exception_handled:;
+      __Pyx_XGIVEREF(__pyx_t_4);
+      __Pyx_XGIVEREF(__pyx_t_5);
+      __Pyx_XGIVEREF(__pyx_t_6);
+      __Pyx_ExceptionReset(__pyx_t_4, __pyx_t_5, __pyx_t_6);
+      __pyx_L8_try_end:;
+    }
+
+    /* "xpra/server/window/motion.pyx":19
+ * import zlib
+ * hashfn = None
+ * if envbool("XPRA_XXHASH", True):             # <<<<<<<<<<<<<<
+ *     try:
+ *         import xxhash
+ */
+    goto __pyx_L2;
+  }
+
+  /* "xpra/server/window/motion.pyx":27
+ *         logger.warn("Warning: xxhash python bindings not found")
+ * else:
+ *     logger.warn("Warning: xxhash disabled")             # <<<<<<<<<<<<<<
+ * if hashfn is None:
+ *     logger.warn(" no scrolling detection")
+ */
+  /*else*/ {
+    __Pyx_GetModuleGlobalName(__pyx_t_8, __pyx_n_s_logger); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 27, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_8);
+    __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_8, __pyx_n_s_warn); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 27, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+    __pyx_t_8 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_tuple__8, NULL); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 27, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_8);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+  }
+  __pyx_L2:;
+
+  /* "xpra/server/window/motion.pyx":28
+ * else:
+ *     logger.warn("Warning: xxhash disabled")
+ * if hashfn is None:             # <<<<<<<<<<<<<<
+ *     logger.warn(" no scrolling detection")
+ * 
+ */
+  __Pyx_GetModuleGlobalName(__pyx_t_8, __pyx_n_s_hashfn); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 28, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_8);
+  __pyx_t_3 = (__pyx_t_8 == Py_None);
+  __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+  __pyx_t_11 = (__pyx_t_3 != 0);
+  if (__pyx_t_11) {
+
+    /* "xpra/server/window/motion.pyx":29
+ *     logger.warn("Warning: xxhash disabled")
+ * if hashfn is None:
+ *     logger.warn(" no scrolling detection")             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+    __Pyx_GetModuleGlobalName(__pyx_t_8, __pyx_n_s_logger); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 29, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_8);
+    __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_8, __pyx_n_s_warn); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 29, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+    __pyx_t_8 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_tuple__9, NULL); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 29, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_8);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+
+    /* "xpra/server/window/motion.pyx":28
+ * else:
+ *     logger.warn("Warning: xxhash disabled")
+ * if hashfn is None:             # <<<<<<<<<<<<<<
+ *     logger.warn(" no scrolling detection")
+ * 
+ */
+  }
+
+  /* "xpra/server/window/motion.pyx":53
+ * 
+ * 
+ * def CRC_Image(pixels, unsigned int width, unsigned int height, unsigned int rowstride, unsigned char bpp=4):             # <<<<<<<<<<<<<<
+ *     global hashfn
+ *     if not hashfn:
+ */
+  __pyx_t_8 = PyCFunction_NewEx(&__pyx_mdef_4xpra_6server_6window_6motion_3CRC_Image, NULL, __pyx_n_s_xpra_server_window_motion); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 53, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_8);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_CRC_Image, __pyx_t_8) < 0) __PYX_ERR(0, 53, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+
+  /* "xpra/server/window/motion.pyx":72
+ * 
+ * #the xxh64 primes and round function:
+ * cdef uint64_t PRIME64_1 = 11400714785074694791ULL             # <<<<<<<<<<<<<<
+ * cdef uint64_t PRIME64_2 = 14029467366897019727ULL
+ * cdef uint64_t PRIME64_3 = 1609587929392839161ULL
+ */
+  __pyx_v_4xpra_6server_6window_6motion_PRIME64_1 = 11400714785074694791ULL;
+
+  /* "xpra/server/window/motion.pyx":73
+ * #the xxh64 primes and round function:
+ * cdef uint64_t PRIME64_1 = 11400714785074694791ULL
+ * cdef uint64_t PRIME64_2 = 14029467366897019727ULL             # <<<<<<<<<<<<<<
+ * cdef uint64_t PRIME64_3 = 1609587929392839161ULL
+ * cdef uint64_t PRIME64_4 = 9650029242287828579ULL
+ */
+  __pyx_v_4xpra_6server_6window_6motion_PRIME64_2 = 14029467366897019727ULL;
+
+  /* "xpra/server/window/motion.pyx":74
+ * cdef uint64_t PRIME64_1 = 11400714785074694791ULL
+ * cdef uint64_t PRIME64_2 = 14029467366897019727ULL
+ * cdef uint64_t PRIME64_3 = 1609587929392839161ULL             # <<<<<<<<<<<<<<
+ * cdef uint64_t PRIME64_4 = 9650029242287828579ULL
+ * cdef uint64_t PRIME64_5 = 2870177450012600261ULL
+ */
+  __pyx_v_4xpra_6server_6window_6motion_PRIME64_3 = 1609587929392839161ULL;
+
+  /* "xpra/server/window/motion.pyx":75
+ * cdef uint64_t PRIME64_2 = 14029467366897019727ULL
+ * cdef uint64_t PRIME64_3 = 1609587929392839161ULL
+ * cdef uint64_t PRIME64_4 = 9650029242287828579ULL             # <<<<<<<<<<<<<<
+ * cdef uint64_t PRIME64_5 = 2870177450012600261ULL
+ * 
+ */
+  __pyx_v_4xpra_6server_6window_6motion_PRIME64_4 = 9650029242287828579ULL;
+
+  /* "xpra/server/window/motion.pyx":76
+ * cdef uint64_t PRIME64_3 = 1609587929392839161ULL
+ * cdef uint64_t PRIME64_4 = 9650029242287828579ULL
+ * cdef uint64_t PRIME64_5 = 2870177450012600261ULL             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline uint64_t rotl64(uint64_t v, int r) nogil:
+ */
+  __pyx_v_4xpra_6server_6window_6motion_PRIME64_5 = 2870177450012600261ULL;
+
+  /* "xpra/server/window/motion.pyx":116
+ *     return h
+ * 
+ * def hash_tiles(pixels, unsigned int x, unsigned int y, unsigned int width, unsigned int height, unsigned int rowstride, unsigned int tile_size=64, unsigned char bpp=4):             # <<<<<<<<<<<<<<
+ *     """
+ *         Hashes the pixels of the region (x, y, width, height) one tile at a time,
+ */
+  __pyx_t_8 = PyCFunction_NewEx(&__pyx_mdef_4xpra_6server_6window_6motion_5hash_tiles, NULL, __pyx_n_s_xpra_server_window_motion); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 116, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_8);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_hash_tiles, __pyx_t_8) < 0) __PYX_ERR(0, 116, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+
+  /* "xpra/server/window/motion.pyx":1
+ * # coding=utf8             # <<<<<<<<<<<<<<
+ * # This file is part of Xpra.
+ * # Copyright (C) 2016 Antoine Martin <antoine@devloop.org.uk>
+ */
+  __pyx_t_8 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_8);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_test, __pyx_t_8) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+
+  /*--- Wrapped vars code ---*/
+
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_8);
+  __Pyx_XDECREF(__pyx_t_9);
+  __Pyx_XDECREF(__pyx_t_10);
+  if (__pyx_m) {
+    if (__pyx_d) {
+      __Pyx_AddTraceback("init xpra.server.window.motion", __pyx_clineno, __pyx_lineno, __pyx_filename);
+    }
+    Py_CLEAR(__pyx_m);
+  } else if (!PyErr_Occurred()) {
+    PyErr_SetString(PyExc_ImportError, "init xpra.server.window.motion");
+  }
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  #if CYTHON_PEP489_MULTI_PHASE_INIT
+  return (__pyx_m != NULL) ? 0 : -1;
+  #elif PY_MAJOR_VERSION >= 3
+  return __pyx_m;
+  #else
+  return;
+  #endif
+}
+
+/* --- Runtime support code --- */
+/* Refnanny */
+#if CYTHON_REFNANNY
+static __Pyx_RefNannyAPIStruct *__Pyx_RefNannyImportAPI(const char *modname) {
+    PyObject *m = NULL, *p = NULL;
+    void *r = NULL;
+    m = PyImport_ImportModule(modname);
+    if (!m) goto end;
+    p = PyObject_GetAttrString(m, "RefNannyAPI");
+    if (!p) goto end;
+    r = PyLong_AsVoidPtr(p);
+end:
+    Py_XDECREF(p);
+    Py_XDECREF(m);
+    return (__Pyx_RefNannyAPIStruct *)r;
+}
+#endif
+
+/* PyObjectGetAttrStr */
+#if CYTHON_USE_TYPE_SLOTS
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStr(PyObject* obj, PyObject* attr_name) {
+    PyTypeObject* tp = Py_TYPE(obj);
+    if (likely(tp->tp_getattro))
+        return tp->tp_getattro(obj, attr_name);
+#if PY_MAJOR_VERSION < 3
+    if (likely(tp->tp_getattr))
+        return tp->tp_getattr(obj, PyString_AS_STRING(attr_name));
+#endif
+    return PyObject_GetAttr(obj, attr_name);
+}
+#endif
+
+/* GetBuiltinName */
+static PyObject *__Pyx_GetBuiltinName(PyObject *name) {
+    PyObject* result = __Pyx_PyObject_GetAttrStr(__pyx_b, name);
+    if (unlikely(!result)) {
+        PyErr_Format(PyExc_NameError,
+#if PY_MAJOR_VERSION >= 3
+            "name '%U' is not defined", name);
+#else
+            "name '%.200s' is not defined", PyString_AS_STRING(name));
+#endif
+    }
+    return result;
+}
+
+/* PyDictVersioning */
+#if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_TYPE_SLOTS
+static CYTHON_INLINE PY_UINT64_T __Pyx_get_tp_dict_version(PyObject *obj) {
+    PyObject *dict = Py_TYPE(obj)->tp_dict;
+    return likely(dict) ? __PYX_GET_DICT_VERSION(dict) : 0;
+}
+static CYTHON_INLINE PY_UINT64_T __Pyx_get_object_dict_version(PyObject *obj) {
+    PyObject **dictptr = NULL;
+    Py_ssize_t offset = Py_TYPE(obj)->tp_dictoffset;
+    if (offset) {
+#if CYTHON_COMPILING_IN_CPYTHON
+        dictptr = (likely(offset > 0)) ? (PyObject **) ((char *)obj + offset) : _PyObject_GetDictPtr(obj);
+#else
+        dictptr = _PyObject_GetDictPtr(obj);
+#endif
+    }
+    return (dictptr && *dictptr) ? __PYX_GET_DICT_VERSION(*dictptr) : 0;
+}
+static CYTHON_INLINE int __Pyx_object_dict_version_matches(PyObject* obj, PY_UINT64_T tp_dict_version, PY_UINT64_T obj_dict_version) {
+    PyObject *dict = Py_TYPE(obj)->tp_dict;
+    if (unlikely(!dict) || unlikely(tp_dict_version != __PYX_GET_DICT_VERSION(dict)))
+        return 0;
+    return obj_dict_version == __Pyx_get_object_dict_version(obj);
+}
+#endif
+
+/* GetModuleGlobalName */
+#if CYTHON_USE_DICT_VERSIONS
+static PyObject *__Pyx__GetModuleGlobalName(PyObject *name, PY_UINT64_T *dict_version, PyObject **dict_cached_value)
+#else
+static CYTHON_INLINE PyObject *__Pyx__GetModuleGlobalName(PyObject *name)
+#endif
+{
+    PyObject *result;
+#if !CYTHON_AVOID_BORROWED_REFS
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030500A1
+    result = _PyDict_GetItem_KnownHash(__pyx_d, name, ((PyASCIIObject *) name)->hash);
+    __PYX_UPDATE_DICT_CACHE(__pyx_d, result, *dict_cached_value, *dict_version)
+    if (likely(result)) {
+        return __Pyx_NewRef(result);
+    } else if (unlikely(PyErr_Occurred())) {
+        return NULL;
+    }
+#else
+    result = PyDict_GetItem(__pyx_d, name);
+    __PYX_UPDATE_DICT_CACHE(__pyx_d, result, *dict_cached_value, *dict_version)
+    if (likely(result)) {
+        return __Pyx_NewRef(result);
+    }
+#endif
+#else
+    result = PyObject_GetItem(__pyx_d, name);
+    __PYX_UPDATE_DICT_CACHE(__pyx_d, result, *dict_cached_value, *dict_version)
+    if (likely(result)) {
+        return __Pyx_NewRef(result);
+    }
+    PyErr_Clear();
+#endif
+    return __Pyx_GetBuiltinName(name);
+}
+
+/* PyCFunctionFastCall */
+#if CYTHON_FAST_PYCCALL
+static CYTHON_INLINE PyObject * __Pyx_PyCFunction_FastCall(PyObject *func_obj, PyObject **args, Py_ssize_t nargs) {
+    PyCFunctionObject *func = (PyCFunctionObject*)func_obj;
+    PyCFunction meth = PyCFunction_GET_FUNCTION(func);
+    PyObject *self = PyCFunction_GET_SELF(func);
+    int flags = PyCFunction_GET_FLAGS(func);
+    assert(PyCFunction_Check(func));
+    assert(METH_FASTCALL == (flags & ~(METH_CLASS | METH_STATIC | METH_COEXIST | METH_KEYWORDS | METH_STACKLESS)));
+    assert(nargs >= 0);
+    assert(nargs == 0 || args != NULL);
+    /* _PyCFunction_FastCallDict() must not be called with an exception set,
+       because it may clear it (directly or indirectly) and so the
+       caller loses its exception */
+    assert(!PyErr_Occurred());
+    if ((PY_VERSION_HEX < 0x030700A0) || unlikely(flags & METH_KEYWORDS)) {
+        return (*((__Pyx_PyCFunctionFastWithKeywords)(void*)meth)) (self, args, nargs, NULL);
+    } else {
+        return (*((__Pyx_PyCFunctionFast)(void*)meth)) (self, args, nargs);
+    }
+}
+#endif
+
+/* PyFunctionFastCall */
+#if CYTHON_FAST_PYCALL
+static PyObject* __Pyx_PyFunction_FastCallNoKw(PyCodeObject *co, PyObject **args, Py_ssize_t na,
+                                               PyObject *globals) {
+    PyFrameObject *f;
+    PyThreadState *tstate = __Pyx_PyThreadState_Current;
+    PyObject **fastlocals;
+    Py_ssize_t i;
+    PyObject *result;
+    assert(globals != NULL);
+    /* XXX Perhaps we should create a specialized
+       PyFrame_New() that doesn't take locals, but does
+       take builtins without sanity checking them.
+       */
+    assert(tstate != NULL);
+    f = PyFrame_New(tstate, co, globals, NULL);
+    if (f == NULL) {
+        return NULL;
+    }
+    fastlocals = __Pyx_PyFrame_GetLocalsplus(f);
+    for (i = 0; i < na; i++) {
+        Py_INCREF(*args);
+        fastlocals[i] = *args++;
+    }
+    result = PyEval_EvalFrameEx(f,0);
+    ++tstate->recursion_depth;
+    Py_DECREF(f);
+    --tstate->recursion_depth;
+    return result;
+}
+#if 1 || PY_VERSION_HEX < 0x030600B1
+static PyObject *__Pyx_PyFunction_FastCallDict(PyObject *func, PyObject **args, Py_ssize_t nargs, PyObject *kwargs) {
+    PyCodeObject *co = (PyCodeObject *)PyFunction_GET_CODE(func);
+    PyObject *globals = PyFunction_GET_GLOBALS(func);
+    PyObject *argdefs = PyFunction_GET_DEFAULTS(func);
+    PyObject *closure;
+#if PY_MAJOR_VERSION >= 3
+    PyObject *kwdefs;
+#endif
+    PyObject *kwtuple, **k;
+    PyObject **d;
+    Py_ssize_t nd;
+    Py_ssize_t nk;
+    PyObject *result;
+    assert(kwargs == NULL || PyDict_Check(kwargs));
+    nk = kwargs ? PyDict_Size(kwargs) : 0;
+    if (Py_EnterRecursiveCall((char*)" while calling a Python object")) {
+        return NULL;
+    }
+    if (
+#if PY_MAJOR_VERSION >= 3
+            co->co_kwonlyargcount == 0 &&
+#endif
+            likely(kwargs == NULL || nk == 0) &&
+            co->co_flags == (CO_OPTIMIZED | CO_NEWLOCALS | CO_NOFREE)) {
+        if (argdefs == NULL && co->co_argcount == nargs) {
+            result = __Pyx_PyFunction_FastCallNoKw(co, args, nargs, globals);
+            goto done;
+        }
+        else if (nargs == 0 && argdefs != NULL
+                 && co->co_argcount == Py_SIZE(argdefs)) {
+            /* function called with no arguments, but all parameters have
+               a default value: use default values as arguments .*/
+            args = &PyTuple_GET_ITEM(argdefs, 0);
+            result =__Pyx_PyFunction_FastCallNoKw(co, args, Py_SIZE(argdefs), globals);
+            goto done;
+        }
+    }
+    if (kwargs != NULL) {
+        Py_ssize_t pos, i;
+        kwtuple = PyTuple_New(2 * nk);
+        if (kwtuple == NULL) {
+            result = NULL;
+            goto done;
+        }
+        k = &PyTuple_GET_ITEM(kwtuple, 0);
+        pos = i = 0;
+        while (PyDict_Next(kwargs, &pos, &k[i], &k[i+1])) {
+            Py_INCREF(k[i]);
+            Py_INCREF(k[i+1]);
+            i += 2;
+        }
+        nk = i / 2;
+    }
+    else {
+        kwtuple = NULL;
+        k = NULL;
+    }
+    closure = PyFunction_GET_CLOSURE(func);
+#if PY_MAJOR_VERSION >= 3
+    kwdefs = PyFunction_GET_KW_DEFAULTS(func);
+#endif
+    if (argdefs != NULL) {
+        d = &PyTuple_GET_ITEM(argdefs, 0);
+        nd = Py_SIZE(argdefs);
+    }
+    else {
+        d = NULL;
+        nd = 0;
+    }
+#if PY_MAJOR_VERSION >= 3
+    result = PyEval_EvalCodeEx((PyObject*)co, globals, (PyObject *)NULL,
+                               args, (int)nargs,
+                               k, (int)nk,
+                               d, (int)nd, kwdefs, closure);
+#else
+    result = PyEval_EvalCodeEx(co, globals, (PyObject *)NULL,
+                               args, (int)nargs,
+                               k, (int)nk,
+                               d, (int)nd, closure);
+#endif
+    Py_XDECREF(kwtuple);
+done:
+    Py_LeaveRecursiveCall();
+    return result;
+}
+#endif
+#endif
+
+/* PyObjectCall */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_Call(PyObject *func, PyObject *arg, PyObject *kw) {
+    PyObject *result;
+    ternaryfunc call = Py_TYPE(func)->tp_call;
+    if (unlikely(!call))
+        return PyObject_Call(func, arg, kw);
+    if (unlikely(Py_EnterRecursiveCall((char*)" while calling a Python object")))
+        return NULL;
+    result = (*call)(func, arg, kw);
+    Py_LeaveRecursiveCall();
+    if (unlikely(!result) && unlikely(!PyErr_Occurred())) {
+        PyErr_SetString(
+            PyExc_SystemError,
+            "NULL result without error in PyObject_Call");
+    }
+    return result;
+}
+#endif
+
+/* PyObjectCall2Args */
+static CYTHON_UNUSED PyObject* __Pyx_PyObject_Call2Args(PyObject* function, PyObject* arg1, PyObject* arg2) {
+    PyObject *args, *result = NULL;
+    #if CYTHON_FAST_PYCALL
+    if (PyFunction_Check(function)) {
+        PyObject *args[2] = {arg1, arg2};
+        return __Pyx_PyFunction_FastCall(function, args, 2);
+    }
+    #endif
+    #if CYTHON_FAST_PYCCALL
+    if (__Pyx_PyFastCFunction_Check(function)) {
+        PyObject *args[2] = {arg1, arg2};
+        return __Pyx_PyCFunction_FastCall(function, args, 2);
+    }
+    #endif
+    args = PyTuple_New(2);
+    if (unlikely(!args)) goto done;
+    Py_INCREF(arg1);
+    PyTuple_SET_ITEM(args, 0, arg1);
+    Py_INCREF(arg2);
+    PyTuple_SET_ITEM(args, 1, arg2);
+    Py_INCREF(function);
+    result = __Pyx_PyObject_Call(function, args, NULL);
+    Py_DECREF(args);
+    Py_DECREF(function);
+done:
+    return result;
+}
+
+/* PyObjectCallMethO */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallMethO(PyObject *func, PyObject *arg) {
+    PyObject *self, *result;
+    PyCFunction cfunc;
+    cfunc = PyCFunction_GET_FUNCTION(func);
+    self = PyCFunction_GET_SELF(func);
+    if (unlikely(Py_EnterRecursiveCall((char*)" while calling a Python object")))
+        return NULL;
+    result = cfunc(self, arg);
+    Py_LeaveRecursiveCall();
+    if (unlikely(!result) && unlikely(!PyErr_Occurred())) {
+        PyErr_SetString(
+            PyExc_SystemError,
+            "NULL result without error in PyObject_Call");
+    }
+    return result;
+}
+#endif
+
+/* PyObjectCallOneArg */
+#if CYTHON_COMPILING_IN_CPYTHON
+static PyObject* __Pyx__PyObject_CallOneArg(PyObject *func, PyObject *arg) {
+    PyObject *result;
+    PyObject *args = PyTuple_New(1);
+    if (unlikely(!args)) return NULL;
+    Py_INCREF(arg);
+    PyTuple_SET_ITEM(args, 0, arg);
+    result = __Pyx_PyObject_Call(func, args, NULL);
+    Py_DECREF(args);
+    return result;
+}
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallOneArg(PyObject *func, PyObject *arg) {
+#if CYTHON_FAST_PYCALL
+    if (PyFunction_Check(func)) {
+        return __Pyx_PyFunction_FastCall(func, &arg, 1);
+    }
+#endif
+    if (likely(PyCFunction_Check(func))) {
+        if (likely(PyCFunction_GET_FLAGS(func) & METH_O)) {
+            return __Pyx_PyObject_CallMethO(func, arg);
+#if CYTHON_FAST_PYCCALL
+        } else if (__Pyx_PyFastCFunction_Check(func)) {
+            return __Pyx_PyCFunction_FastCall(func, &arg, 1);
+#endif
+        }
+    }
+    return __Pyx__PyObject_CallOneArg(func, arg);
+}
+#else
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallOneArg(PyObject *func, PyObject *arg) {
+    PyObject *result;
+    PyObject *args = PyTuple_Pack(1, arg);
+    if (unlikely(!args)) return NULL;
+    result = __Pyx_PyObject_Call(func, args, NULL);
+    Py_DECREF(args);
+    return result;
+}
+#endif
+
+/* PyObjectCallNoArg */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallNoArg(PyObject *func) {
+#if CYTHON_FAST_PYCALL
+    if (PyFunction_Check(func)) {
+        return __Pyx_PyFunction_FastCall(func, NULL, 0);
+    }
+#endif
+#if defined(__Pyx_CyFunction_USED) && defined(NDEBUG)
+    if (likely(PyCFunction_Check(func) || __Pyx_CyFunction_Check(func)))
+#else
+    if (likely(PyCFunction_Check(func)))
+#endif
+    {
+        if (likely(PyCFunction_GET_FLAGS(func) & METH_NOARGS)) {
+            return __Pyx_PyObject_CallMethO(func, NULL);
+        }
+    }
+    return __Pyx_PyObject_Call(func, __pyx_empty_tuple, NULL);
+}
+#endif
+
+/* RaiseArgTupleInvalid */
+static void __Pyx_RaiseArgtupleInvalid(
+    const char* func_name,
+    int exact,
+    Py_ssize_t num_min,
+    Py_ssize_t num_max,
+    Py_ssize_t num_found)
+{
+    Py_ssize_t num_expected;
+    const char *more_or_less;
+    if (num_found < num_min) {
+        num_expected = num_min;
+        more_or_less = "at least";
+    } else {
+        num_expected = num_max;
+        more_or_less = "at most";
+    }
+    if (exact) {
+        more_or_less = "exactly";
+    }
+    PyErr_Format(PyExc_TypeError,
+                 "%.200s() takes %.8s %" CYTHON_FORMAT_SSIZE_T "d positional argument%.1s (%" CYTHON_FORMAT_SSIZE_T "d given)",
+                 func_name, more_or_less, num_expected,
+                 (num_expected == 1) ? "" : "s", num_found);
+}
+
+/* RaiseDoubleKeywords */
+static void __Pyx_RaiseDoubleKeywordsError(
+    const char* func_name,
+    PyObject* kw_name)
+{
+    PyErr_Format(PyExc_TypeError,
+        #if PY_MAJOR_VERSION >= 3
+        "%s() got multiple values for keyword argument '%U'", func_name, kw_name);
+        #else
+        "%s() got multiple values for keyword argument '%s'", func_name,
+        PyString_AsString(kw_name));
+        #endif
+}
+
+/* ParseKeywords */
+static int __Pyx_ParseOptionalKeywords(
+    PyObject *kwds,
+    PyObject **argnames[],
+    PyObject *kwds2,
+    PyObject *values[],
+    Py_ssize_t num_pos_args,
+    const char* function_name)
+{
+    PyObject *key = 0, *value = 0;
+    Py_ssize_t pos = 0;
+    PyObject*** name;
+    PyObject*** first_kw_arg = argnames + num_pos_args;
+    while (PyDict_Next(kwds, &pos, &key, &value)) {
+        name = first_kw_arg;
+        while (*name && (**name != key)) name++;
+        if (*name) {
+            values[name-argnames] = value;
+            continue;
+        }
+        name = first_kw_arg;
+        #if PY_MAJOR_VERSION < 3
+        if (likely(PyString_Check(key))) {
+            while (*name) {
+                if ((CYTHON_COMPILING_IN_PYPY || PyString_GET_SIZE(**name) == PyString_GET_SIZE(key))
+                        && _PyString_Eq(**name, key)) {
+                    values[name-argnames] = value;
+                    break;
+                }
+                name++;
+            }
+            if (*name) continue;
+            else {
+                PyObject*** argname = argnames;
+                while (argname != first_kw_arg) {
+                    if ((**argname == key) || (
+                            (CYTHON_COMPILING_IN_PYPY || PyString_GET_SIZE(**argname) == PyString_GET_SIZE(key))
+                             && _PyString_Eq(**argname, key))) {
+                        goto arg_passed_twice;
+                    }
+                    argname++;
+                }
+            }
+        } else
+        #endif
+        if (likely(PyUnicode_Check(key))) {
+            while (*name) {
+                int cmp = (**name == key) ? 0 :
+                #if !CYTHON_COMPILING_IN_PYPY && PY_MAJOR_VERSION >= 3
+                    (__Pyx_PyUnicode_GET_LENGTH(**name) != __Pyx_PyUnicode_GET_LENGTH(key)) ? 1 :
+                #endif
+                    PyUnicode_Compare(**name, key);
+                if (cmp < 0 && unlikely(PyErr_Occurred())) goto bad;
+                if (cmp == 0) {
+                    values[name-argnames] = value;
+                    break;
+                }
+                name++;
+            }
+            if (*name) continue;
+            else {
+                PyObject*** argname = argnames;
+                while (argname != first_kw_arg) {
+                    int cmp = (**argname == key) ? 0 :
+                    #if !CYTHON_COMPILING_IN_PYPY && PY_MAJOR_VERSION >= 3
+                        (__Pyx_PyUnicode_GET_LENGTH(**argname) != __Pyx_PyUnicode_GET_LENGTH(key)) ? 1 :
+                    #endif
+                        PyUnicode_Compare(**argname, key);
+                    if (cmp < 0 && unlikely(PyErr_Occurred())) goto bad;
+                    if (cmp == 0) goto arg_passed_twice;
+                    argname++;
+                }
+            }
+        } else
+            goto invalid_keyword_type;
+        if (kwds2) {
+            if (unlikely(PyDict_SetItem(kwds2, key, value))) goto bad;
+        } else {
+            goto invalid_keyword;
+        }
+    }
+    return 0;
+arg_passed_twice:
+    __Pyx_RaiseDoubleKeywordsError(function_name, key);
+    goto bad;
+invalid_keyword_type:
+    PyErr_Format(PyExc_TypeError,
+        "%.200s() keywords must be strings", function_name);
+    goto bad;
+invalid_keyword:
+    PyErr_Format(PyExc_TypeError,
+    #if PY_MAJOR_VERSION < 3
+        "%.200s() got an unexpected keyword argument '%.200s'",
+        function_name, PyString_AsString(key));
+    #else
+        "%s() got an unexpected keyword argument '%U'",
+        function_name, key);
+    #endif
+bad:
+    return -1;
+}
+
+/* PyErrFetchRestore */
+#if CYTHON_FAST_THREAD_STATE
+static CYTHON_INLINE void __Pyx_ErrRestoreInState(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb) {
+    PyObject *tmp_type, *tmp_value, *tmp_tb;
+    tmp_type = tstate->curexc_type;
+    tmp_value = tstate->curexc_value;
+    tmp_tb = tstate->curexc_traceback;
+    tstate->curexc_type = type;
+    tstate->curexc_value = value;
+    tstate->curexc_traceback = tb;
+    Py_XDECREF(tmp_type);
+    Py_XDECREF(tmp_value);
+    Py_XDECREF(tmp_tb);
+}
+static CYTHON_INLINE void __Pyx_ErrFetchInState(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb) {
+    *type = tstate->curexc_type;
+    *value = tstate->curexc_value;
+    *tb = tstate->curexc_traceback;
+    tstate->curexc_type = 0;
+    tstate->curexc_value = 0;
+    tstate->curexc_traceback = 0;
+}
+#endif
+
+/* GetException */
+#if CYTHON_FAST_THREAD_STATE
+static int __Pyx__GetException(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb)
+#else
+static int __Pyx_GetException(PyObject **type, PyObject **value, PyObject **tb)
+#endif
+{
+    PyObject *local_type, *local_value, *local_tb;
+#if CYTHON_FAST_THREAD_STATE
+    PyObject *tmp_type, *tmp_value, *tmp_tb;
+    local_type = tstate->curexc_type;
+    local_value = tstate->curexc_value;
+    local_tb = tstate->curexc_traceback;
+    tstate->curexc_type = 0;
+    tstate->curexc_value = 0;
+    tstate->curexc_traceback = 0;
+#else
+    PyErr_Fetch(&local_type, &local_value, &local_tb);
+#endif
+    PyErr_NormalizeException(&local_type, &local_value, &local_tb);
+#if CYTHON_FAST_THREAD_STATE
+    if (unlikely(tstate->curexc_type))
+#else
+    if (unlikely(PyErr_Occurred()))
+#endif
+        goto bad;
+    #if PY_MAJOR_VERSION >= 3
+    if (local_tb) {
+        if (unlikely(PyException_SetTraceback(local_value, local_tb) < 0))
+            goto bad;
+    }
+    #endif
+    Py_XINCREF(local_tb);
+    Py_XINCREF(local_type);
+    Py_XINCREF(local_value);
+    *type = local_type;
+    *value = local_value;
+    *tb = local_tb;
+#if CYTHON_FAST_THREAD_STATE
+    #if CYTHON_USE_EXC_INFO_STACK
+    {
+        _PyErr_StackItem *exc_info = tstate->exc_info;
+        tmp_type = exc_info->exc_type;
+        tmp_value = exc_info->exc_value;
+        tmp_tb = exc_info->exc_traceback;
+        exc_info->exc_type = local_type;
+        exc_info->exc_value = local_value;
+        exc_info->exc_traceback = local_tb;
+    }
+    #else
+    tmp_type = tstate->exc_type;
+    tmp_value = tstate->exc_value;
+    tmp_tb = tstate->exc_traceback;
+    tstate->exc_type = local_type;
+    tstate->exc_value = local_value;
+    tstate->exc_traceback = local_tb;
+    #endif
+    Py_XDECREF(tmp_type);
+    Py_XDECREF(tmp_value);
+    Py_XDECREF(tmp_tb);
+#else
+    PyErr_SetExcInfo(local_type, local_value, local_tb);
+#endif
+    return 0;
+bad:
+    *type = 0;
+    *value = 0;
+    *tb = 0;
+    Py_XDECREF(local_type);
+    Py_XDECREF(local_value);
+    Py_XDECREF(local_tb);
+    return -1;
+}
+
+/* SwapException */
+#if CYTHON_FAST_THREAD_STATE
+static CYTHON_INLINE void __Pyx__ExceptionSwap(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb) {
+    PyObject *tmp_type, *tmp_value, *tmp_tb;
+    #if CYTHON_USE_EXC_INFO_STACK
+    _PyErr_StackItem *exc_info = tstate->exc_info;
+    tmp_type = exc_info->exc_type;
+    tmp_value = exc_info->exc_value;
+    tmp_tb = exc_info->exc_traceback;
+    exc_info->exc_type = *type;
+    exc_info->exc_value = *value;
+    exc_info->exc_traceback = *tb;
+    #else
+    tmp_type = tstate->exc_type;
+    tmp_value = tstate->exc_value;
+    tmp_tb = tstate->exc_traceback;
+    tstate->exc_type = *type;
+    tstate->exc_value = *value;
+    tstate->exc_traceback = *tb;
+    #endif
+    *type = tmp_type;
+    *value = tmp_value;
+    *tb = tmp_tb;
+}
+#else
+static CYTHON_INLINE void __Pyx_ExceptionSwap(PyObject **type, PyObject **value, PyObject **tb) {
+    PyObject *tmp_type, *tmp_value, *tmp_tb;
+    PyErr_GetExcInfo(&tmp_type, &tmp_value, &tmp_tb);
+    PyErr_SetExcInfo(*type, *value, *tb);
+    *type = tmp_type;
+    *value = tmp_value;
+    *tb = tmp_tb;
+}
+#endif
+
+/* GetTopmostException */
+#if CYTHON_USE_EXC_INFO_STACK
+static _PyErr_StackItem *
+__Pyx_PyErr_GetTopmostException(PyThreadState *tstate)
+{
+    _PyErr_StackItem *exc_info = tstate->exc_info;
+    while ((exc_info->exc_type == NULL || exc_info->exc_type == Py_None) &&
+           exc_info->previous_item != NULL)
+    {
+        exc_info = exc_info->previous_item;
+    }
+    return exc_info;
+}
+#endif
+
+/* SaveResetException */
+#if CYTHON_FAST_THREAD_STATE
+static CYTHON_INLINE void __Pyx__ExceptionSave(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb) {
+    #if CYTHON_USE_EXC_INFO_STACK
+    _PyErr_StackItem *exc_info = __Pyx_PyErr_GetTopmostException(tstate);
+    *type = exc_info->exc_type;
+    *value = exc_info->exc_value;
+    *tb = exc_info->exc_traceback;
+    #else
+    *type = tstate->exc_type;
+    *value = tstate->exc_value;
+    *tb = tstate->exc_traceback;
+    #endif
+    Py_XINCREF(*type);
+    Py_XINCREF(*value);
+    Py_XINCREF(*tb);
+}
+static CYTHON_INLINE void __Pyx__ExceptionReset(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb) {
+    PyObject *tmp_type, *tmp_value, *tmp_tb;
+    #if CYTHON_USE_EXC_INFO_STACK
+    _PyErr_StackItem *exc_info = tstate->exc_info;
+    tmp_type = exc_info->exc_type;
+    tmp_value = exc_info->exc_value;
+    tmp_tb = exc_info->exc_traceback;
+    exc_info->exc_type = type;
+    exc_info->exc_value = value;
+    exc_info->exc_traceback = tb;
+    #else
+    tmp_type = tstate->exc_type;
+    tmp_value = tstate->exc_value;
+    tmp_tb = tstate->exc_traceback;
+    tstate->exc_type = type;
+    tstate->exc_value = value;
+    tstate->exc_traceback = tb;
+    #endif
+    Py_XDECREF(tmp_type);
+    Py_XDECREF(tmp_value);
+    Py_XDECREF(tmp_tb);
+}
+#endif
+
+/* WriteUnraisableException */
+static void __Pyx_WriteUnraisable(const char *name, CYTHON_UNUSED int clineno,
+                                  CYTHON_UNUSED int lineno, CYTHON_UNUSED const char *filename,
+                                  int full_traceback, CYTHON_UNUSED int nogil) {
+    PyObject *old_exc, *old_val, *old_tb;
+    PyObject *ctx;
+    __Pyx_PyThreadState_declare
+#ifdef WITH_THREAD
+    PyGILState_STATE state;
+    if (nogil)
+        state = PyGILState_Ensure();
+    else state = (PyGILState_STATE)0;
+#endif
+    __Pyx_PyThreadState_assign
+    __Pyx_ErrFetch(&old_exc, &old_val, &old_tb);
+    if (full_traceback) {
+        Py_XINCREF(old_exc);
+        Py_XINCREF(old_val);
+        Py_XINCREF(old_tb);
+        __Pyx_ErrRestore(old_exc, old_val, old_tb);
+        PyErr_PrintEx(1);
+    }
+    #if PY_MAJOR_VERSION < 3
+    ctx = PyString_FromString(name);
+    #else
+    ctx = PyUnicode_FromString(name);
+    #endif
+    __Pyx_ErrRestore(old_exc, old_val, old_tb);
+    if (!ctx) {
+        PyErr_WriteUnraisable(Py_None);
+    } else {
+        PyErr_WriteUnraisable(ctx);
+        Py_DECREF(ctx);
+    }
+#ifdef WITH_THREAD
+    if (nogil)
+        PyGILState_Release(state);
+#endif
+}
+
+/* RaiseTooManyValuesToUnpack */
+static CYTHON_INLINE void __Pyx_RaiseTooManyValuesError(Py_ssize_t expected) {
+    PyErr_Format(PyExc_ValueError,
+                 "too many values to unpack (expected %" CYTHON_FORMAT_SSIZE_T "d)", expected);
+}
+
+/* RaiseNeedMoreValuesToUnpack */
+static CYTHON_INLINE void __Pyx_RaiseNeedMoreValuesError(Py_ssize_t index) {
+    PyErr_Format(PyExc_ValueError,
+                 "need more than %" CYTHON_FORMAT_SSIZE_T "d value%.1s to unpack",
+                 index, (index == 1) ? "" : "s");
+}
+
+/* IterFinish */
+static CYTHON_INLINE int __Pyx_IterFinish(void) {
+#if CYTHON_FAST_THREAD_STATE
+    PyThreadState *tstate = __Pyx_PyThreadState_Current;
+    PyObject* exc_type = tstate->curexc_type;
+    if (unlikely(exc_type)) {
+        if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) {
+            PyObject *exc_value, *exc_tb;
+            exc_value = tstate->curexc_value;
+            exc_tb = tstate->curexc_traceback;
+            tstate->curexc_type = 0;
+            tstate->curexc_value = 0;
+            tstate->curexc_traceback = 0;
+            Py_DECREF(exc_type);
+            Py_XDECREF(exc_value);
+            Py_XDECREF(exc_tb);
+            return 0;
+        } else {
+            return -1;
+        }
+    }
+    return 0;
+#else
+    if (unlikely(PyErr_Occurred())) {
+        if (likely(PyErr_ExceptionMatches(PyExc_StopIteration))) {
+            PyErr_Clear();
+            return 0;
+        } else {
+            return -1;
+        }
+    }
+    return 0;
+#endif
+}
+
+/* UnpackItemEndCheck */
+static int __Pyx_IternextUnpackEndCheck(PyObject *retval, Py_ssize_t expected) {
+    if (unlikely(retval)) {
+        Py_DECREF(retval);
+        __Pyx_RaiseTooManyValuesError(expected);
+        return -1;
+    }
+    return __Pyx_IterFinish();
+}
+
+/* RaiseException */
+#if PY_MAJOR_VERSION < 3
+static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb,
+                        CYTHON_UNUSED PyObject *cause) {
+    __Pyx_PyThreadState_declare
+    Py_XINCREF(type);
+    if (!value || value == Py_None)
+        value = NULL;
+    else
+        Py_INCREF(value);
+    if (!tb || tb == Py_None)
+        tb = NULL;
+    else {
+        Py_INCREF(tb);
+        if (!PyTraceBack_Check(tb)) {
+            PyErr_SetString(PyExc_TypeError,
+                "raise: arg 3 must be a traceback or None");
+            goto raise_error;
+        }
+    }
+    if (PyType_Check(type)) {
+#if CYTHON_COMPILING_IN_PYPY
+        if (!value) {
+            Py_INCREF(Py_None);
+            value = Py_None;
+        }
+#endif
+        PyErr_NormalizeException(&type, &value, &tb);
+    } else {
+        if (value) {
+            PyErr_SetString(PyExc_TypeError,
+                "instance exception may not have a separate value");
+            goto raise_error;
+        }
+        value = type;
+        type = (PyObject*) Py_TYPE(type);
+        Py_INCREF(type);
+        if (!PyType_IsSubtype((PyTypeObject *)type, (PyTypeObject *)PyExc_BaseException)) {
+            PyErr_SetString(PyExc_TypeError,
+                "raise: exception class must be a subclass of BaseException");
+            goto raise_error;
+        }
+    }
+    __Pyx_PyThreadState_assign
+    __Pyx_ErrRestore(type, value, tb);
+    return;
+raise_error:
+    Py_XDECREF(value);
+    Py_XDECREF(type);
+    Py_XDECREF(tb);
+    return;
+}
+#else
+static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb, PyObject *cause) {
+    PyObject* owned_instance = NULL;
+    if (tb == Py_None) {
+        tb = 0;
+    } else if (tb && !PyTraceBack_Check(tb)) {
+        PyErr_SetString(PyExc_TypeError,
+            "raise: arg 3 must be a traceback or None");
+        goto bad;
+    }
+    if (value == Py_None)
+        value = 0;
+    if (PyExceptionInstance_Check(type)) {
+        if (value) {
+            PyErr_SetString(PyExc_TypeError,
+                "instance exception may not have a separate value");
+            goto bad;
+        }
+        value = type;
+        type = (PyObject*) Py_TYPE(value);
+    } else if (PyExceptionClass_Check(type)) {
+        PyObject *instance_class = NULL;
+        if (value && PyExceptionInstance_Check(value)) {
+            instance_class = (PyObject*) Py_TYPE(value);
+            if (instance_class != type) {
+                int is_subclass = PyObject_IsSubclass(instance_class, type);
+                if (!is_subclass) {
+                    instance_class = NULL;
+                } else if (unlikely(is_subclass == -1)) {
+                    goto bad;
+                } else {
+                    type = instance_class;
+                }
+            }
+        }
+        if (!instance_class) {
+            PyObject *args;
+            if (!value)
+                args = PyTuple_New(0);
+            else if (PyTuple_Check(value)) {
+                Py_INCREF(value);
+                args = value;
+            } else
+                args = PyTuple_Pack(1, value);
+            if (!args)
+                goto bad;
+            owned_instance = PyObject_Call(type, args, NULL);
+            Py_DECREF(args);
+            if (!owned_instance)
+                goto bad;
+            value = owned_instance;
+            if (!PyExceptionInstance_Check(value)) {
+                PyErr_Format(PyExc_TypeError,
+                             "calling %R should have returned an instance of "
+                             "BaseException, not %R",
+                             type, Py_TYPE(value));
+                goto bad;
+            }
+        }
+    } else {
+        PyErr_SetString(PyExc_TypeError,
+            "raise: exception class must be a subclass of BaseException");
+        goto bad;
+    }
+    if (cause) {
+        PyObject *fixed_cause;
+        if (cause == Py_None) {
+            fixed_cause = NULL;
+        } else if (PyExceptionClass_Check(cause)) {
+            fixed_cause = PyObject_CallObject(cause, NULL);
+            if (fixed_cause == NULL)
+                goto bad;
+        } else if (PyExceptionInstance_Check(cause)) {
+            fixed_cause = cause;
+            Py_INCREF(fixed_cause);
+        } else {
+            PyErr_SetString(PyExc_TypeError,
+                            "exception causes must derive from "
+                            "BaseException");
+            goto bad;
+        }
+        PyException_SetCause(value, fixed_cause);
+    }
+    PyErr_SetObject(type, value);
+    if (tb) {
+#if CYTHON_FAST_THREAD_STATE
+        PyThreadState *tstate = __Pyx_PyThreadState_Current;
+        PyObject* tmp_tb = tstate->curexc_traceback;
+        if (tb != tmp_tb) {
+            Py_INCREF(tb);
+            tstate->curexc_traceback = tb;
+            Py_XDECREF(tmp_tb);
+        }
+#else
+        PyObject *tmp_type, *tmp_value, *tmp_tb;
+        PyErr_Fetch(&tmp_type, &tmp_value, &tmp_tb);
+        Py_INCREF(tb);
+        PyErr_Restore(tmp_type, tmp_value, tb);
+        Py_XDECREF(tmp_tb);
+#endif
+    }
+bad:
+    Py_XDECREF(owned_instance);
+    return;
+}
+#endif
+
+/* PyObject_GenericGetAttrNoDict */
+#if CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP && PY_VERSION_HEX < 0x03070000
+static PyObject *__Pyx_RaiseGenericGetAttributeError(PyTypeObject *tp, PyObject *attr_name) {
+    PyErr_Format(PyExc_AttributeError,
+#if PY_MAJOR_VERSION >= 3
+                 "'%.50s' object has no attribute '%U'",
+                 tp->tp_name, attr_name);
+#else
+                 "'%.50s' object has no attribute '%.400s'",
+                 tp->tp_name, PyString_AS_STRING(attr_name));
+#endif
+    return NULL;
+}
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GenericGetAttrNoDict(PyObject* obj, PyObject* attr_name) {
+    PyObject *descr;
+    PyTypeObject *tp = Py_TYPE(obj);
+    if (unlikely(!PyString_Check(attr_name))) {
+        return PyObject_GenericGetAttr(obj, attr_name);
+    }
+    assert(!tp->tp_dictoffset);
+    descr = _PyType_Lookup(tp, attr_name);
+    if (unlikely(!descr)) {
+        return __Pyx_RaiseGenericGetAttributeError(tp, attr_name);
+    }
+    Py_INCREF(descr);
+    #if PY_MAJOR_VERSION < 3
+    if (likely(PyType_HasFeature(Py_TYPE(descr), Py_TPFLAGS_HAVE_CLASS)))
+    #endif
+    {
+        descrgetfunc f = Py_TYPE(descr)->tp_descr_get;
+        if (unlikely(f)) {
+            PyObject *res = f(descr, obj, (PyObject *)tp);
+            Py_DECREF(descr);
+            return res;
+        }
+    }
+    return descr;
+}
+#endif
+
+/* PyObject_GenericGetAttr */
+#if CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP && PY_VERSION_HEX < 0x03070000
+static PyObject* __Pyx_PyObject_GenericGetAttr(PyObject* obj, PyObject* attr_name) {
+    if (unlikely(Py_TYPE(obj)->tp_dictoffset)) {
+        return PyObject_GenericGetAttr(obj, attr_name);
+    }
+    return __Pyx_PyObject_GenericGetAttrNoDict(obj, attr_name);
+}
+#endif
+
+/* SetVTable */
+static int __Pyx_SetVtable(PyObject *dict, void *vtable) {
+#if PY_VERSION_HEX >= 0x02070000
+    PyObject *ob = PyCapsule_New(vtable, 0, 0);
+#else
+    PyObject *ob = PyCObject_FromVoidPtr(vtable, 0);
+#endif
+    if (!ob)
+        goto bad;
+    if (PyDict_SetItem(dict, __pyx_n_s_pyx_vtable, ob) < 0)
+        goto bad;
+    Py_DECREF(ob);
+    return 0;
+bad:
+    Py_XDECREF(ob);
+    return -1;
+}
+
+/* PyErrExceptionMatches */
+#if CYTHON_FAST_THREAD_STATE
+static int __Pyx_PyErr_ExceptionMatchesTuple(PyObject *exc_type, PyObject *tuple) {
+    Py_ssize_t i, n;
+    n = PyTuple_GET_SIZE(tuple);
+#if PY_MAJOR_VERSION >= 3
+    for (i=0; i<n; i++) {
+        if (exc_type == PyTuple_GET_ITEM(tuple, i)) return 1;
+    }
+#endif
+    for (i=0; i<n; i++) {
+        if (__Pyx_PyErr_GivenExceptionMatches(exc_type, PyTuple_GET_ITEM(tuple, i))) return 1;
+    }
+    return 0;
+}
+static CYTHON_INLINE int __Pyx_PyErr_ExceptionMatchesInState(PyThreadState* tstate, PyObject* err) {
+    PyObject *exc_type = tstate->curexc_type;
+    if (exc_type == err) return 1;
+    if (unlikely(!exc_type)) return 0;
+    if (unlikely(PyTuple_Check(err)))
+        return __Pyx_PyErr_ExceptionMatchesTuple(exc_type, err);
+    return __Pyx_PyErr_GivenExceptionMatches(exc_type, err);
+}
+#endif
+
+/* PyObjectGetAttrStrNoError */
+static void __Pyx_PyObject_GetAttrStr_ClearAttributeError(void) {
+    __Pyx_PyThreadState_declare
+    __Pyx_PyThreadState_assign
+    if (likely(__Pyx_PyErr_ExceptionMatches(PyExc_AttributeError)))
+        __Pyx_PyErr_Clear();
+}
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStrNoError(PyObject* obj, PyObject* attr_name) {
+    PyObject *result;
+#if CYTHON_COMPILING_IN_CPYTHON && CYTHON_USE_TYPE_SLOTS && PY_VERSION_HEX >= 0x030700B1
+    PyTypeObject* tp = Py_TYPE(obj);
+    if (likely(tp->tp_getattro == PyObject_GenericGetAttr)) {
+        return _PyObject_GenericGetAttrWithDict(obj, attr_name, NULL, 1);
+    }
+#endif
+    result = __Pyx_PyObject_GetAttrStr(obj, attr_name);
+    if (unlikely(!result)) {
+        __Pyx_PyObject_GetAttrStr_ClearAttributeError();
+    }
+    return result;
+}
+
+/* SetupReduce */
+static int __Pyx_setup_reduce_is_named(PyObject* meth, PyObject* name) {
+  int ret;
+  PyObject *name_attr;
+  name_attr = __Pyx_PyObject_GetAttrStr(meth, __pyx_n_s_name);
+  if (likely(name_attr)) {
+      ret = PyObject_RichCompareBool(name_attr, name, Py_EQ);
+  } else {
+      ret = -1;
+  }
+  if (unlikely(ret < 0)) {
+      PyErr_Clear();
+      ret = 0;
+  }
+  Py_XDECREF(name_attr);
+  return ret;
+}
+static int __Pyx_setup_reduce(PyObject* type_obj) {
+    int ret = 0;
+    PyObject *object_reduce = NULL;
+    PyObject *object_getstate = NULL;
+    PyObject *object_reduce_ex = NULL;
+    PyObject *reduce = NULL;
+    PyObject *reduce_ex = NULL;
+    PyObject *reduce_cython = NULL;
+    PyObject *setstate = NULL;
+    PyObject *setstate_cython = NULL;
+    PyObject *getstate = NULL;
+#if CYTHON_USE_PYTYPE_LOOKUP
+    getstate = _PyType_Lookup((PyTypeObject*)type_obj, __pyx_n_s_getstate);
+#else
+    getstate = __Pyx_PyObject_GetAttrStrNoError(type_obj, __pyx_n_s_getstate);
+    if (!getstate && PyErr_Occurred()) {
+        goto __PYX_BAD;
+    }
+#endif
+    if (getstate) {
+#if CYTHON_USE_PYTYPE_LOOKUP
+        object_getstate = _PyType_Lookup(&PyBaseObject_Type, __pyx_n_s_getstate);
+#else
+        object_getstate = __Pyx_PyObject_GetAttrStrNoError((PyObject*)&PyBaseObject_Type, __pyx_n_s_getstate);
+        if (!object_getstate && PyErr_Occurred()) {
+            goto __PYX_BAD;
+        }
+#endif
+        if (object_getstate != getstate) {
+            goto __PYX_GOOD;
+        }
+    }
+#if CYTHON_USE_PYTYPE_LOOKUP
+    object_reduce_ex = _PyType_Lookup(&PyBaseObject_Type, __pyx_n_s_reduce_ex); if (!object_reduce_ex) goto __PYX_BAD;
+#else
+    object_reduce_ex = __Pyx_PyObject_GetAttrStr((PyObject*)&PyBaseObject_Type, __pyx_n_s_reduce_ex); if (!object_reduce_ex) goto __PYX_BAD;
+#endif
+    reduce_ex = __Pyx_PyObject_GetAttrStr(type_obj, __pyx_n_s_reduce_ex); if (unlikely(!reduce_ex)) goto __PYX_BAD;
+    if (reduce_ex == object_reduce_ex) {
+#if CYTHON_USE_PYTYPE_LOOKUP
+        object_reduce = _PyType_Lookup(&PyBaseObject_Type, __pyx_n_s_reduce); if (!object_reduce) goto __PYX_BAD;
+#else
+        object_reduce = __Pyx_PyObject_GetAttrStr((PyObject*)&PyBaseObject_Type, __pyx_n_s_reduce); if (!object_reduce) goto __PYX_BAD;
+#endif
+        reduce = __Pyx_PyObject_GetAttrStr(type_obj, __pyx_n_s_reduce); if (unlikely(!reduce)) goto __PYX_BAD;
+        if (reduce == object_reduce || __Pyx_setup_reduce_is_named(reduce, __pyx_n_s_reduce_cython)) {
+            reduce_cython = __Pyx_PyObject_GetAttrStrNoError(type_obj, __pyx_n_s_reduce_cython);
+            if (likely(reduce_cython)) {
+                ret = PyDict_SetItem(((PyTypeObject*)type_obj)->tp_dict, __pyx_n_s_reduce, reduce_cython); if (unlikely(ret < 0)) goto __PYX_BAD;
+                ret = PyDict_DelItem(((PyTypeObject*)type_obj)->tp_dict, __pyx_n_s_reduce_cython); if (unlikely(ret < 0)) goto __PYX_BAD;
+            } else if (reduce == object_reduce || PyErr_Occurred()) {
+                goto __PYX_BAD;
+            }
+            setstate = __Pyx_PyObject_GetAttrStr(type_obj, __pyx_n_s_setstate);
+            if (!setstate) PyErr_Clear();
+            if (!setstate || __Pyx_setup_reduce_is_named(setstate, __pyx_n_s_setstate_cython)) {
+                setstate_cython = __Pyx_PyObject_GetAttrStrNoError(type_obj, __pyx_n_s_setstate_cython);
+                if (likely(setstate_cython)) {
+                    ret = PyDict_SetItem(((PyTypeObject*)type_obj)->tp_dict, __pyx_n_s_setstate, setstate_cython); if (unlikely(ret < 0)) goto __PYX_BAD;
+                    ret = PyDict_DelItem(((PyTypeObject*)type_obj)->tp_dict, __pyx_n_s_setstate_cython); if (unlikely(ret < 0)) goto __PYX_BAD;
+                } else if (!setstate || PyErr_Occurred()) {
+                    goto __PYX_BAD;
+                }
+            }
+            PyType_Modified((PyTypeObject*)type_obj);
+        }
+    }
+    goto __PYX_GOOD;
+__PYX_BAD:
+    if (!PyErr_Occurred())
+        PyErr_Format(PyExc_RuntimeError, "Unable to initialize pickling for %s", ((PyTypeObject*)type_obj)->tp_name);
+    ret = -1;
+__PYX_GOOD:
+#if !CYTHON_USE_PYTYPE_LOOKUP
+    Py_XDECREF(object_reduce);
+    Py_XDECREF(object_reduce_ex);
+    Py_XDECREF(object_getstate);
+    Py_XDECREF(getstate);
+#endif
+    Py_XDECREF(reduce);
+    Py_XDECREF(reduce_ex);
+    Py_XDECREF(reduce_cython);
+    Py_XDECREF(setstate);
+    Py_XDECREF(setstate_cython);
+    return ret;
+}
+
+/* Import */
+static PyObject *__Pyx_Import(PyObject *name, PyObject *from_list, int level) {
+    PyObject *empty_list = 0;
+    PyObject *module = 0;
+    PyObject *global_dict = 0;
+    PyObject *empty_dict = 0;
+    PyObject *list;
+    #if PY_MAJOR_VERSION < 3
+    PyObject *py_import;
+    py_import = __Pyx_PyObject_GetAttrStr(__pyx_b, __pyx_n_s_import);
+    if (!py_import)
+        goto bad;
+    #endif
+    if (from_list)
+        list = from_list;
+    else {
+        empty_list = PyList_New(0);
+        if (!empty_list)
+            goto bad;
+        list = empty_list;
+    }
+    global_dict = PyModule_GetDict(__pyx_m);
+    if (!global_dict)
+        goto bad;
+    empty_dict = PyDict_New();
+    if (!empty_dict)
+        goto bad;
+    {
+        #if PY_MAJOR_VERSION >= 3
+        if (level == -1) {
+            if ((1) && (strchr(__Pyx_MODULE_NAME, '.'))) {
+                module = PyImport_ImportModuleLevelObject(
+                    name, global_dict, empty_dict, list, 1);
+                if (!module) {
+                    if (!PyErr_ExceptionMatches(PyExc_ImportError))
+                        goto bad;
+                    PyErr_Clear();
+                }
+            }
+            level = 0;
+        }
+        #endif
+        if (!module) {
+            #if PY_MAJOR_VERSION < 3
+            PyObject *py_level = PyInt_FromLong(level);
+            if (!py_level)
+                goto bad;
+            module = PyObject_CallFunctionObjArgs(py_import,
+                name, global_dict, empty_dict, list, py_level, (PyObject *)NULL);
+            Py_DECREF(py_level);
+            #else
+            module = PyImport_ImportModuleLevelObject(
+                name, global_dict, empty_dict, list, level);
+            #endif
+        }
+    }
+bad:
+    #if PY_MAJOR_VERSION < 3
+    Py_XDECREF(py_import);
+    #endif
+    Py_XDECREF(empty_list);
+    Py_XDECREF(empty_dict);
+    return module;
+}
+
+/* ImportFrom */
+static PyObject* __Pyx_ImportFrom(PyObject* module, PyObject* name) {
+    PyObject* value = __Pyx_PyObject_GetAttrStr(module, name);
+    if (unlikely(!value) && PyErr_ExceptionMatches(PyExc_AttributeError)) {
+        PyErr_Format(PyExc_ImportError,
+        #if PY_MAJOR_VERSION < 3
+            "cannot import name %.230s", PyString_AS_STRING(name));
+        #else
+            "cannot import name %S", name);
+        #endif
+    }
+    return value;
+}
+
+/* CLineInTraceback */
+#ifndef CYTHON_CLINE_IN_TRACEBACK
+static int __Pyx_CLineForTraceback(CYTHON_UNUSED PyThreadState *tstate, int c_line) {
+    PyObject *use_cline;
+    PyObject *ptype, *pvalue, *ptraceback;
+#if CYTHON_COMPILING_IN_CPYTHON
+    PyObject **cython_runtime_dict;
+#endif
+    if (unlikely(!__pyx_cython_runtime)) {
+        return c_line;
+    }
+    __Pyx_ErrFetchInState(tstate, &ptype, &pvalue, &ptraceback);
+#if CYTHON_COMPILING_IN_CPYTHON
+    cython_runtime_dict = _PyObject_GetDictPtr(__pyx_cython_runtime);
+    if (likely(cython_runtime_dict)) {
+        __PYX_PY_DICT_LOOKUP_IF_MODIFIED(
+            use_cline, *cython_runtime_dict,
+            __Pyx_PyDict_GetItemStr(*cython_runtime_dict, __pyx_n_s_cline_in_traceback))
+    } else
+#endif
+    {
+      PyObject *use_cline_obj = __Pyx_PyObject_GetAttrStr(__pyx_cython_runtime, __pyx_n_s_cline_in_traceback);
+      if (use_cline_obj) {
+        use_cline = PyObject_Not(use_cline_obj) ? Py_False : Py_True;
+        Py_DECREF(use_cline_obj);
+      } else {
+        PyErr_Clear();
+        use_cline = NULL;
+      }
+    }
+    if (!use_cline) {
+        c_line = 0;
+        (void) PyObject_SetAttr(__pyx_cython_runtime, __pyx_n_s_cline_in_traceback, Py_False);
+    }
+    else if (use_cline == Py_False || (use_cline != Py_True && PyObject_Not(use_cline) != 0)) {
+        c_line = 0;
+    }
+    __Pyx_ErrRestoreInState(tstate, ptype, pvalue, ptraceback);
+    return c_line;
+}
+#endif
+
+/* CodeObjectCache */
+static int __pyx_bisect_code_objects(__Pyx_CodeObjectCacheEntry* entries, int count, int code_line) {
+    int start = 0, mid = 0, end = count - 1;
+    if (end >= 0 && code_line > entries[end].code_line) {
+        return count;
+    }
+    while (start < end) {
+        mid = start + (end - start) / 2;
+        if (code_line < entries[mid].code_line) {
+            end = mid;
+        } else if (code_line > entries[mid].code_line) {
+             start = mid + 1;
+        } else {
+            return mid;
+        }
+    }
+    if (code_line <= entries[mid].code_line) {
+        return mid;
+    } else {
+        return mid + 1;
+    }
+}
+static PyCodeObject *__pyx_find_code_object(int code_line) {
+    PyCodeObject* code_object;
+    int pos;
+    if (unlikely(!code_line) || unlikely(!__pyx_code_cache.entries)) {
+        return NULL;
+    }
+    pos = __pyx_bisect_code_objects(__pyx_code_cache.entries, __pyx_code_cache.count, code_line);
+    if (unlikely(pos >= __pyx_code_cache.count) || unlikely(__pyx_code_cache.entries[pos].code_line != code_line)) {
+        return NULL;
+    }
+    code_object = __pyx_code_cache.entries[pos].code_object;
+    Py_INCREF(code_object);
+    return code_object;
+}
+static void __pyx_insert_code_object(int code_line, PyCodeObject* code_object) {
+    int pos, i;
+    __Pyx_CodeObjectCacheEntry* entries = __pyx_code_cache.entries;
+    if (unlikely(!code_line)) {
+        return;
+    }
+    if (unlikely(!entries)) {
+        entries = (__Pyx_CodeObjectCacheEntry*)PyMem_Malloc(64*sizeof(__Pyx_CodeObjectCacheEntry));
+        if (likely(entries)) {
+            __pyx_code_cache.entries = entries;
+            __pyx_code_cache.max_count = 64;
+            __pyx_code_cache.count = 1;
+            entries[0].code_line = code_line;
+            entries[0].code_object = code_object;
+            Py_INCREF(code_object);
+        }
+        return;
+    }
+    pos = __pyx_bisect_code_objects(__pyx_code_cache.entries, __pyx_code_cache.count, code_line);
+    if ((pos < __pyx_code_cache.count) && unlikely(__pyx_code_cache.entries[pos].code_line == code_line)) {
+        PyCodeObject* tmp = entries[pos].code_object;
+        entries[pos].code_object = code_object;
+        Py_DECREF(tmp);
+        return;
+    }
+    if (__pyx_code_cache.count == __pyx_code_cache.max_count) {
+        int new_max = __pyx_code_cache.max_count + 64;
+        entries = (__Pyx_CodeObjectCacheEntry*)PyMem_Realloc(
+            __pyx_code_cache.entries, ((size_t)new_max) * sizeof(__Pyx_CodeObjectCacheEntry));
+        if (unlikely(!entries)) {
+            return;
+        }
+        __pyx_code_cache.entries = entries;
+        __pyx_code_cache.max_count = new_max;
+    }
+    for (i=__pyx_code_cache.count; i>pos; i--) {
+        entries[i] = entries[i-1];
+    }
+    entries[pos].code_line = code_line;
+    entries[pos].code_object = code_object;
+    __pyx_code_cache.count++;
+    Py_INCREF(code_object);
+}
+
+/* AddTraceback */
+#include "compile.h"
+#include "frameobject.h"
+#include "traceback.h"
+#if PY_VERSION_HEX >= 0x030b00a6
+  #ifndef Py_BUILD_CORE
+    #define Py_BUILD_CORE 1
+  #endif
+  #include "internal/pycore_frame.h"
+#endif
+static PyCodeObject* __Pyx_CreateCodeObjectForTraceback(
+            const char *funcname, int c_line,
+            int py_line, const char *filename) {
+    PyCodeObject *py_code = NULL;
+    PyObject *py_funcname = NULL;
+    #if PY_MAJOR_VERSION < 3
+    PyObject *py_srcfile = NULL;
+    py_srcfile = PyString_FromString(filename);
+    if (!py_srcfile) goto bad;
+    #endif
+    if (c_line) {
+        #if PY_MAJOR_VERSION < 3
+        py_funcname = PyString_FromFormat( "%s (%s:%d)", funcname, __pyx_cfilenm, c_line);
+        if (!py_funcname) goto bad;
+        #else
+        py_funcname = PyUnicode_FromFormat( "%s (%s:%d)", funcname, __pyx_cfilenm, c_line);
+        if (!py_funcname) goto bad;
+        funcname = PyUnicode_AsUTF8(py_funcname);
+        if (!funcname) goto bad;
+        #endif
+    }
+    else {
+        #if PY_MAJOR_VERSION < 3
+        py_funcname = PyString_FromString(funcname);
+        if (!py_funcname) goto bad;
+        #endif
+    }
+    #if PY_MAJOR_VERSION < 3
+    py_code = __Pyx_PyCode_New(
+        0,
+        0,
+        0,
+        0,
+        0,
+        __pyx_empty_bytes, /*PyObject *code,*/
+        __pyx_empty_tuple, /*PyObject *consts,*/
+        __pyx_empty_tuple, /*PyObject *names,*/
+        __pyx_empty_tuple, /*PyObject *varnames,*/
+        __pyx_empty_tuple, /*PyObject *freevars,*/
+        __pyx_empty_tuple, /*PyObject *cellvars,*/
+        py_srcfile,   /*PyObject *filename,*/
+        py_funcname,  /*PyObject *name,*/
+        py_line,
+        __pyx_empty_bytes  /*PyObject *lnotab*/
+    );
+    Py_DECREF(py_srcfile);
+    #else
+    py_code = PyCode_NewEmpty(filename, funcname, py_line);
+    #endif
+    Py_XDECREF(py_funcname);  // XDECREF since it's only set on Py3 if cline
+    return py_code;
+bad:
+    Py_XDECREF(py_funcname);
+    #if PY_MAJOR_VERSION < 3
+    Py_XDECREF(py_srcfile);
+    #endif
+    return NULL;
+}
+static void __Pyx_AddTraceback(const char *funcname, int c_line,
+                               int py_line, const char *filename) {
+    PyCodeObject *py_code = 0;
+    PyFrameObject *py_frame = 0;
+    PyThreadState *tstate = __Pyx_PyThreadState_Current;
+    PyObject *ptype, *pvalue, *ptraceback;
+    if (c_line) {
+        c_line = __Pyx_CLineForTraceback(tstate, c_line);
+    }
+    py_code = __pyx_find_code_object(c_line ? -c_line : py_line);
+    if (!py_code) {
+        __Pyx_ErrFetchInState(tstate, &ptype, &pvalue, &ptraceback);
+        py_code = __Pyx_CreateCodeObjectForTraceback(
+            funcname, c_line, py_line, filename);
+        if (!py_code) {
+            /* If the code object creation fails, then we should clear the
+               fetched exception references and propagate the new exception */
+            Py_XDECREF(ptype);
+            Py_XDECREF(pvalue);
+            Py_XDECREF(ptraceback);
+            goto bad;
+        }
+        __Pyx_ErrRestoreInState(tstate, ptype, pvalue, ptraceback);
+        __pyx_insert_code_object(c_line ? -c_line : py_line, py_code);
+    }
+    py_frame = PyFrame_New(
+        tstate,            /*PyThreadState *tstate,*/
+        py_code,           /*PyCodeObject *code,*/
+        __pyx_d,    /*PyObject *globals,*/
+        0                  /*PyObject *locals*/
+    );
+    if (!py_frame) goto bad;
+    __Pyx_PyFrame_SetLineNumber(py_frame, py_line);
+    PyTraceBack_Here(py_frame);
+bad:
+    Py_XDECREF(py_code);
+    Py_XDECREF(py_frame);
+}
+
+/* CIntFromPyVerify */
+#define __PYX_VERIFY_RETURN_INT(target_type, func_type, func_value)\
+    __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, 0)
+#define __PYX_VERIFY_RETURN_INT_EXC(target_type, func_type, func_value)\
+    __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, 1)
+#define __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, exc)\
+    {\
+        func_type value = func_value;\
+        if (sizeof(target_type) < sizeof(func_type)) {\
+            if (unlikely(value != (func_type) (target_type) value)) {\
+                func_type zero = 0;\
+                if (exc && unlikely(value == (func_type)-1 && PyErr_Occurred()))\
+                    return (target_type) -1;\
+                if (is_unsigned && unlikely(value < zero))\
+                    goto raise_neg_overflow;\
+                else\
+                    goto raise_overflow;\
+            }\
+        }\
+        return (target_type) value;\
+    }
+
+/* CIntFromPy */
+static CYTHON_INLINE unsigned int __Pyx_PyInt_As_unsigned_int(PyObject *x) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const unsigned int neg_one = (unsigned int) -1, const_zero = (unsigned int) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+#if PY_MAJOR_VERSION < 3
+    if (likely(PyInt_Check(x))) {
+        if (sizeof(unsigned int) < sizeof(long)) {
+            __PYX_VERIFY_RETURN_INT(unsigned int, long, PyInt_AS_LONG(x))
+        } else {
+            long val = PyInt_AS_LONG(x);
+            if (is_unsigned && unlikely(val < 0)) {
+                goto raise_neg_overflow;
+            }
+            return (unsigned int) val;
+        }
+    } else
+#endif
+    if (likely(PyLong_Check(x))) {
+        if (is_unsigned) {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (unsigned int) 0;
+                case  1: __PYX_VERIFY_RETURN_INT(unsigned int, digit, digits[0])
+                case 2:
+                    if (8 * sizeof(unsigned int) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(unsigned int, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(unsigned int) >= 2 * PyLong_SHIFT) {
+                            return (unsigned int) (((((unsigned int)digits[1]) << PyLong_SHIFT) | (unsigned int)digits[0]));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(unsigned int) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(unsigned int, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(unsigned int) >= 3 * PyLong_SHIFT) {
+                            return (unsigned int) (((((((unsigned int)digits[2]) << PyLong_SHIFT) | (unsigned int)digits[1]) << PyLong_SHIFT) | (unsigned int)digits[0]));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(unsigned int) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(unsigned int, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(unsigned int) >= 4 * PyLong_SHIFT) {
+                            return (unsigned int) (((((((((unsigned int)digits[3]) << PyLong_SHIFT) | (unsigned int)digits[2]) << PyLong_SHIFT) | (unsigned int)digits[1]) << PyLong_SHIFT) | (unsigned int)digits[0]));
+                        }
+                    }
+                    break;
+            }
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030C00A7
+            if (unlikely(Py_SIZE(x) < 0)) {
+                goto raise_neg_overflow;
+            }
+#else
+            {
+                int result = PyObject_RichCompareBool(x, Py_False, Py_LT);
+                if (unlikely(result < 0))
+                    return (unsigned int) -1;
+                if (unlikely(result == 1))
+                    goto raise_neg_overflow;
+            }
+#endif
+            if (sizeof(unsigned int) <= sizeof(unsigned long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(unsigned int, unsigned long, PyLong_AsUnsignedLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(unsigned int) <= sizeof(unsigned PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(unsigned int, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
+#endif
+            }
+        } else {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (unsigned int) 0;
+                case -1: __PYX_VERIFY_RETURN_INT(unsigned int, sdigit, (sdigit) (-(sdigit)digits[0]))
+                case  1: __PYX_VERIFY_RETURN_INT(unsigned int,  digit, +digits[0])
+                case -2:
+                    if (8 * sizeof(unsigned int) - 1 > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(unsigned int, long, -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(unsigned int) - 1 > 2 * PyLong_SHIFT) {
+                            return (unsigned int) (((unsigned int)-1)*(((((unsigned int)digits[1]) << PyLong_SHIFT) | (unsigned int)digits[0])));
+                        }
+                    }
+                    break;
+                case 2:
+                    if (8 * sizeof(unsigned int) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(unsigned int, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(unsigned int) - 1 > 2 * PyLong_SHIFT) {
+                            return (unsigned int) ((((((unsigned int)digits[1]) << PyLong_SHIFT) | (unsigned int)digits[0])));
+                        }
+                    }
+                    break;
+                case -3:
+                    if (8 * sizeof(unsigned int) - 1 > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(unsigned int, long, -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(unsigned int) - 1 > 3 * PyLong_SHIFT) {
+                            return (unsigned int) (((unsigned int)-1)*(((((((unsigned int)digits[2]) << PyLong_SHIFT) | (unsigned int)digits[1]) << PyLong_SHIFT) | (unsigned int)digits[0])));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(unsigned int) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(unsigned int, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(unsigned int) - 1 > 3 * PyLong_SHIFT) {
+                            return (unsigned int) ((((((((unsigned int)digits[2]) << PyLong_SHIFT) | (unsigned int)digits[1]) << PyLong_SHIFT) | (unsigned int)digits[0])));
+                        }
+                    }
+                    break;
+                case -4:
+                    if (8 * sizeof(unsigned int) - 1 > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(unsigned int, long, -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(unsigned int) - 1 > 4 * PyLong_SHIFT) {
+                            return (unsigned int) (((unsigned int)-1)*(((((((((unsigned int)digits[3]) << PyLong_SHIFT) | (unsigned int)digits[2]) << PyLong_SHIFT) | (unsigned int)digits[1]) << PyLong_SHIFT) | (unsigned int)digits[0])));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(unsigned int) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(unsigned int, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(unsigned int) - 1 > 4 * PyLong_SHIFT) {
+                            return (unsigned int) ((((((((((unsigned int)digits[3]) << PyLong_SHIFT) | (unsigned int)digits[2]) << PyLong_SHIFT) | (unsigned int)digits[1]) << PyLong_SHIFT) | (unsigned int)digits[0])));
+                        }
+                    }
+                    break;
+            }
+#endif
+            if (sizeof(unsigned int) <= sizeof(long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(unsigned int, long, PyLong_AsLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(unsigned int) <= sizeof(PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(unsigned int, PY_LONG_LONG, PyLong_AsLongLong(x))
+#endif
+            }
+        }
+        {
+#if CYTHON_COMPILING_IN_PYPY && !defined(_PyLong_AsByteArray)
+            PyErr_SetString(PyExc_RuntimeError,
+                            "_PyLong_AsByteArray() not available in PyPy, cannot convert large numbers");
+#else
+            unsigned int val;
+            PyObject *v = __Pyx_PyNumber_IntOrLong(x);
+ #if PY_MAJOR_VERSION < 3
+            if (likely(v) && !PyLong_Check(v)) {
+                PyObject *tmp = v;
+                v = PyNumber_Long(tmp);
+                Py_DECREF(tmp);
+            }
+ #endif
+            if (likely(v)) {
+                int one = 1; int is_little = (int)*(unsigned char *)&one;
+                unsigned char *bytes = (unsigned char *)&val;
+                int ret = _PyLong_AsByteArray((PyLongObject *)v,
+                                              bytes, sizeof(val),
+                                              is_little, !is_unsigned);
+                Py_DECREF(v);
+                if (likely(!ret))
+                    return val;
+            }
+#endif
+            return (unsigned int) -1;
+        }
+    } else {
+        unsigned int val;
+        PyObject *tmp = __Pyx_PyNumber_IntOrLong(x);
+        if (!tmp) return (unsigned int) -1;
+        val = __Pyx_PyInt_As_unsigned_int(tmp);
+        Py_DECREF(tmp);
+        return val;
+    }
+raise_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "value too large to convert to unsigned int");
+    return (unsigned int) -1;
+raise_neg_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "can't convert negative value to unsigned int");
+    return (unsigned int) -1;
+}
+
+/* CIntFromPy */
+static CYTHON_INLINE unsigned char __Pyx_PyInt_As_unsigned_char(PyObject *x) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const unsigned char neg_one = (unsigned char) -1, const_zero = (unsigned char) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+#if PY_MAJOR_VERSION < 3
+    if (likely(PyInt_Check(x))) {
+        if (sizeof(unsigned char) < sizeof(long)) {
+            __PYX_VERIFY_RETURN_INT(unsigned char, long, PyInt_AS_LONG(x))
+        } else {
+            long val = PyInt_AS_LONG(x);
+            if (is_unsigned && unlikely(val < 0)) {
+                goto raise_neg_overflow;
+            }
+            return (unsigned char) val;
+        }
+    } else
+#endif
+    if (likely(PyLong_Check(x))) {
+        if (is_unsigned) {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (unsigned char) 0;
+                case  1: __PYX_VERIFY_RETURN_INT(unsigned char, digit, digits[0])
+                case 2:
+                    if (8 * sizeof(unsigned char) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(unsigned char, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(unsigned char) >= 2 * PyLong_SHIFT) {
+                            return (unsigned char) (((((unsigned char)digits[1]) << PyLong_SHIFT) | (unsigned char)digits[0]));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(unsigned char) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(unsigned char, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(unsigned char) >= 3 * PyLong_SHIFT) {
+                            return (unsigned char) (((((((unsigned char)digits[2]) << PyLong_SHIFT) | (unsigned char)digits[1]) << PyLong_SHIFT) | (unsigned char)digits[0]));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(unsigned char) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(unsigned char, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(unsigned char) >= 4 * PyLong_SHIFT) {
+                            return (unsigned char) (((((((((unsigned char)digits[3]) << PyLong_SHIFT) | (unsigned char)digits[2]) << PyLong_SHIFT) | (unsigned char)digits[1]) << PyLong_SHIFT) | (unsigned char)digits[0]));
+                        }
+                    }
+                    break;
+            }
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030C00A7
+            if (unlikely(Py_SIZE(x) < 0)) {
+                goto raise_neg_overflow;
+            }
+#else
+            {
+                int result = PyObject_RichCompareBool(x, Py_False, Py_LT);
+                if (unlikely(result < 0))
+                    return (unsigned char) -1;
+                if (unlikely(result == 1))
+                    goto raise_neg_overflow;
+            }
+#endif
+            if (sizeof(unsigned char) <= sizeof(unsigned long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(unsigned char, unsigned long, PyLong_AsUnsignedLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(unsigned char) <= sizeof(unsigned PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(unsigned char, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
+#endif
+            }
+        } else {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (unsigned char) 0;
+                case -1: __PYX_VERIFY_RETURN_INT(unsigned char, sdigit, (sdigit) (-(sdigit)digits[0]))
+                case  1: __PYX_VERIFY_RETURN_INT(unsigned char,  digit, +digits[0])
+                case -2:
+                    if (8 * sizeof(unsigned char) - 1 > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(unsigned char, long, -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(unsigned char) - 1 > 2 * PyLong_SHIFT) {
+                            return (unsigned char) (((unsigned char)-1)*(((((unsigned char)digits[1]) << PyLong_SHIFT) | (unsigned char)digits[0])));
+                        }
+                    }
+                    break;
+                case 2:
+                    if (8 * sizeof(unsigned char) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(unsigned char, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(unsigned char) - 1 > 2 * PyLong_SHIFT) {
+                            return (unsigned char) ((((((unsigned char)digits[1]) << PyLong_SHIFT) | (unsigned char)digits[0])));
+                        }
+                    }
+                    break;
+                case -3:
+                    if (8 * sizeof(unsigned char) - 1 > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(unsigned char, long, -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(unsigned char) - 1 > 3 * PyLong_SHIFT) {
+                            return (unsigned char) (((unsigned char)-1)*(((((((unsigned char)digits[2]) << PyLong_SHIFT) | (unsigned char)digits[1]) << PyLong_SHIFT) | (unsigned char)digits[0])));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(unsigned char) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(unsigned char, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(unsigned char) - 1 > 3 * PyLong_SHIFT) {
+                            return (unsigned char) ((((((((unsigned char)digits[2]) << PyLong_SHIFT) | (unsigned char)digits[1]) << PyLong_SHIFT) | (unsigned char)digits[0])));
+                        }
+                    }
+                    break;
+                case -4:
+                    if (8 * sizeof(unsigned char) - 1 > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(unsigned char, long, -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(unsigned char) - 1 > 4 * PyLong_SHIFT) {
+                            return (unsigned char) (((unsigned char)-1)*(((((((((unsigned char)digits[3]) << PyLong_SHIFT) | (unsigned char)digits[2]) << PyLong_SHIFT) | (unsigned char)digits[1]) << PyLong_SHIFT) | (unsigned char)digits[0])));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(unsigned char) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(unsigned char, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(unsigned char) - 1 > 4 * PyLong_SHIFT) {
+                            return (unsigned char) ((((((((((unsigned char)digits[3]) << PyLong_SHIFT) | (unsigned char)digits[2]) << PyLong_SHIFT) | (unsigned char)digits[1]) << PyLong_SHIFT) | (unsigned char)digits[0])));
+                        }
+                    }
+                    break;
+            }
+#endif
+            if (sizeof(unsigned char) <= sizeof(long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(unsigned char, long, PyLong_AsLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(unsigned char) <= sizeof(PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(unsigned char, PY_LONG_LONG, PyLong_AsLongLong(x))
+#endif
+            }
+        }
+        {
+#if CYTHON_COMPILING_IN_PYPY && !defined(_PyLong_AsByteArray)
+            PyErr_SetString(PyExc_RuntimeError,
+                            "_PyLong_AsByteArray() not available in PyPy, cannot convert large numbers");
+#else
+            unsigned char val;
+            PyObject *v = __Pyx_PyNumber_IntOrLong(x);
+ #if PY_MAJOR_VERSION < 3
+            if (likely(v) && !PyLong_Check(v)) {
+                PyObject *tmp = v;
+                v = PyNumber_Long(tmp);
+                Py_DECREF(tmp);
+            }
+ #endif
+            if (likely(v)) {
+                int one = 1; int is_little = (int)*(unsigned char *)&one;
+                unsigned char *bytes = (unsigned char *)&val;
+                int ret = _PyLong_AsByteArray((PyLongObject *)v,
+                                              bytes, sizeof(val),
+                                              is_little, !is_unsigned);
+                Py_DECREF(v);
+                if (likely(!ret))
+                    return val;
+            }
+#endif
+            return (unsigned char) -1;
+        }
+    } else {
+        unsigned char val;
+        PyObject *tmp = __Pyx_PyNumber_IntOrLong(x);
+        if (!tmp) return (unsigned char) -1;
+        val = __Pyx_PyInt_As_unsigned_char(tmp);
+        Py_DECREF(tmp);
+        return val;
+    }
+raise_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "value too large to convert to unsigned char");
+    return (unsigned char) -1;
+raise_neg_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "can't convert negative value to unsigned char");
+    return (unsigned char) -1;
+}
+
+/* CIntFromPy */
+static CYTHON_INLINE int __Pyx_PyInt_As_int(PyObject *x) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const int neg_one = (int) -1, const_zero = (int) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+#if PY_MAJOR_VERSION < 3
+    if (likely(PyInt_Check(x))) {
+        if (sizeof(int) < sizeof(long)) {
+            __PYX_VERIFY_RETURN_INT(int, long, PyInt_AS_LONG(x))
+        } else {
+            long val = PyInt_AS_LONG(x);
+            if (is_unsigned && unlikely(val < 0)) {
+                goto raise_neg_overflow;
+            }
+            return (int) val;
+        }
+    } else
+#endif
+    if (likely(PyLong_Check(x))) {
+        if (is_unsigned) {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (int) 0;
+                case  1: __PYX_VERIFY_RETURN_INT(int, digit, digits[0])
+                case 2:
+                    if (8 * sizeof(int) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) >= 2 * PyLong_SHIFT) {
+                            return (int) (((((int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(int) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) >= 3 * PyLong_SHIFT) {
+                            return (int) (((((((int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(int) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) >= 4 * PyLong_SHIFT) {
+                            return (int) (((((((((int)digits[3]) << PyLong_SHIFT) | (int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
+                        }
+                    }
+                    break;
+            }
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030C00A7
+            if (unlikely(Py_SIZE(x) < 0)) {
+                goto raise_neg_overflow;
+            }
+#else
+            {
+                int result = PyObject_RichCompareBool(x, Py_False, Py_LT);
+                if (unlikely(result < 0))
+                    return (int) -1;
+                if (unlikely(result == 1))
+                    goto raise_neg_overflow;
+            }
+#endif
+            if (sizeof(int) <= sizeof(unsigned long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(int, unsigned long, PyLong_AsUnsignedLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(int) <= sizeof(unsigned PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(int, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
+#endif
+            }
+        } else {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (int) 0;
+                case -1: __PYX_VERIFY_RETURN_INT(int, sdigit, (sdigit) (-(sdigit)digits[0]))
+                case  1: __PYX_VERIFY_RETURN_INT(int,  digit, +digits[0])
+                case -2:
+                    if (8 * sizeof(int) - 1 > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, long, -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 2 * PyLong_SHIFT) {
+                            return (int) (((int)-1)*(((((int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case 2:
+                    if (8 * sizeof(int) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 2 * PyLong_SHIFT) {
+                            return (int) ((((((int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case -3:
+                    if (8 * sizeof(int) - 1 > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, long, -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 3 * PyLong_SHIFT) {
+                            return (int) (((int)-1)*(((((((int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(int) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 3 * PyLong_SHIFT) {
+                            return (int) ((((((((int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case -4:
+                    if (8 * sizeof(int) - 1 > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, long, -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 4 * PyLong_SHIFT) {
+                            return (int) (((int)-1)*(((((((((int)digits[3]) << PyLong_SHIFT) | (int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(int) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 4 * PyLong_SHIFT) {
+                            return (int) ((((((((((int)digits[3]) << PyLong_SHIFT) | (int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+            }
+#endif
+            if (sizeof(int) <= sizeof(long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(int, long, PyLong_AsLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(int) <= sizeof(PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(int, PY_LONG_LONG, PyLong_AsLongLong(x))
+#endif
+            }
+        }
+        {
+#if CYTHON_COMPILING_IN_PYPY && !defined(_PyLong_AsByteArray)
+            PyErr_SetString(PyExc_RuntimeError,
+                            "_PyLong_AsByteArray() not available in PyPy, cannot convert large numbers");
+#else
+            int val;
+            PyObject *v = __Pyx_PyNumber_IntOrLong(x);
+ #if PY_MAJOR_VERSION < 3
+            if (likely(v) && !PyLong_Check(v)) {
+                PyObject *tmp = v;
+                v = PyNumber_Long(tmp);
+                Py_DECREF(tmp);
+            }
+ #endif
+            if (likely(v)) {
+                int one = 1; int is_little = (int)*(unsigned char *)&one;
+                unsigned char *bytes = (unsigned char *)&val;
+                int ret = _PyLong_AsByteArray((PyLongObject *)v,
+                                              bytes, sizeof(val),
+                                              is_little, !is_unsigned);
+                Py_DECREF(v);
+                if (likely(!ret))
+                    return val;
+            }
+#endif
+            return (int) -1;
+        }
+    } else {
+        int val;
+        PyObject *tmp = __Pyx_PyNumber_IntOrLong(x);
+        if (!tmp) return (int) -1;
+        val = __Pyx_PyInt_As_int(tmp);
+        Py_DECREF(tmp);
+        return val;
+    }
+raise_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "value too large to convert to int");
+    return (int) -1;
+raise_neg_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "can't convert negative value to int");
+    return (int) -1;
+}
+
+/* CIntToPy */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_unsigned_int(unsigned int value) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const unsigned int neg_one = (unsigned int) -1, const_zero = (unsigned int) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    if (is_unsigned) {
+        if (sizeof(unsigned int) < sizeof(long)) {
+            return PyInt_FromLong((long) value);
+        } else if (sizeof(unsigned int) <= sizeof(unsigned long)) {
+            return PyLong_FromUnsignedLong((unsigned long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(unsigned int) <= sizeof(unsigned PY_LONG_LONG)) {
+            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
+#endif
+        }
+    } else {
+        if (sizeof(unsigned int) <= sizeof(long)) {
+            return PyInt_FromLong((long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(unsigned int) <= sizeof(PY_LONG_LONG)) {
+            return PyLong_FromLongLong((PY_LONG_LONG) value);
+#endif
+        }
+    }
+    {
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        unsigned char *bytes = (unsigned char *)&value;
+        return _PyLong_FromByteArray(bytes, sizeof(unsigned int),
+                                     little, !is_unsigned);
+    }
+}
+
+/* CIntToPy */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_long(long value) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const long neg_one = (long) -1, const_zero = (long) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    if (is_unsigned) {
+        if (sizeof(long) < sizeof(long)) {
+            return PyInt_FromLong((long) value);
+        } else if (sizeof(long) <= sizeof(unsigned long)) {
+            return PyLong_FromUnsignedLong((unsigned long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(long) <= sizeof(unsigned PY_LONG_LONG)) {
+            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
+#endif
+        }
+    } else {
+        if (sizeof(long) <= sizeof(long)) {
+            return PyInt_FromLong((long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(long) <= sizeof(PY_LONG_LONG)) {
+            return PyLong_FromLongLong((PY_LONG_LONG) value);
+#endif
+        }
+    }
+    {
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        unsigned char *bytes = (unsigned char *)&value;
+        return _PyLong_FromByteArray(bytes, sizeof(long),
+                                     little, !is_unsigned);
+    }
+}
+
+/* CIntToPy */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_uint64_t(uint64_t value) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const uint64_t neg_one = (uint64_t) -1, const_zero = (uint64_t) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    if (is_unsigned) {
+        if (sizeof(uint64_t) < sizeof(long)) {
+            return PyInt_FromLong((long) value);
+        } else if (sizeof(uint64_t) <= sizeof(unsigned long)) {
+            return PyLong_FromUnsignedLong((unsigned long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(uint64_t) <= sizeof(unsigned PY_LONG_LONG)) {
+            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
+#endif
+        }
+    } else {
+        if (sizeof(uint64_t) <= sizeof(long)) {
+            return PyInt_FromLong((long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(uint64_t) <= sizeof(PY_LONG_LONG)) {
+            return PyLong_FromLongLong((PY_LONG_LONG) value);
+#endif
+        }
+    }
+    {
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        unsigned char *bytes = (unsigned char *)&value;
+        return _PyLong_FromByteArray(bytes, sizeof(uint64_t),
+                                     little, !is_unsigned);
+    }
+}
+
+/* CIntToPy */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_int(int value) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const int neg_one = (int) -1, const_zero = (int) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    if (is_unsigned) {
+        if (sizeof(int) < sizeof(long)) {
+            return PyInt_FromLong((long) value);
+        } else if (sizeof(int) <= sizeof(unsigned long)) {
+            return PyLong_FromUnsignedLong((unsigned long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(int) <= sizeof(unsigned PY_LONG_LONG)) {
+            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
+#endif
+        }
+    } else {
+        if (sizeof(int) <= sizeof(long)) {
+            return PyInt_FromLong((long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(int) <= sizeof(PY_LONG_LONG)) {
+            return PyLong_FromLongLong((PY_LONG_LONG) value);
+#endif
+        }
+    }
+    {
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        unsigned char *bytes = (unsigned char *)&value;
+        return _PyLong_FromByteArray(bytes, sizeof(int),
+                                     little, !is_unsigned);
+    }
+}
+
+/* CIntToPy */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_uint8_t(uint8_t value) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const uint8_t neg_one = (uint8_t) -1, const_zero = (uint8_t) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    if (is_unsigned) {
+        if (sizeof(uint8_t) < sizeof(long)) {
+            return PyInt_FromLong((long) value);
+        } else if (sizeof(uint8_t) <= sizeof(unsigned long)) {
+            return PyLong_FromUnsignedLong((unsigned long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(uint8_t) <= sizeof(unsigned PY_LONG_LONG)) {
+            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
+#endif
+        }
+    } else {
+        if (sizeof(uint8_t) <= sizeof(long)) {
+            return PyInt_FromLong((long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(uint8_t) <= sizeof(PY_LONG_LONG)) {
+            return PyLong_FromLongLong((PY_LONG_LONG) value);
+#endif
+        }
+    }
+    {
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        unsigned char *bytes = (unsigned char *)&value;
+        return _PyLong_FromByteArray(bytes, sizeof(uint8_t),
+                                     little, !is_unsigned);
+    }
+}
+
+/* CIntToPy */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_unsigned_long(unsigned long value) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const unsigned long neg_one = (unsigned long) -1, const_zero = (unsigned long) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    if (is_unsigned) {
+        if (sizeof(unsigned long) < sizeof(long)) {
+            return PyInt_FromLong((long) value);
+        } else if (sizeof(unsigned long) <= sizeof(unsigned long)) {
+            return PyLong_FromUnsignedLong((unsigned long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(unsigned long) <= sizeof(unsigned PY_LONG_LONG)) {
+            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
+#endif
+        }
+    } else {
+        if (sizeof(unsigned long) <= sizeof(long)) {
+            return PyInt_FromLong((long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(unsigned long) <= sizeof(PY_LONG_LONG)) {
+            return PyLong_FromLongLong((PY_LONG_LONG) value);
+#endif
+        }
+    }
+    {
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        unsigned char *bytes = (unsigned char *)&value;
+        return _PyLong_FromByteArray(bytes, sizeof(unsigned long),
+                                     little, !is_unsigned);
+    }
+}
+
+/* CIntFromPy */
+static CYTHON_INLINE long __Pyx_PyInt_As_long(PyObject *x) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const long neg_one = (long) -1, const_zero = (long) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+#if PY_MAJOR_VERSION < 3
+    if (likely(PyInt_Check(x))) {
+        if (sizeof(long) < sizeof(long)) {
+            __PYX_VERIFY_RETURN_INT(long, long, PyInt_AS_LONG(x))
+        } else {
+            long val = PyInt_AS_LONG(x);
+            if (is_unsigned && unlikely(val < 0)) {
+                goto raise_neg_overflow;
+            }
+            return (long) val;
+        }
+    } else
+#endif
+    if (likely(PyLong_Check(x))) {
+        if (is_unsigned) {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (long) 0;
+                case  1: __PYX_VERIFY_RETURN_INT(long, digit, digits[0])
+                case 2:
+                    if (8 * sizeof(long) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) >= 2 * PyLong_SHIFT) {
+                            return (long) (((((long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(long) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) >= 3 * PyLong_SHIFT) {
+                            return (long) (((((((long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(long) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) >= 4 * PyLong_SHIFT) {
+                            return (long) (((((((((long)digits[3]) << PyLong_SHIFT) | (long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
+                        }
+                    }
+                    break;
+            }
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030C00A7
+            if (unlikely(Py_SIZE(x) < 0)) {
+                goto raise_neg_overflow;
+            }
+#else
+            {
+                int result = PyObject_RichCompareBool(x, Py_False, Py_LT);
+                if (unlikely(result < 0))
+                    return (long) -1;
+                if (unlikely(result == 1))
+                    goto raise_neg_overflow;
+            }
+#endif
+            if (sizeof(long) <= sizeof(unsigned long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(long, unsigned long, PyLong_AsUnsignedLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(long) <= sizeof(unsigned PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(long, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
+#endif
+            }
+        } else {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (long) 0;
+                case -1: __PYX_VERIFY_RETURN_INT(long, sdigit, (sdigit) (-(sdigit)digits[0]))
+                case  1: __PYX_VERIFY_RETURN_INT(long,  digit, +digits[0])
+                case -2:
+                    if (8 * sizeof(long) - 1 > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, long, -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT) {
+                            return (long) (((long)-1)*(((((long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+                case 2:
+                    if (8 * sizeof(long) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT) {
+                            return (long) ((((((long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+                case -3:
+                    if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, long, -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT) {
+                            return (long) (((long)-1)*(((((((long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(long) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT) {
+                            return (long) ((((((((long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+                case -4:
+                    if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, long, -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 4 * PyLong_SHIFT) {
+                            return (long) (((long)-1)*(((((((((long)digits[3]) << PyLong_SHIFT) | (long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(long) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 4 * PyLong_SHIFT) {
+                            return (long) ((((((((((long)digits[3]) << PyLong_SHIFT) | (long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+            }
+#endif
+            if (sizeof(long) <= sizeof(long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(long, long, PyLong_AsLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(long) <= sizeof(PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(long, PY_LONG_LONG, PyLong_AsLongLong(x))
+#endif
+            }
+        }
+        {
+#if CYTHON_COMPILING_IN_PYPY && !defined(_PyLong_AsByteArray)
+            PyErr_SetString(PyExc_RuntimeError,
+                            "_PyLong_AsByteArray() not available in PyPy, cannot convert large numbers");
+#else
+            long val;
+            PyObject *v = __Pyx_PyNumber_IntOrLong(x);
+ #if PY_MAJOR_VERSION < 3
+            if (likely(v) && !PyLong_Check(v)) {
+                PyObject *tmp = v;
+                v = PyNumber_Long(tmp);
+                Py_DECREF(tmp);
+            }
+ #endif
+            if (likely(v)) {
+                int one = 1; int is_little = (int)*(unsigned char *)&one;
+                unsigned char *bytes = (unsigned char *)&val;
+                int ret = _PyLong_AsByteArray((PyLongObject *)v,
+                                              bytes, sizeof(val),
+                                              is_little, !is_unsigned);
+                Py_DECREF(v);
+                if (likely(!ret))
+                    return val;
+            }
+#endif
+            return (long) -1;
+        }
+    } else {
+        long val;
+        PyObject *tmp = __Pyx_PyNumber_IntOrLong(x);
+        if (!tmp) return (long) -1;
+        val = __Pyx_PyInt_As_long(tmp);
+        Py_DECREF(tmp);
+        return val;
+    }
+raise_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "value too large to convert to long");
+    return (long) -1;
+raise_neg_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "can't convert negative value to long");
+    return (long) -1;
+}
+
+/* FastTypeChecks */
+#if CYTHON_COMPILING_IN_CPYTHON
+static int __Pyx_InBases(PyTypeObject *a, PyTypeObject *b) {
+    while (a) {
+        a = a->tp_base;
+        if (a == b)
+            return 1;
+    }
+    return b == &PyBaseObject_Type;
+}
+static CYTHON_INLINE int __Pyx_IsSubtype(PyTypeObject *a, PyTypeObject *b) {
+    PyObject *mro;
+    if (a == b) return 1;
+    mro = a->tp_mro;
+    if (likely(mro)) {
+        Py_ssize_t i, n;
+        n = PyTuple_GET_SIZE(mro);
+        for (i = 0; i < n; i++) {
+            if (PyTuple_GET_ITEM(mro, i) == (PyObject *)b)
+                return 1;
+        }
+        return 0;
+    }
+    return __Pyx_InBases(a, b);
+}
+#if PY_MAJOR_VERSION == 2
+static int __Pyx_inner_PyErr_GivenExceptionMatches2(PyObject *err, PyObject* exc_type1, PyObject* exc_type2) {
+    PyObject *exception, *value, *tb;
+    int res;
+    __Pyx_PyThreadState_declare
+    __Pyx_PyThreadState_assign
+    __Pyx_ErrFetch(&exception, &value, &tb);
+    res = exc_type1 ? PyObject_IsSubclass(err, exc_type1) : 0;
+    if (unlikely(res == -1)) {
+        PyErr_WriteUnraisable(err);
+        res = 0;
+    }
+    if (!res) {
+        res = PyObject_IsSubclass(err, exc_type2);
+        if (unlikely(res == -1)) {
+            PyErr_WriteUnraisable(err);
+            res = 0;
+        }
+    }
+    __Pyx_ErrRestore(exception, value, tb);
+    return res;
+}
+#else
+static CYTHON_INLINE int __Pyx_inner_PyErr_GivenExceptionMatches2(PyObject *err, PyObject* exc_type1, PyObject *exc_type2) {
+    int res = exc_type1 ? __Pyx_IsSubtype((PyTypeObject*)err, (PyTypeObject*)exc_type1) : 0;
+    if (!res) {
+        res = __Pyx_IsSubtype((PyTypeObject*)err, (PyTypeObject*)exc_type2);
+    }
+    return res;
+}
+#endif
+static int __Pyx_PyErr_GivenExceptionMatchesTuple(PyObject *exc_type, PyObject *tuple) {
+    Py_ssize_t i, n;
+    assert(PyExceptionClass_Check(exc_type));
+    n = PyTuple_GET_SIZE(tuple);
+#if PY_MAJOR_VERSION >= 3
+    for (i=0; i<n; i++) {
+        if (exc_type == PyTuple_GET_ITEM(tuple, i)) return 1;
+    }
+#endif
+    for (i=0; i<n; i++) {
+        PyObject *t = PyTuple_GET_ITEM(tuple, i);
+        #if PY_MAJOR_VERSION < 3
+        if (likely(exc_type == t)) return 1;
+        #endif
+        if (likely(PyExceptionClass_Check(t))) {
+            if (__Pyx_inner_PyErr_GivenExceptionMatches2(exc_type, NULL, t)) return 1;
+        } else {
+        }
+    }
+    return 0;
+}
+static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches(PyObject *err, PyObject* exc_type) {
+    if (likely(err == exc_type)) return 1;
+    if (likely(PyExceptionClass_Check(err))) {
+        if (likely(PyExceptionClass_Check(exc_type))) {
+            return __Pyx_inner_PyErr_GivenExceptionMatches2(err, NULL, exc_type);
+        } else if (likely(PyTuple_Check(exc_type))) {
+            return __Pyx_PyErr_GivenExceptionMatchesTuple(err, exc_type);
+        } else {
+        }
+    }
+    return PyErr_GivenExceptionMatches(err, exc_type);
+}
+static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches2(PyObject *err, PyObject *exc_type1, PyObject *exc_type2) {
+    assert(PyExceptionClass_Check(exc_type1));
+    assert(PyExceptionClass_Check(exc_type2));
+    if (likely(err == exc_type1 || err == exc_type2)) return 1;
+    if (likely(PyExceptionClass_Check(err))) {
+        return __Pyx_inner_PyErr_GivenExceptionMatches2(err, exc_type1, exc_type2);
+    }
+    return (PyErr_GivenExceptionMatches(err, exc_type1) || PyErr_GivenExceptionMatches(err, exc_type2));
+}
+#endif
+
+/* CheckBinaryVersion */
+static int __Pyx_check_binary_version(void) {
+    char ctversion[5];
+    int same=1, i, found_dot;
+    const char* rt_from_call = Py_GetVersion();
+    PyOS_snprintf(ctversion, 5, "%d.%d", PY_MAJOR_VERSION, PY_MINOR_VERSION);
+    found_dot = 0;
+    for (i = 0; i < 4; i++) {
+        if (!ctversion[i]) {
+            same = (rt_from_call[i] < '0' || rt_from_call[i] > '9');
+            break;
+        }
+        if (rt_from_call[i] != ctversion[i]) {
+            same = 0;
+            break;
+        }
+    }
+    if (!same) {
+        char rtversion[5] = {'\0'};
+        char message[200];
+        for (i=0; i<4; ++i) {
+            if (rt_from_call[i] == '.') {
+                if (found_dot) break;
+                found_dot = 1;
+            } else if (rt_from_call[i] < '0' || rt_from_call[i] > '9') {
+                break;
+            }
+            rtversion[i] = rt_from_call[i];
+        }
+        PyOS_snprintf(message, sizeof(message),
+                      "compiletime version %s of module '%.100s' "
+                      "does not match runtime version %s",
+                      ctversion, __Pyx_MODULE_NAME, rtversion);
+        return PyErr_WarnEx(NULL, message, 1);
+    }
+    return 0;
+}
+
+/* InitStrings */
+static int __Pyx_InitStrings(__Pyx_StringTabEntry *t) {
+    while (t->p) {
+        #if PY_MAJOR_VERSION < 3
+        if (t->is_unicode) {
+            *t->p = PyUnicode_DecodeUTF8(t->s, t->n - 1, NULL);
+        } else if (t->intern) {
+            *t->p = PyString_InternFromString(t->s);
+        } else {
+            *t->p = PyString_FromStringAndSize(t->s, t->n - 1);
+        }
+        #else
+        if (t->is_unicode | t->is_str) {
+            if (t->intern) {
+                *t->p = PyUnicode_InternFromString(t->s);
+            } else if (t->encoding) {
+                *t->p = PyUnicode_Decode(t->s, t->n - 1, t->encoding, NULL);
+            } else {
+                *t->p = PyUnicode_FromStringAndSize(t->s, t->n - 1);
+            }
+        } else {
+            *t->p = PyBytes_FromStringAndSize(t->s, t->n - 1);
+        }
+        #endif
+        if (!*t->p)
+            return -1;
+        if (PyObject_Hash(*t->p) == -1)
+            return -1;
+        ++t;
+    }
+    return 0;
+}
+
+static CYTHON_INLINE PyObject* __Pyx_PyUnicode_FromString(const char* c_str) {
+    return __Pyx_PyUnicode_FromStringAndSize(c_str, (Py_ssize_t)strlen(c_str));
+}
+static CYTHON_INLINE const char* __Pyx_PyObject_AsString(PyObject* o) {
+    Py_ssize_t ignore;
+    return __Pyx_PyObject_AsStringAndSize(o, &ignore);
+}
+#if __PYX_DEFAULT_STRING_ENCODING_IS_ASCII || __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT
+#if !CYTHON_PEP393_ENABLED
+static const char* __Pyx_PyUnicode_AsStringAndSize(PyObject* o, Py_ssize_t *length) {
+    char* defenc_c;
+    PyObject* defenc = _PyUnicode_AsDefaultEncodedString(o, NULL);
+    if (!defenc) return NULL;
+    defenc_c = PyBytes_AS_STRING(defenc);
+#if __PYX_DEFAULT_STRING_ENCODING_IS_ASCII
+    {
+        char* end = defenc_c + PyBytes_GET_SIZE(defenc);
+        char* c;
+        for (c = defenc_c; c < end; c++) {
+            if ((unsigned char) (*c) >= 128) {
+                PyUnicode_AsASCIIString(o);
+                return NULL;
+            }
+        }
+    }
+#endif
+    *length = PyBytes_GET_SIZE(defenc);
+    return defenc_c;
+}
+#else
+static CYTHON_INLINE const char* __Pyx_PyUnicode_AsStringAndSize(PyObject* o, Py_ssize_t *length) {
+    if (unlikely(__Pyx_PyUnicode_READY(o) == -1)) return NULL;
+#if __PYX_DEFAULT_STRING_ENCODING_IS_ASCII
+    if (likely(PyUnicode_IS_ASCII(o))) {
+        *length = PyUnicode_GET_LENGTH(o);
+        return PyUnicode_AsUTF8(o);
+    } else {
+        PyUnicode_AsASCIIString(o);
+        return NULL;
+    }
+#else
+    return PyUnicode_AsUTF8AndSize(o, length);
+#endif
+}
+#endif
+#endif
+static CYTHON_INLINE const char* __Pyx_PyObject_AsStringAndSize(PyObject* o, Py_ssize_t *length) {
+#if __PYX_DEFAULT_STRING_ENCODING_IS_ASCII || __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT
+    if (
+#if PY_MAJOR_VERSION < 3 && __PYX_DEFAULT_STRING_ENCODING_IS_ASCII
+            __Pyx_sys_getdefaultencoding_not_ascii &&
+#endif
+            PyUnicode_Check(o)) {
+        return __Pyx_PyUnicode_AsStringAndSize(o, length);
+    } else
+#endif
+#if (!CYTHON_COMPILING_IN_PYPY) || (defined(PyByteArray_AS_STRING) && defined(PyByteArray_GET_SIZE))
+    if (PyByteArray_Check(o)) {
+        *length = PyByteArray_GET_SIZE(o);
+        return PyByteArray_AS_STRING(o);
+    } else
+#endif
+    {
+        char* result;
+        int r = PyBytes_AsStringAndSize(o, &result, length);
+        if (unlikely(r < 0)) {
+            return NULL;
+        } else {
+            return result;
+        }
+    }
+}
+static CYTHON_INLINE int __Pyx_PyObject_IsTrue(PyObject* x) {
+   int is_true = x == Py_True;
+   if (is_true | (x == Py_False) | (x == Py_None)) return is_true;
+   else return PyObject_IsTrue(x);
+}
+static CYTHON_INLINE int __Pyx_PyObject_IsTrueAndDecref(PyObject* x) {
+    int retval;
+    if (unlikely(!x)) return -1;
+    retval = __Pyx_PyObject_IsTrue(x);
+    Py_DECREF(x);
+    return retval;
+}
+static PyObject* __Pyx_PyNumber_IntOrLongWrongResultType(PyObject* result, const char* type_name) {
+#if PY_MAJOR_VERSION >= 3
+    if (PyLong_Check(result)) {
+        if (PyErr_WarnFormat(PyExc_DeprecationWarning, 1,
+                "__int__ returned non-int (type %.200s).  "
+                "The ability to return an instance of a strict subclass of int "
+                "is deprecated, and may be removed in a future version of Python.",
+                Py_TYPE(result)->tp_name)) {
+            Py_DECREF(result);
+            return NULL;
+        }
+        return result;
+    }
+#endif
+    PyErr_Format(PyExc_TypeError,
+                 "__%.4s__ returned non-%.4s (type %.200s)",
+                 type_name, type_name, Py_TYPE(result)->tp_name);
+    Py_DECREF(result);
+    return NULL;
+}
+static CYTHON_INLINE PyObject* __Pyx_PyNumber_IntOrLong(PyObject* x) {
+#if CYTHON_USE_TYPE_SLOTS
+  PyNumberMethods *m;
+#endif
+  const char *name = NULL;
+  PyObject *res = NULL;
+#if PY_MAJOR_VERSION < 3
+  if (likely(PyInt_Check(x) || PyLong_Check(x)))
+#else
+  if (likely(PyLong_Check(x)))
+#endif
+    return __Pyx_NewRef(x);
+#if CYTHON_USE_TYPE_SLOTS
+  m = Py_TYPE(x)->tp_as_number;
+  #if PY_MAJOR_VERSION < 3
+  if (m && m->nb_int) {
+    name = "int";
+    res = m->nb_int(x);
+  }
+  else if (m && m->nb_long) {
+    name = "long";
+    res = m->nb_long(x);
+  }
+  #else
+  if (likely(m && m->nb_int)) {
+    name = "int";
+    res = m->nb_int(x);
+  }
+  #endif
+#else
+  if (!PyBytes_CheckExact(x) && !PyUnicode_CheckExact(x)) {
+    res = PyNumber_Int(x);
+  }
+#endif
+  if (likely(res)) {
+#if PY_MAJOR_VERSION < 3
+    if (unlikely(!PyInt_Check(res) && !PyLong_Check(res))) {
+#else
+    if (unlikely(!PyLong_CheckExact(res))) {
+#endif
+        return __Pyx_PyNumber_IntOrLongWrongResultType(res, name);
+    }
+  }
+  else if (!PyErr_Occurred()) {
+    PyErr_SetString(PyExc_TypeError,
+                    "an integer is required");
+  }
+  return res;
+}
+static CYTHON_INLINE Py_ssize_t __Pyx_PyIndex_AsSsize_t(PyObject* b) {
+  Py_ssize_t ival;
+  PyObject *x;
+#if PY_MAJOR_VERSION < 3
+  if (likely(PyInt_CheckExact(b))) {
+    if (sizeof(Py_ssize_t) >= sizeof(long))
+        return PyInt_AS_LONG(b);
+    else
+        return PyInt_AsSsize_t(b);
+  }
+#endif
+  if (likely(PyLong_CheckExact(b))) {
+    #if CYTHON_USE_PYLONG_INTERNALS
+    const digit* digits = ((PyLongObject*)b)->ob_digit;
+    const Py_ssize_t size = Py_SIZE(b);
+    if (likely(__Pyx_sst_abs(size) <= 1)) {
+        ival = likely(size) ? digits[0] : 0;
+        if (size == -1) ival = -ival;
+        return ival;
+    } else {
+      switch (size) {
+         case 2:
+           if (8 * sizeof(Py_ssize_t) > 2 * PyLong_SHIFT) {
+             return (Py_ssize_t) (((((size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+         case -2:
+           if (8 * sizeof(Py_ssize_t) > 2 * PyLong_SHIFT) {
+             return -(Py_ssize_t) (((((size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+         case 3:
+           if (8 * sizeof(Py_ssize_t) > 3 * PyLong_SHIFT) {
+             return (Py_ssize_t) (((((((size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+         case -3:
+           if (8 * sizeof(Py_ssize_t) > 3 * PyLong_SHIFT) {
+             return -(Py_ssize_t) (((((((size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+         case 4:
+           if (8 * sizeof(Py_ssize_t) > 4 * PyLong_SHIFT) {
+             return (Py_ssize_t) (((((((((size_t)digits[3]) << PyLong_SHIFT) | (size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+         case -4:
+           if (8 * sizeof(Py_ssize_t) > 4 * PyLong_SHIFT) {
+             return -(Py_ssize_t) (((((((((size_t)digits[3]) << PyLong_SHIFT) | (size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+      }
+    }
+    #endif
+    return PyLong_AsSsize_t(b);
+  }
+  x = PyNumber_Index(b);
+  if (!x) return -1;
+  ival = PyInt_AsSsize_t(x);
+  Py_DECREF(x);
+  return ival;
+}
+static CYTHON_INLINE Py_hash_t __Pyx_PyIndex_AsHash_t(PyObject* o) {
+  if (sizeof(Py_hash_t) == sizeof(Py_ssize_t)) {
+    return (Py_hash_t) __Pyx_PyIndex_AsSsize_t(o);
+#if PY_MAJOR_VERSION < 3
+  } else if (likely(PyInt_CheckExact(o))) {
+    return PyInt_AS_LONG(o);
+#endif
+  } else {
+    Py_ssize_t ival;
+    PyObject *x;
+    x = PyNumber_Index(o);
+    if (!x) return -1;
+    ival = PyInt_AsLong(x);
+    Py_DECREF(x);
+    return ival;
+  }
+}
+static CYTHON_INLINE PyObject * __Pyx_PyBool_FromLong(long b) {
+  return b ? __Pyx_NewRef(Py_True) : __Pyx_NewRef(Py_False);
+}
+static CYTHON_INLINE PyObject * __Pyx_PyInt_FromSize_t(size_t ival) {
+    return PyInt_FromSize_t(ival);
+}
+
+
+#endif /* Py_PYTHON_H */
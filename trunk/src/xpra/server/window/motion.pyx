@@ -32,7 +32,7 @@ if hashfn is None:
 cdef extern from "math.h":
     double log(double x)
 
-from libc.stdint cimport int32_t, uint8_t, uint32_t, int64_t
+from libc.stdint cimport int32_t, uint8_t, uint32_t, int64_t, uint64_t
 
 cdef extern from "stdlib.h":
     int abs(int number)
@@ -41,6 +41,7 @@ cdef extern from "string.h":
     void free(void * ptr) nogil
     void *memset(void * ptr, int value, size_t num) nogil
     int memcmp(const void *a1, const void *a2, size_t size)
+    void *memcpy(void *destination, const void *source, size_t num) nogil
 
 cdef extern from "../../buffers/memalign.h":
     void *xmemalign(size_t size) nogil
@@ -67,88 +68,378 @@ def CRC_Image(pixels, unsigned int width, unsigned int height, unsigned int rows
     return crcs
 
 
-DEF MAXINT64 = 2**63
-DEF MAXUINT64 = 2**64
-DEF MASK64 = 2**64-1
-cdef inline castint64(v):
-    if v>=MAXINT64:
-        return v-MAXUINT64
-    #assert v>=0, "invalid int to cast: %s" % v
-    return v
-
-def calculate_distances(array1, array2, int min_score=0, int max_distance=1000):
-    #print("calculate_distances(..)")
-    assert len(array1)==len(array2)
-    cdef int l = len(array1)
-    cdef int i, y1, y2, miny, maxy, d
-    #we want fast array access,
-    #so cache both arrays in C arrays:
-    assert sizeof(int64_t)==64//8, "uint64_t is not 64-bit: %i!" % sizeof(int64_t)
-    cdef size_t asize = l*(sizeof(int64_t))
-    cdef int64_t *a1 = NULL
-    cdef int64_t *a2 = NULL
-    cdef int64_t a1v = 0
-    cdef int32_t *distances = NULL
-    #print("calculate_distances(%s, %s, %i, %i)" % (array1, array2, elen, min_score))
+#the xxh64 primes and round function:
+cdef uint64_t PRIME64_1 = 11400714785074694791ULL
+cdef uint64_t PRIME64_2 = 14029467366897019727ULL
+cdef uint64_t PRIME64_3 = 1609587929392839161ULL
+cdef uint64_t PRIME64_4 = 9650029242287828579ULL
+cdef uint64_t PRIME64_5 = 2870177450012600261ULL
+
+cdef inline uint64_t rotl64(uint64_t v, int r) nogil:
+    return (v<<r) | (v>>(64-r))
+
+cdef inline uint64_t xxh64_round(uint64_t acc, uint64_t v) nogil:
+    acc += v*PRIME64_2
+    acc = rotl64(acc, 31)
+    return acc*PRIME64_1
+
+cdef uint64_t hash_tile(const uint8_t *buf, unsigned int rowstride, size_t row_len, unsigned int rows) nogil:
+    #hashes a tile using the xxh64 round function,
+    #the rows of the tile are not contiguous in memory so we can't use the python bindings
+    cdef uint64_t h = PRIME64_5 + row_len*rows
+    cdef uint64_t v = 0
+    cdef uint32_t v32 = 0
+    cdef size_t i
+    cdef unsigned int y
+    for y in range(rows):
+        i = 0
+        while i+8<=row_len:
+            memcpy(&v, buf+i, 8)
+            h = rotl64(h ^ xxh64_round(0, v), 27)*PRIME64_1 + PRIME64_4
+            i += 8
+        if i+4<=row_len:
+            memcpy(&v32, buf+i, 4)
+            h = rotl64(h ^ (v32*PRIME64_1), 23)*PRIME64_2 + PRIME64_3
+            i += 4
+        while i<row_len:
+            h = rotl64(h ^ (buf[i]*PRIME64_5), 11)*PRIME64_1
+            i += 1
+        buf += rowstride
+    #avalanche:
+    h ^= h >> 33
+    h *= PRIME64_2
+    h ^= h >> 29
+    h *= PRIME64_3
+    h ^= h >> 32
+    return h
+
+def hash_tiles(pixels, unsigned int x, unsigned int y, unsigned int width, unsigned int height, unsigned int rowstride, unsigned int tile_size=64, unsigned char bpp=4):
+    """
+        Hashes the pixels of the region (x, y, width, height) one tile at a time,
+        the tiles are aligned on a grid of tile_size pixels,
+        so the tiles on the edges of the region may be smaller.
+        Returns a dictionary with the (column, row) of each tile as key
+        and the geometry of the tile and its hash as value.
+    """
+    assert tile_size>0 and width>0 and height>0
+    cdef uint8_t *buf = NULL
+    cdef Py_ssize_t buf_len = 0
+    assert object_as_buffer(pixels, <const void**> &buf, &buf_len)==0
+    assert buf_len>=0 and (<unsigned int> buf_len)>=rowstride*(height-1)+width*bpp, "buffer is too small for %ix%i" % (rowstride, height)
+    cdef unsigned int col, row
+    cdef unsigned int tx, ty, tw, th
+    cdef uint64_t h
+    tiles = {}
+    for row in range(y//tile_size, (y+height-1)//tile_size+1):
+        ty = max(y, row*tile_size)
+        th = min(y+height, (row+1)*tile_size)-ty
+        for col in range(x//tile_size, (x+width-1)//tile_size+1):
+            tx = max(x, col*tile_size)
+            tw = min(x+width, (col+1)*tile_size)-tx
+            with nogil:
+                h = hash_tile(buf+(ty-y)*rowstride+(tx-x)*bpp, rowstride, tw*bpp, th)
+            tiles[(col, row)] = (tx, ty, tw, th, h)
+    return tiles
+
+
+#don't try more than this many scroll distances:
+DEF MAX_SCROLL_VALUES = 50
+#don't send more than this many scroll rectangles:
+DEF MAX_SCROLLS = 1000
+
+cdef match_lines(const uint64_t *old, const uint8_t *known, const uint64_t *cur, int n, int start, int end, int max_distance, int min_percent):
+    """
+        Finds the lines in [start, end[ whose new hash can be found in the old hashes,
+        and returns the scroll runs (dest_start, count, distance), the runs of lines which must be sent,
+        and the number of lines which have not changed.
+        The old hashes cover all the 'n' lines, not just [start, end[,
+        'known' can be used to flag the old hashes which are valid (NULL if they all are).
+        Returns None if less than min_percent of the lines can be handled with scrolling.
+    """
+    cdef int lines = end-start
+    if lines<=0 or n<=0:
+        return None
+    cdef int maxd = min(max_distance, n-1)
+    cdef int hsize = 2*maxd+1
+    cdef int32_t *hist = NULL
+    cdef uint8_t *handled = NULL
+    cdef int values[MAX_SCROLL_VALUES+1]
+    cdef int nvalues = 0
+    cdef int scroll_start[MAX_SCROLLS]
+    cdef int scroll_count[MAX_SCROLLS]
+    cdef int scroll_distance[MAX_SCROLLS]
+    cdef int nscrolls = 0
+    cdef int unchanged = 0
+    cdef int handled_count = 0
+    cdef int r, s, i, k, src, lo, hi, best, besthits, run_start, ok
+    cdef uint8_t pass_id
+    cdef uint64_t v
     try:
-        a1 = <int64_t*> xmemalign(asize)
-        a2 = <int64_t*> xmemalign(asize)
-        assert a1!=NULL and a2!=NULL, "failed to allocate %i bytes of scroll array memory" % asize
-        for i in range(l):
-            a1[i] = castint64(array1[i])
-            a2[i] = castint64(array2[i])
-        #now compare all the values
-        distances = <int32_t*> xmemalign(2*l*sizeof(int32_t))
-        assert distances!=NULL
+        hist = <int32_t*> xmemalign(hsize*sizeof(int32_t))
+        handled = <uint8_t*> xmemalign(n)
+        assert hist!=NULL and handled!=NULL, "failed to allocate scroll detection memory"
         with nogil:
-            memset(<void*> distances, 0, 2*l*sizeof(int32_t))
-            for y1 in range(l):
-                miny = max(0, y1-max_distance)
-                maxy = min(l, y1+max_distance)
-                a1v = a1[y1]
-                for y2 in range(miny, maxy):
-                    if a1v==a2[y2]:
-                        #distance = y1-y2
-                        distances[l+y1-y2] += 1
-        r = {}
-        for i in range(2*l):
-            d = distances[i]
-            if min_score<=0 or abs(d)>=min_score:
-                r[i-l] = d
-        return r
+            memset(<void*> hist, 0, hsize*sizeof(int32_t))
+            memset(<void*> handled, 0, n)
+            #histogram of the distances between matching lines:
+            for r in range(start, end):
+                v = cur[r]
+                lo = max(0, r-maxd)
+                hi = min(n-1, r+maxd)
+                for src in range(lo, hi+1):
+                    if old[src]==v and (known==NULL or known[src]):
+                        hist[r-src+maxd] += 1
+            #pick the distances with the most hits first,
+            #(ignoring those with a single hit as those are likely to be false positives)
+            #picked values are flagged by negating their hits:
+            for k in range(MAX_SCROLL_VALUES):
+                best = -1
+                besthits = 1
+                for i in range(hsize):
+                    if hist[i]>besthits:
+                        best = i
+                        besthits = hist[i]
+                if best<0:
+                    break
+                hist[best] = -hist[best]
+                values[nvalues] = best-maxd
+                nvalues += 1
+            #always include "no change", so we can drop those lines:
+            if hist[maxd]>0:
+                values[nvalues] = 0
+                nvalues += 1
+            #assign each line to the first distance that matches it,
+            #the 'handled' value records which pass the line was assigned in:
+            for k in range(nvalues):
+                s = values[k]
+                pass_id = k+1
+                run_start = -1
+                for r in range(start, end+1):
+                    ok = 0
+                    src = r-s
+                    if r<end and handled[r]==0 and nscrolls<MAX_SCROLLS and 0<=src<n and old[src]==cur[r] and (known==NULL or known[src]):
+                        #don't use a source line which has already been overwritten by a previous pass:
+                        ok = handled[src]==0 or handled[src]==pass_id
+                    if ok:
+                        handled[r] = pass_id
+                        handled_count += 1
+                        if s==0:
+                            unchanged += 1
+                        elif run_start<0:
+                            run_start = r
+                    elif run_start>=0:
+                        scroll_start[nscrolls] = run_start
+                        scroll_count[nscrolls] = r-run_start
+                        scroll_distance[nscrolls] = s
+                        nscrolls += 1
+                        run_start = -1
+        if handled_count*100<min_percent*lines:
+            return None
+        scrolls = [(scroll_start[i], scroll_count[i], scroll_distance[i]) for i in range(nscrolls)]
+        #everything else must be sent:
+        non_scroll = []
+        run_start = -1
+        for r in range(start, end+1):
+            if r<end and handled[r]==0:
+                if run_start<0:
+                    run_start = r
+            elif run_start>=0:
+                non_scroll.append((run_start, r-run_start))
+                run_start = -1
+        return scrolls, non_scroll, unchanged
     finally:
-        if a1!=NULL:
-            free(a1)
-        if a2!=NULL:
-            free(a2)
-        if distances!=NULL:
-            free(distances)
-
-def match_distance(array1, array2, int distance):
-    assert len(array1)==len(array2)
-    l = len(array1)
-    if distance>=0:
-        return [i for i,v in enumerate(array1) if (i+distance)<l and array2[i+distance]==v]
-    distance = abs(distance)
-    return [i+distance for i,v in enumerate(array2) if (i+distance)<l and array1[i+distance]==v]
-
-def consecutive_lines(line_numbers):
-    #print("line_numbers_to_rectangles(%s)" % (line_numbers, ))
-    #aggregates consecutive lines:
-    #[1,2,3,4,8,9] -> [(1,3), (8,1)]
-    assert len(line_numbers)>0
-    if len(line_numbers)==1:
-        return [(line_numbers[0], 1)]
-    cdef int start = line_numbers[0]
-    cdef int last = start
-    cdef int line = 0
-    r = []
-    for line in line_numbers[1:]:
-        if line!=last+1:
-            #new rectangle
-            r.append((start, last-start+1))
-            start = line
-        last = line
-    if last!=line_numbers[0]:
-        r.append((start, last-start+1))
-    return r
+        if hist!=NULL:
+            free(hist)
+        if handled!=NULL:
+            free(handled)
+
+
+cdef class ScrollData:
+    """
+        Keeps the hash of each row of a window, so that we only need to hash the rows
+        of the regions being updated to find the areas which have been scrolled.
+        The rows are hashed over the same columns (x, w) every time,
+        and we also hash the columns of the region to detect horizontal scrolling.
+    """
+    cdef readonly unsigned int width
+    cdef readonly unsigned int height
+    cdef int x                          #the columns used for hashing the rows
+    cdef unsigned int w
+    cdef uint64_t *row_hashes
+    cdef uint64_t *old_row_hashes
+    cdef uint8_t *row_known
+    cdef uint8_t *old_row_known
+    cdef uint64_t *col_hashes
+    cdef uint64_t *old_col_hashes
+    cdef int col_geometry[4]
+    cdef int old_col_geometry[4]
+    cdef int update_y
+    cdef int update_h
+    cdef object pixels                  #only kept between update() and detect()
+    cdef unsigned int rowstride
+    cdef unsigned char bpp
+    cdef unsigned long updates
+    cdef unsigned long rows_hashed
+
+    def __cinit__(self, unsigned int width, unsigned int height):
+        assert width>0 and height>0
+        self.width = width
+        self.height = height
+        self.x = -1
+        self.w = 0
+        self.row_hashes = <uint64_t*> xmemalign(height*sizeof(uint64_t))
+        self.old_row_hashes = <uint64_t*> xmemalign(height*sizeof(uint64_t))
+        self.row_known = <uint8_t*> xmemalign(height)
+        self.old_row_known = <uint8_t*> xmemalign(height)
+        self.col_hashes = <uint64_t*> xmemalign(width*sizeof(uint64_t))
+        self.old_col_hashes = <uint64_t*> xmemalign(width*sizeof(uint64_t))
+        assert self.row_hashes!=NULL and self.old_row_hashes!=NULL and self.row_known!=NULL and self.old_row_known!=NULL, "failed to allocate scroll data"
+        assert self.col_hashes!=NULL and self.old_col_hashes!=NULL, "failed to allocate scroll data"
+        memset(self.row_known, 0, height)
+        memset(self.old_row_known, 0, height)
+        memset(self.col_geometry, 0, sizeof(self.col_geometry))
+        memset(self.old_col_geometry, 0, sizeof(self.old_col_geometry))
+
+    def __dealloc__(self):
+        free(self.row_hashes)
+        free(self.old_row_hashes)
+        free(self.row_known)
+        free(self.old_row_known)
+        free(self.col_hashes)
+        free(self.old_col_hashes)
+
+    def __repr__(self):
+        return "ScrollData(%ix%i)" % (self.width, self.height)
+
+    def get_info(self):
+        return {
+                "size"          : (self.width, self.height),
+                "updates"       : self.updates,
+                "rows-hashed"   : self.rows_hashed,
+                }
+
+    def invalidate(self, int x, int y, int width, int height):
+        """
+            Forget the hash values for this region,
+            which is being sent to the client without updating the hashes.
+        """
+        cdef int start = max(0, y)
+        cdef int end = min(<int> self.height, y+height)
+        if end<=start or x>=self.x+<int> self.w or x+width<=self.x:
+            return
+        memset(self.row_known+start, 0, end-start)
+        memset(self.col_geometry, 0, sizeof(self.col_geometry))
+
+    def update(self, pixels, int x, int y, unsigned int width, unsigned int height, unsigned int rowstride, unsigned char bpp=4):
+        """
+            Hashes the rows of the region given, in window coordinates,
+            the other rows keep their previous hash value.
+        """
+        assert x>=0 and y>=0 and width>0 and height>0
+        assert x+width<=self.width and y+height<=self.height, "region %s does not fit in %ix%i" % ((x, y, width, height), self.width, self.height)
+        cdef uint8_t *buf = NULL
+        cdef Py_ssize_t buf_len = 0
+        assert object_as_buffer(pixels, <const void**> &buf, &buf_len)==0
+        assert buf_len>=0 and (<unsigned int> buf_len)>=rowstride*(height-1)+width*bpp, "buffer is too small for %ix%i" % (rowstride, height)
+        if x!=self.x or width!=self.w:
+            #the hashes of the other rows cover different columns, we can't use them:
+            memset(self.row_known, 0, self.height)
+            self.x = x
+            self.w = width
+        memcpy(self.old_row_hashes, self.row_hashes, self.height*sizeof(uint64_t))
+        memcpy(self.old_row_known, self.row_known, self.height)
+        #swap the column hashes:
+        cdef uint64_t *tmp = self.old_col_hashes
+        self.old_col_hashes = self.col_hashes
+        self.col_hashes = tmp
+        memcpy(self.old_col_geometry, self.col_geometry, sizeof(self.col_geometry))
+        #the column hashes are only calculated if detect() needs them:
+        memset(self.col_geometry, 0, sizeof(self.col_geometry))
+        cdef size_t row_len = width*bpp
+        cdef uint64_t *rows = self.row_hashes + y
+        cdef uint8_t *row = buf
+        cdef unsigned int i
+        with nogil:
+            for i in range(height):
+                rows[i] = hash_tile(row, rowstride, row_len, 1)
+                row += rowstride
+            memset(self.row_known+y, 1, height)
+        self.pixels = pixels
+        self.rowstride = rowstride
+        self.bpp = bpp
+        self.update_y = y
+        self.update_h = height
+        self.updates += 1
+        self.rows_hashed += height
+
+    cdef int hash_columns(self):
+        if self.pixels is None or self.bpp!=4:
+            return 0
+        cdef uint8_t *buf = NULL
+        cdef Py_ssize_t buf_len = 0
+        assert object_as_buffer(self.pixels, <const void**> &buf, &buf_len)==0
+        cdef uint64_t *cols = self.col_hashes
+        cdef unsigned int width = self.w
+        cdef unsigned int rowstride = self.rowstride
+        cdef uint32_t v32
+        cdef int i, c
+        with nogil:
+            for c in range(width):
+                cols[c] = PRIME64_5
+            for i in range(self.update_h):
+                for c in range(width):
+                    memcpy(&v32, buf+c*4, 4)
+                    cols[c] = rotl64(cols[c] ^ (v32*PRIME64_1), 23)*PRIME64_2 + PRIME64_3
+                buf += rowstride
+        self.col_geometry[:] = [self.x, self.update_y, self.w, self.update_h]
+        return 1
+
+    def detect(self, int min_percent=40, int max_distance=1000, int horizontal=True):
+        """
+            Compares the region from the last update with the previous hash values.
+            Returns None if less than min_percent of the region can be handled
+            by scrolling and dropping unchanged rows (or columns),
+            otherwise (scrolls, non_scroll, unchanged) where:
+            * scrolls is a list of (x, y, w, h, xdelta, ydelta) in window coordinates,
+              suitable for sending as "scroll" draw packets
+            * non_scroll is a list of the (x, y, w, h) rectangles which must be sent
+            * unchanged is the number of rows (or columns) which have not changed
+        """
+        try:
+            return self.do_detect(min_percent, max_distance, horizontal)
+        finally:
+            #don't keep a reference to the pixels:
+            self.pixels = None
+
+    cdef do_detect(self, int min_percent, int max_distance, int horizontal):
+        cdef int x = self.x
+        cdef int y = self.update_y
+        cdef int w = self.w
+        cdef int h = self.update_h
+        if self.updates<2 or h<=0:
+            return None
+        r = match_lines(self.old_row_hashes, self.old_row_known, self.row_hashes, self.height, y, y+h, max_distance, min_percent)
+        if r:
+            scrolls, non_scroll, unchanged = r
+            return ([(x, start-s, w, count, 0, s) for start, count, s in scrolls],
+                    [(x, start, w, count) for start, count in non_scroll],
+                    unchanged)
+        if not horizontal:
+            return None
+        #try to find columns that have moved, the region must be the same,
+        #so this only works if the previous update also needed the column hashes:
+        if not self.hash_columns():
+            return None
+        cdef int i
+        for i in range(4):
+            if self.col_geometry[i]!=self.old_col_geometry[i]:
+                return None
+        if self.col_geometry[2]==0:
+            return None
+        r = match_lines(self.old_col_hashes, NULL, self.col_hashes, w, 0, w, max_distance, min_percent)
+        if not r:
+            return None
+        scrolls, non_scroll, unchanged = r
+        return ([(x+start-s, y, count, h, s, 0) for start, count, s in scrolls],
+                [(x+start, y, count, h) for start, count in non_scroll],
+                unchanged)
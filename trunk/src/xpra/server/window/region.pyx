@@ -9,6 +9,13 @@
 
 #cython: boundscheck=False, wraparound=False, overflowcheck=False, cdivision=True, unraisable_tracebacks=True, always_allow_keywords=False
 
+from libc.stdlib cimport realloc, free
+from libc.string cimport memcpy
+from libc.limits cimport INT_MIN
+
+#don't try to merge more rectangles than this, just use the extents instead:
+DEF MAX_MERGE_RECTANGLES = 128
+
 
 #what I want is a real macro!
 cdef inline int MIN(int a, int b):
@@ -210,3 +217,412 @@ def merge_all(rectangles):
         if y2>ry2:
             ry2 = y2
     return rectangle(rx, ry, rx2-rx, ry2-ry)
+
+cdef struct box_t:
+    int x1
+    int y1
+    int x2
+    int y2
+
+cdef struct box_array:
+    box_t *boxes
+    int count
+    int size
+
+cdef enum region_op:
+    OP_UNION
+    OP_SUBSTRACT
+    OP_INTERSECT
+
+
+cdef int ensure_size(box_array *a, int size) except -1:
+    if size<=a.size:
+        return 0
+    cdef int new_size = max(16, max(size, a.size*2))
+    cdef box_t *boxes = <box_t*> realloc(a.boxes, new_size*sizeof(box_t))
+    if boxes==NULL:
+        raise MemoryError("failed to allocate %i region boxes" % new_size)
+    a.boxes = boxes
+    a.size = new_size
+    return 0
+
+cdef inline int band_end(const box_t *boxes, int i, int n) nogil:
+    cdef int y1 = boxes[i].y1
+    while i<n and boxes[i].y1==y1:
+        i += 1
+    return i
+
+cdef inline int append_box(box_array *out, int x1, int y1, int x2, int y2) except -1:
+    cdef box_t *b
+    if out.count>0:
+        b = &out.boxes[out.count-1]
+        if b.y1==y1 and b.x2==x1:
+            #extend the previous box of this band:
+            b.x2 = x2
+            return 0
+    ensure_size(out, out.count+1)
+    b = &out.boxes[out.count]
+    b.x1 = x1
+    b.y1 = y1
+    b.x2 = x2
+    b.y2 = y2
+    out.count += 1
+    return 0
+
+cdef int emit_band(box_array *out, region_op op, const box_t *a, int na, const box_t *b, int nb, int y1, int y2) except -1:
+    """
+        Adds the boxes for the band y1 to y2
+        using the x intervals of the bands of the two regions given.
+        (either band may be empty)
+    """
+    cdef int i = 0, j = 0
+    cdef int x1, x2
+    if op==OP_UNION:
+        while i<na or j<nb:
+            if j>=nb or (i<na and a[i].x1<=b[j].x1):
+                x1 = a[i].x1
+                x2 = a[i].x2
+                i += 1
+            else:
+                x1 = b[j].x1
+                x2 = b[j].x2
+                j += 1
+            if out.count>0 and out.boxes[out.count-1].y1==y1 and out.boxes[out.count-1].x2>=x1:
+                #overlaps or touches the previous interval:
+                out.boxes[out.count-1].x2 = MAX(out.boxes[out.count-1].x2, x2)
+            else:
+                append_box(out, x1, y1, x2, y2)
+    elif op==OP_INTERSECT:
+        while i<na and j<nb:
+            x1 = MAX(a[i].x1, b[j].x1)
+            x2 = MIN(a[i].x2, b[j].x2)
+            if x1<x2:
+                append_box(out, x1, y1, x2, y2)
+            if a[i].x2<b[j].x2:
+                i += 1
+            else:
+                j += 1
+    else:
+        #substract: clip each interval of 'a' with the intervals of 'b'
+        while i<na:
+            x1 = a[i].x1
+            x2 = a[i].x2
+            while j<nb and b[j].x2<=x1:
+                j += 1
+            while j<nb and b[j].x1<x2:
+                if b[j].x1>x1:
+                    append_box(out, x1, y1, b[j].x1, y2)
+                x1 = MAX(x1, b[j].x2)
+                if b[j].x2>=x2:
+                    break
+                j += 1
+            if x1<x2:
+                append_box(out, x1, y1, x2, y2)
+            i += 1
+    return 0
+
+cdef int region_op_boxes(box_array *out, region_op op, const box_t *a, int na, const box_t *b, int nb) except -1:
+    """
+        Sweeps the bands of both regions from top to bottom,
+        emitting the boxes of each horizontal slab and coalescing
+        consecutive bands that have identical x intervals.
+    """
+    cdef int ia = 0, ib = 0
+    cdef int a_end = 0, b_end = 0
+    cdef int ay1, ay2, by1, by2
+    cdef int top, bot
+    cdef int y = INT_MIN
+    cdef int prev_band = -1
+    cdef int band_start, k, n
+    cdef int same
+    while ia<na or ib<nb:
+        if ia<na:
+            a_end = band_end(a, ia, na)
+            ay1 = MAX(a[ia].y1, y)
+            ay2 = a[ia].y2
+        if ib<nb:
+            b_end = band_end(b, ib, nb)
+            by1 = MAX(b[ib].y1, y)
+            by2 = b[ib].y2
+        band_start = out.count
+        if ia<na and ib<nb:
+            if ay1<by1:
+                top = ay1
+                bot = MIN(ay2, by1)
+                if op!=OP_INTERSECT:
+                    emit_band(out, op, a+ia, a_end-ia, NULL, 0, top, bot)
+            elif by1<ay1:
+                top = by1
+                bot = MIN(by2, ay1)
+                if op==OP_UNION:
+                    emit_band(out, op, NULL, 0, b+ib, b_end-ib, top, bot)
+            else:
+                top = ay1
+                bot = MIN(ay2, by2)
+                emit_band(out, op, a+ia, a_end-ia, b+ib, b_end-ib, top, bot)
+        elif ia<na:
+            if op==OP_INTERSECT:
+                break
+            top = ay1
+            bot = ay2
+            emit_band(out, op, a+ia, a_end-ia, NULL, 0, top, bot)
+        else:
+            if op!=OP_UNION:
+                break
+            top = by1
+            bot = by2
+            emit_band(out, op, NULL, 0, b+ib, b_end-ib, top, bot)
+        y = bot
+        if ia<na and ay2<=y:
+            ia = a_end
+        if ib<nb and by2<=y:
+            ib = b_end
+        if out.count==band_start:
+            continue
+        #try to coalesce with the previous band:
+        if prev_band>=0 and out.boxes[prev_band].y2==top and band_start-prev_band==out.count-band_start:
+            n = band_start-prev_band
+            same = 1
+            for k in range(n):
+                if out.boxes[prev_band+k].x1!=out.boxes[band_start+k].x1 or out.boxes[prev_band+k].x2!=out.boxes[band_start+k].x2:
+                    same = 0
+                    break
+            if same:
+                for k in range(n):
+                    out.boxes[prev_band+k].y2 = bot
+                out.count = band_start
+                continue
+        prev_band = band_start
+    return 0
+
+
+cdef class Region:
+    """
+        A set of non-overlapping rectangles stored in y-x banded order, like pixman regions:
+        the boxes are sorted by their top edge then by their left edge,
+        all the boxes of a band have the same top and bottom edges,
+        and the bands which can be joined vertically are always coalesced.
+        This makes union, substraction and intersection linear in the number of boxes.
+    """
+    cdef box_array data
+
+    def __cinit__(self):
+        self.data.boxes = NULL
+        self.data.count = 0
+        self.data.size = 0
+
+    def __init__(self, rectangles=()):
+        cdef rectangle r
+        for r in rectangles:
+            self.add(r.x, r.y, r.width, r.height)
+
+    def __dealloc__(self):
+        free(self.data.boxes)
+        self.data.boxes = NULL
+
+    def __repr__(self):
+        return "Region(%s)" % self.get_rectangles()
+
+    def __len__(self):
+        return self.data.count
+
+    def __bool__(self):
+        return self.data.count>0
+
+    def __iter__(self):
+        return iter(self.get_rectangles())
+
+    cdef int do_op(self, region_op op, const box_t *b, int nb) except -1:
+        cdef box_array out
+        out.boxes = NULL
+        out.count = 0
+        out.size = 0
+        try:
+            ensure_size(&out, self.data.count+nb)
+            region_op_boxes(&out, op, self.data.boxes, self.data.count, b, nb)
+        except:
+            free(out.boxes)
+            raise
+        free(self.data.boxes)
+        self.data = out
+        return 0
+
+    cdef int rect_op(self, region_op op, int x, int y, int w, int h) except -1:
+        cdef box_t box
+        if w<=0 or h<=0:
+            if op==OP_INTERSECT:
+                self.clear()
+            return 0
+        box.x1 = x
+        box.y1 = y
+        box.x2 = x+w
+        box.y2 = y+h
+        return self.do_op(op, &box, 1)
+
+    def clear(self):
+        self.data.count = 0
+
+    def copy(self):
+        cdef Region r = Region()
+        ensure_size(&r.data, self.data.count)
+        if self.data.count>0:
+            memcpy(r.data.boxes, self.data.boxes, self.data.count*sizeof(box_t))
+        r.data.count = self.data.count
+        return r
+
+    def add(self, int x, int y, int w, int h):
+        self.rect_op(OP_UNION, x, y, w, h)
+
+    def add_rect(self, rectangle rect):
+        self.rect_op(OP_UNION, rect.x, rect.y, rect.width, rect.height)
+
+    def union(self, Region other):
+        self.do_op(OP_UNION, other.data.boxes, other.data.count)
+
+    def substract(self, int x, int y, int w, int h):
+        self.rect_op(OP_SUBSTRACT, x, y, w, h)
+
+    def substract_rect(self, rectangle rect):
+        self.rect_op(OP_SUBSTRACT, rect.x, rect.y, rect.width, rect.height)
+
+    def substract_region(self, Region other):
+        self.do_op(OP_SUBSTRACT, other.data.boxes, other.data.count)
+
+    def intersect(self, int x, int y, int w, int h):
+        self.rect_op(OP_INTERSECT, x, y, w, h)
+
+    def intersect_rect(self, rectangle rect):
+        self.rect_op(OP_INTERSECT, rect.x, rect.y, rect.width, rect.height)
+
+    def intersect_region(self, Region other):
+        self.do_op(OP_INTERSECT, other.data.boxes, other.data.count)
+
+    def intersects(self, int x, int y, int w, int h):
+        if w<=0 or h<=0:
+            return False
+        cdef int i
+        cdef box_t *b
+        for i in range(self.data.count):
+            b = &self.data.boxes[i]
+            if b.y1>=y+h:
+                break
+            if b.x1<x+w and b.x2>x and b.y2>y:
+                return True
+        return False
+
+    def intersects_rect(self, rectangle rect):
+        return self.intersects(rect.x, rect.y, rect.width, rect.height)
+
+    def contains(self, int x, int y, int w, int h):
+        """ the area is contained in the region if substracting the region from it leaves nothing """
+        if w<=0 or h<=0:
+            return True
+        cdef box_array out
+        out.boxes = NULL
+        out.count = 0
+        out.size = 0
+        cdef box_t box
+        box.x1 = x
+        box.y1 = y
+        box.x2 = x+w
+        box.y2 = y+h
+        try:
+            region_op_boxes(&out, OP_SUBSTRACT, &box, 1, self.data.boxes, self.data.count)
+            return out.count==0
+        finally:
+            free(out.boxes)
+
+    def contains_rect(self, rectangle rect):
+        return self.contains(rect.x, rect.y, rect.width, rect.height)
+
+    def get_extents(self):
+        """ returns the bounding rectangle, or None if the region is empty """
+        cdef int n = self.data.count
+        if n==0:
+            return None
+        cdef int i
+        cdef int x1 = self.data.boxes[0].x1
+        cdef int x2 = self.data.boxes[0].x2
+        for i in range(1, n):
+            x1 = MIN(x1, self.data.boxes[i].x1)
+            x2 = MAX(x2, self.data.boxes[i].x2)
+        cdef int y1 = self.data.boxes[0].y1
+        cdef int y2 = self.data.boxes[n-1].y2
+        return rectangle(x1, y1, x2-x1, y2-y1)
+
+    def get_area(self):
+        cdef long long area = 0
+        cdef int i
+        cdef box_t *b
+        for i in range(self.data.count):
+            b = &self.data.boxes[i]
+            area += (<long long> (b.x2-b.x1)) * (b.y2-b.y1)
+        return area
+
+    def get_rectangles(self):
+        #work on a copy of the boxes:
+        #another thread may modify the region whilst we create the python objects
+        cdef Region r = self.copy()
+        cdef int i
+        cdef box_t *b
+        rects = []
+        for i in range(r.data.count):
+            b = &r.data.boxes[i]
+            rects.append(rectangle(b.x1, b.y1, b.x2-b.x1, b.y2-b.y1))
+        return rects
+
+    def merge(self, int packet_cost=0, int max_rectangles=0):
+        """
+            Returns a list of rectangles covering the region,
+            merging pairs of rectangles into their bounding box whenever
+            the extra pixels cost less than the packet we save (packet_cost is in pixels),
+            and until we have no more than max_rectangles (if specified).
+            The rectangles returned may overlap.
+        """
+        cdef int n = self.data.count
+        if n==0:
+            return []
+        if n>MAX_MERGE_RECTANGLES or (max_rectangles==1):
+            return [self.get_extents()]
+        cdef box_t m[MAX_MERGE_RECTANGLES]
+        cdef long long area[MAX_MERGE_RECTANGLES]
+        memcpy(m, self.data.boxes, n*sizeof(box_t))
+        cdef int i, j, k, best_i, best_j
+        cdef long long cost, best_cost
+        cdef box_t u
+        for i in range(n):
+            area[i] = (<long long> (m[i].x2-m[i].x1)) * (m[i].y2-m[i].y1)
+        while n>1:
+            best_i = -1
+            best_j = -1
+            best_cost = 0
+            for i in range(n):
+                for j in range(i+1, n):
+                    u.x1 = MIN(m[i].x1, m[j].x1)
+                    u.y1 = MIN(m[i].y1, m[j].y1)
+                    u.x2 = MAX(m[i].x2, m[j].x2)
+                    u.y2 = MAX(m[i].y2, m[j].y2)
+                    cost = (<long long> (u.x2-u.x1)) * (u.y2-u.y1) - area[i] - area[j] - packet_cost
+                    if best_i<0 or cost<best_cost:
+                        best_cost = cost
+                        best_i = i
+                        best_j = j
+            if best_cost>=0 and (max_rectangles<=0 or n<=max_rectangles):
+                #no more savings to be made
+                break
+            u.x1 = MIN(m[best_i].x1, m[best_j].x1)
+            u.y1 = MIN(m[best_i].y1, m[best_j].y1)
+            u.x2 = MAX(m[best_i].x2, m[best_j].x2)
+            u.y2 = MAX(m[best_i].y2, m[best_j].y2)
+            m[best_i] = u
+            area[best_i] = (<long long> (u.x2-u.x1)) * (u.y2-u.y1)
+            #drop the rectangles which are now fully contained in the merged one:
+            k = 0
+            for i in range(n):
+                if i!=best_i and m[i].x1>=u.x1 and m[i].y1>=u.y1 and m[i].x2<=u.x2 and m[i].y2<=u.y2:
+                    continue
+                m[k] = m[i]
+                area[k] = area[i]
+                k += 1
+            n = k
+        return [rectangle(m[i].x1, m[i].y1, m[i].x2-m[i].x1, m[i].y2-m[i].y1) for i in range(n)]
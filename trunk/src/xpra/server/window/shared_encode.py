@@ -0,0 +1,120 @@
+# This file is part of Xpra.
+# Copyright (C) 2016 Antoine Martin <antoine@devloop.org.uk>
+# Xpra is released under the terms of the GNU GPL v2, or, at your option, any
+# later version. See the file COPYING for details.
+
+import time
+import hashlib
+from threading import Lock
+from collections import deque
+
+from xpra.util import envint, envbool
+from xpra.log import Logger
+log = Logger("encoding", "compress")
+
+SHARED_ENCODE = envbool("XPRA_SHARED_ENCODE", True)
+#how many compressed frames we keep for each window:
+MAX_ENTRIES = envint("XPRA_SHARED_ENCODE_MAX_ENTRIES", 10)
+#entries older than this (in milliseconds) are discarded:
+MAX_AGE = envint("XPRA_SHARED_ENCODE_MAX_AGE", 1000)
+#only stateless picture encodings can be shared,
+#video encoders have a per-client stream state,
+#and hashing the pixels costs more than the fast compression used for rgb:
+SHAREABLE_ENCODINGS = ("png", "png/P", "png/L", "jpeg", "webp")
+
+
+def image_digest(image):
+    """
+        Identifies the pixel contents of an image wrapper.
+        This is much cheaper than compressing the pixels.
+    """
+    pixels = image.get_pixels()
+    if pixels is None:
+        return None
+    try:
+        h = hashlib.sha1(pixels)
+    except TypeError:
+        from xpra.os_util import memoryview_to_bytes
+        h = hashlib.sha1(memoryview_to_bytes(pixels))
+    return h.hexdigest()
+
+
+class SharedEncodeCache(object):
+    """
+        When multiple clients are viewing the same window (sharing mode),
+        they usually end up compressing the exact same pixels
+        with the exact same encoder settings.
+        This cache allows the first WindowSource to compress a frame
+        and the other clients' WindowSources to re-use the result.
+        The cache key must include every setting that affects the encoder output,
+        so clients that negotiated different capabilities never share data
+        and simply fall back to encoding it themselves.
+    """
+
+    def __init__(self):
+        self.lock = Lock()
+        self.sources = set()
+        self.entries = {}       #wid -> deque of (timestamp, key, digest, result)
+        self.hits = 0
+        self.misses = 0
+
+    def add_source(self, source):
+        with self.lock:
+            self.sources.add(source)
+
+    def remove_source(self, source):
+        with self.lock:
+            self.sources.discard(source)
+            if len(self.sources)<2:
+                self.entries = {}
+
+    def is_active(self):
+        return SHARED_ENCODE and len(self.sources)>=2
+
+    def remove_window(self, wid):
+        with self.lock:
+            self.entries.pop(wid, None)
+
+    def get(self, wid, key, digest):
+        now = time.time()
+        with self.lock:
+            wentries = self.entries.get(wid)
+            if wentries:
+                for timestamp, ekey, edigest, result in wentries:
+                    if ekey==key and edigest==digest and (now-timestamp)*1000<=MAX_AGE:
+                        self.hits += 1
+                        return result
+            self.misses += 1
+        return None
+
+    def add(self, wid, key, digest, result):
+        with self.lock:
+            wentries = self.entries.get(wid)
+            if wentries is None:
+                wentries = deque(maxlen=MAX_ENTRIES)
+                self.entries[wid] = wentries
+            wentries.append((time.time(), key, digest, result))
+
+    def get_info(self):
+        return {
+                "enabled"   : SHARED_ENCODE,
+                "active"    : self.is_active(),
+                "sources"   : len(self.sources),
+                "windows"   : len(self.entries),
+                "hits"      : self.hits,
+                "misses"    : self.misses,
+                }
+
+
+#only one cache per server process:
+singleton = None
+lock = Lock()
+
+def get_shared_encode_cache():
+    global singleton
+    if singleton is not None:
+        return singleton
+    with lock:
+        if not singleton:
+            singleton = SharedEncodeCache()
+    return singleton
@@ -0,0 +1,106 @@
+# This file is part of Xpra.
+# Copyright (C) 2016 Antoine Martin <antoine@devloop.org.uk>
+# Xpra is released under the terms of the GNU GPL v2, or, at your option, any
+# later version. See the file COPYING for details.
+
+from xpra.util import envint, envbool
+from xpra.log import Logger
+log = Logger("damage")
+
+from xpra.server.window.motion import hash_tiles     #@UnresolvedImport
+
+TILE_HASH = envbool("XPRA_TILE_HASH", True)
+TILE_SIZE = envint("XPRA_TILE_SIZE", 64)
+#send the whole region if more than this percentage of its pixels has changed:
+MAX_CHANGED = envint("XPRA_TILE_MAX_CHANGED", 75)
+#don't split regions into more rectangles than this:
+MAX_RECTANGLES = envint("XPRA_TILE_MAX_RECTANGLES", 8)
+
+
+def tiles_to_rectangles(tiles):
+    """
+        Merges the geometry of the tiles given into larger rectangles:
+        first the consecutive tiles of each row, then the rows with identical columns.
+        The tiles are (x, y, w, h) tuples, and must all be on the same grid.
+    """
+    rows = {}
+    for x, y, w, h in sorted(tiles, key=lambda t : (t[1], t[0])):
+        runs = rows.setdefault(y, [])
+        if runs and runs[-1][0]+runs[-1][2]==x:
+            rx, ry, rw, rh = runs[-1]
+            runs[-1] = (rx, ry, rw+w, rh)
+        else:
+            runs.append((x, y, w, h))
+    rectangles = []
+    pending = {}            #(x, w) -> rectangle which may be extended downwards
+    for y in sorted(rows.keys()):
+        extended = {}
+        for x, _, w, h in rows[y]:
+            r = pending.pop((x, w), None)
+            if r and r[1]+r[3]==y:
+                r = (r[0], r[1], w, r[3]+h)
+            else:
+                if r:
+                    rectangles.append(r)
+                r = (x, y, w, h)
+            extended[(x, w)] = r
+        rectangles += list(pending.values())
+        pending = extended
+    rectangles += list(pending.values())
+    return sorted(rectangles, key=lambda r : (r[1], r[0]))
+
+
+class TileHashMap(object):
+    """
+        Keeps track of the hash of the tiles of pixels last sent to the client for a window,
+        so we can drop the parts of a damaged region that have not actually changed.
+        The tiles on the edges of a region may only cover part of the grid cell,
+        those only match if the exact same part of the cell is damaged again,
+        which is what happens with blinking cursors and widgets that repaint themselves.
+    """
+
+    def __init__(self, tile_size=TILE_SIZE):
+        self.tile_size = tile_size
+        self.tiles = {}
+
+    def __repr__(self):
+        return "TileHashMap(%i tiles)" % len(self.tiles)
+
+    def clear(self):
+        self.tiles = {}
+
+    def invalidate(self, x, y, w, h):
+        """ forget the tiles in this area """
+        if not self.tiles or w<=0 or h<=0:
+            return
+        ts = self.tile_size
+        for row in range(y//ts, (y+h-1)//ts+1):
+            for col in range(x//ts, (x+w-1)//ts+1):
+                self.tiles.pop((col, row), None)
+
+    def get_info(self):
+        return {
+                "size"      : self.tile_size,
+                "tiles"     : len(self.tiles),
+                }
+
+    def update(self, pixels, x, y, w, h, rowstride, bpp=4):
+        """
+            Updates the tile hashes for the pixels of the region given
+            and returns the list of rectangles that have changed.
+            The caller must send those rectangles, or clear the map if it does not.
+        """
+        tiles = hash_tiles(pixels, x, y, w, h, rowstride, self.tile_size, bpp)
+        old = self.tiles
+        changed = [v[:4] for k, v in tiles.items() if old.get(k)!=v]
+        old.update(tiles)
+        if not changed:
+            return []
+        changed_pixels = sum(tw*th for _, _, tw, th in changed)
+        if changed_pixels*100>w*h*MAX_CHANGED:
+            return [(x, y, w, h)]
+        rectangles = tiles_to_rectangles(changed)
+        if len(rectangles)>MAX_RECTANGLES:
+            return [(x, y, w, h)]
+        log("tiles changed: %s", rectangles)
+        return rectangles
@@ -151,6 +151,11 @@ def get_pipeline_score(enc_in_format, csc_spec, encoder_spec, width, height, sca
         csc_scaling = None
         encoder_scaling = scaling
 
+    if csc_spec and enc_height<getattr(csc_spec, "threaded_min_h", 0):
+        #the threaded csc would run single threaded, without the speed it advertises:
+        scorelog("frame height %i is too small for %s", enc_height, csc_spec)
+        return None
+
     if encoder_scaling!=(1,1) and not encoder_spec.can_scale:
         #we need the encoder to scale but it cannot do it, fail it:
         scorelog("scaling (%s) not supported by %s", encoder_scaling, encoder_spec)
@@ -8,7 +8,7 @@ import time
 import math
 
 from xpra.util import MutableInteger, envint, envbool
-from xpra.server.window.region import rectangle, add_rectangle, remove_rectangle, merge_all    #@UnresolvedImport
+from xpra.server.window.region import rectangle, merge_all, Region    #@UnresolvedImport
 from xpra.log import Logger
 
 sslog = Logger("regiondetect")
@@ -74,7 +74,7 @@ class VideoSubregion(object):
         self.counter = 0        #value of the "damage event count" recorded at "time"
         self.time = 0           #see above
         self.refresh_timer = None
-        self.refresh_regions = []
+        self.refresh_regions = Region()
         self.last_scores = {}
         #keep track of how much extra we batch non-video regions (milliseconds):
         self.non_max_wait = 150
@@ -127,7 +127,7 @@ class VideoSubregion(object):
         if rt:
             self.source_remove(rt)
             self.refresh_timer = None
-            self.refresh_regions = []
+            self.refresh_regions = Region()
         refreshlog("cancel_refresh_timer() timer=%s", rt)
 
     def get_info(self):
@@ -167,7 +167,7 @@ class VideoSubregion(object):
 
 
     def remove_refresh_region(self, region):
-        remove_rectangle(self.refresh_regions, region)
+        self.refresh_regions.substract_rect(region)
         refreshlog("remove_refresh_region(%s) updated refresh regions=%s", region, self.refresh_regions)
 
 
@@ -182,27 +182,24 @@ class VideoSubregion(object):
         #so we re-schedule the subregion refresh:
         self.cancel_refresh_timer()
         #add the new region to what we already have:
-        add_rectangle(self.refresh_regions, region)
+        self.refresh_regions.add_rect(region)
         #do refresh any regions which are now outside the current video region:
         #(this can happen when the region moves or changes size)
-        non_video = []
-        for r in self.refresh_regions:
-            if not rect.contains_rect(r):
-                non_video += r.substract_rect(rect)
+        non_video = self.refresh_regions.copy()
+        non_video.substract_rect(rect)
         delay = max(150, self.auto_refresh_delay)
         if non_video:
             #refresh via timeout_add so this will run in the UI thread:
-            self.timeout_add(delay, self.refresh_cb, non_video)
+            self.timeout_add(delay, self.refresh_cb, non_video.get_rectangles())
             #only keep the regions still in the video region:
-            inrect = [rect.intersection_rect(r) for r in self.refresh_regions]
-            self.refresh_regions = [r for r in inrect if r is not None]
+            self.refresh_regions.intersect_rect(rect)
         #re-schedule the video region refresh (if we have regions to fresh):
         if self.refresh_regions:
             def refresh():
                 #runs via timeout_add, safe to call UI!
                 self.refresh_timer = None
                 regions = self.refresh_regions
-                self.refresh_regions = []
+                self.refresh_regions = Region()
                 #it probably makes sense to refresh the whole thing:
                 #(the window source code doesn't know about the video region,
                 # and would decide to do many overlapping refreshes)
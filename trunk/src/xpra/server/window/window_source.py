@@ -8,6 +8,7 @@
 
 import time
 import os
+import zlib
 import hashlib
 import threading
 from collections import deque
@@ -35,6 +36,10 @@ DELTA = envbool("XPRA_DELTA", True)
 MIN_DELTA_SIZE = envint("XPRA_MIN_DELTA_SIZE", 1024)
 MAX_DELTA_SIZE = envint("XPRA_MAX_DELTA_SIZE", 32768)
 MAX_DELTA_HITS = envint("XPRA_MAX_DELTA_HITS", 20)
+#don't use a delta bucket if more than this percentage of rows have changed:
+MAX_DELTA_CHANGED = envint("XPRA_MAX_DELTA_CHANGED", 80)
+#ask the client to free the buckets we haven't used for this many seconds:
+DELTA_BUCKET_EXPIRY = envint("XPRA_DELTA_BUCKET_EXPIRY", 60)
 MIN_WINDOW_REGION_SIZE = envint("XPRA_MIN_WINDOW_REGION_SIZE", 1024)
 MAX_SOFT_EXPIRED = envint("XPRA_MAX_SOFT_EXPIRED", 5)
 
@@ -57,15 +62,28 @@ from xpra.server.window.window_stats import WindowPerformanceStatistics
 from xpra.server.window.batch_config import DamageBatchConfig
 from xpra.simple_stats import get_list_stats
 from xpra.server.window.batch_delay_calculator import calculate_batch_delay, get_target_speed, get_target_quality
+from xpra.server.window.shared_encode import get_shared_encode_cache, image_digest, SHAREABLE_ENCODINGS
 from xpra.server.cystats import time_weighted_average   #@UnresolvedImport
-from xpra.server.window.region import rectangle, add_rectangle, remove_rectangle, merge_all   #@UnresolvedImport
-from xpra.codecs.xor.cyxor import xor_str           #@UnresolvedImport
+from xpra.server.window.region import rectangle, Region   #@UnresolvedImport
+from xpra.codecs.xor.cyxor import xor_str, xor_rows #@UnresolvedImport
+from xpra.server.window.motion import CRC_Image     #@UnresolvedImport
+from xpra.server.window.tiles import TileHashMap, TILE_HASH
+from xpra.server.window.encoding_model import EncodingCostModel, ENCODING_MODEL, DEFAULT_BANDWIDTH
 from xpra.server.picture_encode import webp_encode, rgb_encode, mmap_send
 from xpra.codecs.loader import PREFERED_ENCODING_ORDER, get_codec
 from xpra.codecs.codec_constants import LOSSY_PIXEL_FORMATS
 from xpra.net import compression
 
 
+def get_row_hashes(pixels, rowstride, height):
+    """ returns a hash value for each row of pixels """
+    hashes = CRC_Image(pixels, rowstride, height, rowstride, 1)
+    if hashes is None:
+        #no xxhash, use crc32 instead:
+        hashes = [zlib.crc32(pixels[y*rowstride:(y+1)*rowstride]) for y in range(height)]
+    return hashes
+
+
 class WindowSource(object):
     """
     We create a Window Source for each window we send pixels for.
@@ -94,10 +112,11 @@ class WindowSource(object):
                     encoding, encodings, core_encodings, window_icon_encodings, encoding_options, icons_encoding_options,
                     rgb_formats,
                     default_encoding_options,
-                    mmap, mmap_size):
+                    mmap, mmap_size, mmap_allocator=None):
         # mmap:
         self._mmap = mmap
         self._mmap_size = mmap_size
+        self._mmap_allocator = mmap_allocator
 
         self.init_vars()
 
@@ -110,7 +129,9 @@ class WindowSource(object):
         self.wid = wid
         self.window = window                            #only to be used from the UI thread!
         self.global_statistics = statistics             #shared/global statistics from ServerSource
+        self.shared_encode = get_shared_encode_cache()  #compressed frames shared with other clients (sharing mode)
         self.statistics = WindowPerformanceStatistics()
+        self.encoding_model = EncodingCostModel()       #predicts the cost of each picture encoding for this window
         self.av_sync = av_sync
         self.av_sync_delay = av_sync_delay
         self.av_sync_delay_target = av_sync_delay
@@ -143,6 +164,7 @@ class WindowSource(object):
             if self.supports_delta:
                 self.delta_buckets = min(25, encoding_options.intget("delta_buckets", 1))
                 self.delta_pixel_data = [None for _ in range(self.delta_buckets)]
+                self.supports_delta_evict = encoding_options.boolget("delta_evict", False)
         self.batch_config = batch_config
         #auto-refresh:
         self.auto_refresh_delay = auto_refresh_delay
@@ -156,6 +178,8 @@ class WindowSource(object):
         self.is_shadow = window.is_shadow()
         self.has_alpha = window.has_alpha()
         self.window_dimensions = 0, 0
+        if TILE_HASH and not self.is_tray:
+            self.tile_hash = TileHashMap()
         self.fullscreen = not self.is_tray and window.get("fullscreen")
         self.scaling_control = default_encoding_options.intget("scaling.control", 1)    #ServerSource sets defaults with the client's scaling.control value
         self.scaling = None
@@ -254,6 +278,9 @@ class WindowSource(object):
         self.supports_delta = []
         self.delta_buckets = 0
         self.delta_pixel_data = []
+        self.delta_evict = []
+        self.supports_delta_evict = False
+        self.delta_rows = [0, 0]                            #changed rows, total rows
         self.suspended = False
         self.strict = STRICT_MODE
         #
@@ -263,7 +290,7 @@ class WindowSource(object):
         self.refresh_event_time = 0
         self.refresh_target_time = 0
         self.refresh_timer = None
-        self.refresh_regions = []
+        self.refresh_regions = Region()
         self.timeout_timer = None
         self.expire_timer = None
         self.soft_timer = None
@@ -276,6 +303,8 @@ class WindowSource(object):
         self.is_shadow = False
         self.has_alpha = False
         self.window_dimensions = 0, 0
+        self.tile_hash = None
+        self._tile_flush_pending = False
         self.fullscreen = False
         self.scaling_control = 0
         self.scaling = None
@@ -307,6 +336,7 @@ class WindowSource(object):
 
     def cleanup(self):
         self.cancel_damage()
+        self.shared_encode.remove_window(self.wid)
         self.statistics.reset()
         log("encoding_totals for wid=%s with primary encoding=%s : %s", self.wid, self.encoding, self.statistics.encoding_totals)
         self.init_vars()
@@ -360,7 +390,7 @@ class WindowSource(object):
         buckets_info = {}
         for i,x in enumerate(self.delta_pixel_data):
             if x:
-                w, h, pixel_format, coding, store, buflen, _, hits, last_used = x
+                w, h, pixel_format, coding, store, buflen, _, _, hits, last_used = x
                 buckets_info[i] = w, h, pixel_format, coding, store, buflen, hits, int((now-last_used)*1000)
         #remove large default dict:
         info.update({
@@ -379,6 +409,11 @@ class WindowSource(object):
                 "delta"                 : {""               : self.supports_delta,
                                            "buckets"        : self.delta_buckets,
                                            "bucket"         : buckets_info,
+                                           "evict"          : self.supports_delta_evict,
+                                           "rows"           : {
+                                                               "changed"    : self.delta_rows[0],
+                                                               "total"      : self.delta_rows[1],
+                                                               },
                                            },
                 "property"              : self.get_property_info(),
                 "batch"                 : self.batch_config.get_info(),
@@ -396,6 +431,11 @@ class WindowSource(object):
         if lde:
             dfps = len(lde) // 5
         info["damage.fps"] = dfps
+        th = self.tile_hash
+        if th:
+            info["tile-hash"] = th.get_info()
+        if ENCODING_MODEL:
+            einfo["model"] = self.encoding_model.get_info()
         if self.pixel_format:
             info["pixel-format"] = self.pixel_format
         idata = self.window_icon_data
@@ -675,7 +715,7 @@ class WindowSource(object):
         if self.encoding==encoding:
             return
         self.statistics.reset()
-        self.delta_pixel_data = [None for _ in range(self.delta_buckets)]
+        self.clear_delta_buckets()
         self.update_encoding_selection(encoding)
 
 
@@ -779,6 +819,12 @@ class WindowSource(object):
         return self.encoding
 
     def get_transparent_encoding(self, pixel_count, ww, wh, speed, quality, current_encoding):
+        encoding = self.get_default_transparent_encoding(pixel_count, speed, quality)
+        #only use lossy webp when the quality is low enough:
+        candidates = [x for x in ("rgb32", "png", "webp") if x in self.common_encodings and (x!="webp" or quality<=75)]
+        return self.get_model_encoding(candidates, pixel_count, quality, encoding)
+
+    def get_default_transparent_encoding(self, pixel_count, speed, quality):
         #small areas prefer rgb, also when high speed and high quality
         if "rgb32" in self.common_encodings and (pixel_count<self._rgb_auto_threshold or (quality>=90 and speed>=90)):
             return "rgb32"
@@ -789,6 +835,24 @@ class WindowSource(object):
                 return x
         return self.common_encodings[0]
 
+    def get_model_encoding(self, candidates, pixel_count, quality, default):
+        """
+            Lets the encoding cost model choose the candidate with the lowest predicted latency,
+            the default encoding is the one chosen by the heuristics.
+        """
+        if not ENCODING_MODEL:
+            return default
+        return self.encoding_model.choose(candidates, pixel_count, self.get_bandwidth_estimate(), default, quality)
+
+    def get_bandwidth_estimate(self):
+        bandwidth = self.global_statistics.bandwidth_estimate
+        if bandwidth<=0:
+            #how fast we have been sending the damage packets recently:
+            bandwidth = self.statistics.recent_send_speed
+        if bandwidth<=0:
+            return DEFAULT_BANDWIDTH
+        return bandwidth
+
     def get_current_or_rgb(self, pixel_count, ww, wh, *args):
         if pixel_count<self._rgb_auto_threshold:
             return "rgb24"
@@ -818,7 +882,7 @@ class WindowSource(object):
         self.cancel_timeout_timer()
         self.cancel_av_sync_timer()
         #if a region was delayed, we can just drop it now:
-        self.refresh_regions = []
+        self.refresh_regions = Region()
         eq = self.encode_queue
         if eq:
             self.encode_queue = []
@@ -829,7 +893,8 @@ class WindowSource(object):
                     log.error("Error: cannot free image wrapper %s: %s", item[4], exc_info=True)
         self._damage_delayed = None
         self._damage_delayed_expired = False
-        self.delta_pixel_data = [None for _ in range(self.delta_buckets)]
+        self.clear_delta_buckets()
+        self.clear_tile_hashes()
         #make sure we don't account for those as they will get dropped
         #(generally before encoding - only one may still get encoded):
         for sequence in self.statistics.encoding_pending.keys():
@@ -1037,6 +1102,7 @@ class WindowSource(object):
         if self.window_dimensions != (ww, wh):
             self.statistics.last_resized = now
             self.window_dimensions = ww, wh
+            self.clear_tile_hashes()
             self.encode_queue_max_size = max(2, min(15, MAX_SYNC_BUFFER_SIZE/(ww*wh*4)))
         if self.full_frames_only:
             x, y, w, h = 0, 0, ww, wh
@@ -1045,9 +1111,7 @@ class WindowSource(object):
         if delayed:
             #use existing delayed region:
             if not self.full_frames_only:
-                regions = delayed[1]
-                region = rectangle(x, y, w, h)
-                add_rectangle(regions, region)
+                delayed[1].add(x, y, w, h)
             #merge/override options
             if options is not None:
                 override = options.get("override_options", False)
@@ -1113,7 +1177,8 @@ class WindowSource(object):
             return
 
         #create a new delayed region:
-        regions = [rectangle(x, y, w, h)]
+        regions = Region()
+        regions.add(x, y, w, h)
         self._damage_delayed_expired = False
         actual_encoding = options.get("encoding", self.encoding)
         self._damage_delayed = now, regions, actual_encoding, options or {}
@@ -1281,6 +1346,9 @@ class WindowSource(object):
         def get_encoding(pixel_count):
             return get_best_encoding(pixel_count, ww, wh, speed, quality, coding)
 
+        if not isinstance(regions, Region):
+            regions = Region(regions)
+
         def send_full_window_update():
             actual_encoding = get_encoding(ww*wh)
             log("send_delayed_regions: using full window update %sx%s with %s", ww, wh, actual_encoding)
@@ -1301,10 +1369,11 @@ class WindowSource(object):
                 send_full_window_update()
                 return
 
-        regions = list(set(regions))
+        region_set = regions
+        regions = region_set.get_rectangles()
         if MERGE_REGIONS:
             bytes_threshold = ww*wh*self.max_bytes_percent/100
-            pixel_count = sum(rect.width*rect.height for rect in regions)
+            pixel_count = region_set.get_area()
             bytes_cost = pixel_count+self.small_packet_cost*len(regions)
             log("send_delayed_regions: bytes_cost=%s, bytes_threshold=%s, pixel_count=%s", bytes_cost, bytes_threshold, pixel_count)
             if bytes_cost>=bytes_threshold:
@@ -1315,16 +1384,14 @@ class WindowSource(object):
                 #make regions out of the rest of the window area:
                 non_exclude = rectangle(0, 0, ww, wh).substract_rect(exclude_region)
                 #and keep those that have damage areas in them:
-                regions = [x for x in non_exclude if len([y for y in regions if x.intersects_rect(y)])>0]
+                regions = [x for x in non_exclude if region_set.intersects_rect(x)]
                 #TODO: should verify that is still better than what we had before..
             elif len(regions)>1:
-                #try to merge all the regions to see if we save anything:
-                merged = merge_all(regions)
+                #try to merge the regions to see if we save anything:
+                merged_rects = region_set.merge(self.small_packet_cost)
                 #remove the exclude region if needed:
                 if exclude_region:
-                    merged_rects = merged.substract_rect(exclude_region)
-                else:
-                    merged_rects = [merged]
+                    merged_rects = [v for r in merged_rects for v in r.substract_rect(exclude_region)]
                 merged_pixel_count = sum(r.width*r.height for r in merged_rects)
                 merged_bytes_cost = merged_pixel_count+self.small_packet_cost*len(merged_rects)
                 log("send_delayed_regions: merged=%s, merged_bytes_cost=%s, bytes_cost=%s, merged_pixel_count=%s, pixel_count=%s",
@@ -1427,12 +1494,67 @@ class WindowSource(object):
             return
         self.pixel_format = image.get_pixel_format()
 
-        now = time.time()
-        item = (w, h, damage_time, now, image, coding, sequence, options, flush)
-        self.call_in_encode_thread(True, self.make_data_packet_cb, *item)
-        log("process_damage_region: wid=%i, adding pixel data to encode queue (%4ix%-4i - %5s), elapsed time: %.1f ms, request time: %.1f ms",
-                self.wid, w, h, coding, 1000*(now-damage_time), 1000*(now-rgb_request_time))
+        rectangles = self.get_changed_tiles(image, x, y, w, h, coding, options, flush)
+        if not rectangles:
+            image.free()
+            return
+        n = len(rectangles)
+        for i, (rx, ry, rw, rh) in enumerate(rectangles):
+            rimage = image
+            rflush = flush
+            if n>1 or (rw, rh)!=(w, h):
+                rimage = image.get_sub_image(rx-x, ry-y, rw, rh)
+                if flush is not None:
+                    rflush = flush+n-1-i
+                if i>0:
+                    self._sequence += 1
+                    sequence = self._sequence
+            now = time.time()
+            item = (rw, rh, damage_time, now, rimage, coding, sequence, options, rflush)
+            self.call_in_encode_thread(True, self.make_data_packet_cb, *item)
+            log("process_damage_region: wid=%i, adding pixel data to encode queue (%4ix%-4i - %5s), elapsed time: %.1f ms, request time: %.1f ms",
+                    self.wid, rw, rh, coding, 1000*(now-damage_time), 1000*(now-rgb_request_time))
+        if rimage is not image:
+            image.free()
+
 
+    def clear_tile_hashes(self):
+        th = self.tile_hash
+        if th:
+            th.clear()
+
+    def get_changed_tiles(self, image, x, y, w, h, coding, options, flush=None):
+        """
+            Uses the tile hashes to figure out which parts of the image have changed
+            since we last sent them, and returns the list of rectangles we need to send.
+            (the list is empty when nothing has changed)
+        """
+        th = self.tile_hash
+        if not th:
+            return [(x, y, w, h)]
+        rectangles = [(x, y, w, h)]
+        pixels = None
+        if not self.must_encode_full_frame(coding) and image.get_planes()==0 and len(image.get_pixel_format())==4:
+            pixels = image.get_pixels()
+        if pixels is None:
+            #we can't send sub-regions, or we can't hash these pixels,
+            #so we don't know what the client will have in this area:
+            th.invalidate(x, y, w, h)
+        else:
+            changed = th.update(pixels, x, y, w, h, image.get_rowstride())
+            if options.get("auto_refresh", False):
+                #refreshes must be sent, even if the pixels have not changed
+                pass
+            elif not changed and flush==0 and self._tile_flush_pending:
+                #the client is still waiting for the final flush packet
+                pass
+            else:
+                rectangles = changed
+            self.statistics.tile_pixels[0] += w*h
+            self.statistics.tile_pixels[1] += w*h-sum(rw*rh for _, _, rw, rh in rectangles)
+        if rectangles and flush is not None:
+            self._tile_flush_pending = flush>0
+        return rectangles
 
     def make_data_packet_cb(self, w, h, damage_time, process_damage_time, image, coding, sequence, options, flush):
         """ This function is called from the damage data thread!
@@ -1452,6 +1574,8 @@ class WindowSource(object):
         #NOTE: we MUST send it (even if the window is cancelled by now..)
         #because the code may rely on the client having received this frame
         if not packet:
+            #the client won't have those pixels:
+            self.clear_tile_hashes()
             return
         #queue packet for sending:
         self.queue_damage_packet(packet, damage_time, process_damage_time)
@@ -1531,14 +1655,14 @@ class WindowSource(object):
     def remove_refresh_region(self, region):
         #removes the given region from the refresh list
         #(also overriden in window video source)
-        remove_rectangle(self.refresh_regions, region)
+        self.refresh_regions.substract_rect(region)
 
     def add_refresh_region(self, region):
         #adds the given region to the refresh list
         #returns the number of pixels in the region update
         #(overriden in window video source to exclude the video region)
         #Note: this does not run in the UI thread!
-        add_rectangle(self.refresh_regions, region)
+        self.refresh_regions.add_rect(region)
         return region.width*region.height
 
     def can_refresh(self):
@@ -1581,7 +1705,7 @@ class WindowSource(object):
         ret = self.refresh_event_time
         self.refresh_event_time = 0
         regions = self.refresh_regions
-        self.refresh_regions = []
+        self.refresh_regions = Region()
         if self.can_refresh() and regions and ret>0:
             now = time.time()
             options = self.get_refresh_options()
@@ -1612,7 +1736,7 @@ class WindowSource(object):
             #can happen during cleanup
             return
         refresh_regions = self.refresh_regions
-        self.refresh_regions = []
+        self.refresh_regions = Region()
         w, h = self.window_dimensions
         refreshlog("full_quality_refresh() for %sx%s window with regions: %s", w, h, self.refresh_regions)
         new_options = damage_options.copy()
@@ -1659,6 +1783,7 @@ class WindowSource(object):
                     damage_out_latency = now-process_damage_time
                     self.statistics.damage_out_latency.append((now, width*height, actual_batch_delay, damage_out_latency))
                     self.statistics.damage_send_speed.append((now, bytecount-start_bytecount, now-start_send_time))
+                self.global_statistics.record_write(bytecount-start_bytecount, now-start_send_time)
         if damage_time>0:
             now = time.time()
             damage_in_latency = now-process_damage_time
@@ -1678,6 +1803,9 @@ class WindowSource(object):
         statslog("packet decoding sequence %s for window %s: %sx%s took %.1fms", damage_packet_sequence, self.wid, width, height, decode_time/1000.0)
         if decode_time>0:
             self.statistics.client_decode_time.append((time.time(), width*height, decode_time))
+        elif decode_time==0 and message=="superseded":
+            #the client is falling behind and dropped this frame:
+            self.statistics.client_skipped.append((time.time(), width*height))
         elif decode_time<0:
             self.client_decode_error(decode_time, message)
         pending = self.statistics.damage_ack_pending.get(damage_packet_sequence)
@@ -1707,11 +1835,67 @@ class WindowSource(object):
         log.warn("Warning: client decoding error: %s%s", message, emsg)
         self.global_statistics.decode_errors += 1
         #something failed client-side, so we can't rely on the delta being available
-        self.delta_pixel_data = [None for _ in range(self.delta_buckets)]
+        self.clear_delta_buckets()
+        self.clear_tile_hashes()
         if self.window:
             self.timeout_add(250, self.full_quality_refresh)
 
 
+    def clear_delta_buckets(self):
+        #the client can free the pixel data of the buckets we were using:
+        evict = [i for i, dr in enumerate(self.delta_pixel_data) if dr is not None]
+        self.delta_pixel_data = [None for _ in range(self.delta_buckets)]
+        if evict:
+            self.delta_evict = sorted(set(self.delta_evict+evict))
+
+    def expire_delta_buckets(self):
+        if DELTA_BUCKET_EXPIRY<=0:
+            return
+        expired = time.time()-DELTA_BUCKET_EXPIRY
+        for i, dr in enumerate(self.delta_pixel_data):
+            if dr is not None and dr[-1]<expired:
+                deltalog("delta: bucket %i has expired", i)
+                self.delta_pixel_data[i] = None
+                self.delta_evict = sorted(set(self.delta_evict+[i]))
+
+    def find_delta_bucket(self, w, h, pixel_format, coding, dlen, row_hashes):
+        """
+            Finds the bucket with the most rows in common with these pixels.
+            Returns the bucket index (or -1) and the list of rows which differ,
+            the list is None if the bucket is too different to be worth using.
+        """
+        bucket, changed_rows = -1, None
+        for i, dr in enumerate(list(self.delta_pixel_data)):
+            if dr is None:
+                continue
+            lw, lh, lpixel_format, lcoding, _, buflen, _, lrow_hashes = dr[:8]
+            if lw!=w or lh!=h or lpixel_format!=pixel_format or lcoding!=coding or buflen!=dlen:
+                continue
+            changed = [y for y in range(h) if row_hashes[y]!=lrow_hashes[y]]
+            if bucket<0 or len(changed)<len(changed_rows):
+                bucket, changed_rows = i, changed
+        if bucket>=0 and len(changed_rows)*100>h*MAX_DELTA_CHANGED:
+            return bucket, None
+        return bucket, changed_rows
+
+    def get_store_bucket(self):
+        """ returns an empty bucket, or the one which has not been used for the longest time """
+        lpd = self.delta_pixel_data
+        try:
+            bucket = lpd.index(None)
+            deltalog("delta: found empty bucket %i", bucket)
+            return bucket
+        except ValueError:
+            pass
+        t = 0
+        bucket = 0
+        for i,dr in enumerate(lpd):
+            if dr and (t==0 or dr[-1]<t):
+                t = dr[-1]
+                bucket = i
+        deltalog("delta: using oldest bucket %i", bucket)
+        return bucket
+
     def make_data_packet(self, damage_time, process_damage_time, image, coding, sequence, options, flush):
         """
             Picture encoding - non-UI thread.
@@ -1755,29 +1939,38 @@ class WindowSource(object):
             assert dpixels, "failed to get pixels from %s" % image
             dpixels = memoryview_to_bytes(dpixels)
             dlen = len(dpixels)
+            rowstride = image.get_rowstride()
+            row_hashes = get_row_hashes(dpixels, rowstride, h)
             store = sequence
             deltalog("delta available for %s and %i %s pixels on wid=%i", coding, isize, pixel_format, self.wid)
-            for i, dr in enumerate(list(self.delta_pixel_data)):
-                if dr is None:
-                    continue
-                lw, lh, lpixel_format, lcoding, lsequence, buflen, ldata, hits, _ = dr
-                if lw==w and lh==h and lpixel_format==pixel_format and lcoding==coding and buflen==dlen:
-                    bucket = i
-                    if MAX_DELTA_HITS>0 and hits<MAX_DELTA_HITS:
-                        deltalog("delta: using matching bucket %s: %sx%s (%s, %i bytes, sequence=%i, hit count=%s)", i, lw, lh, lpixel_format, dlen, lsequence, hits)
-                        #xor with this matching delta bucket:
-                        delta = lsequence
+            self.expire_delta_buckets()
+            bucket, changed_rows = self.find_delta_bucket(w, h, pixel_format, coding, dlen, row_hashes)
+            if bucket>=0:
+                dr = self.delta_pixel_data[bucket]
+                lsequence, ldata, hits = dr[4], dr[6], dr[8]
+                if changed_rows is None:
+                    deltalog("delta: bucket %i is too different, replacing it", bucket)
+                    hits = 0
+                    self.delta_pixel_data[bucket] = None
+                elif MAX_DELTA_HITS>0 and hits<MAX_DELTA_HITS:
+                    deltalog("delta: using bucket %s: %sx%s (%s, %i bytes, sequence=%i, hit count=%s, %i rows changed)",
+                             bucket, w, h, pixel_format, dlen, lsequence, hits, len(changed_rows))
+                    #xor with this delta bucket, only the rows which have changed:
+                    delta = lsequence
+                    if len(changed_rows)==h:
                         xored = xor_str(dpixels, ldata)
-                        image.set_pixels(xored)
-                        dr[-1] = time.time()            #update last used time
-                        hits += 1
-                        dr[-2] = hits               #update hit count
                     else:
-                        deltalog("delta: too many hits for bucket %s: %s, clearing it", bucket, hits)
-                        hits = 0
-                        self.delta_pixel_data[i] = None
-                        delta = -1
-                    break
+                        xored = xor_rows(dpixels, ldata, rowstride, changed_rows)
+                    image.set_pixels(xored)
+                    dr[-1] = time.time()            #update last used time
+                    hits += 1
+                    dr[-2] = hits               #update hit count
+                    self.delta_rows[0] += len(changed_rows)
+                    self.delta_rows[1] += h
+                else:
+                    deltalog("delta: too many hits for bucket %s: %s, clearing it", bucket, hits)
+                    hits = 0
+                    self.delta_pixel_data[bucket] = None
 
         #by default, don't set rowstride (the container format will take care of providing it):
         encoder = self._encoders.get(coding)
@@ -1786,13 +1979,35 @@ class WindowSource(object):
                 return None
             else:
                 raise Exception("BUG: no encoder not found for %s" % coding)
-        ret = encoder(coding, image, options)
+        shared_key, digest, ret = None, None, None
+        shared = False
+        if delta<0 and coding in SHAREABLE_ENCODINGS and self.shared_encode.is_active():
+            #another client may have already compressed these exact pixels:
+            shared_key = self.get_shared_encode_key(coding, image, options)
+            if shared_key:
+                digest = image_digest(image)
+                if digest:
+                    ret = self.shared_encode.get(self.wid, shared_key, digest)
         if ret is None:
-            log("%s%s returned None", encoder, (coding, image, options))
-            #something went wrong.. nothing we can do about it here!
-            return  None
+            encode_start = time.time()
+            ret = encoder(coding, image, options)
+            if ret is None:
+                log("%s%s returned None", encoder, (coding, image, options))
+                #something went wrong.. nothing we can do about it here!
+                return  None
+            if shared_key and digest:
+                self.shared_encode.add(self.wid, shared_key, digest, ret)
+            if delta<0:
+                #(xored delta frames compress much better than regular frames)
+                quality = options.get("quality") or self.get_quality(coding)
+                self.encoding_model.record(ret[0], w*h, len(ret[1]), time.time()-encode_start, quality)
+        else:
+            log("make_data_packet: re-using %s data compressed for another client", coding)
+            shared = True
 
         coding, data, client_options, outw, outh, outstride, bpp = ret
+        #the client options may be shared or modified below:
+        client_options = client_options.copy()
         #check cancellation list again since the code above may take some time:
         #but always send mmap data so we can reclaim the space!
         if coding!="mmap" and (self.is_cancelled(sequence) or self.suspended):
@@ -1803,31 +2018,21 @@ class WindowSource(object):
             client_options["delta"] = delta
             client_options["bucket"] = bucket
         csize = len(data)
+        evict = self.delta_evict
         if store>0:
             if delta>0 and csize>=psize*40//100:
                 #compressed size is more than 40% of the original
                 #maybe delta is not helping us, so clear it:
                 self.delta_pixel_data[bucket] = None
                 deltalog("delta: clearing bucket %i (compressed size=%s, original size=%s)", bucket, csize, psize)
-                #TODO: could tell the clients they can clear it too
-                #(add a new client capability and send it a zero store value)
+                #this packet still uses the bucket,
+                #so the client can only free it with the next packet:
+                self.delta_evict = [bucket]
             else:
                 #find the bucket to use:
                 if bucket<0:
-                    lpd = self.delta_pixel_data
-                    try:
-                        bucket = lpd.index(None)
-                        deltalog("delta: found empty bucket %i", bucket)
-                    except ValueError:
-                        #find a bucket which has not been used recently
-                        t = 0
-                        bucket = 0
-                        for i,dr in enumerate(lpd):
-                            if dr and (t==0 or dr[-1]<t):
-                                t = dr[-1]
-                                bucket = i
-                        deltalog("delta: using oldest bucket %i", bucket)
-                self.delta_pixel_data[bucket] = [w, h, pixel_format, coding, store, len(dpixels), dpixels, hits, time.time()]
+                    bucket = self.get_store_bucket()
+                self.delta_pixel_data[bucket] = [w, h, pixel_format, coding, store, len(dpixels), dpixels, row_hashes, hits, time.time()]
                 client_options["store"] = store
                 client_options["bucket"] = bucket
                 #record number of frames and pixels:
@@ -1835,6 +2040,14 @@ class WindowSource(object):
                 totals[0] = totals[0] + 1
                 totals[1] = totals[1] + w*h
                 deltalog("delta: client options=%s (for region %s)", client_options, (x, y, w, h))
+        if evict:
+            if self.delta_evict is evict:
+                self.delta_evict = []
+            #don't evict the buckets we have re-used since:
+            evict = [i for i in evict if self.delta_pixel_data[i] is None]
+            if evict and self.supports_delta_evict:
+                deltalog("delta: client can free buckets %s", evict)
+                client_options["evict"] = evict
         if INTEGRITY_HASH and coding!="mmap":
             #could be a compressed wrapper or just raw bytes:
             try:
@@ -1851,9 +2064,31 @@ class WindowSource(object):
         end = time.time()
         compresslog("compress: %5.1fms for %4ix%-4i pixels at %4i,%-4i for wid=%-5i using %5s with ratio %5.1f%% (%5iKB to %5iKB), client_options=%s",
                  (end-start)*1000.0, outw, outh, x, y, self.wid, coding, 100.0*csize/psize, psize/1024, csize/1024, client_options)
-        self.statistics.encoding_stats.append((end, coding, w*h, bpp, len(data), end-start))
+        if not shared:
+            #the encoding time of a shared frame would skew the speed and quality heuristics:
+            self.statistics.encoding_stats.append((end, coding, w*h, bpp, len(data), end-start))
         return self.make_draw_packet(x, y, outw, outh, coding, data, outstride, client_options)
 
+    def get_shared_encode_key(self, coding, image, options):
+        """
+            Returns a key which identifies all the settings that affect the output of the encoder,
+            so that other clients can only re-use the compressed data if they would have
+            generated exactly the same thing. (ie: same encoding, quality, speed and caps)
+        """
+        x, y, w, h, _ = image.get_geometry()
+        q = options.get("quality") or self.get_quality(coding)
+        s = options.get("speed") or self.get_speed(coding)
+        key = (coding, x, y, w, h, image.get_pixel_format(), image.get_rowstride(), q, s,
+               self.supports_transparency, tuple(self.rgb_formats),
+               self.rgb_zlib, self.rgb_lz4, self.rgb_lzo, self.scaling,
+               tuple(sorted(options.items())))
+        try:
+            hash(key)
+        except TypeError:
+            #some options cannot be used as a key
+            return None
+        return key
+
     def make_draw_packet(self, x, y, outw, outh, coding, data, outstride, client_options={}):
         packet = ("draw", self.wid, x, y, outw, outh, coding, data, self._damage_packet_sequence, outstride, client_options)
         self.global_statistics.packet_count += 1
@@ -1890,7 +2125,7 @@ class WindowSource(object):
 
     def mmap_encode(self, coding, image, options):
         assert self._mmap and self._mmap_size>0
-        v = mmap_send(self._mmap, self._mmap_size, image, self.rgb_formats, self.supports_transparency)
+        v = mmap_send(self._mmap, self._mmap_size, image, self.rgb_formats, self.supports_transparency, self._mmap_allocator, self.wid)
         if v is None:
             return None
         mmap_info, mmap_free_size, written = v
@@ -43,6 +43,8 @@ class WindowPerformanceStatistics(object):
         self.client_decode_time = deque(maxlen=NRECS)       #records how long it took the client to decode frames:
                                                             #(ack_time, no of pixels, decoding_time*1000*1000)
         self.encoding_stats = deque(maxlen=NRECS)           #encoding: (time, coding, pixels, bpp, compressed_size, encoding_time)
+        self.client_skipped = deque(maxlen=NRECS)           #frames the client did not paint because newer ones replaced them:
+                                                            #(ack_time, no of pixels)
         # statistics:
         self.damage_in_latency = deque(maxlen=NRECS)        #records how long it took for a damage request to be sent
                                                             #last NRECS: (sent_time, no of pixels, actual batch delay, damage_latency)
@@ -61,6 +63,7 @@ class WindowPerformanceStatistics(object):
         self.last_recalculate = 0
         self.damage_events_count = 0
         self.packet_count = 0
+        self.tile_pixels = [0, 0]                           #pixels checked using the tile hashes, pixels skipped
 
         self.last_resized = 0
 
@@ -135,6 +138,11 @@ class WindowPerformanceStatistics(object):
             recent1MB = 1.0*1024*1024/rds
             weight_div = max(0.25, rds/(4*1000*1000))
             factors.append(calculate_for_average(metric, avg1MB, recent1MB, weight_offset=0.0, weight_div=weight_div))
+        #frames skipped by the client are a strong indicator that we are sending too much:
+        recent_skipped = [t for t, _ in list(self.client_skipped) if t>time.time()-1]
+        if recent_skipped:
+            count = len(recent_skipped)
+            factors.append(("client-skipped", {"count" : count}, 1.0+logp(count), 1.0))
         ldet = self.last_damage_event_time
         if ldet:
             #If nothing happens for a while then we can reduce the batch delay,
@@ -196,6 +204,14 @@ class WindowPerformanceStatistics(object):
         for encoding, totals in self.encoding_totals.items():
             tf[encoding] = totals[0]
             tp[encoding] = totals[1]
+        if self.client_skipped:
+            info["client_skipped"] = {"frames" : len(self.client_skipped),
+                                      "pixels" : sum(p for _, p in list(self.client_skipped))}
+        checked, skipped = self.tile_pixels
+        if checked>0:
+            info["tiles"] = {"pixels"       : checked,
+                             "skipped"      : skipped,
+                             "skipped_pct"  : 100*skipped//checked}
         return info
 
 
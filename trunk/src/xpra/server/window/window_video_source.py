@@ -13,8 +13,8 @@ from math import sqrt
 from xpra.net.compression import Compressed, LargeStructure
 from xpra.codecs.codec_constants import TransientCodecException, RGB_FORMATS, PIXEL_SUBSAMPLING
 from xpra.server.window.window_source import WindowSource, STRICT_MODE, AUTO_REFRESH_SPEED, AUTO_REFRESH_QUALITY
-from xpra.server.window.region import merge_all            #@UnresolvedImport
-from xpra.server.window.motion import match_distance, consecutive_lines, calculate_distances, CRC_Image #@UnresolvedImport
+from xpra.server.window.region import Region               #@UnresolvedImport
+from xpra.server.window.motion import ScrollData #@UnresolvedImport
 from xpra.server.window.video_subregion import VideoSubregion, VIDEO_SUBREGION
 from xpra.server.window.video_scoring import get_pipeline_score
 from xpra.codecs.loader import PREFERED_ENCODING_ORDER, EDGE_ENCODING_ORDER
@@ -48,6 +48,8 @@ B_FRAMES = envbool("XPRA_B_FRAMES", True)
 VIDEO_SKIP_EDGE = envbool("XPRA_VIDEO_SKIP_EDGE", False)
 SCROLL_ENCODING = envbool("XPRA_SCROLL_ENCODING", True)
 SCROLL_MIN_PERCENT = max(1, min(100, envint("XPRA_SCROLL_MIN_PERCENT", 40)))
+SCROLL_MAX_DISTANCE = envint("XPRA_SCROLL_MAX_DISTANCE", 1000)
+SCROLL_HORIZONTAL = envbool("XPRA_SCROLL_HORIZONTAL", True)
 
 FAST_ORDER = ["jpeg", "rgb32", "rgb24", "png"] + PREFERED_ENCODING_ORDER
 
@@ -407,37 +409,54 @@ class WindowVideoSource(WindowSource):
         #if we're here, then the window has no alpha (or the client cannot handle alpha)
         #and we can ignore the current encoding
         options = options or self.non_video_encodings
+        encoding = self.get_default_nonvideo_encoding(pixel_count, ww, wh, speed, quality, options)
+        #the cost model can only choose between the encodings which honour the lossless threshold,
+        #and webp only within the same limits as the heuristics:
+        candidates = [x for x in ("rgb24", "rgb32", "png") if x in options]
+        webp = "webp" in options and self.is_webp_size_ok(pixel_count, speed, quality)
+        if quality<self.get_lossless_threshold(pixel_count, ww, wh):
+            candidates += [x for x in ("jpeg", ) if x in options]
+            if webp and speed>30:
+                candidates.append("webp")
+        elif webp and (quality<100 or speed>=50):
+            candidates.append("webp")
+        return self.get_model_encoding(candidates, pixel_count, quality, encoding)
+
+    def is_webp_size_ok(self, pixel_count, speed, quality):
+        #avoid very small and very large areas (both slow), especially at low speed and high quality:
+        max_webp = 1024*1024 * (200-quality)/100 * speed/100
+        return pixel_count>16384 and pixel_count<max_webp
+
+    def get_lossless_threshold(self, pixel_count, ww, wh):
+        #use sliding scale for lossless threshold
+        #(high speed favours switching to lossy sooner)
+        #take into account how many pixels need to be encoder:
+        #more pixels means we switch to lossless more easily
+        return min(100, self._lossless_threshold_base + self._lossless_threshold_pixel_boost * pixel_count / (ww*wh))
+
+    def get_default_nonvideo_encoding(self, pixel_count, ww, wh, speed, quality, options):
         if pixel_count<self._rgb_auto_threshold:
             #high speed and high quality, rgb is still good
             if "rgb24" in options:
                 return "rgb24"
             if "rgb32" in options:
                 return "rgb32"
-        #use sliding scale for lossless threshold
-        #(high speed favours switching to lossy sooner)
-        #take into account how many pixels need to be encoder:
-        #more pixels means we switch to lossless more easily
-        lossless_q = min(100, self._lossless_threshold_base + self._lossless_threshold_pixel_boost * pixel_count / (ww*wh))
-        if quality<lossless_q:
+        if quality<self.get_lossless_threshold(pixel_count, ww, wh):
             #lossy options:
             if "jpeg" in options:
                 #assume that we have "turbojpeg",
                 #which beats everything in terms of efficiency for lossy compression:
                 return "jpeg"
             #avoid large areas (too slow), especially at low speed and high quality:
-            if "webp" in options and pixel_count>16384:
-                max_webp = 1024*1024 * (200-quality)/100 * speed/100
-                if speed>30 and pixel_count<max_webp:
-                    return "webp"
+            if "webp" in options and speed>30 and self.is_webp_size_ok(pixel_count, speed, quality):
+                return "webp"
         else:
             #lossless options:
             #webp: don't enable it for "true" lossless (q>99) unless speed is high enough
             #because webp forces speed=100 for true lossless mode
             #also avoid very small and very large areas (both slow)
-            if "webp" in options and (quality<100 or speed>=50) and pixel_count>16384:
-                max_webp = 1024*1024 * (200-quality)/100 * speed/100
-                if pixel_count<max_webp:
-                    return "webp"
+            if "webp" in options and (quality<100 or speed>=50) and self.is_webp_size_ok(pixel_count, speed, quality):
+                return "webp"
             if speed>75:
                 if "rgb24" in options:
                     return "rgb24"
@@ -619,19 +638,19 @@ class WindowVideoSource(WindowSource):
             return
         assert not self.full_frames_only
 
+        if not isinstance(regions, Region):
+            regions = Region(regions)
         actual_vr = None
-        if vr in regions:
-            #found the video region the easy way: exact match in list
+        if regions.contains_rect(vr):
+            #found the video region the easy way: fully damaged
             actual_vr = vr
         else:
-            #find how many pixels are within the region (roughly):
-            #find all unique regions that intersect with it:
-            inter = [x for x in (vr.intersection_rect(r) for r in regions) if x is not None]
-            if len(inter)>0:
-                #merge all regions into one:
-                in_region = merge_all(inter)
+            #find how many pixels are within the region:
+            inter = regions.copy()
+            inter.intersect_rect(vr)
+            if inter:
                 pixels_in_region = vr.width*vr.height
-                pixels_intersect = in_region.width*in_region.height
+                pixels_intersect = inter.get_area()
                 if pixels_intersect>=pixels_in_region*40/100:
                     #we have at least 40% of the video region
                     #that needs refreshing, do it:
@@ -660,9 +679,8 @@ class WindowVideoSource(WindowSource):
             self.process_damage_region(damage_time, actual_vr.x, actual_vr.y, actual_vr.width, actual_vr.height, coding, video_options, 0)
 
             #now substract this region from the rest:
-            trimmed = []
-            for r in regions:
-                trimmed += r.substract_rect(actual_vr)
+            trimmed = regions.copy()
+            trimmed.substract_rect(actual_vr)
             if not trimmed:
                 sublog("send_delayed_regions: nothing left after removing video region %s", actual_vr)
                 return
@@ -673,7 +691,7 @@ class WindowVideoSource(WindowSource):
         #(this codepath can fire from a video region refresh callback)
         dr = self._damage_delayed
         if dr:
-            regions = dr[1] + regions
+            regions.union(dr[1])
             damage_time = min(damage_time, dr[0])
             self._damage_delayed = None
             self.cancel_expire_timer()
@@ -755,6 +773,18 @@ class WindowVideoSource(WindowSource):
             else:
                 self.encode_queue.append(item)
                 self.timeout_add(av_delay, self.call_in_encode_thread, True, self.encode_from_queue)
+        rectangles = self.get_changed_tiles(image, x, y, w, h, coding, options, flush)
+        if not rectangles:
+            image.free()
+            return
+        if rectangles!=[(x, y, w, h)]:
+            #only send the tiles that have changed:
+            n = len(rectangles)
+            for i, (rx, ry, rw, rh) in enumerate(rectangles):
+                sub = image.get_sub_image(rx-x, ry-y, rw, rh)
+                call_encode(rw, rh, sub, coding, flush+n-1-i)
+            image.free()
+            return
         #now figure out if we need to send edges separately:
         if coding in self.video_encodings and self.edge_encoding and not VIDEO_SKIP_EDGE:
             dw = w - (w & self.width_mask)
@@ -1351,60 +1381,22 @@ class WindowVideoSource(WindowSource):
         return {}
 
 
-    def encode_scrolling(self, image, distances, old_csums, csums, options):
+    def make_data_packet(self, damage_time, process_damage_time, image, coding, sequence, options, flush):
+        sd = self.scroll_data
+        if sd and self._encoders.get(coding)!=self.video_encode:
+            #the scroll data must not be used for the pixels we are about to send:
+            sd.invalidate(*image.get_geometry()[:4])
+        return WindowSource.make_data_packet(self, damage_time, process_damage_time, image, coding, sequence, options, flush)
+
+    def encode_scrolling(self, image, scrolls, non_scroll, options):
+        """
+            Sends the areas which have been scrolled as a single "scroll" packet,
+            and everything else (excluding the areas that have not changed) as regular draw packets.
+            The rectangles are in window coordinates.
+        """
         tstart = time.time()
-        scrolllog("encode_scrolling(%s, {..}, [], [], %s) window-dimensions=%s", image, options, self.window_dimensions)
+        scrolllog("encode_scrolling(%s, %i scrolls, %s, %s) window-dimensions=%s", image, len(scrolls), non_scroll, options, self.window_dimensions)
         x, y, w, h = image.get_geometry()[:4]
-        yscroll_values = []
-        max_scroll_regions = 50
-        #process distances with the highest score first:
-        for hits in reversed(sorted(distances.values())):
-            for scroll in (d for d,v in distances.items() if v==hits):
-                assert scroll<h
-                yscroll_values.append(scroll)
-            if len(yscroll_values)>=max_scroll_regions:
-                break
-        assert yscroll_values
-        #always add zero=no-change so we can drop those updates!
-        if 0 not in yscroll_values and 0 in distances:
-            #(but do this last so we don't end up cutting too many rectangles)
-            yscroll_values.append(0)
-        scrolllog(" will send scroll packets for yscroll=%s", yscroll_values)
-        #keep track of the lines we have handled already:
-        #(the same line may be available from multiple scroll directions)
-        handled = set()
-        scrolls = []
-        max_scrolls = 1000
-        for s in yscroll_values:
-            #find all the lines that scroll by this much:
-            slines = match_distance(old_csums, csums, s)
-            assert slines, "no lines matching distance %i" % s
-            #remove any lines we have already handled:
-            lines = [v+s for v in slines if ((v+s) not in handled and v not in handled)]
-            if not lines:
-                continue
-            #and them to the handled set so we don't try to paint them again:
-            handled = handled.union(set(lines))
-            if s==0:
-                scrolllog(" %i lines have not changed", len(lines))
-            else:
-                #things have actually moved
-                #aggregate consecutive lines into rectangles:
-                cl = consecutive_lines(lines)
-                scrolllog(" scroll groups for distance=%i : %s=%s", s, lines, cl)
-                for start,count in cl:
-                    #new rectangle
-                    scrolls.append((x, y+start-s, w, count, 0, s))
-                    if len(scrolls)>max_scrolls:
-                        break
-                if len(scrolls)>max_scrolls:
-                    break
-        non_scroll = []
-        remaining = set(range(h))-handled
-        if remaining:
-            damaged_lines = sorted(list(remaining))
-            non_scroll = consecutive_lines(damaged_lines)
-            scrolllog(" non scroll: %i packets: %s", len(non_scroll), non_scroll)
         flush = len(non_scroll)
         #send as scroll paints packets:
         if scrolls:
@@ -1417,8 +1409,8 @@ class WindowVideoSource(WindowSource):
         #send the rest as rectangles:
         if non_scroll:
             non_start = time.time()
-            for start, count in non_scroll:
-                sub = image.get_sub_image(0, start, w, count)
+            for rx, ry, rw, rh in non_scroll:
+                sub = image.get_sub_image(rx-x, ry-y, rw, rh)
                 flush -= 1
                 ret = self.video_fallback(sub, options)
                 if not ret:
@@ -1435,6 +1427,35 @@ class WindowVideoSource(WindowSource):
         assert flush==0
         return None
 
+    def detect_scrolling(self, image):
+        """
+            Updates the row hashes of the window with the pixels of this image,
+            and returns the scroll data if enough of it can be sent using scrolling.
+
+            Runs in the 'encode' thread.
+        """
+        start = time.time()
+        x, y, w, h = image.get_geometry()[:4]
+        ww, wh = self.window_dimensions
+        if x<0 or y<0 or x+w>ww or y+h>wh:
+            scrolllog("image %s does not fit in window %ix%i", image.get_geometry(), ww, wh)
+            self.scroll_data = None
+            return None
+        sd = self.scroll_data
+        if sd is None or sd.width!=ww or sd.height!=wh:
+            sd = ScrollData(ww, wh)
+            self.scroll_data = sd
+            scrolllog("new scroll data: %s", sd)
+        sd.update(image.get_pixels(), x, y, w, h, image.get_rowstride())
+        r = sd.detect(SCROLL_MIN_PERCENT, SCROLL_MAX_DISTANCE, SCROLL_HORIZONTAL)
+        end = time.time()
+        if not r:
+            scrolllog("no scrolling detected in %ims", (end-start)*1000)
+            return None
+        scrolls, non_scroll, unchanged = r
+        scrolllog("scroll detection took %ims: %i scrolls, %i non-scroll areas, %i unchanged", (end-start)*1000, len(scrolls), len(non_scroll), unchanged)
+        return scrolls, non_scroll
+
     def video_fallback(self, image, options, order=PREFERED_ENCODING_ORDER):
         #find one that is not video:
         fallback_encodings = [x for x in order if (x in self.non_video_encodings and x in self._encoders and x!="mmap")]
@@ -1469,37 +1490,15 @@ class WindowVideoSource(WindowSource):
         #check for scrolling if we're not dealing with a "real" video area:
         if self.supports_scrolling and not self.subregion_is_video() and not self.b_frame_flush_timer and not STRICT_MODE:
             try:
-                start = time.time()
-                lsd = self.scroll_data
-                pixels = image.get_pixels()
-                stride = image.get_rowstride()
-                width = image.get_width()
-                height = image.get_height()
-                csums = CRC_Image(pixels, width, height, stride)
-                if csums:
-                    self.scroll_data = (width, height, csums)
-                    scrolllog("updated scroll data")
-                if lsd and csums:
-                    lw, lh, lcsums = lsd
-                    if lw!=width or lh!=height:
-                        scrolllog("scroll data size mismatch: %ix%i vs %ix%i", lw, lh, width, height)
-                    else:
-                        #same size, try to find scrolling value
-                        assert len(csums)==len(lcsums), "mismatch between checksums lists: %i vs %i items!" % (len(csums), len(lcsums))
-                        distances = calculate_distances(csums, lcsums, 2, 1000)
-                        if len(distances)==0:
-                            scrolllog("no scroll distances found")
-                        else:
-                            best = max(distances.values())
-                            scroll = distances.keys()[distances.values().index(best)]
-                            end = time.time()
-                            best_pct = int(100*best/height)
-                            scrolllog("best scroll guess took %ims, matches %i%% of %i lines: %s", (end-start)*1000, best_pct, height, scroll)
-                            #at least 40% of the picture was found as scroll areas:
-                            if best_pct>=SCROLL_MIN_PERCENT:
-                                return self.encode_scrolling(image, distances, lcsums, csums, options)
+                r = self.detect_scrolling(image)
+                if r:
+                    scrolls, non_scroll = r
+                    return self.encode_scrolling(image, scrolls, non_scroll, options)
             except Exception:
                 scrolllog.error("Error during scrolling detection!", exc_info=True)
+                self.scroll_data = None
+        elif self.scroll_data:
+            self.scroll_data.invalidate(x, y, w, h)
 
         def video_fallback():
             videolog.warn("using non-video fallback encoding")